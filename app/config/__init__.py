@@ -12,6 +12,15 @@ from .workflow_config import (
     get_workflow,
     get_fase_config,
     get_dokumen_list,
+    get_dokumen_wajib,
+    get_dokumen_opsional,
+    get_all_dokumen,
+    get_dokumen,
+    get_workflow_index,
+    get_fase_index,
+    get_validasi_rules,
+    cek_validasi_fase,
+    cek_konsistensi_workflow,
 )
 
 __all__ = [
@@ -22,4 +31,13 @@ __all__ = [
     'get_workflow',
     'get_fase_config',
     'get_dokumen_list',
+    'get_dokumen_wajib',
+    'get_dokumen_opsional',
+    'get_all_dokumen',
+    'get_dokumen',
+    'get_workflow_index',
+    'get_fase_index',
+    'get_validasi_rules',
+    'cek_validasi_fase',
+    'cek_konsistensi_workflow',
 ]
@@ -10,7 +10,10 @@ Mekanisme Pencairan Dana:
 3. LS (Langsung) - Pembayaran langsung ke penyedia via KPPN
 """
 
-from typing import Dict, List, Any, Optional
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 # ============================================================================
 # WORKFLOW UP (UANG PERSEDIAAN)
@@ -1023,7 +1026,114 @@ ALL_WORKFLOWS = {
     "LS": LS_WORKFLOW,
 }
 
-def get_workflow(mekanisme: str) -> Optional[Dict[str, Any]]:
+# ============================================================================
+# COMPILED INDEX
+# ============================================================================
+# Definisi workflow di atas dikompilasi SEKALI saat import menjadi struktur
+# read-only (MappingProxyType/tuple) yang diindeks per mekanisme, fase dan
+# kode dokumen. Helper di bawah mengembalikan objek ini langsung tanpa
+# menyalin, jadi aman dipanggil di loop render per baris. Perubahan pada
+# dict *_WORKFLOW setelah import tidak terlihat di index.
+
+def _freeze(value: Any) -> Any:
+    """Salin dict/list bersarang menjadi MappingProxyType/tuple."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@dataclass(frozen=True)
+class FaseIndex:
+    """Index satu fase: dokumen (daftar utama) dan aturan validasinya."""
+    nomor: int
+    nama: str
+    config: Mapping[str, Any]
+    dokumen: Tuple[Mapping[str, Any], ...]
+    dokumen_wajib: Tuple[Mapping[str, Any], ...]
+    dokumen_opsional: Tuple[Mapping[str, Any], ...]
+    validasi: Tuple[Mapping[str, str], ...]
+
+
+@dataclass(frozen=True)
+class WorkflowIndex:
+    """
+    Index satu mekanisme.
+
+    dokumen berisi daftar utama semua fase (dengan 'fase' dan 'fase_nama'),
+    dokumen_by_kode juga mencakup daftar varian per jenis kegiatan
+    (dokumen_kepanitiaan, dokumen_kontrak, ...), ditambah 'grup'.
+    """
+    kode: str
+    config: Mapping[str, Any]
+    fase: Mapping[int, FaseIndex]
+    dokumen: Tuple[Mapping[str, Any], ...]
+    dokumen_by_kode: Mapping[str, Mapping[str, Any]]
+
+
+def _daftar_dokumen(fase_config: Dict[str, Any]):
+    """Yield (grup, dokumen) untuk semua daftar dokumen* di satu fase."""
+    for grup, isi in fase_config.items():
+        if grup.startswith("dokumen") and isinstance(isi, (list, tuple)):
+            for dok in isi:
+                yield grup, dok
+
+
+def _compile_workflow(kode: str, workflow: Dict[str, Any]) -> WorkflowIndex:
+    fase_index: Dict[int, FaseIndex] = {}
+    semua_dokumen = []
+    by_kode: Dict[str, Mapping[str, Any]] = {}
+
+    for nomor, fase_config in workflow.get("fase", {}).items():
+        nama = fase_config.get("nama", "")
+        dokumen = _freeze(fase_config.get("dokumen", []))
+        fase_index[nomor] = FaseIndex(
+            nomor=nomor,
+            nama=nama,
+            config=_freeze(fase_config),
+            dokumen=dokumen,
+            dokumen_wajib=tuple(d for d in dokumen if d.get("kategori") == "wajib"),
+            dokumen_opsional=tuple(d for d in dokumen if d.get("kategori") != "wajib"),
+            validasi=_freeze(fase_config.get("validasi", [])),
+        )
+        semua_dokumen.extend(
+            _freeze(dict(dok, fase=nomor, fase_nama=nama))
+            for dok in fase_config.get("dokumen", [])
+        )
+        for grup, dok in _daftar_dokumen(fase_config):
+            # Daftar utama didahulukan; varian hanya mengisi kode yang belum ada
+            if dok.get("kode") not in by_kode:
+                by_kode[dok.get("kode")] = _freeze(
+                    dict(dok, fase=nomor, fase_nama=nama, grup=grup)
+                )
+
+    return WorkflowIndex(
+        kode=kode,
+        config=_freeze(workflow),
+        fase=MappingProxyType(fase_index),
+        dokumen=tuple(semua_dokumen),
+        dokumen_by_kode=MappingProxyType(by_kode),
+    )
+
+
+_WORKFLOW_INDEX: Mapping[str, WorkflowIndex] = MappingProxyType({
+    kode: _compile_workflow(kode, workflow) for kode, workflow in ALL_WORKFLOWS.items()
+})
+
+
+def get_workflow_index(mekanisme: str) -> Optional[WorkflowIndex]:
+    """Get index terkompilasi untuk mekanisme (UP, TUP, LS)."""
+    return _WORKFLOW_INDEX.get(mekanisme.upper()) if mekanisme else None
+
+
+def get_fase_index(mekanisme: str, fase: int) -> Optional[FaseIndex]:
+    """Get index terkompilasi untuk satu fase."""
+    workflow = get_workflow_index(mekanisme)
+    return workflow.fase.get(fase) if workflow else None
+
+
+def get_workflow(mekanisme: str) -> Optional[Mapping[str, Any]]:
     """
     Get konfigurasi workflow berdasarkan mekanisme.
 
@@ -1031,12 +1141,13 @@ def get_workflow(mekanisme: str) -> Optional[Dict[str, Any]]:
         mekanisme: Kode mekanisme (UP, TUP, LS)
 
     Returns:
-        Dictionary konfigurasi workflow atau None
+        Mapping read-only konfigurasi workflow atau None
     """
-    return ALL_WORKFLOWS.get(mekanisme.upper())
+    workflow = get_workflow_index(mekanisme)
+    return workflow.config if workflow else None
 
 
-def get_fase_config(mekanisme: str, fase: int) -> Optional[Dict[str, Any]]:
+def get_fase_config(mekanisme: str, fase: int) -> Optional[Mapping[str, Any]]:
     """
     Get konfigurasi fase tertentu.
 
@@ -1045,15 +1156,13 @@ def get_fase_config(mekanisme: str, fase: int) -> Optional[Dict[str, Any]]:
         fase: Nomor fase (1-5)
 
     Returns:
-        Dictionary konfigurasi fase atau None
+        Mapping read-only konfigurasi fase atau None
     """
-    workflow = get_workflow(mekanisme)
-    if workflow and fase in workflow.get("fase", {}):
-        return workflow["fase"][fase]
-    return None
+    fase_index = get_fase_index(mekanisme, fase)
+    return fase_index.config if fase_index else None
 
 
-def get_dokumen_list(mekanisme: str, fase: int) -> List[Dict[str, Any]]:
+def get_dokumen_list(mekanisme: str, fase: int) -> Tuple[Mapping[str, Any], ...]:
     """
     Get daftar dokumen untuk fase tertentu.
 
@@ -1062,47 +1171,191 @@ def get_dokumen_list(mekanisme: str, fase: int) -> List[Dict[str, Any]]:
         fase: Nomor fase
 
     Returns:
-        List dokumen untuk fase tersebut
+        Tuple dokumen untuk fase tersebut
     """
-    fase_config = get_fase_config(mekanisme, fase)
-    if fase_config:
-        return fase_config.get("dokumen", [])
-    return []
+    fase_index = get_fase_index(mekanisme, fase)
+    return fase_index.dokumen if fase_index else ()
+
+
+def get_dokumen_wajib(mekanisme: str, fase: int) -> Tuple[Mapping[str, Any], ...]:
+    """Get dokumen kategori wajib untuk fase tertentu."""
+    fase_index = get_fase_index(mekanisme, fase)
+    return fase_index.dokumen_wajib if fase_index else ()
 
 
-def get_all_dokumen(mekanisme: str) -> List[Dict[str, Any]]:
+def get_dokumen_opsional(mekanisme: str, fase: int) -> Tuple[Mapping[str, Any], ...]:
+    """Get dokumen selain wajib (opsional, upload, kondisional) untuk fase tertentu."""
+    fase_index = get_fase_index(mekanisme, fase)
+    return fase_index.dokumen_opsional if fase_index else ()
+
+
+def get_all_dokumen(mekanisme: str) -> Tuple[Mapping[str, Any], ...]:
     """
     Get semua dokumen untuk mekanisme tertentu.
 
     Returns:
-        List semua dokumen dengan informasi fase
+        Tuple semua dokumen dengan informasi fase
     """
-    workflow = get_workflow(mekanisme)
-    if not workflow:
-        return []
+    workflow = get_workflow_index(mekanisme)
+    return workflow.dokumen if workflow else ()
 
-    dokumen_list = []
-    for fase_num, fase_config in workflow.get("fase", {}).items():
-        for dok in fase_config.get("dokumen", []):
-            dok_copy = dok.copy()
-            dok_copy["fase"] = fase_num
-            dok_copy["fase_nama"] = fase_config.get("nama", "")
-            dokumen_list.append(dok_copy)
 
-    return dokumen_list
+def get_dokumen(mekanisme: str, kode: str) -> Optional[Mapping[str, Any]]:
+    """
+    Get definisi dokumen berdasarkan kode (termasuk daftar varian).
+
+    Returns:
+        Mapping dokumen dengan 'fase', 'fase_nama' dan 'grup', atau None
+    """
+    workflow = get_workflow_index(mekanisme)
+    return workflow.dokumen_by_kode.get(kode) if workflow else None
 
 
-def get_validasi_rules(mekanisme: str, fase: int) -> List[Dict[str, str]]:
+def get_validasi_rules(mekanisme: str, fase: int) -> Tuple[Mapping[str, str], ...]:
     """
     Get aturan validasi untuk fase tertentu.
 
     Returns:
-        List aturan validasi
+        Tuple aturan validasi
+    """
+    fase_index = get_fase_index(mekanisme, fase)
+    return fase_index.validasi if fase_index else ()
+
+
+# ============================================================================
+# CONSISTENCY CHECK
+# ============================================================================
+
+TEMPLATES_DIR = Path(__file__).parent.parent.parent / "templates"
+
+
+def _template_ada(template: str, templates_dir: Path) -> bool:
+    """Template dicari seperti DokumenGenerator: word/, excel/, lalu root."""
+    return any((folder / template).exists()
+               for folder in (templates_dir / "word", templates_dir / "excel", templates_dir))
+
+
+def cek_konsistensi_workflow(workflows: Dict[str, Dict[str, Any]] = None,
+                             templates_dir: Path = None) -> List[Dict[str, Any]]:
+    """
+    Cek definisi workflow: kode dokumen ganda dan template yang tidak ada.
+
+    Kode yang sama boleh muncul di beberapa daftar varian pada fase yang
+    sama (mis. TOR untuk kepanitiaan dan rapat), tetapi tidak boleh ganda
+    dalam satu daftar atau dipakai di fase berbeda.
+
+    Args:
+        workflows: Definisi yang dicek (default: ALL_WORKFLOWS)
+        templates_dir: Folder template (default: <root>/templates)
+
+    Returns:
+        List masalah: {'jenis', 'mekanisme', 'fase', 'kode', 'pesan'};
+        kosong jika konsisten
+    """
+    workflows = ALL_WORKFLOWS if workflows is None else workflows
+    templates_dir = Path(templates_dir) if templates_dir else TEMPLATES_DIR
+    masalah: List[Dict[str, Any]] = []
+
+    def catat(jenis, mekanisme, fase, kode, pesan):
+        masalah.append({'jenis': jenis, 'mekanisme': mekanisme, 'fase': fase,
+                        'kode': kode, 'pesan': pesan})
+
+    for mekanisme, workflow in workflows.items():
+        fase_kode: Dict[str, int] = {}
+        lintas_fase = set()
+        for fase, fase_config in workflow.get("fase", {}).items():
+            per_grup: Dict[str, set] = {}
+            for grup, dok in _daftar_dokumen(fase_config):
+                kode = dok.get("kode")
+                if not kode:
+                    catat("kode_kosong", mekanisme, fase, None,
+                          f"Dokumen tanpa kode di {grup}: {dok.get('nama', '-')}")
+                    continue
+
+                kode_grup = per_grup.setdefault(grup, set())
+                if kode in kode_grup:
+                    catat("kode_ganda", mekanisme, fase, kode,
+                          f"{kode} muncul lebih dari sekali di {grup}")
+                kode_grup.add(kode)
+
+                fase_awal = fase_kode.setdefault(kode, fase)
+                if fase_awal != fase and (kode, fase) not in lintas_fase:
+                    lintas_fase.add((kode, fase))
+                    catat("kode_ganda", mekanisme, fase, kode,
+                          f"{kode} dipakai di fase {fase_awal} dan fase {fase}")
+
+                template = dok.get("template")
+                if template and not _template_ada(template, templates_dir):
+                    catat("template_hilang", mekanisme, fase, kode,
+                          f"Template {template} untuk {kode} tidak ditemukan")
+
+    return masalah
+
+
+# Status dokumen yang dianggap sudah ada/selesai
+STATUS_DOKUMEN_SELESAI = ("final", "signed", "uploaded")
+
+
+def _kode_dokumen_rule(mekanisme: str, field: str) -> Optional[str]:
+    """Petakan field rule 'dokumen_xxx' ke kode dokumen workflow (XXX atau DOK_XXX)."""
+    nama = field[len("dokumen_"):].upper()
+    for kode in (nama, f"DOK_{nama}"):
+        if get_dokumen(mekanisme, kode) is not None:
+            return kode
+    return None
+
+
+def cek_validasi_fase(mekanisme: str, fase: int, transaksi: Dict[str, Any],
+                      dokumen_status: Dict[str, str]) -> Dict[str, List[str]]:
+    """
+    Evaluasi dokumen wajib dan aturan validasi fase sebelum maju ke fase berikutnya.
+
+    Aturan yang bisa dicek otomatis: 'required' dan 'max:N' untuk field
+    transaksi, 'required' dan 'signed' untuk field 'dokumen_xxx'. Aturan lain
+    (mis. 'sesuai_rincian', 'confirmed') atau dokumen yang tidak ada di
+    workflow tidak memblokir dan dilaporkan sebagai peringatan.
+
+    Args:
+        mekanisme: Kode mekanisme
+        fase: Fase yang sedang diselesaikan
+        transaksi: Data transaksi (kolom transaksi_pencairan)
+        dokumen_status: {kode_dokumen: status} dokumen transaksi
+
+    Returns:
+        {'errors': [...], 'warnings': [...]}; lolos jika errors kosong
     """
-    fase_config = get_fase_config(mekanisme, fase)
-    if fase_config:
-        return fase_config.get("validasi", [])
-    return []
+    errors: List[str] = []
+    warnings: List[str] = []
+
+    for dok in get_dokumen_wajib(mekanisme, fase):
+        if dokumen_status.get(dok.get("kode")) not in STATUS_DOKUMEN_SELESAI:
+            errors.append(f"Dokumen wajib belum lengkap: {dok.get('nama', dok.get('kode'))}")
+
+    for rule in get_validasi_rules(mekanisme, fase):
+        field = rule.get("field", "")
+        jenis = rule.get("rule", "")
+        message = rule.get("message", f"{field}: {jenis}")
+
+        if field.startswith("dokumen_"):
+            kode = _kode_dokumen_rule(mekanisme, field)
+            if kode is None or jenis not in ("required", "signed"):
+                warnings.append(f"{message} (tidak dicek otomatis)")
+                continue
+            status = dokumen_status.get(kode)
+            ok = status == "signed" if jenis == "signed" else status in STATUS_DOKUMEN_SELESAI
+        elif field in transaksi and jenis == "required":
+            ok = transaksi.get(field) not in (None, "", 0)
+        elif field in transaksi and jenis.startswith("max:"):
+            nilai = transaksi.get(field)
+            ok = nilai is None or nilai <= float(jenis[len("max:"):])
+        else:
+            warnings.append(f"{message} (tidak dicek otomatis)")
+            continue
+
+        if not ok:
+            errors.append(message)
+
+    return {"errors": errors, "warnings": warnings}
 
 
 def get_workflow_summary(mekanisme: str) -> Dict[str, Any]:
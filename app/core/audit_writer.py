@@ -0,0 +1,214 @@
+"""
+PPK DOCUMENT FACTORY - Buffered Audit Writer
+=============================================
+Penampung (buffer) untuk entri audit_log.
+
+Entri audit tidak lagi ditulis satu per satu dengan koneksi dan commit
+sendiri. Entri dimasukkan ke antrian terbatas lalu ditulis dalam batch:
+- periodik oleh background thread (setiap AUDIT_FLUSH_INTERVAL detik)
+- segera bila antrian mencapai AUDIT_BATCH_SIZE
+- sinkron bila antrian penuh (AUDIT_MAX_QUEUE), saat backup, dan saat
+  aplikasi ditutup (atexit), sehingga tidak ada entri yang hilang pada
+  exit normal.
+"""
+
+import atexit
+import json
+import sqlite3
+import threading
+import weakref
+from collections import deque
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+# ============================================================================
+# KONFIGURASI
+# ============================================================================
+
+AUDIT_BATCH_SIZE = 50          # Flush segera jika antrian mencapai jumlah ini
+AUDIT_FLUSH_INTERVAL = 2.0     # Detik antar flush periodik
+AUDIT_MAX_QUEUE = 1000         # Batas antrian; jika penuh, flush sinkron
+
+_INSERT_AUDIT_SQL = """
+    INSERT INTO audit_log (
+        timestamp, user_name, action, table_name, record_id,
+        old_values, new_values, notes
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _to_json(values: Optional[Dict]) -> Optional[str]:
+    """Serialize audit values; empty values stored as NULL."""
+    return json.dumps(values, default=str) if values else None
+
+
+class AuditWriter:
+    """
+    Buffered, batched writer untuk tabel audit_log.
+
+    Thread-safe: enqueue() boleh dipanggil dari thread mana pun. Penulisan
+    ke database selalu berurutan (FIFO) karena dilindungi _flush_lock.
+    """
+
+    def __init__(self, db_path: str,
+                 batch_size: int = AUDIT_BATCH_SIZE,
+                 flush_interval: float = AUDIT_FLUSH_INTERVAL,
+                 max_queue: int = AUDIT_MAX_QUEUE):
+        self.db_path = db_path
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.max_queue = max(self.batch_size, max_queue)
+
+        self._pending: deque = deque()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+        _writers.add(self)
+
+    # =========================================================================
+    # PUBLIC API
+    # =========================================================================
+
+    def enqueue(self, action: str, table_name: str, record_id: int,
+                old_values: Dict = None, new_values: Dict = None,
+                user_name: str = None, notes: str = None):
+        """Queue one audit entry. Values are snapshotted at call time."""
+        entry = (
+            datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S'),
+            user_name, action, table_name, record_id,
+            dict(old_values) if old_values else None,
+            dict(new_values) if new_values else None,
+            notes,
+        )
+
+        with self._lock:
+            self._pending.append(entry)
+            size = len(self._pending)
+
+        if self._closed or size >= self.max_queue:
+            # Backpressure: antrian penuh (atau writer sudah ditutup),
+            # tulis langsung di thread pemanggil.
+            self.flush()
+            return
+
+        self._ensure_thread()
+        if size >= self.batch_size:
+            self._wake.set()
+
+    def flush(self) -> int:
+        """
+        Write all pending entries in a single transaction.
+
+        Returns:
+            Jumlah entri yang ditulis
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return 0
+                batch = list(self._pending)
+                self._pending.clear()
+
+            rows = [
+                (ts, user, action, table, record_id,
+                 _to_json(old), _to_json(new), notes)
+                for ts, user, action, table, record_id, old, new, notes in batch
+            ]
+
+            try:
+                conn = sqlite3.connect(self.db_path)
+                try:
+                    conn.executemany(_INSERT_AUDIT_SQL, rows)
+                    conn.commit()
+                finally:
+                    conn.close()
+            except Exception:
+                # Kembalikan ke depan antrian agar tidak hilang
+                with self._lock:
+                    self._pending.extendleft(reversed(batch))
+                raise
+
+            return len(batch)
+
+    def pending_count(self) -> int:
+        """Number of entries not yet written to the database."""
+        with self._lock:
+            return len(self._pending)
+
+    def close(self):
+        """Stop background thread and flush everything synchronously."""
+        self._closed = True
+        self._stop.set()
+        self._wake.set()
+        thread = self._thread
+        if thread and thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout=max(self.flush_interval * 2, 5.0))
+        self.flush()
+
+    # =========================================================================
+    # BACKGROUND THREAD
+    # =========================================================================
+
+    def _ensure_thread(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="AuditWriter", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"Warning: Gagal menulis audit log: {e}")
+
+
+# ============================================================================
+# REGISTRY (flush saat backup / shutdown)
+# ============================================================================
+
+_writers: "weakref.WeakSet[AuditWriter]" = weakref.WeakSet()
+
+
+def flush_all_audit_writers() -> int:
+    """Flush every live AuditWriter. Dipanggil sebelum backup database."""
+    total = 0
+    for writer in list(_writers):
+        try:
+            total += writer.flush()
+        except Exception as e:
+            print(f"Warning: Gagal flush audit log: {e}")
+    return total
+
+
+def close_all_audit_writers():
+    """Close every live AuditWriter (clean shutdown)."""
+    for writer in list(_writers):
+        try:
+            writer.close()
+        except Exception as e:
+            print(f"Warning: Gagal menutup audit writer: {e}")
+
+
+atexit.register(close_all_audit_writers)
+
+
+__all__ = [
+    'AuditWriter',
+    'flush_all_audit_writers',
+    'close_all_audit_writers',
+    'AUDIT_BATCH_SIZE',
+    'AUDIT_FLUSH_INTERVAL',
+    'AUDIT_MAX_QUEUE',
+]
@@ -38,6 +38,27 @@ for d in [DATA_DIR, OUTPUT_DIR, WORD_TEMPLATES_DIR, EXCEL_TEMPLATES_DIR,
 
 DATABASE_PATH = os.path.join(DATA_DIR, "ppk_workflow.db")
 
+# ============================================================================
+# QUERY INSTRUMENTATION (opt-in)
+# ============================================================================
+
+# Aktifkan dengan env PPK_SQL_STATS=1 atau `python main.py --sql-stats`
+LOG_DIR = os.path.join(DATA_DIR, "logs")
+QUERY_STATS_ENABLED = os.environ.get("PPK_SQL_STATS", "") not in ("", "0")
+SLOW_QUERY_THRESHOLD_MS = float(os.environ.get("PPK_SLOW_QUERY_MS", "100"))
+SLOW_QUERY_LOG_PATH = os.path.join(LOG_DIR, "slow_query.log")
+SLOW_QUERY_LOG_MAX_BYTES = 1_000_000
+SLOW_QUERY_LOG_BACKUPS = 3
+QUERY_STATS_PATH = os.path.join(LOG_DIR, "query_stats.json")
+
+# ============================================================================
+# TEMA UI
+# ============================================================================
+
+# "light" / "dark"; kosong = tema default tanpa ganti tema saat runtime.
+# Tema gelap masih opt-in: sebagian layar memakai warna inline terang.
+UI_THEME = os.environ.get("PPK_THEME", "")
+
 # ============================================================================
 # TAHUN ANGGARAN
 # ============================================================================
@@ -1142,6 +1163,14 @@ TAX_RATES = {
     'PPH_4_2_KONSTRUKSI': 0.025,
 }
 
+# Potongan default untuk payroll bulanan PJLP (DatabaseManagerV4.run_payroll_pjlp)
+PJLP_PAYROLL_DEFAULT = {
+    'tarif_pajak_npwp': TAX_RATES['PPH_21_NPWP'],
+    'tarif_pajak_non_npwp': TAX_RATES['PPH_21_NON_NPWP'],
+    'potongan_lain': 0,         # Rupiah per orang per bulan (iuran, dll)
+    'total_hari_kerja': 22,
+}
+
 # ============================================================================
 # NUMBERING PREFIXES
 # ============================================================================
@@ -12,6 +12,8 @@ from typing import Dict, List, Optional, Any
 from contextlib import contextmanager
 
 from .config import DATABASE_PATH, TAHUN_ANGGARAN, SATKER_DEFAULT
+from .events import TOPIC_MASTER_DATA, get_event_bus
+from .query_stats import connect
 
 # ============================================================================
 # DATABASE SCHEMA
@@ -737,7 +739,7 @@ class DatabaseManager:
     @contextmanager
     def get_connection(self):
         """Get database connection with context manager"""
-        conn = sqlite3.connect(self.db_path)
+        conn = connect(self.db_path)
         conn.row_factory = sqlite3.Row
         try:
             yield conn
@@ -1411,6 +1413,24 @@ class DatabaseManager:
             """, (paket_id,))
             return [dict(row) for row in cursor.fetchall()]
     
+    def get_dokumen_timeline_by_tahun(self, tahun: int) -> List[Dict]:
+        """
+        Get timeline dates of every paket in a fiscal year (single query).
+
+        Paket tanpa entri timeline tetap muncul dengan doc_type NULL.
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT p.id AS paket_id, p.nama, p.jangka_waktu, p.tahun_anggaran,
+                       dt.doc_type, dt.tanggal_dokumen
+                FROM paket p
+                LEFT JOIN dokumen_timeline dt ON dt.paket_id = p.id
+                WHERE p.tahun_anggaran = ?
+                ORDER BY p.id
+            """, (tahun,))
+            return [dict(row) for row in cursor.fetchall()]
+    
     def get_dokumen_timeline_by_type(self, paket_id: int, doc_type: str) -> Optional[Dict]:
         """Get timeline entry for specific document type"""
         with self.get_connection() as conn:
@@ -1442,6 +1462,7 @@ class DatabaseManager:
                         updated_at = CURRENT_TIMESTAMP
                     WHERE paket_id = ? AND doc_type = ?
                 """, (nomor, tanggal, catatan, paket_id, doc_type))
+                conn.commit()
                 return existing['id']
             else:
                 cursor.execute("""
@@ -1732,21 +1753,24 @@ class DatabaseManager:
         with self.get_connection() as conn:
             cursor = conn.cursor()
             
-            cursor.execute("""
-                SELECT counter FROM doc_counter
-                WHERE doc_type = ? AND tahun = ?
-            """, (doc_type, tahun))
-            
-            row = cursor.fetchone()
-            next_num = (row['counter'] + 1) if row else 1
-            
-            if not preview:
+            if preview:
+                cursor.execute("""
+                    SELECT counter FROM doc_counter
+                    WHERE doc_type = ? AND tahun = ?
+                """, (doc_type, tahun))
+                
+                row = cursor.fetchone()
+                next_num = (row['counter'] + 1) if row else 1
+            else:
+                # Satu statement: aman bila beberapa proses generate bersamaan
                 cursor.execute("""
                     INSERT INTO doc_counter (doc_type, tahun, counter)
-                    VALUES (?, ?, ?)
+                    VALUES (?, ?, 1)
                     ON CONFLICT(doc_type, tahun) DO UPDATE SET
-                        counter = ?, last_updated = CURRENT_TIMESTAMP
-                """, (doc_type, tahun, next_num, next_num))
+                        counter = counter + 1, last_updated = CURRENT_TIMESTAMP
+                    RETURNING counter
+                """, (doc_type, tahun))
+                next_num = cursor.fetchone()[0]
                 conn.commit()
             
             return f"{next_num:04d}/{prefix}/PKP.SRG/{tahun}"
@@ -1856,6 +1880,11 @@ class DatabaseManager:
     # PEGAWAI OPERATIONS
     # =========================================================================
     
+    def _publish_master_data(self, table: str, action: str, record_id: int = None):
+        """Beritahu cache master data (pegawai/satker) bahwa tabel berubah."""
+        get_event_bus().publish(TOPIC_MASTER_DATA, action, db_path=self.db_path,
+                                table=table, record_id=record_id)
+
     def get_pegawai_list(self, role: str = None) -> List[Dict]:
         """Get list of pegawai, optionally filtered by role"""
         with self.get_connection() as conn:
@@ -1924,6 +1953,7 @@ class DatabaseManager:
                     data.get('signature_path'), data['id']
                 ))
                 conn.commit()
+                self._publish_master_data('pegawai', 'update', data['id'])
                 return data['id']
             else:
                 # Insert
@@ -1943,6 +1973,7 @@ class DatabaseManager:
                     data.get('signature_path')
                 ))
                 conn.commit()
+                self._publish_master_data('pegawai', 'create', cursor.lastrowid)
                 return cursor.lastrowid
     
     # =========================================================================
@@ -2031,6 +2062,7 @@ class DatabaseManager:
                     data.get('eselon1'), data['id']
                 ))
                 conn.commit()
+                self._publish_master_data('satker', 'update', data['id'])
                 return data['id']
             else:
                 # Insert new
@@ -2047,6 +2079,7 @@ class DatabaseManager:
                     data.get('eselon1')
                 ))
                 conn.commit()
+                self._publish_master_data('satker', 'create', cursor.lastrowid)
                 return cursor.lastrowid
 
     def update_satker(self, data: Dict) -> bool:
@@ -2066,6 +2099,7 @@ class DatabaseManager:
                 data.get('website'), data.get('kementerian'), data.get('eselon1'),
             ))
             conn.commit()
+            self._publish_master_data('satker', 'update', 1)
             return cursor.rowcount > 0
 
     def update_satker_pejabat(self, kpa_id: int = None, ppk_id: int = None,
@@ -2080,6 +2114,7 @@ class DatabaseManager:
                 WHERE id = 1
             """, (kpa_id, ppk_id, ppspm_id, bendahara_id))
             conn.commit()
+            self._publish_master_data('satker', 'update_pejabat', 1)
             return cursor.rowcount > 0
 
     def get_satker_pejabat(self) -> Dict:
@@ -2276,6 +2311,7 @@ class DatabaseManager:
                 WHERE id = ?
             """, (pegawai_id,))
             conn.commit()
+            self._publish_master_data('pegawai', 'deactivate', pegawai_id)
             return cursor.rowcount > 0
 
     def get_pegawai(self, pegawai_id: int) -> Optional[Dict]:
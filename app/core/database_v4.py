@@ -13,11 +13,18 @@ Complete database schema with:
 import sqlite3
 import os
 import json
+import calendar
 from datetime import datetime, date
 from typing import Dict, List, Optional, Any, Tuple
 from contextlib import contextmanager
 
-from .config import DATABASE_PATH, TAHUN_ANGGARAN, SATKER_DEFAULT
+from .config import DATABASE_PATH, TAHUN_ANGGARAN, SATKER_DEFAULT, PJLP_PAYROLL_DEFAULT
+from .query_stats import connect
+from .audit_writer import AuditWriter
+from .events import (
+    get_event_bus, TOPIC_MASTER_DATA, TOPIC_SK_KPA, TOPIC_HONORARIUM,
+    TOPIC_JAMUAN_TAMU, TOPIC_HONOR_PENGELOLA,
+)
 
 # ============================================================================
 # ENHANCED DATABASE SCHEMA v4.0
@@ -775,6 +782,9 @@ CREATE TABLE IF NOT EXISTS pembayaran_pjlp (
     status TEXT DEFAULT 'draft',
     tanggal_bayar DATE,
 
+    -- Payroll run yang membuat baris ini (NULL = input manual)
+    payroll_run_id INTEGER REFERENCES payroll_run_pjlp(id),
+
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
 
@@ -785,6 +795,29 @@ CREATE TABLE IF NOT EXISTS pembayaran_pjlp (
 CREATE INDEX IF NOT EXISTS idx_pembayaran_pjlp_periode ON pembayaran_pjlp(tahun, bulan);
 CREATE INDEX IF NOT EXISTS idx_pembayaran_pjlp_status ON pembayaran_pjlp(status);
 
+-- ============================================================================
+-- PAYROLL RUN PJLP (Generate pembayaran bulanan seluruh kontrak aktif)
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS payroll_run_pjlp (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    bulan INTEGER NOT NULL,
+    tahun INTEGER NOT NULL,
+
+    -- Parameter potongan yang dipakai saat run
+    tarif_pajak_npwp REAL NOT NULL,
+    tarif_pajak_non_npwp REAL NOT NULL,
+    potongan_lain REAL DEFAULT 0,
+    total_hari_kerja INTEGER DEFAULT 22,
+
+    status TEXT DEFAULT 'aktif',  -- aktif, dibatalkan
+    created_by TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    dibatalkan_at TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_payroll_run_pjlp_periode ON payroll_run_pjlp(tahun, bulan, status);
+
 -- ============================================================================
 -- SK KPA (Surat Keputusan Kuasa Pengguna Anggaran)
 -- ============================================================================
@@ -826,6 +859,7 @@ CREATE TABLE IF NOT EXISTS sk_kpa (
 
 CREATE INDEX IF NOT EXISTS idx_sk_kpa_tahun ON sk_kpa(tahun_anggaran);
 CREATE INDEX IF NOT EXISTS idx_sk_kpa_jenis ON sk_kpa(jenis_pembayaran);
+CREATE INDEX IF NOT EXISTS idx_sk_kpa_tahun_tanggal ON sk_kpa(tahun_anggaran, tanggal_sk);
 
 -- ============================================================================
 -- HONORARIUM
@@ -866,10 +900,11 @@ CREATE TABLE IF NOT EXISTS honorarium (
     bendahara_nama TEXT,
     bendahara_nip TEXT,
 
-    -- Total
+    -- Total (diturunkan dari honorarium_detail lewat trigger bila ada rincian)
     total_bruto REAL DEFAULT 0,
     total_pajak REAL DEFAULT 0,
     total_netto REAL DEFAULT 0,
+    jumlah_penerima INTEGER NOT NULL DEFAULT 0,
 
     status TEXT DEFAULT 'draft',
     keterangan TEXT,
@@ -910,6 +945,8 @@ CREATE TABLE IF NOT EXISTS honorarium_detail (
 
 CREATE INDEX IF NOT EXISTS idx_honorarium_tahun ON honorarium(tahun_anggaran);
 CREATE INDEX IF NOT EXISTS idx_honorarium_kategori ON honorarium(kategori);
+CREATE INDEX IF NOT EXISTS idx_honorarium_tahun_created ON honorarium(tahun_anggaran, created_at);
+CREATE INDEX IF NOT EXISTS idx_honorarium_detail_hon ON honorarium_detail(honorarium_id);
 
 -- ============================================================================
 -- JAMUAN TAMU
@@ -968,6 +1005,7 @@ CREATE TABLE IF NOT EXISTS jamuan_tamu (
 
 CREATE INDEX IF NOT EXISTS idx_jamuan_tamu_tahun ON jamuan_tamu(tahun_anggaran);
 CREATE INDEX IF NOT EXISTS idx_jamuan_tamu_tanggal ON jamuan_tamu(tanggal_kegiatan);
+CREATE INDEX IF NOT EXISTS idx_jamuan_tamu_tahun_tanggal ON jamuan_tamu(tahun_anggaran, tanggal_kegiatan);
 
 -- ============================================================================
 -- PAGU ANGGARAN / FA DETAIL (POK/DIPA)
@@ -1127,16 +1165,124 @@ WORKFLOW_STAGES_V4 = [
      'required_before': ['BAST'], 'can_generate': ['SPP', 'SSP', 'KUITANSI']},
 ]
 
+# ============================================================================
+# SORT COLUMNS - PEMBAYARAN LAINNYA
+# ============================================================================
+# Kolom yang boleh dipakai order_by di list_sk_kpa / list_honorarium /
+# list_jamuan_tamu / list_honorarium_pengelola (key = kolom di hasil query).
+
+SORT_COLUMNS_SK_KPA = {
+    'id': 's.id',
+    'nomor_sk': 's.nomor_sk',
+    'tanggal_sk': 's.tanggal_sk',
+    'perihal': 's.perihal',
+    'jenis_pembayaran': 's.jenis_pembayaran',
+    'nilai_pembayaran': 's.nilai_pembayaran',
+    'status': 's.status',
+}
+
+SORT_COLUMNS_HONORARIUM = {
+    'id': 'h.id',
+    'nama_kegiatan': 'h.nama_kegiatan',
+    'jenis_honorarium': 'h.jenis_honorarium',
+    'kategori': 'h.kategori',
+    'nomor_sk_kpa': 'h.nomor_sk_kpa',
+    'total_bruto': 'h.total_bruto',
+    'status': 'h.status',
+    'created_at': 'h.created_at',
+}
+
+SORT_COLUMNS_JAMUAN_TAMU = {
+    'id': 'j.id',
+    'nama_kegiatan': 'j.nama_kegiatan',
+    'tanggal_kegiatan': 'j.tanggal_kegiatan',
+    'nama_tamu': 'j.nama_tamu',
+    'kategori': 'j.kategori',
+    'total_biaya': 'j.total_biaya',
+    'status': 'j.status',
+}
+
+SORT_COLUMNS_HONOR_PENGELOLA = {
+    'id': 'hp.id',
+    'bulan': 'hp.bulan',
+    'jabatan': 'hp.jabatan',
+    'pegawai_nama': 'p.nama',
+    'pegawai_nip': 'p.nip',
+    'jumlah': 'hp.jumlah',
+    'pajak': 'hp.pajak',
+    'netto': 'hp.netto',
+}
+
 # ============================================================================
 # DATABASE MANAGER CLASS
 # ============================================================================
 
+# ============================================================================
+# HONORARIUM TOTAL TRIGGERS
+# ============================================================================
+# Total header honorarium (bruto, PPh 21, netto, jumlah penerima) dijaga oleh
+# trigger pada honorarium_detail. Rincian pertama menggantikan total yang
+# diisi manual; reconcile_honorarium_totals() memeriksa dan memperbaiki drift.
+# Dibuat di _run_migrations karena butuh kolom jumlah_penerima.
+
+HONORARIUM_TRIGGERS_SQL = """
+CREATE TRIGGER IF NOT EXISTS trg_honorarium_detail_insert
+AFTER INSERT ON honorarium_detail
+BEGIN
+    UPDATE honorarium SET
+        total_bruto = CASE WHEN jumlah_penerima > 0 THEN total_bruto ELSE 0 END
+                      + COALESCE(NEW.nilai_bruto, 0),
+        total_pajak = CASE WHEN jumlah_penerima > 0 THEN total_pajak ELSE 0 END
+                      + COALESCE(NEW.pph21, 0),
+        total_netto = CASE WHEN jumlah_penerima > 0 THEN total_netto ELSE 0 END
+                      + COALESCE(NEW.nilai_netto, 0),
+        jumlah_penerima = jumlah_penerima + 1,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE id = NEW.honorarium_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_honorarium_detail_delete
+AFTER DELETE ON honorarium_detail
+BEGIN
+    UPDATE honorarium SET
+        total_bruto = total_bruto - COALESCE(OLD.nilai_bruto, 0),
+        total_pajak = total_pajak - COALESCE(OLD.pph21, 0),
+        total_netto = total_netto - COALESCE(OLD.nilai_netto, 0),
+        jumlah_penerima = jumlah_penerima - 1,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE id = OLD.honorarium_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_honorarium_detail_update
+AFTER UPDATE OF honorarium_id, nilai_bruto, pph21, nilai_netto ON honorarium_detail
+BEGIN
+    UPDATE honorarium SET
+        total_bruto = total_bruto - COALESCE(OLD.nilai_bruto, 0),
+        total_pajak = total_pajak - COALESCE(OLD.pph21, 0),
+        total_netto = total_netto - COALESCE(OLD.nilai_netto, 0),
+        jumlah_penerima = jumlah_penerima - 1
+    WHERE id = OLD.honorarium_id;
+    UPDATE honorarium SET
+        total_bruto = CASE WHEN jumlah_penerima > 0 THEN total_bruto ELSE 0 END
+                      + COALESCE(NEW.nilai_bruto, 0),
+        total_pajak = CASE WHEN jumlah_penerima > 0 THEN total_pajak ELSE 0 END
+                      + COALESCE(NEW.pph21, 0),
+        total_netto = CASE WHEN jumlah_penerima > 0 THEN total_netto ELSE 0 END
+                      + COALESCE(NEW.nilai_netto, 0),
+        jumlah_penerima = jumlah_penerima + 1,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE id = NEW.honorarium_id;
+END;
+"""
+
+
 class DatabaseManagerV4:
     """Enhanced Database Manager for PPK Document Factory v4.0"""
     
     def __init__(self, db_path: str = None):
         self.db_path = db_path or DATABASE_PATH
         self._init_db()
+        self._audit_writer = AuditWriter(self.db_path)
     
     def _init_db(self):
         """Initialize database and create/update tables"""
@@ -1316,6 +1462,7 @@ class DatabaseManagerV4:
             ('kpa_id', "ALTER TABLE honorarium ADD COLUMN kpa_id INTEGER REFERENCES pegawai(id)"),
             ('ppk_id', "ALTER TABLE honorarium ADD COLUMN ppk_id INTEGER REFERENCES pegawai(id)"),
             ('bendahara_id', "ALTER TABLE honorarium ADD COLUMN bendahara_id INTEGER REFERENCES pegawai(id)"),
+            ('jumlah_penerima', "ALTER TABLE honorarium ADD COLUMN jumlah_penerima INTEGER NOT NULL DEFAULT 0"),
         ]
 
         for col, sql in hon_migrations:
@@ -1325,6 +1472,12 @@ class DatabaseManagerV4:
                 except:
                     pass
 
+        # Migration: Derived honorarium totals. Header lama yang sudah punya
+        # rincian diisi ulang sekali sebelum trigger mulai menjaga totalnya.
+        if 'jumlah_penerima' not in hon_columns:
+            self._recompute_honorarium_totals(cursor)
+        cursor.executescript(HONORARIUM_TRIGGERS_SQL)
+
         # Migration: Add foreign key columns to honorarium_detail for normalization
         cursor.execute("PRAGMA table_info(honorarium_detail)")
         hond_columns = [col[1] for col in cursor.fetchall()]
@@ -1388,6 +1541,19 @@ class DatabaseManagerV4:
                 except:
                     pass
 
+        # Migration: Link pembayaran_pjlp to the payroll run that created it
+        cursor.execute("PRAGMA table_info(pembayaran_pjlp)")
+        pembayaran_pjlp_columns = [col[1] for col in cursor.fetchall()]
+
+        if 'payroll_run_id' not in pembayaran_pjlp_columns:
+            try:
+                cursor.execute("ALTER TABLE pembayaran_pjlp ADD COLUMN payroll_run_id INTEGER "
+                               "REFERENCES payroll_run_pjlp(id)")
+            except:
+                pass
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_pembayaran_pjlp_run "
+                       "ON pembayaran_pjlp(payroll_run_id)")
+
         # Migration: Add nomor_mak column to pagu_anggaran
         cursor.execute("PRAGMA table_info(pagu_anggaran)")
         pagu_columns = [col[1] for col in cursor.fetchall()]
@@ -1403,6 +1569,42 @@ class DatabaseManagerV4:
                 except:
                     pass
 
+    def _publish_master_data(self, table: str, action: str, record_id: int = None):
+        """Beritahu cache master data (pegawai/satker) bahwa tabel berubah."""
+        get_event_bus().publish(TOPIC_MASTER_DATA, action, db_path=self.db_path,
+                                table=table, record_id=record_id)
+
+    def _publish_pembayaran(self, topic: str, action: str, record_id: int = None):
+        """Beritahu UI pembayaran lainnya bahwa tabel (= topic) berubah."""
+        get_event_bus().publish(topic, action, db_path=self.db_path, record_id=record_id)
+
+    def _list_page(self, select_sql: str, from_sql: str, conditions: List[str],
+                   params: List, order_sql: str, limit: int,
+                   offset: int) -> Tuple[List[Dict], int]:
+        """Satu halaman hasil query + total baris yang cocok dengan filter."""
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT COUNT(*) FROM {from_sql}{where}", params)
+            total = cursor.fetchone()[0]
+            cursor.execute(f"""
+                SELECT {select_sql} FROM {from_sql}{where}
+                ORDER BY {order_sql}
+                LIMIT ? OFFSET ?
+            """, params + [limit, offset])
+            return [dict(row) for row in cursor.fetchall()], total
+
+    @staticmethod
+    def _order_sql(sort_columns: Dict[str, str], order_by: Optional[str],
+                   descending: bool, id_column: str, default: str) -> str:
+        """ORDER BY dari whitelist sort_columns dengan id sebagai tiebreak."""
+        if order_by is None:
+            return default
+        if order_by not in sort_columns:
+            raise ValueError(f"Kolom sort tidak valid: {order_by}")
+        direction = "DESC" if descending else "ASC"
+        return f"{sort_columns[order_by]} {direction}, {id_column} {direction}"
+
     def _insert_default_satker(self, cursor):
         """Insert default satker data"""
         cursor.execute("""
@@ -1454,6 +1656,7 @@ class DatabaseManagerV4:
                 data.get('website'), data.get('kementerian'), data.get('eselon1'),
             ))
             conn.commit()
+            self._publish_master_data('satker', 'update', 1)
             return cursor.rowcount > 0
 
     def update_satker_pejabat(self, kpa_id: int = None, ppk_id: int = None,
@@ -1468,6 +1671,7 @@ class DatabaseManagerV4:
                 WHERE id = 1
             """, (kpa_id, ppk_id, ppspm_id, bendahara_id))
             conn.commit()
+            self._publish_master_data('satker', 'update_pejabat', 1)
             return cursor.rowcount > 0
 
     def get_satker_pejabat(self) -> Dict:
@@ -1499,7 +1703,7 @@ class DatabaseManagerV4:
     @contextmanager
     def get_connection(self):
         """Get database connection with context manager"""
-        conn = sqlite3.connect(self.db_path)
+        conn = connect(self.db_path)
         conn.row_factory = sqlite3.Row
         try:
             yield conn
@@ -1573,6 +1777,7 @@ class DatabaseManagerV4:
             ))
             
             conn.commit()
+            self._publish_master_data('pegawai', 'create', cursor.lastrowid)
             return cursor.lastrowid
     
     def update_pegawai(self, pegawai_id: int, data: Dict) -> bool:
@@ -1599,6 +1804,7 @@ class DatabaseManagerV4:
             ))
             
             conn.commit()
+            self._publish_master_data('pegawai', 'update', pegawai_id)
             return cursor.rowcount > 0
     
     def deactivate_pegawai(self, pegawai_id: int) -> bool:
@@ -1610,6 +1816,19 @@ class DatabaseManagerV4:
                 WHERE id = ?
             """, (pegawai_id,))
             conn.commit()
+            self._publish_master_data('pegawai', 'deactivate', pegawai_id)
+            return cursor.rowcount > 0
+    
+    def activate_pegawai(self, pegawai_id: int) -> bool:
+        """Reactivate soft-deleted pegawai"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                UPDATE pegawai SET is_active = 1, updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            """, (pegawai_id,))
+            conn.commit()
+            self._publish_master_data('pegawai', 'activate', pegawai_id)
             return cursor.rowcount > 0
     
     def get_pegawai_by_role(self, role: str) -> List[Dict]:
@@ -1692,6 +1911,8 @@ class DatabaseManagerV4:
             
             conn.commit()
         
+        if imported or updated:
+            self._publish_master_data('pegawai', 'bulk_import')
         return imported, updated, errors
 
     # =========================================================================
@@ -2416,21 +2637,54 @@ class DatabaseManagerV4:
     def log_audit(self, action: str, table_name: str, record_id: int,
                  old_values: Dict = None, new_values: Dict = None,
                  user_name: str = None, notes: str = None):
-        """Log audit trail entry"""
+        """Log audit trail entry (buffered, written in batches)"""
+        self._audit_writer.enqueue(
+            action, table_name, record_id,
+            old_values=old_values, new_values=new_values,
+            user_name=user_name, notes=notes
+        )
+
+    def flush_audit(self) -> int:
+        """Write pending audit entries now. Returns number written."""
+        return self._audit_writer.flush()
+
+    def get_audit_log(self, table_name: str = None, record_id: int = None,
+                      action: str = None, limit: int = 100) -> List[Dict]:
+        """Get audit trail entries (newest first), including pending ones"""
+        # Read-your-writes: tulis entri yang masih di buffer sebelum query
+        self._audit_writer.flush()
+
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO audit_log (
-                    user_name, action, table_name, record_id,
-                    old_values, new_values, notes
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                user_name, action, table_name, record_id,
-                json.dumps(old_values) if old_values else None,
-                json.dumps(new_values) if new_values else None,
-                notes
-            ))
-            conn.commit()
+
+            sql = "SELECT * FROM audit_log"
+            params = []
+            conditions = []
+
+            if table_name:
+                conditions.append("table_name = ?")
+                params.append(table_name)
+            if record_id is not None:
+                conditions.append("record_id = ?")
+                params.append(record_id)
+            if action:
+                conditions.append("action = ?")
+                params.append(action)
+
+            if conditions:
+                sql += " WHERE " + " AND ".join(conditions)
+            sql += " ORDER BY id DESC LIMIT ?"
+            params.append(limit)
+
+            cursor.execute(sql, params)
+            result = []
+            for row in cursor.fetchall():
+                entry = dict(row)
+                for key in ('old_values', 'new_values'):
+                    if entry.get(key):
+                        entry[key] = json.loads(entry[key])
+                result.append(entry)
+            return result
 
     # =========================================================================
     # PERJALANAN DINAS (Official Travel)
@@ -3064,28 +3318,257 @@ class DatabaseManagerV4:
 
     def get_pjlp_summary(self, pjlp_id: int) -> Dict:
         """Get payment summary for a PJLP contract"""
+        return self.get_pjlp_summaries([pjlp_id]).get(pjlp_id, {
+            'total_bulan_dibayar': 0,
+            'total_bruto': 0,
+            'total_pajak': 0,
+            'total_potongan_lain': 0,
+            'total_netto': 0
+        })
+
+    def get_pjlp_summaries(self, pjlp_ids: List[int] = None, tahun: int = None) -> Dict[int, Dict]:
+        """
+        Get paid-payment summaries for many PJLP contracts in one grouped query.
+
+        Returns {pjlp_id: summary}; contracts without paid months are absent.
+        """
+        query = """
+            SELECT
+                pjlp_id,
+                COUNT(*) as total_bulan_dibayar,
+                SUM(nilai_bruto) as total_bruto,
+                SUM(potongan_pajak) as total_pajak,
+                SUM(potongan_lain) as total_potongan_lain,
+                SUM(nilai_netto) as total_netto
+            FROM pembayaran_pjlp
+            WHERE status = 'dibayar'
+        """
+        params = []
+        if pjlp_ids is not None:
+            if not pjlp_ids:
+                return {}
+            query += f" AND pjlp_id IN ({','.join('?' * len(pjlp_ids))})"
+            params.extend(pjlp_ids)
+        if tahun:
+            query += " AND tahun = ?"
+            params.append(tahun)
+        query += " GROUP BY pjlp_id"
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            return {row['pjlp_id']: dict(row) for row in cursor.fetchall()}
+
+    def get_rekap_pembayaran_pjlp(self, bulan: int, tahun: int) -> Dict:
+        """
+        Get monthly PJLP recap: payment rows plus totals computed in SQL.
+
+        Returns {'items': [...], 'total': {...}, 'per_status': {status: {...}}}.
+        """
         with self.get_connection() as conn:
             cursor = conn.cursor()
+            cursor.execute("""
+                SELECT p.*, pj.nama_pjlp, pj.nama_pekerjaan, pj.honor_bulanan,
+                    COALESCE(p.potongan_pajak, 0) + COALESCE(p.potongan_lain, 0) as total_potongan
+                FROM pembayaran_pjlp p
+                JOIN pjlp pj ON p.pjlp_id = pj.id
+                WHERE p.bulan = ? AND p.tahun = ?
+                ORDER BY pj.nama_pjlp
+            """, (bulan, tahun))
+            items = [dict(row) for row in cursor.fetchall()]
+
             cursor.execute("""
                 SELECT
-                    COUNT(*) as total_bulan_dibayar,
-                    SUM(nilai_bruto) as total_bruto,
-                    SUM(potongan_pajak) as total_pajak,
-                    SUM(potongan_lain) as total_potongan_lain,
-                    SUM(nilai_netto) as total_netto
+                    status,
+                    COUNT(*) as jumlah,
+                    COALESCE(SUM(nilai_bruto), 0) as total_bruto,
+                    COALESCE(SUM(potongan_pajak), 0) as total_pajak,
+                    COALESCE(SUM(potongan_lain), 0) as total_potongan_lain,
+                    COALESCE(SUM(nilai_netto), 0) as total_netto
                 FROM pembayaran_pjlp
-                WHERE pjlp_id = ? AND status = 'dibayar'
-            """, (pjlp_id,))
-            row = cursor.fetchone()
-            if row:
-                return dict(row)
-            return {
-                'total_bulan_dibayar': 0,
-                'total_bruto': 0,
-                'total_pajak': 0,
-                'total_potongan_lain': 0,
-                'total_netto': 0
-            }
+                WHERE bulan = ? AND tahun = ?
+                GROUP BY status
+            """, (bulan, tahun))
+            per_status = {row['status']: dict(row) for row in cursor.fetchall()}
+
+        keys = ('jumlah', 'total_bruto', 'total_pajak', 'total_potongan_lain', 'total_netto')
+        total = {k: sum(s[k] for s in per_status.values()) for k in keys}
+        total['total_potongan'] = total['total_pajak'] + total['total_potongan_lain']
+        return {'items': items, 'total': total, 'per_status': per_status}
+
+    # ========================================================================
+    # PAYROLL RUN PJLP (Monthly Batch) METHODS
+    # ========================================================================
+
+    # Kontrak yang wajib dibayar pada periode :awal..:akhir
+    _PJLP_PAYROLL_FILTER = """
+        status = 'aktif'
+        AND tahun_anggaran = :tahun
+        AND COALESCE(honor_bulanan, 0) > 0
+        AND (NULLIF(tanggal_mulai, '') IS NULL OR tanggal_mulai <= :akhir)
+        AND (NULLIF(tanggal_selesai, '') IS NULL OR tanggal_selesai >= :awal)
+    """
+
+    def run_payroll_pjlp(self, bulan: int, tahun: int, created_by: str = None,
+                         tarif_pajak_npwp: float = None, tarif_pajak_non_npwp: float = None,
+                         potongan_lain: float = None, total_hari_kerja: int = None) -> Dict:
+        """
+        Generate draft payments for every active PJLP contract in one transaction.
+
+        Pajak = honor x tarif PPh 21 (NPWP / non-NPWP), potongan_lain per orang;
+        parameters left None fall back to PJLP_PAYROLL_DEFAULT.
+        Idempotent: contracts that already have a payment for the month
+        (manual or from an earlier run) are skipped, and a repeated run adds
+        only the missing rows to the month's active run.
+
+        Returns the run (see get_payroll_runs_pjlp) plus jumlah_baru and
+        jumlah_dilewati; 'id' is None when no contract needed a payment.
+        """
+        params = dict(PJLP_PAYROLL_DEFAULT)
+        overrides = {
+            'tarif_pajak_npwp': tarif_pajak_npwp,
+            'tarif_pajak_non_npwp': tarif_pajak_non_npwp,
+            'potongan_lain': potongan_lain,
+            'total_hari_kerja': total_hari_kerja,
+        }
+        params.update({k: v for k, v in overrides.items() if v is not None})
+        params.update({
+            'bulan': bulan,
+            'tahun': tahun,
+            'awal': date(tahun, bulan, 1).isoformat(),
+            'akhir': date(tahun, bulan, calendar.monthrange(tahun, bulan)[1]).isoformat(),
+        })
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                cursor.execute("""
+                    SELECT id FROM payroll_run_pjlp
+                    WHERE bulan = ? AND tahun = ? AND status = 'aktif'
+                """, (bulan, tahun))
+                row = cursor.fetchone()
+                if row:
+                    run_id, run_baru = row['id'], False
+                else:
+                    cursor.execute("""
+                        INSERT INTO payroll_run_pjlp (
+                            bulan, tahun, tarif_pajak_npwp, tarif_pajak_non_npwp,
+                            potongan_lain, total_hari_kerja, created_by
+                        ) VALUES (:bulan, :tahun, :tarif_pajak_npwp, :tarif_pajak_non_npwp,
+                                  :potongan_lain, :total_hari_kerja, :created_by)
+                    """, {**params, 'created_by': created_by})
+                    run_id, run_baru = cursor.lastrowid, True
+                params['run_id'] = run_id
+
+                cursor.execute(f"""
+                    SELECT COUNT(*) FROM pjlp WHERE {self._PJLP_PAYROLL_FILTER}
+                """, params)
+                jumlah_kontrak = cursor.fetchone()[0]
+
+                cursor.execute(f"""
+                    INSERT INTO pembayaran_pjlp (
+                        pjlp_id, bulan, tahun, nilai_bruto, potongan_pajak,
+                        potongan_lain, nilai_netto, kehadiran_hari, total_hari_kerja,
+                        status, payroll_run_id
+                    )
+                    SELECT id, :bulan, :tahun, bruto, pajak,
+                        :potongan_lain, bruto - pajak - :potongan_lain,
+                        :total_hari_kerja, :total_hari_kerja, 'draft', :run_id
+                    FROM (
+                        SELECT id, honor_bulanan as bruto,
+                            ROUND(honor_bulanan * CASE
+                                WHEN TRIM(COALESCE(npwp, '')) <> '' THEN :tarif_pajak_npwp
+                                ELSE :tarif_pajak_non_npwp
+                            END) as pajak
+                        FROM pjlp
+                        WHERE {self._PJLP_PAYROLL_FILTER}
+                    )
+                    WHERE 1
+                    ON CONFLICT(pjlp_id, bulan, tahun) DO NOTHING
+                """, params)
+                jumlah_baru = cursor.rowcount
+
+                if run_baru and jumlah_baru == 0:
+                    conn.rollback()
+                    return {'id': None, 'bulan': bulan, 'tahun': tahun,
+                            'jumlah_baru': 0, 'jumlah_dilewati': jumlah_kontrak}
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+        run = self.get_payroll_runs_pjlp(run_id=run_id)[0]
+        run['jumlah_baru'] = jumlah_baru
+        run['jumlah_dilewati'] = jumlah_kontrak - jumlah_baru
+        return run
+
+    def reverse_payroll_pjlp(self, run_id: int) -> bool:
+        """
+        Cancel a payroll run as a unit: delete all of its payments.
+
+        Refused (ValueError) once any of its payments has left 'draft', so a
+        run is never half-reversed. Returns False if the run is not active.
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                cursor.execute("""
+                    SELECT id FROM payroll_run_pjlp WHERE id = ? AND status = 'aktif'
+                """, (run_id,))
+                if not cursor.fetchone():
+                    conn.rollback()
+                    return False
+
+                cursor.execute("""
+                    SELECT COUNT(*) FROM pembayaran_pjlp
+                    WHERE payroll_run_id = ? AND status != 'draft'
+                """, (run_id,))
+                terkunci = cursor.fetchone()[0]
+                if terkunci:
+                    raise ValueError(
+                        f"{terkunci} pembayaran sudah diproses/dibayar, "
+                        f"payroll tidak dapat dibatalkan")
+
+                cursor.execute("DELETE FROM pembayaran_pjlp WHERE payroll_run_id = ?", (run_id,))
+                cursor.execute("""
+                    UPDATE payroll_run_pjlp
+                    SET status = 'dibatalkan', dibatalkan_at = CURRENT_TIMESTAMP
+                    WHERE id = ?
+                """, (run_id,))
+                conn.commit()
+                return True
+            except Exception:
+                conn.rollback()
+                raise
+
+    def get_payroll_runs_pjlp(self, bulan: int = None, tahun: int = None,
+                              status: str = None, run_id: int = None) -> List[Dict]:
+        """Get payroll runs with their payment totals (one grouped query)"""
+        query = """
+            SELECT r.*,
+                COUNT(p.id) as jumlah_pembayaran,
+                COALESCE(SUM(p.nilai_bruto), 0) as total_bruto,
+                COALESCE(SUM(p.potongan_pajak), 0) as total_pajak,
+                COALESCE(SUM(p.potongan_lain), 0) as total_potongan_lain,
+                COALESCE(SUM(p.nilai_netto), 0) as total_netto
+            FROM payroll_run_pjlp r
+            LEFT JOIN pembayaran_pjlp p ON p.payroll_run_id = r.id
+            WHERE 1=1
+        """
+        params = []
+        for column, value in (('r.id', run_id), ('r.bulan', bulan),
+                              ('r.tahun', tahun), ('r.status', status)):
+            if value is not None:
+                query += f" AND {column} = ?"
+                params.append(value)
+        query += " GROUP BY r.id ORDER BY r.tahun DESC, r.bulan DESC, r.id DESC"
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            return [dict(row) for row in cursor.fetchall()]
 
     # ========================================================================
     # SK KPA (Surat Keputusan KPA) METHODS
@@ -3123,6 +3606,7 @@ class DatabaseManagerV4:
                 data.get('status', 'draft')
             ))
             conn.commit()
+            self._publish_pembayaran(TOPIC_SK_KPA, 'create', cursor.lastrowid)
             return cursor.lastrowid
 
     def get_sk_kpa(self, sk_id: int) -> Optional[Dict]:
@@ -3149,6 +3633,39 @@ class DatabaseManagerV4:
             cursor.execute(query, params)
             return [dict(row) for row in cursor.fetchall()]
 
+    def list_sk_kpa(self, tahun: int = None, jenis: str = None, search: str = None,
+                    limit: int = 100, offset: int = 0, order_by: str = None,
+                    descending: bool = True) -> Tuple[List[Dict], int]:
+        """
+        List SK KPA per halaman dengan filter dan sort di query.
+
+        Args:
+            tahun: Filter tahun anggaran
+            jenis: Filter jenis pembayaran
+            search: Cari di nomor SK atau perihal
+            limit: Jumlah hasil maksimal
+            offset: Offset untuk pagination
+            order_by: Kolom sort (lihat SORT_COLUMNS_SK_KPA), default tanggal_sk
+            descending: Urutan menurun
+
+        Returns:
+            Tuple (list SK KPA, total count)
+        """
+        conditions, params = [], []
+        if tahun:
+            conditions.append("s.tahun_anggaran = ?")
+            params.append(tahun)
+        if jenis:
+            conditions.append("s.jenis_pembayaran = ?")
+            params.append(jenis)
+        if search:
+            conditions.append("(s.nomor_sk LIKE ? OR s.perihal LIKE ?)")
+            params.extend([f"%{search}%", f"%{search}%"])
+        order_sql = self._order_sql(SORT_COLUMNS_SK_KPA, order_by, descending, "s.id",
+                                    default="s.tanggal_sk DESC, s.id DESC")
+        return self._list_page("s.*", "sk_kpa s", conditions, params, order_sql,
+                               limit, offset)
+
     def update_sk_kpa(self, sk_id: int, data: Dict) -> bool:
         """Update SK KPA"""
         with self.get_connection() as conn:
@@ -3185,6 +3702,7 @@ class DatabaseManagerV4:
                 sk_id
             ))
             conn.commit()
+            self._publish_pembayaran(TOPIC_SK_KPA, 'update', sk_id)
             return cursor.rowcount > 0
 
     def delete_sk_kpa(self, sk_id: int) -> bool:
@@ -3193,6 +3711,7 @@ class DatabaseManagerV4:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM sk_kpa WHERE id = ?", (sk_id,))
             conn.commit()
+            self._publish_pembayaran(TOPIC_SK_KPA, 'delete', sk_id)
             return cursor.rowcount > 0
 
     # ========================================================================
@@ -3246,6 +3765,7 @@ class DatabaseManagerV4:
                 data.get('keterangan')
             ))
             conn.commit()
+            self._publish_pembayaran(TOPIC_HONORARIUM, 'create', cursor.lastrowid)
             return cursor.lastrowid
 
     def get_honorarium(self, hon_id: int) -> Optional[Dict]:
@@ -3285,8 +3805,41 @@ class DatabaseManagerV4:
             cursor.execute(query, params)
             return [dict(row) for row in cursor.fetchall()]
 
+    def list_honorarium(self, tahun: int = None, kategori: str = None, search: str = None,
+                        limit: int = 100, offset: int = 0, order_by: str = None,
+                        descending: bool = True) -> Tuple[List[Dict], int]:
+        """
+        List honorarium per halaman dengan filter dan sort di query.
+
+        Args:
+            tahun: Filter tahun anggaran
+            kategori: Filter kategori (reguler/insidentil)
+            search: Cari di nama kegiatan atau nomor SK KPA
+            limit: Jumlah hasil maksimal
+            offset: Offset untuk pagination
+            order_by: Kolom sort (lihat SORT_COLUMNS_HONORARIUM), default created_at
+            descending: Urutan menurun
+
+        Returns:
+            Tuple (list honorarium, total count)
+        """
+        conditions, params = [], []
+        if tahun:
+            conditions.append("h.tahun_anggaran = ?")
+            params.append(tahun)
+        if kategori:
+            conditions.append("h.kategori = ?")
+            params.append(kategori)
+        if search:
+            conditions.append("(h.nama_kegiatan LIKE ? OR h.nomor_sk_kpa LIKE ?)")
+            params.extend([f"%{search}%", f"%{search}%"])
+        order_sql = self._order_sql(SORT_COLUMNS_HONORARIUM, order_by, descending, "h.id",
+                                    default="h.created_at DESC, h.id DESC")
+        return self._list_page("h.*", "honorarium h", conditions, params, order_sql,
+                               limit, offset)
+
     def update_honorarium(self, hon_id: int, data: Dict) -> bool:
-        """Update honorarium"""
+        """Update honorarium (totals are kept from the details when it has any)"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
@@ -3299,7 +3852,9 @@ class DatabaseManagerV4:
                     kpa_id = ?, kpa_nama = ?, kpa_nip = ?,
                     ppk_id = ?, ppk_nama = ?, ppk_nip = ?,
                     bendahara_id = ?, bendahara_nama = ?, bendahara_nip = ?,
-                    total_bruto = ?, total_pajak = ?, total_netto = ?,
+                    total_bruto = CASE WHEN jumlah_penerima > 0 THEN total_bruto ELSE ? END,
+                    total_pajak = CASE WHEN jumlah_penerima > 0 THEN total_pajak ELSE ? END,
+                    total_netto = CASE WHEN jumlah_penerima > 0 THEN total_netto ELSE ? END,
                     status = ?, keterangan = ?,
                     updated_at = CURRENT_TIMESTAMP
                 WHERE id = ?
@@ -3336,6 +3891,7 @@ class DatabaseManagerV4:
                 hon_id
             ))
             conn.commit()
+            self._publish_pembayaran(TOPIC_HONORARIUM, 'update', hon_id)
             return cursor.rowcount > 0
 
     def delete_honorarium(self, hon_id: int) -> bool:
@@ -3344,41 +3900,88 @@ class DatabaseManagerV4:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM honorarium WHERE id = ?", (hon_id,))
             conn.commit()
+            self._publish_pembayaran(TOPIC_HONORARIUM, 'delete', hon_id)
             return cursor.rowcount > 0
 
     # Honorarium Detail
+    _HONORARIUM_DETAIL_INSERT = """
+        INSERT INTO honorarium_detail (
+            honorarium_id, nama, nip, jabatan, pangkat_golongan,
+            npwp, no_rekening, nama_bank, peran,
+            jumlah_jp, tarif_per_jp, nilai_bruto, pph21,
+            potongan_lain, nilai_netto, keterangan
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def _honorarium_detail_nilai(data: Dict) -> Tuple[float, float, float, float]:
+        """Nilai (bruto, pph21, potongan_lain, netto) rincian; yang kosong diturunkan"""
+        bruto = data.get('nilai_bruto')
+        if bruto is None:
+            bruto = (data.get('jumlah_jp', 1) or 0) * (data.get('tarif_per_jp', 0) or 0)
+        pph21 = data.get('pph21', 0) or 0
+        potongan_lain = data.get('potongan_lain', 0) or 0
+        netto = data.get('nilai_netto')
+        if netto is None:
+            netto = bruto - pph21 - potongan_lain
+        return bruto, pph21, potongan_lain, netto
+
+    def _honorarium_detail_params(self, honorarium_id: int, data: Dict) -> tuple:
+        bruto, pph21, potongan_lain, netto = self._honorarium_detail_nilai(data)
+        return (
+            honorarium_id,
+            data.get('nama'),
+            data.get('nip'),
+            data.get('jabatan'),
+            data.get('pangkat_golongan'),
+            data.get('npwp'),
+            data.get('no_rekening'),
+            data.get('nama_bank'),
+            data.get('peran'),
+            data.get('jumlah_jp', 1),
+            data.get('tarif_per_jp', 0),
+            bruto,
+            pph21,
+            potongan_lain,
+            netto,
+            data.get('keterangan')
+        )
+
     def add_honorarium_detail(self, data: Dict) -> int:
-        """Add honorarium detail"""
+        """Add honorarium detail (header totals follow via trigger)"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO honorarium_detail (
-                    honorarium_id, nama, nip, jabatan, pangkat_golongan,
-                    npwp, no_rekening, nama_bank, peran,
-                    jumlah_jp, tarif_per_jp, nilai_bruto, pph21,
-                    potongan_lain, nilai_netto, keterangan
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                data.get('honorarium_id'),
-                data.get('nama'),
-                data.get('nip'),
-                data.get('jabatan'),
-                data.get('pangkat_golongan'),
-                data.get('npwp'),
-                data.get('no_rekening'),
-                data.get('nama_bank'),
-                data.get('peran'),
-                data.get('jumlah_jp', 1),
-                data.get('tarif_per_jp', 0),
-                data.get('nilai_bruto', 0),
-                data.get('pph21', 0),
-                data.get('potongan_lain', 0),
-                data.get('nilai_netto', 0),
-                data.get('keterangan')
-            ))
+            cursor.execute(self._HONORARIUM_DETAIL_INSERT,
+                           self._honorarium_detail_params(data.get('honorarium_id'), data))
             conn.commit()
+            self._publish_pembayaran(TOPIC_HONORARIUM, 'detail', data.get('honorarium_id'))
             return cursor.lastrowid
 
+    def import_honorarium_details(self, honorarium_id: int, rows: List[Dict],
+                                  replace: bool = False) -> int:
+        """
+        Insert many honorarium recipients in one transaction.
+
+        All rows are written or none (e.g. a row without nama rolls back the
+        whole import). With replace=True the existing details are removed
+        first. Header totals follow via the honorarium_detail triggers.
+        Returns the number of rows inserted.
+        """
+        params = [self._honorarium_detail_params(honorarium_id, row) for row in rows]
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                if replace:
+                    cursor.execute("DELETE FROM honorarium_detail WHERE honorarium_id = ?",
+                                   (honorarium_id,))
+                cursor.executemany(self._HONORARIUM_DETAIL_INSERT, params)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+        self._publish_pembayaran(TOPIC_HONORARIUM, 'detail', honorarium_id)
+        return len(params)
+
     def get_honorarium_details(self, honorarium_id: int) -> List[Dict]:
         """Get all details for honorarium"""
         with self.get_connection() as conn:
@@ -3391,7 +3994,8 @@ class DatabaseManagerV4:
             return [dict(row) for row in cursor.fetchall()]
 
     def update_honorarium_detail(self, detail_id: int, data: Dict) -> bool:
-        """Update honorarium detail"""
+        """Update honorarium detail (header totals follow via trigger)"""
+        bruto, pph21, potongan_lain, netto = self._honorarium_detail_nilai(data)
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
@@ -3412,24 +4016,108 @@ class DatabaseManagerV4:
                 data.get('peran'),
                 data.get('jumlah_jp', 1),
                 data.get('tarif_per_jp', 0),
-                data.get('nilai_bruto', 0),
-                data.get('pph21', 0),
-                data.get('potongan_lain', 0),
-                data.get('nilai_netto', 0),
+                bruto,
+                pph21,
+                potongan_lain,
+                netto,
                 data.get('keterangan'),
                 detail_id
             ))
             conn.commit()
+            self._publish_pembayaran(TOPIC_HONORARIUM, 'detail')
             return cursor.rowcount > 0
 
     def delete_honorarium_detail(self, detail_id: int) -> bool:
-        """Delete honorarium detail"""
+        """Delete honorarium detail (header totals follow via trigger)"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM honorarium_detail WHERE id = ?", (detail_id,))
             conn.commit()
+            self._publish_pembayaran(TOPIC_HONORARIUM, 'detail')
             return cursor.rowcount > 0
 
+    # Honorarium Totals
+    _HONORARIUM_TOTALS_SQL = """
+        SELECT h.id, h.jumlah_penerima,
+            COALESCE(h.total_bruto, 0) as total_bruto,
+            COALESCE(h.total_pajak, 0) as total_pajak,
+            COALESCE(h.total_netto, 0) as total_netto,
+            COALESCE(d.bruto, 0) as seharusnya_bruto,
+            COALESCE(d.pajak, 0) as seharusnya_pajak,
+            COALESCE(d.netto, 0) as seharusnya_netto,
+            COALESCE(d.penerima, 0) as seharusnya_penerima
+        FROM honorarium h
+        LEFT JOIN (
+            SELECT honorarium_id,
+                SUM(COALESCE(nilai_bruto, 0)) as bruto,
+                SUM(COALESCE(pph21, 0)) as pajak,
+                SUM(COALESCE(nilai_netto, 0)) as netto,
+                COUNT(*) as penerima
+            FROM honorarium_detail
+            GROUP BY honorarium_id
+        ) d ON d.honorarium_id = h.id
+        WHERE (d.penerima IS NOT NULL OR h.jumlah_penerima <> 0)
+    """
+
+    def _recompute_honorarium_totals(self, cursor, hon_ids: List[int] = None):
+        """Tulis ulang total header yang punya rincian dari honorarium_detail"""
+        query = self._HONORARIUM_TOTALS_SQL
+        params = []
+        if hon_ids is not None:
+            if not hon_ids:
+                return
+            query += f" AND h.id IN ({','.join('?' * len(hon_ids))})"
+            params.extend(hon_ids)
+        cursor.execute(query, params)
+        cursor.executemany("""
+            UPDATE honorarium SET
+                total_bruto = ?, total_pajak = ?, total_netto = ?, jumlah_penerima = ?
+            WHERE id = ?
+        """, [
+            (row['seharusnya_bruto'], row['seharusnya_pajak'], row['seharusnya_netto'],
+             row['seharusnya_penerima'], row['id'])
+            for row in cursor.fetchall()
+        ])
+
+    def reconcile_honorarium_totals(self, tahun: int = None, perbaiki: bool = True) -> Dict:
+        """
+        Recompute all honorarium header totals from their details and diff.
+
+        Headers without details keep their manually entered totals and are
+        not checked. One grouped query covers every header.
+
+        Args:
+            tahun: Filter tahun anggaran (default: semua)
+            perbaiki: Jika True, tulis total yang benar ke header yang drift
+
+        Returns:
+            Dict dengan 'drift' (list per header) dan 'ok'
+        """
+        query = self._HONORARIUM_TOTALS_SQL
+        params = []
+        if tahun:
+            query += " AND h.tahun_anggaran = ?"
+            params.append(tahun)
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+
+            drift = []
+            for row in cursor.fetchall():
+                if (abs(row['total_bruto'] - row['seharusnya_bruto']) > 0.005
+                        or abs(row['total_pajak'] - row['seharusnya_pajak']) > 0.005
+                        or abs(row['total_netto'] - row['seharusnya_netto']) > 0.005
+                        or row['jumlah_penerima'] != row['seharusnya_penerima']):
+                    drift.append(dict(row))
+
+            if perbaiki and drift:
+                self._recompute_honorarium_totals(cursor, [d['id'] for d in drift])
+                conn.commit()
+                self._publish_pembayaran(TOPIC_HONORARIUM, 'reconcile')
+
+        return {'drift': drift, 'ok': not drift}
+
     # ========================================================================
     # JAMUAN TAMU METHODS
     # ========================================================================
@@ -3487,6 +4175,7 @@ class DatabaseManagerV4:
                 data.get('keterangan')
             ))
             conn.commit()
+            self._publish_pembayaran(TOPIC_JAMUAN_TAMU, 'create', cursor.lastrowid)
             return cursor.lastrowid
 
     def get_jamuan_tamu(self, jt_id: int) -> Optional[Dict]:
@@ -3526,6 +4215,39 @@ class DatabaseManagerV4:
             cursor.execute(query, params)
             return [dict(row) for row in cursor.fetchall()]
 
+    def list_jamuan_tamu(self, tahun: int = None, kategori: str = None, search: str = None,
+                         limit: int = 100, offset: int = 0, order_by: str = None,
+                         descending: bool = True) -> Tuple[List[Dict], int]:
+        """
+        List jamuan tamu per halaman dengan filter dan sort di query.
+
+        Args:
+            tahun: Filter tahun anggaran
+            kategori: Filter kategori (reguler/insidentil)
+            search: Cari di nama kegiatan atau nama tamu
+            limit: Jumlah hasil maksimal
+            offset: Offset untuk pagination
+            order_by: Kolom sort (lihat SORT_COLUMNS_JAMUAN_TAMU), default tanggal_kegiatan
+            descending: Urutan menurun
+
+        Returns:
+            Tuple (list jamuan tamu, total count)
+        """
+        conditions, params = [], []
+        if tahun:
+            conditions.append("j.tahun_anggaran = ?")
+            params.append(tahun)
+        if kategori:
+            conditions.append("j.kategori = ?")
+            params.append(kategori)
+        if search:
+            conditions.append("(j.nama_kegiatan LIKE ? OR j.nama_tamu LIKE ?)")
+            params.extend([f"%{search}%", f"%{search}%"])
+        order_sql = self._order_sql(SORT_COLUMNS_JAMUAN_TAMU, order_by, descending, "j.id",
+                                    default="j.tanggal_kegiatan DESC, j.id DESC")
+        return self._list_page("j.*", "jamuan_tamu j", conditions, params, order_sql,
+                               limit, offset)
+
     def update_jamuan_tamu(self, jt_id: int, data: Dict) -> bool:
         """Update jamuan tamu"""
         with self.get_connection() as conn:
@@ -3583,6 +4305,7 @@ class DatabaseManagerV4:
                 jt_id
             ))
             conn.commit()
+            self._publish_pembayaran(TOPIC_JAMUAN_TAMU, 'update', jt_id)
             return cursor.rowcount > 0
 
     def delete_jamuan_tamu(self, jt_id: int) -> bool:
@@ -3591,6 +4314,7 @@ class DatabaseManagerV4:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM jamuan_tamu WHERE id = ?", (jt_id,))
             conn.commit()
+            self._publish_pembayaran(TOPIC_JAMUAN_TAMU, 'delete', jt_id)
             return cursor.rowcount > 0
 
     # ========================================================================
@@ -4000,6 +4724,7 @@ class DatabaseManagerV4:
                 data.get('keterangan')
             ))
             conn.commit()
+            self._publish_pembayaran(TOPIC_HONOR_PENGELOLA, 'create', cursor.lastrowid)
             return cursor.lastrowid
 
     def update_honorarium_pengelola(self, hp_id: int, data: Dict) -> bool:
@@ -4025,6 +4750,7 @@ class DatabaseManagerV4:
                 hp_id
             ))
             conn.commit()
+            self._publish_pembayaran(TOPIC_HONOR_PENGELOLA, 'update', hp_id)
             return cursor.rowcount > 0
 
     def delete_honorarium_pengelola(self, hp_id: int) -> bool:
@@ -4033,6 +4759,7 @@ class DatabaseManagerV4:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM honorarium_pengelola WHERE id = ?", (hp_id,))
             conn.commit()
+            self._publish_pembayaran(TOPIC_HONOR_PENGELOLA, 'delete', hp_id)
             return cursor.rowcount > 0
 
     def get_honorarium_pengelola(self, hp_id: int) -> Optional[Dict]:
@@ -4071,6 +4798,43 @@ class DatabaseManagerV4:
             cursor.execute(sql, params)
             return [dict(row) for row in cursor.fetchall()]
 
+    def list_honorarium_pengelola(self, tahun: int = None, bulan: int = None,
+                                  search: str = None, limit: int = 100, offset: int = 0,
+                                  order_by: str = None,
+                                  descending: bool = True) -> Tuple[List[Dict], int]:
+        """
+        List honorarium pengelola per halaman dengan filter dan sort di query.
+
+        Args:
+            tahun: Filter tahun
+            bulan: Filter bulan
+            search: Cari di nama pegawai atau jabatan
+            limit: Jumlah hasil maksimal
+            offset: Offset untuk pagination
+            order_by: Kolom sort (lihat SORT_COLUMNS_HONOR_PENGELOLA),
+                default tahun/bulan terbaru lalu jabatan
+            descending: Urutan menurun
+
+        Returns:
+            Tuple (list honorarium pengelola, total count)
+        """
+        conditions, params = [], []
+        if tahun:
+            conditions.append("hp.tahun = ?")
+            params.append(tahun)
+        if bulan:
+            conditions.append("hp.bulan = ?")
+            params.append(bulan)
+        if search:
+            conditions.append("(p.nama LIKE ? OR hp.jabatan LIKE ?)")
+            params.extend([f"%{search}%", f"%{search}%"])
+        order_sql = self._order_sql(SORT_COLUMNS_HONOR_PENGELOLA, order_by, descending, "hp.id",
+                                    default="hp.tahun DESC, hp.bulan DESC, hp.jabatan, hp.id")
+        return self._list_page(
+            "hp.*, p.nama as pegawai_nama, p.nip as pegawai_nip",
+            "honorarium_pengelola hp LEFT JOIN pegawai p ON hp.pegawai_id = p.id",
+            conditions, params, order_sql, limit, offset)
+
     def get_pagu_for_honorarium_pengelola(self, tahun: int) -> List[Dict]:
         """Get pagu anggaran items for honorarium pengelola keuangan"""
         with self.get_connection() as conn:
@@ -0,0 +1,145 @@
+"""
+PPK DOCUMENT FACTORY - Data Change Events
+==========================================
+Event bus in-process untuk notifikasi perubahan data.
+
+Manager (PencairanManager, dll) mem-publish event setelah commit pada
+jalur tulis transaksi, dokumen, saldo dan fase. UI berlangganan dan hanya
+me-refresh agregat yang terdampak, bukan memuat ulang seluruh dashboard.
+
+Modul ini tidak bergantung pada Qt; callback dipanggil sinkron di thread
+pemanggil publish(). Penggabungan (coalescing) event dan pemindahan ke
+GUI thread dilakukan di sisi UI (lihat app.ui.data_change_notifier).
+"""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# ============================================================================
+# TOPICS
+# ============================================================================
+
+TOPIC_TRANSAKSI = "transaksi"
+TOPIC_DOKUMEN = "dokumen"
+TOPIC_SALDO = "saldo"
+TOPIC_FASE = "fase"
+TOPIC_TUP_DEADLINE = "tup_deadline"  # Pengingat batas TUP (bukan perubahan data)
+TOPIC_MASTER_DATA = "master_data"    # Pegawai / satker pejabat (DatabaseManagerV4)
+TOPIC_LEMBAR = "lembar_permintaan"   # Lembar permintaan & rinciannya
+
+# Pembayaran lainnya (DatabaseManagerV4); nama topic = nama tabel
+TOPIC_SK_KPA = "sk_kpa"
+TOPIC_HONORARIUM = "honorarium"      # Termasuk rincian yang mengubah total header
+TOPIC_JAMUAN_TAMU = "jamuan_tamu"
+TOPIC_HONOR_PENGELOLA = "honorarium_pengelola"
+PEMBAYARAN_LAINNYA_TOPICS = (TOPIC_SK_KPA, TOPIC_HONORARIUM, TOPIC_JAMUAN_TAMU,
+                             TOPIC_HONOR_PENGELOLA)
+
+ALL_TOPICS = (TOPIC_TRANSAKSI, TOPIC_DOKUMEN, TOPIC_SALDO, TOPIC_FASE)
+
+
+@dataclass(frozen=True)
+class DataChangeEvent:
+    """Satu perubahan data yang sudah di-commit."""
+    topic: str
+    action: str = ""
+    transaksi_id: Optional[int] = None
+    mekanisme: Optional[str] = None
+    data: Dict[str, Any] = field(default_factory=dict)
+
+
+Subscriber = Callable[[DataChangeEvent], None]
+
+
+# ============================================================================
+# EVENT BUS
+# ============================================================================
+
+class EventBus:
+    """
+    Publish/subscribe sederhana per topic.
+
+    Thread-safe: subscribe/unsubscribe/publish boleh dari thread mana pun.
+    Exception di subscriber dicetak sebagai warning dan tidak menghentikan
+    subscriber lain maupun operasi tulis yang mem-publish.
+    """
+
+    def __init__(self):
+        self._subscribers: List[Tuple[Subscriber, Optional[frozenset]]] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback: Subscriber,
+                  topics: Iterable[str] = None) -> Callable[[], None]:
+        """
+        Register callback(event). topics=None berarti semua topic.
+
+        Returns:
+            Fungsi tanpa argumen untuk berhenti berlangganan
+        """
+        entry = (callback, frozenset(topics) if topics is not None else None)
+        with self._lock:
+            self._subscribers.append(entry)
+
+        def unsubscribe():
+            with self._lock:
+                if entry in self._subscribers:
+                    self._subscribers.remove(entry)
+
+        return unsubscribe
+
+    def publish(self, topic: str, action: str = "", transaksi_id: int = None,
+                mekanisme: str = None, **data) -> DataChangeEvent:
+        """Kirim event ke semua subscriber topic tersebut."""
+        event = DataChangeEvent(topic, action, transaksi_id, mekanisme, data)
+        with self._lock:
+            subscribers = list(self._subscribers)
+
+        for callback, topics in subscribers:
+            if topics is not None and topic not in topics:
+                continue
+            try:
+                callback(event)
+            except Exception as e:
+                print(f"Warning: Event subscriber error ({topic}/{action}): {e}")
+        return event
+
+    def clear(self):
+        """Hapus semua subscriber."""
+        with self._lock:
+            self._subscribers.clear()
+
+
+# Singleton instance
+_event_bus: Optional[EventBus] = None
+_event_bus_lock = threading.Lock()
+
+
+def get_event_bus() -> EventBus:
+    """Get singleton event bus."""
+    global _event_bus
+    if _event_bus is None:
+        with _event_bus_lock:
+            if _event_bus is None:
+                _event_bus = EventBus()
+    return _event_bus
+
+
+__all__ = [
+    'TOPIC_TRANSAKSI',
+    'TOPIC_DOKUMEN',
+    'TOPIC_SALDO',
+    'TOPIC_FASE',
+    'TOPIC_TUP_DEADLINE',
+    'TOPIC_MASTER_DATA',
+    'TOPIC_LEMBAR',
+    'TOPIC_SK_KPA',
+    'TOPIC_HONORARIUM',
+    'TOPIC_JAMUAN_TAMU',
+    'TOPIC_HONOR_PENGELOLA',
+    'PEMBAYARAN_LAINNYA_TOPICS',
+    'ALL_TOPICS',
+    'DataChangeEvent',
+    'EventBus',
+    'get_event_bus',
+]
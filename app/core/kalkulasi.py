@@ -0,0 +1,241 @@
+"""
+PPK DOCUMENT FACTORY - Kalkulasi Core
+=====================================
+Satu sumber untuk format Rupiah, terbilang dan perhitungan rincian.
+
+Dipakai oleh widget kalkulasi, dialog perjalanan dinas/swakelola dan
+template engine sehingga semua tampilan dan dokumen memakai format yang
+sama. Modul ini tidak bergantung pada Qt.
+
+KalkulasiModel menyimpan total secara inkremental: perubahan satu nilai
+atau satu item hanya menambahkan selisihnya ke total, bukan menjumlah
+ulang seluruh tabel.
+"""
+
+from typing import Any, Callable, Dict, Iterable, List
+
+
+# ============================================================================
+# FORMATTING
+# ============================================================================
+
+def format_rupiah(value: float) -> str:
+    """Format angka ke format Rupiah (dibulatkan): 1500000 -> 'Rp 1.500.000'."""
+    if value is None:
+        return "Rp 0"
+    return f"Rp {value:,.0f}".replace(",", ".")
+
+
+def format_angka(nilai: float) -> str:
+    """Format angka dengan pemisah ribuan (dipotong ke bilangan bulat)."""
+    if nilai is None:
+        nilai = 0
+    return f"{int(nilai):,}".replace(",", ".")
+
+
+_SATUAN = ["", "satu", "dua", "tiga", "empat", "lima",
+           "enam", "tujuh", "delapan", "sembilan", "sepuluh", "sebelas"]
+
+
+def _terbilang_kata(num: int) -> str:
+    if num < 0:
+        return "minus " + _terbilang_kata(-num)
+    elif num < 12:
+        return _SATUAN[num]
+    elif num < 20:
+        return _SATUAN[num - 10] + " belas"
+    elif num < 100:
+        return _SATUAN[num // 10] + " puluh " + _SATUAN[num % 10]
+    elif num < 200:
+        return "seratus " + _terbilang_kata(num - 100)
+    elif num < 1000:
+        return _SATUAN[num // 100] + " ratus " + _terbilang_kata(num % 100)
+    elif num < 2000:
+        return "seribu " + _terbilang_kata(num - 1000)
+    elif num < 1000000:
+        return _terbilang_kata(num // 1000) + " ribu " + _terbilang_kata(num % 1000)
+    elif num < 1000000000:
+        return _terbilang_kata(num // 1000000) + " juta " + _terbilang_kata(num % 1000000)
+    elif num < 1000000000000:
+        return _terbilang_kata(num // 1000000000) + " miliar " + _terbilang_kata(num % 1000000000)
+    else:
+        return _terbilang_kata(num // 1000000000000) + " triliun " + _terbilang_kata(num % 1000000000000)
+
+
+def terbilang(n: float) -> str:
+    """Convert number to Indonesian words: 1500 -> 'seribu lima ratus rupiah'."""
+    if n == 0:
+        return "nol rupiah"
+
+    result = _terbilang_kata(int(n)).strip()
+    while "  " in result:
+        result = result.replace("  ", " ")
+    return result.strip() + " rupiah"
+
+
+# ============================================================================
+# SELISIH UANG MUKA VS REALISASI
+# ============================================================================
+
+STATUS_KURANG_BAYAR = "KURANG_BAYAR"
+STATUS_LEBIH_BAYAR = "LEBIH_BAYAR"
+STATUS_PAS = "PAS"
+
+
+def hitung_selisih(uang_muka: float, realisasi: float) -> Dict[str, Any]:
+    """
+    Hitung selisih realisasi terhadap uang muka.
+
+    Returns:
+        Dict dengan selisih, selisih_abs dan status
+        (KURANG_BAYAR / LEBIH_BAYAR / PAS)
+    """
+    selisih = realisasi - uang_muka
+    if selisih > 0:
+        status = STATUS_KURANG_BAYAR
+    elif selisih < 0:
+        status = STATUS_LEBIH_BAYAR
+    else:
+        status = STATUS_PAS
+    return {'selisih': selisih, 'selisih_abs': abs(selisih), 'status': status}
+
+
+# ============================================================================
+# CALCULATION MODEL
+# ============================================================================
+
+class KalkulasiModel:
+    """
+    Calculation model bound to by the kalkulasi widgets.
+
+    Total = jumlah komponen bernama (mis. biaya_transport) + jumlah
+    'jumlah' seluruh item rincian. Setiap perubahan memperbarui total
+    secara inkremental lalu memanggil listener dengan total baru.
+    """
+
+    def __init__(self, komponen: Iterable[str] = ()):
+        self._komponen: Dict[str, float] = {name: 0.0 for name in komponen}
+        self._items: List[Dict[str, Any]] = []
+        self._total = 0.0
+        self._listeners: List[Callable[[float], None]] = []
+
+    # -------------------------------------------------------------------------
+    # LISTENERS
+    # -------------------------------------------------------------------------
+
+    def subscribe(self, callback: Callable[[float], None]):
+        """Register callback(total) called after every change."""
+        self._listeners.append(callback)
+
+    def _changed(self, delta: float):
+        if delta:
+            self._total += delta
+        for callback in list(self._listeners):
+            callback(self._total)
+
+    # -------------------------------------------------------------------------
+    # KOMPONEN
+    # -------------------------------------------------------------------------
+
+    def set_value(self, name: str, value: float):
+        """Set a named component; only the difference is applied to the total."""
+        value = float(value or 0)
+        old = self._komponen.get(name, 0.0)
+        self._komponen[name] = value
+        self._changed(value - old)
+
+    def set_values(self, values: Dict[str, float]):
+        """Set several components at once (one notification)."""
+        delta = 0.0
+        for name, value in values.items():
+            value = float(value or 0)
+            delta += value - self._komponen.get(name, 0.0)
+            self._komponen[name] = value
+        self._changed(delta)
+
+    def get_value(self, name: str) -> float:
+        return self._komponen.get(name, 0.0)
+
+    def get_values(self) -> Dict[str, float]:
+        return dict(self._komponen)
+
+    # -------------------------------------------------------------------------
+    # ITEM RINCIAN
+    # -------------------------------------------------------------------------
+
+    @property
+    def items(self) -> List[Dict[str, Any]]:
+        """Live list of rincian items (jangan diubah langsung)."""
+        return self._items
+
+    def add_item(self, uraian: str, volume: float, satuan: str,
+                 harga_satuan: float) -> Dict[str, Any]:
+        """Append an item; jumlah = volume x harga_satuan."""
+        item = {
+            'uraian': uraian,
+            'volume': volume,
+            'satuan': satuan,
+            'harga_satuan': harga_satuan,
+            'jumlah': volume * harga_satuan,
+        }
+        self._items.append(item)
+        self._changed(item['jumlah'])
+        return item
+
+    def update_item(self, index: int, **changes) -> Dict[str, Any]:
+        """Update one item (cell edit); jumlah is recomputed for that row only."""
+        item = self._items[index]
+        old_jumlah = item.get('jumlah', 0) or 0
+        item.update(changes)
+        if 'jumlah' not in changes and ('volume' in changes or 'harga_satuan' in changes):
+            item['jumlah'] = (item.get('volume', 0) or 0) * (item.get('harga_satuan', 0) or 0)
+        self._changed((item.get('jumlah', 0) or 0) - old_jumlah)
+        return item
+
+    def remove_items(self, indices: Iterable[int]):
+        """Remove items by index."""
+        delta = 0.0
+        for index in sorted(set(indices), reverse=True):
+            if 0 <= index < len(self._items):
+                delta -= self._items.pop(index).get('jumlah', 0) or 0
+        self._changed(delta)
+
+    def set_items(self, items: Iterable[Dict[str, Any]]):
+        """Replace all items (full recomputation)."""
+        self._items = list(items)
+        self._recompute()
+
+    def clear_items(self):
+        self._items = []
+        self._recompute()
+
+    def _recompute(self):
+        self._total = (sum(self._komponen.values())
+                       + sum(item.get('jumlah', 0) or 0 for item in self._items))
+        self._changed(0)
+
+    # -------------------------------------------------------------------------
+    # DERIVED
+    # -------------------------------------------------------------------------
+
+    @property
+    def total(self) -> float:
+        return self._total
+
+    def total_rupiah(self) -> str:
+        return format_rupiah(self._total)
+
+    def total_terbilang(self) -> str:
+        return terbilang(self._total)
+
+
+__all__ = [
+    'format_rupiah',
+    'format_angka',
+    'terbilang',
+    'hitung_selisih',
+    'KalkulasiModel',
+    'STATUS_KURANG_BAYAR',
+    'STATUS_LEBIH_BAYAR',
+    'STATUS_PAS',
+]
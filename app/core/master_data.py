@@ -0,0 +1,233 @@
+"""
+PPK DOCUMENT FACTORY - Master Data Directory
+============================================
+Direktori in-memory pegawai, peran (PPK/PPSPM/Bendahara/...) dan pejabat
+satker yang dipakai bersama oleh semua dialog.
+
+Data dimuat sekali (2 query: pegawai dan satker) saat pertama dibutuhkan,
+lalu lookup per id, NIP dan peran berjalan dari memori. Cache di-invalidate otomatis ketika
+DatabaseManagerV4 menulis pegawai/satker (event TOPIC_MASTER_DATA), sehingga
+membuka dialog tidak lagi bergantung pada ukuran tabel pegawai.
+
+Modul ini tidak bergantung pada Qt; model combo bersama ada di
+app.ui.master_data_models.
+"""
+
+import os
+import sqlite3
+import threading
+from typing import Callable, Dict, List, Optional
+
+from .config import DATABASE_PATH
+from .events import DataChangeEvent, TOPIC_MASTER_DATA, get_event_bus
+from .query_stats import connect
+
+# ============================================================================
+# CONSTANTS
+# ============================================================================
+
+# Peran -> kolom flag di tabel pegawai (sama dengan get_pegawai_by_role)
+ROLE_COLUMNS = {
+    'ppk': 'is_ppk',
+    'ppspm': 'is_ppspm',
+    'bendahara': 'is_bendahara',
+    'pemeriksa': 'is_pemeriksa',
+    'pejabat_pengadaan': 'is_pejabat_pengadaan',
+}
+
+# Pejabat satker -> kolom id di tabel satker
+PEJABAT_SATKER = ('kpa', 'ppk', 'ppspm', 'bendahara')
+_PEJABAT_FIELDS = ('nama', 'nip', 'jabatan', 'pangkat', 'golongan')
+_SATKER_PEJABAT_BASE = ('id', 'kode', 'nama', 'nama_pendek',
+                        'kpa_id', 'ppk_id', 'ppspm_id', 'bendahara_id')
+
+
+def format_nama_pegawai(pegawai: Optional[Dict]) -> str:
+    """Nama lengkap dengan gelar depan/belakang."""
+    if not pegawai:
+        return ""
+    nama = pegawai.get('nama') or ''
+    if pegawai.get('gelar_depan'):
+        nama = f"{pegawai['gelar_depan']} {nama}"
+    if pegawai.get('gelar_belakang'):
+        nama = f"{nama}, {pegawai['gelar_belakang']}"
+    return nama
+
+
+# ============================================================================
+# DIRECTORY
+# ============================================================================
+
+class MasterDataDirectory:
+    """
+    Snapshot pegawai + pejabat satker untuk satu database.
+
+    Dict yang dikembalikan dipakai bersama oleh semua pemanggil; anggap
+    read-only (copy dulu bila perlu diubah).
+    """
+
+    def __init__(self, db_path: str = None, bus=None):
+        self.db_path = db_path or DATABASE_PATH
+        self._key = os.path.abspath(self.db_path)
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._version = 0
+        self._listeners: List[Callable[[], None]] = []
+
+        self._pegawai: List[Dict] = []
+        self._by_id: Dict[int, Dict] = {}
+        self._by_nip: Dict[str, Dict] = {}
+        self._by_role: Dict[str, List[Dict]] = {}
+        self._satker: Dict = {}
+        self._satker_pejabat: Dict = {}
+
+        self._unsubscribe = (bus or get_event_bus()).subscribe(
+            self._on_event, [TOPIC_MASTER_DATA])
+
+    # ------------------------------------------------------------------
+    # Loading / invalidation
+    # ------------------------------------------------------------------
+
+    @property
+    def version(self) -> int:
+        """Naik setiap kali cache di-invalidate."""
+        return self._version
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            conn = connect(self.db_path)
+            conn.row_factory = sqlite3.Row
+            try:
+                pegawai = [dict(r) for r in conn.execute(
+                    "SELECT * FROM pegawai ORDER BY nama")]
+                row = conn.execute("SELECT * FROM satker LIMIT 1").fetchone()
+                satker = dict(row) if row else None
+            finally:
+                conn.close()
+
+            by_id = {p['id']: p for p in pegawai}
+            active = [p for p in pegawai if p.get('is_active')]
+            self._pegawai = pegawai
+            self._by_id = by_id
+            self._by_nip = {p['nip']: p for p in pegawai if p.get('nip')}
+            self._by_role = {
+                role: [p for p in active if p.get(column)]
+                for role, column in ROLE_COLUMNS.items()
+            }
+            self._satker = satker or {}
+            self._satker_pejabat = self._compose_pejabat(satker, by_id)
+            self._loaded = True
+
+    @staticmethod
+    def _compose_pejabat(satker: Optional[Dict], by_id: Dict[int, Dict]) -> Dict:
+        """Bentuk sama dengan DatabaseManagerV4.get_satker_pejabat()."""
+        if not satker:
+            return {}
+        result = {key: satker.get(key) for key in _SATKER_PEJABAT_BASE}
+        for jabatan in PEJABAT_SATKER:
+            pegawai = by_id.get(satker.get(f'{jabatan}_id')) or {}
+            for field in _PEJABAT_FIELDS:
+                result[f'{jabatan}_{field}'] = pegawai.get(field)
+        return result
+
+    def invalidate(self):
+        """Buang snapshot; dimuat ulang pada akses berikutnya."""
+        with self._lock:
+            self._loaded = False
+            self._version += 1
+            listeners = list(self._listeners)
+        for callback in listeners:
+            try:
+                callback()
+            except Exception as e:
+                print(f"Warning: Master data listener error: {e}")
+
+    def add_listener(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """callback() dipanggil setelah invalidate. Returns fungsi unsubscribe."""
+        with self._lock:
+            self._listeners.append(callback)
+
+        def remove():
+            with self._lock:
+                if callback in self._listeners:
+                    self._listeners.remove(callback)
+
+        return remove
+
+    def _on_event(self, event: DataChangeEvent):
+        db_path = event.data.get('db_path')
+        if db_path and os.path.abspath(db_path) != self._key:
+            return
+        self.invalidate()
+
+    def close(self):
+        """Berhenti mendengarkan event bus."""
+        self._unsubscribe()
+        with self._lock:
+            self._listeners.clear()
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def all_pegawai(self, active_only: bool = True) -> List[Dict]:
+        """Semua pegawai urut nama."""
+        self._ensure_loaded()
+        if active_only:
+            return [p for p in self._pegawai if p.get('is_active')]
+        return list(self._pegawai)
+
+    def get_pegawai(self, pegawai_id: int) -> Optional[Dict]:
+        self._ensure_loaded()
+        return self._by_id.get(pegawai_id)
+
+    def get_pegawai_by_nip(self, nip: str) -> Optional[Dict]:
+        self._ensure_loaded()
+        return self._by_nip.get(nip)
+
+    def get_pegawai_by_role(self, role: str) -> List[Dict]:
+        """Pegawai aktif dengan flag peran; peran tidak dikenal -> []."""
+        self._ensure_loaded()
+        return list(self._by_role.get((role or '').lower(), []))
+
+    def get_satker(self) -> Dict:
+        """Baris satker (sama dengan DatabaseManagerV4.get_satker())."""
+        self._ensure_loaded()
+        return dict(self._satker)
+
+    def get_satker_pejabat(self) -> Dict:
+        """Satker + nama/NIP/jabatan KPA, PPK, PPSPM dan Bendahara."""
+        self._ensure_loaded()
+        return dict(self._satker_pejabat)
+
+
+# ============================================================================
+# REGISTRY
+# ============================================================================
+
+_directories: Dict[str, MasterDataDirectory] = {}
+_directories_lock = threading.Lock()
+
+
+def get_master_data(db_path: str = None) -> MasterDataDirectory:
+    """Direktori bersama per database (default: DATABASE_PATH)."""
+    key = os.path.abspath(db_path or DATABASE_PATH)
+    with _directories_lock:
+        directory = _directories.get(key)
+        if directory is None:
+            directory = MasterDataDirectory(db_path)
+            _directories[key] = directory
+        return directory
+
+
+__all__ = [
+    'ROLE_COLUMNS',
+    'PEJABAT_SATKER',
+    'format_nama_pegawai',
+    'MasterDataDirectory',
+    'get_master_data',
+]
@@ -0,0 +1,386 @@
+"""
+PPK DOCUMENT FACTORY - Query Instrumentation
+=============================================
+Instrumentasi query SQLite (opt-in) untuk DatabaseManager,
+DatabaseManagerV4 dan PencairanManager.
+
+Per statement dicatat: jumlah eksekusi, total & p95 latency, dan jumlah
+baris yang dikembalikan. Statement yang melebihi SLOW_QUERY_THRESHOLD_MS
+ditulis ke rotating log (data/logs/slow_query.log).
+
+Aktifkan:
+    PPK_SQL_STATS=1 python main.py
+    python main.py --sql-stats
+
+Lihat top offenders (dari snapshot yang disimpan saat aplikasi ditutup):
+    python -m app.core.query_stats --top 20 --sort p95
+"""
+
+import argparse
+import atexit
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import deque
+from logging.handlers import RotatingFileHandler
+from typing import Dict, List, Optional
+
+from .config import (
+    QUERY_STATS_ENABLED, SLOW_QUERY_THRESHOLD_MS, SLOW_QUERY_LOG_PATH,
+    SLOW_QUERY_LOG_MAX_BYTES, SLOW_QUERY_LOG_BACKUPS, QUERY_STATS_PATH,
+)
+
+# Jumlah sampel latency per statement untuk menghitung p95
+SAMPLE_SIZE = 1024
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+SORT_KEYS = ('total_ms', 'p95_ms', 'count', 'rows', 'avg_ms', 'max_ms')
+
+
+def normalize_sql(sql: str) -> str:
+    """Collapse whitespace so the same statement maps to one key."""
+    return _WHITESPACE_RE.sub(" ", sql).strip()
+
+
+# ============================================================================
+# STATISTICS REGISTRY
+# ============================================================================
+
+class _StatementStats:
+    """Accumulated statistics for one normalized statement."""
+
+    __slots__ = ('sql', 'count', 'total', 'max', 'rows', 'samples')
+
+    def __init__(self, sql: str):
+        self.sql = sql
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.rows = 0
+        self.samples: deque = deque(maxlen=SAMPLE_SIZE)
+
+    def p95(self) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(s[0] for s in self.samples)
+        index = min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def to_dict(self) -> Dict:
+        return {
+            'sql': self.sql,
+            'count': self.count,
+            'rows': self.rows,
+            'total_ms': round(self.total * 1000, 3),
+            'avg_ms': round(self.total * 1000 / self.count, 3) if self.count else 0.0,
+            'p95_ms': round(self.p95() * 1000, 3),
+            'max_ms': round(self.max * 1000, 3),
+        }
+
+
+class QueryStats:
+    """Thread-safe registry of per-statement statistics."""
+
+    def __init__(self, threshold_ms: float = SLOW_QUERY_THRESHOLD_MS,
+                 log_path: str = SLOW_QUERY_LOG_PATH):
+        self.threshold = threshold_ms / 1000.0
+        self.log_path = log_path
+        self._stats: Dict[str, _StatementStats] = {}
+        self._lock = threading.Lock()
+        self._logger: Optional[logging.Logger] = None
+
+    # -------------------------------------------------------------------------
+    # Recording (dipanggil oleh InstrumentedCursor)
+    # -------------------------------------------------------------------------
+
+    def record(self, sql: str, elapsed: float) -> list:
+        """Record one execution. Returns the sample so fetches can extend it."""
+        key = normalize_sql(sql)
+        sample = [elapsed, False]  # [elapsed detik, sudah di-log sebagai slow]
+        with self._lock:
+            stat = self._stats.get(key)
+            if stat is None:
+                stat = self._stats[key] = _StatementStats(key)
+            stat.count += 1
+            stat.total += elapsed
+            stat.samples.append(sample)
+            if elapsed > stat.max:
+                stat.max = elapsed
+        self._check_slow(key, sample, 0)
+        return sample
+
+    def record_fetch(self, sql: str, sample: list, elapsed: float, rows: int):
+        """Add fetch time and returned rows to an execution sample."""
+        key = normalize_sql(sql)
+        with self._lock:
+            stat = self._stats.get(key)
+            if stat is None:
+                return
+            stat.total += elapsed
+            stat.rows += rows
+            sample[0] += elapsed
+            if sample[0] > stat.max:
+                stat.max = sample[0]
+        self._check_slow(key, sample, rows)
+
+    def _check_slow(self, key: str, sample: list, rows: int):
+        if sample[1] or sample[0] < self.threshold:
+            return
+        sample[1] = True
+        self._get_logger().warning("%.1f ms | rows=%d | %s", sample[0] * 1000, rows, key)
+
+    def _get_logger(self) -> logging.Logger:
+        if self._logger is None:
+            logger = logging.getLogger(f"ppk.slow_query.{id(self)}")
+            logger.setLevel(logging.WARNING)
+            logger.propagate = False
+            os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+            handler = RotatingFileHandler(
+                self.log_path, maxBytes=SLOW_QUERY_LOG_MAX_BYTES,
+                backupCount=SLOW_QUERY_LOG_BACKUPS, encoding='utf-8'
+            )
+            handler.setFormatter(logging.Formatter("%(asctime)s | %(message)s"))
+            logger.addHandler(handler)
+            self._logger = logger
+        return self._logger
+
+    # -------------------------------------------------------------------------
+    # Reporting
+    # -------------------------------------------------------------------------
+
+    def snapshot(self) -> List[Dict]:
+        """All statements as dicts."""
+        with self._lock:
+            return [stat.to_dict() for stat in self._stats.values()]
+
+    def top(self, n: int = 20, sort_by: str = 'total_ms') -> List[Dict]:
+        """Top N statements by the given metric."""
+        if sort_by not in SORT_KEYS:
+            raise ValueError(f"sort_by harus salah satu dari {SORT_KEYS}")
+        rows = self.snapshot()
+        rows.sort(key=lambda r: r[sort_by], reverse=True)
+        return rows[:n]
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+    def save(self, path: str = QUERY_STATS_PATH):
+        """Persist snapshot as JSON (untuk CLI dump)."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'saved_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'threshold_ms': self.threshold * 1000,
+                'statements': self.snapshot(),
+            }, f, indent=2)
+
+
+def format_report(rows: List[Dict], sql_width: int = 80) -> str:
+    """Format rows from QueryStats.top() as a text table."""
+    header = f"{'count':>7} {'rows':>9} {'total ms':>11} {'avg ms':>9} {'p95 ms':>9} {'max ms':>9}  sql"
+    lines = [header, "-" * len(header)]
+    for r in rows:
+        sql = r['sql'] if len(r['sql']) <= sql_width else r['sql'][:sql_width - 3] + "..."
+        lines.append(
+            f"{r['count']:>7} {r['rows']:>9} {r['total_ms']:>11.1f} "
+            f"{r['avg_ms']:>9.2f} {r['p95_ms']:>9.2f} {r['max_ms']:>9.2f}  {sql}"
+        )
+    return "\n".join(lines)
+
+
+# ============================================================================
+# INSTRUMENTED CONNECTION
+# ============================================================================
+
+class InstrumentedCursor(sqlite3.Cursor):
+    """Cursor that times execute/fetch and counts returned rows."""
+
+    _sql = None
+    _sample = None
+
+    def execute(self, sql, parameters=()):
+        start = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            self._track(sql, time.perf_counter() - start)
+
+    def executemany(self, sql, seq_of_parameters):
+        start = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            self._track(sql, time.perf_counter() - start)
+
+    def executescript(self, sql_script):
+        start = time.perf_counter()
+        try:
+            return super().executescript(sql_script)
+        finally:
+            self._track("-- SCRIPT --", time.perf_counter() - start)
+
+    def fetchone(self):
+        start = time.perf_counter()
+        row = super().fetchone()
+        self._track_fetch(time.perf_counter() - start, 0 if row is None else 1)
+        return row
+
+    def fetchmany(self, size=None):
+        start = time.perf_counter()
+        rows = super().fetchmany(self.arraysize if size is None else size)
+        self._track_fetch(time.perf_counter() - start, len(rows))
+        return rows
+
+    def fetchall(self):
+        start = time.perf_counter()
+        rows = super().fetchall()
+        self._track_fetch(time.perf_counter() - start, len(rows))
+        return rows
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        row = self.fetchone()
+        if row is None:
+            raise StopIteration
+        return row
+
+    def _track(self, sql: str, elapsed: float):
+        stats = _registry
+        if stats is None:
+            return
+        self._sql = sql
+        self._sample = stats.record(sql, elapsed)
+
+    def _track_fetch(self, elapsed: float, rows: int):
+        stats = _registry
+        if stats is None or self._sample is None:
+            return
+        stats.record_fetch(self._sql, self._sample, elapsed, rows)
+
+
+class InstrumentedConnection(sqlite3.Connection):
+    """Connection whose cursors (and shortcut execute methods) are instrumented."""
+
+    def cursor(self, factory=None):
+        return super().cursor(factory or InstrumentedCursor)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def executescript(self, sql_script):
+        return self.cursor().executescript(sql_script)
+
+
+# ============================================================================
+# MODULE API
+# ============================================================================
+
+_registry: Optional[QueryStats] = None
+
+
+def connect(db_path: str, **kwargs) -> sqlite3.Connection:
+    """
+    Open a SQLite connection; instrumented only when stats are enabled.
+
+    Dipakai oleh get_connection() di semua manager database.
+    """
+    if _registry is not None:
+        kwargs.setdefault('factory', InstrumentedConnection)
+    return sqlite3.connect(db_path, **kwargs)
+
+
+def enable_query_stats(threshold_ms: float = None, log_path: str = None) -> QueryStats:
+    """Enable instrumentation for connections opened from now on."""
+    global _registry
+    if _registry is None:
+        _registry = QueryStats(
+            threshold_ms if threshold_ms is not None else SLOW_QUERY_THRESHOLD_MS,
+            log_path or SLOW_QUERY_LOG_PATH,
+        )
+    else:
+        if threshold_ms is not None:
+            _registry.threshold = threshold_ms / 1000.0
+    return _registry
+
+
+def disable_query_stats():
+    """Disable instrumentation (statistik yang ada dibuang)."""
+    global _registry
+    _registry = None
+
+
+def get_query_stats() -> Optional[QueryStats]:
+    """Active registry, or None when instrumentation is off."""
+    return _registry
+
+
+def is_query_stats_enabled() -> bool:
+    return _registry is not None
+
+
+def _save_on_exit():
+    if _registry is not None and _registry.snapshot():
+        try:
+            _registry.save()
+        except Exception as e:
+            print(f"Warning: Gagal menyimpan query stats: {e}")
+
+
+atexit.register(_save_on_exit)
+
+if QUERY_STATS_ENABLED:
+    enable_query_stats()
+
+
+__all__ = [
+    'QueryStats',
+    'InstrumentedConnection',
+    'InstrumentedCursor',
+    'connect',
+    'enable_query_stats',
+    'disable_query_stats',
+    'get_query_stats',
+    'is_query_stats_enabled',
+    'format_report',
+    'normalize_sql',
+]
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Tampilkan query paling lambat/sering")
+    parser.add_argument('--file', default=QUERY_STATS_PATH, help="Snapshot JSON query stats")
+    parser.add_argument('--top', type=int, default=20, help="Jumlah statement")
+    parser.add_argument('--sort', default='total_ms', choices=SORT_KEYS, help="Urutkan berdasarkan")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.file):
+        print(f"Snapshot tidak ditemukan: {args.file}")
+        print("Jalankan aplikasi dengan PPK_SQL_STATS=1 atau --sql-stats terlebih dahulu.")
+        return 1
+
+    with open(args.file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    rows = sorted(data.get('statements', []), key=lambda r: r[args.sort], reverse=True)
+    print(f"Snapshot: {data.get('saved_at')} | slow threshold: {data.get('threshold_ms')} ms")
+    print(format_report(rows[:args.top]))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
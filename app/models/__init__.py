@@ -13,6 +13,7 @@ from .pencairan_models import (
     JENIS_BELANJA,
     BATAS_UP_MAKSIMAL,
     BATAS_TUP_HARI,
+    TUP_PENGINGAT_HARI,
 )
 
 __all__ = [
@@ -20,4 +21,5 @@ __all__ = [
     'JENIS_BELANJA',
     'BATAS_UP_MAKSIMAL',
     'BATAS_TUP_HARI',
+    'TUP_PENGINGAT_HARI',
 ]
@@ -7,7 +7,8 @@ Tabel utama:
 1. transaksi_pencairan - Master transaksi pencairan
 2. dokumen_transaksi - Dokumen per fase
 3. fase_log - Log perpindahan fase
-4. saldo_up - Tracking saldo UP
+4. saldo_up - Saldo UP per bulan (materialisasi dari up_ledger)
+5. up_ledger - Jurnal append-only pergerakan UP per event transaksi
 """
 
 import sqlite3
@@ -23,12 +24,44 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from core.config import DATABASE_PATH, TAHUN_ANGGARAN
 
+try:
+    from app.core.query_stats import connect
+    from app.core.events import (
+        get_event_bus, TOPIC_TRANSAKSI, TOPIC_DOKUMEN, TOPIC_SALDO, TOPIC_FASE,
+        TOPIC_LEMBAR,
+    )
+except ImportError:
+    from core.query_stats import connect
+    from core.events import (
+        get_event_bus, TOPIC_TRANSAKSI, TOPIC_DOKUMEN, TOPIC_SALDO, TOPIC_FASE,
+        TOPIC_LEMBAR,
+    )
+
+try:
+    from app.config.workflow_config import cek_validasi_fase
+except ImportError:
+    from config.workflow_config import cek_validasi_fase
+
 # ============================================================================
 # KONSTANTA
 # ============================================================================
 
 BATAS_UP_MAKSIMAL = 50_000_000  # Rp 50 juta
 BATAS_TUP_HARI = 30  # 1 bulan untuk pertanggungjawaban TUP
+TUP_PENGINGAT_HARI = (7, 3)  # Pengingat H-7 dan H-3 sebelum batas TUP
+
+# Sisa hari pertanggungjawaban TUP (NULL jika belum SP2D), dipakai
+# get_countdown_tup dan list_transaksi. Parameter: _sisa_hari_tup_params()
+_SISA_HARI_TUP_SQL = "CAST(julianday(date({kolom}, ?)) - julianday(?) AS INTEGER)"
+
+
+def _sisa_hari_tup_params(hari_ini: date = None) -> List[str]:
+    return [f"+{BATAS_TUP_HARI} days", (hari_ini or date.today()).isoformat()]
+
+
+def _sekarang() -> datetime:
+    """Waktu lokal saat event ledger UP dicatat."""
+    return datetime.now()
 
 # Jenis Belanja yang didukung
 JENIS_BELANJA = [
@@ -40,6 +73,23 @@ JENIS_BELANJA = [
     {"kode": "lainnya", "nama": "Belanja Lainnya", "icon": "box", "akun_default": "5.2.2.99"},
 ]
 
+# Urutan status dokumen; kode dengan beberapa baris memakai status tertinggi
+_RANK_STATUS_DOKUMEN = {'pending': 0, 'draft': 1, 'final': 2, 'uploaded': 3, 'signed': 4}
+
+# Kolom yang boleh dipakai untuk sorting list_transaksi
+SORT_COLUMNS_TRANSAKSI = {
+    'kode_transaksi': 't.kode_transaksi',
+    'nama_kegiatan': 't.nama_kegiatan',
+    'jenis_belanja': 't.jenis_belanja',
+    'estimasi_biaya': 't.estimasi_biaya',
+    'nilai_kontrak': 'COALESCE(NULLIF(t.nilai_kontrak, 0), t.estimasi_biaya)',
+    'fase_aktif': 't.fase_aktif',
+    'status': 't.status',
+    'tanggal_sp2d_tup': 't.tanggal_sp2d_tup',
+    'penyedia_nama': 'p.nama',
+    'created_at': 't.created_at',
+}
+
 # ============================================================================
 # ENUM CLASSES
 # ============================================================================
@@ -146,6 +196,7 @@ CREATE INDEX IF NOT EXISTS idx_transaksi_mekanisme ON transaksi_pencairan(mekani
 CREATE INDEX IF NOT EXISTS idx_transaksi_status ON transaksi_pencairan(status);
 CREATE INDEX IF NOT EXISTS idx_transaksi_tahun ON transaksi_pencairan(tahun_anggaran);
 CREATE INDEX IF NOT EXISTS idx_transaksi_jenis ON transaksi_pencairan(jenis_belanja);
+CREATE INDEX IF NOT EXISTS idx_transaksi_mekanisme_created ON transaksi_pencairan(mekanisme, created_at);
 """
 
 SCHEMA_DOKUMEN_TRANSAKSI = """
@@ -206,6 +257,25 @@ CREATE TABLE IF NOT EXISTS saldo_up (
 );
 """
 
+SCHEMA_UP_LEDGER = """
+CREATE TABLE IF NOT EXISTS up_ledger (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    tahun_anggaran INTEGER NOT NULL,
+    bulan INTEGER NOT NULL,
+    transaksi_id INTEGER,               -- NULL untuk koreksi manual
+    event TEXT NOT NULL,                -- CREATE, UPDATE, FASE, STATUS, KOREKSI, SINKRON
+    penggunaan REAL NOT NULL DEFAULT 0,
+    pertanggungjawaban REAL NOT NULL DEFAULT 0,
+    keterangan TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+    FOREIGN KEY (transaksi_id) REFERENCES transaksi_pencairan(id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_up_ledger_periode ON up_ledger(tahun_anggaran, bulan);
+CREATE INDEX IF NOT EXISTS idx_up_ledger_transaksi ON up_ledger(transaksi_id);
+"""
+
 SCHEMA_COUNTER_TRANSAKSI = """
 CREATE TABLE IF NOT EXISTS counter_transaksi (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -382,10 +452,16 @@ class PencairanManager:
         self.db_path = db_path or DATABASE_PATH
         self._init_database()
 
+    def _publish(self, topic: str, action: str, transaksi_id: int = None,
+                 mekanisme: str = None, **data):
+        """Publish data-change event setelah commit."""
+        get_event_bus().publish(topic, action, transaksi_id, mekanisme,
+                                db_path=self.db_path, **data)
+
     @contextmanager
     def get_connection(self):
         """Context manager untuk database connection."""
-        conn = sqlite3.connect(self.db_path)
+        conn = connect(self.db_path)
         conn.row_factory = sqlite3.Row
         try:
             yield conn
@@ -402,6 +478,7 @@ class PencairanManager:
             cursor.executescript(SCHEMA_DOKUMEN_TRANSAKSI)
             cursor.executescript(SCHEMA_FASE_LOG)
             cursor.executescript(SCHEMA_SALDO_UP)
+            cursor.executescript(SCHEMA_UP_LEDGER)
             cursor.executescript(SCHEMA_COUNTER_TRANSAKSI)
             cursor.executescript(SCHEMA_LEMBAR_PERMINTAAN)
             cursor.executescript(SCHEMA_TRANSAKSI_ITEM)
@@ -540,10 +617,15 @@ class PencairanManager:
 
             # Log fase awal
             self._log_fase(conn, transaksi_id, None, 1, "CREATE", "Transaksi dibuat")
+            saldo_berubah = self._catat_ledger_up(conn, transaksi_id, "CREATE")
 
             conn.commit()
 
-            return transaksi_id
+        self._publish(TOPIC_TRANSAKSI, "create", transaksi_id, mekanisme)
+        if saldo_berubah:
+            self._publish(TOPIC_SALDO, "create", transaksi_id, mekanisme)
+
+        return transaksi_id
 
     def get_transaksi(self, transaksi_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -637,8 +719,18 @@ class PencairanManager:
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(query, values)
+            updated = cursor.rowcount > 0
+            saldo_berubah = False
+            if updated and ('uang_muka' in data or 'realisasi' in data):
+                saldo_berubah = self._catat_ledger_up(conn, transaksi_id, "UPDATE")
             conn.commit()
-            return cursor.rowcount > 0
+
+        if updated:
+            mekanisme = data.get('mekanisme')
+            self._publish(TOPIC_TRANSAKSI, "update", transaksi_id, mekanisme)
+            if saldo_berubah:
+                self._publish(TOPIC_SALDO, "update", transaksi_id, mekanisme)
+        return updated
 
     def update_fase(self, transaksi_id: int, fase_baru: int, catatan: str = None) -> bool:
         """
@@ -659,12 +751,16 @@ class PencairanManager:
             cursor = conn.cursor()
 
             # Get current fase
-            cursor.execute("SELECT fase_aktif FROM transaksi_pencairan WHERE id = ?", (transaksi_id,))
+            cursor.execute(
+                "SELECT fase_aktif, mekanisme FROM transaksi_pencairan WHERE id = ?",
+                (transaksi_id,)
+            )
             row = cursor.fetchone()
             if not row:
                 return False
 
             fase_lama = row[0]
+            mekanisme = row[1]
 
             # Update fase
             cursor.execute("""
@@ -678,9 +774,127 @@ class PencairanManager:
             # Log perpindahan
             aksi = "NEXT" if fase_baru > fase_lama else "BACK"
             self._log_fase(conn, transaksi_id, fase_lama, fase_baru, aksi, catatan)
+            saldo_berubah = self._catat_ledger_up(conn, transaksi_id, "FASE")
 
             conn.commit()
-            return True
+
+        self._publish(TOPIC_FASE, aksi.lower(), transaksi_id, mekanisme,
+                      fase_lama=fase_lama, fase_baru=fase_baru)
+        if saldo_berubah:
+            self._publish(TOPIC_SALDO, "fase", transaksi_id, mekanisme)
+        return True
+
+    def update_fase_batch(self, transaksi_ids: List[int], catatan: str = None,
+                          dry_run: bool = False) -> List[Dict[str, Any]]:
+        """
+        Majukan banyak transaksi satu fase sekaligus (mis. tutup bulan).
+
+        Setiap transaksi dicek terhadap dokumen wajib dan aturan validasi
+        fase aktifnya (workflow_config.cek_validasi_fase). Semua transaksi
+        yang lolos dipindah dan fase_log-nya ditulis dalam satu transaksi
+        database; yang tidak lolos tidak disentuh.
+
+        Args:
+            transaksi_ids: ID transaksi yang akan dimajukan
+            catatan: Catatan untuk fase_log
+            dry_run: Hanya evaluasi, tanpa menulis
+
+        Returns:
+            List laporan per transaksi (urut sesuai input):
+            transaksi_id, kode_transaksi, fase_dari, fase_ke, accepted,
+            errors, warnings
+        """
+        ids = list(dict.fromkeys(transaksi_ids))
+        report: Dict[int, Dict[str, Any]] = {}
+        diterima: List[Dict[str, Any]] = []
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            transaksi_map: Dict[int, Dict[str, Any]] = {}
+            dokumen_map: Dict[int, Dict[str, str]] = {}
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(
+                    f"SELECT * FROM transaksi_pencairan WHERE id IN ({placeholders})", chunk
+                )
+                for row in cursor.fetchall():
+                    transaksi_map[row['id']] = dict(row)
+                cursor.execute(f"""
+                    SELECT transaksi_id, kode_dokumen, status FROM dokumen_transaksi
+                    WHERE transaksi_id IN ({placeholders})
+                """, chunk)
+                for row in cursor.fetchall():
+                    dokumen = dokumen_map.setdefault(row['transaksi_id'], {})
+                    lama = dokumen.get(row['kode_dokumen'])
+                    if _RANK_STATUS_DOKUMEN.get(row['status'], 0) > _RANK_STATUS_DOKUMEN.get(lama, -1):
+                        dokumen[row['kode_dokumen']] = row['status']
+
+            for tid in ids:
+                transaksi = transaksi_map.get(tid)
+                item = {
+                    'transaksi_id': tid,
+                    'kode_transaksi': transaksi.get('kode_transaksi') if transaksi else None,
+                    'fase_dari': transaksi.get('fase_aktif') if transaksi else None,
+                    'fase_ke': None,
+                    'accepted': False,
+                    'errors': [],
+                    'warnings': [],
+                }
+                report[tid] = item
+
+                if not transaksi:
+                    item['errors'].append("Transaksi tidak ditemukan")
+                    continue
+                if transaksi['status'] in (StatusTransaksi.SELESAI, StatusTransaksi.BATAL):
+                    item['errors'].append(f"Transaksi sudah {transaksi['status']}")
+                    continue
+                fase = transaksi['fase_aktif'] or 1
+                if fase >= 5:
+                    item['errors'].append("Transaksi sudah di fase terakhir")
+                    continue
+
+                hasil = cek_validasi_fase(
+                    transaksi['mekanisme'], fase, transaksi, dokumen_map.get(tid, {})
+                )
+                item['errors'].extend(hasil['errors'])
+                item['warnings'].extend(hasil['warnings'])
+                if item['errors']:
+                    continue
+
+                item['fase_ke'] = fase + 1
+                item['accepted'] = True
+                diterima.append(item)
+
+            if dry_run or not diterima:
+                return [report[tid] for tid in ids]
+
+            cursor.executemany("""
+                UPDATE transaksi_pencairan
+                SET fase_aktif = ?,
+                    status = CASE WHEN ? = 5 THEN 'selesai' ELSE 'aktif' END,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            """, [(item['fase_ke'], item['fase_ke'], item['transaksi_id']) for item in diterima])
+            cursor.executemany("""
+                INSERT INTO fase_log (transaksi_id, fase_dari, fase_ke, aksi, catatan)
+                VALUES (?, ?, ?, 'NEXT', ?)
+            """, [(item['transaksi_id'], item['fase_dari'], item['fase_ke'], catatan)
+                  for item in diterima])
+            saldo_berubah = [
+                item for item in diterima
+                if self._catat_ledger_up(conn, item['transaksi_id'], "FASE")
+            ]
+
+            conn.commit()
+
+        for item in diterima:
+            self._publish(TOPIC_FASE, "next", item['transaksi_id'],
+                          transaksi_map[item['transaksi_id']]['mekanisme'],
+                          fase_lama=item['fase_dari'], fase_baru=item['fase_ke'])
+        if saldo_berubah:
+            self._publish(TOPIC_SALDO, "fase", mekanisme="UP")
+        return [report[tid] for tid in ids]
 
     def update_status(self, transaksi_id: int, status: str) -> bool:
         """Update status transaksi."""
@@ -695,8 +909,22 @@ class PencairanManager:
                 SET status = ?, updated_at = CURRENT_TIMESTAMP
                 WHERE id = ?
             """, (status, transaksi_id))
+            updated = cursor.rowcount > 0
+            saldo_berubah = False
+            mekanisme = None
+            if updated:
+                saldo_berubah = self._catat_ledger_up(conn, transaksi_id, "STATUS")
+                cursor.execute(
+                    "SELECT mekanisme FROM transaksi_pencairan WHERE id = ?", (transaksi_id,)
+                )
+                mekanisme = cursor.fetchone()[0]
             conn.commit()
-            return cursor.rowcount > 0
+
+        if updated:
+            self._publish(TOPIC_TRANSAKSI, "status", transaksi_id, mekanisme, status=status)
+            if saldo_berubah:
+                self._publish(TOPIC_SALDO, "status", transaksi_id, mekanisme)
+        return updated
 
     def delete_transaksi(self, transaksi_id: int) -> bool:
         """Delete transaksi (soft delete dengan set status batal)."""
@@ -710,11 +938,17 @@ class PencairanManager:
         tahun: int = None,
         search: str = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        order_by: str = None,
+        descending: bool = True,
+        hari_ini: date = None
     ) -> Tuple[List[Dict[str, Any]], int]:
         """
         List transaksi dengan filter.
 
+        Setiap baris TUP membawa sisa_hari_tup (sama dengan
+        get_countdown_tup); None untuk UP/LS dan TUP yang belum SP2D.
+
         Args:
             mekanisme: Filter by mekanisme (UP, TUP, LS)
             status: Filter by status
@@ -723,31 +957,41 @@ class PencairanManager:
             search: Search by nama kegiatan atau kode
             limit: Jumlah hasil maksimal
             offset: Offset untuk pagination
+            order_by: Kolom sort (lihat SORT_COLUMNS_TRANSAKSI), default created_at
+            descending: Urutan menurun
+            hari_ini: Tanggal acuan sisa_hari_tup (default: hari ini)
 
         Returns:
             Tuple (list transaksi, total count)
         """
-        conditions = ["status != 'batal'"]
+        order_by = order_by or 'created_at'
+        if order_by not in SORT_COLUMNS_TRANSAKSI:
+            raise ValueError(f"Kolom sort tidak valid: {order_by}")
+        direction = "DESC" if descending else "ASC"
+
+        conditions = ["t.status != 'batal'"]
         params = []
 
         if mekanisme:
-            conditions.append("mekanisme = ?")
+            conditions.append("t.mekanisme = ?")
             params.append(mekanisme)
 
         if status:
-            conditions.append("status = ?")
+            conditions.append("t.status = ?")
             params.append(status)
 
         if jenis_belanja:
-            conditions.append("jenis_belanja = ?")
+            conditions.append("t.jenis_belanja = ?")
             params.append(jenis_belanja)
 
         if tahun:
-            conditions.append("tahun_anggaran = ?")
+            conditions.append("t.tahun_anggaran = ?")
             params.append(tahun)
 
         if search:
-            conditions.append("(nama_kegiatan LIKE ? OR kode_transaksi LIKE ?)")
+            # Substring match sengaja tidak memakai index: baris yang di-scan
+            # sudah dibatasi filter mekanisme/tahun yang ter-index.
+            conditions.append("(t.nama_kegiatan LIKE ? OR t.kode_transaksi LIKE ?)")
             params.extend([f"%{search}%", f"%{search}%"])
 
         where_clause = " AND ".join(conditions)
@@ -757,7 +1001,7 @@ class PencairanManager:
 
             # Get total count
             cursor.execute(f"""
-                SELECT COUNT(*) FROM transaksi_pencairan WHERE {where_clause}
+                SELECT COUNT(*) FROM transaksi_pencairan t WHERE {where_clause}
             """, params)
             total = cursor.fetchone()[0]
 
@@ -766,13 +1010,16 @@ class PencairanManager:
                 SELECT
                     t.*,
                     p.nama as penyedia_nama,
-                    (t.realisasi - t.uang_muka) as selisih
+                    (t.realisasi - t.uang_muka) as selisih,
+                    CASE WHEN t.mekanisme = 'TUP'
+                         THEN {_SISA_HARI_TUP_SQL.format(kolom='t.tanggal_sp2d_tup')}
+                    END AS sisa_hari_tup
                 FROM transaksi_pencairan t
                 LEFT JOIN penyedia p ON t.penyedia_id = p.id
                 WHERE {where_clause}
-                ORDER BY t.created_at DESC
+                ORDER BY {SORT_COLUMNS_TRANSAKSI[order_by]} {direction}, t.id {direction}
                 LIMIT ? OFFSET ?
-            """, params + [limit, offset])
+            """, _sisa_hari_tup_params(hari_ini) + params + [limit, offset])
 
             rows = cursor.fetchall()
             return [dict(row) for row in rows], total
@@ -873,7 +1120,10 @@ class PencairanManager:
             ))
 
             conn.commit()
-            return cursor.lastrowid
+            dokumen_id = cursor.lastrowid
+
+        self._publish(TOPIC_DOKUMEN, "create", transaksi_id, dokumen_id=dokumen_id)
+        return dokumen_id
 
     def get_dokumen_by_transaksi(
         self,
@@ -923,7 +1173,11 @@ class PencairanManager:
             cursor = conn.cursor()
             cursor.execute(query, values)
             conn.commit()
-            return cursor.rowcount > 0
+            updated = cursor.rowcount > 0
+
+        if updated:
+            self._publish(TOPIC_DOKUMEN, "update", dokumen_id=dokumen_id)
+        return updated
 
     def update_dokumen_status(self, dokumen_id: int, status: str, file_path: str = None) -> bool:
         """Update status dokumen."""
@@ -944,7 +1198,11 @@ class PencairanManager:
                 """, (status, dokumen_id))
 
             conn.commit()
-            return cursor.rowcount > 0
+            updated = cursor.rowcount > 0
+
+        if updated:
+            self._publish(TOPIC_DOKUMEN, "status", dokumen_id=dokumen_id, status=status)
+        return updated
 
     def get_dokumen_progress(self, transaksi_id: int) -> Dict[str, Any]:
         """Get progress dokumen per fase untuk transaksi."""
@@ -1016,7 +1274,7 @@ class PencairanManager:
 
     def get_saldo_up(self, tahun: int = None, bulan: int = None) -> Dict[str, Any]:
         """
-        Get saldo UP untuk periode tertentu.
+        Get saldo UP untuk periode tertentu (read-only).
 
         Args:
             tahun: Tahun anggaran (default: tahun sekarang)
@@ -1032,15 +1290,6 @@ class PencairanManager:
 
         with self.get_connection() as conn:
             cursor = conn.cursor()
-
-            # Get or create saldo record
-            cursor.execute("""
-                INSERT INTO saldo_up (tahun_anggaran, bulan, saldo_awal)
-                VALUES (?, ?, ?)
-                ON CONFLICT(tahun_anggaran, bulan) DO NOTHING
-            """, (tahun, bulan, BATAS_UP_MAKSIMAL))
-            conn.commit()
-
             cursor.execute("""
                 SELECT * FROM saldo_up
                 WHERE tahun_anggaran = ? AND bulan = ?
@@ -1068,21 +1317,279 @@ class PencairanManager:
         penggunaan_delta: float = 0,
         pertanggungjawaban_delta: float = 0
     ) -> bool:
-        """Update saldo UP dengan delta penggunaan/pertanggungjawaban."""
+        """Koreksi manual saldo UP; dicatat sebagai entri KOREKSI di up_ledger."""
+        if not penggunaan_delta and not pertanggungjawaban_delta:
+            return False
+
+        with self.get_connection() as conn:
+            self._append_ledger_up(
+                conn, tahun, bulan, None, "KOREKSI",
+                penggunaan_delta, pertanggungjawaban_delta, "Koreksi manual"
+            )
+            conn.commit()
+
+        self._publish(TOPIC_SALDO, "koreksi", mekanisme="UP", bulan=bulan)
+        return True
+
+    def get_ledger_up(self, tahun: int = None, bulan: int = None,
+                      transaksi_id: int = None) -> List[Dict[str, Any]]:
+        """Get entri up_ledger, urut dari yang terlama."""
+        conditions = []
+        params = []
+        if tahun is not None:
+            conditions.append("tahun_anggaran = ?")
+            params.append(tahun)
+        if bulan is not None:
+            conditions.append("bulan = ?")
+            params.append(bulan)
+        if transaksi_id is not None:
+            conditions.append("transaksi_id = ?")
+            params.append(transaksi_id)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
         with self.get_connection() as conn:
             cursor = conn.cursor()
+            cursor.execute(f"SELECT * FROM up_ledger {where} ORDER BY id", params)
+            return [dict(row) for row in cursor.fetchall()]
+
+    @staticmethod
+    def hitung_efek_up(transaksi: Dict[str, Any]) -> Tuple[float, float]:
+        """
+        Efek transaksi terhadap saldo UP berdasarkan state-nya.
 
+        - Fase 1 / batal / bukan UP: tidak ada efek
+        - Fase 2-3 (uang muka dicairkan): penggunaan = uang_muka
+        - Fase 4 (pertanggungjawaban): penggunaan = realisasi jika sudah diisi
+        - Fase 5 (SPBY & penyelesaian): pertanggungjawaban = penggunaan
+
+        Returns:
+            Tuple (penggunaan, pertanggungjawaban)
+        """
+        if (transaksi.get('mekanisme') != 'UP'
+                or transaksi.get('status') == StatusTransaksi.BATAL):
+            return 0.0, 0.0
+
+        fase = transaksi.get('fase_aktif') or 1
+        if fase < 2:
+            return 0.0, 0.0
+
+        realisasi = transaksi.get('realisasi') or 0
+        if fase >= 4 and realisasi:
+            penggunaan = realisasi
+        else:
+            penggunaan = transaksi.get('uang_muka') or 0
+        pertanggungjawaban = penggunaan if fase >= 5 else 0
+        return float(penggunaan), float(pertanggungjawaban)
+
+    def _catat_ledger_up(self, conn, transaksi_id: int, event: str,
+                         keterangan: str = None) -> bool:
+        """
+        Catat selisih antara efek UP transaksi dan total ledger-nya.
+
+        Dipanggil di dalam transaksi database pemanggil sehingga perubahan
+        transaksi, entri ledger dan saldo_up commit bersama.
+
+        Returns:
+            True jika ada entri ledger baru (saldo berubah)
+        """
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT mekanisme, status, fase_aktif, uang_muka, realisasi, tahun_anggaran
+            FROM transaksi_pencairan WHERE id = ?
+        """, (transaksi_id,))
+        row = cursor.fetchone()
+        if not row or row['mekanisme'] != 'UP':
+            return False
+
+        penggunaan, pertanggungjawaban = self.hitung_efek_up(dict(row))
+        cursor.execute("""
+            SELECT COALESCE(SUM(penggunaan), 0), COALESCE(SUM(pertanggungjawaban), 0)
+            FROM up_ledger WHERE transaksi_id = ?
+        """, (transaksi_id,))
+        tercatat = cursor.fetchone()
+
+        delta_penggunaan = penggunaan - tercatat[0]
+        delta_pj = pertanggungjawaban - tercatat[1]
+        if not delta_penggunaan and not delta_pj:
+            return False
+
+        tahun = row['tahun_anggaran'] or TAHUN_ANGGARAN
+        self._append_ledger_up(
+            conn, tahun, self._bulan_ledger_up(tahun, _sekarang()),
+            transaksi_id, event, delta_penggunaan, delta_pj, keterangan
+        )
+        return True
+
+    @staticmethod
+    def _bulan_ledger_up(tahun: int, waktu: datetime) -> int:
+        """
+        Bulan saldo_up untuk entri ledger: bulan lokal saat uang bergerak.
+
+        Pencairan (fase 2) dan pertanggungjawaban (fase 5) satu transaksi
+        bisa jatuh di bulan berbeda dan masing-masing masuk bulannya
+        sendiri. Event di luar tahun anggaran (mis. penyelesaian Januari
+        tahun berikutnya) masuk ke Januari/Desember tahun anggaran itu.
+        """
+        if waktu.year < tahun:
+            return 1
+        if waktu.year > tahun:
+            return 12
+        return waktu.month
+
+    def _append_ledger_up(self, conn, tahun: int, bulan: int,
+                          transaksi_id: Optional[int], event: str,
+                          penggunaan: float, pertanggungjawaban: float,
+                          keterangan: str = None):
+        """Insert satu entri up_ledger dan terapkan ke saldo_up."""
+        cursor = conn.cursor()
+        cursor.execute("""
+            INSERT INTO up_ledger (
+                tahun_anggaran, bulan, transaksi_id, event,
+                penggunaan, pertanggungjawaban, keterangan
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, (tahun, bulan, transaksi_id, event,
+              penggunaan, pertanggungjawaban, keterangan))
+        cursor.execute("""
+            INSERT INTO saldo_up (
+                tahun_anggaran, bulan, saldo_awal,
+                total_penggunaan, total_pertanggungjawaban
+            ) VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(tahun_anggaran, bulan) DO UPDATE SET
+                total_penggunaan = total_penggunaan + excluded.total_penggunaan,
+                total_pertanggungjawaban = total_pertanggungjawaban + excluded.total_pertanggungjawaban,
+                updated_at = CURRENT_TIMESTAMP
+        """, (tahun, bulan, BATAS_UP_MAKSIMAL, penggunaan, pertanggungjawaban))
+
+    def reconcile_saldo_up(self, tahun: int = None, perbaiki: bool = True) -> Dict[str, Any]:
+        """
+        Rebuild saldo_up dari up_ledger dan laporkan drift.
+
+        1. Transaksi UP yang total ledger-nya tidak sesuai state transaksi
+           (mis. data lama sebelum ada ledger) diberi entri SINKRON di
+           bulan lokal perubahan terakhir transaksi (updated_at).
+        2. Total per bulan dihitung ulang dari ledger dan dibandingkan
+           dengan saldo_up.
+
+        Cukup dua query agregat per tahun sehingga aman dijalankan saat
+        aplikasi start.
+
+        Args:
+            tahun: Tahun anggaran (default: tahun sekarang)
+            perbaiki: Jika True, tulis entri SINKRON dan perbaiki saldo_up
+
+        Returns:
+            Dict dengan 'transaksi_drift', 'saldo_drift' dan 'ok'
+        """
+        if tahun is None:
+            tahun = TAHUN_ANGGARAN
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+
+            # 1. State transaksi vs ledger per transaksi
             cursor.execute("""
-                UPDATE saldo_up
-                SET
-                    total_penggunaan = total_penggunaan + ?,
-                    total_pertanggungjawaban = total_pertanggungjawaban + ?,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE tahun_anggaran = ? AND bulan = ?
-            """, (penggunaan_delta, pertanggungjawaban_delta, tahun, bulan))
+                SELECT t.id, t.mekanisme, t.status, t.fase_aktif, t.uang_muka, t.realisasi,
+                       datetime(COALESCE(t.updated_at, t.created_at), 'localtime') AS diubah_at,
+                       COALESCE(l.penggunaan, 0) AS ledger_penggunaan,
+                       COALESCE(l.pertanggungjawaban, 0) AS ledger_pj
+                FROM transaksi_pencairan t
+                LEFT JOIN (
+                    SELECT transaksi_id, SUM(penggunaan) AS penggunaan,
+                           SUM(pertanggungjawaban) AS pertanggungjawaban
+                    FROM up_ledger
+                    WHERE transaksi_id IS NOT NULL
+                    GROUP BY transaksi_id
+                ) l ON l.transaksi_id = t.id
+                WHERE t.tahun_anggaran = ? AND t.mekanisme = 'UP'
+            """, (tahun,))
+
+            transaksi_drift = []
+            for row in cursor.fetchall():
+                penggunaan, pj = self.hitung_efek_up(dict(row))
+                delta_penggunaan = penggunaan - row['ledger_penggunaan']
+                delta_pj = pj - row['ledger_pj']
+                if delta_penggunaan or delta_pj:
+                    # Waktu event asli tidak tercatat: pakai perubahan terakhir
+                    # transaksi (UTC di database, dikonversi ke waktu lokal)
+                    diubah = (datetime.fromisoformat(row['diubah_at'])
+                              if row['diubah_at'] else _sekarang())
+                    transaksi_drift.append({
+                        'transaksi_id': row['id'],
+                        'bulan': self._bulan_ledger_up(tahun, diubah),
+                        'penggunaan': delta_penggunaan,
+                        'pertanggungjawaban': delta_pj,
+                    })
+
+            if perbaiki:
+                for drift in transaksi_drift:
+                    self._append_ledger_up(
+                        conn, tahun, drift['bulan'], drift['transaksi_id'], "SINKRON",
+                        drift['penggunaan'], drift['pertanggungjawaban'],
+                        "Sinkronisasi dari state transaksi"
+                    )
+
+            # 2. Ledger vs saldo_up per bulan
+            cursor.execute("""
+                SELECT bulan, SUM(penggunaan) AS penggunaan,
+                       SUM(pertanggungjawaban) AS pertanggungjawaban
+                FROM up_ledger WHERE tahun_anggaran = ?
+                GROUP BY bulan
+            """, (tahun,))
+            seharusnya = {
+                row['bulan']: (row['penggunaan'] or 0, row['pertanggungjawaban'] or 0)
+                for row in cursor.fetchall()
+            }
 
-            conn.commit()
-            return cursor.rowcount > 0
+            cursor.execute("""
+                SELECT bulan, total_penggunaan, total_pertanggungjawaban
+                FROM saldo_up WHERE tahun_anggaran = ?
+            """, (tahun,))
+            tercatat = {
+                row['bulan']: (row['total_penggunaan'] or 0, row['total_pertanggungjawaban'] or 0)
+                for row in cursor.fetchall()
+            }
+
+            saldo_drift = []
+            for bulan in sorted(set(seharusnya) | set(tercatat)):
+                expected = seharusnya.get(bulan, (0, 0))
+                actual = tercatat.get(bulan, (0, 0))
+                if abs(expected[0] - actual[0]) > 0.005 or abs(expected[1] - actual[1]) > 0.005:
+                    saldo_drift.append({
+                        'bulan': bulan,
+                        'total_penggunaan': actual[0],
+                        'seharusnya_penggunaan': expected[0],
+                        'total_pertanggungjawaban': actual[1],
+                        'seharusnya_pertanggungjawaban': expected[1],
+                    })
+
+            if perbaiki and saldo_drift:
+                cursor.executemany("""
+                    INSERT INTO saldo_up (
+                        tahun_anggaran, bulan, saldo_awal,
+                        total_penggunaan, total_pertanggungjawaban
+                    ) VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT(tahun_anggaran, bulan) DO UPDATE SET
+                        total_penggunaan = excluded.total_penggunaan,
+                        total_pertanggungjawaban = excluded.total_pertanggungjawaban,
+                        updated_at = CURRENT_TIMESTAMP
+                """, [
+                    (tahun, d['bulan'], BATAS_UP_MAKSIMAL,
+                     d['seharusnya_penggunaan'], d['seharusnya_pertanggungjawaban'])
+                    for d in saldo_drift
+                ])
+
+            if perbaiki:
+                conn.commit()
+
+        report = {
+            'tahun_anggaran': tahun,
+            'transaksi_drift': transaksi_drift,
+            'saldo_drift': saldo_drift,
+            'ok': not transaksi_drift and not saldo_drift,
+        }
+        if perbaiki and not report['ok']:
+            self._publish(TOPIC_SALDO, "reconcile", mekanisme="UP")
+        return report
 
     def cek_ketersediaan_up(self, jumlah: float, tahun: int = None, bulan: int = None) -> Tuple[bool, float]:
         """
@@ -1176,32 +1683,52 @@ class PencairanManager:
             'status': status,
         }
 
-    def hitung_countdown_tup(self, transaksi_id: int) -> Optional[Dict[str, Any]]:
+    def get_countdown_tup(self, hari_ini: date = None,
+                          transaksi_ids: List[int] = None) -> List[Dict[str, Any]]:
         """
-        Hitung sisa hari untuk TUP.
+        Hitung sisa hari semua TUP terbuka dalam satu query.
+
+        TUP terbuka = sudah ada tanggal SP2D dan status bukan selesai/batal.
+        Batas waktu = tanggal SP2D + BATAS_TUP_HARI.
+
+        Args:
+            hari_ini: Tanggal acuan (default: hari ini)
+            transaksi_ids: Batasi ke transaksi tertentu (tanpa filter status)
 
         Returns:
-            Dictionary dengan:
-            - tanggal_sp2d
-            - batas_waktu
-            - sisa_hari
-            - is_overdue
+            List dict (transaksi_id, kode_transaksi, nama_kegiatan,
+            tanggal_sp2d, batas_waktu, sisa_hari, is_overdue), urut dari
+            sisa hari paling sedikit
         """
-        transaksi = self.get_transaksi(transaksi_id)
-        if not transaksi or transaksi.get('mekanisme') != 'TUP':
-            return None
-
-        tanggal_sp2d = transaksi.get('tanggal_sp2d_tup')
-        if not tanggal_sp2d:
-            return None
+        params: List[Any] = [f"+{BATAS_TUP_HARI} days"] + _sisa_hari_tup_params(hari_ini)
+        query = f"""
+            SELECT id AS transaksi_id, kode_transaksi, nama_kegiatan,
+                   date(tanggal_sp2d_tup) AS tanggal_sp2d,
+                   date(tanggal_sp2d_tup, ?) AS batas_waktu,
+                   {_SISA_HARI_TUP_SQL.format(kolom='tanggal_sp2d_tup')} AS sisa_hari
+            FROM transaksi_pencairan
+            WHERE mekanisme = 'TUP' AND date(tanggal_sp2d_tup) IS NOT NULL
+        """
+        if transaksi_ids is not None:
+            if not transaksi_ids:
+                return []
+            query += f" AND id IN ({','.join('?' * len(transaksi_ids))})"
+            params.extend(transaksi_ids)
+        else:
+            query += " AND status NOT IN ('selesai', 'batal')"
+        query += " ORDER BY sisa_hari, id"
 
-        if isinstance(tanggal_sp2d, str):
-            tanggal_sp2d = datetime.strptime(tanggal_sp2d, '%Y-%m-%d').date()
+        with self.get_connection() as conn:
+            rows = conn.execute(query, params).fetchall()
 
-        from datetime import timedelta
-        batas_waktu = tanggal_sp2d + timedelta(days=BATAS_TUP_HARI)
-        hari_ini = date.today()
-        sisa_hari = (batas_waktu - hari_ini).days
+        result = []
+        for row in rows:
+            item = dict(row)
+            item['tanggal_sp2d'] = date.fromisoformat(item['tanggal_sp2d'])
+            item['batas_waktu'] = date.fromisoformat(item['batas_waktu'])
+            item['is_overdue'] = item['sisa_hari'] < 0
+            result.append(item)
+        return result
 
     def hitung_countdown_tup(self, transaksi_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -1214,27 +1741,15 @@ class PencairanManager:
             - sisa_hari
             - is_overdue
         """
-        transaksi = self.get_transaksi(transaksi_id)
-        if not transaksi or transaksi.get('mekanisme') != 'TUP':
-            return None
-
-        tanggal_sp2d = transaksi.get('tanggal_sp2d_tup')
-        if not tanggal_sp2d:
+        rows = self.get_countdown_tup(transaksi_ids=[transaksi_id])
+        if not rows:
             return None
-
-        if isinstance(tanggal_sp2d, str):
-            tanggal_sp2d = datetime.strptime(tanggal_sp2d, '%Y-%m-%d').date()
-
-        from datetime import timedelta
-        batas_waktu = tanggal_sp2d + timedelta(days=BATAS_TUP_HARI)
-        hari_ini = date.today()
-        sisa_hari = (batas_waktu - hari_ini).days
-
+        row = rows[0]
         return {
-            'tanggal_sp2d': tanggal_sp2d,
-            'batas_waktu': batas_waktu,
-            'sisa_hari': sisa_hari,
-            'is_overdue': sisa_hari < 0,
+            'tanggal_sp2d': row['tanggal_sp2d'],
+            'batas_waktu': row['batas_waktu'],
+            'sisa_hari': row['sisa_hari'],
+            'is_overdue': row['is_overdue'],
         }
 
     # ========================================================================
@@ -1289,7 +1804,9 @@ class PencairanManager:
             ))
             
             conn.commit()
-            return cursor.lastrowid
+            lembar_id = cursor.lastrowid
+        self._publish(TOPIC_LEMBAR, "create", lembar_id=lembar_id)
+        return lembar_id
 
     def add_lembar_permintaan_item(self, lembar_id: int, item_data: Dict[str, Any]) -> int:
         """
@@ -1322,7 +1839,9 @@ class PencairanManager:
             ))
             
             conn.commit()
-            return cursor.lastrowid
+            item_id = cursor.lastrowid
+        self._publish(TOPIC_LEMBAR, "item", lembar_id=lembar_id)
+        return item_id
 
     def get_lembar_permintaan(self, lembar_id: int) -> Optional[Dict[str, Any]]:
         """Get lembar permintaan by ID."""
@@ -1382,7 +1901,10 @@ class PencairanManager:
             cursor = conn.cursor()
             cursor.execute(query, values)
             conn.commit()
-            return cursor.rowcount > 0
+            updated = cursor.rowcount > 0
+        if updated:
+            self._publish(TOPIC_LEMBAR, "update", lembar_id=lembar_id)
+        return updated
 
     def list_lembar_permintaan(self, tahun: int = None, status: str = None, limit: int = 100) -> List[Dict[str, Any]]:
         """
@@ -5,5 +5,11 @@ Business logic services for document generation and workflow management.
 """
 
 from .dokumen_generator import DokumenGenerator, get_dokumen_generator
+from .dokumen_index import DokumenIndex, get_dokumen_index
+from .document_store import DocumentStore, get_document_store
+from .fiscal_archive import FiscalArchive, get_fiscal_archive
+from .tup_deadline_scheduler import TUPDeadlineScheduler
 
-__all__ = ['DokumenGenerator', 'get_dokumen_generator']
+__all__ = ['DokumenGenerator', 'get_dokumen_generator', 'DokumenIndex',
+           'get_dokumen_index', 'DocumentStore', 'get_document_store',
+           'FiscalArchive', 'get_fiscal_archive', 'TUPDeadlineScheduler']
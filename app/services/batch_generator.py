@@ -0,0 +1,457 @@
+"""
+PPK DOCUMENT FACTORY - Batch Document Generator (Headless)
+==========================================================
+Generate dokumen massal tanpa GUI (tidak meng-import PySide6).
+
+Sumber:
+- paket     -> TemplateEngine.generate_document (dokumen pengadaan)
+- transaksi -> DokumenGenerator.generate_document (dokumen pencairan)
+
+Satu job = satu (paket/transaksi, dokumen). Job dijalankan paralel
+(process atau thread pool). Setiap hasil ditulis ke file state JSON-lines
+begitu selesai, sehingga batch yang terputus bisa dilanjutkan: job yang
+sudah 'ok' di file state dilewati. Ringkasan akhir berupa JSON.
+
+Batch hanya me-render dokumen; tahapan workflow paket/fase transaksi
+tidak diubah.
+
+Usage:
+    python -m app.services.batch_generator paket --tahun 2026 --stage SPK \\
+        --workers 4 --state output/batch_spk.jsonl --summary output/batch_spk.json
+    python -m app.services.batch_generator transaksi --mekanisme UP --fase 2 --final
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, asdict, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from app.core.config import DATABASE_PATH, STAGE_CODE_MAP, STAGE_ID_MAP
+from app.core.query_stats import connect
+
+SOURCE_PAKET = 'paket'
+SOURCE_TRANSAKSI = 'transaksi'
+
+STATUS_OK = 'ok'
+STATUS_GAGAL = 'gagal'
+STATUS_DILEWATI = 'dilewati'
+
+EXECUTORS = ('process', 'thread')
+
+
+# =============================================================================
+# JOB
+# =============================================================================
+
+@dataclass
+class BatchJob:
+    """Satu dokumen untuk satu paket/transaksi."""
+    source: str
+    target_id: int
+    target_kode: str
+    dokumen: str
+    template: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        return f"{self.source}:{self.target_id}:{self.dokumen}"
+
+
+@dataclass
+class BatchOptions:
+    """Opsi yang diteruskan ke worker."""
+    db_path: str
+    is_draft: bool = True
+    additional_data: Dict[str, Any] = field(default_factory=dict)
+
+
+# =============================================================================
+# SELEKSI
+# =============================================================================
+
+def _query(db_path: str, sql: str, params: Sequence) -> List[Dict[str, Any]]:
+    conn = connect(db_path)
+    conn.row_factory = sqlite3.Row
+    try:
+        return [dict(r) for r in conn.execute(sql, params)]
+    finally:
+        conn.close()
+
+
+def _filter(where: List[str], params: List, column: str, values) -> None:
+    if values:
+        values = list(values)
+        where.append(f"{column} IN ({','.join('?' * len(values))})")
+        params.extend(values)
+
+
+def select_paket(db_path: str = None, tahun: int = None, ids: Iterable[int] = None,
+                 status: Iterable[str] = None, stage: Iterable[str] = None) -> List[Dict]:
+    """Pilih paket menurut tahun, id, status dan current_stage."""
+    where, params = [], []
+    if tahun:
+        where.append("tahun_anggaran = ?")
+        params.append(tahun)
+    _filter(where, params, "id", ids)
+    _filter(where, params, "status", status)
+    _filter(where, params, "current_stage", stage)
+    sql = "SELECT id, kode, nama, tahun_anggaran, status, current_stage FROM paket"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    return _query(db_path or str(DATABASE_PATH), sql + " ORDER BY id", params)
+
+
+def select_transaksi(db_path: str = None, tahun: int = None, ids: Iterable[int] = None,
+                     mekanisme: Iterable[str] = None, status: Iterable[str] = None,
+                     fase: Iterable[int] = None) -> List[Dict]:
+    """Pilih transaksi pencairan menurut tahun, id, mekanisme, status dan fase aktif."""
+    where, params = [], []
+    if tahun:
+        where.append("tahun_anggaran = ?")
+        params.append(tahun)
+    _filter(where, params, "id", ids)
+    _filter(where, params, "mekanisme", [m.upper() for m in mekanisme or []])
+    _filter(where, params, "status", status)
+    _filter(where, params, "fase_aktif", fase)
+    sql = "SELECT id, kode_transaksi, mekanisme, status, fase_aktif FROM transaksi_pencairan"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    return _query(db_path or str(DATABASE_PATH), sql + " ORDER BY id", params)
+
+
+# =============================================================================
+# PERENCANAAN JOB
+# =============================================================================
+
+def dokumen_stage(stage_code: str) -> List[str]:
+    """Dokumen keluaran tahapan workflow paket."""
+    stage = STAGE_ID_MAP.get(STAGE_CODE_MAP.get(stage_code))
+    if not stage:
+        raise ValueError(f"Stage {stage_code} tidak dikenal")
+    return list(stage.get('outputs', []))
+
+
+def plan_paket_jobs(pakets: List[Dict], dokumen: Sequence[str] = None,
+                    stage: str = None, spp_package: bool = False) -> List[BatchJob]:
+    """
+    Job dokumen paket. Set dokumen: daftar eksplisit, keluaran satu
+    stage, dan/atau paket SPP (SPP-LS, DRPP, Kuitansi, SSP).
+    """
+    from app.workflow.engine import SPP_PACKAGE_DOCS, SSP_PACKAGE_DOCS
+
+    doc_types = list(dokumen or [])
+    if stage:
+        doc_types += dokumen_stage(stage)
+    if spp_package:
+        doc_types += list(SPP_PACKAGE_DOCS) + list(SSP_PACKAGE_DOCS)
+    doc_types = list(dict.fromkeys(doc_types))
+    if not doc_types:
+        raise ValueError("Pilih dokumen: --dokumen, --stage atau --spp-package")
+
+    return [BatchJob(SOURCE_PAKET, p['id'], p['kode'], doc)
+            for p in pakets for doc in doc_types]
+
+
+def plan_transaksi_jobs(transaksi: List[Dict], dokumen: Sequence[str] = None,
+                        fase: int = None) -> List[BatchJob]:
+    """
+    Job dokumen transaksi. Tanpa --dokumen, semua dokumen ber-template
+    pada fase (default: fase aktif transaksi) dari workflow_config.
+    """
+    from app.config.workflow_config import get_dokumen, get_dokumen_list
+
+    jobs = []
+    for t in transaksi:
+        mekanisme = t['mekanisme']
+        if dokumen:
+            daftar = [get_dokumen(mekanisme, kode) or {'kode': kode} for kode in dokumen]
+        else:
+            daftar = get_dokumen_list(mekanisme, fase or t['fase_aktif'])
+        for dok in daftar:
+            if not dok.get('template') and not dokumen:
+                continue
+            jobs.append(BatchJob(SOURCE_TRANSAKSI, t['id'], t['kode_transaksi'],
+                                 dok['kode'], dok.get('template')))
+    return jobs
+
+
+# =============================================================================
+# WORKER
+# =============================================================================
+
+_engines: Dict[tuple, Any] = {}
+_engines_lock = threading.Lock()
+
+
+def _engine(kind: str, db_path: str):
+    """Engine per proses (dan per database), dibuat sekali."""
+    key = (kind, db_path)
+    with _engines_lock:
+        if key not in _engines:
+            if kind == SOURCE_PAKET:
+                from app.core.database import DatabaseManager
+                from app.templates.engine import TemplateEngine
+                _engines[key] = TemplateEngine(DatabaseManager(db_path))
+            else:
+                from app.models.pencairan_models import PencairanManager
+                from app.services.dokumen_generator import DokumenGenerator
+                from app.services.dokumen_index import DokumenIndex
+                manager = PencairanManager(db_path)
+                generator = DokumenGenerator(manager, index=DokumenIndex(db_path))
+                _engines[key] = (manager, generator, manager.get_satker_aktif())
+        return _engines[key]
+
+
+def run_job(job: BatchJob, options: BatchOptions) -> Dict[str, Any]:
+    """Generate satu dokumen. Tidak pernah raise; error masuk ke hasil."""
+    result = {
+        'key': job.key, 'source': job.source, 'target_id': job.target_id,
+        'target_kode': job.target_kode, 'dokumen': job.dokumen,
+        'status': STATUS_OK, 'filepath': None, 'nomor': None, 'error': None,
+    }
+    start = time.perf_counter()
+    try:
+        if job.source == SOURCE_PAKET:
+            engine = _engine(SOURCE_PAKET, options.db_path)
+            filepath, nomor = engine.generate_document(
+                job.target_id, job.dokumen, dict(options.additional_data))
+            result.update(filepath=filepath, nomor=nomor)
+        elif not job.template:
+            result.update(status=STATUS_DILEWATI, error="Dokumen tidak memiliki template")
+        else:
+            manager, generator, satker = _engine(SOURCE_TRANSAKSI, options.db_path)
+            transaksi = manager.get_transaksi(job.target_id)
+            if not transaksi:
+                raise ValueError(f"Transaksi {job.target_id} tidak ditemukan")
+            filepath, error = generator.generate_document(
+                transaksi=transaksi,
+                kode_dokumen=job.dokumen,
+                template_name=job.template,
+                satker=satker,
+                rincian=manager.get_items_for_dokumen(job.target_id, job.dokumen) or None,
+                additional_data=dict(options.additional_data),
+                is_draft=options.is_draft,
+            )
+            if not filepath:
+                raise RuntimeError(error or "Gagal generate dokumen")
+            result['filepath'] = filepath
+    except Exception as e:
+        result.update(status=STATUS_GAGAL, error=f"{type(e).__name__}: {e}")
+    result['durasi_ms'] = round((time.perf_counter() - start) * 1000, 1)
+    return result
+
+
+# =============================================================================
+# STATE (RESUME)
+# =============================================================================
+
+def load_state(state_path: str) -> Dict[str, Dict[str, Any]]:
+    """Hasil terakhir per job key dari file state JSON-lines."""
+    state = {}
+    if not state_path or not os.path.exists(state_path):
+        return state
+    with open(state_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # Baris terakhir bisa terpotong bila proses dihentikan paksa
+                continue
+            state[entry['key']] = entry
+    return state
+
+
+# =============================================================================
+# RUNNER
+# =============================================================================
+
+class BatchGenerator:
+    """Jalankan job secara paralel dengan state yang bisa dilanjutkan."""
+
+    def __init__(self, db_path: str = None, workers: int = 1, executor: str = 'process',
+                 state_path: str = None, is_draft: bool = True,
+                 additional_data: Dict[str, Any] = None):
+        if executor not in EXECUTORS:
+            raise ValueError(f"Executor tidak valid: {executor}")
+        self.options = BatchOptions(db_path or str(DATABASE_PATH), is_draft,
+                                    dict(additional_data or {}))
+        self.workers = max(1, workers)
+        self.executor = executor
+        self.state_path = state_path
+
+    def _pool(self):
+        if self.executor == 'thread':
+            return ThreadPoolExecutor(max_workers=self.workers)
+        return ProcessPoolExecutor(max_workers=self.workers)
+
+    def run(self, jobs: List[BatchJob],
+            progress: Callable[[int, int, Dict], None] = None) -> Dict[str, Any]:
+        """
+        Jalankan semua job yang belum 'ok' di file state.
+
+        Returns:
+            Ringkasan: jumlah per status, job yang dilanjutkan dari state,
+            durasi, dan hasil per job (urut sesuai daftar job)
+        """
+        started = datetime.now()
+        start = time.perf_counter()
+        state = load_state(self.state_path)
+        selesai = {k for k, v in state.items() if v.get('status') == STATUS_OK}
+
+        pending = [job for job in jobs if job.key not in selesai]
+        results: Dict[str, Dict[str, Any]] = {
+            job.key: state[job.key] for job in jobs if job.key in selesai
+        }
+
+        state_file = None
+        if self.state_path:
+            os.makedirs(os.path.dirname(os.path.abspath(self.state_path)), exist_ok=True)
+            state_file = open(self.state_path, 'a', encoding='utf-8')
+        try:
+            if self.workers == 1:
+                outcomes = (run_job(job, self.options) for job in pending)
+                self._collect(outcomes, results, state_file, len(pending), progress)
+            else:
+                with self._pool() as pool:
+                    futures = [pool.submit(run_job, job, self.options) for job in pending]
+                    outcomes = (f.result() for f in as_completed(futures))
+                    self._collect(outcomes, results, state_file, len(pending), progress)
+        finally:
+            if state_file:
+                state_file.close()
+
+        ordered = [results[job.key] for job in jobs if job.key in results]
+        counts = {s: 0 for s in (STATUS_OK, STATUS_GAGAL, STATUS_DILEWATI)}
+        for job in pending:
+            counts[results[job.key]['status']] += 1
+
+        return {
+            'started_at': started.isoformat(timespec='seconds'),
+            'finished_at': datetime.now().isoformat(timespec='seconds'),
+            'durasi_detik': round(time.perf_counter() - start, 3),
+            'db_path': self.options.db_path,
+            'workers': self.workers,
+            'executor': self.executor,
+            'total': len(jobs),
+            'dilanjutkan': len(jobs) - len(pending),
+            'berhasil': counts[STATUS_OK],
+            'gagal': counts[STATUS_GAGAL],
+            'dilewati': counts[STATUS_DILEWATI],
+            'hasil': ordered,
+        }
+
+    def _collect(self, outcomes, results, state_file, total, progress):
+        for done, result in enumerate(outcomes, 1):
+            results[result['key']] = result
+            if state_file:
+                state_file.write(json.dumps(result, default=str) + "\n")
+                state_file.flush()
+            if progress:
+                progress(done, total, result)
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def _split(values: List[str]) -> List[str]:
+    """Gabungkan opsi berulang dan dipisah koma: --dokumen A,B --dokumen C."""
+    return [v.strip() for value in values or [] for v in value.split(',') if v.strip()]
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Generate dokumen massal tanpa GUI (paket pengadaan / transaksi pencairan)")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--db', default=str(DATABASE_PATH), help="Path database")
+    common.add_argument('--tahun', type=int, help="Tahun anggaran")
+    common.add_argument('--id', type=int, action='append', dest='ids', help="ID (boleh berulang)")
+    common.add_argument('--status', action='append', help="Filter status (boleh berulang)")
+    common.add_argument('--dokumen', action='append', help="Kode dokumen, pisahkan dengan koma")
+    common.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="Jumlah worker")
+    common.add_argument('--executor', choices=EXECUTORS, default='process')
+    common.add_argument('--state', help="File state JSON-lines untuk melanjutkan batch")
+    common.add_argument('--restart', action='store_true', help="Abaikan state lama")
+    common.add_argument('--summary', help="Tulis ringkasan JSON ke file (default: stdout)")
+    common.add_argument('--dry-run', action='store_true', help="Hanya tampilkan rencana job")
+
+    sub = parser.add_subparsers(dest='source', required=True)
+    paket = sub.add_parser(SOURCE_PAKET, parents=[common], help="Dokumen paket pengadaan")
+    paket.add_argument('--current-stage', action='append', help="Filter current_stage paket")
+    paket.add_argument('--stage', help="Generate semua dokumen keluaran stage ini")
+    paket.add_argument('--spp-package', action='store_true', help="Generate paket SPP + SSP")
+
+    transaksi = sub.add_parser(SOURCE_TRANSAKSI, parents=[common], help="Dokumen transaksi pencairan")
+    transaksi.add_argument('--mekanisme', action='append', help="UP/TUP/LS (boleh berulang)")
+    transaksi.add_argument('--fase-aktif', type=int, action='append', help="Filter fase aktif")
+    transaksi.add_argument('--fase', type=int, help="Generate dokumen fase ini (default: fase aktif)")
+    transaksi.add_argument('--final', action='store_true', help="Generate sebagai final (bukan draft)")
+    return parser
+
+
+def main(argv: List[str] = None) -> int:
+    args = _build_parser().parse_args(argv)
+    dokumen = _split(args.dokumen)
+
+    try:
+        if args.source == SOURCE_PAKET:
+            targets = select_paket(args.db, args.tahun, args.ids, args.status, args.current_stage)
+            jobs = plan_paket_jobs(targets, dokumen, args.stage, args.spp_package)
+        else:
+            targets = select_transaksi(args.db, args.tahun, args.ids, args.mekanisme,
+                                       args.status, args.fase_aktif)
+            jobs = plan_transaksi_jobs(targets, dokumen, args.fase)
+    except (ValueError, sqlite3.Error) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    if args.dry_run:
+        summary = {'total': len(jobs), 'jobs': [asdict(job) for job in jobs]}
+    else:
+        if args.state and args.restart and os.path.exists(args.state):
+            os.remove(args.state)
+        runner = BatchGenerator(args.db, args.workers, args.executor, args.state,
+                                is_draft=not getattr(args, 'final', False))
+
+        def progress(done, total, result):
+            print(f"[{done}/{total}] {result['status']:8} {result['target_kode']} "
+                  f"{result['dokumen']} {result['error'] or result['filepath'] or ''}",
+                  file=sys.stderr)
+
+        summary = runner.run(jobs, progress)
+
+    text = json.dumps(summary, indent=2, default=str)
+    if args.summary:
+        with open(args.summary, 'w', encoding='utf-8') as f:
+            f.write(text)
+    else:
+        print(text)
+    return 1 if summary.get('gagal') else 0
+
+
+__all__ = [
+    'BatchJob',
+    'BatchOptions',
+    'BatchGenerator',
+    'select_paket',
+    'select_transaksi',
+    'plan_paket_jobs',
+    'plan_transaksi_jobs',
+    'run_job',
+    'load_state',
+    'main',
+]
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
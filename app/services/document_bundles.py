@@ -0,0 +1,618 @@
+"""
+PPK DOCUMENT FACTORY - Document Bundle Registry
+===============================================
+Deklarasi paket dokumen per modul (swakelola, perjalanan dinas, jamuan
+tamu) dan satu pipeline generate untuk semuanya.
+
+Sebuah DocumentBundle mendeklarasikan:
+- daftar dokumen (kode template, nama output, word/excel, label checkbox)
+- folder output
+- data provider: fungsi (data modul, master data) -> dict placeholder
+
+BundlePipeline menyiapkan konteks placeholder SEKALI lalu me-merge setiap
+dokumen terpilih. Pipeline tidak bergantung pada Qt dan aman dijalankan di
+worker thread: progress dilaporkan lewat callback dan pembatalan lewat
+threading.Event (dicek di antara dokumen). Hasilnya selalu BundleReport
+yang seragam untuk semua modul. File yang berhasil dibuat dicatat di
+index dokumen dengan pemilik record modulnya (DocumentBundle.index_owner).
+
+Usage:
+    bundle = get_bundle('swakelola')
+    report = BundlePipeline().run(bundle, sw_data, selected=['KAK_Swakelola'])
+    print(report.summary_text())
+"""
+
+import os
+import threading
+import time
+import traceback
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.core.config import (
+    OUTPUT_DIR, TAHUN_ANGGARAN, WORD_TEMPLATES_DIR, EXCEL_TEMPLATES_DIR,
+)
+from app.core.kalkulasi import format_rupiah, terbilang
+from app.core.master_data import MasterDataDirectory, get_master_data
+from app.services.dokumen_index import get_dokumen_index
+
+# ============================================================================
+# CONSTANTS
+# ============================================================================
+
+FORMAT_WORD = 'word'
+FORMAT_EXCEL = 'excel'
+
+STATUS_OK = 'ok'
+STATUS_GAGAL = 'gagal'
+STATUS_DIBATALKAN = 'dibatalkan'
+
+# Komponen biaya perjalanan dinas (dipakai juga oleh form PerjalananDinasDialog)
+BIAYA_PERJALANAN_DINAS = (
+    'biaya_transport', 'biaya_uang_harian', 'biaya_penginapan',
+    'biaya_representasi', 'biaya_lain_lain',
+)
+
+# provider(data modul, master data) -> placeholder dict
+DataProvider = Callable[[Dict[str, Any], MasterDataDirectory], Dict[str, Any]]
+# progress(selesai, total, nama output dokumen berikutnya/terakhir)
+ProgressCallback = Callable[[int, int, str], None]
+
+
+# ============================================================================
+# DATA CLASSES
+# ============================================================================
+
+@dataclass(frozen=True)
+class BundleDocument:
+    """Satu dokumen dalam bundle."""
+    template: str              # Nama file template tanpa ekstensi
+    output_name: str           # Nama file output tanpa ekstensi
+    label: str                 # Teks checkbox di dialog
+    format: str = FORMAT_WORD
+    default_checked: bool = False
+
+    @property
+    def extension(self) -> str:
+        return '.xlsx' if self.format == FORMAT_EXCEL else '.docx'
+
+
+@dataclass(frozen=True)
+class DocumentBundle:
+    """Paket dokumen satu modul."""
+    kode: str
+    nama: str
+    folder: str                # Sub-folder di OUTPUT_DIR/<tahun>/
+    folder_prefix: str         # Prefix folder per record, mis. "SW"
+    folder_label_key: str      # Key data untuk nama folder per record
+    documents: Tuple[BundleDocument, ...]
+    provider: DataProvider
+    notes: Tuple[str, ...] = ()  # Dokumen pendukung yang disiapkan manual
+    index_owner: Optional[str] = None  # Kolom pemilik di dokumen_file_index
+
+    def document(self, output_name: str) -> BundleDocument:
+        for doc in self.documents:
+            if doc.output_name == output_name:
+                return doc
+        raise KeyError(f"Dokumen '{output_name}' tidak ada di bundle '{self.kode}'")
+
+    def default_selection(self) -> List[str]:
+        return [doc.output_name for doc in self.documents if doc.default_checked]
+
+    def folder_name(self, data: Dict[str, Any]) -> str:
+        label = (data.get(self.folder_label_key) or 'unknown')[:20]
+        return f"{self.folder_prefix}_{data['id']}_{label}"
+
+
+@dataclass
+class BundleItemResult:
+    """Hasil satu dokumen."""
+    output_name: str
+    template: str
+    status: str
+    path: Optional[str] = None
+    error: Optional[str] = None
+    durasi_detik: float = 0.0
+
+
+@dataclass
+class BundleReport:
+    """Laporan seragam hasil BundlePipeline.run()."""
+    bundle: str
+    output_folder: str
+    items: List[BundleItemResult] = field(default_factory=list)
+    cancelled: bool = False
+    error: Optional[str] = None   # Kegagalan sebelum merge (data/folder)
+    durasi_detik: float = 0.0
+
+    @property
+    def generated(self) -> List[BundleItemResult]:
+        return [item for item in self.items if item.status == STATUS_OK]
+
+    @property
+    def failed(self) -> List[BundleItemResult]:
+        return [item for item in self.items if item.status == STATUS_GAGAL]
+
+    @property
+    def ok(self) -> bool:
+        return bool(self.generated)
+
+    def summary_text(self) -> str:
+        """Pesan ringkas untuk QMessageBox / log."""
+        if self.error:
+            return self.error
+        lines = []
+        if self.generated:
+            lines.append(f"Berhasil generate {len(self.generated)} dokumen:")
+            lines.extend(f"✅ {item.output_name}" for item in self.generated)
+        else:
+            lines.append("Tidak ada dokumen yang berhasil di-generate.")
+        if self.failed:
+            lines.append("")
+            lines.append("⚠️ Error:")
+            lines.extend(f"{item.output_name}: {item.error}" for item in self.failed)
+        if self.cancelled:
+            skipped = sum(1 for item in self.items if item.status == STATUS_DIBATALKAN)
+            lines.append("")
+            lines.append(f"⏹️ Dibatalkan, {skipped} dokumen tidak diproses.")
+        if self.generated:
+            lines.append("")
+            lines.append(f"📁 Output: {self.output_folder}")
+        return "\n".join(lines)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'bundle': self.bundle,
+            'output_folder': self.output_folder,
+            'cancelled': self.cancelled,
+            'error': self.error,
+            'durasi_detik': self.durasi_detik,
+            'items': [asdict(item) for item in self.items],
+        }
+
+
+# ============================================================================
+# REGISTRY
+# ============================================================================
+
+_bundles: Dict[str, DocumentBundle] = {}
+
+
+def register_bundle(bundle: DocumentBundle) -> DocumentBundle:
+    """Daftarkan (atau ganti) bundle berdasarkan kode."""
+    _bundles[bundle.kode] = bundle
+    return bundle
+
+
+def get_bundle(kode: str) -> DocumentBundle:
+    try:
+        return _bundles[kode]
+    except KeyError:
+        raise KeyError(f"Bundle dokumen '{kode}' tidak terdaftar") from None
+
+
+def list_bundles() -> List[DocumentBundle]:
+    return list(_bundles.values())
+
+
+# ============================================================================
+# PIPELINE
+# ============================================================================
+
+class BundlePipeline:
+    """
+    Eksekusi satu bundle: siapkan konteks sekali, merge dokumen terpilih.
+
+    engine: objek dengan merge_word()/merge_excel() (default TemplateEngine).
+    """
+
+    def __init__(self, engine=None, db_path: str = None, output_dir: str = None,
+                 word_dir: str = None, excel_dir: str = None):
+        self._engine = engine
+        self.db_path = db_path
+        self.output_dir = output_dir or OUTPUT_DIR
+        self.word_dir = word_dir or WORD_TEMPLATES_DIR
+        self.excel_dir = excel_dir or EXCEL_TEMPLATES_DIR
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            from app.templates.engine import get_template_engine
+            self._engine = get_template_engine()
+        return self._engine
+
+    def output_folder(self, bundle: DocumentBundle, data: Dict[str, Any]) -> str:
+        return os.path.join(self.output_dir, str(TAHUN_ANGGARAN), bundle.folder,
+                            bundle.folder_name(data))
+
+    def template_path(self, doc: BundleDocument) -> str:
+        base = self.excel_dir if doc.format == FORMAT_EXCEL else self.word_dir
+        return os.path.join(base, f"{doc.template}{doc.extension}")
+
+    def prepare_context(self, bundle: DocumentBundle, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Placeholder dict untuk semua dokumen bundle (dibuat sekali per run)."""
+        return bundle.provider(data, get_master_data(self.db_path))
+
+    def run(self, bundle: DocumentBundle, data: Dict[str, Any],
+            selected: Iterable[str] = None, progress: ProgressCallback = None,
+            cancel_event: threading.Event = None) -> BundleReport:
+        """
+        Generate dokumen terpilih (output_name); None = default_selection().
+
+        Nama dokumen yang tidak ada di bundle -> KeyError. Selain itu tidak
+        raise: kegagalan per dokumen masuk report.items, kegagalan
+        menyiapkan data/folder masuk report.error.
+        """
+        started = time.perf_counter()
+        names = list(selected) if selected is not None else bundle.default_selection()
+        docs = [bundle.document(name) for name in names]
+        report = BundleReport(bundle.kode, self.output_folder(bundle, data))
+
+        try:
+            context = self.prepare_context(bundle, data)
+        except Exception as e:
+            report.error = f"Gagal menyiapkan data:\n{e}\n\n{traceback.format_exc()}"
+            return report
+        try:
+            os.makedirs(report.output_folder, exist_ok=True)
+        except Exception as e:
+            report.error = f"Gagal membuat folder output:\n{e}"
+            return report
+
+        total = len(docs)
+        for i, doc in enumerate(docs):
+            if cancel_event is not None and cancel_event.is_set():
+                report.cancelled = True
+                report.items.extend(
+                    BundleItemResult(d.output_name, d.template, STATUS_DIBATALKAN)
+                    for d in docs[i:]
+                )
+                break
+            if progress:
+                progress(i, total, doc.output_name)
+            item = self._merge(doc, context, report.output_folder)
+            if item.status == STATUS_OK:
+                self._register_output(bundle, doc, data, item.path)
+            report.items.append(item)
+
+        if progress and not report.cancelled:
+            progress(total, total, docs[-1].output_name if docs else '')
+        report.durasi_detik = round(time.perf_counter() - started, 3)
+        return report
+
+    def _register_output(self, bundle: DocumentBundle, doc: BundleDocument,
+                         data: Dict[str, Any], path: str):
+        """Catat file di index dokumen; kegagalan tidak membatalkan generate."""
+        if not bundle.index_owner or not path or data.get('id') is None:
+            return
+        try:
+            get_dokumen_index(self.db_path).catat(
+                path, doc.output_name, **{bundle.index_owner: data['id']})
+        except Exception as e:
+            print(f"Warning: Gagal mencatat index dokumen: {e}")
+
+    def _merge(self, doc: BundleDocument, context: Dict[str, Any],
+               output_folder: str) -> BundleItemResult:
+        started = time.perf_counter()
+        result = BundleItemResult(doc.output_name, doc.template, STATUS_GAGAL)
+        template_path = self.template_path(doc)
+        output_path = os.path.join(output_folder, f"{doc.output_name}{doc.extension}")
+        try:
+            if not os.path.exists(template_path):
+                result.error = f"Template tidak ditemukan di {template_path}"
+            elif doc.format == FORMAT_EXCEL:
+                result.path = self.engine.merge_excel(
+                    template_path=template_path, data=context, output_path=output_path)
+                result.status = STATUS_OK
+            else:
+                result.path = self.engine.merge_word(
+                    template_path=template_path, data=context, output_path=output_path)
+                result.status = STATUS_OK
+        except Exception as e:
+            result.error = f"{e}\n{traceback.format_exc()}"
+        result.durasi_detik = round(time.perf_counter() - started, 3)
+        return result
+
+
+# ============================================================================
+# DATA PROVIDERS
+# ============================================================================
+
+def _satker_context(satker: Dict) -> Dict[str, Any]:
+    return {
+        'satker_kode': satker.get('kode', ''),
+        'satker_nama': satker.get('nama', ''),
+        'satker_alamat': satker.get('alamat', ''),
+        'satker_kota': satker.get('kota', ''),
+        'satker_provinsi': satker.get('provinsi', ''),
+        'kementerian': satker.get('kementerian', ''),
+        'eselon1': satker.get('eselon1', ''),
+        'tahun_anggaran': str(TAHUN_ANGGARAN),
+    }
+
+
+def _pejabat_context(d: Dict, pejabat: Dict, ppk_jabatan: str) -> Dict[str, Any]:
+    return {
+        'kpa_nama': pejabat.get('kpa_nama', ''),
+        'kpa_nip': pejabat.get('kpa_nip', ''),
+        'ppk_nama': d.get('ppk_nama', '') or pejabat.get('ppk_nama', ''),
+        'ppk_nip': d.get('ppk_nip', '') or pejabat.get('ppk_nip', ''),
+        'ppk_jabatan': ppk_jabatan,
+        'bendahara_nama': d.get('bendahara_nama', '') or pejabat.get('bendahara_nama', ''),
+        'bendahara_nip': d.get('bendahara_nip', '') or pejabat.get('bendahara_nip', ''),
+    }
+
+
+def swakelola_context(d: Dict[str, Any], master: MasterDataDirectory) -> Dict[str, Any]:
+    """Placeholder dokumen swakelola."""
+    uang_muka = d.get('uang_muka', 0) or 0
+    realisasi = d.get('total_realisasi', 0) or 0
+    selisih = uang_muka - realisasi
+    satker = master.get_satker()
+    pejabat = master.get_satker_pejabat()
+
+    context = _satker_context(satker)
+    context.update({
+        'sumber_dana': d.get('sumber_dana', 'DIPA'),
+        'kode_akun': d.get('kode_akun', ''),
+
+        # Kegiatan
+        'nama_kegiatan': d.get('nama_kegiatan', ''),
+        'nama_paket': d.get('nama_kegiatan', ''),
+        'tipe_swakelola': d.get('tipe_swakelola_text', ''),
+        'deskripsi': d.get('deskripsi', ''),
+        'output_kegiatan': d.get('output_kegiatan', ''),
+
+        # Nomor dokumen
+        'nomor_kak': d.get('nomor_kak', ''),
+        'nomor_sk_tim': d.get('nomor_sk_tim', ''),
+
+        # Waktu
+        'tanggal_sk_tim': str(d.get('tanggal_sk_tim', '')),
+        'tanggal_mulai': str(d.get('tanggal_mulai', '')),
+        'tanggal_selesai': str(d.get('tanggal_selesai', '')),
+        'jangka_waktu': str(d.get('jangka_waktu', 30)),
+        'waktu_mulai': d.get('waktu_mulai', '08:00'),
+        'waktu_selesai': d.get('waktu_selesai', 'selesai'),
+        'tempat_kegiatan': d.get('tempat_kegiatan', '') or satker.get('nama', ''),
+
+        # Anggaran
+        'pagu_swakelola': format_rupiah(d.get('pagu_swakelola', 0) or 0),
+        'pagu_swakelola_terbilang': terbilang(d.get('pagu_swakelola', 0) or 0),
+
+        # Uang Muka
+        'pum_nama': d.get('pum_nama', ''),
+        'pum_nip': d.get('pum_nip', ''),
+        'pum_jabatan': d.get('pum_jabatan', ''),
+        'uang_muka': format_rupiah(uang_muka),
+        'uang_muka_terbilang': terbilang(uang_muka),
+        'tanggal_uang_muka': str(d.get('tanggal_uang_muka', '')),
+
+        # Realisasi / Rampung
+        'total_realisasi': format_rupiah(realisasi),
+        'total_realisasi_terbilang': terbilang(realisasi),
+        'sisa_uang_muka': format_rupiah(max(0, selisih)),
+        'kekurangan_bayar': format_rupiah(max(0, -selisih)),
+        'tanggal_rampung': str(d.get('tanggal_rampung', '')),
+
+        # Tim
+        'ketua_nama': d.get('ketua_nama', ''),
+        'ketua_nip': d.get('ketua_nip', ''),
+        'ketua_jabatan': d.get('ketua_jabatan', ''),
+        'sekretaris_nama': d.get('sekretaris_nama', ''),
+        'sekretaris_nip': d.get('sekretaris_nip', ''),
+        'anggota_tim': d.get('anggota_tim', ''),
+    })
+    context.update(_pejabat_context(
+        d, pejabat, d.get('ppk_jabatan', '') or 'Pejabat Pembuat Komitmen'))
+    return context
+
+
+def perjalanan_dinas_context(d: Dict[str, Any], master: MasterDataDirectory) -> Dict[str, Any]:
+    """Placeholder dokumen perjalanan dinas."""
+    total_biaya = sum(d.get(key, 0) or 0 for key in BIAYA_PERJALANAN_DINAS)
+    uang_muka = d.get('uang_muka', 0) or 0
+    selisih = total_biaya - uang_muka
+    pejabat = master.get_satker_pejabat()
+
+    context = _satker_context(master.get_satker())
+    context.update({
+        'sumber_dana': d.get('sumber_dana', 'DIPA'),
+        'kode_akun': d.get('kode_akun', ''),
+
+        # Kegiatan
+        'nama_paket': d.get('nama_kegiatan', ''),
+        'maksud_perjalanan': d.get('maksud_perjalanan', ''),
+
+        # Pelaksana
+        'pelaksana_nama': d.get('pelaksana_nama', ''),
+        'pelaksana_nip': d.get('pelaksana_nip', ''),
+        'pelaksana_pangkat': d.get('pelaksana_pangkat', ''),
+        'pelaksana_golongan': d.get('pelaksana_golongan', ''),
+        'pelaksana_jabatan': d.get('pelaksana_jabatan', ''),
+
+        # Tujuan
+        'kota_asal': d.get('kota_asal', ''),
+        'kota_tujuan': d.get('kota_tujuan', ''),
+        'provinsi_tujuan': d.get('provinsi_tujuan', ''),
+        'alamat_tujuan': d.get('alamat_tujuan', ''),
+
+        # Waktu
+        'tanggal_surat_tugas': str(d.get('tanggal_surat_tugas', '')),
+        'tanggal_berangkat': str(d.get('tanggal_berangkat', '')),
+        'tanggal_kembali': str(d.get('tanggal_kembali', '')),
+        'lama_perjalanan': str(d.get('lama_perjalanan', 1)),
+
+        # Nomor dokumen
+        'nomor_surat_tugas': d.get('nomor_surat_tugas', ''),
+        'nomor_sppd': d.get('nomor_sppd', ''),
+
+        # Biaya
+        'biaya_transport': format_rupiah(d.get('biaya_transport', 0) or 0),
+        'biaya_uang_harian': format_rupiah(d.get('biaya_uang_harian', 0) or 0),
+        'biaya_penginapan': format_rupiah(d.get('biaya_penginapan', 0) or 0),
+        'biaya_representasi': format_rupiah(d.get('biaya_representasi', 0) or 0),
+        'biaya_lain_lain': format_rupiah(d.get('biaya_lain_lain', 0) or 0),
+        'total_biaya': format_rupiah(total_biaya),
+        'uang_muka': format_rupiah(uang_muka),
+        'uang_muka_terbilang': terbilang(uang_muka),
+        'kekurangan_bayar': format_rupiah(max(0, selisih)),
+        'kelebihan_bayar': format_rupiah(max(0, -selisih)),
+        'sisa_terbilang': terbilang(abs(selisih)),
+    })
+    context.update(_pejabat_context(
+        d, pejabat, d.get('ppk_jabatan', '') or 'Pejabat Pembuat Komitmen'))
+    return context
+
+
+def jamuan_tamu_context(d: Dict[str, Any], master: MasterDataDirectory) -> Dict[str, Any]:
+    """Placeholder dokumen jamuan tamu."""
+    pejabat = master.get_satker_pejabat()
+
+    context = _satker_context(master.get_satker())
+    context.update({
+        # Kegiatan
+        'nama_kegiatan': d.get('nama_kegiatan', ''),
+        'tanggal_kegiatan': str(d.get('tanggal_kegiatan', '')),
+        'tempat_kegiatan': d.get('tempat', ''),
+        'waktu_mulai': d.get('waktu_mulai', '08:00'),
+        'kategori': d.get('kategori', ''),
+
+        # Tamu
+        'nama_tamu': d.get('nama_tamu', ''),
+        'instansi_tamu': d.get('instansi_tamu', ''),
+        'jabatan_tamu': d.get('jabatan_tamu', ''),
+        'jumlah_tamu': str(d.get('jumlah_tamu', 1)),
+
+        # Dokumen
+        'nomor_sk_kpa': d.get('nomor_sk_kpa', ''),
+        'tanggal_sk_kpa': str(d.get('tanggal_sk_kpa', '')),
+        'nomor_nd': d.get('nomor_nd', ''),
+        'tanggal_nd': str(d.get('tanggal_nd', '')),
+        'nomor_kuitansi': d.get('nomor_kuitansi', ''),
+        'tanggal_kuitansi': str(d.get('tanggal_kuitansi', '')),
+
+        # Sumber Dana
+        'sumber_dana': d.get('sumber_dana', 'DIPA'),
+        'kode_akun': d.get('kode_akun', ''),
+        'mak': d.get('mak', ''),
+
+        # Biaya
+        'biaya_konsumsi': format_rupiah(d.get('biaya_konsumsi', 0) or 0),
+        'biaya_akomodasi': format_rupiah(d.get('biaya_akomodasi', 0) or 0),
+        'biaya_transportasi': format_rupiah(d.get('biaya_transportasi', 0) or 0),
+        'biaya_lainnya': format_rupiah(d.get('biaya_lainnya', 0) or 0),
+        'total_biaya': format_rupiah(d.get('total_biaya', 0) or 0),
+        'total_biaya_terbilang': terbilang(d.get('total_biaya', 0) or 0),
+    })
+    context.update(_pejabat_context(d, pejabat, 'Pejabat Pembuat Komitmen'))
+    context.update({
+        # Penanggung Jawab (bisa diisi dari data atau default)
+        'pj_nama': d.get('pj_nama', '') or pejabat.get('ppk_nama', ''),
+        'pj_nip': d.get('pj_nip', '') or pejabat.get('ppk_nip', ''),
+        'keterangan': d.get('keterangan', ''),
+    })
+    return context
+
+
+# ============================================================================
+# BUNDLES
+# ============================================================================
+
+SWAKELOLA_BUNDLE = register_bundle(DocumentBundle(
+    kode='swakelola',
+    nama='Swakelola',
+    folder='Swakelola',
+    folder_prefix='SW',
+    folder_label_key='nama_kegiatan',
+    provider=swakelola_context,
+    index_owner='swakelola_id',
+    documents=(
+        BundleDocument('kak_swakelola', 'KAK_Swakelola', "📄 KAK Swakelola",
+                       default_checked=True),
+        BundleDocument('rab_swakelola', 'RAB_Swakelola', "📊 RAB Swakelola (Excel)",
+                       FORMAT_EXCEL, default_checked=True),
+        BundleDocument('sk_tim_swakelola', 'SK_Tim_Pelaksana', "📄 SK Tim Pelaksana",
+                       default_checked=True),
+        BundleDocument('kuitansi_uang_muka', 'Kuitansi_Uang_Muka',
+                       "💰 Kuitansi Uang Muka Swakelola"),
+        BundleDocument('bap_swakelola', 'BA_Pembayaran', "📄 Berita Acara Pembayaran"),
+        BundleDocument('laporan_kemajuan', 'Laporan_Kemajuan', "📝 Laporan Kemajuan"),
+        BundleDocument('kuitansi_rampung', 'Kuitansi_Rampung',
+                       "💰 Kuitansi Rampung Swakelola"),
+        BundleDocument('bast_swakelola', 'BAST_Swakelola', "📄 BAST Swakelola"),
+        BundleDocument('daftar_hadir_swakelola', 'Daftar_Hadir', "📋 Daftar Hadir"),
+    ),
+))
+
+PERJALANAN_DINAS_BUNDLE = register_bundle(DocumentBundle(
+    kode='perjalanan_dinas',
+    nama='Perjalanan Dinas',
+    folder='Perjalanan_Dinas',
+    folder_prefix='PD',
+    folder_label_key='pelaksana_nama',
+    provider=perjalanan_dinas_context,
+    index_owner='perjalanan_dinas_id',
+    documents=(
+        BundleDocument('surat_tugas', 'Surat_Tugas', "📄 Surat Tugas", default_checked=True),
+        BundleDocument('sppd', 'SPPD', "📄 SPPD (Surat Perintah Perjalanan Dinas)",
+                       default_checked=True),
+        BundleDocument('kuitansi_uang_muka', 'Kuitansi_Uang_Muka', "💰 Kuitansi Uang Muka",
+                       default_checked=True),
+        BundleDocument('rincian_biaya_pd', 'Rincian_Biaya',
+                       "📊 Rincian Biaya Perjalanan Dinas"),
+        BundleDocument('kuitansi_rampung', 'Kuitansi_Rampung', "💰 Kuitansi Rampung"),
+        BundleDocument('daftar_pengeluaran_riil', 'Daftar_Pengeluaran_Riil',
+                       "📋 Daftar Pengeluaran Riil"),
+        BundleDocument('laporan_perjalanan_dinas', 'Laporan_Perjalanan_Dinas',
+                       "📝 Laporan Perjalanan Dinas"),
+    ),
+))
+
+# Sesuai Kepmen KP 56/2025
+JAMUAN_TAMU_BUNDLE = register_bundle(DocumentBundle(
+    kode='jamuan_tamu',
+    nama='Jamuan Tamu',
+    folder='Jamuan_Tamu',
+    folder_prefix='JT',
+    folder_label_key='nama_kegiatan',
+    provider=jamuan_tamu_context,
+    index_owner='jamuan_tamu_id',
+    documents=(
+        BundleDocument('kuitansi_jamuan_tamu', 'Kuitansi_Jamuan_Tamu',
+                       "💰 Kuitansi Jamuan Tamu", default_checked=True),
+        BundleDocument('daftar_hadir_jamuan_tamu', 'Daftar_Hadir', "📋 Daftar Hadir",
+                       default_checked=True),
+        BundleDocument('laporan_jamuan_tamu', 'Laporan_Kegiatan',
+                       "📊 Laporan Kegiatan Jamuan Tamu", default_checked=True),
+    ),
+    notes=(
+        "Faktur/Nota/Bon dari restoran/katering",
+        "Foto tagging menu makanan",
+        "Foto tagging jumlah peserta",
+    ),
+))
+
+
+__all__ = [
+    'FORMAT_WORD',
+    'FORMAT_EXCEL',
+    'STATUS_OK',
+    'STATUS_GAGAL',
+    'STATUS_DIBATALKAN',
+    'BIAYA_PERJALANAN_DINAS',
+    'BundleDocument',
+    'DocumentBundle',
+    'BundleItemResult',
+    'BundleReport',
+    'BundlePipeline',
+    'register_bundle',
+    'get_bundle',
+    'list_bundles',
+    'swakelola_context',
+    'perjalanan_dinas_context',
+    'jamuan_tamu_context',
+    'SWAKELOLA_BUNDLE',
+    'PERJALANAN_DINAS_BUNDLE',
+    'JAMUAN_TAMU_BUNDLE',
+]
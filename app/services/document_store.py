@@ -0,0 +1,579 @@
+"""
+PPK DOCUMENT FACTORY - Content-Addressed Document Store
+=======================================================
+Penyimpanan file upload (dokumen SPJ bertandatangan, foto dokumentasi)
+berdasarkan isi file.
+
+Setiap file di-hash (SHA-256) dan disimpan sekali di
+<root>/<2 karakter pertama hash>/<hash><ext>. Scan PDF atau foto yang sama
+yang dilampirkan ke beberapa paket, atau di-upload ulang, tidak lagi
+disalin berkali-kali. Baris checklist_spj dan foto_dokumentasi merujuk
+blob lewat kolom blob_sha256. Kolom path lama tetap berisi path di store,
+jadi kode yang membuka file tidak berubah.
+
+Reference count di tabel document_blob dijaga trigger SQLite pada tabel
+perujuk (insert/update/delete), sehingga selalu sesuai dengan data.
+Rujukan dari file arsip tahun anggaran (app.services.fiscal_archive) ikut
+dihitung, jadi file milik tahun yang sudah ditutup tidak dianggap sampah.
+collect_garbage() menghapus blob yang tidak dirujuk lagi. verify()
+memeriksa ulang hash file di disk, dan stats() melaporkan penghematan
+deduplikasi.
+
+Usage:
+    store = get_document_store()
+    blob = store.put("/path/scan_kontrak.pdf")
+    # simpan blob.sha256 + blob.path ke checklist_spj
+    report = store.collect_garbage()
+    print(store.stats().hemat)
+"""
+
+import hashlib
+import os
+import shutil
+import sqlite3
+import threading
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from app.core.config import DATABASE_PATH
+from app.core.query_stats import connect
+
+STATUS_OK = 'ok'
+STATUS_RUSAK = 'rusak'    # Hash file tidak cocok lagi
+STATUS_HILANG = 'hilang'  # File tidak ada di disk
+
+# Blob tanpa rujukan baru dihapus setelah jeda ini, agar upload yang
+# sedang berjalan (put() sebelum baris perujuk disimpan) tidak ikut terhapus.
+GC_GRACE_SECONDS = 3600
+
+_HASH_CHUNK = 1024 * 1024
+_TMP_SUFFIX = '.tmp'
+
+# Tabel perujuk: nama tabel -> kolom path file
+REFERENCE_TABLES = {
+    'checklist_spj': 'filepath_signed',
+    'foto_dokumentasi': 'filepath',
+}
+
+SCHEMA_DOCUMENT_BLOB = """
+CREATE TABLE IF NOT EXISTS document_blob (
+    sha256 TEXT PRIMARY KEY,
+    ukuran INTEGER NOT NULL,
+    ext TEXT,
+    storage_path TEXT NOT NULL,       -- Relatif terhadap root store
+    ref_count INTEGER NOT NULL DEFAULT 0,
+    status TEXT DEFAULT 'ok' CHECK (status IN ('ok', 'rusak', 'hilang')),
+    created_at TEXT,
+    last_put_at TEXT,
+    verified_at TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_document_blob_ref ON document_blob(ref_count);
+"""
+
+_TRIGGERS_SQL = """
+CREATE TRIGGER IF NOT EXISTS trg_{table}_blob_insert
+AFTER INSERT ON {table} WHEN NEW.blob_sha256 IS NOT NULL
+BEGIN
+    UPDATE document_blob SET ref_count = ref_count + 1 WHERE sha256 = NEW.blob_sha256;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_{table}_blob_delete
+AFTER DELETE ON {table} WHEN OLD.blob_sha256 IS NOT NULL
+BEGIN
+    UPDATE document_blob SET ref_count = ref_count - 1 WHERE sha256 = OLD.blob_sha256;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_{table}_blob_update
+AFTER UPDATE OF blob_sha256 ON {table}
+WHEN OLD.blob_sha256 IS NOT NEW.blob_sha256
+BEGIN
+    UPDATE document_blob SET ref_count = ref_count - 1 WHERE sha256 = OLD.blob_sha256;
+    UPDATE document_blob SET ref_count = ref_count + 1 WHERE sha256 = NEW.blob_sha256;
+END;
+
+CREATE INDEX IF NOT EXISTS idx_{table}_blob ON {table}(blob_sha256);
+"""
+
+
+def hash_file(path: str) -> str:
+    """SHA-256 isi file (dibaca per blok)."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec='microseconds')
+
+
+@dataclass
+class StoredBlob:
+    """Hasil DocumentStore.put()."""
+    sha256: str
+    path: str           # Path absolut di store
+    ukuran: int
+    baru: bool          # False = isi sudah ada (deduplikasi)
+
+
+@dataclass
+class DedupStats:
+    """Ringkasan penghematan deduplikasi."""
+    jumlah_blob: int
+    jumlah_referensi: int
+    ukuran_tersimpan: int   # Byte di disk (tiap isi sekali)
+    ukuran_logis: int       # Byte jika setiap rujukan disalin sendiri
+
+    @property
+    def hemat(self) -> int:
+        return max(self.ukuran_logis - self.ukuran_tersimpan, 0)
+
+    @property
+    def rasio(self) -> float:
+        if not self.ukuran_tersimpan:
+            return 1.0
+        return self.ukuran_logis / self.ukuran_tersimpan
+
+    def to_dict(self) -> Dict:
+        return {
+            'jumlah_blob': self.jumlah_blob,
+            'jumlah_referensi': self.jumlah_referensi,
+            'ukuran_tersimpan': self.ukuran_tersimpan,
+            'ukuran_logis': self.ukuran_logis,
+            'hemat': self.hemat,
+            'rasio': self.rasio,
+        }
+
+
+class DocumentStore:
+    """Store file upload berbasis hash isi, dirujuk dari tabel SPJ/foto."""
+
+    def __init__(self, db_path: str = None, root_dir: str = None):
+        self.db_path = db_path or DATABASE_PATH
+        self.root_dir = root_dir or os.path.join(
+            os.path.dirname(os.path.abspath(self.db_path)), "document_store")
+        # put() dan collect_garbage() tidak boleh bersilangan pada blob yang sama
+        self._lock = threading.RLock()
+        self._init_database()
+
+    @contextmanager
+    def get_connection(self):
+        """Context manager untuk database connection."""
+        conn = connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def _init_database(self):
+        with self.get_connection() as conn:
+            conn.executescript(SCHEMA_DOCUMENT_BLOB)
+            for table in REFERENCE_TABLES:
+                columns = [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+                if not columns:
+                    continue  # Skema DatabaseManager belum dibuat di file ini
+                if 'blob_sha256' not in columns:
+                    conn.execute(f"ALTER TABLE {table} ADD COLUMN blob_sha256 TEXT")
+                conn.executescript(_TRIGGERS_SQL.format(table=table))
+            conn.commit()
+
+    def _reference_union(self, conn, schema: str = 'main') -> str:
+        """SELECT blob_sha256 dari semua tabel perujuk yang sudah terpasang."""
+        parts = []
+        for table in REFERENCE_TABLES:
+            columns = [row[1] for row in conn.execute(f"PRAGMA {schema}.table_info({table})")]
+            if 'blob_sha256' in columns:
+                parts.append(
+                    f"SELECT blob_sha256 FROM {schema}.{table} WHERE blob_sha256 IS NOT NULL")
+        return " UNION ALL ".join(parts) or "SELECT NULL AS blob_sha256 WHERE 0"
+
+    def _load_archived_references(self, conn):
+        """
+        Isi temp.arsip_ref (sha256, jumlah) dengan rujukan dari file arsip
+        tahun anggaran yang tercatat di tahun_arsip.
+
+        Arsip di-ATTACH satu per satu, jadi tidak terbatas jumlah ATTACH.
+        """
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS arsip_ref "
+                     "(sha256 TEXT PRIMARY KEY, jumlah INTEGER NOT NULL)")
+        conn.execute("DELETE FROM temp.arsip_ref")
+        has_registry = conn.execute(
+            "SELECT 1 FROM main.sqlite_master WHERE type = 'table' AND name = 'tahun_arsip'"
+        ).fetchone()
+        if not has_registry:
+            return
+        base_dir = os.path.dirname(os.path.abspath(self.db_path))
+        for row in conn.execute("SELECT path FROM tahun_arsip").fetchall():
+            path = os.path.join(base_dir, row['path'])
+            if not os.path.exists(path):
+                continue
+            conn.execute("ATTACH DATABASE ? AS arsip_blob", (path,))
+            try:
+                conn.execute(f"""
+                    INSERT INTO temp.arsip_ref (sha256, jumlah)
+                    SELECT blob_sha256, COUNT(*) FROM ({self._reference_union(conn, 'arsip_blob')})
+                    GROUP BY blob_sha256
+                    ON CONFLICT(sha256) DO UPDATE SET jumlah = jumlah + excluded.jumlah
+                """)
+                conn.commit()
+            finally:
+                conn.execute("DETACH DATABASE arsip_blob")
+
+    # =========================================================================
+    # PENYIMPANAN
+    # =========================================================================
+
+    def path_for(self, sha256: str, ext: str = '') -> str:
+        return os.path.join(self.root_dir, sha256[:2], f"{sha256}{ext}")
+
+    def put(self, source_path: str) -> StoredBlob:
+        """
+        Simpan file ke store (sekali per isi).
+
+        Hash dihitung di thread pemanggil; UI memanggilnya dari worker
+        thread. Blob baru ber-ref_count 0 sampai baris perujuk disimpan.
+        """
+        sha256 = hash_file(source_path)
+        ukuran = os.path.getsize(source_path)
+        ext = os.path.splitext(source_path)[1].lower()
+
+        with self._lock, self.get_connection() as conn:
+            row = conn.execute(
+                "SELECT storage_path FROM document_blob WHERE sha256 = ?", (sha256,)
+            ).fetchone()
+            if row:
+                path = os.path.join(self.root_dir, row['storage_path'])
+                baru = not self._is_intact(path, ukuran)
+                if baru:
+                    self._copy_in(source_path, path)  # Pulihkan file yang hilang/rusak
+                conn.execute("""
+                    UPDATE document_blob SET last_put_at = ?, status = 'ok'
+                    WHERE sha256 = ?
+                """, (_now(), sha256))
+            else:
+                path = self.path_for(sha256, ext)
+                self._copy_in(source_path, path)
+                now = _now()
+                conn.execute("""
+                    INSERT INTO document_blob
+                        (sha256, ukuran, ext, storage_path, created_at, last_put_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, (sha256, ukuran, ext, os.path.relpath(path, self.root_dir), now, now))
+                baru = True
+            conn.commit()
+        return StoredBlob(sha256, path, ukuran, baru)
+
+    def _is_intact(self, path: str, ukuran: int) -> bool:
+        try:
+            return os.path.getsize(path) == ukuran
+        except OSError:
+            return False
+
+    def _copy_in(self, source_path: str, path: str):
+        """Salin atomik: file sementara lalu os.replace."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{uuid.uuid4().hex}{_TMP_SUFFIX}"
+        try:
+            shutil.copy2(source_path, tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def get(self, sha256: str) -> Optional[Dict]:
+        with self.get_connection() as conn:
+            row = conn.execute(
+                "SELECT * FROM document_blob WHERE sha256 = ?", (sha256,)
+            ).fetchone()
+        if not row:
+            return None
+        item = dict(row)
+        item['path'] = os.path.join(self.root_dir, item['storage_path'])
+        return item
+
+    # =========================================================================
+    # GARBAGE COLLECTION
+    # =========================================================================
+
+    def recount(self) -> int:
+        """
+        Samakan ref_count dengan rujukan sebenarnya. Returns jumlah blob yang diperbaiki.
+
+        Tidak memegang lock store: UPDATE tunggal sudah atomik di SQLite,
+        jadi put() dan GC per dokumen tidak menunggu recount.
+        """
+        with self.get_connection() as conn:
+            self._load_archived_references(conn)
+            expected = f"""(
+                SELECT COUNT(*) FROM ({self._reference_union(conn)}) r
+                WHERE r.blob_sha256 = document_blob.sha256
+            ) + COALESCE((
+                SELECT jumlah FROM temp.arsip_ref a WHERE a.sha256 = document_blob.sha256
+            ), 0)"""
+            cursor = conn.execute(f"""
+                UPDATE document_blob SET ref_count = {expected}
+                WHERE ref_count != {expected}
+            """)
+            conn.commit()
+            return cursor.rowcount
+
+    def collect_garbage(self, sha256_list: Iterable[str] = None,
+                        grace_seconds: int = GC_GRACE_SECONDS,
+                        cancel: Optional[threading.Event] = None) -> Dict:
+        """
+        Hapus blob tanpa rujukan.
+
+        Lock store hanya dipegang saat menghapus blob, bukan selama recount
+        dan penelusuran folder, agar GC per dokumen dari GUI tidak menunggu
+        pass penuh saat start.
+
+        Args:
+            sha256_list: Batasi ke blob tertentu (mis. setelah hapus dokumen);
+                None = pass penuh: recount, lalu hapus juga file yatim di root
+            grace_seconds: Blob yang baru di-put() dalam jeda ini dilewati
+            cancel: Event untuk menghentikan pass (mis. saat aplikasi
+                ditutup), dicek antar blob dan antar entri folder. File blob
+                yang belum sempat dihapus dibersihkan pass penuh berikutnya.
+
+        Returns:
+            Dict dengan diperbaiki, dihapus, yatim, bytes, dibatalkan
+        """
+        report = {'diperbaiki': 0, 'dihapus': 0, 'yatim': 0, 'bytes': 0,
+                  'dibatalkan': False}
+        cutoff_dt = datetime.now() - timedelta(seconds=grace_seconds)
+        cutoff = cutoff_dt.isoformat(timespec='microseconds')
+        full_pass = sha256_list is None
+
+        def cancelled() -> bool:
+            if cancel is not None and cancel.is_set():
+                report['dibatalkan'] = True
+            return report['dibatalkan']
+
+        if full_pass:
+            if cancelled():
+                return report
+            report['diperbaiki'] = self.recount()
+
+        with self._lock:
+            if cancelled():
+                return report
+            with self.get_connection() as conn:
+                sql = """
+                    SELECT sha256, storage_path, ukuran FROM document_blob
+                    WHERE ref_count <= 0 AND COALESCE(last_put_at, '') < ?
+                """
+                params: List = [cutoff]
+                if not full_pass:
+                    shas = list(sha256_list)
+                    if not shas:
+                        return report
+                    sql += f" AND sha256 IN ({','.join('?' * len(shas))})"
+                    params.extend(shas)
+                candidates = conn.execute(sql, params).fetchall()
+                conn.executemany("DELETE FROM document_blob WHERE sha256 = ?",
+                                 [(row['sha256'],) for row in candidates])
+                conn.commit()
+
+            for row in candidates:
+                if cancelled():
+                    break
+                path = os.path.join(self.root_dir, row['storage_path'])
+                if os.path.exists(path):
+                    os.remove(path)
+                    report['bytes'] += row['ukuran']
+                report['dihapus'] += 1
+
+        if full_pass and not cancelled():
+            report['yatim'], freed = self._remove_orphans(cutoff_dt.timestamp(), cancel)
+            report['bytes'] += freed
+            cancelled()
+        return report
+
+    def _remove_orphans(self, cutoff: float, cancel: Optional[threading.Event] = None):
+        """
+        File di root store yang tidak tercatat (mis. sisa copy yang gagal).
+
+        Folder ditelusuri tanpa lock; setiap calon yatim dicek ulang di
+        database di bawah lock sebelum dihapus, karena put() bisa saja
+        baru mencatat file itu.
+        """
+        removed = freed = 0
+        if not os.path.isdir(self.root_dir):
+            return removed, freed
+
+        def cancelled() -> bool:
+            return cancel is not None and cancel.is_set()
+
+        with self.get_connection() as conn:
+            known = {row['storage_path'] for row in
+                     conn.execute("SELECT storage_path FROM document_blob")}
+            for dirpath, _, filenames in os.walk(self.root_dir):
+                if cancelled():
+                    break
+                for name in filenames:
+                    if cancelled():
+                        break
+                    path = os.path.join(dirpath, name)
+                    rel = os.path.relpath(path, self.root_dir)
+                    if rel in known:
+                        continue
+                    with self._lock:
+                        if conn.execute("SELECT 1 FROM document_blob WHERE storage_path = ?",
+                                        (rel,)).fetchone():
+                            continue
+                        try:
+                            st = os.stat(path)
+                            if st.st_mtime >= cutoff:
+                                continue
+                            os.remove(path)
+                        except OSError:
+                            continue
+                    removed += 1
+                    freed += st.st_size
+        return removed, freed
+
+    # =========================================================================
+    # INTEGRITAS & STATISTIK
+    # =========================================================================
+
+    def verify(self, sha256_list: Iterable[str] = None) -> Dict:
+        """
+        Hash ulang file di disk dan bandingkan dengan kuncinya.
+
+        Returns:
+            Dict dengan ok (jumlah), rusak dan hilang (daftar sha256)
+        """
+        with self.get_connection() as conn:
+            sql = "SELECT sha256, storage_path FROM document_blob"
+            params: List = []
+            if sha256_list is not None:
+                shas = list(sha256_list)
+                sql += f" WHERE sha256 IN ({','.join('?' * len(shas))})" if shas else " WHERE 0"
+                params = shas
+            rows = conn.execute(sql, params).fetchall()
+
+        report = {'ok': 0, STATUS_RUSAK: [], STATUS_HILANG: []}
+        updates = []
+        for row in rows:
+            path = os.path.join(self.root_dir, row['storage_path'])
+            if not os.path.exists(path):
+                status = STATUS_HILANG
+            elif hash_file(path) != row['sha256']:
+                status = STATUS_RUSAK
+            else:
+                status = STATUS_OK
+            if status == STATUS_OK:
+                report['ok'] += 1
+            else:
+                report[status].append(row['sha256'])
+            updates.append((status, _now(), row['sha256']))
+
+        with self.get_connection() as conn:
+            conn.executemany("""
+                UPDATE document_blob SET status = ?, verified_at = ? WHERE sha256 = ?
+            """, updates)
+            conn.commit()
+        return report
+
+    def stats(self) -> DedupStats:
+        with self.get_connection() as conn:
+            blob = conn.execute("""
+                SELECT COUNT(*) AS jumlah, COALESCE(SUM(ukuran), 0) AS ukuran
+                FROM document_blob
+            """).fetchone()
+            ref = conn.execute(f"""
+                SELECT COUNT(*) AS jumlah, COALESCE(SUM(b.ukuran), 0) AS ukuran
+                FROM ({self._reference_union(conn)}) r
+                JOIN document_blob b ON b.sha256 = r.blob_sha256
+            """).fetchone()
+            self._load_archived_references(conn)
+            arsip = conn.execute("""
+                SELECT COALESCE(SUM(a.jumlah), 0) AS jumlah,
+                       COALESCE(SUM(a.jumlah * b.ukuran), 0) AS ukuran
+                FROM temp.arsip_ref a
+                JOIN document_blob b ON b.sha256 = a.sha256
+            """).fetchone()
+        return DedupStats(blob['jumlah'], ref['jumlah'] + arsip['jumlah'],
+                          blob['ukuran'], ref['ukuran'] + arsip['ukuran'])
+
+    # =========================================================================
+    # MIGRASI
+    # =========================================================================
+
+    def adopt_legacy(self, remove_original: bool = False) -> int:
+        """
+        Pindahkan file lama (baris tanpa blob_sha256) ke store.
+
+        Path baris diarahkan ke file di store. File asli hanya dihapus
+        jika remove_original=True.
+
+        Returns:
+            Jumlah baris yang dipindahkan
+        """
+        moved = 0
+        for table, path_column in REFERENCE_TABLES.items():
+            with self.get_connection() as conn:
+                columns = [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+                if 'blob_sha256' not in columns:
+                    continue
+                rows = conn.execute(f"""
+                    SELECT id, {path_column} AS path FROM {table}
+                    WHERE blob_sha256 IS NULL AND {path_column} IS NOT NULL
+                """).fetchall()
+
+            for row in rows:
+                if not os.path.isfile(row['path']):
+                    continue
+                try:
+                    blob = self.put(row['path'])
+                except OSError as e:
+                    print(f"Warning: Gagal memindahkan {row['path']} ke document store: {e}")
+                    continue
+                with self.get_connection() as conn:
+                    conn.execute(f"""
+                        UPDATE {table} SET blob_sha256 = ?, {path_column} = ? WHERE id = ?
+                    """, (blob.sha256, blob.path, row['id']))
+                    conn.commit()
+                if remove_original and os.path.abspath(row['path']) != os.path.abspath(blob.path):
+                    os.remove(row['path'])
+                moved += 1
+        return moved
+
+
+# ============================================================================
+# SINGLETON
+# ============================================================================
+
+_stores: Dict[str, DocumentStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_document_store(db_path: str = None) -> DocumentStore:
+    """Store bersama per file database (root: <folder database>/document_store)."""
+    key = os.path.abspath(db_path or DATABASE_PATH)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = DocumentStore(key)
+            _stores[key] = store
+        return store
+
+
+__all__ = [
+    'STATUS_OK',
+    'STATUS_RUSAK',
+    'STATUS_HILANG',
+    'GC_GRACE_SECONDS',
+    'REFERENCE_TABLES',
+    'hash_file',
+    'StoredBlob',
+    'DedupStats',
+    'DocumentStore',
+    'get_document_store',
+]
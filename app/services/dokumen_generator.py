@@ -8,6 +8,7 @@ Features:
 - Replace placeholder dengan data transaksi
 - Simpan ke folder terstruktur per transaksi
 - Track status dokumen di database
+- Catat setiap file hasil generate di index dokumen (dokumen_index)
 """
 
 import os
@@ -19,53 +20,15 @@ from docx import Document
 from docx.shared import Pt
 import openpyxl
 
+from app.core.kalkulasi import format_rupiah, terbilang
+from app.services.dokumen_index import get_dokumen_index
+
 # Base paths
 BASE_DIR = Path(__file__).parent.parent.parent
 TEMPLATES_DIR = BASE_DIR / "templates"
 OUTPUT_DIR = BASE_DIR / "output" / "dokumen"
 
 
-def format_rupiah(value: float) -> str:
-    """Format angka ke format Rupiah."""
-    if value is None:
-        return "Rp 0"
-    return f"Rp {value:,.0f}".replace(",", ".")
-
-
-def terbilang(n: float) -> str:
-    """Konversi angka ke terbilang dalam Bahasa Indonesia."""
-    if n == 0:
-        return "nol rupiah"
-
-    satuan = ["", "satu", "dua", "tiga", "empat", "lima",
-              "enam", "tujuh", "delapan", "sembilan", "sepuluh", "sebelas"]
-
-    n = int(n)
-
-    if n < 0:
-        return "minus " + terbilang(-n)
-    elif n < 12:
-        return satuan[n]
-    elif n < 20:
-        return satuan[n - 10] + " belas"
-    elif n < 100:
-        return satuan[n // 10] + " puluh " + satuan[n % 10]
-    elif n < 200:
-        return "seratus " + terbilang(n - 100)
-    elif n < 1000:
-        return satuan[n // 100] + " ratus " + terbilang(n % 100)
-    elif n < 2000:
-        return "seribu " + terbilang(n - 1000)
-    elif n < 1000000:
-        return terbilang(n // 1000) + " ribu " + terbilang(n % 1000)
-    elif n < 1000000000:
-        return terbilang(n // 1000000) + " juta " + terbilang(n % 1000000)
-    elif n < 1000000000000:
-        return terbilang(n // 1000000000) + " miliar " + terbilang(n % 1000000000)
-    else:
-        return terbilang(n // 1000000000000) + " triliun " + terbilang(n % 1000000000000)
-
-
 def format_tanggal(date_str: str) -> str:
     """Format tanggal ke format Indonesia."""
     if not date_str:
@@ -96,11 +59,56 @@ class DokumenGenerator:
         'title': lambda x: str(x).title() if x else "",
     }
 
-    def __init__(self, db=None):
-        """Initialize generator with optional database connection."""
+    def __init__(self, db=None, index=None):
+        """Initialize generator with optional database connection and index."""
         self.db = db
+        self._index = index
         self._ensure_directories()
 
+    @property
+    def index(self):
+        """Index file dokumen (default: index database aplikasi)."""
+        if self._index is None:
+            self._index = get_dokumen_index()
+        return self._index
+
+    def register_document(self, output_path: Path, kode_dokumen: str, transaksi: Dict[str, Any]):
+        """Catat file dokumen di index; kegagalan tidak membatalkan generate/upload."""
+        try:
+            self.index.catat(output_path, kode_dokumen,
+                             transaksi_id=transaksi.get('id'),
+                             paket_id=transaksi.get('paket_id'))
+        except Exception as e:
+            print(f"Warning: Gagal mencatat index dokumen: {e}")
+
+    def find_document(self, kode_dokumen: str, transaksi: Dict[str, Any]) -> Optional[str]:
+        """
+        Cari file terbaru untuk kode dokumen milik transaksi.
+
+        Lookup lewat index. Untuk file lama yang dibuat sebelum index ada,
+        folder output transaksi dicek sekali lalu hasilnya dicatat.
+        """
+        transaksi_id = transaksi.get('id')
+        paket_id = transaksi.get('paket_id')
+        if transaksi_id is not None or paket_id is not None:
+            try:
+                entry = self.index.cari_terbaru(kode_dokumen, transaksi_id=transaksi_id,
+                                                paket_id=paket_id)
+                if entry:
+                    return entry['file_path']
+            except Exception as e:
+                print(f"Warning: Gagal membaca index dokumen: {e}")
+
+        folder = self.get_output_folder(transaksi=transaksi)
+        files = sorted(folder.glob(f"{kode_dokumen}_*")) + sorted(folder.glob(f"{kode_dokumen}.*"))
+        files = [f for f in files if f.is_file()]
+        if not files:
+            return None
+        latest = max(files, key=lambda f: f.stat().st_mtime)
+        if transaksi_id is not None or paket_id is not None:
+            self.register_document(latest, kode_dokumen, transaksi)
+        return str(latest)
+
     def _ensure_directories(self):
         """Pastikan folder output ada."""
         OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -557,6 +565,7 @@ class DokumenGenerator:
             return None, f"Format template '{ext}' tidak didukung"
 
         if success:
+            self.register_document(output_path, kode_dokumen, transaksi)
             if file_locked:
                 return str(output_path), f"File lama sedang dibuka. Disimpan sebagai: {output_filename}"
             return str(output_path), None
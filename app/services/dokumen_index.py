@@ -0,0 +1,429 @@
+"""
+PPK DOCUMENT FACTORY - Generated Document Index
+================================================
+Index persisten untuk file dokumen hasil generate.
+
+Setiap file yang dibuat DokumenGenerator, TemplateEngine.generate_document
+(dokumen paket) dan BundlePipeline (swakelola, perjalanan dinas, jamuan
+tamu) dicatat di tabel dokumen_file_index (pemilik, kode dokumen, path,
+ukuran, hash, waktu). Membuka dokumen cukup satu lookup ber-index, bukan glob folder
+OUTPUT_DIR/MEKANISME/Bulan_Tahun/... yang makin lambat seiring jumlah file.
+
+rescan() merekonsiliasi index dengan disk dalam satu kali os.walk atas
+root_dir (file di luar root_dir, mis. OUTPUT_DIR/<tahun>/..., di-stat
+langsung):
+- file berubah      -> ukuran/hash/mtime diperbarui
+- file dipindah     -> dicocokkan lewat hash, path diperbarui
+- file hilang       -> status 'hilang' (tetap disimpan, bisa muncul lagi)
+- file tanpa index  -> dilaporkan sebagai yatim (orphan)
+
+Usage:
+    index = get_dokumen_index()
+    index.catat(path, 'KUIT_UM', transaksi_id=12)
+    index.catat(path, 'kak_swakelola', swakelola_id=3)
+    entry = index.cari_terbaru('KUIT_UM', transaksi_id=12)
+    report = index.rescan()
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from app.core.config import DATABASE_PATH, OUTPUT_DIR
+from app.core.query_stats import connect
+
+# Folder output DokumenGenerator
+DOKUMEN_OUTPUT_DIR = os.path.join(OUTPUT_DIR, "dokumen")
+
+# Kolom pemilik entri index. Tiga terakhir untuk output bundle dokumen
+# (app.services.document_bundles), yang tidak terkait transaksi/paket.
+OWNER_COLUMNS = ('transaksi_id', 'paket_id', 'swakelola_id',
+                 'perjalanan_dinas_id', 'jamuan_tamu_id')
+
+STATUS_ADA = 'ada'
+STATUS_HILANG = 'hilang'
+
+_HASH_CHUNK = 1024 * 1024
+
+SCHEMA_DOKUMEN_FILE_INDEX = """
+CREATE TABLE IF NOT EXISTS dokumen_file_index (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    transaksi_id INTEGER,
+    paket_id INTEGER,
+    swakelola_id INTEGER,
+    perjalanan_dinas_id INTEGER,
+    jamuan_tamu_id INTEGER,
+    kode_dokumen TEXT NOT NULL,
+    file_path TEXT NOT NULL UNIQUE,
+    ukuran INTEGER,
+    sha256 TEXT,
+    mtime REAL,
+    status TEXT DEFAULT 'ada' CHECK (status IN ('ada', 'hilang')),
+    created_at TEXT,
+    updated_at TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_dfi_transaksi
+    ON dokumen_file_index(transaksi_id, kode_dokumen, updated_at);
+CREATE INDEX IF NOT EXISTS idx_dfi_paket
+    ON dokumen_file_index(paket_id, kode_dokumen, updated_at);
+CREATE INDEX IF NOT EXISTS idx_dfi_sha256 ON dokumen_file_index(sha256);
+"""
+
+SCHEMA_DOKUMEN_FILE_INDEX_BUNDLE = """
+CREATE INDEX IF NOT EXISTS idx_dfi_swakelola
+    ON dokumen_file_index(swakelola_id, kode_dokumen, updated_at);
+CREATE INDEX IF NOT EXISTS idx_dfi_perjalanan_dinas
+    ON dokumen_file_index(perjalanan_dinas_id, kode_dokumen, updated_at);
+CREATE INDEX IF NOT EXISTS idx_dfi_jamuan_tamu
+    ON dokumen_file_index(jamuan_tamu_id, kode_dokumen, updated_at);
+"""
+
+
+def hash_file(path: str) -> str:
+    """SHA-256 isi file (dibaca per blok)."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _normalize(path: str) -> str:
+    return os.path.normcase(os.path.abspath(str(path)))
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec='microseconds')
+
+
+class DokumenIndex:
+    """Index file dokumen hasil generate di tabel dokumen_file_index."""
+
+    def __init__(self, db_path: str = None, root_dir: str = None):
+        self.db_path = db_path or DATABASE_PATH
+        self.root_dir = root_dir or DOKUMEN_OUTPUT_DIR
+        self._rescan_lock = threading.Lock()
+        self._init_database()
+
+    @contextmanager
+    def get_connection(self):
+        """Context manager untuk database connection."""
+        conn = connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def _init_database(self):
+        with self.get_connection() as conn:
+            conn.executescript(SCHEMA_DOKUMEN_FILE_INDEX)
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(dokumen_file_index)")]
+            for column in OWNER_COLUMNS:
+                if column not in columns:  # Index dari versi sebelum ada bundle
+                    conn.execute(f"ALTER TABLE dokumen_file_index ADD COLUMN {column} INTEGER")
+            conn.executescript(SCHEMA_DOKUMEN_FILE_INDEX_BUNDLE)
+            conn.commit()
+
+    def _in_root(self, path: str) -> bool:
+        root = _normalize(self.root_dir)
+        return path == root or path.startswith(root + os.sep)
+
+    # =========================================================================
+    # PENCATATAN
+    # =========================================================================
+
+    def catat(self, file_path: str, kode_dokumen: str,
+              transaksi_id: int = None, paket_id: int = None, **pemilik) -> int:
+        """
+        Catat (atau perbarui) file hasil generate.
+
+        File yang ditimpa di path yang sama memperbarui baris yang ada.
+
+        Args:
+            pemilik: Pemilik output bundle, mis. swakelola_id=3
+                (lihat OWNER_COLUMNS)
+
+        Returns:
+            ID baris index
+        """
+        owners = self._owners(transaksi_id=transaksi_id, paket_id=paket_id, **pemilik)
+        path = _normalize(file_path)
+        stat = os.stat(path)
+        sha256 = hash_file(path)
+        now = _now()
+
+        columns = ", ".join(OWNER_COLUMNS)
+        with self.get_connection() as conn:
+            row = conn.execute(f"""
+                INSERT INTO dokumen_file_index (
+                    {columns}, kode_dokumen, file_path,
+                    ukuran, sha256, mtime, status, created_at, updated_at
+                ) VALUES ({', '.join('?' * len(OWNER_COLUMNS))}, ?, ?, ?, ?, ?, 'ada', ?, ?)
+                ON CONFLICT(file_path) DO UPDATE SET
+                    {', '.join(f'{c} = excluded.{c}' for c in OWNER_COLUMNS)},
+                    kode_dokumen = excluded.kode_dokumen,
+                    ukuran = excluded.ukuran,
+                    sha256 = excluded.sha256,
+                    mtime = excluded.mtime,
+                    status = 'ada',
+                    updated_at = excluded.updated_at
+                RETURNING id
+            """, [owners[c] for c in OWNER_COLUMNS] + [
+                kode_dokumen, path, stat.st_size, sha256, stat.st_mtime, now, now,
+            ]).fetchone()
+            conn.commit()
+            return row[0]
+
+    def hapus(self, file_path: str) -> bool:
+        """Hapus entri index untuk path (file di disk tidak disentuh)."""
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                "DELETE FROM dokumen_file_index WHERE file_path = ?",
+                (_normalize(file_path),))
+            conn.commit()
+            return cursor.rowcount > 0
+
+    # =========================================================================
+    # LOOKUP
+    # =========================================================================
+
+    @staticmethod
+    def _owners(**pemilik) -> Dict[str, Optional[int]]:
+        unknown = set(pemilik) - set(OWNER_COLUMNS)
+        if unknown:
+            raise ValueError(f"Kolom pemilik tidak dikenal: {', '.join(sorted(unknown))}")
+        return {column: pemilik.get(column) for column in OWNER_COLUMNS}
+
+    def _pemilik(self, transaksi_id: int, paket_id: int, **pemilik):
+        """WHERE untuk pemilik pertama yang diisi (urutan OWNER_COLUMNS)."""
+        owners = self._owners(transaksi_id=transaksi_id, paket_id=paket_id, **pemilik)
+        for column in OWNER_COLUMNS:
+            if owners[column] is not None:
+                return f"{column} = ?", owners[column]
+        raise ValueError(f"Salah satu dari {', '.join(OWNER_COLUMNS)} wajib diisi")
+
+    def cari_terbaru(self, kode_dokumen: str, transaksi_id: int = None,
+                     paket_id: int = None, **pemilik) -> Optional[Dict[str, Any]]:
+        """
+        File terbaru untuk kode dokumen milik transaksi/paket.
+
+        Entri yang ternyata sudah tidak ada di disk ditandai 'hilang'
+        dan entri berikutnya dicoba.
+        """
+        kolom, nilai = self._pemilik(transaksi_id, paket_id, **pemilik)
+        with self.get_connection() as conn:
+            rows = conn.execute(f"""
+                SELECT * FROM dokumen_file_index
+                WHERE {kolom} AND kode_dokumen = ? AND status = 'ada'
+                ORDER BY updated_at DESC, id DESC
+            """, (nilai, kode_dokumen)).fetchall()
+
+            hilang = []
+            found = None
+            for row in rows:
+                if os.path.exists(row['file_path']):
+                    found = dict(row)
+                    break
+                hilang.append(row['id'])
+
+            if hilang:
+                conn.executemany(
+                    "UPDATE dokumen_file_index SET status = 'hilang', updated_at = ? WHERE id = ?",
+                    [(_now(), i) for i in hilang])
+                conn.commit()
+        return found
+
+    def daftar(self, transaksi_id: int = None, paket_id: int = None,
+               status: str = STATUS_ADA, **pemilik) -> List[Dict[str, Any]]:
+        """Semua file ter-index milik transaksi/paket/record bundle, terbaru dulu."""
+        kolom, nilai = self._pemilik(transaksi_id, paket_id, **pemilik)
+        query = f"SELECT * FROM dokumen_file_index WHERE {kolom}"
+        params: list = [nilai]
+        if status:
+            query += " AND status = ?"
+            params.append(status)
+        query += " ORDER BY updated_at DESC, id DESC"
+        with self.get_connection() as conn:
+            return [dict(r) for r in conn.execute(query, params)]
+
+    # =========================================================================
+    # REKONSILIASI
+    # =========================================================================
+
+    def _scan_disk(self, cancel: Optional[threading.Event] = None
+                   ) -> Optional[Dict[str, os.stat_result]]:
+        """Stat semua file di root_dir; None jika dibatalkan lewat cancel."""
+        files = {}
+        if not os.path.isdir(self.root_dir):
+            return files
+        for root, _dirs, names in os.walk(self.root_dir):
+            if cancel is not None and cancel.is_set():
+                return None
+            for name in names:
+                # File lock Office (~$KUIT_UM.docx) bukan dokumen
+                if name.startswith('~$'):
+                    continue
+                path = _normalize(os.path.join(root, name))
+                try:
+                    files[path] = os.stat(path)
+                except OSError:
+                    continue
+        return files
+
+    def rescan(self, cancel: Optional[threading.Event] = None) -> Dict[str, Any]:
+        """
+        Rekonsiliasi index dengan isi root_dir.
+
+        Hash hanya dihitung untuk file yang ukuran/mtime-nya berubah dan
+        untuk kandidat pindahan (file tanpa index dengan ukuran sama).
+
+        Args:
+            cancel: Event untuk menghentikan rescan (mis. saat aplikasi
+                ditutup). Diperiksa per folder dan per file; rescan yang
+                dibatalkan tidak menulis apa pun ke index.
+
+        Returns:
+            Dict berisi jumlah 'diperiksa', list 'diperbarui', 'dipindah'
+            (dari, ke), 'hilang', 'muncul_lagi', 'yatim' (path) dan
+            'dibatalkan'
+        """
+        def cancelled() -> bool:
+            return cancel is not None and cancel.is_set()
+
+        with self._rescan_lock:
+            report: Dict[str, Any] = {
+                'diperiksa': 0, 'diperbarui': [], 'dipindah': [],
+                'hilang': [], 'muncul_lagi': [], 'yatim': [],
+                'dibatalkan': False,
+            }
+            disk = self._scan_disk(cancel)
+            if disk is None:
+                report['dibatalkan'] = True
+                return report
+            now = _now()
+
+            with self.get_connection() as conn:
+                rows = [dict(r) for r in conn.execute(
+                    "SELECT id, file_path, ukuran, sha256, mtime, status FROM dokumen_file_index")]
+                report['diperiksa'] = len(rows)
+                indexed = {r['file_path'] for r in rows}
+                unindexed = {p: s for p, s in disk.items() if p not in indexed}
+
+                updates = []   # (ukuran, sha256, mtime, status, updated_at, id)
+                moves = []     # (file_path, ukuran, mtime, updated_at, id)
+                missing = []
+                for row in rows:
+                    if cancelled():
+                        report['dibatalkan'] = True
+                        return report
+                    stat = disk.get(row['file_path'])
+                    if stat is None and not self._in_root(row['file_path']):
+                        try:  # Tidak terjangkau os.walk root_dir
+                            stat = os.stat(row['file_path'])
+                        except OSError:
+                            stat = None
+                    if stat is not None:
+                        changed = (stat.st_size != row['ukuran']
+                                   or stat.st_mtime != row['mtime'])
+                        if changed or row['status'] == STATUS_HILANG:
+                            sha256 = hash_file(row['file_path']) if changed else row['sha256']
+                            updates.append((stat.st_size, sha256, stat.st_mtime,
+                                            STATUS_ADA, now, row['id']))
+                            key = 'muncul_lagi' if row['status'] == STATUS_HILANG else 'diperbarui'
+                            report[key].append(row['file_path'])
+                    else:
+                        missing.append(row)
+
+                # Cocokkan file hilang dengan file tanpa index lewat ukuran + hash
+                hash_cache: Dict[str, str] = {}
+                for row in missing:
+                    target = None
+                    for path, stat in unindexed.items():
+                        if cancelled():
+                            report['dibatalkan'] = True
+                            return report
+                        if stat.st_size != row['ukuran']:
+                            continue
+                        if path not in hash_cache:
+                            hash_cache[path] = hash_file(path)
+                        if hash_cache[path] == row['sha256']:
+                            target = path
+                            break
+                    if target:
+                        stat = unindexed.pop(target)
+                        moves.append((target, stat.st_size, stat.st_mtime, now, row['id']))
+                        report['dipindah'].append((row['file_path'], target))
+                    elif row['status'] != STATUS_HILANG:
+                        updates.append((row['ukuran'], row['sha256'], row['mtime'],
+                                        STATUS_HILANG, now, row['id']))
+                        report['hilang'].append(row['file_path'])
+
+                if updates:
+                    conn.executemany("""
+                        UPDATE dokumen_file_index
+                        SET ukuran = ?, sha256 = ?, mtime = ?, status = ?, updated_at = ?
+                        WHERE id = ?
+                    """, updates)
+                if moves:
+                    conn.executemany("""
+                        UPDATE dokumen_file_index
+                        SET file_path = ?, ukuran = ?, mtime = ?, status = 'ada', updated_at = ?
+                        WHERE id = ?
+                    """, moves)
+                conn.commit()
+
+            report['yatim'] = sorted(unindexed)
+            return report
+
+    def rescan_async(self, callback: Callable[[Dict[str, Any]], None] = None) -> threading.Thread:
+        """
+        Jalankan rescan() di background thread.
+
+        callback dipanggil dari thread tersebut; kode UI harus
+        meneruskannya ke main thread sendiri.
+        """
+        def run():
+            try:
+                report = self.rescan()
+            except Exception as e:
+                print(f"Warning: Rescan index dokumen gagal: {e}")
+                return
+            if callback:
+                callback(report)
+
+        thread = threading.Thread(target=run, name="DokumenIndexRescan", daemon=True)
+        thread.start()
+        return thread
+
+
+# Instance bersama per file database
+_indexes: Dict[str, DokumenIndex] = {}
+_index_lock = threading.Lock()
+
+
+def get_dokumen_index(db_path: str = None) -> DokumenIndex:
+    """Get DokumenIndex bersama per file database (default: database aplikasi)."""
+    key = os.path.abspath(db_path or DATABASE_PATH)
+    with _index_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = DokumenIndex(key)
+            _indexes[key] = index
+        return index
+
+
+__all__ = [
+    'DOKUMEN_OUTPUT_DIR',
+    'OWNER_COLUMNS',
+    'STATUS_ADA',
+    'STATUS_HILANG',
+    'hash_file',
+    'DokumenIndex',
+    'get_dokumen_index',
+]
@@ -0,0 +1,542 @@
+"""
+PPK DOCUMENT FACTORY - Fiscal Year Archive
+==========================================
+Partisi data per tahun anggaran. Database aktif hanya berisi tahun yang
+masih berjalan. Tahun yang sudah ditutup dipindah ke file arsip
+<folder database>/arsip/<nama database>_<tahun>.db.
+
+close_year() memindahkan semua baris milik satu tahun ke file arsip dalam
+satu transaksi lintas database (ATTACH). Yang dipindah adalah tabel
+ber-kolom tahun beserta tabel anaknya (lihat PARTITIONED_TABLES). Setelah
+itu baris tersebut dihapus dari database aktif, sehingga query harian dan
+indeksnya tidak lagi memuat data tahun lama. reopen_year() mengembalikan
+arsip ke database aktif.
+
+Laporan lintas tahun memakai attached() atau query_all_years(). Keduanya
+meng-ATTACH file arsip hanya saat dibutuhkan.
+
+backup_incremental() menyimpan database aktif dan file arsip ke folder
+backup berdasarkan isi (SHA-256). File yang mtime/ukurannya tidak berubah
+sejak backup terakhir tidak dibaca maupun disalin lagi, sehingga arsip yang
+sudah ditutup cukup disalin sekali.
+
+Usage:
+    archive = get_fiscal_archive()
+    archive.close_year(2024)
+    rows = archive.query_all_years("transaksi_pencairan", "status = ?", ("selesai",))
+    report = archive.backup_incremental("/media/usb/ppk_backup")
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from app.core.audit_writer import flush_all_audit_writers
+from app.core.config import DATABASE_PATH, TAHUN_ANGGARAN
+from app.core.events import (
+    ALL_TOPICS, PEMBAYARAN_LAINNYA_TOPICS, TOPIC_LEMBAR, get_event_bus,
+)
+from app.core.query_stats import connect
+
+ARCHIVE_DIRNAME = 'arsip'
+MANIFEST_NAME = 'manifest.json'
+
+_HASH_CHUNK = 1024 * 1024
+
+# Tabel yang dipartisi per tahun, induk sebelum anak. Nilai berupa nama
+# kolom tahun, atau daftar (tabel induk, kolom FK) untuk tabel anak yang
+# ikut tahun induknya. Tabel yang tidak ada di database dilewati. Tabel
+# master (pegawai, satker, penyedia), counter penomoran dan audit_log
+# tetap di database aktif.
+PARTITIONED_TABLES: Dict[str, Union[str, List[Tuple[str, str]]]] = {
+    # Pengadaan
+    'paket': 'tahun_anggaran',
+    'paket_pejabat': [('paket', 'paket_id')],
+    'item_barang': [('paket', 'paket_id')],
+    'survey_harga_detail': [('paket', 'paket_id')],
+    'survey_toko': [('paket', 'paket_id')],
+    'harga_lifecycle': [('paket', 'paket_id')],
+    'revisi_harga': [('paket', 'paket_id')],
+    'bukti_survey': [('paket', 'paket_id')],
+    'dokumen_timeline': [('paket', 'paket_id')],
+    'tim_pemeriksa': [('paket', 'paket_id')],
+    'workflow_stage': [('paket', 'paket_id')],
+    'dokumen': [('paket', 'paket_id')],
+    'paket_item': [('paket', 'paket_id')],
+    'paket_pemeriksa': [('paket', 'paket_id')],
+    'checklist_spj': [('paket', 'paket_id')],
+    'foto_dokumentasi': [('paket', 'paket_id')],
+    # Pembayaran lainnya
+    'perjalanan_dinas': 'tahun_anggaran',
+    'swakelola': 'tahun_anggaran',
+    'sk_kpa': 'tahun_anggaran',
+    'jamuan_tamu': 'tahun_anggaran',
+    'honorarium': 'tahun_anggaran',
+    'honorarium_detail': [('honorarium', 'honorarium_id')],
+    'pjlp': 'tahun_anggaran',
+    'payroll_run_pjlp': 'tahun',
+    'pembayaran_pjlp': [('pjlp', 'pjlp_id')],
+    # Anggaran
+    'pagu_anggaran': 'tahun_anggaran',
+    'realisasi_anggaran': [('pagu_anggaran', 'pagu_id')],
+    'honorarium_pengelola': 'tahun',
+    # Pencairan
+    'transaksi_pencairan': 'tahun_anggaran',
+    'dokumen_transaksi': [('transaksi_pencairan', 'transaksi_id')],
+    'fase_log': [('transaksi_pencairan', 'transaksi_id')],
+    'saldo_up': 'tahun_anggaran',
+    'up_ledger': 'tahun_anggaran',
+    'lembar_permintaan': 'tahun_anggaran',
+    'lembar_permintaan_item': [('lembar_permintaan', 'lembar_permintaan_id')],
+    'transaksi_item': [('transaksi_pencairan', 'transaksi_id'), ('paket', 'paket_id'),
+                       ('lembar_permintaan', 'lembar_permintaan_id')],
+    'transaksi_item_log': [('transaksi_item', 'transaksi_item_id')],
+    # Index file hasil generate (kolom rujukan tanpa FK yang dideklarasikan)
+    'dokumen_file_index': [('transaksi_pencairan', 'transaksi_id'), ('paket', 'paket_id'),
+                           ('swakelola', 'swakelola_id'),
+                           ('perjalanan_dinas', 'perjalanan_dinas_id'),
+                           ('jamuan_tamu', 'jamuan_tamu_id')],
+}
+
+SCHEMA_TAHUN_ARSIP = """
+CREATE TABLE IF NOT EXISTS tahun_arsip (
+    tahun INTEGER PRIMARY KEY,
+    path TEXT NOT NULL,               -- Relatif terhadap folder database
+    jumlah_baris INTEGER DEFAULT 0,
+    ditutup_at TEXT
+);
+"""
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec='seconds')
+
+
+def _hash_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _row_filter(table: str, schema: str, tables: Iterable[str]) -> Optional[str]:
+    """WHERE untuk baris milik :tahun, atau None jika induknya tidak ada."""
+    spec = PARTITIONED_TABLES[table]
+    if isinstance(spec, str):
+        return f"{spec} = :tahun"
+    parts = []
+    for parent, fk in spec:
+        if parent not in tables:
+            continue
+        parent_filter = _row_filter(parent, schema, tables)
+        if parent_filter:
+            parts.append(f"{fk} IN (SELECT id FROM {schema}.{parent} WHERE {parent_filter})")
+    return " OR ".join(parts) or None
+
+
+class FiscalArchive:
+    """Database aktif + file arsip per tahun anggaran yang sudah ditutup."""
+
+    def __init__(self, db_path: str = None, archive_dir: str = None):
+        self.db_path = os.path.abspath(db_path or DATABASE_PATH)
+        self.base_dir = os.path.dirname(self.db_path)
+        self.archive_dir = archive_dir or os.path.join(self.base_dir, ARCHIVE_DIRNAME)
+        self._lock = threading.RLock()
+        self._init_database()
+
+    @contextmanager
+    def get_connection(self):
+        conn = connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def _init_database(self):
+        with self.get_connection() as conn:
+            conn.executescript(SCHEMA_TAHUN_ARSIP)
+            conn.commit()
+
+    # ------------------------------------------------------------------------
+    # Registry arsip
+    # ------------------------------------------------------------------------
+
+    def archive_path(self, tahun: int) -> str:
+        stem = os.path.splitext(os.path.basename(self.db_path))[0]
+        return os.path.join(self.archive_dir, f"{stem}_{tahun}.db")
+
+    def archived_years(self) -> Dict[int, str]:
+        """{tahun: path absolut file arsip} untuk semua tahun yang ditutup."""
+        with self.get_connection() as conn:
+            rows = conn.execute("SELECT tahun, path FROM tahun_arsip ORDER BY tahun").fetchall()
+        return {row['tahun']: os.path.join(self.base_dir, row['path']) for row in rows}
+
+    def get_archive_info(self) -> List[Dict]:
+        with self.get_connection() as conn:
+            rows = conn.execute("SELECT * FROM tahun_arsip ORDER BY tahun DESC").fetchall()
+        return [dict(row) for row in rows]
+
+    # ------------------------------------------------------------------------
+    # Tutup / buka tahun
+    # ------------------------------------------------------------------------
+
+    def close_year(self, tahun: int, vacuum: bool = True) -> Dict[str, int]:
+        """
+        Pindahkan seluruh data satu tahun anggaran ke file arsip.
+
+        Semua tabel dipindah dalam satu transaksi; jumlah baris yang dihapus
+        dari database aktif harus sama dengan yang disalin, jika tidak semua
+        dibatalkan. vacuum=True mengecilkan file database aktif sesudahnya.
+
+        Returns:
+            Dict nama tabel -> jumlah baris yang dipindah
+        """
+        if tahun >= TAHUN_ANGGARAN:
+            raise ValueError(f"Tahun {tahun} masih berjalan dan tidak dapat ditutup")
+
+        with self._lock:
+            if tahun in self.archived_years():
+                raise ValueError(f"Tahun {tahun} sudah diarsipkan")
+
+            path = self.archive_path(tahun)
+            os.makedirs(self.archive_dir, exist_ok=True)
+            if os.path.exists(path):
+                os.remove(path)  # Sisa penutupan yang gagal
+
+            with self.get_connection() as conn:
+                tables = self._tables(conn, 'main')
+                self._create_archive(conn, path, tables, tahun)
+                conn.execute("ATTACH DATABASE ? AS arsip", (path,))
+                try:
+                    conn.execute("BEGIN IMMEDIATE")
+                    counts = self._move(conn, 'main', 'arsip', tables, tahun)
+                    self._adjust_blob_refs(conn, tables, +1)
+                    conn.execute("""
+                        INSERT INTO main.tahun_arsip (tahun, path, jumlah_baris, ditutup_at)
+                        VALUES (?, ?, ?, ?)
+                    """, (tahun, os.path.relpath(path, self.base_dir),
+                          sum(counts.values()), _now()))
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    conn.execute("DETACH DATABASE arsip")
+                    os.remove(path)
+                    raise
+                conn.execute("DETACH DATABASE arsip")
+                if vacuum:
+                    conn.execute("VACUUM")
+
+        self._publish("arsip", tahun)
+        return counts
+
+    def reopen_year(self, tahun: int) -> Dict[str, int]:
+        """Kembalikan data tahun yang diarsipkan ke database aktif."""
+        with self._lock:
+            path = self.archived_years().get(tahun)
+            if not path:
+                raise ValueError(f"Tahun {tahun} tidak ada di arsip")
+
+            with self.get_connection() as conn:
+                conn.execute("ATTACH DATABASE ? AS arsip", (path,))
+                try:
+                    aktif = self._tables(conn, 'main')
+                    tables = [t for t in self._tables(conn, 'arsip') if t in aktif]
+                    conn.execute("BEGIN IMMEDIATE")
+                    self._adjust_blob_refs(conn, tables, -1)
+                    counts = self._move(conn, 'arsip', 'main', tables, tahun)
+                    conn.execute("DELETE FROM main.tahun_arsip WHERE tahun = ?", (tahun,))
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+                finally:
+                    conn.execute("DETACH DATABASE arsip")
+            os.remove(path)
+
+        self._publish("buka_arsip", tahun)
+        return counts
+
+    def _tables(self, conn, schema: str) -> List[str]:
+        """Tabel partisi yang ada di schema, urut induk sebelum anak."""
+        existing = {row[0] for row in conn.execute(
+            f"SELECT name FROM {schema}.sqlite_master WHERE type = 'table'")}
+        tables = [t for t in PARTITIONED_TABLES if t in existing]
+        return [t for t in tables if _row_filter(t, schema, tables)]
+
+    def _columns(self, conn, schema: str, table: str) -> List[str]:
+        return [row[1] for row in conn.execute(f"PRAGMA {schema}.table_info({table})")]
+
+    def _create_archive(self, conn, path: str, tables: List[str], tahun: int):
+        """Buat file arsip dengan skema (tabel + index) yang sama."""
+        placeholders = ','.join('?' * len(tables))
+        statements = [row['sql'] for row in conn.execute(f"""
+            SELECT sql FROM sqlite_master
+            WHERE type IN ('table', 'index') AND tbl_name IN ({placeholders})
+              AND sql IS NOT NULL
+            ORDER BY type DESC
+        """, tables)]
+        archive = connect(path)
+        try:
+            for sql in statements:
+                archive.execute(sql)
+            archive.execute("CREATE TABLE arsip_info (tahun INTEGER, sumber TEXT, dibuat_at TEXT)")
+            archive.execute("INSERT INTO arsip_info VALUES (?, ?, ?)",
+                            (tahun, os.path.basename(self.db_path), _now()))
+            archive.commit()
+        finally:
+            archive.close()
+
+    def _move(self, conn, src: str, dst: str, tables: List[str], tahun: int) -> Dict[str, int]:
+        """
+        Salin baris tahun dari src ke dst lalu hapus dari src.
+
+        Anak diproses sebelum induk: filter anak masih bisa membaca induk di
+        src saat dihapus, dan trigger total di dst (mis. honorarium_detail)
+        tidak menambah total induk yang disalin belakangan.
+        """
+        params = {'tahun': tahun}
+        counts = {}
+        for table in reversed(tables):
+            columns = [c for c in self._columns(conn, src, table)
+                       if c in self._columns(conn, dst, table)]
+            column_list = ", ".join(columns)
+            cursor = conn.execute(f"""
+                INSERT INTO {dst}.{table} ({column_list})
+                SELECT {column_list} FROM {src}.{table}
+                WHERE {_row_filter(table, src, tables)}
+            """, params)
+            counts[table] = cursor.rowcount
+
+        for table in reversed(tables):
+            cursor = conn.execute(f"""
+                DELETE FROM {src}.{table} WHERE {_row_filter(table, src, tables)}
+            """, params)
+            if cursor.rowcount != counts[table]:
+                raise RuntimeError(
+                    f"Jumlah baris {table} tidak cocok ({cursor.rowcount} != {counts[table]})")
+        return counts
+
+    def _adjust_blob_refs(self, conn, tables: List[str], sign: int):
+        """
+        Jaga ref_count document_blob untuk baris perujuk di arsip.
+
+        Trigger document store di database aktif mengurangi ref_count saat
+        baris checklist_spj/foto_dokumentasi dipindah ke arsip (dan
+        menambahnya saat dikembalikan). Rujukan dari arsip tetap dihitung,
+        agar garbage collection tidak menghapus file yang dipakai arsip.
+        Dipanggil saat baris ada di arsip: sign=+1 sesudah tutup tahun,
+        -1 sebelum buka kembali.
+        """
+        if not self._columns(conn, 'main', 'document_blob'):
+            return
+        for table in tables:
+            if 'blob_sha256' not in self._columns(conn, 'arsip', table):
+                continue
+            conn.execute(f"""
+                UPDATE main.document_blob
+                SET ref_count = ref_count + ? * (
+                    SELECT COUNT(*) FROM arsip.{table} r
+                    WHERE r.blob_sha256 = document_blob.sha256
+                )
+                WHERE sha256 IN (SELECT blob_sha256 FROM arsip.{table})
+            """, (sign,))
+
+    def _publish(self, action: str, tahun: Optional[int]):
+        bus = get_event_bus()
+        for topic in ALL_TOPICS + (TOPIC_LEMBAR,) + PEMBAYARAN_LAINNYA_TOPICS:
+            bus.publish(topic, action, db_path=self.db_path, tahun=tahun)
+
+    # ------------------------------------------------------------------------
+    # Query lintas tahun
+    # ------------------------------------------------------------------------
+
+    @contextmanager
+    def attached(self, years: Iterable[int] = None):
+        """
+        Koneksi database aktif dengan arsip ter-ATTACH sebagai arsip_<tahun>.
+
+        Yields (conn, schemas): schemas diawali 'main' lalu arsip yang diminta
+        (default: semua). SQLite membatasi jumlah ATTACH (default 10).
+        """
+        archives = self.archived_years()
+        if years is not None:
+            archives = {t: p for t, p in archives.items() if t in set(years)}
+        with self.get_connection() as conn:
+            schemas = ['main']
+            for tahun, path in sorted(archives.items()):
+                schema = f"arsip_{tahun}"
+                conn.execute("ATTACH DATABASE ? AS " + schema, (path,))
+                schemas.append(schema)
+            yield conn, schemas
+
+    def query_all_years(self, table: str, where: str = "1=1", params: Iterable = (),
+                        columns: str = None, years: Iterable[int] = None,
+                        order_by: str = None) -> List[Dict]:
+        """
+        SELECT dari tabel di database aktif dan arsip (UNION ALL).
+
+        columns=None memakai kolom yang ada di semua sumber. Setiap baris
+        diberi kolom _sumber ('main' atau 'arsip_<tahun>').
+        """
+        params = list(params)
+        with self.attached(years) as (conn, schemas):
+            sources = [s for s in schemas if self._columns(conn, s, table)]
+            if not sources:
+                return []
+            if columns is None:
+                common = self._columns(conn, sources[0], table)
+                for schema in sources[1:]:
+                    present = set(self._columns(conn, schema, table))
+                    common = [c for c in common if c in present]
+                columns = ", ".join(common)
+
+            query = " UNION ALL ".join(
+                f"SELECT {columns}, '{schema}' as _sumber FROM {schema}.{table} WHERE {where}"
+                for schema in sources)
+            if order_by:
+                query += f" ORDER BY {order_by}"
+            rows = conn.execute(query, params * len(sources)).fetchall()
+        return [dict(row) for row in rows]
+
+    # ------------------------------------------------------------------------
+    # Backup inkremental
+    # ------------------------------------------------------------------------
+
+    def backup_incremental(self, backup_dir: str) -> Dict:
+        """
+        Simpan database aktif dan arsip ke backup_dir berdasarkan isi.
+
+        File disimpan sekali di objects/<aa>/<sha256>.db. manifest.json
+        mencatat mtime/ukuran terakhir tiap file dan daftar snapshot, jadi
+        file yang tidak berubah dilewati tanpa dibaca ulang.
+
+        Returns:
+            Dict dengan 'disalin', 'dilewati' (nama file), 'bytes' dan 'snapshot'
+        """
+        flush_all_audit_writers()
+        manifest_path = os.path.join(backup_dir, MANIFEST_NAME)
+        manifest = {'files': {}, 'snapshots': []}
+        if os.path.exists(manifest_path):
+            with open(manifest_path, encoding='utf-8') as f:
+                manifest = json.load(f)
+
+        sources = [self.db_path] + [p for _, p in sorted(self.archived_years().items())]
+        disalin, dilewati, total_bytes = [], [], 0
+        snapshot = {'created_at': _now(), 'files': {}}
+
+        with self._lock:
+            for path in sources:
+                name = os.path.relpath(path, self.base_dir).replace(os.sep, '/')
+                stat = os.stat(path)
+                previous = manifest['files'].get(name)
+                if (previous and previous['mtime_ns'] == stat.st_mtime_ns
+                        and previous['size'] == stat.st_size
+                        and os.path.exists(self._object_path(backup_dir, previous['sha256']))):
+                    snapshot['files'][name] = previous['sha256']
+                    dilewati.append(name)
+                    continue
+
+                sha256, ukuran, baru = self._store_object(backup_dir, path)
+                manifest['files'][name] = {
+                    'sha256': sha256, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+                }
+                snapshot['files'][name] = sha256
+                if baru:
+                    disalin.append(name)
+                    total_bytes += ukuran
+                else:
+                    dilewati.append(name)
+
+            manifest['snapshots'].append(snapshot)
+            tmp_path = f"{manifest_path}.{uuid.uuid4().hex}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=2)
+            os.replace(tmp_path, manifest_path)
+
+        return {'disalin': disalin, 'dilewati': dilewati, 'bytes': total_bytes,
+                'snapshot': snapshot}
+
+    def _object_path(self, backup_dir: str, sha256: str) -> str:
+        return os.path.join(backup_dir, 'objects', sha256[:2], f"{sha256}.db")
+
+    def _store_object(self, backup_dir: str, path: str) -> Tuple[str, int, bool]:
+        """Salinan konsisten (SQLite backup API) lalu simpan berdasarkan hash."""
+        os.makedirs(os.path.join(backup_dir, 'objects'), exist_ok=True)
+        tmp_path = os.path.join(backup_dir, 'objects', f"{uuid.uuid4().hex}.tmp")
+        source = sqlite3.connect(path)
+        target = sqlite3.connect(tmp_path)
+        try:
+            source.backup(target)
+        finally:
+            target.close()
+            source.close()
+
+        sha256 = _hash_file(tmp_path)
+        ukuran = os.path.getsize(tmp_path)
+        object_path = self._object_path(backup_dir, sha256)
+        if os.path.exists(object_path):
+            os.remove(tmp_path)
+            return sha256, ukuran, False
+        os.makedirs(os.path.dirname(object_path), exist_ok=True)
+        os.replace(tmp_path, object_path)
+        return sha256, ukuran, True
+
+    def restore_incremental(self, backup_dir: str, snapshot_index: int = -1) -> List[str]:
+        """
+        Pulihkan database aktif dan arsip dari snapshot backup_incremental().
+
+        Database aktif saat ini disimpan dulu sebagai <db>.backup_<waktu>.
+        Returns daftar file yang dipulihkan.
+        """
+        with open(os.path.join(backup_dir, MANIFEST_NAME), encoding='utf-8') as f:
+            snapshot = json.load(f)['snapshots'][snapshot_index]
+
+        with self._lock:
+            if os.path.exists(self.db_path):
+                stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                shutil.copy2(self.db_path, f"{self.db_path}.backup_{stamp}")
+            restored = []
+            for name, sha256 in snapshot['files'].items():
+                target = os.path.join(self.base_dir, *name.split('/'))
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                shutil.copyfile(self._object_path(backup_dir, sha256), target)
+                restored.append(name)
+
+        self._publish("restore", None)
+        return restored
+
+
+# ============================================================================
+# SINGLETON
+# ============================================================================
+
+_archives: Dict[str, FiscalArchive] = {}
+_archives_lock = threading.Lock()
+
+
+def get_fiscal_archive(db_path: str = None) -> FiscalArchive:
+    """Arsip bersama per file database (folder: <folder database>/arsip)."""
+    key = os.path.abspath(db_path or DATABASE_PATH)
+    with _archives_lock:
+        archive = _archives.get(key)
+        if archive is None:
+            archive = FiscalArchive(key)
+            _archives[key] = archive
+        return archive
+
+
+__all__ = [
+    'ARCHIVE_DIRNAME',
+    'PARTITIONED_TABLES',
+    'FiscalArchive',
+    'get_fiscal_archive',
+]
@@ -10,12 +10,23 @@ Fitur:
 - Link lembar_permintaan ke fase berikutnya
 - Generate dokumen dari data lembar
 - Sync items ke transaksi_item (master data)
+
+Semua transformasi (SPJ, kuitansi, realisasi), nilai finansial,
+penandatangan dan ringkasan dilayani dari satu LembarContext: lembar dan
+rinciannya dimuat sekali lalu dipakai ulang selama satu batch generate.
+Context di-cache per (database, lembar) dan dibuang otomatis ketika
+PencairanManager menulis lembar atau item-nya (event TOPIC_LEMBAR).
 """
 
+import os
+import threading
+from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime
 from pathlib import Path
 
+from app.core.events import DataChangeEvent, TOPIC_LEMBAR, get_event_bus
+
 # ============================================================================
 # CORE HELPER FUNCTIONS
 # ============================================================================
@@ -145,6 +156,231 @@ def approve_lembar_and_sync(db, lembar_id: int, transaksi_id: int = None) -> Tup
     return True, None
 
 
+# ============================================================================
+# LEMBAR DOCUMENT CONTEXT
+# ============================================================================
+
+@dataclass
+class LembarContext:
+    """
+    Lembar permintaan + rincian yang dimuat sekali untuk semua view dokumen.
+
+    Setiap method mengembalikan struktur baru; data context sendiri tidak
+    boleh diubah oleh pemanggil.
+    """
+    lembar_id: int
+    lembar: Dict[str, Any]
+    items: List[Dict[str, Any]]
+
+    @classmethod
+    def load(cls, db, lembar_id: int) -> Optional['LembarContext']:
+        """Muat lembar dan items (satu set query). None jika tidak ada."""
+        data = get_lembar_data_complete(db, lembar_id)
+        if not data:
+            return None
+        return cls(lembar_id, data['lembar'], data['items'])
+
+    def nilai_finansial(self) -> Dict[str, float]:
+        lembar = self.lembar
+        return {
+            'subtotal': lembar.get('subtotal', 0),
+            'ppn': lembar.get('ppn', 0),
+            'total': lembar.get('total', 0),
+        }
+
+    def penandatangan(self) -> Dict[str, str]:
+        lembar = self.lembar
+        return {
+            'nama_pengajuan': lembar.get('nama_pengajuan', ''),
+            'nama_verifikator': lembar.get('nama_verifikator', ''),
+            'nama_ppk': lembar.get('nama_ppk', ''),
+            'nama_atasan': lembar.get('nama_atasan', ''),
+            'nama_kpa': lembar.get('nama_kpa', ''),
+        }
+
+    def spj_format(self) -> Dict[str, Any]:
+        lembar = self.lembar
+        return {
+            'ref_lembar_id': self.lembar_id,
+            'nomor_sp2d': '',  # Will be filled later
+            'tanggal_sp2d': datetime.now().strftime('%Y-%m-%d'),
+            'tanggal_pengajuan': lembar.get('hari_tanggal'),
+            'unit_kerja': lembar.get('unit_kerja'),
+            'sumber_dana': lembar.get('sumber_dana'),
+            
+            # Penandatangan
+            'pengajuan_oleh': lembar.get('nama_pengajuan'),
+            'verifikasi_oleh': lembar.get('nama_verifikator'),
+            'ppk': lembar.get('nama_ppk'),
+            'kpa': lembar.get('nama_kpa'),
+            
+            # Nilai
+            'subtotal': lembar.get('subtotal', 0),
+            'ppn': lembar.get('ppn', 0),
+            'total': lembar.get('total', 0),
+            
+            # Detail rincian
+            'rincian': transform_items_to_spj_format(self.items),
+        }
+
+    def kuitansi_format(self) -> Dict[str, Any]:
+        lembar = self.lembar
+        return {
+            'ref_lembar_id': self.lembar_id,
+            'nomor_kuitansi': '',  # Will be filled by system
+            'tanggal_kuitansi': datetime.now().strftime('%Y-%m-%d'),
+            'tanggal_pengajuan_lembar': lembar.get('hari_tanggal'),
+            'unit_kerja': lembar.get('unit_kerja'),
+            'penerima_dana': lembar.get('nama_pengajuan'),
+            'sumber_dana': lembar.get('sumber_dana'),
+            
+            # Verifikasi
+            'verifikator': lembar.get('nama_verifikator'),
+            'ppk': lembar.get('nama_ppk'),
+            'kpa': lembar.get('nama_kpa'),
+            
+            # Nilai
+            'nilai_uang_muka': lembar.get('total', 0),
+            'nilai_realisasi': lembar.get('total', 0),
+            'selisih': 0,  # Calculated later
+            
+            # Detail rincian
+            'rincian': transform_items_to_kuitansi_format(self.items),
+        }
+
+    def realisasi_format(self) -> Dict[str, Any]:
+        lembar = self.lembar
+        return {
+            'ref_lembar_id': self.lembar_id,
+            'tanggal_realisasi': datetime.now().strftime('%Y-%m-%d'),
+            'tanggal_rencana': lembar.get('hari_tanggal'),
+            'unit_kerja': lembar.get('unit_kerja'),
+            'nama_kegiatan': lembar.get('unit_kerja'),  # Use unit_kerja as activity name
+            'sumber_dana': lembar.get('sumber_dana'),
+            
+            # Penandatangan
+            'pelaksana': lembar.get('nama_pengajuan'),
+            'verifikator': lembar.get('nama_verifikator'),
+            'ppk': lembar.get('nama_ppk'),
+            'kpa': lembar.get('nama_kpa'),
+            
+            # Nilai realisasi
+            'anggaran': lembar.get('total', 0),
+            'realisasi': 0,  # Will be filled by actual spending
+            'sisa': 0,  # Calculated: anggaran - realisasi
+            
+            # Detail rincian realisasi
+            'rincian': transform_items_to_realisasi_format(self.items),
+        }
+
+    def summary(self) -> Dict[str, Any]:
+        lembar = self.lembar
+        return {
+            'id': self.lembar_id,
+            'kode_transaksi': lembar.get('kode_transaksi'),
+            'tanggal': lembar.get('hari_tanggal'),
+            'unit_kerja': lembar.get('unit_kerja'),
+            'sumber_dana': lembar.get('sumber_dana'),
+            'status': lembar.get('status'),
+            
+            'jumlah_item': len(self.items),
+            'subtotal': lembar.get('subtotal', 0),
+            'ppn': lembar.get('ppn', 0),
+            'total': lembar.get('total', 0),
+            
+            'pengajuan_oleh': lembar.get('nama_pengajuan'),
+            'verifikasi_oleh': lembar.get('nama_verifikator'),
+            'ppk': lembar.get('nama_ppk'),
+            'kpa': lembar.get('nama_kpa'),
+            
+            'file': lembar.get('file_path'),
+            'created_at': lembar.get('created_at'),
+            'created_by': lembar.get('created_by'),
+            
+            'items': [dict(item) for item in self.items],
+        }
+
+
+def _db_key(db) -> Any:
+    db_path = getattr(db, 'db_path', None)
+    return os.path.abspath(db_path) if db_path else id(db)
+
+
+class LembarContextCache:
+    """
+    Cache LembarContext per (database, lembar_id).
+
+    Event TOPIC_LEMBAR dari PencairanManager membuang context lembar yang
+    berubah, jadi batch generate berikutnya memuat data terbaru.
+    """
+
+    def __init__(self, bus=None):
+        self._contexts: Dict[Tuple[Any, int], LembarContext] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._unsubscribe = (bus or get_event_bus()).subscribe(
+            self._on_event, [TOPIC_LEMBAR])
+
+    def get(self, db, lembar_id: int) -> Optional[LembarContext]:
+        if not db:
+            return None
+        key = (_db_key(db), lembar_id)
+        with self._lock:
+            context = self._contexts.get(key)
+            generation = self._generation
+        if context is not None:
+            return context
+
+        context = LembarContext.load(db, lembar_id)
+        with self._lock:
+            # Jangan simpan hasil load yang bersilangan dengan penulisan
+            if context is not None and generation == self._generation:
+                self._contexts[key] = context
+        return context
+
+    def invalidate(self, lembar_id: int = None, db_path: str = None):
+        """Buang context (semua, per database, atau satu lembar)."""
+        db_key = os.path.abspath(db_path) if db_path else None
+        with self._lock:
+            self._generation += 1
+            for key in list(self._contexts):
+                if db_key is not None and key[0] != db_key:
+                    continue
+                if lembar_id is not None and key[1] != lembar_id:
+                    continue
+                del self._contexts[key]
+
+    def _on_event(self, event: DataChangeEvent):
+        self.invalidate(event.data.get('lembar_id'), event.data.get('db_path'))
+
+    def close(self):
+        self._unsubscribe()
+        with self._lock:
+            self._contexts.clear()
+
+
+_context_cache: Optional[LembarContextCache] = None
+_context_cache_lock = threading.Lock()
+
+
+def get_lembar_context_cache() -> LembarContextCache:
+    """Get singleton LembarContextCache."""
+    global _context_cache
+    if _context_cache is None:
+        with _context_cache_lock:
+            if _context_cache is None:
+                _context_cache = LembarContextCache()
+    return _context_cache
+
+
+def get_lembar_context(db, lembar_id: int) -> Optional[LembarContext]:
+    """
+    Context dokumen lembar (di-cache). Pakai satu context untuk seluruh
+    set dokumen SPJ: ctx.spj_format(), ctx.kuitansi_format(), ...
+    """
+    return get_lembar_context_cache().get(db, lembar_id)
+
+
 def get_nilai_finansial(db, lembar_id: int) -> Optional[Dict[str, float]]:
     """
     Get nilai finansial dari lembar_permintaan.
@@ -152,15 +388,8 @@ def get_nilai_finansial(db, lembar_id: int) -> Optional[Dict[str, float]]:
     Returns:
         Dictionary dengan keys: subtotal, ppn, total
     """
-    lembar = db.get_lembar_permintaan(lembar_id) if db else None
-    if not lembar:
-        return None
-    
-    return {
-        'subtotal': lembar.get('subtotal', 0),
-        'ppn': lembar.get('ppn', 0),
-        'total': lembar.get('total', 0),
-    }
+    context = get_lembar_context(db, lembar_id)
+    return context.nilai_finansial() if context else None
 
 
 def get_penandatangan(db, lembar_id: int) -> Optional[Dict[str, str]]:
@@ -171,17 +400,8 @@ def get_penandatangan(db, lembar_id: int) -> Optional[Dict[str, str]]:
         Dictionary dengan keys: nama_pengajuan, nama_verifikator, nama_ppk,
                                nama_atasan, nama_kpa
     """
-    lembar = db.get_lembar_permintaan(lembar_id) if db else None
-    if not lembar:
-        return None
-    
-    return {
-        'nama_pengajuan': lembar.get('nama_pengajuan', ''),
-        'nama_verifikator': lembar.get('nama_verifikator', ''),
-        'nama_ppk': lembar.get('nama_ppk', ''),
-        'nama_atasan': lembar.get('nama_atasan', ''),
-        'nama_kpa': lembar.get('nama_kpa', ''),
-    }
+    context = get_lembar_context(db, lembar_id)
+    return context.penandatangan() if context else None
 
 
 # ============================================================================
@@ -297,35 +517,8 @@ def transform_to_spj_format(db, lembar_id: int) -> Optional[Dict[str, Any]]:
     Returns:
         Dictionary siap untuk SPJ dokumen generation
     """
-    data = get_lembar_data_complete(db, lembar_id)
-    if not data:
-        return None
-    
-    lembar = data['lembar']
-    items = data['items']
-    
-    return {
-        'ref_lembar_id': lembar_id,
-        'nomor_sp2d': '',  # Will be filled later
-        'tanggal_sp2d': datetime.now().strftime('%Y-%m-%d'),
-        'tanggal_pengajuan': lembar.get('hari_tanggal'),
-        'unit_kerja': lembar.get('unit_kerja'),
-        'sumber_dana': lembar.get('sumber_dana'),
-        
-        # Penandatangan
-        'pengajuan_oleh': lembar.get('nama_pengajuan'),
-        'verifikasi_oleh': lembar.get('nama_verifikator'),
-        'ppk': lembar.get('nama_ppk'),
-        'kpa': lembar.get('nama_kpa'),
-        
-        # Nilai
-        'subtotal': lembar.get('subtotal', 0),
-        'ppn': lembar.get('ppn', 0),
-        'total': lembar.get('total', 0),
-        
-        # Detail rincian
-        'rincian': transform_items_to_spj_format(items),
-    }
+    context = get_lembar_context(db, lembar_id)
+    return context.spj_format() if context else None
 
 
 def transform_to_kuitansi_format(db, lembar_id: int) -> Optional[Dict[str, Any]]:
@@ -335,35 +528,8 @@ def transform_to_kuitansi_format(db, lembar_id: int) -> Optional[Dict[str, Any]]
     Returns:
         Dictionary siap untuk Kuitansi dokumen generation
     """
-    data = get_lembar_data_complete(db, lembar_id)
-    if not data:
-        return None
-    
-    lembar = data['lembar']
-    items = data['items']
-    
-    return {
-        'ref_lembar_id': lembar_id,
-        'nomor_kuitansi': '',  # Will be filled by system
-        'tanggal_kuitansi': datetime.now().strftime('%Y-%m-%d'),
-        'tanggal_pengajuan_lembar': lembar.get('hari_tanggal'),
-        'unit_kerja': lembar.get('unit_kerja'),
-        'penerima_dana': lembar.get('nama_pengajuan'),
-        'sumber_dana': lembar.get('sumber_dana'),
-        
-        # Verifikasi
-        'verifikator': lembar.get('nama_verifikator'),
-        'ppk': lembar.get('nama_ppk'),
-        'kpa': lembar.get('nama_kpa'),
-        
-        # Nilai
-        'nilai_uang_muka': lembar.get('total', 0),
-        'nilai_realisasi': lembar.get('total', 0),
-        'selisih': 0,  # Calculated later
-        
-        # Detail rincian
-        'rincian': transform_items_to_kuitansi_format(items),
-    }
+    context = get_lembar_context(db, lembar_id)
+    return context.kuitansi_format() if context else None
 
 
 def transform_to_realisasi_format(db, lembar_id: int) -> Optional[Dict[str, Any]]:
@@ -373,35 +539,8 @@ def transform_to_realisasi_format(db, lembar_id: int) -> Optional[Dict[str, Any]
     Returns:
         Dictionary siap untuk Realisasi dokumen generation
     """
-    data = get_lembar_data_complete(db, lembar_id)
-    if not data:
-        return None
-    
-    lembar = data['lembar']
-    items = data['items']
-    
-    return {
-        'ref_lembar_id': lembar_id,
-        'tanggal_realisasi': datetime.now().strftime('%Y-%m-%d'),
-        'tanggal_rencana': lembar.get('hari_tanggal'),
-        'unit_kerja': lembar.get('unit_kerja'),
-        'nama_kegiatan': lembar.get('unit_kerja'),  # Use unit_kerja as activity name
-        'sumber_dana': lembar.get('sumber_dana'),
-        
-        # Penandatangan
-        'pelaksana': lembar.get('nama_pengajuan'),
-        'verifikator': lembar.get('nama_verifikator'),
-        'ppk': lembar.get('nama_ppk'),
-        'kpa': lembar.get('nama_kpa'),
-        
-        # Nilai realisasi
-        'anggaran': lembar.get('total', 0),
-        'realisasi': 0,  # Will be filled by actual spending
-        'sisa': 0,  # Calculated: anggaran - realisasi
-        
-        # Detail rincian realisasi
-        'rincian': transform_items_to_realisasi_format(items),
-    }
+    context = get_lembar_context(db, lembar_id)
+    return context.realisasi_format() if context else None
 
 
 def transform_items_to_spj_format(items: List[Dict]) -> List[Dict[str, Any]]:
@@ -546,34 +685,5 @@ def get_lembar_summary(db, lembar_id: int) -> Optional[Dict[str, Any]]:
     Returns:
         Dictionary dengan semua informasi penting lembar
     """
-    data = get_lembar_data_complete(db, lembar_id)
-    if not data:
-        return None
-    
-    lembar = data['lembar']
-    items = data['items']
-    
-    return {
-        'id': lembar_id,
-        'kode_transaksi': lembar.get('kode_transaksi'),
-        'tanggal': lembar.get('hari_tanggal'),
-        'unit_kerja': lembar.get('unit_kerja'),
-        'sumber_dana': lembar.get('sumber_dana'),
-        'status': lembar.get('status'),
-        
-        'jumlah_item': len(items),
-        'subtotal': lembar.get('subtotal', 0),
-        'ppn': lembar.get('ppn', 0),
-        'total': lembar.get('total', 0),
-        
-        'pengajuan_oleh': lembar.get('nama_pengajuan'),
-        'verifikasi_oleh': lembar.get('nama_verifikator'),
-        'ppk': lembar.get('nama_ppk'),
-        'kpa': lembar.get('nama_kpa'),
-        
-        'file': lembar.get('file_path'),
-        'created_at': lembar.get('created_at'),
-        'created_by': lembar.get('created_by'),
-        
-        'items': items,
-    }
+    context = get_lembar_context(db, lembar_id)
+    return context.summary() if context else None
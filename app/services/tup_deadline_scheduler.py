@@ -0,0 +1,114 @@
+"""
+PPK DOCUMENT FACTORY - TUP Deadline Scheduler
+==============================================
+Pengingat batas pertanggungjawaban TUP (H-7, H-3, terlambat).
+
+Setiap check() membaca countdown semua TUP terbuka dengan satu query
+(PencairanManager.get_countdown_tup) lalu hanya mem-publish event
+TOPIC_TUP_DEADLINE untuk transaksi yang baru melewati ambang berikutnya.
+Level terakhir per transaksi disimpan di memori, sehingga check yang
+diulang (saat start, tengah malam, setelah data TUP berubah) tidak
+mengirim pengingat ganda.
+
+Modul ini tidak bergantung pada Qt; penjadwalan (timer tengah malam)
+dilakukan di sisi UI memakai seconds_until_midnight().
+"""
+
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.core.events import TOPIC_TUP_DEADLINE, get_event_bus
+from app.models.pencairan_models import TUP_PENGINGAT_HARI
+
+LEVEL_OVERDUE = "OVERDUE"
+
+
+def seconds_until_midnight(now: datetime = None) -> float:
+    """Detik sampai pergantian hari berikutnya (jadwal check harian)."""
+    now = now or datetime.now()
+    besok = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+    return (besok - now).total_seconds()
+
+
+class TUPDeadlineScheduler:
+    """
+    Evaluasi ambang batas TUP dan publish pengingat sekali per level.
+
+    Level: "H-<n>" untuk setiap ambang (urut dari terbesar), lalu
+    LEVEL_OVERDUE jika batas waktu sudah lewat.
+
+    Usage:
+        scheduler = TUPDeadlineScheduler(db)
+        for reminder in scheduler.check():
+            print(reminder['level'], reminder['kode_transaksi'])
+    """
+
+    def __init__(self, manager, thresholds: Iterable[int] = TUP_PENGINGAT_HARI,
+                 bus=None):
+        self.manager = manager
+        self.thresholds = tuple(sorted(set(thresholds), reverse=True))
+        self._bus = bus or get_event_bus()
+        # transaksi_id -> rank level terakhir (0 = belum masuk ambang)
+        self._notified: Dict[int, int] = {}
+
+    def levels(self) -> List[str]:
+        """Nama level urut dari paling longgar ke terlambat."""
+        return [f"H-{hari}" for hari in self.thresholds] + [LEVEL_OVERDUE]
+
+    def _rank(self, sisa_hari: int) -> int:
+        if sisa_hari < 0:
+            return len(self.thresholds) + 1
+        rank = 0
+        for i, hari in enumerate(self.thresholds, start=1):
+            if sisa_hari <= hari:
+                rank = i
+        return rank
+
+    def check(self, hari_ini: date = None) -> List[Dict[str, Any]]:
+        """
+        Evaluasi semua TUP terbuka dan publish level yang baru tercapai.
+
+        Returns:
+            List pengingat yang di-publish pada check ini
+        """
+        rows = self.manager.get_countdown_tup(hari_ini=hari_ini)
+        levels = self.levels()
+        reminders = []
+        aktif = set()
+
+        for row in rows:
+            tid = row['transaksi_id']
+            aktif.add(tid)
+            rank = self._rank(row['sisa_hari'])
+            if rank <= self._notified.get(tid, 0):
+                # Level turun (mis. tanggal SP2D dikoreksi): ingat level baru
+                self._notified[tid] = rank
+                continue
+            self._notified[tid] = rank
+
+            reminder = dict(row, level=levels[rank - 1])
+            reminders.append(reminder)
+            self._bus.publish(
+                TOPIC_TUP_DEADLINE, reminder['level'], tid, 'TUP',
+                kode_transaksi=row['kode_transaksi'],
+                nama_kegiatan=row['nama_kegiatan'],
+                batas_waktu=row['batas_waktu'],
+                sisa_hari=row['sisa_hari'],
+            )
+
+        # TUP yang sudah selesai/batal tidak perlu dilacak lagi
+        for tid in list(self._notified):
+            if tid not in aktif:
+                del self._notified[tid]
+
+        return reminders
+
+    def reset(self, transaksi_id: Optional[int] = None):
+        """Lupakan pengingat yang sudah dikirim (semua atau satu transaksi)."""
+        if transaksi_id is None:
+            self._notified.clear()
+        else:
+            self._notified.pop(transaksi_id, None)
+
+
+__all__ = ['TUPDeadlineScheduler', 'LEVEL_OVERDUE', 'seconds_until_midnight']
@@ -0,0 +1,252 @@
+"""
+PPK DOCUMENT FACTORY - Template Catalog
+=======================================
+Snapshot status semua template DOCUMENT_TEMPLATES: status (uploaded /
+exists / missing), versi, path, mtime/ukuran dan daftar placeholder.
+
+Tabel template dibaca sekali (di-invalidate saat upload lewat
+TemplateManager). File diperiksa dengan os.stat, paling sering sekali
+per max_age detik. Hanya entry yang mtime/ukurannya berubah yang
+diperbarui, dan placeholder-nya diekstrak ulang saat dibutuhkan. Daftar
+status dan checklist per fase di Template Manager serta resolusi path
+saat generate semuanya memakai snapshot yang sama.
+
+Usage:
+    catalog = get_template_catalog()
+    for item in catalog.status_list():
+        print(item['code'], item['status'])
+    path = catalog.resolve_path('SPK')
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from app.core.config import (
+    DOCUMENT_TEMPLATES, EXCEL_TEMPLATES_DIR, WORD_TEMPLATES_DIR,
+)
+from app.core.database import get_db_manager
+
+STATUS_UPLOADED = 'uploaded'
+STATUS_EXISTS = 'exists'
+STATUS_MISSING = 'missing'
+
+DEFAULT_MAX_AGE = 2.0  # Detik sebelum file diperiksa ulang (os.stat)
+
+Signature = Optional[Tuple[int, int]]  # (mtime_ns, size); None = file tidak ada
+
+
+def _signature(path: Optional[str]) -> Signature:
+    if not path:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+@dataclass
+class TemplateEntry:
+    """Status satu kode dokumen."""
+    code: str
+    name: str
+    type: str
+    path: str                          # Path yang dipakai (upload atau default)
+    version: int = 0
+    uploaded: bool = False
+    uploaded_at: Optional[str] = None
+    signature: Signature = None
+    placeholders: Optional[List[str]] = None  # None = belum diekstrak
+
+    @property
+    def exists(self) -> bool:
+        return self.signature is not None
+
+    @property
+    def status(self) -> str:
+        if self.uploaded:
+            return STATUS_UPLOADED
+        return STATUS_EXISTS if self.exists else STATUS_MISSING
+
+    @property
+    def mtime(self) -> Optional[float]:
+        return self.signature[0] / 1e9 if self.signature else None
+
+    @property
+    def size(self) -> Optional[int]:
+        return self.signature[1] if self.signature else None
+
+    def to_status(self) -> Dict:
+        """Bentuk sama dengan TemplateManager.get_all_templates_status()."""
+        return {
+            'code': self.code,
+            'name': self.name,
+            'type': self.type,
+            'status': self.status,
+            'version': self.version,
+            'filepath': self.path if (self.uploaded or self.exists) else None,
+            'uploaded_at': self.uploaded_at,
+            'mtime': self.mtime,
+            'size': self.size,
+        }
+
+
+class TemplateCatalog:
+    """Katalog template per database dengan deteksi perubahan file."""
+
+    def __init__(self, db=None, max_age: float = DEFAULT_MAX_AGE,
+                 word_dir: str = None, excel_dir: str = None):
+        self.db = db or get_db_manager()
+        self.max_age = max_age
+        self.word_dir = word_dir or WORD_TEMPLATES_DIR
+        self.excel_dir = excel_dir or EXCEL_TEMPLATES_DIR
+        self._lock = threading.RLock()
+        self._entries: Dict[str, TemplateEntry] = {}
+        self._db_dirty = True
+        self._checked_at: Optional[float] = None
+
+    # =========================================================================
+    # REFRESH
+    # =========================================================================
+
+    def invalidate(self):
+        """Baca ulang tabel template pada akses berikutnya (mis. setelah upload)."""
+        with self._lock:
+            self._db_dirty = True
+
+    def _default_path(self, config: Dict) -> str:
+        base = self.word_dir if config['type'] == 'word' else self.excel_dir
+        return os.path.join(base, config['template'])
+
+    def _load_db(self):
+        rows = {row['code']: row for row in self.db.get_all_templates()}
+        entries = {}
+        for code, config in DOCUMENT_TEMPLATES.items():
+            row = rows.get(code)
+            if row:
+                entry = TemplateEntry(code, config['name'], config['type'], row['filepath'],
+                                      version=row['version'], uploaded=True,
+                                      uploaded_at=row.get('uploaded_at'))
+            else:
+                entry = TemplateEntry(code, config['name'], config['type'],
+                                      self._default_path(config))
+            old = self._entries.get(code)
+            if old is not None and old.path == entry.path:
+                # File sama: pertahankan signature & placeholder yang sudah ada
+                entry.signature = old.signature
+                entry.placeholders = old.placeholders
+            else:
+                entry.signature = _signature(entry.path)
+            entries[code] = entry
+        self._entries = entries
+        self._db_dirty = False
+
+    def refresh(self, force: bool = False) -> List[str]:
+        """
+        Perbarui entry yang filenya berubah.
+
+        Returns:
+            Kode template yang berubah (file baru/hilang/dimodifikasi)
+        """
+        with self._lock:
+            now = time.monotonic()
+            reload_db = self._db_dirty
+            if (not force and not reload_db and self._checked_at is not None
+                    and now - self._checked_at < self.max_age):
+                return []
+
+            before = {code: (e.path, e.signature, e.version)
+                      for code, e in self._entries.items()}
+            if reload_db:
+                self._load_db()
+
+            changed = []
+            for code, entry in self._entries.items():
+                signature = _signature(entry.path)
+                if signature != entry.signature:
+                    entry.signature = signature
+                    entry.placeholders = None
+                if before.get(code) != (entry.path, entry.signature, entry.version):
+                    changed.append(code)
+            self._checked_at = now
+            return changed
+
+    # =========================================================================
+    # QUERIES
+    # =========================================================================
+
+    def entries(self) -> List[TemplateEntry]:
+        self.refresh()
+        with self._lock:
+            return list(self._entries.values())
+
+    def get(self, code: str) -> Optional[TemplateEntry]:
+        self.refresh()
+        with self._lock:
+            return self._entries.get(code)
+
+    def status_list(self) -> List[Dict]:
+        """Status semua template (urutan DOCUMENT_TEMPLATES)."""
+        return [entry.to_status() for entry in self.entries()]
+
+    def resolve_path(self, code: str) -> Optional[str]:
+        """
+        Path template untuk generate; None jika kode tidak dikenal.
+
+        Hanya satu os.stat untuk kode ini (tanpa query database), sehingga
+        file yang baru ditambahkan langsung terlihat.
+        """
+        if self._db_dirty or self._checked_at is None:
+            self.refresh()
+        with self._lock:
+            entry = self._entries.get(code)
+            if entry is None:
+                return None
+            signature = _signature(entry.path)
+            if signature != entry.signature:
+                entry.signature = signature
+                entry.placeholders = None
+            return entry.path
+
+    def placeholders(self, code: str) -> List[str]:
+        """Placeholder di file template (diekstrak sekali per versi file)."""
+        entry = self.get(code)
+        if entry is None or not entry.exists:
+            return []
+        if entry.placeholders is None:
+            from app.templates.engine import extract_placeholders
+            entry.placeholders = extract_placeholders(entry.path, entry.type)
+        return list(entry.placeholders)
+
+
+# ============================================================================
+# SINGLETON
+# ============================================================================
+
+_catalogs: Dict[str, TemplateCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_template_catalog(db=None) -> TemplateCatalog:
+    """Katalog bersama per file database."""
+    db = db or get_db_manager()
+    key = os.path.abspath(db.db_path)
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            catalog = TemplateCatalog(db)
+            _catalogs[key] = catalog
+        return catalog
+
+
+__all__ = [
+    'STATUS_UPLOADED',
+    'STATUS_EXISTS',
+    'STATUS_MISSING',
+    'TemplateEntry',
+    'TemplateCatalog',
+    'get_template_catalog',
+]
@@ -22,6 +22,7 @@ from app.core.config import (
     OUTPUT_DIR, TAHUN_ANGGARAN, ALL_PLACEHOLDERS, BULAN_INDONESIA
 )
 from app.core.database import get_db_manager
+from app.core.kalkulasi import format_angka, terbilang
 
 
 # ============================================================================
@@ -30,58 +31,10 @@ from app.core.database import get_db_manager
 
 def format_rupiah(nilai: float, with_prefix: bool = True) -> str:
     """Format angka ke format Rupiah"""
-    if nilai is None:
-        nilai = 0
-    formatted = f"{int(nilai):,}".replace(",", ".")
+    formatted = format_angka(nilai)
     return f"Rp {formatted}" if with_prefix else formatted
 
 
-def format_angka(nilai: float) -> str:
-    """Format angka dengan pemisah ribuan"""
-    if nilai is None:
-        nilai = 0
-    return f"{int(nilai):,}".replace(",", ".")
-
-
-def terbilang(n: float) -> str:
-    """Convert number to Indonesian words"""
-    if n == 0:
-        return "nol rupiah"
-    
-    satuan = ["", "satu", "dua", "tiga", "empat", "lima", 
-              "enam", "tujuh", "delapan", "sembilan", "sepuluh", "sebelas"]
-    
-    def convert(num: int) -> str:
-        num = int(num)
-        if num < 0:
-            return "minus " + convert(-num)
-        elif num < 12:
-            return satuan[num]
-        elif num < 20:
-            return satuan[num - 10] + " belas"
-        elif num < 100:
-            return satuan[num // 10] + " puluh " + satuan[num % 10]
-        elif num < 200:
-            return "seratus " + convert(num - 100)
-        elif num < 1000:
-            return satuan[num // 100] + " ratus " + convert(num % 100)
-        elif num < 2000:
-            return "seribu " + convert(num - 1000)
-        elif num < 1000000:
-            return convert(num // 1000) + " ribu " + convert(num % 1000)
-        elif num < 1000000000:
-            return convert(num // 1000000) + " juta " + convert(num % 1000000)
-        elif num < 1000000000000:
-            return convert(num // 1000000000) + " miliar " + convert(num % 1000000000)
-        else:
-            return convert(num // 1000000000000) + " triliun " + convert(num % 1000000000000)
-    
-    result = convert(n).strip()
-    while "  " in result:
-        result = result.replace("  ", " ")
-    return result.strip() + " rupiah"
-
-
 def format_tanggal(tgl: Any, fmt: str = "long") -> str:
     """Format date to Indonesian format"""
     if tgl is None:
@@ -150,8 +103,8 @@ class TemplateEngine:
     - Table row duplication for items
     """
     
-    def __init__(self):
-        self.db = get_db_manager()
+    def __init__(self, db=None):
+        self.db = db or get_db_manager()
         self.formatters = {
             'rupiah': format_rupiah,
             'angka': format_angka,
@@ -1258,16 +1211,9 @@ class TemplateEngine:
         if not template_config:
             raise ValueError(f"Document type {doc_type} tidak dikenal")
         
-        # Check if custom template exists in database
-        db_template = self.db.get_template(doc_type)
-        
-        if db_template:
-            template_path = db_template['filepath']
-        else:
-            # Use default template
-            template_dir = (WORD_TEMPLATES_DIR if template_config['type'] == 'word' 
-                          else EXCEL_TEMPLATES_DIR)
-            template_path = os.path.join(template_dir, template_config['template'])
+        # Path template dari katalog (upload atau default), tanpa query per generate
+        from app.templates.catalog import get_template_catalog
+        template_path = get_template_catalog(self.db).resolve_path(doc_type)
         
         if not os.path.exists(template_path):
             raise FileNotFoundError(
@@ -1327,8 +1273,17 @@ class TemplateEngine:
             'template_used': template_path,
             'data': data
         })
+        self._register_output(output_path, doc_type, paket_id)
         
         return output_path, nomor
+
+    def _register_output(self, output_path: str, doc_type: str, paket_id: int):
+        """Catat file di index dokumen; kegagalan tidak membatalkan generate."""
+        from app.services.dokumen_index import get_dokumen_index
+        try:
+            get_dokumen_index(self.db.db_path).catat(output_path, doc_type, paket_id=paket_id)
+        except Exception as e:
+            print(f"Warning: Gagal mencatat index dokumen: {e}")
     
     def generate_batch(self, paket_id: int, doc_types: List[str],
                       additional_data: Dict = None) -> List[Tuple[str, str, str]]:
@@ -1355,6 +1310,45 @@ class TemplateEngine:
         return results
 
 
+def extract_placeholders(filepath: str, template_type: str) -> List[str]:
+    """Extract placeholders from template file"""
+    placeholders = set()
+
+    try:
+        if template_type == 'word':
+            doc = Document(filepath)
+
+            # Check paragraphs
+            for para in doc.paragraphs:
+                matches = PLACEHOLDER_PATTERN.findall(para.text)
+                for match in matches:
+                    placeholders.add(match[0])
+
+            # Check tables
+            for table in doc.tables:
+                for row in table.rows:
+                    for cell in row.cells:
+                        for para in cell.paragraphs:
+                            matches = PLACEHOLDER_PATTERN.findall(para.text)
+                            for match in matches:
+                                placeholders.add(match[0])
+
+        else:  # Excel
+            wb = load_workbook(filepath)
+            for ws in wb.worksheets:
+                for row in ws.iter_rows():
+                    for cell in row:
+                        if cell.value and isinstance(cell.value, str):
+                            matches = PLACEHOLDER_PATTERN.findall(cell.value)
+                            for match in matches:
+                                placeholders.add(match[0])
+
+    except Exception as e:
+        print(f"Warning: Could not extract placeholders: {e}")
+
+    return sorted(list(placeholders))
+
+
 # ============================================================================
 # TEMPLATE MANAGER
 # ============================================================================
@@ -1428,6 +1422,9 @@ class TemplateManager:
             'uploaded_by': uploaded_by
         })
         
+        from app.templates.catalog import get_template_catalog
+        get_template_catalog(self.db).invalidate()
+        
         return {
             'success': True,
             'template_id': template_id,
@@ -1438,41 +1435,7 @@ class TemplateManager:
     
     def extract_placeholders(self, filepath: str, template_type: str) -> List[str]:
         """Extract placeholders from template file"""
-        placeholders = set()
-        
-        try:
-            if template_type == 'word':
-                doc = Document(filepath)
-                
-                # Check paragraphs
-                for para in doc.paragraphs:
-                    matches = PLACEHOLDER_PATTERN.findall(para.text)
-                    for match in matches:
-                        placeholders.add(match[0])
-                
-                # Check tables
-                for table in doc.tables:
-                    for row in table.rows:
-                        for cell in row.cells:
-                            for para in cell.paragraphs:
-                                matches = PLACEHOLDER_PATTERN.findall(para.text)
-                                for match in matches:
-                                    placeholders.add(match[0])
-            
-            else:  # Excel
-                wb = load_workbook(filepath)
-                for ws in wb.worksheets:
-                    for row in ws.iter_rows():
-                        for cell in row:
-                            if cell.value and isinstance(cell.value, str):
-                                matches = PLACEHOLDER_PATTERN.findall(cell.value)
-                                for match in matches:
-                                    placeholders.add(match[0])
-        
-        except Exception as e:
-            print(f"Warning: Could not extract placeholders: {e}")
-        
-        return sorted(list(placeholders))
+        return extract_placeholders(filepath, template_type)
     
     def get_template_info(self, doc_type: str) -> Optional[Dict]:
         """Get template information with placeholder details"""
@@ -1500,39 +1463,9 @@ class TemplateManager:
         return template
     
     def get_all_templates_status(self) -> List[Dict]:
-        """Get status of all templates"""
-        from app.core.config import DOCUMENT_TEMPLATES
-        
-        results = []
-        existing = {t['code']: t for t in self.db.get_all_templates()}
-        
-        for code, config in DOCUMENT_TEMPLATES.items():
-            if code in existing:
-                results.append({
-                    'code': code,
-                    'name': config['name'],
-                    'type': config['type'],
-                    'status': 'uploaded',
-                    'version': existing[code]['version'],
-                    'filepath': existing[code]['filepath'],
-                    'uploaded_at': existing[code]['uploaded_at']
-                })
-            else:
-                # Check if default exists
-                template_dir = (WORD_TEMPLATES_DIR if config['type'] == 'word' 
-                              else EXCEL_TEMPLATES_DIR)
-                default_path = os.path.join(template_dir, config['template'])
-                
-                results.append({
-                    'code': code,
-                    'name': config['name'],
-                    'type': config['type'],
-                    'status': 'exists' if os.path.exists(default_path) else 'missing',
-                    'version': 0,
-                    'filepath': default_path if os.path.exists(default_path) else None
-                })
-        
-        return results
+        """Get status of all templates (snapshot dari TemplateCatalog)"""
+        from app.templates.catalog import get_template_catalog
+        return get_template_catalog(self.db).status_list()
 
 
 # ============================================================================
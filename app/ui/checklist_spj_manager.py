@@ -6,10 +6,13 @@ Fitur:
 2. Upload dokumen yang sudah ditandatangani/cap
 3. Tracking status dokumen (draft, signed, archived)
 4. Export checklist ke PDF
+
+File upload disimpan di DocumentStore (berbasis hash isi): file yang sama
+untuk beberapa paket hanya disimpan sekali.
 """
 
 import os
-import shutil
+import sqlite3
 from datetime import datetime, date
 from typing import Dict, List, Optional, Tuple
 
@@ -28,6 +31,8 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.core.database import get_db_manager
+from app.services.document_store import get_document_store
+from app.ui.document_store_worker import StoreFilesThread
 
 
 # =============================================================================
@@ -221,9 +226,11 @@ class ChecklistSPJManager(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.db = get_db_manager()
+        self.store = get_document_store(self.db.db_path)
         self.current_paket_id = None
         self.current_paket = None
         self.checklist_items = {}
+        self._store_thread = None
 
         self.init_ui()
 
@@ -580,6 +587,7 @@ class ChecklistSPJManager(QWidget):
                 'status': status,
                 'filepath': doc_info.get('filepath'),
                 'catatan': doc_info.get('catatan'),
+                'blob_sha256': doc_info.get('blob_sha256'),
             }
 
         self.update_progress()
@@ -590,28 +598,26 @@ class ChecklistSPJManager(QWidget):
             return {}
 
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                SELECT doc_type, status, filepath_signed, catatan
-                FROM checklist_spj
-                WHERE paket_id = ?
-            """, (self.current_paket_id,))
-
-            result = {}
-            for row in cursor.fetchall():
-                result[row[0]] = {
-                    'status': row[1],
-                    'filepath': row[2],
-                    'catatan': row[3],
-                }
-
-            return result
-        except Exception as e:
-            # Tabel mungkin belum ada
+            with self.db.get_connection() as conn:
+                rows = conn.execute("""
+                    SELECT doc_type, status, filepath_signed, catatan, blob_sha256
+                    FROM checklist_spj
+                    WHERE paket_id = ?
+                """, (self.current_paket_id,)).fetchall()
+        except sqlite3.Error as e:
+            QMessageBox.warning(self, "Error", f"Gagal membaca status dokumen SPJ:\n{e}")
             return {}
 
+        return {
+            row['doc_type']: {
+                'status': row['status'],
+                'filepath': row['filepath_signed'],
+                'catatan': row['catatan'],
+                'blob_sha256': row['blob_sha256'],
+            }
+            for row in rows
+        }
+
     def update_progress(self):
         """Update progress bar dan summary"""
         if not self.checklist_items:
@@ -767,111 +773,67 @@ class ChecklistSPJManager(QWidget):
             QMessageBox.warning(self, "Error", "Ukuran file maksimal 10MB!")
             return
 
-        # Copy file ke folder output
-        try:
-            dest_folder = self.get_upload_folder()
-            os.makedirs(dest_folder, exist_ok=True)
-
-            # Generate nama file unik
-            ext = os.path.splitext(filepath)[1]
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            new_filename = f"{kode}_{timestamp}{ext}"
-            dest_path = os.path.join(dest_folder, new_filename)
-
-            shutil.copy2(filepath, dest_path)
-
-            # Simpan ke database
-            self.save_document_status(kode, 'UPLOADED', dest_path)
-
-            # Update UI
-            self.checklist_items[kode]['status'] = 'UPLOADED'
-            self.checklist_items[kode]['filepath'] = dest_path
-
-            # Refresh
-            self.refresh_checklist()
-
-            QMessageBox.information(self, "Sukses", f"Dokumen berhasil diupload!\n{new_filename}")
-
-            # Emit signal
-            self.document_uploaded.emit(self.current_paket_id, kode, dest_path)
-
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Gagal upload dokumen:\n{str(e)}")
-
-    def get_upload_folder(self) -> str:
-        """Dapatkan folder upload untuk paket ini"""
-        from app.core.config import OUTPUT_DIR, TAHUN_ANGGARAN
-
-        paket_kode = self.current_paket.get('kode', 'unknown')
-        paket_nama = self.current_paket.get('nama', 'unknown')[:30]
-
-        # Bersihkan nama folder
-        folder_name = f"{paket_kode}_{paket_nama}".replace(' ', '_')
-        folder_name = "".join(c for c in folder_name if c.isalnum() or c in ('_', '-'))
-
-        return os.path.join(OUTPUT_DIR, str(TAHUN_ANGGARAN), folder_name, "signed_documents")
+        # Hash & simpan ke document store di background
+        if self._store_thread is not None and self._store_thread.isRunning():
+            return
+        self.btn_upload.setEnabled(False)
+        self._store_thread = StoreFilesThread(self.store, [filepath], self)
+        self._store_thread.finished.connect(
+            lambda results, kode=kode: self._on_document_stored(kode, results))
+        self._store_thread.start()
+
+    def _on_document_stored(self, kode: str, results: list):
+        """Simpan rujukan blob setelah file masuk document store"""
+        self._store_thread.wait()
+        self.btn_upload.setEnabled(True)
+        source_path, blob = results[0]
+        if isinstance(blob, Exception):
+            QMessageBox.critical(self, "Error", f"Gagal upload dokumen:\n{str(blob)}")
+            return
 
-    def save_document_status(self, doc_type: str, status: str, filepath: str = None, catatan: str = None):
-        """Simpan status dokumen ke database"""
+        info = self.checklist_items[kode]
+        old_blob = info.get('blob_sha256')
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-
-            # Cek apakah sudah ada
-            cursor.execute("""
-                SELECT id FROM checklist_spj WHERE paket_id = ? AND doc_type = ?
-            """, (self.current_paket_id, doc_type))
-
-            existing = cursor.fetchone()
-
-            if existing:
-                cursor.execute("""
-                    UPDATE checklist_spj
-                    SET status = ?, filepath_signed = ?, catatan = ?, updated_at = CURRENT_TIMESTAMP
-                    WHERE paket_id = ? AND doc_type = ?
-                """, (status, filepath, catatan, self.current_paket_id, doc_type))
-            else:
-                cursor.execute("""
-                    INSERT INTO checklist_spj (paket_id, doc_type, status, filepath_signed, catatan)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (self.current_paket_id, doc_type, status, filepath, catatan))
+            self.save_document_status(kode, 'UPLOADED', blob.path, info.get('catatan'),
+                                      blob_sha256=blob.sha256)
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, "Error", f"Gagal upload dokumen:\n{str(e)}")
+            return
+        if old_blob and old_blob != blob.sha256:
+            self.store.collect_garbage([old_blob])
 
-            conn.commit()
+        # Update UI
+        info['status'] = 'UPLOADED'
+        info['filepath'] = blob.path
+        info['blob_sha256'] = blob.sha256
 
-        except Exception as e:
-            print(f"Error saving document status: {e}")
-            # Mungkin tabel belum ada, buat dulu
-            self.create_checklist_table()
-            # Coba lagi
-            self.save_document_status(doc_type, status, filepath, catatan)
-
-    def create_checklist_table(self):
-        """Buat tabel checklist_spj jika belum ada"""
-        try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS checklist_spj (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    paket_id INTEGER NOT NULL,
-                    doc_type TEXT NOT NULL,
-                    status TEXT DEFAULT 'BELUM',
-                    filepath_signed TEXT,
-                    catatan TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-
-                    FOREIGN KEY (paket_id) REFERENCES paket(id) ON DELETE CASCADE,
-                    UNIQUE(paket_id, doc_type)
-                )
-            """)
+        # Refresh
+        self.refresh_checklist()
 
+        note = "" if blob.baru else "\n(File yang sama sudah tersimpan, tidak disalin ulang)"
+        QMessageBox.information(self, "Sukses",
+                                f"Dokumen berhasil diupload!\n{os.path.basename(source_path)}{note}")
+
+        # Emit signal
+        self.document_uploaded.emit(self.current_paket_id, kode, blob.path)
+
+    def save_document_status(self, doc_type: str, status: str, filepath: str = None,
+                             catatan: str = None, blob_sha256: str = None):
+        """Simpan status dokumen ke database (ref_count blob dijaga trigger)"""
+        with self.db.get_connection() as conn:
+            conn.execute("""
+                INSERT INTO checklist_spj
+                    (paket_id, doc_type, status, filepath_signed, catatan, blob_sha256)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(paket_id, doc_type) DO UPDATE SET
+                    status = excluded.status,
+                    filepath_signed = excluded.filepath_signed,
+                    catatan = excluded.catatan,
+                    blob_sha256 = excluded.blob_sha256,
+                    updated_at = CURRENT_TIMESTAMP
+            """, (self.current_paket_id, doc_type, status, filepath, catatan, blob_sha256))
             conn.commit()
 
-        except Exception as e:
-            print(f"Error creating table: {e}")
-
     def view_document(self):
         """Buka dokumen untuk dilihat"""
         selected = self.tbl_checklist.selectedItems()
@@ -926,16 +888,19 @@ class ChecklistSPJManager(QWidget):
         kode = nama_item.data(Qt.UserRole)
         info = self.checklist_items.get(kode, {})
 
-        # Hapus file
-        filepath = info.get('filepath')
-        if filepath and os.path.exists(filepath):
-            try:
-                os.remove(filepath)
-            except:
-                pass
-
-        # Update database
-        self.save_document_status(kode, 'BELUM', None)
+        # Update database, lalu lepas blob (file dihapus jika tidak dirujuk paket lain)
+        self.save_document_status(kode, 'BELUM', None, info.get('catatan'))
+        blob_sha256 = info.get('blob_sha256')
+        if blob_sha256:
+            self.store.collect_garbage([blob_sha256])
+        else:
+            # File lama (sebelum document store) milik baris ini saja
+            filepath = info.get('filepath')
+            if filepath and os.path.exists(filepath):
+                try:
+                    os.remove(filepath)
+                except OSError:
+                    pass
 
         # Refresh
         self.refresh_checklist()
@@ -957,7 +922,8 @@ class ChecklistSPJManager(QWidget):
             kode,
             info.get('status', 'BELUM'),
             info.get('filepath'),
-            catatan
+            catatan,
+            blob_sha256=info.get('blob_sha256')
         )
 
         self.checklist_items[kode]['catatan'] = catatan
@@ -22,6 +22,7 @@ from PySide6.QtGui import QColor, QFont
 from typing import Dict, Any, List, Optional
 
 from .flow_layout import FlowLayout
+from ..themes import set_role
 
 
 class DokumenItem(QFrame):
@@ -30,18 +31,18 @@ class DokumenItem(QFrame):
     action_clicked = Signal(str, str)  # kode_dokumen, action
 
     STATUS_STYLES = {
-        "pending": {"icon": "?", "color": "#bdc3c7", "text": "Belum dibuat"},
-        "draft": {"icon": "D", "color": "#f39c12", "text": "Draft"},
-        "final": {"icon": "F", "color": "#3498db", "text": "Final"},
-        "signed": {"icon": "S", "color": "#27ae60", "text": "Ditandatangani"},
-        "uploaded": {"icon": "U", "color": "#9b59b6", "text": "Diupload"},
+        "pending": {"icon": "?", "tone": "neutral", "text": "Belum dibuat"},
+        "draft": {"icon": "D", "tone": "warning", "text": "Draft"},
+        "final": {"icon": "F", "tone": "primary", "text": "Final"},
+        "signed": {"icon": "S", "tone": "success", "text": "Ditandatangani"},
+        "uploaded": {"icon": "U", "tone": "accent", "text": "Diupload"},
     }
 
     KATEGORI_STYLES = {
-        "wajib": {"bg": "#fdeaea", "color": "#e74c3c", "text": "Wajib"},
-        "opsional": {"bg": "#e8f6fd", "color": "#3498db", "text": "Opsional"},
-        "upload": {"bg": "#f5eef8", "color": "#9b59b6", "text": "Upload"},
-        "kondisional": {"bg": "#fef5e7", "color": "#f39c12", "text": "Kondisional"},
+        "wajib": {"tone": "danger", "text": "Wajib"},
+        "opsional": {"tone": "primary", "text": "Opsional"},
+        "upload": {"tone": "accent", "text": "Upload"},
+        "kondisional": {"tone": "warning", "text": "Kondisional"},
     }
 
     def __init__(
@@ -70,15 +71,7 @@ class DokumenItem(QFrame):
 
     def _setup_ui(self):
         """Setup item UI."""
-        self.setStyleSheet("""
-            DokumenItem {
-                background-color: #ffffff;
-                border-bottom: 1px solid #f5f6fa;
-            }
-            DokumenItem:hover {
-                background-color: #f8f9fa;
-            }
-        """)
+        set_role(self, "list-item")
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(15, 12, 15, 12)
@@ -93,13 +86,7 @@ class DokumenItem(QFrame):
         self.status_icon = QLabel(status_style["icon"])
         self.status_icon.setFixedSize(28, 28)
         self.status_icon.setAlignment(Qt.AlignCenter)
-        self.status_icon.setStyleSheet(f"""
-            background-color: {status_style['color']};
-            color: white;
-            border-radius: 14px;
-            font-weight: bold;
-            font-size: 12px;
-        """)
+        set_role(self.status_icon, "status-icon", tone=status_style["tone"])
         self.status_icon.setToolTip(status_style["text"])
         top_layout.addWidget(self.status_icon)
 
@@ -112,37 +99,19 @@ class DokumenItem(QFrame):
         name_layout.setSpacing(8)
 
         name_label = QLabel(self.nama)
-        name_label.setStyleSheet("""
-            font-size: 13px;
-            color: #2c3e50;
-            font-weight: 500;
-        """)
+        set_role(name_label, "checklist-nama")
         name_layout.addWidget(name_label)
 
         # Status badge (draft, final, signed, etc.)
         if self.status != "pending":
             status_badge = QLabel(status_style["text"])
-            status_badge.setStyleSheet(f"""
-                background-color: {status_style['color']}20;
-                color: {status_style['color']};
-                border-radius: 8px;
-                padding: 2px 8px;
-                font-size: 10px;
-                font-weight: 500;
-            """)
+            set_role(status_badge, "chip", tone=status_style["tone"])
             name_layout.addWidget(status_badge)
 
         # Kategori badge
         kat_style = self.KATEGORI_STYLES.get(self.kategori, self.KATEGORI_STYLES["wajib"])
         kat_badge = QLabel(kat_style["text"])
-        kat_badge.setStyleSheet(f"""
-            background-color: {kat_style['bg']};
-            color: {kat_style['color']};
-            border-radius: 8px;
-            padding: 2px 8px;
-            font-size: 10px;
-            font-weight: 500;
-        """)
+        set_role(kat_badge, "chip", tone=kat_style["tone"])
         name_layout.addWidget(kat_badge)
         name_layout.addStretch()
 
@@ -151,7 +120,7 @@ class DokumenItem(QFrame):
         # Description
         if self.deskripsi:
             desc_label = QLabel(self.deskripsi)
-            desc_label.setStyleSheet("font-size: 11px; color: #7f8c8d;")
+            set_role(desc_label, "caption")
             info_layout.addWidget(desc_label)
 
         top_layout.addLayout(info_layout, 1)
@@ -177,69 +146,44 @@ class DokumenItem(QFrame):
         if self.kategori == "upload" or self.template is None:
             # Upload-only documents
             if self.status == "pending":
-                self._add_action_btn("upload", "📤 Upload", "#9b59b6")
+                self._add_action_btn("upload", "📤 Upload", "accent")
             else:
-                self._add_action_btn("open", "📂 Buka", "#3498db")
-                self._add_action_btn("upload", "🔄 Ganti", "#95a5a6")
+                self._add_action_btn("open", "📂 Buka", "primary")
+                self._add_action_btn("upload", "🔄 Ganti", "neutral")
         else:
             # Template-based documents
             if self.status == "pending":
                 # Belum dibuat - tombol Buat (akan jadi draft)
-                self._add_action_btn("create", "✏️ Buat Draft", "#27ae60")
-                self._add_action_btn("upload_arsip", "📁 Arsip", "#9b59b6")
+                self._add_action_btn("create", "✏️ Buat Draft", "success")
+                self._add_action_btn("upload_arsip", "📁 Arsip", "accent")
             elif self.status == "draft":
                 # Draft - tombol Buka, Edit/Generate Ulang, Upload TTD
-                self._add_action_btn("open", "📂 Buka", "#3498db")
-                self._add_action_btn("edit", "✏️ Edit", "#f39c12")
-                self._add_action_btn("upload_signed", "📝 Upload TTD", "#27ae60")
+                self._add_action_btn("open", "📂 Buka", "primary")
+                self._add_action_btn("edit", "✏️ Edit", "warning")
+                self._add_action_btn("upload_signed", "📝 Upload TTD", "success")
             elif self.status == "signed":
                 # Sudah di-TTD - tombol Buka, Upload Final
-                self._add_action_btn("open", "📂 Buka", "#3498db")
-                self._add_action_btn("upload_final", "📤 Upload Final", "#9b59b6")
+                self._add_action_btn("open", "📂 Buka", "primary")
+                self._add_action_btn("upload_final", "📤 Upload Final", "accent")
             elif self.status == "uploaded":
                 # Sudah diupload - tombol Buka saja
-                self._add_action_btn("open", "📂 Buka", "#3498db")
-                self._add_action_btn("open_folder", "📁 Folder", "#7f8c8d")
+                self._add_action_btn("open", "📂 Buka", "primary")
+                self._add_action_btn("open_folder", "📁 Folder", "neutral")
             else:  # final
                 # Final - tombol Buka, Edit
-                self._add_action_btn("open", "📂 Buka", "#3498db")
-                self._add_action_btn("edit", "✏️ Edit", "#f39c12")
-                self._add_action_btn("upload_arsip", "📁 Arsip", "#9b59b6")
+                self._add_action_btn("open", "📂 Buka", "primary")
+                self._add_action_btn("edit", "✏️ Edit", "warning")
+                self._add_action_btn("upload_arsip", "📁 Arsip", "accent")
 
-    def _add_action_btn(self, action: str, text: str, color: str):
+    def _add_action_btn(self, action: str, text: str, tone: str):
         """Add action button to FlowLayout."""
         btn = QPushButton(text)
         btn.setFixedHeight(28)
         btn.setCursor(Qt.PointingHandCursor)
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {color};
-                color: white;
-                border: none;
-                padding: 4px 12px;
-                border-radius: 4px;
-                font-size: 11px;
-                font-weight: 500;
-            }}
-            QPushButton:hover {{
-                background-color: {self._darken_color(color)};
-            }}
-        """)
+        set_role(btn, tone=tone, size="small")
         btn.clicked.connect(lambda checked, a=action: self.action_clicked.emit(self.kode, a))
         self.actions_layout.addWidget(btn)
 
-    def _darken_color(self, hex_color: str) -> str:
-        """Darken a hex color."""
-        darken_map = {
-            "#27ae60": "#1e8449",
-            "#f39c12": "#d68910",
-            "#3498db": "#2980b9",
-            "#9b59b6": "#7d3c98",
-            "#95a5a6": "#7f8c8d",
-            "#7f8c8d": "#6c7a7d",
-        }
-        return darken_map.get(hex_color, hex_color)
-
     def set_status(self, status: str, file_path: str = None):
         """Update document status and refresh buttons."""
         self.status = status
@@ -249,13 +193,7 @@ class DokumenItem(QFrame):
         # Update status icon
         status_style = self.STATUS_STYLES.get(self.status, self.STATUS_STYLES["pending"])
         self.status_icon.setText(status_style["icon"])
-        self.status_icon.setStyleSheet(f"""
-            background-color: {status_style['color']};
-            color: white;
-            border-radius: 14px;
-            font-weight: bold;
-            font-size: 12px;
-        """)
+        set_role(self.status_icon, tone=status_style["tone"])
         self.status_icon.setToolTip(status_style["text"])
         
         # Refresh action buttons
@@ -289,13 +227,6 @@ class DokumenChecklist(QFrame):
     def _setup_ui(self):
         """Setup checklist UI."""
         self.setObjectName("dokumenChecklist")
-        self.setStyleSheet("""
-            #dokumenChecklist {
-                background-color: #ffffff;
-                border-radius: 8px;
-                border: 1px solid #ecf0f1;
-            }
-        """)
 
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -303,30 +234,21 @@ class DokumenChecklist(QFrame):
 
         # Header
         header = QFrame()
-        header.setStyleSheet("""
-            background-color: #f8f9fa;
-            border-top-left-radius: 8px;
-            border-top-right-radius: 8px;
-            border-bottom: 1px solid #ecf0f1;
-        """)
+        set_role(header, "card-header")
 
         header_layout = QHBoxLayout(header)
         header_layout.setContentsMargins(15, 12, 15, 12)
 
         # Title
         title = QLabel(f"Dokumen {self.nama_fase}")
-        title.setStyleSheet("""
-            font-size: 14px;
-            font-weight: bold;
-            color: #2c3e50;
-        """)
+        set_role(title, "heading")
         header_layout.addWidget(title)
 
         header_layout.addStretch()
 
         # Progress
         self.progress_label = QLabel("0/0 selesai")
-        self.progress_label.setStyleSheet("font-size: 11px; color: #7f8c8d;")
+        set_role(self.progress_label, "caption")
         header_layout.addWidget(self.progress_label)
 
         # Progress bar
@@ -336,17 +258,7 @@ class DokumenChecklist(QFrame):
         self.progress_bar.setTextVisible(False)
         self.progress_bar.setFixedWidth(80)
         self.progress_bar.setFixedHeight(6)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                background-color: #ecf0f1;
-                border: none;
-                border-radius: 3px;
-            }
-            QProgressBar::chunk {
-                background-color: #27ae60;
-                border-radius: 3px;
-            }
-        """)
+        set_role(self.progress_bar, "thin", tone="success")
         header_layout.addWidget(self.progress_bar)
 
         main_layout.addWidget(header)
@@ -355,12 +267,6 @@ class DokumenChecklist(QFrame):
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-        """)
 
         self.items_container = QWidget()
         self.items_layout = QVBoxLayout(self.items_container)
@@ -369,11 +275,7 @@ class DokumenChecklist(QFrame):
 
         # Empty state
         self.empty_label = QLabel("Tidak ada dokumen untuk fase ini")
-        self.empty_label.setStyleSheet("""
-            font-size: 12px;
-            color: #7f8c8d;
-            padding: 30px;
-        """)
+        set_role(self.empty_label, "empty")
         self.empty_label.setAlignment(Qt.AlignCenter)
         self.items_layout.addWidget(self.empty_label)
 
@@ -400,11 +302,7 @@ class DokumenChecklist(QFrame):
 
         if not dokumen_list:
             self.empty_label = QLabel("Tidak ada dokumen untuk fase ini")
-            self.empty_label.setStyleSheet("""
-                font-size: 12px;
-                color: #7f8c8d;
-                padding: 30px;
-            """)
+            set_role(self.empty_label, "empty")
             self.empty_label.setAlignment(Qt.AlignCenter)
             self.items_layout.addWidget(self.empty_label)
             self._update_progress(0, 0)
@@ -449,23 +347,12 @@ class DokumenChecklist(QFrame):
 
             # Change color based on progress
             if persen == 100:
-                color = "#27ae60"
+                tone = "success"
             elif persen >= 50:
-                color = "#3498db"
+                tone = "primary"
             else:
-                color = "#f39c12"
-
-            self.progress_bar.setStyleSheet(f"""
-                QProgressBar {{
-                    background-color: #ecf0f1;
-                    border: none;
-                    border-radius: 3px;
-                }}
-                QProgressBar::chunk {{
-                    background-color: {color};
-                    border-radius: 3px;
-                }}
-            """)
+                tone = "warning"
+            set_role(self.progress_bar, tone=tone)
         else:
             self.progress_bar.setValue(0)
 
@@ -19,38 +19,16 @@ from PySide6.QtGui import QColor, QFont
 
 from typing import Dict, Any, List, Optional
 
+from ..themes import set_role
+
 
 class FaseStep(QWidget):
     """Individual step dalam stepper."""
 
     clicked = Signal(int)
 
-    STATE_STYLES = {
-        "completed": {
-            "bg": "#27ae60",
-            "border": "#1e8449",
-            "text": "#ffffff",
-            "label": "#27ae60"
-        },
-        "active": {
-            "bg": "#3498db",
-            "border": "#2980b9",
-            "text": "#ffffff",
-            "label": "#3498db"
-        },
-        "pending": {
-            "bg": "#bdc3c7",
-            "border": "#95a5a6",
-            "text": "#ffffff",
-            "label": "#7f8c8d"
-        },
-        "locked": {
-            "bg": "#95a5a6",
-            "border": "#7f8c8d",
-            "text": "#7f8c8d",
-            "label": "#95a5a6"
-        }
-    }
+    # Nilai property "state"; warna per state ada di main.qss
+    STATES = ("completed", "active", "pending", "locked")
 
     def __init__(
         self,
@@ -90,35 +68,13 @@ class FaseStep(QWidget):
 
     def _update_style(self):
         """Update styling based on state."""
-        styles = self.STATE_STYLES.get(self._state, self.STATE_STYLES["pending"])
-
-        # Circle style
-        border_width = "3px" if self._state == "active" else "2px"
-        self.circle.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {styles['bg']};
-                color: {styles['text']};
-                border: {border_width} solid {styles['border']};
-                border-radius: 22px;
-                font-size: 16px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {styles['border']};
-            }}
-        """)
-
-        # Label style
-        font_weight = "bold" if self._state in ["active", "completed"] else "normal"
-        self.label.setStyleSheet(f"""
-            font-size: 11px;
-            color: {styles['label']};
-            font-weight: {font_weight};
-        """)
+        state = self._state if self._state in self.STATES else "pending"
+        set_role(self.circle, "fase-step", state=state)
+        set_role(self.label, "fase-label", state=state)
 
     def set_state(self, state: str):
         """Set step state."""
-        if state in self.STATE_STYLES:
+        if state in self.STATES:
             self._state = state
             self._update_style()
 
@@ -139,11 +95,8 @@ class FaseConnector(QFrame):
 
     def _update_style(self):
         """Update connector style."""
-        color = "#27ae60" if self._completed else "#bdc3c7"
-        self.setStyleSheet(f"""
-            background-color: {color};
-            border-radius: 2px;
-        """)
+        set_role(self, "fase-connector",
+                 state="completed" if self._completed else "pending")
 
     def set_completed(self, completed: bool):
         """Set completion state."""
@@ -179,13 +132,6 @@ class FaseStepper(QFrame):
     def _setup_ui(self):
         """Setup stepper UI."""
         self.setObjectName("faseStepper")
-        self.setStyleSheet("""
-            #faseStepper {
-                background-color: #ffffff;
-                border-radius: 8px;
-                border: 1px solid #ecf0f1;
-            }
-        """)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 15, 20, 15)
@@ -193,12 +139,8 @@ class FaseStepper(QFrame):
 
         # Title
         title = QLabel(f"Progress Workflow {self.mekanisme}")
-        title.setStyleSheet("""
-            font-size: 14px;
-            font-weight: bold;
-            color: #2c3e50;
-            margin-bottom: 15px;
-        """)
+        set_role(title, "heading")
+        title.setContentsMargins(0, 0, 0, 15)
         layout.addWidget(title)
 
         # Stepper row
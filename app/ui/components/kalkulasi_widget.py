@@ -18,51 +18,16 @@ from PySide6.QtWidgets import (
     QScrollArea, QSpinBox, QComboBox, QTableWidget,
     QTableWidgetItem, QHeaderView, QAbstractItemView
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QTimer
 from PySide6.QtGui import QColor, QFont
 
 from typing import Dict, Any, Optional, List
 
+from app.core.kalkulasi import KalkulasiModel, format_rupiah, hitung_selisih
+from ..themes import set_role
 
-def format_rupiah(value: float) -> str:
-    """Format angka ke format Rupiah."""
-    if value is None:
-        return "Rp 0"
-    return f"Rp {value:,.0f}".replace(",", ".")
-
-
-def terbilang(n: float) -> str:
-    """Konversi angka ke terbilang dalam Bahasa Indonesia."""
-    if n == 0:
-        return "nol"
-
-    satuan = ["", "satu", "dua", "tiga", "empat", "lima",
-              "enam", "tujuh", "delapan", "sembilan", "sepuluh", "sebelas"]
-
-    n = int(n)
-
-    if n < 0:
-        return "minus " + terbilang(-n)
-    elif n < 12:
-        return satuan[n]
-    elif n < 20:
-        return satuan[n - 10] + " belas"
-    elif n < 100:
-        return satuan[n // 10] + " puluh " + satuan[n % 10]
-    elif n < 200:
-        return "seratus " + terbilang(n - 100)
-    elif n < 1000:
-        return satuan[n // 100] + " ratus " + terbilang(n % 100)
-    elif n < 2000:
-        return "seribu " + terbilang(n - 1000)
-    elif n < 1000000:
-        return terbilang(n // 1000) + " ribu " + terbilang(n % 1000)
-    elif n < 1000000000:
-        return terbilang(n // 1000000) + " juta " + terbilang(n % 1000000)
-    elif n < 1000000000000:
-        return terbilang(n // 1000000000) + " miliar " + terbilang(n % 1000000000)
-    else:
-        return terbilang(n // 1000000000000) + " triliun " + terbilang(n % 1000000000000)
+# Jeda sebelum tampilan selisih dihitung ulang saat nilai diketik
+CALCULATE_DEBOUNCE_MS = 150
 
 
 class KalkulasiWidget(QFrame):
@@ -77,28 +42,19 @@ class KalkulasiWidget(QFrame):
 
     RESULT_STYLES = {
         "KURANG_BAYAR": {
-            "bg": "#ffffff",
-            "text_bg": "#e74c3c",
-            "color": "#ffffff",
-            "border": "#e74c3c",
+            "tone": "danger",
             "icon": "↑",
             "label": "KURANG BAYAR",
             "action": "Ajukan pembayaran tambahan"
         },
         "LEBIH_BAYAR": {
-            "bg": "#ffffff",
-            "text_bg": "#f39c12",
-            "color": "#ffffff",
-            "border": "#f39c12",
+            "tone": "warning",
             "icon": "↓",
             "label": "LEBIH BAYAR",
             "action": "Kembalikan kelebihan ke kas negara"
         },
         "PAS": {
-            "bg": "#ffffff",
-            "text_bg": "#27ae60",
-            "color": "#ffffff",
-            "border": "#27ae60",
+            "tone": "success",
             "icon": "✓",
             "label": "PAS / NIHIL",
             "action": "Lanjut ke pembuatan SPBY"
@@ -110,20 +66,24 @@ class KalkulasiWidget(QFrame):
         self._uang_muka = 0.0
         self._realisasi = 0.0
         self._show_rincian = show_rincian
-        self._rincian_items = []
+        self._rincian_model = KalkulasiModel()
+
+        self._calculate_timer = QTimer(self)
+        self._calculate_timer.setSingleShot(True)
+        self._calculate_timer.setInterval(CALCULATE_DEBOUNCE_MS)
+        self._calculate_timer.timeout.connect(self._calculate)
 
         self._setup_ui()
+        self._rincian_model.subscribe(self._on_rincian_total_changed)
         self._calculate()
 
+    @property
+    def _rincian_items(self) -> List[Dict]:
+        return self._rincian_model.items
+
     def _setup_ui(self):
         """Setup widget UI."""
         self.setObjectName("kalkulasiWidget")
-        self.setStyleSheet("""
-            #kalkulasiWidget {
-                background-color: #ffffff;
-                border-radius: 8px;
-            }
-        """)
 
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(15, 15, 15, 15)
@@ -131,24 +91,13 @@ class KalkulasiWidget(QFrame):
 
         # ========== SECTION 1: Input Uang Muka & Realisasi ==========
         calc_section = QFrame()
-        calc_section.setStyleSheet("""
-            QFrame {
-                background-color: #f8f9fa;
-                border-radius: 8px;
-                padding: 10px;
-            }
-        """)
+        set_role(calc_section, "panel")
         calc_layout = QVBoxLayout(calc_section)
         calc_layout.setSpacing(10)
 
         # Header
         header = QLabel("💰 Perhitungan Tambah/Kurang")
-        header.setStyleSheet("""
-            font-size: 14px;
-            font-weight: bold;
-            color: #2c3e50;
-            padding: 5px 0;
-        """)
+        set_role(header, "heading")
         calc_layout.addWidget(header)
 
         # Input Grid
@@ -159,7 +108,7 @@ class KalkulasiWidget(QFrame):
 
         # Uang Muka Row
         um_label = QLabel("Uang Muka Diterima:")
-        um_label.setStyleSheet("font-size: 12px; color: #34495e; font-weight: 500;")
+        set_role(um_label, "field-label")
         input_layout.addWidget(um_label, 0, 0)
 
         self.um_input = QDoubleSpinBox()
@@ -168,26 +117,13 @@ class KalkulasiWidget(QFrame):
         self.um_input.setPrefix("Rp ")
         self.um_input.setGroupSeparatorShown(True)
         self.um_input.setMinimumHeight(36)
-        self.um_input.setStyleSheet("""
-            QDoubleSpinBox {
-                background-color: #ffffff;
-                border: 2px solid #3498db;
-                border-radius: 6px;
-                padding: 6px 10px;
-                font-size: 14px;
-                font-weight: bold;
-                color: #2c3e50;
-            }
-            QDoubleSpinBox:focus {
-                border-color: #2980b9;
-            }
-        """)
+        set_role(self.um_input, "amount-input")
         self.um_input.valueChanged.connect(self._on_value_changed)
         input_layout.addWidget(self.um_input, 0, 1)
 
         # Realisasi Row
         real_label = QLabel("Total Realisasi:")
-        real_label.setStyleSheet("font-size: 12px; color: #34495e; font-weight: 500;")
+        set_role(real_label, "field-label")
         input_layout.addWidget(real_label, 1, 0)
 
         self.real_input = QDoubleSpinBox()
@@ -196,47 +132,26 @@ class KalkulasiWidget(QFrame):
         self.real_input.setPrefix("Rp ")
         self.real_input.setGroupSeparatorShown(True)
         self.real_input.setMinimumHeight(36)
-        self.real_input.setStyleSheet("""
-            QDoubleSpinBox {
-                background-color: #ffffff;
-                border: 2px solid #9b59b6;
-                border-radius: 6px;
-                padding: 6px 10px;
-                font-size: 14px;
-                font-weight: bold;
-                color: #2c3e50;
-            }
-            QDoubleSpinBox:focus {
-                border-color: #7d3c98;
-            }
-        """)
+        set_role(self.real_input, "amount-input", tone="accent")
         self.real_input.valueChanged.connect(self._on_value_changed)
         input_layout.addWidget(self.real_input, 1, 1)
 
         # Separator
         separator = QFrame()
         separator.setFrameShape(QFrame.HLine)
-        separator.setStyleSheet("background-color: #bdc3c7;")
+        set_role(separator, "divider")
         separator.setFixedHeight(1)
         input_layout.addWidget(separator, 2, 0, 1, 2)
 
         # Selisih Row
         selisih_label = QLabel("SELISIH:")
-        selisih_label.setStyleSheet("font-size: 13px; color: #2c3e50; font-weight: bold;")
+        set_role(selisih_label, "heading")
         input_layout.addWidget(selisih_label, 3, 0)
 
         self.selisih_display = QLabel("Rp 0")
         self.selisih_display.setMinimumHeight(36)
         self.selisih_display.setAlignment(Qt.AlignCenter)
-        self.selisih_display.setStyleSheet("""
-            font-size: 16px;
-            font-weight: bold;
-            color: #27ae60;
-            padding: 6px 10px;
-            background-color: #e8f8f0;
-            border-radius: 6px;
-            border: 2px solid #27ae60;
-        """)
+        set_role(self.selisih_display, "selisih", tone="success")
         input_layout.addWidget(self.selisih_display, 3, 1)
 
         calc_layout.addWidget(input_frame)
@@ -245,12 +160,7 @@ class KalkulasiWidget(QFrame):
         # ========== SECTION 2: Result Box ==========
         self.result_frame = QFrame()
         self.result_frame.setMinimumHeight(80)
-        self.result_frame.setStyleSheet("""
-            QFrame {
-                background-color: #27ae60;
-                border-radius: 10px;
-            }
-        """)
+        set_role(self.result_frame, "result", tone="success")
 
         result_layout = QVBoxLayout(self.result_frame)
         result_layout.setContentsMargins(15, 12, 15, 12)
@@ -259,22 +169,13 @@ class KalkulasiWidget(QFrame):
         # Result label (status)
         self.result_label = QLabel("✓ PAS / NIHIL")
         self.result_label.setAlignment(Qt.AlignCenter)
-        self.result_label.setStyleSheet("""
-            font-size: 18px;
-            font-weight: bold;
-            color: #ffffff;
-            background-color: transparent;
-        """)
+        set_role(self.result_label, "on-accent")
         result_layout.addWidget(self.result_label)
 
         # Action hint
         self.action_label = QLabel("Lanjut ke pembuatan SPBY")
         self.action_label.setAlignment(Qt.AlignCenter)
-        self.action_label.setStyleSheet("""
-            font-size: 12px;
-            color: rgba(255, 255, 255, 0.9);
-            background-color: transparent;
-        """)
+        set_role(self.action_label, "on-accent-muted")
         result_layout.addWidget(self.action_label)
 
         main_layout.addWidget(self.result_frame)
@@ -283,12 +184,7 @@ class KalkulasiWidget(QFrame):
         self.summary_label = QLabel("Uang muka sama dengan realisasi")
         self.summary_label.setWordWrap(True)
         self.summary_label.setAlignment(Qt.AlignCenter)
-        self.summary_label.setStyleSheet("""
-            font-size: 11px;
-            color: #7f8c8d;
-            padding: 5px;
-            font-style: italic;
-        """)
+        set_role(self.summary_label, "hint")
         main_layout.addWidget(self.summary_label)
 
         # ========== SECTION 4: Rincian (optional) ==========
@@ -300,37 +196,21 @@ class KalkulasiWidget(QFrame):
     def _setup_rincian_section(self, parent_layout):
         """Setup rincian barang/jasa section."""
         rincian_frame = QFrame()
-        rincian_frame.setStyleSheet("""
-            QFrame {
-                background-color: #f8f9fa;
-                border-radius: 8px;
-                padding: 10px;
-            }
-        """)
+        set_role(rincian_frame, "panel")
         rincian_layout = QVBoxLayout(rincian_frame)
         rincian_layout.setSpacing(8)
 
         # Header
         header_layout = QHBoxLayout()
         header = QLabel("📋 Rincian Barang/Jasa")
-        header.setStyleSheet("font-size: 13px; font-weight: bold; color: #2c3e50;")
+        set_role(header, "heading")
         header_layout.addWidget(header)
 
         header_layout.addStretch()
 
         add_btn = QPushButton("+ Tambah")
         add_btn.setCursor(Qt.PointingHandCursor)
-        add_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                padding: 5px 12px;
-                border-radius: 4px;
-                font-size: 11px;
-            }
-            QPushButton:hover { background-color: #2980b9; }
-        """)
+        set_role(add_btn, tone="primary", size="small")
         add_btn.clicked.connect(self._toggle_input_form)
         header_layout.addWidget(add_btn)
 
@@ -345,30 +225,29 @@ class KalkulasiWidget(QFrame):
 
         self.uraian_edit = QLineEdit()
         self.uraian_edit.setPlaceholderText("Uraian")
-        self.uraian_edit.setStyleSheet("padding: 5px; border: 1px solid #ddd; border-radius: 3px;")
+        set_role(self.uraian_edit, "compact")
         form_layout.addWidget(self.uraian_edit, 3)
 
         self.volume_spin = QSpinBox()
         self.volume_spin.setRange(1, 9999)
-        self.volume_spin.setStyleSheet("padding: 5px;")
+        set_role(self.volume_spin, "compact")
         form_layout.addWidget(self.volume_spin)
 
         self.satuan_combo = QComboBox()
         self.satuan_combo.setEditable(True)
         self.satuan_combo.addItems(["pkt", "unit", "bh", "org", "set"])
+        set_role(self.satuan_combo, "compact")
         form_layout.addWidget(self.satuan_combo)
 
         self.harga_spin = QDoubleSpinBox()
         self.harga_spin.setRange(0, 999999999)
         self.harga_spin.setDecimals(0)
         self.harga_spin.setPrefix("Rp ")
+        set_role(self.harga_spin, "compact")
         form_layout.addWidget(self.harga_spin)
 
         add_item_btn = QPushButton("OK")
-        add_item_btn.setStyleSheet("""
-            QPushButton { background-color: #27ae60; color: white; padding: 5px 10px; border-radius: 3px; }
-            QPushButton:hover { background-color: #1e8449; }
-        """)
+        set_role(add_item_btn, tone="success", size="small")
         add_item_btn.clicked.connect(self._add_rincian_item)
         form_layout.addWidget(add_item_btn)
 
@@ -381,10 +260,7 @@ class KalkulasiWidget(QFrame):
         self.rincian_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
         self.rincian_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.rincian_table.setMaximumHeight(120)
-        self.rincian_table.setStyleSheet("""
-            QTableWidget { border: 1px solid #ddd; font-size: 11px; }
-            QHeaderView::section { background-color: #ecf0f1; padding: 4px; font-weight: bold; }
-        """)
+        set_role(self.rincian_table, "compact")
         rincian_layout.addWidget(self.rincian_table)
 
         # Total
@@ -392,15 +268,13 @@ class KalkulasiWidget(QFrame):
         total_layout.addStretch()
 
         del_btn = QPushButton("Hapus")
-        del_btn.setStyleSheet("""
-            QPushButton { background-color: #e74c3c; color: white; padding: 4px 10px; border-radius: 3px; font-size: 10px; }
-        """)
+        set_role(del_btn, tone="danger", size="small")
         del_btn.clicked.connect(self._delete_rincian_item)
         total_layout.addWidget(del_btn)
 
         total_layout.addWidget(QLabel("TOTAL:"))
         self.rincian_total_label = QLabel("Rp 0")
-        self.rincian_total_label.setStyleSheet("font-weight: bold; color: #27ae60;")
+        set_role(self.rincian_total_label, "subheading", tone="success")
         total_layout.addWidget(self.rincian_total_label)
 
         rincian_layout.addLayout(total_layout)
@@ -435,17 +309,13 @@ class KalkulasiWidget(QFrame):
         self.rincian_table.setItem(row, 3, QTableWidgetItem(format_rupiah(harga)))
         self.rincian_table.setItem(row, 4, QTableWidgetItem(format_rupiah(jumlah)))
 
-        # Add to list
-        self._rincian_items.append({
-            'uraian': uraian, 'volume': volume, 'satuan': satuan,
-            'harga_satuan': harga, 'jumlah': jumlah
-        })
-
-        # Clear and update
+        # Clear input
         self.uraian_edit.clear()
         self.volume_spin.setValue(1)
         self.harga_spin.setValue(0)
-        self._update_rincian_total()
+
+        # Add to model (total diperbarui inkremental)
+        self._rincian_model.add_item(uraian, volume, satuan, harga)
 
     def _delete_rincian_item(self):
         """Delete selected rincian."""
@@ -455,26 +325,25 @@ class KalkulasiWidget(QFrame):
         rows = set(item.row() for item in self.rincian_table.selectedItems())
         for row in sorted(rows, reverse=True):
             self.rincian_table.removeRow(row)
-            if row < len(self._rincian_items):
-                self._rincian_items.pop(row)
-        self._update_rincian_total()
+        self._rincian_model.remove_items(rows)
 
-    def _update_rincian_total(self):
-        """Update rincian total."""
+    def _on_rincian_total_changed(self, total: float):
+        """Model listener: update rincian total."""
         if hasattr(self, 'rincian_total_label'):
-            total = sum(item['jumlah'] for item in self._rincian_items)
             self.rincian_total_label.setText(format_rupiah(total))
 
     def _on_value_changed(self):
-        """Handle value change."""
+        """Handle value change; display is recalculated after debounce."""
         self._uang_muka = self.um_input.value()
         self._realisasi = self.real_input.value()
-        self._calculate()
+        self._calculate_timer.start()
         self.nilai_changed.emit()
 
     def _calculate(self):
         """Calculate selisih and update display."""
-        selisih = self._realisasi - self._uang_muka
+        self._calculate_timer.stop()
+        hasil = hitung_selisih(self._uang_muka, self._realisasi)
+        selisih = hasil['selisih']
 
         # Update selisih display
         if selisih >= 0:
@@ -482,59 +351,17 @@ class KalkulasiWidget(QFrame):
         else:
             selisih_text = f"- {format_rupiah(abs(selisih))}"
 
-        # Determine result type
-        if selisih > 0:
-            result_type = "KURANG_BAYAR"
-        elif selisih < 0:
-            result_type = "LEBIH_BAYAR"
-        else:
-            result_type = "PAS"
+        result_type = hasil['status']
 
         style = self.RESULT_STYLES[result_type]
 
-        # Update selisih display
+        # Update selisih display dan result frame (warna dari tone di main.qss)
         self.selisih_display.setText(selisih_text)
-        if result_type == "KURANG_BAYAR":
-            self.selisih_display.setStyleSheet("""
-                font-size: 16px; font-weight: bold; color: #e74c3c;
-                padding: 6px 10px; background-color: #fdeaea;
-                border-radius: 6px; border: 2px solid #e74c3c;
-            """)
-        elif result_type == "LEBIH_BAYAR":
-            self.selisih_display.setStyleSheet("""
-                font-size: 16px; font-weight: bold; color: #f39c12;
-                padding: 6px 10px; background-color: #fef5e7;
-                border-radius: 6px; border: 2px solid #f39c12;
-            """)
-        else:
-            self.selisih_display.setStyleSheet("""
-                font-size: 16px; font-weight: bold; color: #27ae60;
-                padding: 6px 10px; background-color: #e8f8f0;
-                border-radius: 6px; border: 2px solid #27ae60;
-            """)
-
-        # Update result frame - solid color background with white text
-        self.result_frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {style['text_bg']};
-                border-radius: 10px;
-            }}
-        """)
+        set_role(self.selisih_display, tone=style['tone'])
+        set_role(self.result_frame, tone=style['tone'])
 
         self.result_label.setText(f"{style['icon']} {style['label']}")
-        self.result_label.setStyleSheet("""
-            font-size: 18px;
-            font-weight: bold;
-            color: #ffffff;
-            background-color: transparent;
-        """)
-
         self.action_label.setText(style['action'])
-        self.action_label.setStyleSheet("""
-            font-size: 12px;
-            color: rgba(255, 255, 255, 0.9);
-            background-color: transparent;
-        """)
 
         # Update summary
         if selisih > 0:
@@ -577,21 +404,14 @@ class KalkulasiWidget(QFrame):
 
     def get_result(self) -> Dict[str, Any]:
         """Get calculation result."""
-        selisih = self._realisasi - self._uang_muka
-
-        if selisih > 0:
-            status = "KURANG_BAYAR"
-        elif selisih < 0:
-            status = "LEBIH_BAYAR"
-        else:
-            status = "PAS"
+        hasil = hitung_selisih(self._uang_muka, self._realisasi)
 
         return {
             'uang_muka': self._uang_muka,
             'realisasi': self._realisasi,
-            'selisih': selisih,
-            'selisih_abs': abs(selisih),
-            'status': status,
+            'selisih': hasil['selisih'],
+            'selisih_abs': hasil['selisih_abs'],
+            'status': hasil['status'],
             'rincian_items': self._rincian_items,
         }
 
@@ -603,33 +423,3 @@ class KalkulasiWidget(QFrame):
         """Set inputs to readonly mode."""
         self.um_input.setReadOnly(readonly)
         self.real_input.setReadOnly(readonly)
-
-        if readonly:
-            style = """
-                QDoubleSpinBox {
-                    background-color: #f5f6fa;
-                    border: 1px solid #ecf0f1;
-                    border-radius: 6px;
-                    padding: 6px 10px;
-                    font-size: 14px;
-                    color: #7f8c8d;
-                }
-            """
-        else:
-            style = """
-                QDoubleSpinBox {
-                    background-color: #ffffff;
-                    border: 2px solid #3498db;
-                    border-radius: 6px;
-                    padding: 6px 10px;
-                    font-size: 14px;
-                    font-weight: bold;
-                    color: #2c3e50;
-                }
-                QDoubleSpinBox:focus {
-                    border-color: #2980b9;
-                }
-            """
-
-        self.um_input.setStyleSheet(style)
-        self.real_input.setStyleSheet(style)
@@ -17,51 +17,15 @@ from PySide6.QtWidgets import (
     QGraphicsDropShadowEffect, QSizePolicy, QMessageBox,
     QComboBox, QAbstractItemView
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QTimer
 from PySide6.QtGui import QColor, QFont
 
 from typing import Dict, Any, List, Optional
 
+from app.core.kalkulasi import KalkulasiModel, format_rupiah, terbilang
 
-def format_rupiah(value: float) -> str:
-    """Format angka ke format Rupiah."""
-    if value is None:
-        return "Rp 0"
-    return f"Rp {value:,.0f}".replace(",", ".")
-
-
-def terbilang(n: float) -> str:
-    """Konversi angka ke terbilang dalam Bahasa Indonesia."""
-    if n == 0:
-        return "nol rupiah"
-
-    satuan = ["", "satu", "dua", "tiga", "empat", "lima",
-              "enam", "tujuh", "delapan", "sembilan", "sepuluh", "sebelas"]
-
-    n = int(n)
-
-    if n < 0:
-        return "minus " + terbilang(-n)
-    elif n < 12:
-        return satuan[n]
-    elif n < 20:
-        return satuan[n - 10] + " belas"
-    elif n < 100:
-        return satuan[n // 10] + " puluh " + satuan[n % 10]
-    elif n < 200:
-        return "seratus " + terbilang(n - 100)
-    elif n < 1000:
-        return satuan[n // 100] + " ratus " + terbilang(n % 100)
-    elif n < 2000:
-        return "seribu " + terbilang(n - 1000)
-    elif n < 1000000:
-        return terbilang(n // 1000) + " ribu " + terbilang(n % 1000)
-    elif n < 1000000000:
-        return terbilang(n // 1000000) + " juta " + terbilang(n % 1000000)
-    elif n < 1000000000000:
-        return terbilang(n // 1000000000) + " miliar " + terbilang(n % 1000000000)
-    else:
-        return terbilang(n // 1000000000000) + " triliun " + terbilang(n % 1000000000000)
+# Jeda sebelum terbilang dihitung ulang saat total berubah beruntun
+TERBILANG_DEBOUNCE_MS = 150
 
 
 class RincianKalkulasiWidget(QFrame):
@@ -79,11 +43,29 @@ class RincianKalkulasiWidget(QFrame):
     def __init__(self, title: str = "Rincian Barang/Jasa", parent=None):
         super().__init__(parent)
         self._title = title
-        self._items: List[Dict[str, Any]] = []
-        self._total = 0.0
+        self._model = KalkulasiModel()
+
+        self._terbilang_timer = QTimer(self)
+        self._terbilang_timer.setSingleShot(True)
+        self._terbilang_timer.setInterval(TERBILANG_DEBOUNCE_MS)
+        self._terbilang_timer.timeout.connect(self._refresh_terbilang)
 
         self._setup_ui()
         self._add_shadow()
+        self._model.subscribe(self._on_total_changed)
+
+    @property
+    def model(self) -> KalkulasiModel:
+        """Calculation model backing this widget."""
+        return self._model
+
+    @property
+    def _items(self) -> List[Dict[str, Any]]:
+        return self._model.items
+
+    @property
+    def _total(self) -> float:
+        return self._model.total
 
     def _setup_ui(self):
         """Setup widget UI."""
@@ -360,16 +342,6 @@ class RincianKalkulasiWidget(QFrame):
         harga = self.harga_input.value()
         jumlah = volume * harga
 
-        # Add to internal list
-        item = {
-            'uraian': uraian,
-            'volume': volume,
-            'satuan': satuan,
-            'harga_satuan': harga,
-            'jumlah': jumlah,
-        }
-        self._items.append(item)
-
         # Add to table
         row = self.table.rowCount()
         self.table.insertRow(row)
@@ -390,8 +362,8 @@ class RincianKalkulasiWidget(QFrame):
         self.volume_input.setValue(1)
         self.harga_input.setValue(0)
 
-        # Update total
-        self._update_total()
+        # Update model (total diperbarui inkremental)
+        self._model.add_item(uraian, volume, satuan, harga)
 
         # Emit signal
         self.items_changed.emit()
@@ -406,10 +378,8 @@ class RincianKalkulasiWidget(QFrame):
             QMessageBox.information(self, "Info", "Pilih item yang akan dihapus")
             return
 
-        # Remove from internal list (reverse order to maintain indices)
+        # Remove rows (reverse order to maintain indices)
         for row in sorted(selected_rows, reverse=True):
-            if row < len(self._items):
-                self._items.pop(row)
             self.table.removeRow(row)
 
         # Renumber rows
@@ -417,29 +387,25 @@ class RincianKalkulasiWidget(QFrame):
             self.table.setItem(i, 0, QTableWidgetItem(str(i + 1)))
             self.table.item(i, 0).setTextAlignment(Qt.AlignCenter)
 
-        # Update total
-        self._update_total()
+        # Update model
+        self._model.remove_items(selected_rows)
 
         # Emit signal
         self.items_changed.emit()
 
-    def _update_total(self):
-        """Calculate and update total."""
-        self._total = sum(item['jumlah'] for item in self._items)
-        self.total_display.setText(format_rupiah(self._total))
-
-        # Update terbilang
-        terbilang_text = terbilang(self._total).strip()
-        # Capitalize first letter and add "rupiah"
-        if terbilang_text:
-            terbilang_text = terbilang_text[0].upper() + terbilang_text[1:]
-            if not terbilang_text.endswith("rupiah"):
-                terbilang_text += " rupiah"
+    def _on_total_changed(self, total: float):
+        """Model listener: update total now, terbilang after debounce."""
+        self.total_display.setText(format_rupiah(total))
+        self._terbilang_timer.start()
+        self.total_changed.emit(total)
+
+    def _refresh_terbilang(self):
+        """Update terbilang label from current total."""
+        self._terbilang_timer.stop()
+        terbilang_text = terbilang(self._total)
+        terbilang_text = terbilang_text[0].upper() + terbilang_text[1:]
         self.terbilang_label.setText(f"( {terbilang_text} )")
 
-        # Emit signal
-        self.total_changed.emit(self._total)
-
     def get_items(self) -> List[Dict[str, Any]]:
         """Get all items."""
         return self._items.copy()
@@ -456,12 +422,10 @@ class RincianKalkulasiWidget(QFrame):
         """Set items from list."""
         # Clear table
         self.table.setRowCount(0)
-        self._items.clear()
+        items = list(items)
 
         # Add items
         for item in items:
-            self._items.append(item)
-
             row = self.table.rowCount()
             self.table.insertRow(row)
 
@@ -477,13 +441,14 @@ class RincianKalkulasiWidget(QFrame):
                 self.table.item(row, col).setTextAlignment(Qt.AlignCenter)
 
         # Update total
-        self._update_total()
+        self._model.set_items(items)
+        self._refresh_terbilang()
 
     def clear(self):
         """Clear all items."""
         self.table.setRowCount(0)
-        self._items.clear()
-        self._update_total()
+        self._model.clear_items()
+        self._refresh_terbilang()
 
     def get_data_for_kuitansi(self) -> Dict[str, Any]:
         """Get formatted data for kuitansi document."""
@@ -23,6 +23,7 @@ from PySide6.QtGui import QColor, QIcon
 from typing import List, Tuple, Optional
 
 from app.ui.icons.icon_provider import IconProvider
+from app.ui.themes import set_role
 
 
 class QuickActionButton(QPushButton):
@@ -214,13 +215,7 @@ class QuickActionsWidget(QFrame):
     def _setup_ui(self) -> None:
         """Setup widget UI."""
         self.setObjectName("quickActionsWidget")
-        self.setStyleSheet("""
-            QFrame#quickActionsWidget {
-                background-color: #ffffff;
-                border-radius: 8px;
-                border: 1px solid #ecf0f1;
-            }
-        """)
+        set_role(self, "card")
 
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(20, 15, 20, 15)
@@ -229,11 +224,7 @@ class QuickActionsWidget(QFrame):
         # Title (optional)
         if self._show_title:
             title_label = QLabel(self._title)
-            title_label.setStyleSheet("""
-                font-size: 14px;
-                font-weight: bold;
-                color: #2c3e50;
-            """)
+            set_role(title_label, "heading")
             main_layout.addWidget(title_label)
 
         # Buttons container
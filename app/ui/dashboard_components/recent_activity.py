@@ -25,6 +25,8 @@ from PySide6.QtGui import QColor
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
+from app.ui.themes import MEKANISME_TONE, set_role
+
 
 def format_rupiah(value: float) -> str:
     """Format angka ke format Rupiah."""
@@ -58,24 +60,18 @@ class TransactionItemWidget(QFrame):
     Widget untuk satu item transaksi dalam daftar.
 
     Menampilkan badge mekanisme, nama, nilai, status, dan tanggal.
+    Widget dapat dipakai ulang untuk transaksi lain lewat set_data().
     """
 
     clicked = Signal(str)  # transaction_id
 
-    # Color schemes per mekanisme
-    MEKANISME_COLORS = {
-        "UP": {"bg": "#d5f5e3", "text": "#27ae60"},
-        "TUP": {"bg": "#fef5e7", "text": "#f39c12"},
-        "LS": {"bg": "#ebf5fb", "text": "#3498db"},
-    }
-
-    # Status colors
+    # Tone tema per status
     STATUS_COLORS = {
-        "draft": {"bg": "#f8f9fa", "text": "#6c757d", "label": "Draft"},
-        "proses": {"bg": "#fff3cd", "text": "#856404", "label": "Proses"},
-        "selesai": {"bg": "#d4edda", "text": "#155724", "label": "Selesai"},
-        "dibatalkan": {"bg": "#f8d7da", "text": "#721c24", "label": "Dibatalkan"},
-        "pending": {"bg": "#cce5ff", "text": "#004085", "label": "Pending"},
+        "draft": {"tone": "neutral", "label": "Draft"},
+        "proses": {"tone": "warning", "label": "Proses"},
+        "selesai": {"tone": "success", "label": "Selesai"},
+        "dibatalkan": {"tone": "danger", "label": "Dibatalkan"},
+        "pending": {"tone": "primary", "label": "Pending"},
     }
 
     def __init__(
@@ -103,71 +99,44 @@ class TransactionItemWidget(QFrame):
         super().__init__(parent)
 
         self._transaction_id = transaction_id
-        self._mekanisme = mekanisme.upper()
-        self._nama = nama
-        self._nilai = nilai
-        self._status = status.lower()
-        self._tanggal = tanggal
+        self._mekanisme = None
+        self._nama = None
+        self._nilai = None
+        self._status = None
+        self._tanggal = None
 
         self._setup_ui()
+        self.set_data(transaction_id, mekanisme, nama, nilai, status, tanggal)
 
     def _setup_ui(self) -> None:
         """Setup item UI."""
         self.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.setStyleSheet("""
-            TransactionItemWidget {
-                background-color: #ffffff;
-                border: 1px solid #ecf0f1;
-                border-radius: 6px;
-                padding: 5px;
-            }
-            TransactionItemWidget:hover {
-                background-color: #f8f9fa;
-                border-color: #3498db;
-            }
-        """)
+        set_role(self, "activity-item")
 
         layout = QHBoxLayout(self)
         layout.setContentsMargins(12, 10, 12, 10)
         layout.setSpacing(12)
 
         # Badge mekanisme
-        mek_colors = self.MEKANISME_COLORS.get(
-            self._mekanisme,
-            {"bg": "#ecf0f1", "text": "#7f8c8d"}
-        )
-
-        badge = QLabel(self._mekanisme)
-        badge.setFixedWidth(40)
-        badge.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        badge.setStyleSheet(f"""
-            background-color: {mek_colors['bg']};
-            color: {mek_colors['text']};
-            font-size: 11px;
-            font-weight: bold;
-            padding: 4px 8px;
-            border-radius: 4px;
-        """)
-        layout.addWidget(badge)
+        self.badge_label = QLabel()
+        self.badge_label.setFixedWidth(40)
+        self.badge_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self.badge_label)
 
         # Info container (nama + tanggal)
         info_container = QVBoxLayout()
         info_container.setSpacing(2)
 
         # Nama transaksi
-        nama_label = QLabel(self._nama)
-        nama_label.setStyleSheet("""
-            font-size: 13px;
-            font-weight: 500;
-            color: #2c3e50;
-        """)
-        nama_label.setWordWrap(True)
-        info_container.addWidget(nama_label)
+        self.nama_label = QLabel()
+        set_role(self.nama_label, "checklist-nama")
+        self.nama_label.setWordWrap(True)
+        info_container.addWidget(self.nama_label)
 
         # Tanggal
-        tanggal_label = QLabel(format_tanggal(self._tanggal))
-        tanggal_label.setStyleSheet("font-size: 11px; color: #95a5a6;")
-        info_container.addWidget(tanggal_label)
+        self.tanggal_label = QLabel()
+        set_role(self.tanggal_label, "caption")
+        info_container.addWidget(self.tanggal_label)
 
         layout.addLayout(info_container, 1)
 
@@ -177,59 +146,68 @@ class TransactionItemWidget(QFrame):
         right_container.setAlignment(Qt.AlignmentFlag.AlignRight)
 
         # Nilai
-        nilai_label = QLabel(format_rupiah(self._nilai))
-        nilai_label.setStyleSheet("""
-            font-size: 13px;
-            font-weight: bold;
-            color: #2c3e50;
-        """)
-        nilai_label.setAlignment(Qt.AlignmentFlag.AlignRight)
-        right_container.addWidget(nilai_label)
+        self.nilai_label = QLabel()
+        set_role(self.nilai_label, "value")
+        self.nilai_label.setAlignment(Qt.AlignmentFlag.AlignRight)
+        right_container.addWidget(self.nilai_label)
 
         # Status badge
-        status_info = self.STATUS_COLORS.get(
-            self._status,
-            {"bg": "#ecf0f1", "text": "#7f8c8d", "label": self._status.title()}
-        )
-
-        status_label = QLabel(status_info['label'])
-        status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        status_label.setStyleSheet(f"""
-            background-color: {status_info['bg']};
-            color: {status_info['text']};
-            font-size: 10px;
-            font-weight: 500;
-            padding: 2px 8px;
-            border-radius: 3px;
-        """)
-        right_container.addWidget(status_label, 0, Qt.AlignmentFlag.AlignRight)
+        self.status_label = QLabel()
+        self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        right_container.addWidget(self.status_label, 0, Qt.AlignmentFlag.AlignRight)
 
         # Tombol Edit
         edit_btn = QPushButton("Edit")
         edit_btn.setFixedWidth(60)
         edit_btn.setFixedHeight(28)
-        edit_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                font-size: 11px;
-                font-weight: 500;
-                padding: 4px 8px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:pressed {
-                background-color: #1f618d;
-            }
-        """)
+        set_role(edit_btn, tone="primary", size="small")
         edit_btn.clicked.connect(self._on_edit_clicked)
         layout.addWidget(edit_btn)
 
         layout.addLayout(right_container)
 
+    def set_data(
+        self,
+        transaction_id: str,
+        mekanisme: str,
+        nama: str,
+        nilai: float,
+        status: str,
+        tanggal: Any
+    ) -> None:
+        """
+        Patch item dengan data transaksi; hanya label yang berubah diperbarui.
+        """
+        self._transaction_id = transaction_id
+
+        mekanisme = mekanisme.upper()
+        if mekanisme != self._mekanisme:
+            self._mekanisme = mekanisme
+            self.badge_label.setText(mekanisme)
+            set_role(self.badge_label, "chip", tone=MEKANISME_TONE.get(mekanisme, "neutral"))
+
+        if nama != self._nama:
+            self._nama = nama
+            self.nama_label.setText(nama)
+
+        if tanggal != self._tanggal:
+            self._tanggal = tanggal
+            self.tanggal_label.setText(format_tanggal(tanggal))
+
+        if nilai != self._nilai:
+            self._nilai = nilai
+            self.nilai_label.setText(format_rupiah(nilai))
+
+        status = status.lower()
+        if status != self._status:
+            self._status = status
+            status_info = self.STATUS_COLORS.get(
+                status,
+                {"tone": "neutral", "label": status.title()}
+            )
+            self.status_label.setText(status_info['label'])
+            set_role(self.status_label, "chip", tone=status_info['tone'])
+
     def _on_edit_clicked(self) -> None:
         """Handle edit button click."""
         # Emit clicked signal - the parent will handle opening edit dialog
@@ -258,6 +236,8 @@ class RecentActivityWidget(QFrame):
     - Status indicator dengan warna
     - Empty state jika tidak ada transaksi
     - Tombol 'Lihat Semua' di bawah
+    - Refresh berbasis diff per id: item dipakai ulang, diurutkan ulang atau
+      di-patch; item yang tidak terpakai disimpan di pool, bukan dihapus
 
     Signals:
         item_clicked(str): Emitted ketika item diklik, dengan transaction_id
@@ -309,6 +289,7 @@ class RecentActivityWidget(QFrame):
         self._max_items = max_items or self.MAX_ITEMS
         self._transactions: List[Dict[str, Any]] = []
         self._item_widgets: List[TransactionItemWidget] = []
+        self._pool: List[TransactionItemWidget] = []
 
         self._setup_ui()
         self._add_shadow()
@@ -317,13 +298,7 @@ class RecentActivityWidget(QFrame):
     def _setup_ui(self) -> None:
         """Setup widget UI."""
         self.setObjectName("recentActivityWidget")
-        self.setStyleSheet("""
-            QFrame#recentActivityWidget {
-                background-color: #ffffff;
-                border-radius: 8px;
-                border: 1px solid #ecf0f1;
-            }
-        """)
+        set_role(self, "card")
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 15, 20, 15)
@@ -334,25 +309,14 @@ class RecentActivityWidget(QFrame):
 
         # Title
         self.title_label = QLabel(self._title)
-        self.title_label.setStyleSheet("""
-            font-size: 16px;
-            font-weight: bold;
-            color: #2c3e50;
-        """)
+        set_role(self.title_label, "card-title")
         header_layout.addWidget(self.title_label)
 
         header_layout.addStretch()
 
         # Count badge
         self.count_label = QLabel("0")
-        self.count_label.setStyleSheet("""
-            background-color: #3498db;
-            color: white;
-            font-size: 12px;
-            font-weight: bold;
-            padding: 2px 10px;
-            border-radius: 10px;
-        """)
+        set_role(self.count_label, "badge", tone="primary")
         header_layout.addWidget(self.count_label)
 
         layout.addLayout(header_layout)
@@ -362,20 +326,13 @@ class RecentActivityWidget(QFrame):
         self.scroll_area.setWidgetResizable(True)
         self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.scroll_area.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-            QScrollArea > QWidget > QWidget {
-                background-color: transparent;
-            }
-        """)
 
         self.items_container = QWidget()
         self.items_layout = QVBoxLayout(self.items_container)
         self.items_layout.setContentsMargins(0, 0, 0, 0)
         self.items_layout.setSpacing(8)
+        # Stretch to push items to top (items are inserted before it)
+        self.items_layout.addStretch()
 
         self.scroll_area.setWidget(self.items_container)
         layout.addWidget(self.scroll_area, 1)
@@ -386,21 +343,17 @@ class RecentActivityWidget(QFrame):
         empty_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         empty_icon = QLabel("📋")
-        empty_icon.setStyleSheet("font-size: 48px;")
+        set_role(empty_icon, "empty-icon")
         empty_icon.setAlignment(Qt.AlignmentFlag.AlignCenter)
         empty_layout.addWidget(empty_icon)
 
         empty_text = QLabel("Belum ada transaksi")
-        empty_text.setStyleSheet("""
-            font-size: 14px;
-            color: #95a5a6;
-            margin-top: 10px;
-        """)
+        set_role(empty_text, "empty-desc")
         empty_text.setAlignment(Qt.AlignmentFlag.AlignCenter)
         empty_layout.addWidget(empty_text)
 
         empty_subtext = QLabel("Transaksi terbaru akan muncul di sini")
-        empty_subtext.setStyleSheet("font-size: 12px; color: #bdc3c7;")
+        set_role(empty_subtext, "caption")
         empty_subtext.setAlignment(Qt.AlignmentFlag.AlignCenter)
         empty_layout.addWidget(empty_subtext)
 
@@ -409,24 +362,7 @@ class RecentActivityWidget(QFrame):
         # View all button
         self.view_all_btn = QPushButton("Lihat Semua Transaksi")
         self.view_all_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.view_all_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #3498db;
-                border: 1px solid #3498db;
-                padding: 10px 20px;
-                border-radius: 6px;
-                font-weight: 500;
-                font-size: 13px;
-            }
-            QPushButton:hover {
-                background-color: #3498db;
-                color: white;
-            }
-            QPushButton:pressed {
-                background-color: #2980b9;
-            }
-        """)
+        set_role(self.view_all_btn, "outline")
         self.view_all_btn.clicked.connect(self.view_all_clicked.emit)
         layout.addWidget(self.view_all_btn)
 
@@ -453,11 +389,38 @@ class RecentActivityWidget(QFrame):
         self.view_all_btn.show()
 
     def _clear_items(self) -> None:
-        """Clear all item widgets."""
+        """Clear all item widgets (returned to the pool)."""
         for widget in self._item_widgets:
+            self._release_item_widget(widget)
+        self._item_widgets.clear()
+
+    def _acquire_item_widget(self, data: Dict[str, Any]) -> TransactionItemWidget:
+        """Take a pooled item widget (patched with data) or create a new one."""
+        if self._pool:
+            widget = self._pool.pop()
+            self._patch_item_widget(widget, data)
+            return widget
+        return self._create_item_widget(data)
+
+    def _release_item_widget(self, widget: TransactionItemWidget) -> None:
+        """Hide an unused item widget and keep it for reuse."""
+        self.items_layout.removeWidget(widget)
+        widget.hide()
+        if len(self._pool) < self._max_items:
+            self._pool.append(widget)
+        else:
             widget.setParent(None)
             widget.deleteLater()
-        self._item_widgets.clear()
+
+    def _patch_item_widget(self, widget: TransactionItemWidget, data: Dict[str, Any]) -> None:
+        widget.set_data(
+            transaction_id=data.get("id", ""),
+            mekanisme=data.get("mekanisme", "UP"),
+            nama=data.get("nama", "Transaksi"),
+            nilai=data.get("nilai", 0),
+            status=data.get("status", "draft"),
+            tanggal=data.get("tanggal")
+        )
 
     def _create_item_widget(self, data: Dict[str, Any]) -> TransactionItemWidget:
         """
@@ -505,23 +468,37 @@ class RecentActivityWidget(QFrame):
                 }
             ])
         """
-        self._transactions = transactions[:self._max_items] if transactions else []
-
-        # Clear existing items
-        self._clear_items()
+        self._transactions = list(transactions[:self._max_items]) if transactions else []
 
         if not self._transactions:
+            self._clear_items()
             self._show_empty_state()
             return
 
-        # Create item widgets
-        for data in self._transactions:
-            widget = self._create_item_widget(data)
-            self._item_widgets.append(widget)
-            self.items_layout.addWidget(widget)
-
-        # Add stretch to push items to top
-        self.items_layout.addStretch()
+        # Diff by id: reuse existing widgets, patch and reorder in place
+        existing: Dict[Any, List[TransactionItemWidget]] = {}
+        for widget in self._item_widgets:
+            existing.setdefault(widget.get_transaction_id(), []).append(widget)
+
+        new_widgets = []
+        for index, data in enumerate(self._transactions):
+            matches = existing.get(data.get("id", ""))
+            if matches:
+                widget = matches.pop(0)
+                self._patch_item_widget(widget, data)
+            else:
+                widget = self._acquire_item_widget(data)
+
+            if self.items_layout.indexOf(widget) != index:
+                self.items_layout.removeWidget(widget)
+                self.items_layout.insertWidget(index, widget)
+            widget.show()
+            new_widgets.append(widget)
+
+        for matches in existing.values():
+            for widget in matches:
+                self._release_item_widget(widget)
+        self._item_widgets = new_widgets
 
         # Update count and show items
         self.count_label.setText(str(len(self._transactions)))
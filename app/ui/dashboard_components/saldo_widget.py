@@ -19,6 +19,8 @@ from PySide6.QtGui import QColor
 
 from typing import Optional
 
+from app.ui.themes import set_role
+
 # Import batas maksimal UP dari models
 try:
     from app.models.pencairan_models import BATAS_UP_MAKSIMAL
@@ -43,10 +45,10 @@ class SaldoUPWidget(QFrame):
     - Progress bar penggunaan dengan color coding
     - Persentase penggunaan
 
-    Color coding:
-    - Hijau (#27ae60): Penggunaan < 50%
-    - Kuning (#f39c12): Penggunaan 50-80%
-    - Merah (#e74c3c): Penggunaan > 80%
+    Color coding (tone tema):
+    - success (hijau): Penggunaan < 50%
+    - warning (kuning): Penggunaan 50-80%
+    - danger (merah): Penggunaan > 80%
 
     Signals:
         saldo_changed(): Emitted ketika saldo diupdate
@@ -65,10 +67,10 @@ class SaldoUPWidget(QFrame):
     saldo_changed = Signal()
     warning_threshold = Signal()  # Emitted when saldo < 20%
 
-    # Color thresholds
-    COLOR_HEALTHY = "#27ae60"  # Hijau - penggunaan < 50%
-    COLOR_WARNING = "#f39c12"  # Kuning - penggunaan 50-80%
-    COLOR_DANGER = "#e74c3c"   # Merah - penggunaan > 80%
+    # Tone per ambang saldo
+    TONE_HEALTHY = "success"  # Hijau - penggunaan < 50%
+    TONE_WARNING = "warning"  # Kuning - penggunaan 50-80%
+    TONE_DANGER = "danger"    # Merah - penggunaan > 80%
 
     def __init__(self, parent: QWidget = None):
         """
@@ -90,13 +92,7 @@ class SaldoUPWidget(QFrame):
     def _setup_ui(self) -> None:
         """Setup widget UI."""
         self.setObjectName("saldoUPWidget")
-        self.setStyleSheet("""
-            QFrame#saldoUPWidget {
-                background-color: #ffffff;
-                border-radius: 8px;
-                border: 1px solid #ecf0f1;
-            }
-        """)
+        set_role(self, "card")
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 15, 20, 15)
@@ -107,37 +103,21 @@ class SaldoUPWidget(QFrame):
 
         # Title
         title = QLabel("Saldo UP Tersedia")
-        title.setStyleSheet("""
-            font-size: 12px;
-            color: #7f8c8d;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        """)
+        set_role(title, "muted")
         header_layout.addWidget(title)
 
         header_layout.addStretch()
 
         # Percentage label
         self.persen_label = QLabel("100%")
-        self.persen_label.setStyleSheet(f"""
-            font-size: 14px;
-            font-weight: bold;
-            color: {self.COLOR_HEALTHY};
-            background-color: #d5f5e3;
-            padding: 2px 8px;
-            border-radius: 10px;
-        """)
+        set_role(self.persen_label, "chip", tone=self.TONE_HEALTHY, size="large")
         header_layout.addWidget(self.persen_label)
 
         layout.addLayout(header_layout)
 
         # Main value (saldo tersedia)
         self.value_label = QLabel(format_rupiah(self._batas_maksimal))
-        self.value_label.setStyleSheet(f"""
-            font-size: 28px;
-            font-weight: bold;
-            color: {self.COLOR_HEALTHY};
-        """)
+        set_role(self.value_label, "stat-number", tone=self.TONE_HEALTHY, size="medium")
         layout.addWidget(self.value_label)
 
         # Progress bar
@@ -146,7 +126,7 @@ class SaldoUPWidget(QFrame):
         self.progress_bar.setValue(100)
         self.progress_bar.setTextVisible(False)
         self.progress_bar.setFixedHeight(10)
-        self._update_progress_style(self.COLOR_HEALTHY)
+        set_role(self.progress_bar, tone=self.TONE_HEALTHY)
         layout.addWidget(self.progress_bar)
 
         # Details row
@@ -158,11 +138,11 @@ class SaldoUPWidget(QFrame):
         terpakai_container.setSpacing(2)
 
         terpakai_title = QLabel("Terpakai")
-        terpakai_title.setStyleSheet("font-size: 10px; color: #95a5a6;")
+        set_role(terpakai_title, "caption")
         terpakai_container.addWidget(terpakai_title)
 
         self.used_label = QLabel("Rp 0")
-        self.used_label.setStyleSheet("font-size: 13px; font-weight: bold; color: #e74c3c;")
+        set_role(self.used_label, "subheading", tone="danger")
         terpakai_container.addWidget(self.used_label)
 
         details_layout.addLayout(terpakai_container)
@@ -174,12 +154,12 @@ class SaldoUPWidget(QFrame):
         maks_container.setSpacing(2)
 
         maks_title = QLabel("Batas Maksimal")
-        maks_title.setStyleSheet("font-size: 10px; color: #95a5a6;")
+        set_role(maks_title, "caption")
         maks_title.setAlignment(Qt.AlignmentFlag.AlignRight)
         maks_container.addWidget(maks_title)
 
         self.max_label = QLabel(format_rupiah(self._batas_maksimal))
-        self.max_label.setStyleSheet("font-size: 13px; font-weight: bold; color: #2c3e50;")
+        set_role(self.max_label, "subheading")
         self.max_label.setAlignment(Qt.AlignmentFlag.AlignRight)
         maks_container.addWidget(self.max_label)
 
@@ -196,45 +176,22 @@ class SaldoUPWidget(QFrame):
         shadow.setColor(QColor(0, 0, 0, 25))
         self.setGraphicsEffect(shadow)
 
-    def _update_progress_style(self, color: str) -> None:
-        """Update progress bar style with given color."""
-        self.progress_bar.setStyleSheet(f"""
-            QProgressBar {{
-                background-color: #ecf0f1;
-                border: none;
-                border-radius: 5px;
-            }}
-            QProgressBar::chunk {{
-                background-color: {color};
-                border-radius: 5px;
-            }}
-        """)
-
-    def _get_color_for_percentage(self, persen_tersedia: float) -> str:
+    def _get_tone_for_percentage(self, persen_tersedia: float) -> str:
         """
-        Get color based on percentage of remaining saldo.
+        Get tone based on percentage of remaining saldo.
 
         Args:
             persen_tersedia: Percentage of saldo tersedia (0-100)
 
         Returns:
-            Color hex string
+            Nama tone tema (success, warning, danger)
         """
         if persen_tersedia > 50:
-            return self.COLOR_HEALTHY
-        elif persen_tersedia > 20:
-            return self.COLOR_WARNING
-        else:
-            return self.COLOR_DANGER
-
-    def _get_bg_color_for_percentage(self, persen_tersedia: float) -> str:
-        """Get background color for percentage badge."""
-        if persen_tersedia > 50:
-            return "#d5f5e3"  # Light green
+            return self.TONE_HEALTHY
         elif persen_tersedia > 20:
-            return "#fef5e7"  # Light orange
+            return self.TONE_WARNING
         else:
-            return "#fdedec"  # Light red
+            return self.TONE_DANGER
 
     def set_batas_maksimal(self, batas: float) -> None:
         """
@@ -281,32 +238,20 @@ class SaldoUPWidget(QFrame):
         # Clamp to 0-100
         persen_tersedia = max(0, min(100, persen_tersedia))
 
-        # Get color based on percentage
-        color = self._get_color_for_percentage(persen_tersedia)
-        bg_color = self._get_bg_color_for_percentage(persen_tersedia)
+        # Get tone based on percentage
+        tone = self._get_tone_for_percentage(persen_tersedia)
 
         # Update value label
         self.value_label.setText(format_rupiah(self._saldo_tersedia))
-        self.value_label.setStyleSheet(f"""
-            font-size: 28px;
-            font-weight: bold;
-            color: {color};
-        """)
+        set_role(self.value_label, tone=tone)
 
         # Update percentage label
         self.persen_label.setText(f"{persen_tersedia:.0f}%")
-        self.persen_label.setStyleSheet(f"""
-            font-size: 14px;
-            font-weight: bold;
-            color: {color};
-            background-color: {bg_color};
-            padding: 2px 8px;
-            border-radius: 10px;
-        """)
+        set_role(self.persen_label, tone=tone)
 
         # Update progress bar
         self.progress_bar.setValue(int(persen_tersedia))
-        self._update_progress_style(color)
+        set_role(self.progress_bar, tone=tone)
 
         # Update terpakai label
         self.used_label.setText(format_rupiah(self._saldo_terpakai))
@@ -21,6 +21,7 @@ from PySide6.QtGui import QColor
 from typing import Dict, Any, Optional
 
 from app.ui.icons.icon_provider import IconProvider
+from app.ui.themes import MEKANISME_TONE, set_role
 
 
 def format_rupiah(value: float) -> str:
@@ -81,6 +82,7 @@ class MekanismeStatCard(QFrame):
         self.mekanisme = mekanisme.upper()
         self.title = title or self.TITLES.get(self.mekanisme, "Unknown")
         self.colors = self.COLORS.get(self.mekanisme, self.COLORS["UP"])
+        self.tone = MEKANISME_TONE.get(self.mekanisme, "success")
         self._icon_name = self.ICONS.get(self.mekanisme, "wallet")
 
         self._setup_ui()
@@ -94,18 +96,7 @@ class MekanismeStatCard(QFrame):
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
 
         # Styling
-        self.setStyleSheet(f"""
-            MekanismeStatCard {{
-                background-color: #ffffff;
-                border-radius: 8px;
-                border: 1px solid #ecf0f1;
-                border-top: 4px solid {self.colors['primary']};
-            }}
-            MekanismeStatCard:hover {{
-                border-color: {self.colors['primary']};
-                background-color: {self.colors['light']};
-            }}
-        """)
+        set_role(self, "card", tone=self.tone, hover="tint")
 
         # Layout
         layout = QVBoxLayout(self)
@@ -125,11 +116,7 @@ class MekanismeStatCard(QFrame):
 
         # Title
         title_label = QLabel(self.title)
-        title_label.setStyleSheet(f"""
-            font-size: 16px;
-            font-weight: bold;
-            color: #2c3e50;
-        """)
+        set_role(title_label, "card-title")
         header.addWidget(title_label)
         header.addStretch()
 
@@ -141,28 +128,20 @@ class MekanismeStatCard(QFrame):
 
         # Total transaksi (big number)
         self.total_label = QLabel("0")
-        self.total_label.setStyleSheet(f"""
-            font-size: 32px;
-            font-weight: bold;
-            color: {self.colors['primary']};
-        """)
+        set_role(self.total_label, "stat-number", tone=self.tone)
         stats_layout.addWidget(self.total_label, 0, 0)
 
         total_desc = QLabel("Transaksi Aktif")
-        total_desc.setStyleSheet("font-size: 11px; color: #7f8c8d;")
+        set_role(total_desc, "caption")
         stats_layout.addWidget(total_desc, 1, 0)
 
         # Nilai (money)
         self.nilai_label = QLabel("Rp 0")
-        self.nilai_label.setStyleSheet("""
-            font-size: 14px;
-            font-weight: bold;
-            color: #2c3e50;
-        """)
+        set_role(self.nilai_label, "value")
         stats_layout.addWidget(self.nilai_label, 0, 1, Qt.AlignmentFlag.AlignRight)
 
         nilai_desc = QLabel("Total Nilai")
-        nilai_desc.setStyleSheet("font-size: 11px; color: #7f8c8d;")
+        set_role(nilai_desc, "caption")
         stats_layout.addWidget(nilai_desc, 1, 1, Qt.AlignmentFlag.AlignRight)
 
         layout.addLayout(stats_layout)
@@ -173,40 +152,18 @@ class MekanismeStatCard(QFrame):
         self.progress_bar.setValue(0)
         self.progress_bar.setTextVisible(False)
         self.progress_bar.setFixedHeight(6)
-        self.progress_bar.setStyleSheet(f"""
-            QProgressBar {{
-                background-color: #ecf0f1;
-                border: none;
-                border-radius: 3px;
-            }}
-            QProgressBar::chunk {{
-                background-color: {self.colors['primary']};
-                border-radius: 3px;
-            }}
-        """)
+        set_role(self.progress_bar, "thin", tone=self.tone)
         layout.addWidget(self.progress_bar)
 
         # Status text
         self.status_label = QLabel("Belum ada transaksi")
-        self.status_label.setStyleSheet("font-size: 11px; color: #7f8c8d;")
+        set_role(self.status_label, "caption")
         layout.addWidget(self.status_label)
 
         # Action button
         action_btn = QPushButton(f"+ Buat {self.mekanisme} Baru")
         action_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        action_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.colors['primary']};
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 5px;
-                font-weight: 500;
-            }}
-            QPushButton:hover {{
-                background-color: {self.colors['dark']};
-            }}
-        """)
+        set_role(action_btn, tone=self.tone)
         action_btn.clicked.connect(lambda: self.action_clicked.emit(self.mekanisme))
         layout.addWidget(action_btn)
 
@@ -223,19 +180,11 @@ class MekanismeStatCard(QFrame):
             else:
                 # Fallback to text
                 self.icon_label.setText(self.mekanisme[0])
-                self.icon_label.setStyleSheet(f"""
-                    font-size: 18px;
-                    font-weight: bold;
-                    color: {self.colors['primary']};
-                """)
+                set_role(self.icon_label, "card-icon", tone=self.tone)
         except Exception:
             # Fallback to text
             self.icon_label.setText(self.mekanisme[0])
-            self.icon_label.setStyleSheet(f"""
-                font-size: 18px;
-                font-weight: bold;
-                color: {self.colors['primary']};
-            """)
+            set_role(self.icon_label, "card-icon", tone=self.tone)
 
     def _add_shadow(self) -> None:
         """Add drop shadow effect."""
@@ -331,12 +280,7 @@ class StatisticsSection(QWidget):
 
         # Section title (optional, can be hidden)
         self.title_label = QLabel("Statistik Pencairan Dana")
-        self.title_label.setStyleSheet("""
-            font-size: 18px;
-            font-weight: bold;
-            color: #2c3e50;
-            margin-bottom: 10px;
-        """)
+        set_role(self.title_label, "page-title")
         self.title_label.hide()  # Hidden by default
         layout.addWidget(self.title_label)
 
@@ -0,0 +1,76 @@
+"""
+PPK DOCUMENT FACTORY - Data Change Notifier
+============================================
+Jembatan antara event bus core (app.core.events) dan widget Qt.
+
+Event dari manager dikumpulkan lalu dikirim sekali sebagai satu
+ringkasan perubahan setelah jeda singkat (coalescing), sehingga rentetan
+tulis (mis. simpan transaksi + pindah fase + update saldo) hanya memicu
+satu refresh. Event yang di-publish dari worker thread dipindahkan ke
+GUI thread lewat signal antrian Qt.
+"""
+
+from typing import Dict, Iterable, Optional, Set
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from app.core.events import DataChangeEvent, get_event_bus, ALL_TOPICS
+
+COALESCE_MS = 250  # Jeda pengumpulan event sebelum refresh
+
+
+class DataChangeNotifier(QObject):
+    """
+    Kumpulkan DataChangeEvent dan emit changed(dict) sekali per burst.
+
+    Payload changed: {topic: set(mekanisme)}; mekanisme None berarti
+    tidak diketahui (widget sebaiknya me-refresh semua mekanisme).
+
+    Signals:
+        changed(dict): Ringkasan perubahan yang sudah digabung
+    """
+
+    changed = Signal(dict)
+    _event_received = Signal(object)
+
+    def __init__(self, parent=None, topics: Iterable[str] = ALL_TOPICS,
+                 interval_ms: int = COALESCE_MS, bus=None):
+        super().__init__(parent)
+        self._pending: Dict[str, Set[Optional[str]]] = {}
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.flush)
+
+        # AutoConnection: queued jika publish() berasal dari thread lain
+        self._event_received.connect(self._on_event)
+        self._unsubscribe = (bus or get_event_bus()).subscribe(
+            self._event_received.emit, topics
+        )
+        # Notifier milik widget yang dihapus tidak boleh tertinggal di bus
+        self.destroyed.connect(self._unsubscribe)
+
+    def _on_event(self, event: DataChangeEvent):
+        self._pending.setdefault(event.topic, set()).add(event.mekanisme)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def has_pending(self) -> bool:
+        return bool(self._pending)
+
+    def flush(self):
+        """Emit perubahan yang tertunda sekarang juga."""
+        self._timer.stop()
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        self.changed.emit(pending)
+
+    def close(self):
+        """Berhenti berlangganan event bus."""
+        self._timer.stop()
+        self._unsubscribe()
+
+
+__all__ = ['DataChangeNotifier', 'COALESCE_MS']
@@ -8,15 +8,18 @@ Classes:
     UploadDokumenDialog: Dialog untuk upload dokumen
     PaketFormDialog: Dialog untuk membuat/edit paket pengadaan
     GenerateDocumentDialog: Dialog untuk generate dokumen per stage workflow
+    BundleGenerateDialog: Dialog generate dokumen satu DocumentBundle modul
 """
 
 from .dokumen_dialog import DokumenGeneratorDialog, UploadDokumenDialog
 from .paket_form_dialog import PaketFormDialog
 from .generate_document_dialog import GenerateDocumentDialog
+from .bundle_generate_dialog import BundleGenerateDialog
 
 __all__ = [
     'DokumenGeneratorDialog',
     'UploadDokumenDialog',
     'PaketFormDialog',
     'GenerateDocumentDialog',
+    'BundleGenerateDialog',
 ]
@@ -9,6 +9,8 @@ Fitur:
 - Pilih lokasi penyimpanan
 - Progress indicator
 - Auto-backup pada interval tertentu
+- Backup inkremental (hanya file yang berubah)
+- Tutup / buka kembali tahun anggaran (arsip per tahun)
 """
 
 import os
@@ -27,7 +29,11 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, QThread, Signal, QTimer
 from PySide6.QtGui import QFont, QIcon
 
-from app.core.config import DATABASE_PATH, ROOT_DIR
+from app.core.config import DATABASE_PATH, ROOT_DIR, TAHUN_ANGGARAN
+from app.core.audit_writer import flush_all_audit_writers
+from app.services.document_store import get_document_store
+from app.services.fiscal_archive import get_fiscal_archive
+from app.ui.document_store_worker import StoreMaintenanceThread
 
 
 class BackupThread(QThread):
@@ -47,11 +53,19 @@ class BackupThread(QThread):
             # Buat folder backup jika belum ada
             os.makedirs(os.path.dirname(self.backup_path), exist_ok=True)
             
+            # Pastikan audit log yang masih di buffer ikut ter-backup
+            flush_all_audit_writers()
+            
             # Buat ZIP file
             with zipfile.ZipFile(self.backup_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
                 # Add database file
                 self.progress.emit(30)
                 zipf.write(self.db_path, arcname=os.path.basename(self.db_path))
+
+                # Add arsip tahun anggaran yang sudah ditutup
+                db_dir = os.path.dirname(self.db_path)
+                for path in get_fiscal_archive(self.db_path).archived_years().values():
+                    zipf.write(path, arcname=os.path.relpath(path, db_dir))
                 
                 # Add templates folder jika ada
                 templates_path = os.path.join(ROOT_DIR, 'templates')
@@ -76,6 +90,53 @@ class BackupThread(QThread):
             self.finished.emit(False, f"Error saat backup:\n{str(e)}")
 
 
+class IncrementalBackupThread(QThread):
+    """Background thread untuk backup inkremental (database aktif + arsip)."""
+
+    finished = Signal(bool, str)  # Success flag, message
+
+    def __init__(self, db_path: str, backup_dir: str):
+        super().__init__()
+        self.db_path = db_path
+        self.backup_dir = backup_dir
+
+    def run(self):
+        try:
+            report = get_fiscal_archive(self.db_path).backup_incremental(self.backup_dir)
+            self.finished.emit(True, (
+                f"Backup inkremental selesai: {len(report['disalin'])} file disalin "
+                f"({report['bytes'] / (1024 * 1024):.2f} MB), "
+                f"{len(report['dilewati'])} file tidak berubah.\n{self.backup_dir}"
+            ))
+        except Exception as e:
+            self.finished.emit(False, f"Error saat backup inkremental:\n{str(e)}")
+
+
+class ArchiveYearThread(QThread):
+    """Background thread untuk menutup atau membuka kembali tahun anggaran."""
+
+    finished = Signal(bool, str)  # Success flag, message
+
+    def __init__(self, db_path: str, tahun: int, reopen: bool = False):
+        super().__init__()
+        self.db_path = db_path
+        self.tahun = tahun
+        self.reopen = reopen
+
+    def run(self):
+        archive = get_fiscal_archive(self.db_path)
+        try:
+            if self.reopen:
+                counts = archive.reopen_year(self.tahun)
+                message = f"Tahun {self.tahun} dibuka kembali"
+            else:
+                counts = archive.close_year(self.tahun)
+                message = f"Tahun {self.tahun} ditutup dan diarsipkan"
+            self.finished.emit(True, f"{message} ({sum(counts.values())} baris).")
+        except Exception as e:
+            self.finished.emit(False, str(e))
+
+
 class RestoreThread(QThread):
     """Background thread untuk restore database."""
     
@@ -133,6 +194,9 @@ class BackupRestoreDialog(QDialog):
         # Threads
         self.backup_thread = None
         self.restore_thread = None
+        self.incremental_thread = None
+        self.archive_thread = None
+        self.store_thread = None
         
         self._setup_ui()
         self._load_backups()
@@ -154,6 +218,8 @@ class BackupRestoreDialog(QDialog):
         tabs = QTabWidget()
         tabs.addTab(self._create_backup_tab(), "📦 Backup")
         tabs.addTab(self._create_restore_tab(), "♻️ Restore")
+        tabs.addTab(self._create_archive_tab(), "🗄️ Arsip Tahun")
+        tabs.addTab(self._create_document_store_tab(), "📎 File Upload")
         tabs.addTab(self._create_settings_tab(), "⚙️ Pengaturan")
         layout.addWidget(tabs)
         
@@ -227,6 +293,11 @@ class BackupRestoreDialog(QDialog):
         """)
         backup_btn.clicked.connect(self._start_backup)
         layout.addWidget(backup_btn)
+
+        incremental_btn = QPushButton("🔁 Backup Inkremental")
+        incremental_btn.setToolTip("Salin hanya database/arsip yang berubah sejak backup terakhir")
+        incremental_btn.clicked.connect(self._start_incremental_backup)
+        layout.addWidget(incremental_btn)
         
         # Progress bar
         self.backup_progress = QProgressBar()
@@ -313,6 +384,87 @@ class BackupRestoreDialog(QDialog):
         layout.addStretch()
         return widget
     
+    def _create_archive_tab(self) -> QWidget:
+        """Create arsip tahun anggaran tab."""
+        widget = QWidget()
+        layout = QVBoxLayout(widget)
+        layout.setSpacing(10)
+
+        info_label = QLabel(
+            "Tahun anggaran yang ditutup dipindah ke file arsip terpisah. "
+            "Pekerjaan harian hanya memuat tahun berjalan; laporan lintas tahun "
+            "membuka arsip saat dibutuhkan."
+        )
+        info_label.setWordWrap(True)
+        info_label.setStyleSheet("color: #7f8c8d;")
+        layout.addWidget(info_label)
+
+        self.archive_list = QListWidget()
+        layout.addWidget(self.archive_list)
+
+        action_layout = QHBoxLayout()
+        action_layout.addWidget(QLabel("Tahun:"))
+        self.archive_tahun = QSpinBox()
+        self.archive_tahun.setRange(2000, TAHUN_ANGGARAN - 1)
+        self.archive_tahun.setValue(TAHUN_ANGGARAN - 1)
+        action_layout.addWidget(self.archive_tahun)
+
+        close_year_btn = QPushButton("Tutup Tahun")
+        close_year_btn.clicked.connect(self._close_year)
+        action_layout.addWidget(close_year_btn)
+
+        reopen_btn = QPushButton("Buka Kembali")
+        reopen_btn.clicked.connect(self._reopen_year)
+        action_layout.addWidget(reopen_btn)
+        action_layout.addStretch()
+        layout.addLayout(action_layout)
+
+        self.archive_status = QLabel("")
+        self.archive_status.setWordWrap(True)
+        layout.addWidget(self.archive_status)
+
+        self._load_archives()
+        return widget
+
+    def _create_document_store_tab(self) -> QWidget:
+        """Create tab pemeliharaan document store (file upload)."""
+        widget = QWidget()
+        layout = QVBoxLayout(widget)
+        layout.setSpacing(10)
+
+        info_label = QLabel(
+            "Dokumen SPJ bertandatangan dan foto dokumentasi disimpan sekali per "
+            "isi file. File yang tidak dirujuk lagi dibersihkan otomatis setiap "
+            "aplikasi dibuka."
+        )
+        info_label.setWordWrap(True)
+        info_label.setStyleSheet("color: #7f8c8d;")
+        layout.addWidget(info_label)
+
+        self.store_stats_label = QLabel("")
+        self.store_stats_label.setWordWrap(True)
+        layout.addWidget(self.store_stats_label)
+
+        action_layout = QHBoxLayout()
+        self.store_buttons = []
+        for text, task in (("Verifikasi File", 'verify'),
+                           ("Pindahkan File Lama", 'adopt_legacy'),
+                           ("Bersihkan Sekarang", 'collect_garbage')):
+            btn = QPushButton(text)
+            btn.clicked.connect(lambda _checked=False, t=task: self._start_store_task(t))
+            action_layout.addWidget(btn)
+            self.store_buttons.append(btn)
+        action_layout.addStretch()
+        layout.addLayout(action_layout)
+
+        self.store_status = QLabel("")
+        self.store_status.setWordWrap(True)
+        layout.addWidget(self.store_status)
+        layout.addStretch()
+
+        self._load_store_stats()
+        return widget
+
     def _create_settings_tab(self) -> QWidget:
         """Create settings tab."""
         widget = QWidget()
@@ -501,6 +653,136 @@ class BackupRestoreDialog(QDialog):
         
         self.backup_thread.start()
     
+    def _start_incremental_backup(self):
+        """Start incremental backup ke <lokasi backup>/inkremental."""
+        if self.incremental_thread and self.incremental_thread.isRunning():
+            QMessageBox.warning(self, "Info", "Backup sedang berjalan...")
+            return
+
+        backup_dir = os.path.join(self.backup_path, 'inkremental')
+        self.incremental_thread = IncrementalBackupThread(self.db_path, backup_dir)
+        self.incremental_thread.finished.connect(self._on_backup_finished)
+
+        self.backup_status.setVisible(True)
+        self.backup_status.setText("Membuat backup inkremental...")
+        self.backup_status.setStyleSheet("color: #3498db;")
+
+        self.incremental_thread.start()
+
+    def _load_archives(self):
+        """Load daftar tahun anggaran yang sudah diarsipkan."""
+        self.archive_list.clear()
+        for info in get_fiscal_archive(self.db_path).get_archive_info():
+            self.archive_list.addItem(
+                f"{info['tahun']} - {info['jumlah_baris']} baris - ditutup {info['ditutup_at']}"
+            )
+
+    def _close_year(self):
+        """Tutup tahun anggaran terpilih."""
+        tahun = self.archive_tahun.value()
+        reply = QMessageBox.question(
+            self,
+            "Tutup Tahun Anggaran",
+            f"Pindahkan seluruh data tahun {tahun} ke arsip?\n\n"
+            f"Data tetap bisa dibuka kembali dari tab ini.",
+            QMessageBox.Yes | QMessageBox.No
+        )
+        if reply == QMessageBox.Yes:
+            self._start_archive_thread(tahun, reopen=False)
+
+    def _reopen_year(self):
+        """Kembalikan tahun anggaran terpilih dari arsip."""
+        self._start_archive_thread(self.archive_tahun.value(), reopen=True)
+
+    def _start_archive_thread(self, tahun: int, reopen: bool):
+        if self.archive_thread and self.archive_thread.isRunning():
+            QMessageBox.warning(self, "Info", "Proses arsip sedang berjalan...")
+            return
+
+        self.archive_thread = ArchiveYearThread(self.db_path, tahun, reopen)
+        self.archive_thread.finished.connect(self._on_archive_finished)
+        self.archive_status.setText("Memproses...")
+        self.archive_status.setStyleSheet("color: #3498db;")
+        self.archive_thread.start()
+
+    def _on_archive_finished(self, success: bool, message: str):
+        """Handle tutup/buka tahun completion."""
+        self.archive_thread.wait()
+        if success:
+            self.archive_status.setStyleSheet("color: #27ae60;")
+            self.archive_status.setText(f"✅ {message}")
+        else:
+            self.archive_status.setStyleSheet("color: #e74c3c;")
+            self.archive_status.setText(f"❌ {message}")
+        self._load_archives()
+
+    def _load_store_stats(self):
+        """Tampilkan ringkasan deduplikasi document store."""
+        try:
+            stats = get_document_store(self.db_path).stats()
+        except Exception as e:
+            self.store_stats_label.setText(f"Statistik tidak tersedia: {e}")
+            return
+        self.store_stats_label.setText(
+            f"📁 {stats.jumlah_blob} file tersimpan untuk {stats.jumlah_referensi} rujukan\n"
+            f"💾 {stats.ukuran_tersimpan / (1024 * 1024):.2f} MB di disk, "
+            f"hemat {stats.hemat / (1024 * 1024):.2f} MB ({stats.rasio:.1f}x)"
+        )
+
+    def _start_store_task(self, task: str):
+        if self.store_thread and self.store_thread.isRunning():
+            QMessageBox.warning(self, "Info", "Pemeliharaan file upload sedang berjalan...")
+            return
+
+        self.store_thread = StoreMaintenanceThread(get_document_store(self.db_path), task)
+        self.store_thread.finished.connect(self._on_store_task_finished)
+        self.store_thread.failed.connect(self._on_store_task_failed)
+        for btn in self.store_buttons:
+            btn.setEnabled(False)
+        self.store_status.setText("Memproses...")
+        self.store_status.setStyleSheet("color: #3498db;")
+        self.store_thread.start()
+
+    def _on_store_task_finished(self, task: str, result):
+        """Handle verifikasi / migrasi / pembersihan document store."""
+        self.store_thread.wait()
+        if task == 'verify':
+            rusak, hilang = len(result['rusak']), len(result['hilang'])
+            message = f"{result['ok']} file utuh, {rusak} rusak, {hilang} hilang."
+            ok = not rusak and not hilang
+        elif task == 'adopt_legacy':
+            message = f"{result} file lama dipindahkan ke document store."
+            ok = True
+        else:
+            message = (
+                f"{result['dihapus']} file tanpa rujukan dan {result['yatim']} file "
+                f"yatim dihapus ({result['bytes'] / (1024 * 1024):.2f} MB)."
+            )
+            ok = True
+        self._show_store_status(ok, message)
+        self._load_store_stats()
+
+    def done(self, result: int):
+        """Hentikan tugas document store sebelum dialog ditutup."""
+        if self.store_thread and self.store_thread.isRunning():
+            self.store_thread.cancel()
+            self.store_thread.wait()
+        super().done(result)
+
+    def _on_store_task_failed(self, _task: str, message: str):
+        self.store_thread.wait()
+        self._show_store_status(False, message)
+
+    def _show_store_status(self, ok: bool, message: str):
+        for btn in self.store_buttons:
+            btn.setEnabled(True)
+        if ok:
+            self.store_status.setStyleSheet("color: #27ae60;")
+            self.store_status.setText(f"✅ {message}")
+        else:
+            self.store_status.setStyleSheet("color: #e74c3c;")
+            self.store_status.setText(f"❌ {message}")
+
     def _on_backup_progress(self, value: int):
         """Update backup progress."""
         self.backup_progress.setValue(value)
@@ -0,0 +1,225 @@
+"""
+PPK DOCUMENT FACTORY - Bundle Generate Dialog
+=============================================
+Dialog generate dokumen untuk satu DocumentBundle (swakelola, perjalanan
+dinas, jamuan tamu, ...).
+
+Checkbox dibangun dari deklarasi bundle, merge dijalankan BundlePipeline
+di QThread sehingga GUI tetap responsif, dengan progress bar, tombol
+batal, dan laporan hasil yang sama untuk semua modul.
+"""
+
+import os
+import sys
+import threading
+from typing import Dict, List, Sequence, Tuple
+
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QGroupBox, QLabel,
+    QPushButton, QCheckBox, QFrame, QProgressBar, QMessageBox
+)
+from PySide6.QtCore import QThread, Signal
+
+from app.services.document_bundles import BundlePipeline, BundleReport, DocumentBundle
+
+
+class BundleGenerateThread(QThread):
+    """Background thread untuk BundlePipeline.run()."""
+
+    progress = Signal(int, int, str)  # selesai, total, dokumen
+    finished = Signal(object)         # BundleReport
+
+    def __init__(self, pipeline: BundlePipeline, bundle: DocumentBundle,
+                 data: dict, selected: List[str]):
+        super().__init__()
+        self.pipeline = pipeline
+        self.bundle = bundle
+        self.data = data
+        self.selected = selected
+        self.cancel_event = threading.Event()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def run(self):
+        report = self.pipeline.run(self.bundle, self.data, self.selected,
+                                   progress=self.progress.emit,
+                                   cancel_event=self.cancel_event)
+        self.finished.emit(report)
+
+
+class BundleGenerateDialog(QDialog):
+    """
+    Dialog generik: info record, checkbox dokumen bundle, progress.
+
+    Args:
+        bundle: DocumentBundle yang akan di-generate
+        data: Record modul (dict dari database)
+        info_rows: Baris (label, nilai) untuk grup informasi
+        info_title: Judul grup informasi
+        doc_title: Judul grup checkbox dokumen
+    """
+
+    def __init__(self, bundle: DocumentBundle, data: dict,
+                 info_rows: Sequence[Tuple[str, str]] = (), info_title: str = None,
+                 doc_title: str = "Pilih Dokumen yang akan di-generate",
+                 pipeline: BundlePipeline = None, parent=None):
+        super().__init__(parent)
+        self.bundle = bundle
+        self.data = data
+        self.pipeline = pipeline or BundlePipeline()
+        self.report: BundleReport = None
+        self._thread: BundleGenerateThread = None
+        self.checkboxes: Dict[str, QCheckBox] = {}
+
+        self.setWindowTitle(f"Generate Dokumen {bundle.nama}")
+        self.setMinimumWidth(500)
+        self._setup_ui(info_rows, info_title or bundle.nama, doc_title)
+
+    def _setup_ui(self, info_rows, info_title: str, doc_title: str):
+        layout = QVBoxLayout(self)
+
+        # Info
+        info_group = QGroupBox(info_title)
+        info_form = QFormLayout()
+        for label, value in info_rows:
+            info_form.addRow(label, QLabel(str(value)))
+        info_group.setLayout(info_form)
+        layout.addWidget(info_group)
+
+        # Document checkboxes - dari deklarasi bundle
+        doc_group = QGroupBox(doc_title)
+        doc_layout = QVBoxLayout()
+        for doc in self.bundle.documents:
+            chk = QCheckBox(doc.label)
+            chk.setChecked(doc.default_checked)
+            doc_layout.addWidget(chk)
+            self.checkboxes[doc.output_name] = chk
+
+        if self.bundle.notes:
+            line = QFrame()
+            line.setFrameShape(QFrame.HLine)
+            line.setStyleSheet("color: #bdc3c7;")
+            doc_layout.addWidget(line)
+
+            note_label = QLabel("Dokumen pendukung (disiapkan manual):")
+            note_label.setStyleSheet("font-weight: bold; margin-top: 5px;")
+            doc_layout.addWidget(note_label)
+
+            note_items = QLabel("\n".join(f"• {note}" for note in self.bundle.notes))
+            note_items.setStyleSheet("color: #7f8c8d; margin-left: 10px;")
+            doc_layout.addWidget(note_items)
+
+        doc_group.setLayout(doc_layout)
+        layout.addWidget(doc_group)
+
+        # Progress
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+        layout.addWidget(self.progress_bar)
+        self.lbl_status = QLabel()
+        self.lbl_status.setStyleSheet("color: #7f8c8d;")
+        self.lbl_status.setVisible(False)
+        layout.addWidget(self.lbl_status)
+
+        # Buttons
+        btn_layout = QHBoxLayout()
+        btn_layout.addStretch()
+
+        self.btn_generate = QPushButton("🖨️ Generate Dokumen")
+        self.btn_generate.setStyleSheet("background-color: #27ae60; color: white; padding: 10px 20px;")
+        self.btn_generate.clicked.connect(self.generate)
+        btn_layout.addWidget(self.btn_generate)
+
+        self.btn_cancel = QPushButton("Batal")
+        self.btn_cancel.clicked.connect(self._on_cancel)
+        btn_layout.addWidget(self.btn_cancel)
+
+        layout.addLayout(btn_layout)
+
+    # =========================================================================
+    # GENERATE
+    # =========================================================================
+
+    def selected_documents(self) -> List[str]:
+        return [name for name, chk in self.checkboxes.items() if chk.isChecked()]
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.isRunning()
+
+    def generate(self):
+        """Generate dokumen terpilih di background thread."""
+        if self.is_running():
+            return
+        selected = self.selected_documents()
+        if not selected:
+            QMessageBox.warning(self, "Peringatan", "Pilih minimal satu dokumen untuk di-generate!")
+            return
+
+        for chk in self.checkboxes.values():
+            chk.setEnabled(False)
+        self.btn_generate.setEnabled(False)
+        self.progress_bar.setRange(0, len(selected))
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(True)
+        self.lbl_status.setVisible(True)
+
+        self._thread = BundleGenerateThread(self.pipeline, self.bundle, self.data, selected)
+        self._thread.progress.connect(self._on_progress)
+        self._thread.finished.connect(self._on_finished)
+        self._thread.start()
+
+    def _on_progress(self, done: int, total: int, output_name: str):
+        self.progress_bar.setValue(done)
+        if done < total:
+            self.lbl_status.setText(f"Membuat {output_name} ({done + 1}/{total})...")
+
+    def _on_cancel(self):
+        if self.is_running():
+            self._thread.cancel()
+            self.btn_cancel.setEnabled(False)
+            self.lbl_status.setText("Membatalkan setelah dokumen yang sedang diproses...")
+        else:
+            self.reject()
+
+    def _on_finished(self, report: BundleReport):
+        self._thread.wait()
+        self.report = report
+        self.show_report(report)
+
+    def show_report(self, report: BundleReport):
+        """Tampilkan hasil; buka folder output jika ada dokumen yang jadi."""
+        if report.ok:
+            QMessageBox.information(self, "Generate Selesai", report.summary_text())
+            self._open_folder(report.output_folder)
+            self.accept()
+            return
+
+        QMessageBox.warning(self, "Error", report.summary_text())
+        if report.cancelled:
+            self.reject()
+            return
+        for chk in self.checkboxes.values():
+            chk.setEnabled(True)
+        self.btn_generate.setEnabled(True)
+        self.btn_cancel.setEnabled(True)
+        self.progress_bar.setVisible(False)
+        self.lbl_status.setVisible(False)
+
+    def _open_folder(self, folder: str):
+        if sys.platform == 'win32':
+            os.startfile(folder)
+        elif sys.platform == 'darwin':
+            os.system(f'open "{folder}"')
+        else:
+            os.system(f'xdg-open "{folder}"')
+
+    def done(self, result: int):
+        # Jangan tutup dialog selagi thread masih menulis file
+        if self.is_running():
+            self._thread.cancel()
+            self._thread.wait()
+        super().done(result)
+
+
+__all__ = ['BundleGenerateDialog', 'BundleGenerateThread']
@@ -764,6 +764,7 @@ class UploadDokumenDialog(QDialog):
             dest = output_folder / f"{self.kode_dokumen}{suffix}_{timestamp}{src.suffix}"
 
             shutil.copy2(src, dest)
+            generator.register_document(dest, self.kode_dokumen, self.transaksi)
 
             QMessageBox.information(
                 self,
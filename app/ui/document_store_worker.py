@@ -0,0 +1,87 @@
+"""
+PPK DOCUMENT FACTORY - Document Store Worker
+============================================
+QThread yang meng-hash dan menyimpan file upload ke DocumentStore, agar
+GUI tidak membeku saat file besar (scan PDF, foto 20MB) diproses, serta
+menjalankan tugas pemeliharaan store (garbage collection, verifikasi,
+migrasi file lama) di background.
+"""
+
+import threading
+from typing import List
+
+from PySide6.QtCore import QThread, Signal
+
+from app.services.document_store import DocumentStore
+
+
+class StoreFilesThread(QThread):
+    """
+    Simpan beberapa file ke store di background.
+
+    finished membawa list hasil sesuai urutan input: (source_path,
+    StoredBlob) untuk yang berhasil atau (source_path, Exception).
+    """
+
+    progress = Signal(int, int, str)  # selesai, total, file
+    finished = Signal(list)
+
+    def __init__(self, store: DocumentStore, paths: List[str], parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.paths = list(paths)
+
+    def run(self):
+        results = []
+        total = len(self.paths)
+        for i, path in enumerate(self.paths):
+            self.progress.emit(i, total, path)
+            try:
+                results.append((path, self.store.put(path)))
+            except Exception as e:
+                results.append((path, e))
+        self.progress.emit(total, total, "")
+        self.finished.emit(results)
+
+
+class StoreMaintenanceThread(QThread):
+    """
+    Jalankan satu tugas pemeliharaan DocumentStore di background.
+
+    Tugas: 'collect_garbage' (pass penuh), 'verify', 'adopt_legacy' atau
+    'stats'. finished membawa (tugas, hasil); failed membawa (tugas, pesan).
+    collect_garbage bisa dihentikan lewat cancel(); pass yang dibatalkan
+    tidak meng-emit finished.
+    """
+
+    TASKS = ('collect_garbage', 'verify', 'adopt_legacy', 'stats')
+
+    finished = Signal(str, object)
+    failed = Signal(str, str)
+
+    def __init__(self, store: DocumentStore, task: str, parent=None):
+        super().__init__(parent)
+        if task not in self.TASKS:
+            raise ValueError(f"Tugas document store tidak dikenal: {task}")
+        self.store = store
+        self.task = task
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        """Minta collect_garbage berhenti di blob/file berikutnya."""
+        self._cancel.set()
+
+    def run(self):
+        try:
+            if self.task == 'collect_garbage':
+                result = self.store.collect_garbage(cancel=self._cancel)
+            else:
+                result = getattr(self.store, self.task)()
+        except Exception as e:
+            self.failed.emit(self.task, str(e))
+            return
+        if not self._cancel.is_set():
+            self.finished.emit(self.task, result)
+
+
+__all__ = ['StoreFilesThread', 'StoreMaintenanceThread']
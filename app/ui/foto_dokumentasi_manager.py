@@ -7,10 +7,12 @@ Fitur:
 3. Tagging lokasi dan waktu
 4. Watermark otomatis dengan info paket
 5. Generate laporan foto dokumentasi
+
+Foto disimpan di DocumentStore (berbasis hash isi): foto yang sama untuk
+beberapa paket/jenis hanya disimpan sekali.
 """
 
 import os
-import shutil
 from datetime import datetime, date
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
@@ -31,6 +33,8 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.core.database import get_db_manager
+from app.services.document_store import get_document_store
+from app.ui.document_store_worker import StoreFilesThread
 
 
 # =============================================================================
@@ -315,57 +319,59 @@ class FotoDokumentasiManager(QWidget):
         self.jenis = jenis
         self.current_foto_id = None
         self.foto_list = []
+        self._store_thread = None
 
         self.init_database()
+        self.store = get_document_store(self.db.db_path)
         self.init_ui()
         self.load_photos()
 
     def init_database(self):
         """Pastikan tabel foto_dokumentasi ada"""
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
+            with self.db.get_connection() as conn:
+                cursor = conn.cursor()
 
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS foto_dokumentasi (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    paket_id INTEGER NOT NULL,
-                    jenis TEXT NOT NULL,
-                    kategori TEXT DEFAULT 'LAINNYA',
-                    filepath TEXT NOT NULL,
-                    filename TEXT,
-                    keterangan TEXT,
-
-                    -- Metadata EXIF
-                    waktu_foto TIMESTAMP,
-                    latitude REAL,
-                    longitude REAL,
-                    altitude REAL,
-                    camera_make TEXT,
-                    camera_model TEXT,
-
-                    -- Dimensi
-                    width INTEGER,
-                    height INTEGER,
-
-                    -- Tracking
-                    urutan INTEGER DEFAULT 0,
-                    is_cover INTEGER DEFAULT 0,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    uploaded_by TEXT,
-
-                    FOREIGN KEY (paket_id) REFERENCES paket(id) ON DELETE CASCADE
-                )
-            """)
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS foto_dokumentasi (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        paket_id INTEGER NOT NULL,
+                        jenis TEXT NOT NULL,
+                        kategori TEXT DEFAULT 'LAINNYA',
+                        filepath TEXT NOT NULL,
+                        filename TEXT,
+                        keterangan TEXT,
+
+                        -- Metadata EXIF
+                        waktu_foto TIMESTAMP,
+                        latitude REAL,
+                        longitude REAL,
+                        altitude REAL,
+                        camera_make TEXT,
+                        camera_model TEXT,
+
+                        -- Dimensi
+                        width INTEGER,
+                        height INTEGER,
+
+                        -- Tracking
+                        urutan INTEGER DEFAULT 0,
+                        is_cover INTEGER DEFAULT 0,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        uploaded_by TEXT,
+
+                        FOREIGN KEY (paket_id) REFERENCES paket(id) ON DELETE CASCADE
+                    )
+                """)
 
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_foto_paket ON foto_dokumentasi(paket_id)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_foto_jenis ON foto_dokumentasi(jenis)
-            """)
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_foto_paket ON foto_dokumentasi(paket_id)
+                """)
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_foto_jenis ON foto_dokumentasi(jenis)
+                """)
 
-            conn.commit()
+                conn.commit()
         except Exception as e:
             print(f"Error creating foto_dokumentasi table: {e}")
 
@@ -564,25 +570,21 @@ class FotoDokumentasiManager(QWidget):
     def load_photos(self):
         """Load foto dari database"""
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                SELECT * FROM foto_dokumentasi
-                WHERE paket_id = ? AND jenis = ?
-                ORDER BY urutan, created_at
-            """, (self.paket_id, self.jenis))
-
-            columns = [desc[0] for desc in cursor.description]
-            self.foto_list = [dict(zip(columns, row)) for row in cursor.fetchall()]
-
-            self.refresh_gallery()
-            self.update_summary()
+            with self.db.get_connection() as conn:
+                cursor = conn.execute("""
+                    SELECT * FROM foto_dokumentasi
+                    WHERE paket_id = ? AND jenis = ?
+                    ORDER BY urutan, created_at
+                """, (self.paket_id, self.jenis))
+                self.foto_list = [dict(row) for row in cursor.fetchall()]
 
         except Exception as e:
             print(f"Error loading photos: {e}")
             self.foto_list = []
 
+        self.refresh_gallery()
+        self.update_summary()
+
     def refresh_gallery(self):
         """Refresh tampilan gallery"""
         # Clear existing widgets
@@ -674,31 +676,44 @@ class FotoDokumentasiManager(QWidget):
         kategori = cmb.currentData()
         keterangan = txt_ket.toPlainText()
 
-        # Process each photo
-        success_count = 0
+        # Validate file size (max 20MB)
+        valid_paths = []
         for filepath in filepaths:
-            try:
-                # Validate file size (max 20MB)
-                if os.path.getsize(filepath) > 20 * 1024 * 1024:
-                    QMessageBox.warning(self, "Peringatan", f"File terlalu besar (>20MB):\n{os.path.basename(filepath)}")
-                    continue
+            if os.path.getsize(filepath) > 20 * 1024 * 1024:
+                QMessageBox.warning(self, "Peringatan", f"File terlalu besar (>20MB):\n{os.path.basename(filepath)}")
+                continue
+            valid_paths.append(filepath)
+        if not valid_paths:
+            return
 
+        # Hash & simpan ke document store di background
+        if self._store_thread is not None and self._store_thread.isRunning():
+            return
+        self.btn_upload.setEnabled(False)
+        self.btn_upload.setText("⏳ Memproses foto...")
+        self._store_thread = StoreFilesThread(self.store, valid_paths, self)
+        self._store_thread.finished.connect(
+            lambda results: self._on_photos_stored(results, kategori, keterangan))
+        self._store_thread.start()
+
+    def _on_photos_stored(self, results: list, kategori: str, keterangan: str):
+        """Catat foto yang sudah masuk document store"""
+        self._store_thread.wait()
+        self.btn_upload.setEnabled(True)
+        self.btn_upload.setText("📤 Upload Foto")
+
+        success_count = 0
+        for filepath, blob in results:
+            if isinstance(blob, Exception):
+                print(f"Error uploading {filepath}: {blob}")
+                continue
+            try:
                 # Extract metadata
                 metadata = extract_exif_metadata(filepath)
 
-                # Copy to output folder
-                dest_folder = self.get_photo_folder()
-                os.makedirs(dest_folder, exist_ok=True)
-
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                ext = os.path.splitext(filepath)[1]
-                new_filename = f"{self.jenis}_{kategori}_{timestamp}_{success_count}{ext}"
-                dest_path = os.path.join(dest_folder, new_filename)
-
-                shutil.copy2(filepath, dest_path)
-
                 # Save to database
-                self.save_photo_to_db(dest_path, new_filename, kategori, keterangan, metadata)
+                self.save_photo_to_db(blob.path, os.path.basename(filepath), kategori,
+                                      keterangan, metadata, blob_sha256=blob.sha256)
 
                 success_count += 1
 
@@ -710,24 +725,10 @@ class FotoDokumentasiManager(QWidget):
             self.load_photos()
             self.photos_changed.emit()
 
-    def get_photo_folder(self) -> str:
-        """Get folder for storing photos"""
-        from app.core.config import OUTPUT_DIR, TAHUN_ANGGARAN
-
-        paket = self.db.get_paket(self.paket_id)
-        paket_kode = paket.get('kode', 'unknown') if paket else 'unknown'
-        paket_nama = (paket.get('nama', 'unknown')[:30] if paket else 'unknown')
-
-        folder_name = f"{paket_kode}_{paket_nama}".replace(' ', '_')
-        folder_name = "".join(c for c in folder_name if c.isalnum() or c in ('_', '-'))
-
-        return os.path.join(OUTPUT_DIR, str(TAHUN_ANGGARAN), folder_name, "foto_dokumentasi", self.jenis)
-
     def save_photo_to_db(self, filepath: str, filename: str, kategori: str,
-                         keterangan: str, metadata: FotoMetadata):
-        """Save photo info to database"""
-        try:
-            conn = self.db.get_connection()
+                         keterangan: str, metadata: FotoMetadata, blob_sha256: str = None):
+        """Save photo info to database (ref_count blob dijaga trigger)"""
+        with self.db.get_connection() as conn:
             cursor = conn.cursor()
 
             # Get next urutan
@@ -741,20 +742,17 @@ class FotoDokumentasiManager(QWidget):
                 INSERT INTO foto_dokumentasi (
                     paket_id, jenis, kategori, filepath, filename, keterangan,
                     waktu_foto, latitude, longitude, altitude,
-                    camera_make, camera_model, width, height, urutan
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    camera_make, camera_model, width, height, urutan, blob_sha256
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 self.paket_id, self.jenis, kategori, filepath, filename, keterangan,
                 metadata.datetime_taken, metadata.latitude, metadata.longitude, metadata.altitude,
                 metadata.camera_make, metadata.camera_model, metadata.width, metadata.height,
-                next_urutan
+                next_urutan, blob_sha256
             ))
 
             conn.commit()
 
-        except Exception as e:
-            print(f"Error saving photo to db: {e}")
-
     def on_photo_selected(self, foto_id: int):
         """Handle photo selection"""
         self.current_foto_id = foto_id
@@ -819,27 +817,27 @@ class FotoDokumentasiManager(QWidget):
             return
 
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
+            with self.db.get_connection() as conn:
+                cursor = conn.cursor()
 
-            kategori = self.cmb_kategori.currentData()
-            keterangan = self.txt_keterangan.toPlainText()
-            is_cover = 1 if self.chk_cover.isChecked() else 0
+                kategori = self.cmb_kategori.currentData()
+                keterangan = self.txt_keterangan.toPlainText()
+                is_cover = 1 if self.chk_cover.isChecked() else 0
 
-            # If setting as cover, unset others
-            if is_cover:
-                cursor.execute("""
-                    UPDATE foto_dokumentasi SET is_cover = 0
-                    WHERE paket_id = ? AND jenis = ?
-                """, (self.paket_id, self.jenis))
+                # If setting as cover, unset others
+                if is_cover:
+                    cursor.execute("""
+                        UPDATE foto_dokumentasi SET is_cover = 0
+                        WHERE paket_id = ? AND jenis = ?
+                    """, (self.paket_id, self.jenis))
 
-            cursor.execute("""
-                UPDATE foto_dokumentasi
-                SET kategori = ?, keterangan = ?, is_cover = ?
-                WHERE id = ?
-            """, (kategori, keterangan, is_cover, self.current_foto_id))
+                cursor.execute("""
+                    UPDATE foto_dokumentasi
+                    SET kategori = ?, keterangan = ?, is_cover = ?
+                    WHERE id = ?
+                """, (kategori, keterangan, is_cover, self.current_foto_id))
 
-            conn.commit()
+                conn.commit()
 
             QMessageBox.information(self, "Sukses", "Detail foto berhasil disimpan!")
             self.load_photos()
@@ -887,19 +885,22 @@ class FotoDokumentasiManager(QWidget):
             return
 
         try:
-            # Get filepath
-            foto = next((f for f in self.foto_list if f.get('id') == foto_id), None)
-            if foto:
+            foto = next((f for f in self.foto_list if f.get('id') == foto_id), None) or {}
+
+            # Delete from database
+            with self.db.get_connection() as conn:
+                conn.execute("DELETE FROM foto_dokumentasi WHERE id = ?", (foto_id,))
+                conn.commit()
+
+            # Lepas blob (file dihapus jika tidak dirujuk foto/dokumen lain)
+            if foto.get('blob_sha256'):
+                self.store.collect_garbage([foto['blob_sha256']])
+            else:
+                # File lama (sebelum document store) milik baris ini saja
                 filepath = foto.get('filepath', '')
                 if filepath and os.path.exists(filepath):
                     os.remove(filepath)
 
-            # Delete from database
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM foto_dokumentasi WHERE id = ?", (foto_id,))
-            conn.commit()
-
             self.current_foto_id = None
             self.load_photos()
             self.photos_changed.emit()
@@ -1095,7 +1096,9 @@ class FotoDokumentasiManager(QWidget):
                     foto_path = foto.get('filepath', '')
                     if foto_path and os.path.exists(foto_path):
                         kategori = foto.get('kategori', 'LAINNYA')
-                        arcname = f"{kategori}/{os.path.basename(foto_path)}"
+                        # File di store bernama hash; pakai nama file asli
+                        filename = foto.get('filename') or os.path.basename(foto_path)
+                        arcname = f"{kategori}/{foto.get('urutan', 0):03d}_{filename}"
                         zipf.write(foto_path, arcname)
 
             QMessageBox.information(self, "Sukses", f"Foto berhasil diekspor ke:\n{filepath}")
@@ -23,19 +23,20 @@ Layout:
 └─────────────────────────────────────────────────────────────────────┘
 """
 
-import os
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QStackedWidget, QSplitter, QStatusBar, QLabel,
     QMessageBox, QApplication
 )
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QFont, QIcon
+from PySide6.QtCore import Qt, QTimer, QThread, Signal
+from PySide6.QtGui import QFont, QIcon, QKeySequence, QShortcut
 
+import threading
 from typing import Dict, Any, Optional
 
 # Import components
 from .components.sidebar import Sidebar
+from .themes import THEME_LABELS, get_theme_manager, set_role
 
 # Import pages
 from .pages.pencairan import (
@@ -49,14 +50,24 @@ from .pages.pencairan import (
 # Import models
 from ..models.pencairan_models import PencairanManager, BATAS_UP_MAKSIMAL
 
-# Import config
-from ..core.config import ROOT_DIR
+from ..core.audit_writer import close_all_audit_writers
+from ..core.events import TOPIC_TRANSAKSI, TOPIC_FASE, TOPIC_SALDO, TOPIC_DOKUMEN
+from .data_change_notifier import DataChangeNotifier
+from ..services.tup_deadline_scheduler import (
+    TUPDeadlineScheduler, LEVEL_OVERDUE, seconds_until_midnight
+)
 
 # Import document services and dialogs
 from ..services.dokumen_generator import get_dokumen_generator
+from ..services.dokumen_index import get_dokumen_index
+from ..services.document_store import get_document_store
+from .document_store_worker import StoreMaintenanceThread
 from .dialogs.dokumen_dialog import DokumenGeneratorDialog, UploadDokumenDialog
 from .dialogs.backup_restore_dialog import BackupRestoreDialog
 
+# Batas tunggu thread background saat window ditutup
+BACKGROUND_STOP_TIMEOUT_MS = 3000
+
 
 def format_rupiah(value: float) -> str:
     """Format angka ke format Rupiah."""
@@ -65,6 +76,31 @@ def format_rupiah(value: float) -> str:
     return f"Rp {value:,.0f}".replace(",", ".")
 
 
+class DokumenIndexRescanThread(QThread):
+    """Background thread untuk rekonsiliasi index dokumen dengan disk."""
+
+    finished = Signal(dict)  # Laporan rescan
+
+    def __init__(self, index, parent=None):
+        super().__init__(parent)
+        self.index = index
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        """Minta rescan berhenti di folder/file berikutnya."""
+        self._cancel.set()
+
+    def run(self):
+        """Execute rescan."""
+        try:
+            report = self.index.rescan(cancel=self._cancel)
+        except Exception as e:
+            print(f"Warning: Rescan index dokumen gagal: {e}")
+            return
+        if not report['dibatalkan']:
+            self.finished.emit(report)
+
+
 class MainWindowV2(QMainWindow):
     """
     Main window untuk Asisten PPK Offline - Workflow Edition.
@@ -77,22 +113,125 @@ class MainWindowV2(QMainWindow):
 
         # Initialize database manager
         self.db = PencairanManager()
+        self._reconcile_saldo_up()
 
         # Page stack for navigation history
         self._page_stack = []
 
+        # Tema dipasang sebelum widget dibuat agar setiap widget cukup
+        # di-polish sekali terhadap stylesheet aplikasi
+        self._setup_theme()
+
         # Setup UI
         self._setup_ui()
-        self._load_stylesheet()
         self._connect_signals()
 
         # Initial data load
+        self._statistik: Dict[str, Dict[str, Any]] = {}
         self._refresh_data()
 
-        # Auto-refresh timer (every 5 minutes)
-        self._refresh_timer = QTimer(self)
-        self._refresh_timer.timeout.connect(self._refresh_data)
-        self._refresh_timer.start(300000)  # 5 minutes
+        # Refresh hanya bagian yang terdampak saat data berubah
+        self.data_notifier = DataChangeNotifier(self)
+        self.data_notifier.changed.connect(self._on_data_changed)
+
+        # Pengingat batas TUP: saat start, tiap tengah malam, dan saat data TUP berubah
+        self.tup_scheduler = TUPDeadlineScheduler(self.db)
+        self._tup_timer = QTimer(self)
+        self._tup_timer.setSingleShot(True)
+        self._tup_timer.timeout.connect(self._check_tup_deadlines)
+        self._check_tup_deadlines()
+
+        # Rekonsiliasi index dokumen dengan disk tanpa menahan UI
+        self._rescan_thread = DokumenIndexRescanThread(get_dokumen_index(), self)
+        self._rescan_thread.finished.connect(self._on_dokumen_rescan)
+        self._rescan_thread.start()
+
+        # Bersihkan blob upload tanpa rujukan (termasuk yang dilewati GC
+        # per dokumen karena masih dalam jeda GC_GRACE_SECONDS)
+        self._store_gc_thread = StoreMaintenanceThread(
+            get_document_store(), 'collect_garbage', self)
+        self._store_gc_thread.finished.connect(self._on_document_store_gc)
+        self._store_gc_thread.failed.connect(
+            lambda _task, error: print(f"Warning: GC document store gagal: {error}"))
+        self._store_gc_thread.start()
+
+    def closeEvent(self, event):
+        """Stop notifications and flush buffered audit entries before closing."""
+        self.data_notifier.close()
+        self._tup_timer.stop()
+        self._stop_background_thread(self._rescan_thread, "Rescan index dokumen")
+        self._stop_background_thread(self._store_gc_thread, "Garbage collection document store")
+        close_all_audit_writers()
+        super().closeEvent(event)
+
+    def _reconcile_saldo_up(self):
+        """Rebuild saldo UP dari ledger saat start dan laporkan drift."""
+        try:
+            report = self.db.reconcile_saldo_up()
+        except Exception as e:
+            print(f"Warning: Rekonsiliasi saldo UP gagal: {e}")
+            return
+        if not report['ok']:
+            print(
+                f"Warning: Saldo UP {report['tahun_anggaran']} diperbaiki - "
+                f"{len(report['transaksi_drift'])} transaksi, "
+                f"{len(report['saldo_drift'])} bulan tidak sesuai ledger"
+            )
+
+    def _check_tup_deadlines(self, reschedule: bool = True):
+        """Cek ambang batas TUP dan tampilkan pengingat baru di status bar."""
+        try:
+            reminders = self.tup_scheduler.check()
+        except Exception as e:
+            print(f"Warning: Cek batas TUP gagal: {e}")
+            reminders = []
+
+        if reminders:
+            overdue = [r for r in reminders if r['level'] == LEVEL_OVERDUE]
+            if overdue:
+                text = f"{len(overdue)} TUP melewati batas pertanggungjawaban"
+            else:
+                nearest = reminders[0]
+                text = (f"TUP {nearest['kode_transaksi']}: batas "
+                        f"pertanggungjawaban {nearest['sisa_hari']} hari lagi")
+                if len(reminders) > 1:
+                    text += f" (+{len(reminders) - 1} lainnya)"
+            self.status_label.setText(text)
+
+        if reschedule:
+            # +1 detik agar timer pasti jatuh setelah pergantian hari
+            self._tup_timer.start(int((seconds_until_midnight() + 1) * 1000))
+
+    def _on_dokumen_rescan(self, report: Dict[str, Any]):
+        """Laporkan hasil rekonsiliasi index dokumen."""
+        if report['hilang'] or report['dipindah'] or report['yatim']:
+            print(
+                f"Info: Index dokumen - {len(report['hilang'])} hilang, "
+                f"{len(report['dipindah'])} dipindah, "
+                f"{len(report['yatim'])} file tanpa index"
+            )
+
+    def _stop_background_thread(self, thread: QThread, name: str):
+        """
+        Batalkan thread background dan tunggu sampai selesai.
+
+        Thread ber-parent window, jadi tidak boleh dihancurkan selagi
+        run() berjalan; lewat BACKGROUND_STOP_TIMEOUT_MS hanya diberi
+        peringatan lalu tetap ditunggu.
+        """
+        thread.cancel()
+        if not thread.wait(BACKGROUND_STOP_TIMEOUT_MS):
+            print(f"Warning: {name} belum berhenti saat aplikasi ditutup, menunggu...")
+            thread.wait()
+
+    def _on_document_store_gc(self, _task: str, report: Dict[str, Any]):
+        """Laporkan hasil garbage collection document store."""
+        if report['dihapus'] or report['yatim'] or report['diperbaiki']:
+            print(
+                f"Info: Document store - {report['dihapus']} blob dihapus, "
+                f"{report['yatim']} file yatim, {report['diperbaiki']} ref count diperbaiki "
+                f"({report['bytes'] / (1024 * 1024):.2f} MB)"
+            )
 
     def _setup_ui(self):
         """Setup main window UI."""
@@ -111,7 +250,7 @@ class MainWindowV2(QMainWindow):
 
         # Content area
         self.content_stack = QStackedWidget()
-        self.content_stack.setStyleSheet("background-color: #f5f6fa;")
+        self.content_stack.setObjectName("contentArea")
         main_layout.addWidget(self.content_stack, 1)
 
         # Create pages
@@ -153,6 +292,10 @@ class MainWindowV2(QMainWindow):
         self.content_stack.addWidget(self.ls_detail_page)
         self.content_stack.addWidget(self.ls_form_page)
 
+        # List pages query the database page by page
+        for list_page in (self.up_list_page, self.tup_list_page, self.ls_list_page):
+            list_page.set_fetcher(self.db.list_transaksi)
+
         # Page map for navigation
         self._page_map = {
             "dashboard": self.dashboard_page,
@@ -170,53 +313,42 @@ class MainWindowV2(QMainWindow):
     def _setup_status_bar(self):
         """Setup status bar."""
         status_bar = QStatusBar()
-        status_bar.setStyleSheet("""
-            QStatusBar {
-                background-color: #2c3e50;
-                color: #ecf0f1;
-                padding: 5px 10px;
-            }
-            QStatusBar::item {
-                border: none;
-            }
-        """)
 
         # Connection status
         self.conn_label = QLabel("Database: OK")
-        self.conn_label.setStyleSheet("color: #27ae60;")
+        set_role(self.conn_label, tone="success")
         status_bar.addWidget(self.conn_label)
 
         # Spacer
         spacer = QLabel(" | ")
-        spacer.setStyleSheet("color: #7f8c8d;")
+        set_role(spacer, "separator")
         status_bar.addWidget(spacer)
 
         # Saldo UP
         self.saldo_label = QLabel(f"Saldo UP: {format_rupiah(BATAS_UP_MAKSIMAL)}")
-        self.saldo_label.setStyleSheet("color: #ecf0f1;")
         status_bar.addWidget(self.saldo_label)
 
         # Permanent widget on right
         self.status_label = QLabel("Ready")
-        self.status_label.setStyleSheet("color: #95a5a6;")
+        set_role(self.status_label, "muted")
         status_bar.addPermanentWidget(self.status_label)
 
         self.setStatusBar(status_bar)
 
-    def _load_stylesheet(self):
-        """Load QSS stylesheet."""
-        qss_path = os.path.join(ROOT_DIR, "app", "ui", "styles", "main.qss")
+    def _setup_theme(self):
+        """Pasang tema aplikasi dan shortcut ganti tema (Ctrl+Shift+T, opt-in PPK_THEME)."""
+        self.theme_manager = get_theme_manager()
+        self.theme_manager.apply()
+        if not self.theme_manager.switchable:
+            return
 
-        if os.path.exists(qss_path):
-            with open(qss_path, 'r', encoding='utf-8') as f:
-                self.setStyleSheet(f.read())
-        else:
-            # Fallback basic styling
-            self.setStyleSheet("""
-                QMainWindow {
-                    background-color: #f5f6fa;
-                }
-            """)
+        self._theme_shortcut = QShortcut(QKeySequence("Ctrl+Shift+T"), self)
+        self._theme_shortcut.activated.connect(self._toggle_theme)
+
+    def _toggle_theme(self):
+        """Ganti tema terang/gelap."""
+        theme = self.theme_manager.toggle()
+        self.status_label.setText(f"Tema: {THEME_LABELS.get(theme, theme)}")
 
     def _connect_signals(self):
         """Connect all signals."""
@@ -470,10 +602,9 @@ class MainWindowV2(QMainWindow):
                 transaksi_id = self.db.create_transaksi(data)
                 self.status_label.setText(f"Transaksi baru berhasil dibuat (ID: {transaksi_id})")
 
-            # Navigate back to list
+            # Navigate back to list (list di-refresh oleh data_notifier)
             mekanisme = data.get('mekanisme', 'UP').lower()
             self._navigate_to(mekanisme)
-            self._refresh_list(mekanisme.upper())
 
         except Exception as e:
             QMessageBox.critical(
@@ -576,23 +707,11 @@ class MainWindowV2(QMainWindow):
         """Handle document creation."""
         try:
             # Get template name from workflow config
-            from ..config.workflow_config import get_workflow
+            from ..config.workflow_config import get_dokumen
 
             mekanisme = transaksi_data.get('mekanisme', 'UP')
-            workflow = get_workflow(mekanisme)
-            template_name = None
-
-            # Find template for this document
-            if workflow:
-                found = False
-                for fase_num, fase_config in workflow.get('fase', {}).items():
-                    if found:
-                        break
-                    for dok in fase_config.get('dokumen', []):
-                        if dok.get('kode') == kode_dokumen:
-                            template_name = dok.get('template')
-                            found = True
-                            break
+            dokumen = get_dokumen(mekanisme, kode_dokumen)
+            template_name = dokumen.get('template') if dokumen else None
 
             if not template_name:
                 QMessageBox.warning(
@@ -642,17 +761,10 @@ class MainWindowV2(QMainWindow):
         """Handle viewing document."""
         try:
             generator = get_dokumen_generator()
-            folder = generator.get_output_folder(transaksi=transaksi_data)
-
-            # Find documents with this kode
-            import glob
-            pattern = str(folder / f"{kode_dokumen}_*")
-            files = glob.glob(pattern)
+            filepath = generator.find_document(kode_dokumen, transaksi_data)
 
-            if files:
-                # Open most recent
-                latest_file = max(files, key=lambda x: x)
-                generator.open_document(latest_file)
+            if filepath:
+                generator.open_document(filepath)
             else:
                 QMessageBox.information(
                     self,
@@ -699,62 +811,87 @@ class MainWindowV2(QMainWindow):
     def _refresh_data(self):
         """Refresh all data from database."""
         try:
-            # Get statistics for dashboard
-            stats = {}
-            for mekanisme in ["UP", "TUP", "LS"]:
-                stat = self.db.get_statistik(mekanisme)
-                stats[mekanisme] = {
-                    'total': stat.get('total_transaksi', 0),
-                    'nilai': stat.get('nilai', {}).get('total_estimasi', 0),
-                    'selesai': stat.get('per_status', {}).get('selesai', 0),
-                }
+            self._refresh_statistik(["UP", "TUP", "LS"])
+            self._refresh_saldo()
+            self._refresh_transaksi_aktif()
+
+            self.conn_label.setText("Database: OK")
+            set_role(self.conn_label, tone="success")
 
-            self.dashboard_page.update_statistics(stats)
+        except Exception as e:
+            self.conn_label.setText(f"Database: Error - {str(e)}")
+            set_role(self.conn_label, tone="danger")
 
-            # Update saldo UP
-            saldo = self.db.get_saldo_up()
-            tersedia = saldo.get('saldo_tersedia', BATAS_UP_MAKSIMAL)
-            terpakai = saldo.get('total_penggunaan', 0)
+    def _on_data_changed(self, changes: Dict[str, set]):
+        """Refresh only the aggregates affected by coalesced data changes."""
+        try:
+            transaksi_changed = TOPIC_TRANSAKSI in changes or TOPIC_FASE in changes
+            if transaksi_changed:
+                mekanisme_set = (changes.get(TOPIC_TRANSAKSI, set())
+                                 | changes.get(TOPIC_FASE, set()))
+                if None in mekanisme_set:
+                    mekanisme_set = {"UP", "TUP", "LS"}
+                self._refresh_statistik(sorted(mekanisme_set))
+                self._refresh_transaksi_aktif()
+                if "TUP" in mekanisme_set:
+                    self._check_tup_deadlines(reschedule=False)
+
+            if TOPIC_SALDO in changes:
+                self._refresh_saldo()
+
+            current_page = self._page_stack[-1] if self._page_stack else "dashboard"
+            if transaksi_changed and current_page in ["up", "tup", "ls"]:
+                self._refresh_list(current_page.upper())
+            elif TOPIC_DOKUMEN in changes and current_page.endswith("_detail"):
+                self._refresh_current_page()
 
-            self.dashboard_page.update_saldo_up(tersedia, terpakai)
-            self.saldo_label.setText(f"Saldo UP: {format_rupiah(tersedia)}")
+        except Exception as e:
+            self.conn_label.setText(f"Database: Error - {str(e)}")
+            set_role(self.conn_label, tone="danger")
+
+    def _refresh_statistik(self, mekanisme_list):
+        """Refresh statistik dashboard dan badge sidebar untuk mekanisme tertentu."""
+        for mekanisme in mekanisme_list:
+            stat = self.db.get_statistik(mekanisme)
+            self._statistik[mekanisme] = {
+                'total': stat.get('total_transaksi', 0),
+                'nilai': stat.get('nilai', {}).get('total_estimasi', 0),
+                'selesai': stat.get('per_status', {}).get('selesai', 0),
+            }
 
-            # Get active transactions
-            aktif_list, _ = self.db.list_transaksi(status='aktif', limit=5)
-            self.dashboard_page.set_transaksi_aktif(aktif_list)
+        self.dashboard_page.update_statistics(self._statistik)
 
-            # Update sidebar badges
-            up_count = stats["UP"].get('total', 0) - stats["UP"].get('selesai', 0)
-            tup_count = stats["TUP"].get('total', 0) - stats["TUP"].get('selesai', 0)
-            ls_count = stats["LS"].get('total', 0) - stats["LS"].get('selesai', 0)
+        # Update sidebar badges
+        self.sidebar.update_badges({
+            key.lower(): stat.get('total', 0) - stat.get('selesai', 0)
+            for key, stat in self._statistik.items()
+        })
 
-            self.sidebar.update_badges({
-                'up': up_count,
-                'tup': tup_count,
-                'ls': ls_count,
-            })
+    def _refresh_saldo(self):
+        """Refresh saldo UP di dashboard dan status bar."""
+        saldo = self.db.get_saldo_up()
+        tersedia = saldo.get('saldo_tersedia', BATAS_UP_MAKSIMAL)
+        terpakai = saldo.get('total_penggunaan', 0)
 
-            self.conn_label.setText("Database: OK")
-            self.conn_label.setStyleSheet("color: #27ae60;")
+        self.dashboard_page.update_saldo_up(tersedia, terpakai)
+        self.saldo_label.setText(f"Saldo UP: {format_rupiah(tersedia)}")
 
-        except Exception as e:
-            self.conn_label.setText(f"Database: Error - {str(e)}")
-            self.conn_label.setStyleSheet("color: #e74c3c;")
+    def _refresh_transaksi_aktif(self):
+        """Refresh daftar transaksi aktif di dashboard."""
+        aktif_list, _ = self.db.list_transaksi(status='aktif', limit=5)
+        self.dashboard_page.set_transaksi_aktif(aktif_list)
 
     def _refresh_list(self, mekanisme: str = None):
         """Refresh list data for specific mekanisme."""
         try:
             if mekanisme == "UP" or mekanisme is None:
-                data, _ = self.db.list_transaksi(mekanisme="UP")
-                self.up_list_page.set_data(data)
+                self.up_list_page.reload()
 
             if mekanisme == "TUP" or mekanisme is None:
-                data, _ = self.db.list_transaksi(mekanisme="TUP")
-                self.tup_list_page.set_data(data)
+                self.tup_list_page.reload()
 
             if mekanisme == "LS" or mekanisme is None:
-                data, _ = self.db.list_transaksi(mekanisme="LS")
-                self.ls_list_page.set_data(data)
+                self.ls_list_page.reload()
 
         except Exception as e:
             self.status_label.setText(f"Error loading data: {str(e)}")
@@ -0,0 +1,171 @@
+"""
+PPK DOCUMENT FACTORY - Shared Master Data Combo Models
+======================================================
+Model combo pegawai yang dipakai bersama oleh semua dialog.
+
+Satu PegawaiComboModel per (database, peran, placeholder) dibangun dari
+MasterDataDirectory dan dipakai ulang oleh setiap QComboBox, sehingga
+membuka dialog tidak lagi menjalankan query maupun addItem() per pegawai.
+Ketika DatabaseManagerV4 menulis pegawai/satker, model diperbarui di GUI
+thread dengan mempertahankan pilihan setiap combo (berdasarkan id pegawai).
+
+Item data (Qt.UserRole) tetap dict pegawai seperti sebelumnya, jadi
+combo.currentData() di dialog tidak berubah.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QObject, Qt, Signal
+from PySide6.QtWidgets import QComboBox
+
+from app.core.master_data import (
+    MasterDataDirectory, format_nama_pegawai, get_master_data,
+)
+
+DEFAULT_PLACEHOLDER = "-- Pilih Pegawai --"
+COMBO_MIN_CONTENTS = 30  # Lebar combo tanpa mengukur seluruh item
+
+
+class _InvalidationRelay(QObject):
+    """Pindahkan notifikasi invalidate (thread mana pun) ke GUI thread."""
+    invalidated = Signal()
+
+
+class PegawaiComboModel(QAbstractListModel):
+    """
+    List model: baris 0 placeholder (data None), lalu pegawai urut nama.
+
+    role=None berarti semua pegawai aktif; selain itu peran dari
+    ROLE_COLUMNS (ppk, ppspm, bendahara, pemeriksa, pejabat_pengadaan).
+    """
+
+    def __init__(self, directory: MasterDataDirectory, role: str = None,
+                 placeholder: str = DEFAULT_PLACEHOLDER, parent=None):
+        super().__init__(parent)
+        self._directory = directory
+        self._role = role
+        self._placeholder = placeholder
+        self._rows: List[Tuple[str, Dict]] = []
+        self._row_by_id: Dict[int, int] = {}
+        self._relay = _InvalidationRelay(self)
+        self._relay.invalidated.connect(self.refresh)
+        self._remove_listener = directory.add_listener(self._relay.invalidated.emit)
+        self._load()
+
+    def _load(self):
+        if self._role:
+            pegawai = self._directory.get_pegawai_by_role(self._role)
+        else:
+            pegawai = self._directory.all_pegawai()
+        self._rows = [(format_nama_pegawai(p), p) for p in pegawai]
+        self._row_by_id = {p['id']: i + 1 for i, (_, p) in enumerate(self._rows)}
+
+    def refresh(self):
+        """Muat ulang dari direktori; combo tetap memilih pegawai yang sama."""
+        self.layoutAboutToBeChanged.emit()
+        old = self.persistentIndexList()
+        old_ids = [self.pegawai_id_at(index.row()) for index in old]
+        self._load()
+        self.changePersistentIndexList(old, [
+            self.index(self.row_of(pid) if pid is not None else 0, 0)
+            for pid in old_ids
+        ])
+        self.layoutChanged.emit()
+
+    def close(self):
+        self._remove_listener()
+
+    # ------------------------------------------------------------------
+    # Qt model API
+    # ------------------------------------------------------------------
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows) + 1
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return self._placeholder if row == 0 else self._rows[row - 1][0]
+        if role == Qt.UserRole:
+            return None if row == 0 else self._rows[row - 1][1]
+        return None
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def row_of(self, pegawai_id: Optional[int]) -> int:
+        """Baris pegawai (0 = placeholder bila tidak ada)."""
+        return self._row_by_id.get(pegawai_id, 0)
+
+    def pegawai_id_at(self, row: int) -> Optional[int]:
+        if 1 <= row <= len(self._rows):
+            return self._rows[row - 1][1]['id']
+        return None
+
+
+# ============================================================================
+# SHARED MODELS
+# ============================================================================
+
+_models: Dict[Tuple[str, Optional[str], str], PegawaiComboModel] = {}
+
+
+def get_pegawai_combo_model(role: str = None, placeholder: str = DEFAULT_PLACEHOLDER,
+                            db_path: str = None) -> PegawaiComboModel:
+    """Model bersama untuk (database, peran, placeholder)."""
+    directory = get_master_data(db_path)
+    key = (directory._key, role, placeholder)
+    model = _models.get(key)
+    if model is None:
+        model = PegawaiComboModel(directory, role, placeholder)
+        _models[key] = model
+    return model
+
+
+def bind_pegawai_combo(combo: QComboBox, role: str = None,
+                       placeholder: str = DEFAULT_PLACEHOLDER,
+                       db_path: str = None) -> PegawaiComboModel:
+    """
+    Pasang model bersama ke combo.
+
+    Jangan panggil combo.clear()/addItem() setelahnya: model dipakai
+    dialog lain juga.
+    """
+    model = get_pegawai_combo_model(role, placeholder, db_path)
+    if combo.model() is not model:
+        combo.setModel(model)
+    combo.setInsertPolicy(QComboBox.NoInsert)
+    combo.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
+    combo.setMinimumContentsLength(COMBO_MIN_CONTENTS)
+    # Popup tidak perlu mengukur tiap baris saat stylesheet/ukuran berubah
+    view = combo.view()
+    if hasattr(view, 'setUniformItemSizes'):
+        view.setUniformItemSizes(True)
+    return model
+
+
+def select_pegawai(combo: QComboBox, pegawai_id: Optional[int]) -> bool:
+    """Pilih pegawai berdasarkan id. Returns True jika ditemukan."""
+    model = combo.model()
+    if isinstance(model, PegawaiComboModel):
+        row = model.row_of(pegawai_id)
+        combo.setCurrentIndex(row)
+        return row > 0 or pegawai_id is None
+    for i in range(combo.count()):
+        data = combo.itemData(i)
+        if isinstance(data, dict) and data.get('id') == pegawai_id:
+            combo.setCurrentIndex(i)
+            return True
+    return False
+
+
+__all__ = [
+    'PegawaiComboModel',
+    'get_pegawai_combo_model',
+    'bind_pegawai_combo',
+    'select_pegawai',
+    'DEFAULT_PLACEHOLDER',
+]
@@ -17,6 +17,7 @@ from typing import Dict, Any, List, Optional
 from ...components.fase_stepper import FaseStepper
 from ...components.dokumen_checklist import DokumenChecklist
 from ...components.kalkulasi_widget import KalkulasiWidget
+from ...themes import MEKANISME_TONE, STATUS_TONE, set_role
 
 
 def format_rupiah(value: float) -> str:
@@ -105,18 +106,7 @@ class BaseDetailPage(QWidget):
         # Back button
         back_btn = QPushButton("< Kembali")
         back_btn.setCursor(Qt.PointingHandCursor)
-        back_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #3498db;
-                border: none;
-                font-size: 13px;
-            }
-            QPushButton:hover {
-                color: #2980b9;
-                text-decoration: underline;
-            }
-        """)
+        set_role(back_btn, "link")
         back_btn.clicked.connect(self.back_clicked.emit)
         layout.addWidget(back_btn)
 
@@ -124,14 +114,7 @@ class BaseDetailPage(QWidget):
 
         # Mekanisme badge
         self.mekanisme_badge = QLabel(self.MEKANISME)
-        self.mekanisme_badge.setStyleSheet(f"""
-            background-color: {self.COLOR};
-            color: white;
-            border-radius: 12px;
-            padding: 4px 12px;
-            font-weight: bold;
-            font-size: 12px;
-        """)
+        set_role(self.mekanisme_badge, "badge", tone=self._tone(), size="large")
         layout.addWidget(self.mekanisme_badge)
 
         return header
@@ -139,13 +122,7 @@ class BaseDetailPage(QWidget):
     def _create_info_bar(self) -> QWidget:
         """Create transaksi info bar."""
         bar = QFrame()
-        bar.setStyleSheet("""
-            QFrame {
-                background-color: #ffffff;
-                border-radius: 8px;
-                border: 1px solid #ecf0f1;
-            }
-        """)
+        set_role(bar, "card")
 
         layout = QHBoxLayout(bar)
         layout.setContentsMargins(20, 15, 20, 15)
@@ -156,11 +133,11 @@ class BaseDetailPage(QWidget):
         kode_layout.setSpacing(4)
 
         kode_label = QLabel("Kode Transaksi")
-        kode_label.setStyleSheet("font-size: 11px; color: #7f8c8d;")
+        set_role(kode_label, "caption")
         kode_layout.addWidget(kode_label)
 
         self.kode_value = QLabel("-")
-        self.kode_value.setStyleSheet("font-size: 14px; font-weight: bold; color: #2c3e50;")
+        set_role(self.kode_value, "value")
         kode_layout.addWidget(self.kode_value)
 
         layout.addLayout(kode_layout)
@@ -170,11 +147,11 @@ class BaseDetailPage(QWidget):
         nama_layout.setSpacing(4)
 
         nama_label = QLabel("Nama Kegiatan")
-        nama_label.setStyleSheet("font-size: 11px; color: #7f8c8d;")
+        set_role(nama_label, "caption")
         nama_layout.addWidget(nama_label)
 
         self.nama_value = QLabel("-")
-        self.nama_value.setStyleSheet("font-size: 14px; font-weight: 500; color: #2c3e50;")
+        set_role(self.nama_value, "value", weight="medium")
         nama_layout.addWidget(self.nama_value)
 
         layout.addLayout(nama_layout, 1)
@@ -185,19 +162,12 @@ class BaseDetailPage(QWidget):
         status_layout.setAlignment(Qt.AlignRight)
 
         status_label = QLabel("Status")
-        status_label.setStyleSheet("font-size: 11px; color: #7f8c8d;")
+        set_role(status_label, "caption")
         status_label.setAlignment(Qt.AlignRight)
         status_layout.addWidget(status_label)
 
         self.status_badge = QLabel("Draft")
-        self.status_badge.setStyleSheet("""
-            background-color: #bdc3c7;
-            color: white;
-            border-radius: 10px;
-            padding: 4px 12px;
-            font-size: 11px;
-            font-weight: bold;
-        """)
+        set_role(self.status_badge, "badge", tone=STATUS_TONE['draft'])
         status_layout.addWidget(self.status_badge, alignment=Qt.AlignRight)
 
         layout.addLayout(status_layout)
@@ -208,12 +178,12 @@ class BaseDetailPage(QWidget):
         nilai_layout.setAlignment(Qt.AlignRight)
 
         nilai_label = QLabel("Estimasi Biaya")
-        nilai_label.setStyleSheet("font-size: 11px; color: #7f8c8d;")
+        set_role(nilai_label, "caption")
         nilai_label.setAlignment(Qt.AlignRight)
         nilai_layout.addWidget(nilai_label)
 
         self.nilai_value = QLabel("Rp 0")
-        self.nilai_value.setStyleSheet(f"font-size: 16px; font-weight: bold; color: {self.COLOR};")
+        set_role(self.nilai_value, "amount", tone=self._tone())
         nilai_layout.addWidget(self.nilai_value, alignment=Qt.AlignRight)
 
         layout.addLayout(nilai_layout)
@@ -221,20 +191,7 @@ class BaseDetailPage(QWidget):
         # Edit button
         self.edit_transaksi_btn = QPushButton("✏️ Edit")
         self.edit_transaksi_btn.setCursor(Qt.PointingHandCursor)
-        self.edit_transaksi_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 5px;
-                font-weight: 500;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-        """)
+        set_role(self.edit_transaksi_btn, tone="primary")
         self.edit_transaksi_btn.clicked.connect(self._on_edit_transaksi)
         layout.addWidget(self.edit_transaksi_btn)
 
@@ -243,13 +200,7 @@ class BaseDetailPage(QWidget):
     def _create_detail_panel(self) -> QWidget:
         """Create right detail panel."""
         panel = QFrame()
-        panel.setStyleSheet("""
-            QFrame {
-                background-color: #ffffff;
-                border-radius: 8px;
-                border: 1px solid #ecf0f1;
-            }
-        """)
+        set_role(panel, "card")
 
         layout = QVBoxLayout(panel)
         layout.setContentsMargins(15, 15, 15, 15)
@@ -257,25 +208,7 @@ class BaseDetailPage(QWidget):
 
         # Tabs for different sections
         tabs = QTabWidget()
-        tabs.setStyleSheet("""
-            QTabWidget::pane {
-                border: none;
-                background-color: transparent;
-            }
-            QTabBar::tab {
-                background-color: #f5f6fa;
-                color: #7f8c8d;
-                padding: 8px 16px;
-                margin-right: 2px;
-                border-top-left-radius: 5px;
-                border-top-right-radius: 5px;
-            }
-            QTabBar::tab:selected {
-                background-color: #ffffff;
-                color: #3498db;
-                font-weight: 500;
-            }
-        """)
+        set_role(tabs, "plain")
 
         # Info tab
         info_widget = self._create_info_tab()
@@ -303,54 +236,42 @@ class BaseDetailPage(QWidget):
 
         # Penerima info
         penerima_frame = QFrame()
-        penerima_frame.setStyleSheet("""
-            QFrame {
-                background-color: #f8f9fa;
-                border-radius: 5px;
-                padding: 10px;
-            }
-        """)
+        set_role(penerima_frame, "panel")
 
         penerima_layout = QVBoxLayout(penerima_frame)
         penerima_layout.setSpacing(8)
 
         penerima_title = QLabel("Penerima / Pelaksana")
-        penerima_title.setStyleSheet("font-size: 12px; font-weight: bold; color: #2c3e50;")
+        set_role(penerima_title, "subheading")
         penerima_layout.addWidget(penerima_title)
 
         self.penerima_nama_label = QLabel("Nama: -")
-        self.penerima_nama_label.setStyleSheet("font-size: 12px; color: #2c3e50;")
+        set_role(self.penerima_nama_label, "body")
         penerima_layout.addWidget(self.penerima_nama_label)
 
         self.penerima_nip_label = QLabel("NIP: -")
-        self.penerima_nip_label.setStyleSheet("font-size: 12px; color: #7f8c8d;")
+        set_role(self.penerima_nip_label, "muted")
         penerima_layout.addWidget(self.penerima_nip_label)
 
         layout.addWidget(penerima_frame)
 
         # Dasar hukum
         dasar_frame = QFrame()
-        dasar_frame.setStyleSheet("""
-            QFrame {
-                background-color: #f8f9fa;
-                border-radius: 5px;
-                padding: 10px;
-            }
-        """)
+        set_role(dasar_frame, "panel")
 
         dasar_layout = QVBoxLayout(dasar_frame)
         dasar_layout.setSpacing(8)
 
         dasar_title = QLabel("Dasar Hukum")
-        dasar_title.setStyleSheet("font-size: 12px; font-weight: bold; color: #2c3e50;")
+        set_role(dasar_title, "subheading")
         dasar_layout.addWidget(dasar_title)
 
         self.dasar_nomor_label = QLabel("Nomor: -")
-        self.dasar_nomor_label.setStyleSheet("font-size: 12px; color: #2c3e50;")
+        set_role(self.dasar_nomor_label, "body")
         dasar_layout.addWidget(self.dasar_nomor_label)
 
         self.dasar_tanggal_label = QLabel("Tanggal: -")
-        self.dasar_tanggal_label.setStyleSheet("font-size: 12px; color: #7f8c8d;")
+        set_role(self.dasar_tanggal_label, "muted")
         dasar_layout.addWidget(self.dasar_tanggal_label)
 
         layout.addWidget(dasar_frame)
@@ -370,7 +291,7 @@ class BaseDetailPage(QWidget):
 
         # Empty state
         empty = QLabel("Belum ada riwayat")
-        empty.setStyleSheet("font-size: 12px; color: #7f8c8d; padding: 20px;")
+        set_role(empty, "empty")
         empty.setAlignment(Qt.AlignCenter)
         self.log_container.addWidget(empty)
 
@@ -382,20 +303,14 @@ class BaseDetailPage(QWidget):
     def _create_action_bar(self) -> QWidget:
         """Create bottom action bar."""
         bar = QFrame()
-        bar.setStyleSheet("""
-            QFrame {
-                background-color: #ffffff;
-                border-radius: 8px;
-                border: 1px solid #ecf0f1;
-            }
-        """)
+        set_role(bar, "card")
 
         layout = QHBoxLayout(bar)
         layout.setContentsMargins(15, 12, 15, 12)
 
         # Left: Status info
         self.fase_info_label = QLabel("Fase 1: Inisiasi & SK")
-        self.fase_info_label.setStyleSheet("font-size: 12px; color: #7f8c8d;")
+        set_role(self.fase_info_label, "muted")
         layout.addWidget(self.fase_info_label)
 
         layout.addStretch()
@@ -403,51 +318,22 @@ class BaseDetailPage(QWidget):
         # Save button
         save_btn = QPushButton("Simpan Perubahan")
         save_btn.setCursor(Qt.PointingHandCursor)
-        save_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 5px;
-                font-weight: 500;
-            }
-            QPushButton:hover {
-                background-color: #1e8449;
-            }
-        """)
+        set_role(save_btn, tone="success")
         save_btn.clicked.connect(self._on_save)
         layout.addWidget(save_btn)
 
         # Next fase button
         self.next_btn = QPushButton("Lanjut ke Fase Berikutnya >")
         self.next_btn.setCursor(Qt.PointingHandCursor)
-        self.next_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.COLOR};
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 5px;
-                font-weight: 500;
-            }}
-            QPushButton:hover {{
-                background-color: {self._darken_color(self.COLOR)};
-            }}
-        """)
+        set_role(self.next_btn, tone=self._tone())
         self.next_btn.clicked.connect(self._on_next_fase)
         layout.addWidget(self.next_btn)
 
         return bar
 
-    def _darken_color(self, hex_color: str) -> str:
-        """Darken a hex color."""
-        darken_map = {
-            "#27ae60": "#1e8449",
-            "#f39c12": "#d68910",
-            "#3498db": "#2980b9",
-        }
-        return darken_map.get(hex_color, hex_color)
+    def _tone(self) -> str:
+        """Tone tema untuk mekanisme halaman (badge, nilai, tombol lanjut)."""
+        return MEKANISME_TONE.get(self.MEKANISME, "primary")
 
     def _on_fase_clicked(self, fase: int):
         """Handle fase step click."""
@@ -531,21 +417,8 @@ class BaseDetailPage(QWidget):
 
         # Update status badge
         status = data.get('status', 'draft')
-        status_colors = {
-            'draft': '#bdc3c7',
-            'aktif': '#3498db',
-            'selesai': '#27ae60',
-            'batal': '#e74c3c',
-        }
         self.status_badge.setText(status.title())
-        self.status_badge.setStyleSheet(f"""
-            background-color: {status_colors.get(status, '#bdc3c7')};
-            color: white;
-            border-radius: 10px;
-            padding: 4px 12px;
-            font-size: 11px;
-            font-weight: bold;
-        """)
+        set_role(self.status_badge, tone=STATUS_TONE.get(status, 'neutral'))
 
         # Update penerima info
         self.penerima_nama_label.setText(f"Nama: {data.get('penerima_nama', '-')}")
@@ -588,20 +461,14 @@ class BaseDetailPage(QWidget):
 
         if not entries:
             empty = QLabel("Belum ada riwayat")
-            empty.setStyleSheet("font-size: 12px; color: #7f8c8d; padding: 20px;")
+            set_role(empty, "empty")
             empty.setAlignment(Qt.AlignCenter)
             self.log_container.addWidget(empty)
             return
 
         for entry in entries:
             item = QFrame()
-            item.setStyleSheet("""
-                QFrame {
-                    background-color: #f8f9fa;
-                    border-radius: 5px;
-                    padding: 8px;
-                }
-            """)
+            set_role(item, "panel")
 
             item_layout = QHBoxLayout(item)
             item_layout.setContentsMargins(10, 8, 10, 8)
@@ -619,7 +486,7 @@ class BaseDetailPage(QWidget):
                 text = entry.get('catatan', aksi)
 
             aksi_label = QLabel(text)
-            aksi_label.setStyleSheet("font-size: 12px; color: #2c3e50;")
+            set_role(aksi_label, "body")
             item_layout.addWidget(aksi_label)
 
             item_layout.addStretch()
@@ -627,7 +494,7 @@ class BaseDetailPage(QWidget):
             # Timestamp
             timestamp = entry.get('created_at', '')
             time_label = QLabel(timestamp[:16] if timestamp else '-')
-            time_label.setStyleSheet("font-size: 11px; color: #7f8c8d;")
+            set_role(time_label, "caption")
             item_layout.addWidget(time_label)
 
             self.log_container.addWidget(item)
@@ -2,18 +2,26 @@
 PPK DOCUMENT FACTORY - Base List Page
 ======================================
 Base class for transaksi list pages (UP, TUP, LS).
+
+Tabel memakai TransaksiTableModel: filter dan sorting dijalankan di query
+list_transaksi dan data dimuat per halaman saat di-scroll.
 """
 
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView,
     QLabel, QPushButton, QLineEdit, QComboBox, QFrame, QHeaderView,
     QAbstractItemView, QMenu
 )
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QColor
+from PySide6.QtCore import Qt, Signal, QTimer
+
+from typing import Dict, Any, List, Optional, Callable
+
+from .transaksi_table_model import TransaksiTableModel, ListColumn, ROW_NUMBER_KEY
+
+SEARCH_DEBOUNCE_MS = 300  # Jeda ketik sebelum query pencarian dijalankan
 
-from typing import Dict, Any, List, Optional
-from abc import abstractmethod
+ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+ALIGN_RIGHT = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
 
 
 def format_rupiah(value: float) -> str:
@@ -51,11 +59,37 @@ class BaseListPage(QWidget):
         "batal": "#e74c3c",
     }
 
+    STATUS_FILTERS = [
+        ("Semua", None),
+        ("Draft", "draft"),
+        ("Aktif", "aktif"),
+        ("Selesai", "selesai"),
+    ]
+
+    JENIS_FILTERS = [
+        ("Semua", None),
+        ("Honorarium", "honorarium"),
+        ("Jamuan/Konsumsi", "jamuan"),
+        ("Perjalanan Dinas", "perdin"),
+        ("PJLP", "pjlp"),
+        ("ATK", "atk"),
+        ("Lainnya", "lainnya"),
+    ]
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._data: List[Dict[str, Any]] = []
+        self.model = TransaksiTableModel(self._get_column_defs(), mekanisme=self.MEKANISME)
+
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._apply_filters)
+
         self._setup_ui()
 
+        self.model.modelReset.connect(self._update_footer)
+        self.model.rowsInserted.connect(self._update_footer)
+
     def _setup_ui(self):
         """Setup list page UI."""
         main_layout = QVBoxLayout(self)
@@ -158,7 +192,8 @@ class BaseListPage(QWidget):
                 border-color: #3498db;
             }
         """)
-        self.search_input.textChanged.connect(self._on_filter_changed)
+        self.search_input.textChanged.connect(self._search_timer.start)
+        self.search_input.returnPressed.connect(self._apply_filters)
         layout.addWidget(self.search_input)
 
         # Status filter
@@ -167,7 +202,8 @@ class BaseListPage(QWidget):
         layout.addWidget(status_label)
 
         self.status_combo = QComboBox()
-        self.status_combo.addItems(["Semua", "Draft", "Aktif", "Selesai"])
+        for label, value in self.STATUS_FILTERS:
+            self.status_combo.addItem(label, value)
         self.status_combo.setStyleSheet("""
             QComboBox {
                 background-color: #f8f9fa;
@@ -186,10 +222,8 @@ class BaseListPage(QWidget):
         layout.addWidget(jenis_label)
 
         self.jenis_combo = QComboBox()
-        self.jenis_combo.addItems([
-            "Semua", "Honorarium", "Jamuan/Konsumsi",
-            "Perjalanan Dinas", "PJLP", "ATK", "Lainnya"
-        ])
+        for label, value in self.JENIS_FILTERS:
+            self.jenis_combo.addItem(label, value)
         self.jenis_combo.setStyleSheet("""
             QComboBox {
                 background-color: #f8f9fa;
@@ -223,28 +257,24 @@ class BaseListPage(QWidget):
 
         return bar
 
-    def _create_table(self) -> QTableWidget:
-        """Create data table."""
-        table = QTableWidget()
-
-        # Columns
-        columns = self._get_columns()
-        table.setColumnCount(len(columns))
-        table.setHorizontalHeaderLabels(columns)
+    def _create_table(self) -> QTableView:
+        """Create data table bound to the query-backed model."""
+        table = QTableView()
+        table.setModel(self.model)
 
         # Styling
         table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #ffffff;
                 border: 1px solid #ecf0f1;
                 border-radius: 8px;
                 gridline-color: #f5f6fa;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 10px;
                 border-bottom: 1px solid #f5f6fa;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #ebf5fb;
                 color: #2c3e50;
             }
@@ -267,24 +297,21 @@ class BaseListPage(QWidget):
 
         # Column sizing
         header = table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.Fixed)  # No
-        header.setSectionResizeMode(1, QHeaderView.Fixed)  # Kode
-        header.setSectionResizeMode(2, QHeaderView.Stretch)  # Nama
-        header.setSectionResizeMode(3, QHeaderView.Fixed)  # Jenis
-        header.setSectionResizeMode(4, QHeaderView.Fixed)  # Nilai
-        header.setSectionResizeMode(5, QHeaderView.Fixed)  # Fase
-        header.setSectionResizeMode(6, QHeaderView.Fixed)  # Status
-
-        table.setColumnWidth(0, 50)
-        table.setColumnWidth(1, 120)
-        table.setColumnWidth(3, 120)
-        table.setColumnWidth(4, 130)
-        table.setColumnWidth(5, 80)
-        table.setColumnWidth(6, 100)
+        for column, col in enumerate(self.model.columns()):
+            if col.stretch:
+                header.setSectionResizeMode(column, QHeaderView.Stretch)
+            else:
+                header.setSectionResizeMode(column, QHeaderView.Fixed)
+                if col.width:
+                    table.setColumnWidth(column, col.width)
+
+        # Sorting dijalankan di query (TransaksiTableModel.sort)
+        header.setSortIndicator(-1, Qt.SortOrder.DescendingOrder)
+        table.setSortingEnabled(True)
 
         # Signals
-        table.itemSelectionChanged.connect(self._on_selection_changed)
-        table.itemDoubleClicked.connect(self._on_double_click)
+        table.selectionModel().selectionChanged.connect(self._on_selection_changed)
+        table.doubleClicked.connect(self._on_double_click)
 
         # Context menu
         table.setContextMenuPolicy(Qt.CustomContextMenu)
@@ -311,9 +338,44 @@ class BaseListPage(QWidget):
 
         return footer
 
+    def _get_column_defs(self) -> List[ListColumn]:
+        """Get column definitions. Override if needed."""
+        return [
+            self._col_no(),
+            self._col_kode(),
+            self._col_nama(),
+            ListColumn('jenis_belanja', 'Jenis', width=120,
+                       formatter=lambda v: (v or '-').title()),
+            ListColumn('estimasi_biaya', 'Nilai', width=130,
+                       formatter=format_rupiah, alignment=ALIGN_RIGHT),
+            self._col_fase(),
+            self._col_status(),
+        ]
+
     def _get_columns(self) -> List[str]:
-        """Get column headers. Override if needed."""
-        return ["No", "Kode", "Nama Kegiatan", "Jenis", "Nilai", "Fase", "Status"]
+        """Get column headers."""
+        return [col.header for col in self.model.columns()]
+
+    # Kolom yang dipakai bersama oleh halaman UP/TUP/LS
+
+    def _col_no(self) -> ListColumn:
+        return ListColumn(ROW_NUMBER_KEY, 'No', width=50, alignment=ALIGN_CENTER,
+                          sortable=False)
+
+    def _col_kode(self) -> ListColumn:
+        return ListColumn('kode_transaksi', 'Kode', width=120)
+
+    def _col_nama(self) -> ListColumn:
+        return ListColumn('nama_kegiatan', 'Nama Kegiatan', stretch=True)
+
+    def _col_fase(self) -> ListColumn:
+        return ListColumn('fase_aktif', 'Fase', width=80, alignment=ALIGN_CENTER,
+                          formatter=lambda v: f"Fase {v or 1}")
+
+    def _col_status(self) -> ListColumn:
+        return ListColumn('status', 'Status', width=100, alignment=ALIGN_CENTER,
+                          formatter=lambda v: (v or 'draft').title(),
+                          foreground=lambda v: self.STATUS_COLORS.get(v or 'draft', "#bdc3c7"))
 
     def _get_icon(self) -> str:
         """Get page icon. Override in subclass."""
@@ -333,63 +395,40 @@ class BaseListPage(QWidget):
         self._apply_filters()
 
     def _apply_filters(self):
-        """Apply current filters to data."""
-        search = self.search_input.text().lower()
-        status = self.status_combo.currentText().lower()
-        jenis = self.jenis_combo.currentText()
-
-        for row in range(self.table.rowCount()):
-            show = True
-
-            # Search filter
-            if search:
-                nama = self.table.item(row, 2)
-                kode = self.table.item(row, 1)
-                if nama and kode:
-                    if search not in nama.text().lower() and search not in kode.text().lower():
-                        show = False
-
-            # Status filter
-            if status != "semua":
-                status_item = self.table.item(row, 6)
-                if status_item and status not in status_item.text().lower():
-                    show = False
-
-            # Jenis filter
-            if jenis != "Semua":
-                jenis_item = self.table.item(row, 3)
-                if jenis_item and jenis.lower() not in jenis_item.text().lower():
-                    show = False
-
-            self.table.setRowHidden(row, not show)
-
-    def _on_selection_changed(self):
+        """Push current filters down into the list_transaksi query."""
+        self._search_timer.stop()
+        self.model.set_filters(
+            search=self.search_input.text().strip(),
+            status=self.status_combo.currentData(),
+            jenis_belanja=self.jenis_combo.currentData(),
+        )
+
+    def _update_footer(self, *args):
+        """Update count and loaded-rows labels."""
+        total = self.model.total_count()
+        self.count_label.setText(f"{total} transaksi")
+        self.page_label.setText(f"Menampilkan {self.model.rowCount()} dari {total}")
+
+    def _on_selection_changed(self, *args):
         """Handle row selection."""
-        selected = self.table.selectedItems()
-        if selected:
-            row = selected[0].row()
-            if row < len(self._data):
-                transaksi_id = self._data[row].get('id', 0)
-                self.item_selected.emit(transaksi_id)
-
-    def _on_double_click(self, item):
+        transaksi_id = self.get_selected_id()
+        if transaksi_id is not None:
+            self.item_selected.emit(transaksi_id)
+
+    def _on_double_click(self, index):
         """Handle double click on row."""
-        row = item.row()
-        if row < len(self._data):
-            transaksi_id = self._data[row].get('id', 0)
-            self.item_double_clicked.emit(transaksi_id)
+        data = self.model.row_data(index.row())
+        if data:
+            self.item_double_clicked.emit(data.get('id', 0))
 
     def _show_context_menu(self, pos):
         """Show context menu."""
-        item = self.table.itemAt(pos)
-        if not item:
-            return
-
-        row = item.row()
-        if row >= len(self._data):
+        index = self.table.indexAt(pos)
+        data = self.model.row_data(index.row()) if index.isValid() else None
+        if not data:
             return
 
-        transaksi_id = self._data[row].get('id', 0)
+        transaksi_id = data.get('id', 0)
 
         menu = QMenu(self)
         menu.setStyleSheet("""
@@ -424,57 +463,17 @@ class BaseListPage(QWidget):
         # Implement in subclass or emit signal
         pass
 
-    def set_data(self, data: List[Dict[str, Any]]):
-        """Set table data."""
-        self._data = data
-
-        self.table.setRowCount(len(data))
-
-        for row, item in enumerate(data):
-            self._set_row_data(row, item)
-
-        self.count_label.setText(f"{len(data)} transaksi")
-
-    def _set_row_data(self, row: int, item: Dict[str, Any]):
-        """Set data for a single row."""
-        # No
-        no_item = QTableWidgetItem(str(row + 1))
-        no_item.setTextAlignment(Qt.AlignCenter)
-        self.table.setItem(row, 0, no_item)
+    def set_fetcher(self, fetcher: Callable):
+        """Set query source, e.g. PencairanManager.list_transaksi."""
+        self.model.set_fetcher(fetcher)
 
-        # Kode
-        kode_item = QTableWidgetItem(item.get('kode_transaksi', '-'))
-        self.table.setItem(row, 1, kode_item)
+    def reload(self):
+        """Reload the first page with the current filters and sort."""
+        self.model.reload()
 
-        # Nama
-        nama_item = QTableWidgetItem(item.get('nama_kegiatan', '-'))
-        self.table.setItem(row, 2, nama_item)
-
-        # Jenis
-        jenis_item = QTableWidgetItem(item.get('jenis_belanja', '-').title())
-        self.table.setItem(row, 3, jenis_item)
-
-        # Nilai
-        nilai = item.get('estimasi_biaya', 0)
-        nilai_item = QTableWidgetItem(format_rupiah(nilai))
-        nilai_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        self.table.setItem(row, 4, nilai_item)
-
-        # Fase
-        fase = item.get('fase_aktif', 1)
-        fase_item = QTableWidgetItem(f"Fase {fase}")
-        fase_item.setTextAlignment(Qt.AlignCenter)
-        self.table.setItem(row, 5, fase_item)
-
-        # Status
-        status = item.get('status', 'draft')
-        status_item = QTableWidgetItem(status.title())
-        status_item.setTextAlignment(Qt.AlignCenter)
-
-        color = self.STATUS_COLORS.get(status, "#bdc3c7")
-        status_item.setForeground(QColor(color))
-
-        self.table.setItem(row, 6, status_item)
+    def set_data(self, data: List[Dict[str, Any]]):
+        """Set static table data (tanpa query/halaman berikutnya)."""
+        self.model.set_rows(data)
 
     def refresh(self):
         """Refresh data. Override to implement actual refresh."""
@@ -482,9 +481,9 @@ class BaseListPage(QWidget):
 
     def get_selected_id(self) -> Optional[int]:
         """Get currently selected transaksi ID."""
-        selected = self.table.selectedItems()
-        if selected:
-            row = selected[0].row()
-            if row < len(self._data):
-                return self._data[row].get('id')
+        rows = self.table.selectionModel().selectedRows()
+        if rows:
+            data = self.model.row_data(rows[0].row())
+            if data:
+                return data.get('id')
         return None
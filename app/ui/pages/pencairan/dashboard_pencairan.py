@@ -25,6 +25,7 @@ from app.ui.dashboard_components import (
     QuickActionsWidget,
     RecentActivityWidget,
 )
+from app.ui.themes import set_role
 
 
 class DashboardPencairanPage(QWidget):
@@ -59,12 +60,6 @@ class DashboardPencairanPage(QWidget):
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-        """)
 
         content = QWidget()
         main_layout = QVBoxLayout(content)
@@ -135,11 +130,7 @@ class DashboardPencairanPage(QWidget):
 
         # Title
         title = QLabel("Dashboard Pencairan Dana")
-        title.setStyleSheet("""
-            font-size: 24px;
-            font-weight: bold;
-            color: #2c3e50;
-        """)
+        set_role(title, "page-title", size="large")
         layout.addWidget(title)
 
         layout.addStretch()
@@ -151,13 +142,7 @@ class DashboardPencairanPage(QWidget):
         ]
         now = datetime.now()
         period = QLabel(f"{bulan_names[now.month - 1]} {now.year}")
-        period.setStyleSheet("""
-            font-size: 14px;
-            color: #7f8c8d;
-            background-color: #ecf0f1;
-            padding: 5px 15px;
-            border-radius: 15px;
-        """)
+        set_role(period, "period")
         layout.addWidget(period)
 
         return header
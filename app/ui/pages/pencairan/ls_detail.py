@@ -8,6 +8,7 @@ Includes penyedia/kontrak information.
 from PySide6.QtWidgets import QVBoxLayout, QFrame, QLabel, QHBoxLayout
 
 from .base_detail_page import BaseDetailPage
+from ...themes import set_role
 
 from typing import Dict, Any
 
@@ -29,63 +30,50 @@ class LSDetailPage(BaseDetailPage):
 
         # Penyedia info
         penyedia_frame = QFrame()
-        penyedia_frame.setStyleSheet("""
-            QFrame {
-                background-color: #ebf5fb;
-                border-radius: 5px;
-                padding: 10px;
-                border-left: 4px solid #3498db;
-            }
-        """)
+        set_role(penyedia_frame, "panel", tone="primary")
 
         penyedia_layout = QVBoxLayout(penyedia_frame)
         penyedia_layout.setSpacing(8)
 
         penyedia_title = QLabel("Penyedia Barang/Jasa")
-        penyedia_title.setStyleSheet("font-size: 12px; font-weight: bold; color: #2c3e50;")
+        set_role(penyedia_title, "subheading")
         penyedia_layout.addWidget(penyedia_title)
 
         self.penyedia_nama_label = QLabel("Nama: -")
-        self.penyedia_nama_label.setStyleSheet("font-size: 12px; color: #2c3e50;")
+        set_role(self.penyedia_nama_label, "body")
         penyedia_layout.addWidget(self.penyedia_nama_label)
 
         self.penyedia_npwp_label = QLabel("NPWP: -")
-        self.penyedia_npwp_label.setStyleSheet("font-size: 12px; color: #7f8c8d;")
+        set_role(self.penyedia_npwp_label, "muted")
         penyedia_layout.addWidget(self.penyedia_npwp_label)
 
         self.penyedia_bank_label = QLabel("Rekening: -")
-        self.penyedia_bank_label.setStyleSheet("font-size: 12px; color: #7f8c8d;")
+        set_role(self.penyedia_bank_label, "muted")
         penyedia_layout.addWidget(self.penyedia_bank_label)
 
         layout.addWidget(penyedia_frame)
 
         # Kontrak info
         kontrak_frame = QFrame()
-        kontrak_frame.setStyleSheet("""
-            QFrame {
-                background-color: #f8f9fa;
-                border-radius: 5px;
-                padding: 10px;
-            }
-        """)
+        set_role(kontrak_frame, "panel")
 
         kontrak_layout = QVBoxLayout(kontrak_frame)
         kontrak_layout.setSpacing(8)
 
         kontrak_title = QLabel("Informasi Kontrak/SPK")
-        kontrak_title.setStyleSheet("font-size: 12px; font-weight: bold; color: #2c3e50;")
+        set_role(kontrak_title, "subheading")
         kontrak_layout.addWidget(kontrak_title)
 
         self.kontrak_nomor_label = QLabel("Nomor: -")
-        self.kontrak_nomor_label.setStyleSheet("font-size: 12px; color: #2c3e50;")
+        set_role(self.kontrak_nomor_label, "body")
         kontrak_layout.addWidget(self.kontrak_nomor_label)
 
         self.kontrak_tanggal_label = QLabel("Tanggal: -")
-        self.kontrak_tanggal_label.setStyleSheet("font-size: 12px; color: #7f8c8d;")
+        set_role(self.kontrak_tanggal_label, "muted")
         kontrak_layout.addWidget(self.kontrak_tanggal_label)
 
         self.kontrak_nilai_label = QLabel("Nilai: -")
-        self.kontrak_nilai_label.setStyleSheet("font-size: 12px; font-weight: bold; color: #3498db;")
+        set_role(self.kontrak_nilai_label, "subheading", tone="primary")
         kontrak_layout.addWidget(self.kontrak_nilai_label)
 
         layout.addWidget(kontrak_frame)
@@ -4,11 +4,7 @@ PPK DOCUMENT FACTORY - LS List Page
 List page for Pembayaran Langsung (LS) transactions.
 """
 
-from PySide6.QtWidgets import QTableWidgetItem
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QColor
-
-from .base_list_page import BaseListPage, format_rupiah
+from .base_list_page import BaseListPage, ListColumn, ALIGN_RIGHT, format_rupiah
 
 
 class LSListPage(BaseListPage):
@@ -21,46 +17,16 @@ class LSListPage(BaseListPage):
     def _get_icon(self) -> str:
         return "S"  # Send icon placeholder
 
-    def _get_columns(self):
+    def _get_column_defs(self):
         """Override columns to include penyedia."""
-        return ["No", "Kode", "Nama Kegiatan", "Penyedia", "Nilai Kontrak", "Fase", "Status"]
-
-    def _set_row_data(self, row: int, item: dict):
-        """Override to add penyedia column."""
-        # No
-        no_item = QTableWidgetItem(str(row + 1))
-        no_item.setTextAlignment(Qt.AlignCenter)
-        self.table.setItem(row, 0, no_item)
-
-        # Kode
-        kode_item = QTableWidgetItem(item.get('kode_transaksi', '-'))
-        self.table.setItem(row, 1, kode_item)
-
-        # Nama
-        nama_item = QTableWidgetItem(item.get('nama_kegiatan', '-'))
-        self.table.setItem(row, 2, nama_item)
-
-        # Penyedia
-        penyedia = item.get('penyedia_nama', '-')
-        penyedia_item = QTableWidgetItem(penyedia)
-        self.table.setItem(row, 3, penyedia_item)
-
-        # Nilai Kontrak
-        nilai = item.get('nilai_kontrak', 0) or item.get('estimasi_biaya', 0)
-        nilai_item = QTableWidgetItem(format_rupiah(nilai))
-        nilai_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        self.table.setItem(row, 4, nilai_item)
-
-        # Fase
-        fase = item.get('fase_aktif', 1)
-        fase_item = QTableWidgetItem(f"Fase {fase}")
-        fase_item.setTextAlignment(Qt.AlignCenter)
-        self.table.setItem(row, 5, fase_item)
-
-        # Status
-        status = item.get('status', 'draft')
-        status_item = QTableWidgetItem(status.title())
-        status_item.setTextAlignment(Qt.AlignCenter)
-        color = self.STATUS_COLORS.get(status, "#bdc3c7")
-        status_item.setForeground(QColor(color))
-        self.table.setItem(row, 6, status_item)
+        return [
+            self._col_no(),
+            self._col_kode(),
+            self._col_nama(),
+            ListColumn('penyedia_nama', 'Penyedia', width=120),
+            ListColumn('nilai_kontrak', 'Nilai Kontrak', width=130,
+                       value=lambda row: row.get('nilai_kontrak', 0) or row.get('estimasi_biaya', 0),
+                       formatter=format_rupiah, alignment=ALIGN_RIGHT),
+            self._col_fase(),
+            self._col_status(),
+        ]
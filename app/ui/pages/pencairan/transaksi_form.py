@@ -15,6 +15,7 @@ from typing import Dict, Any, Optional
 
 from ....models.pencairan_models import JENIS_BELANJA, BATAS_UP_MAKSIMAL
 from ...components.dipa_selector import DipaSelectionWidget
+from ...themes import MEKANISME_TONE, set_role
 
 
 def format_rupiah(value: float) -> str:
@@ -36,12 +37,6 @@ class TransaksiFormPage(QWidget):
     saved = Signal(dict)
     cancelled = Signal()
 
-    MEKANISME_COLORS = {
-        "UP": "#27ae60",
-        "TUP": "#f39c12",
-        "LS": "#3498db",
-    }
-
     def __init__(self, mekanisme: str = "UP", parent=None):
         super().__init__(parent)
         self.mekanisme = mekanisme.upper()
@@ -58,12 +53,6 @@ class TransaksiFormPage(QWidget):
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-        """)
 
         content = QWidget()
         main_layout = QVBoxLayout(content)
@@ -76,13 +65,8 @@ class TransaksiFormPage(QWidget):
 
         # Form sections
         form_frame = QFrame()
-        form_frame.setStyleSheet("""
-            QFrame {
-                background-color: #ffffff;
-                border-radius: 8px;
-                border: 1px solid #ecf0f1;
-            }
-        """)
+        form_frame.setObjectName("transaksiForm")
+        set_role(form_frame, "card")
 
         form_layout = QVBoxLayout(form_frame)
         form_layout.setContentsMargins(20, 20, 20, 20)
@@ -137,17 +121,7 @@ class TransaksiFormPage(QWidget):
         # Back button
         back_btn = QPushButton("< Kembali")
         back_btn.setCursor(Qt.PointingHandCursor)
-        back_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #3498db;
-                border: none;
-                font-size: 13px;
-            }
-            QPushButton:hover {
-                color: #2980b9;
-            }
-        """)
+        set_role(back_btn, "link")
         back_btn.clicked.connect(self.cancelled.emit)
         layout.addWidget(back_btn)
 
@@ -156,41 +130,22 @@ class TransaksiFormPage(QWidget):
         # Title
         title_text = "Edit Transaksi" if self._is_edit else f"Buat {self.mekanisme} Baru"
         title = QLabel(title_text)
-        title.setStyleSheet("""
-            font-size: 20px;
-            font-weight: bold;
-            color: #2c3e50;
-        """)
+        set_role(title, "page-title")
         layout.addWidget(title)
 
         layout.addStretch()
 
         # Mekanisme badge
-        color = self.MEKANISME_COLORS.get(self.mekanisme, "#3498db")
         badge = QLabel(self.mekanisme)
-        badge.setStyleSheet(f"""
-            background-color: {color};
-            color: white;
-            border-radius: 12px;
-            padding: 4px 12px;
-            font-weight: bold;
-        """)
+        set_role(badge, "badge", tone=MEKANISME_TONE.get(self.mekanisme, "primary"),
+                 size="large")
         layout.addWidget(badge)
 
         return header
 
     def _create_section_title(self, title: str) -> QLabel:
         """Create section title label."""
-        label = QLabel(title)
-        label.setStyleSheet("""
-            font-size: 14px;
-            font-weight: bold;
-            color: #2c3e50;
-            padding-bottom: 10px;
-            border-bottom: 1px solid #ecf0f1;
-            margin-bottom: 10px;
-        """)
-        return label
+        return set_role(QLabel(title), "section-title")
 
     def _create_basic_section(self) -> QWidget:
         """Create basic info section."""
@@ -208,21 +163,20 @@ class TransaksiFormPage(QWidget):
         # Nama Kegiatan
         self.nama_input = QLineEdit()
         self.nama_input.setPlaceholderText("Contoh: Rapat Koordinasi Tim Teknis")
-        self.nama_input.setStyleSheet(self._get_input_style())
+        set_role(self.nama_input, "form-input")
         form_layout.addRow("Nama Kegiatan *", self.nama_input)
 
         # Jenis Belanja
         self.jenis_combo = QComboBox()
         for jenis in JENIS_BELANJA:
             self.jenis_combo.addItem(jenis['nama'], jenis['kode'])
-        self.jenis_combo.setStyleSheet(self._get_input_style())
+        set_role(self.jenis_combo, "form-input")
         form_layout.addRow("Jenis Belanja *", self.jenis_combo)
 
         # Kode Akun (read-only, auto-fill dari MAK DIPA)
         self.akun_input = QLineEdit()
         self.akun_input.setReadOnly(True)
         self.akun_input.setPlaceholderText("MAK akan terisi otomatis dari DIPA...")
-        self.akun_input.setStyleSheet("background-color: #ecf0f1; padding: 5px; border: 1px solid #bdc3c7;")
         form_layout.addRow("Kode Akun", self.akun_input)
 
         layout.addLayout(form_layout)
@@ -257,17 +211,12 @@ class TransaksiFormPage(QWidget):
         self.estimasi_input.setPrefix("Rp ")
         self.estimasi_input.setGroupSeparatorShown(True)
         self.estimasi_input.setReadOnly(True)
-        self.estimasi_input.setStyleSheet(self._get_input_style() + """
-            QDoubleSpinBox {
-                background-color: #ecf0f1;
-            }
-        """)
+        set_role(self.estimasi_input, "form-input")
         form_layout.addRow("Estimasi Biaya *", self.estimasi_input)
 
         # Kode MAK (read-only, dari DIPA)
         self.kode_mak_input = QLineEdit()
         self.kode_mak_input.setReadOnly(True)
-        self.kode_mak_input.setStyleSheet("background-color: #ecf0f1; padding: 5px; border: 1px solid #bdc3c7;")
         self.kode_mak_input.setPlaceholderText("MAK akan terisi otomatis dari DIPA...")
         form_layout.addRow("Kode MAK/Akun *", self.kode_mak_input)
 
@@ -275,13 +224,13 @@ class TransaksiFormPage(QWidget):
         self.ket_mak_input = QTextEdit()
         self.ket_mak_input.setPlaceholderText("Deskripsi dari item DIPA terpilih (opsional)")
         self.ket_mak_input.setMaximumHeight(80)
-        self.ket_mak_input.setStyleSheet(self._get_input_style())
+        set_role(self.ket_mak_input, "form-input")
         form_layout.addRow("Uraian Kegiatan (MAK)", self.ket_mak_input)
 
         # Warning for UP limit
         if self.mekanisme == "UP":
             warning = QLabel(f"Maksimal UP: {format_rupiah(BATAS_UP_MAKSIMAL)}")
-            warning.setStyleSheet("font-size: 11px; color: #f39c12; font-style: italic;")
+            set_role(warning, "hint", tone="warning")
             form_layout.addRow("", warning)
 
         # Tanggal kegiatan
@@ -290,14 +239,14 @@ class TransaksiFormPage(QWidget):
         self.tgl_mulai_input = QDateEdit()
         self.tgl_mulai_input.setCalendarPopup(True)
         self.tgl_mulai_input.setDate(QDate.currentDate())
-        self.tgl_mulai_input.setStyleSheet(self._get_input_style())
+        set_role(self.tgl_mulai_input, "form-input")
         date_layout.addWidget(QLabel("Mulai:"))
         date_layout.addWidget(self.tgl_mulai_input)
 
         self.tgl_selesai_input = QDateEdit()
         self.tgl_selesai_input.setCalendarPopup(True)
         self.tgl_selesai_input.setDate(QDate.currentDate())
-        self.tgl_selesai_input.setStyleSheet(self._get_input_style())
+        set_role(self.tgl_selesai_input, "form-input")
         date_layout.addWidget(QLabel("Selesai:"))
         date_layout.addWidget(self.tgl_selesai_input)
 
@@ -326,30 +275,12 @@ class TransaksiFormPage(QWidget):
 
         self.rb_kontrak = QRadioButton("Kontrak/SPK (Pengadaan)")
         self.rb_kontrak.setChecked(True)
-        self.rb_kontrak.setStyleSheet("""
-            QRadioButton {
-                font-size: 13px;
-                padding: 8px 15px;
-            }
-            QRadioButton::indicator {
-                width: 18px;
-                height: 18px;
-            }
-        """)
+        set_role(self.rb_kontrak, "option")
         self.ls_mode_group.addButton(self.rb_kontrak, 1)
         mode_layout.addWidget(self.rb_kontrak)
 
         self.rb_surat_tugas = QRadioButton("Surat Tugas (Perjalanan Dinas)")
-        self.rb_surat_tugas.setStyleSheet("""
-            QRadioButton {
-                font-size: 13px;
-                padding: 8px 15px;
-            }
-            QRadioButton::indicator {
-                width: 18px;
-                height: 18px;
-            }
-        """)
+        set_role(self.rb_surat_tugas, "option")
         self.ls_mode_group.addButton(self.rb_surat_tugas, 2)
         mode_layout.addWidget(self.rb_surat_tugas)
 
@@ -375,14 +306,14 @@ class TransaksiFormPage(QWidget):
         # Nomor Kontrak
         self.kontrak_nomor_input = QLineEdit()
         self.kontrak_nomor_input.setPlaceholderText("Contoh: 001/SPK/2026")
-        self.kontrak_nomor_input.setStyleSheet(self._get_input_style())
+        set_role(self.kontrak_nomor_input, "form-input")
         kontrak_form.addRow("Nomor Kontrak/SPK *", self.kontrak_nomor_input)
 
         # Tanggal Kontrak
         self.kontrak_tgl_input = QDateEdit()
         self.kontrak_tgl_input.setCalendarPopup(True)
         self.kontrak_tgl_input.setDate(QDate.currentDate())
-        self.kontrak_tgl_input.setStyleSheet(self._get_input_style())
+        set_role(self.kontrak_tgl_input, "form-input")
         kontrak_form.addRow("Tanggal Kontrak *", self.kontrak_tgl_input)
 
         # Nilai Kontrak
@@ -391,7 +322,7 @@ class TransaksiFormPage(QWidget):
         self.nilai_kontrak_input.setDecimals(0)
         self.nilai_kontrak_input.setPrefix("Rp ")
         self.nilai_kontrak_input.setGroupSeparatorShown(True)
-        self.nilai_kontrak_input.setStyleSheet(self._get_input_style())
+        set_role(self.nilai_kontrak_input, "form-input")
         kontrak_form.addRow("Nilai Kontrak *", self.nilai_kontrak_input)
 
         kontrak_layout.addLayout(kontrak_form)
@@ -410,20 +341,20 @@ class TransaksiFormPage(QWidget):
         # Nomor Surat Tugas
         self.st_nomor_input = QLineEdit()
         self.st_nomor_input.setPlaceholderText("Contoh: 001/ST/2026")
-        self.st_nomor_input.setStyleSheet(self._get_input_style())
+        set_role(self.st_nomor_input, "form-input")
         st_form.addRow("Nomor Surat Tugas *", self.st_nomor_input)
 
         # Tanggal Surat Tugas
         self.st_tgl_input = QDateEdit()
         self.st_tgl_input.setCalendarPopup(True)
         self.st_tgl_input.setDate(QDate.currentDate())
-        self.st_tgl_input.setStyleSheet(self._get_input_style())
+        set_role(self.st_tgl_input, "form-input")
         st_form.addRow("Tanggal Surat Tugas *", self.st_tgl_input)
 
         # Tujuan Perjalanan
         self.st_tujuan_input = QLineEdit()
         self.st_tujuan_input.setPlaceholderText("Contoh: Jakarta - Rapat Koordinasi di Kemenkeu")
-        self.st_tujuan_input.setStyleSheet(self._get_input_style())
+        set_role(self.st_tujuan_input, "form-input")
         st_form.addRow("Tujuan Perjalanan *", self.st_tujuan_input)
 
         # Tanggal Perjalanan
@@ -432,14 +363,14 @@ class TransaksiFormPage(QWidget):
         self.st_tgl_berangkat = QDateEdit()
         self.st_tgl_berangkat.setCalendarPopup(True)
         self.st_tgl_berangkat.setDate(QDate.currentDate())
-        self.st_tgl_berangkat.setStyleSheet(self._get_input_style())
+        set_role(self.st_tgl_berangkat, "form-input")
         date_pjd_layout.addWidget(QLabel("Berangkat:"))
         date_pjd_layout.addWidget(self.st_tgl_berangkat)
 
         self.st_tgl_kembali = QDateEdit()
         self.st_tgl_kembali.setCalendarPopup(True)
         self.st_tgl_kembali.setDate(QDate.currentDate())
-        self.st_tgl_kembali.setStyleSheet(self._get_input_style())
+        set_role(self.st_tgl_kembali, "form-input")
         date_pjd_layout.addWidget(QLabel("Kembali:"))
         date_pjd_layout.addWidget(self.st_tgl_kembali)
 
@@ -451,7 +382,7 @@ class TransaksiFormPage(QWidget):
         self.st_biaya_input.setDecimals(0)
         self.st_biaya_input.setPrefix("Rp ")
         self.st_biaya_input.setGroupSeparatorShown(True)
-        self.st_biaya_input.setStyleSheet(self._get_input_style())
+        set_role(self.st_biaya_input, "form-input")
         st_form.addRow("Estimasi Biaya *", self.st_biaya_input)
 
         st_layout.addLayout(st_form)
@@ -499,7 +430,7 @@ class TransaksiFormPage(QWidget):
 
         # Nama - ComboBox dari data pegawai
         self.penerima_nama_combo = QComboBox()
-        self.penerima_nama_combo.setStyleSheet(self._get_input_style())
+        set_role(self.penerima_nama_combo, "form-input")
         self.penerima_nama_combo.setEditable(False)
         self.penerima_nama_combo.addItem("-- Pilih Pegawai --", None)
         
@@ -514,14 +445,14 @@ class TransaksiFormPage(QWidget):
         # NIP (read-only, akan di-auto-fill)
         self.penerima_nip_input = QLineEdit()
         self.penerima_nip_input.setPlaceholderText("NIP 18 digit")
-        self.penerima_nip_input.setStyleSheet(self._get_input_style())
+        set_role(self.penerima_nip_input, "form-input")
         self.penerima_nip_input.setReadOnly(False)
         form_layout.addRow("NIP", self.penerima_nip_input)
 
         # Jabatan (read-only, akan di-auto-fill)
         self.penerima_jabatan_input = QLineEdit()
         self.penerima_jabatan_input.setPlaceholderText("Jabatan penerima")
-        self.penerima_jabatan_input.setStyleSheet(self._get_input_style())
+        set_role(self.penerima_jabatan_input, "form-input")
         self.penerima_jabatan_input.setReadOnly(False)
         form_layout.addRow("Jabatan", self.penerima_jabatan_input)
 
@@ -545,12 +476,12 @@ class TransaksiFormPage(QWidget):
         # Penyedia dropdown (would be populated from database)
         self.penyedia_combo = QComboBox()
         self.penyedia_combo.addItem("-- Pilih Penyedia --", None)
-        self.penyedia_combo.setStyleSheet(self._get_input_style())
+        set_role(self.penyedia_combo, "form-input")
         form_layout.addRow("Penyedia *", self.penyedia_combo)
 
         # Or manual entry
         hint = QLabel("Atau tambah penyedia baru melalui menu Pengadaan > Data Penyedia")
-        hint.setStyleSheet("font-size: 11px; color: #7f8c8d; font-style: italic;")
+        set_role(hint, "hint")
         form_layout.addRow("", hint)
 
         layout.addLayout(form_layout)
@@ -575,27 +506,27 @@ class TransaksiFormPage(QWidget):
         self.dasar_jenis_combo.addItems([
             "SK KPA", "Surat Tugas", "Nota Dinas", "Undangan", "Lainnya"
         ])
-        self.dasar_jenis_combo.setStyleSheet(self._get_input_style())
+        set_role(self.dasar_jenis_combo, "form-input")
         form_layout.addRow("Jenis Dasar", self.dasar_jenis_combo)
 
         # Nomor
         self.dasar_nomor_input = QLineEdit()
         self.dasar_nomor_input.setPlaceholderText("Nomor SK/Surat Tugas")
-        self.dasar_nomor_input.setStyleSheet(self._get_input_style())
+        set_role(self.dasar_nomor_input, "form-input")
         form_layout.addRow("Nomor", self.dasar_nomor_input)
 
         # Tanggal
         self.dasar_tgl_input = QDateEdit()
         self.dasar_tgl_input.setCalendarPopup(True)
         self.dasar_tgl_input.setDate(QDate.currentDate())
-        self.dasar_tgl_input.setStyleSheet(self._get_input_style())
+        set_role(self.dasar_tgl_input, "form-input")
         form_layout.addRow("Tanggal", self.dasar_tgl_input)
 
         # Perihal
         self.dasar_perihal_input = QTextEdit()
         self.dasar_perihal_input.setPlaceholderText("Perihal/tentang...")
         self.dasar_perihal_input.setMaximumHeight(80)
-        self.dasar_perihal_input.setStyleSheet(self._get_input_style())
+        set_role(self.dasar_perihal_input, "form-input")
         form_layout.addRow("Perihal", self.dasar_perihal_input)
 
         layout.addLayout(form_layout)
@@ -613,72 +544,21 @@ class TransaksiFormPage(QWidget):
         # Cancel button
         cancel_btn = QPushButton("Batal")
         cancel_btn.setCursor(Qt.PointingHandCursor)
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #ecf0f1;
-                color: #2c3e50;
-                border: none;
-                padding: 12px 30px;
-                border-radius: 5px;
-                font-weight: 500;
-            }
-            QPushButton:hover {
-                background-color: #d5dbdb;
-            }
-        """)
+        set_role(cancel_btn, size="large")
         cancel_btn.clicked.connect(self.cancelled.emit)
         layout.addWidget(cancel_btn)
 
         # Save button
         save_text = "Simpan Perubahan" if self._is_edit else "Buat Transaksi"
-        color = self.MEKANISME_COLORS.get(self.mekanisme, "#3498db")
 
         save_btn = QPushButton(save_text)
         save_btn.setCursor(Qt.PointingHandCursor)
-        save_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {color};
-                color: white;
-                border: none;
-                padding: 12px 30px;
-                border-radius: 5px;
-                font-weight: 500;
-            }}
-            QPushButton:hover {{
-                background-color: {self._darken_color(color)};
-            }}
-        """)
+        set_role(save_btn, tone=MEKANISME_TONE.get(self.mekanisme, "primary"), size="large")
         save_btn.clicked.connect(self._on_save)
         layout.addWidget(save_btn)
 
         return actions
 
-    def _get_input_style(self) -> str:
-        """Get common input field style."""
-        return """
-            QLineEdit, QComboBox, QDoubleSpinBox, QDateEdit, QTextEdit {
-                background-color: #ffffff;
-                border: 1px solid #dcdfe6;
-                border-radius: 5px;
-                padding: 10px;
-                font-size: 13px;
-                min-width: 250px;
-            }
-            QLineEdit:focus, QComboBox:focus, QDoubleSpinBox:focus,
-            QDateEdit:focus, QTextEdit:focus {
-                border-color: #3498db;
-            }
-        """
-
-    def _darken_color(self, hex_color: str) -> str:
-        """Darken a hex color."""
-        darken_map = {
-            "#27ae60": "#1e8449",
-            "#f39c12": "#d68910",
-            "#3498db": "#2980b9",
-        }
-        return darken_map.get(hex_color, hex_color)
-
     def _load_pegawai_dropdown(self):
         """Load pegawai data dari database ke dropdown."""
         try:
@@ -0,0 +1,235 @@
+"""
+PPK DOCUMENT FACTORY - Transaksi Table Model
+=============================================
+Query-backed table model untuk halaman daftar transaksi (UP, TUP, LS).
+
+Filter (search, status, jenis) dan sorting dikirim ke query
+PencairanManager.list_transaksi, bukan disaring per baris di widget.
+Data dimuat per halaman (PAGE_SIZE) lewat canFetchMore/fetchMore saat
+tabel di-scroll, sehingga membuka/menyaring 20k transaksi sama cepatnya
+dengan 200.
+
+Karena filter dan sorting sudah dikerjakan SQL, tidak dipakai
+QSortFilterProxyModel; view langsung memakai model ini.
+
+Model ini juga dipakai tab PembayaranLainnyaManager dengan fetcher
+DatabaseManagerV4.list_* (filter tahun/kategori, tanpa mekanisme).
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QColor
+
+from app.ui.base.base_table import ColumnDef
+
+PAGE_SIZE = 100
+
+# fetcher(limit=, offset=, order_by=, descending=, **filters) -> (rows, total)
+Fetcher = Callable[..., Tuple[List[Dict[str, Any]], int]]
+
+
+@dataclass
+class ListColumn(ColumnDef):
+    """
+    ColumnDef untuk TransaksiTableModel.
+
+    key dipakai sebagai order_by list_transaksi saat kolom di-sort.
+
+    Attributes:
+        value: Function row -> nilai mentah (default: row[key])
+        foreground: Function nilai -> warna teks (hex) atau None
+        background: Function nilai -> warna latar (hex) atau None
+    """
+    value: Optional[Callable[[Dict[str, Any]], Any]] = None
+    foreground: Optional[Callable[[Any], Optional[str]]] = None
+    background: Optional[Callable[[Any], Optional[str]]] = None
+
+
+ROW_NUMBER_KEY = "_no"
+
+
+class TransaksiTableModel(QAbstractTableModel):
+    """
+    Table model dengan filter/sort di query dan pemuatan per halaman.
+
+    Usage:
+        model = TransaksiTableModel(columns, mekanisme="UP")
+        model.set_fetcher(db.list_transaksi)
+        model.reload()
+        model.set_filters(search="rapat", status="aktif")
+        view.setModel(model)
+    """
+
+    def __init__(self, columns: List[ListColumn], mekanisme: str = None,
+                 page_size: int = PAGE_SIZE, parent=None):
+        super().__init__(parent)
+        self._columns = columns
+        self._mekanisme = mekanisme
+        self._page_size = page_size
+        self._fetcher: Optional[Fetcher] = None
+        self._filters: Dict[str, Any] = {}
+        self._order_by: Optional[str] = None
+        self._descending = True
+        self._rows: List[Dict[str, Any]] = []
+        self._total = 0
+
+    # =========================================================================
+    # QUERY STATE
+    # =========================================================================
+
+    def set_fetcher(self, fetcher: Optional[Fetcher]):
+        """Set data source (mis. PencairanManager.list_transaksi); muat dengan reload()."""
+        self._fetcher = fetcher
+
+    def set_filters(self, **filters) -> bool:
+        """
+        Set filter (keyword argument fetcher, mis. search, status, tahun).
+
+        Nilai kosong/None berarti tanpa filter. Model dimuat ulang hanya
+        jika filter berubah.
+
+        Returns:
+            True jika filter berubah dan halaman pertama dimuat ulang
+        """
+        filters = {key: value for key, value in filters.items() if value}
+        if filters == self._filters:
+            return False
+        self._filters = filters
+        self.reload()
+        return True
+
+    def filters(self) -> Dict[str, Any]:
+        return dict(self._filters)
+
+    def reload(self):
+        """Muat ulang halaman pertama dengan filter/sort saat ini."""
+        self.beginResetModel()
+        self._rows = []
+        self._total = 0
+        if self._fetcher is not None:
+            self._rows, self._total = self._fetch(0)
+        self.endResetModel()
+
+    def set_rows(self, rows: List[Dict[str, Any]]):
+        """Tampilkan list statis (tanpa fetcher, tanpa halaman berikutnya)."""
+        self.beginResetModel()
+        self._fetcher = None
+        self._rows = list(rows)
+        self._total = len(self._rows)
+        self.endResetModel()
+
+    def _fetch(self, offset: int) -> Tuple[List[Dict[str, Any]], int]:
+        kwargs = dict(self._filters)
+        if self._mekanisme:
+            kwargs['mekanisme'] = self._mekanisme
+        if self._order_by:
+            kwargs['order_by'] = self._order_by
+            kwargs['descending'] = self._descending
+        return self._fetcher(limit=self._page_size, offset=offset, **kwargs)
+
+    # =========================================================================
+    # INCREMENTAL FETCH
+    # =========================================================================
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        if parent.isValid() or self._fetcher is None:
+            return False
+        return len(self._rows) < self._total
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        rows, total = self._fetch(len(self._rows))
+        self._total = total
+        if not rows:
+            # Data berkurang sejak halaman pertama; hentikan fetch
+            self._total = len(self._rows)
+            return
+        start = len(self._rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    # =========================================================================
+    # SORTING
+    # =========================================================================
+
+    def sort(self, column: int, order=Qt.SortOrder.AscendingOrder):
+        if not (0 <= column < len(self._columns)):
+            return
+        col = self._columns[column]
+        if not col.sortable or col.key == ROW_NUMBER_KEY:
+            return
+        self._order_by = col.key
+        self._descending = order == Qt.SortOrder.DescendingOrder
+        if self._fetcher is not None:
+            self.reload()
+
+    # =========================================================================
+    # DATA
+    # =========================================================================
+
+    def columns(self) -> List[ListColumn]:
+        return list(self._columns)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._columns)
+
+    def total_count(self) -> int:
+        """Jumlah baris yang cocok dengan filter (bukan hanya yang dimuat)."""
+        return self._total
+
+    def row_data(self, row: int) -> Optional[Dict[str, Any]]:
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    def _value(self, row: int, col: ListColumn) -> Any:
+        if col.key == ROW_NUMBER_KEY:
+            return row + 1
+        item = self._rows[row]
+        if col.value is not None:
+            return col.value(item)
+        return item.get(col.key)
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._rows):
+            return None
+        col = self._columns[index.column()]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            value = self._value(index.row(), col)
+            if col.formatter is not None:
+                return col.formatter(value)
+            return "-" if value is None or value == "" else str(value)
+
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return col.alignment
+
+        if role == Qt.ItemDataRole.ForegroundRole and col.foreground is not None:
+            color = col.foreground(self._value(index.row(), col))
+            return QColor(color) if color else None
+
+        if role == Qt.ItemDataRole.BackgroundRole and col.background is not None:
+            color = col.background(self._value(index.row(), col))
+            return QColor(color) if color else None
+
+        if role == Qt.ItemDataRole.UserRole:
+            return self._rows[index.row()].get('id')
+
+        return None
+
+    def headerData(self, section: int, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (role == Qt.ItemDataRole.DisplayRole
+                and orientation == Qt.Orientation.Horizontal
+                and 0 <= section < len(self._columns)):
+            return self._columns[section].header
+        return None
+
+
+__all__ = ['TransaksiTableModel', 'ListColumn', 'ROW_NUMBER_KEY', 'PAGE_SIZE']
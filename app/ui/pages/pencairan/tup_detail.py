@@ -9,6 +9,7 @@ from PySide6.QtWidgets import QVBoxLayout, QTabWidget
 
 from .base_detail_page import BaseDetailPage
 from ...components.countdown_widget import CountdownWidget
+from ...themes import set_role
 
 from typing import Dict, Any
 
@@ -24,13 +25,7 @@ class TUPDetailPage(BaseDetailPage):
         from PySide6.QtWidgets import QFrame, QVBoxLayout, QTabWidget
 
         panel = QFrame()
-        panel.setStyleSheet("""
-            QFrame {
-                background-color: #ffffff;
-                border-radius: 8px;
-                border: 1px solid #ecf0f1;
-            }
-        """)
+        set_role(panel, "card")
 
         layout = QVBoxLayout(panel)
         layout.setContentsMargins(15, 15, 15, 15)
@@ -42,25 +37,7 @@ class TUPDetailPage(BaseDetailPage):
 
         # Tabs for different sections
         tabs = QTabWidget()
-        tabs.setStyleSheet("""
-            QTabWidget::pane {
-                border: none;
-                background-color: transparent;
-            }
-            QTabBar::tab {
-                background-color: #f5f6fa;
-                color: #7f8c8d;
-                padding: 8px 16px;
-                margin-right: 2px;
-                border-top-left-radius: 5px;
-                border-top-right-radius: 5px;
-            }
-            QTabBar::tab:selected {
-                background-color: #ffffff;
-                color: #f39c12;
-                font-weight: 500;
-            }
-        """)
+        set_role(tabs, "plain")
 
         # Info tab
         info_widget = self._create_info_tab()
@@ -633,14 +633,7 @@ class PegawaiManager(QDialog):
         if not pegawai_id:
             return
         
-        with self.db.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                UPDATE pegawai SET is_active = 1, updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-            """, (pegawai_id,))
-            conn.commit()
-        
+        self.db.activate_pegawai(pegawai_id)
         self.load_data()
         self.pegawai_changed.emit()
     
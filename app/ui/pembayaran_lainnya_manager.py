@@ -5,6 +5,10 @@ Manager untuk pembayaran:
 - SK KPA (Surat Keputusan Kuasa Pengguna Anggaran)
 - Honorarium (Reguler & Insidentil)
 - Jamuan Tamu
+- Honorarium Pengelola Keuangan
+
+Tab dibangun saat pertama kali dibuka dan datanya di-page dari database
+(DatabaseManagerV4.list_*), sehingga waktu buka tidak bergantung jumlah data.
 """
 
 import os
@@ -15,14 +19,25 @@ from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QGridLayout,
     QWidget, QPushButton, QLabel, QLineEdit, QTextEdit, QComboBox,
     QTableWidget, QTableWidgetItem, QHeaderView, QGroupBox,
-    QMessageBox, QCheckBox, QFrame, QTabWidget,
+    QMessageBox, QCheckBox, QFrame, QTabWidget, QTableView, QMenu,
     QAbstractItemView, QDateEdit, QSpinBox, QDoubleSpinBox, QScrollArea
 )
-from PySide6.QtCore import Qt, Signal, QDate, QLocale
+from PySide6.QtCore import Qt, Signal, QDate, QLocale, QTimer
 from PySide6.QtGui import QColor
 
 from app.core.database_v4 import get_db_manager_v4
+from app.core.master_data import get_master_data, format_nama_pegawai
 from app.core.config import SATKER_DEFAULT, TAHUN_ANGGARAN, OUTPUT_DIR
+from app.services.document_bundles import BundlePipeline, JAMUAN_TAMU_BUNDLE
+from app.ui.dialogs.bundle_generate_dialog import BundleGenerateDialog
+from app.ui.master_data_models import bind_pegawai_combo, select_pegawai
+from app.core.events import (
+    TOPIC_SK_KPA, TOPIC_HONORARIUM, TOPIC_JAMUAN_TAMU, TOPIC_HONOR_PENGELOLA,
+)
+from app.ui.data_change_notifier import DataChangeNotifier
+from app.ui.pages.pencairan.base_list_page import ALIGN_RIGHT, SEARCH_DEBOUNCE_MS
+from app.ui.pages.pencairan.transaksi_table_model import TransaksiTableModel, ListColumn
+from app.ui.themes import set_role
 
 
 # ============================================================================
@@ -127,7 +142,7 @@ class SKKPADialog(QDialog):
         layout.addLayout(form)
 
         # Pejabat Group - ambil dari master data
-        pejabat = self.db.get_satker_pejabat()
+        pejabat = get_master_data(self.db.db_path).get_satker_pejabat()
         pejabat_group = QGroupBox("Data Pejabat")
         pejabat_form = QFormLayout()
 
@@ -409,7 +424,7 @@ class HonorariumDialog(QDialog):
         scroll_layout.addWidget(dana_group)
 
         # Pejabat - Hybrid approach dengan ComboBox dan editable text
-        pejabat_default = self.db.get_satker_pejabat()
+        pejabat_default = get_master_data(self.db.db_path).get_satker_pejabat()
         pejabat_group = QGroupBox("Pejabat")
         pejabat_form = QFormLayout()
 
@@ -517,49 +532,21 @@ class HonorariumDialog(QDialog):
         self.spn_total_netto.setValue(self.spn_total_bruto.value() - self.spn_total_pajak.value())
 
     def _load_kpa_combo(self):
-        """Load KPA pegawai into combo box"""
-        self.cmb_kpa.clear()
-        self.cmb_kpa.addItem("-- Pilih KPA --", None)
-        try:
-            pegawai_list = self.db.get_pegawai_by_role('kpa')
-            for p in pegawai_list:
-                nama = self._format_nama(p)
-                self.cmb_kpa.addItem(nama, p)
-        except Exception as e:
-            print(f"Error loading KPA: {e}")
+        """Load KPA pegawai into combo box (model bersama)"""
+        bind_pegawai_combo(self.cmb_kpa, 'kpa', "-- Pilih KPA --", db_path=self.db.db_path)
 
     def _load_ppk_combo(self):
-        """Load PPK pegawai into combo box"""
-        self.cmb_ppk.clear()
-        self.cmb_ppk.addItem("-- Pilih PPK --", None)
-        try:
-            pegawai_list = self.db.get_pegawai_by_role('ppk')
-            for p in pegawai_list:
-                nama = self._format_nama(p)
-                self.cmb_ppk.addItem(nama, p)
-        except Exception as e:
-            print(f"Error loading PPK: {e}")
+        """Load PPK pegawai into combo box (model bersama)"""
+        bind_pegawai_combo(self.cmb_ppk, 'ppk', "-- Pilih PPK --", db_path=self.db.db_path)
 
     def _load_bendahara_combo(self):
-        """Load Bendahara pegawai into combo box"""
-        self.cmb_bendahara.clear()
-        self.cmb_bendahara.addItem("-- Pilih Bendahara --", None)
-        try:
-            pegawai_list = self.db.get_pegawai_by_role('bendahara')
-            for p in pegawai_list:
-                nama = self._format_nama(p)
-                self.cmb_bendahara.addItem(nama, p)
-        except Exception as e:
-            print(f"Error loading Bendahara: {e}")
+        """Load Bendahara pegawai into combo box (model bersama)"""
+        bind_pegawai_combo(self.cmb_bendahara, 'bendahara', "-- Pilih Bendahara --",
+                           db_path=self.db.db_path)
 
     def _format_nama(self, p: dict) -> str:
         """Format nama pegawai dengan gelar"""
-        nama = p.get('nama', '')
-        if p.get('gelar_depan'):
-            nama = f"{p['gelar_depan']} {nama}"
-        if p.get('gelar_belakang'):
-            nama = f"{nama}, {p['gelar_belakang']}"
-        return nama
+        return format_nama_pegawai(p)
 
     def _on_kpa_selected(self, index):
         data = self.cmb_kpa.currentData()
@@ -583,11 +570,7 @@ class HonorariumDialog(QDialog):
         """Helper to set ComboBox selection by pegawai ID"""
         if not pegawai_id:
             return
-        for i in range(combo.count()):
-            data = combo.itemData(i)
-            if data and isinstance(data, dict) and data.get('id') == pegawai_id:
-                combo.setCurrentIndex(i)
-                return
+        select_pegawai(combo, pegawai_id)
 
     def load_data(self):
         d = self.hon_data
@@ -641,6 +624,14 @@ class HonorariumDialog(QDialog):
         self.spn_total_pajak.setValue(d.get('total_pajak', 0))
         self.spn_total_netto.setValue(d.get('total_netto', 0))
 
+        # Total dihitung database dari rincian penerima
+        if d.get('jumlah_penerima'):
+            tooltip = f"Dihitung dari {d['jumlah_penerima']} rincian penerima"
+            for spn in (self.spn_total_bruto, self.spn_total_pajak):
+                spn.setReadOnly(True)
+                spn.setStyleSheet("background-color: #ecf0f1;")
+                spn.setToolTip(tooltip)
+
         self.txt_keterangan.setPlainText(d.get('keterangan', ''))
 
     def save_data(self):
@@ -941,7 +932,7 @@ class JamuanTamuDialog(QDialog):
             return
 
         # Get pejabat from satker settings
-        pejabat = self.db.get_satker_pejabat()
+        pejabat = get_master_data(self.db.db_path).get_satker_pejabat()
 
         data = {
             'tahun_anggaran': self.spn_tahun.value(),
@@ -1097,7 +1088,7 @@ class HonorariumPengelolaDialog(QDialog):
 
     def load_pegawai(self):
         """Load pegawai list"""
-        pegawai = self.db.get_all_pegawai(active_only=True)
+        pegawai = get_master_data(self.db.db_path).all_pegawai()
         for p in pegawai:
             display = f"{p['nama']} - {p.get('nip', 'N/A')}"
             self.cmb_pegawai.addItem(display, p['id'])
@@ -1105,7 +1096,7 @@ class HonorariumPengelolaDialog(QDialog):
     def on_jabatan_changed(self):
         """Auto-fill pegawai from satker settings"""
         jabatan = self.cmb_jabatan.currentData()
-        satker = self.db.get_satker_pejabat()
+        satker = get_master_data(self.db.db_path).get_satker_pejabat()
 
         pegawai_id = None
         if jabatan == 'KPA':
@@ -1118,10 +1109,9 @@ class HonorariumPengelolaDialog(QDialog):
             pegawai_id = satker.get('bendahara_id')
 
         if pegawai_id:
-            for i in range(self.cmb_pegawai.count()):
-                if self.cmb_pegawai.itemData(i) == pegawai_id:
-                    self.cmb_pegawai.setCurrentIndex(i)
-                    break
+            idx = self.cmb_pegawai.findData(pegawai_id)
+            if idx >= 0:
+                self.cmb_pegawai.setCurrentIndex(idx)
 
     def calc_netto(self):
         """Calculate netto amount"""
@@ -1146,10 +1136,9 @@ class HonorariumPengelolaDialog(QDialog):
 
         pegawai_id = self.hpk_data.get('pegawai_id')
         if pegawai_id:
-            for i in range(self.cmb_pegawai.count()):
-                if self.cmb_pegawai.itemData(i) == pegawai_id:
-                    self.cmb_pegawai.setCurrentIndex(i)
-                    break
+            idx = self.cmb_pegawai.findData(pegawai_id)
+            if idx >= 0:
+                self.cmb_pegawai.setCurrentIndex(idx)
 
         self.spn_jumlah.setValue(self.hpk_data.get('jumlah', 0))
         self.spn_pajak.setValue(self.hpk_data.get('pajak', 0))
@@ -1278,666 +1267,498 @@ class ImportFADialog(QDialog):
 # GENERATE JAMUAN TAMU DOCUMENT DIALOG
 # ============================================================================
 
-class GenerateJTDocumentDialog(QDialog):
+class GenerateJTDocumentDialog(BundleGenerateDialog):
     """Dialog for generating Jamuan Tamu documents"""
 
     def __init__(self, jt_data: dict, parent=None):
-        super().__init__(parent)
-        self.jt_data = jt_data
-        self.db = get_db_manager_v4()
-
-        self.setWindowTitle("Generate Dokumen Jamuan Tamu")
+        super().__init__(
+            JAMUAN_TAMU_BUNDLE, jt_data,
+            info_rows=[("Kegiatan:", jt_data.get('nama_kegiatan', '-')),
+                       ("Tanggal:", str(jt_data.get('tanggal_kegiatan', '-'))),
+                       ("Tamu:", jt_data.get('nama_tamu', '-'))],
+            info_title="Informasi Jamuan Tamu",
+            # Checklist sesuai Kepmen KP 56/2025
+            doc_title="Pilih Dokumen (Kepmen KP 56/2025)",
+            pipeline=BundlePipeline(db_path=get_db_manager_v4().db_path),
+            parent=parent,
+        )
         self.setMinimumWidth(450)
-        self.setup_ui()
-
-    def setup_ui(self):
-        layout = QVBoxLayout(self)
-
-        # Info
-        info_group = QGroupBox("Informasi Jamuan Tamu")
-        info_form = QFormLayout()
-        info_form.addRow("Kegiatan:", QLabel(self.jt_data.get('nama_kegiatan', '-')))
-        info_form.addRow("Tanggal:", QLabel(str(self.jt_data.get('tanggal_kegiatan', '-'))))
-        info_form.addRow("Tamu:", QLabel(self.jt_data.get('nama_tamu', '-')))
-        info_group.setLayout(info_form)
-        layout.addWidget(info_group)
-
-        # Document checkboxes - sesuai Kepmen KP 56/2025
-        doc_group = QGroupBox("Pilih Dokumen (Kepmen KP 56/2025)")
-        doc_layout = QVBoxLayout()
-
-        # Info label
-        info_label = QLabel("Checklist kelengkapan dokumen Jamuan Tamu:")
-        info_label.setStyleSheet("font-style: italic; color: #7f8c8d;")
-        doc_layout.addWidget(info_label)
-
-        self.chk_kuitansi = QCheckBox("💰 Kuitansi Jamuan Tamu")
-        self.chk_kuitansi.setChecked(True)
-        doc_layout.addWidget(self.chk_kuitansi)
-
-        self.chk_daftar_hadir = QCheckBox("📋 Daftar Hadir")
-        self.chk_daftar_hadir.setChecked(True)
-        doc_layout.addWidget(self.chk_daftar_hadir)
-
-        self.chk_laporan = QCheckBox("📊 Laporan Kegiatan Jamuan Tamu")
-        self.chk_laporan.setChecked(True)
-        doc_layout.addWidget(self.chk_laporan)
-
-        # Separator
-        line = QFrame()
-        line.setFrameShape(QFrame.HLine)
-        line.setStyleSheet("color: #bdc3c7;")
-        doc_layout.addWidget(line)
-
-        # Catatan dokumen pendukung
-        note_label = QLabel("Dokumen pendukung (disiapkan manual):")
-        note_label.setStyleSheet("font-weight: bold; margin-top: 5px;")
-        doc_layout.addWidget(note_label)
-
-        note_items = QLabel("• Faktur/Nota/Bon dari restoran/katering\n"
-                           "• Foto tagging menu makanan\n"
-                           "• Foto tagging jumlah peserta")
-        note_items.setStyleSheet("color: #7f8c8d; margin-left: 10px;")
-        doc_layout.addWidget(note_items)
-
-        doc_group.setLayout(doc_layout)
-        layout.addWidget(doc_group)
-
-        # Buttons
-        btn_layout = QHBoxLayout()
-        btn_layout.addStretch()
-
-        btn_generate = QPushButton("🖨️ Generate Dokumen")
-        btn_generate.setStyleSheet("background-color: #27ae60; color: white; padding: 10px 20px;")
-        btn_generate.clicked.connect(self.generate)
-        btn_layout.addWidget(btn_generate)
-
-        btn_cancel = QPushButton("Batal")
-        btn_cancel.clicked.connect(self.reject)
-        btn_layout.addWidget(btn_cancel)
-
-        layout.addLayout(btn_layout)
-
-    def generate(self):
-        """Generate selected documents"""
-        import os
-        import traceback
-        from app.core.config import WORD_TEMPLATES_DIR, OUTPUT_DIR, TAHUN_ANGGARAN
-
-        generated = []
-        errors = []
-
-        try:
-            from app.templates.engine import get_template_engine
-            engine = get_template_engine()
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Gagal load template engine:\n{str(e)}\n\n{traceback.format_exc()}")
-            return
-
-        # Prepare placeholders
-        try:
-            placeholders = self._prepare_placeholders()
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Gagal menyiapkan data:\n{str(e)}\n\n{traceback.format_exc()}")
-            return
-
-        # Output folder
-        try:
-            output_folder = os.path.join(
-                OUTPUT_DIR,
-                str(TAHUN_ANGGARAN),
-                "Jamuan_Tamu",
-                f"JT_{self.jt_data['id']}_{self.jt_data.get('nama_kegiatan', 'unknown')[:20]}"
-            )
-            os.makedirs(output_folder, exist_ok=True)
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Gagal membuat folder output:\n{str(e)}")
-            return
-
-        # Generate each selected document - sesuai Kepmen KP 56/2025
-        docs_to_generate = []
-        if self.chk_kuitansi.isChecked():
-            docs_to_generate.append(('kuitansi_jamuan_tamu', 'Kuitansi_Jamuan_Tamu', 'word'))
-        if self.chk_daftar_hadir.isChecked():
-            docs_to_generate.append(('daftar_hadir_jamuan_tamu', 'Daftar_Hadir', 'word'))
-        if self.chk_laporan.isChecked():
-            docs_to_generate.append(('laporan_jamuan_tamu', 'Laporan_Kegiatan', 'word'))
-
-        if not docs_to_generate:
-            QMessageBox.warning(self, "Peringatan", "Pilih minimal satu dokumen untuk di-generate!")
-            return
-
-        for template_name, output_name, doc_type in docs_to_generate:
-            try:
-                template_path = os.path.join(WORD_TEMPLATES_DIR, f"{template_name}.docx")
-                output_path = os.path.join(output_folder, f"{output_name}.docx")
-
-                # Check if template exists
-                if not os.path.exists(template_path):
-                    errors.append(f"{output_name}: Template tidak ditemukan di {template_path}")
-                    continue
-
-                engine.merge_word(
-                    template_path=template_path,
-                    data=placeholders,
-                    output_path=output_path
-                )
-                generated.append(output_name)
-            except Exception as e:
-                errors.append(f"{output_name}: {str(e)}\n{traceback.format_exc()}")
-
-        # Show result
-        if generated:
-            msg = f"Berhasil generate {len(generated)} dokumen:\n"
-            msg += "\n".join([f"✅ {d}" for d in generated])
-            if errors:
-                msg += f"\n\n⚠️ Error:\n" + "\n".join(errors)
-            msg += f"\n\n📁 Output: {output_folder}"
-
-            QMessageBox.information(self, "Generate Selesai", msg)
-
-            # Open folder
-            import sys
-            if sys.platform == 'win32':
-                os.startfile(output_folder)
-            elif sys.platform == 'darwin':
-                os.system(f'open "{output_folder}"')
-            else:
-                os.system(f'xdg-open "{output_folder}"')
-
-            self.accept()
-        else:
-            error_msg = "Tidak ada dokumen yang berhasil di-generate."
-            if errors:
-                error_msg += "\n\n" + "\n".join(errors)
-            QMessageBox.warning(self, "Error", error_msg)
-
-    def _prepare_placeholders(self) -> dict:
-        """Prepare placeholders from jamuan tamu data"""
-        from app.core.config import TAHUN_ANGGARAN
-        from app.templates.engine import terbilang
-
-        d = self.jt_data
-
-        # Format currency
-        def fmt_rp(value):
-            return f"Rp {value:,.0f}".replace(',', '.')
-
-        # Get satker data from database
-        satker = self.db.get_satker()
-        pejabat = self.db.get_satker_pejabat()
-
-        return {
-            # Satker
-            'satker_kode': satker.get('kode', ''),
-            'satker_nama': satker.get('nama', ''),
-            'satker_alamat': satker.get('alamat', ''),
-            'satker_kota': satker.get('kota', ''),
-            'satker_provinsi': satker.get('provinsi', ''),
-            'kementerian': satker.get('kementerian', ''),
-            'eselon1': satker.get('eselon1', ''),
-            'tahun_anggaran': str(TAHUN_ANGGARAN),
-
-            # Kegiatan
-            'nama_kegiatan': d.get('nama_kegiatan', ''),
-            'tanggal_kegiatan': str(d.get('tanggal_kegiatan', '')),
-            'tempat_kegiatan': d.get('tempat', ''),
-            'waktu_mulai': d.get('waktu_mulai', '08:00'),
-            'kategori': d.get('kategori', ''),
-
-            # Tamu
-            'nama_tamu': d.get('nama_tamu', ''),
-            'instansi_tamu': d.get('instansi_tamu', ''),
-            'jabatan_tamu': d.get('jabatan_tamu', ''),
-            'jumlah_tamu': str(d.get('jumlah_tamu', 1)),
-
-            # Dokumen
-            'nomor_sk_kpa': d.get('nomor_sk_kpa', ''),
-            'tanggal_sk_kpa': str(d.get('tanggal_sk_kpa', '')),
-            'nomor_nd': d.get('nomor_nd', ''),
-            'tanggal_nd': str(d.get('tanggal_nd', '')),
-            'nomor_kuitansi': d.get('nomor_kuitansi', ''),
-            'tanggal_kuitansi': str(d.get('tanggal_kuitansi', '')),
-
-            # Sumber Dana
-            'sumber_dana': d.get('sumber_dana', 'DIPA'),
-            'kode_akun': d.get('kode_akun', ''),
-            'mak': d.get('mak', ''),
-
-            # Biaya
-            'biaya_konsumsi': fmt_rp(d.get('biaya_konsumsi', 0) or 0),
-            'biaya_akomodasi': fmt_rp(d.get('biaya_akomodasi', 0) or 0),
-            'biaya_transportasi': fmt_rp(d.get('biaya_transportasi', 0) or 0),
-            'biaya_lainnya': fmt_rp(d.get('biaya_lainnya', 0) or 0),
-            'total_biaya': fmt_rp(d.get('total_biaya', 0) or 0),
-            'total_biaya_terbilang': terbilang(d.get('total_biaya', 0) or 0),
-
-            # Pejabat
-            'kpa_nama': pejabat.get('kpa_nama', ''),
-            'kpa_nip': pejabat.get('kpa_nip', ''),
-            'ppk_nama': d.get('ppk_nama', '') or pejabat.get('ppk_nama', ''),
-            'ppk_nip': d.get('ppk_nip', '') or pejabat.get('ppk_nip', ''),
-            'ppk_jabatan': 'Pejabat Pembuat Komitmen',
-            'bendahara_nama': d.get('bendahara_nama', '') or pejabat.get('bendahara_nama', ''),
-            'bendahara_nip': d.get('bendahara_nip', '') or pejabat.get('bendahara_nip', ''),
-
-            # Penanggung Jawab (bisa diisi dari data atau default)
-            'pj_nama': d.get('pj_nama', '') or pejabat.get('ppk_nama', ''),
-            'pj_nip': d.get('pj_nip', '') or pejabat.get('ppk_nip', ''),
-
-            'keterangan': d.get('keterangan', ''),
-        }
-
+        self.jt_data = jt_data
 
 # ============================================================================
 # PEMBAYARAN LAINNYA MANAGER (Main Widget)
 # ============================================================================
 
+# Warna latar/teks kolom kategori (reguler hijau, insidentil kuning)
+KATEGORI_BACKGROUND = {'reguler': '#d4edda', 'insidentil': '#fff3cd'}
+KATEGORI_FOREGROUND = {'reguler': '#155724', 'insidentil': '#856404'}
+
+
 class PembayaranLainnyaManager(QWidget):
-    """Main manager for SK KPA, Honorarium, and Jamuan Tamu"""
+    """
+    Main manager for SK KPA, Honorarium, and Jamuan Tamu
+
+    Isi tab dibangun dan dimuat saat tab pertama kali ditampilkan. Tabel
+    memakai TransaksiTableModel dengan fetcher DatabaseManagerV4.list_*,
+    jadi filter dan sort dikerjakan query dan data dimuat per halaman saat
+    di-scroll. Event perubahan data hanya memuat ulang tab yang datanya
+    berubah; tab lain yang sudah dibangun dimuat ulang saat dibuka lagi.
+    """
+
+    # Urutan tab (index dipakai menu_handlers); key = topic event = nama tabel
+    TABS = [
+        (TOPIC_SK_KPA, "SK KPA"),
+        (TOPIC_HONORARIUM, "Honorarium"),
+        (TOPIC_JAMUAN_TAMU, "Jamuan Tamu"),
+        (TOPIC_HONOR_PENGELOLA, "Honor Pengelola Keuangan"),
+    ]
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.db = get_db_manager_v4()
+        self.models: Dict[str, TransaksiTableModel] = {}
+        self.tables: Dict[str, QTableView] = {}
+        self._stale = set()
+        self._search_inputs: Dict[str, QLineEdit] = {}
+        self._search_timers: Dict[str, QTimer] = {}
+        self._builders = {
+            TOPIC_SK_KPA: self._build_sk_tab,
+            TOPIC_HONORARIUM: self._build_hon_tab,
+            TOPIC_JAMUAN_TAMU: self._build_jt_tab,
+            TOPIC_HONOR_PENGELOLA: self._build_hpk_tab,
+        }
         self.setup_ui()
-        self.refresh_all()
+
+        self.data_notifier = DataChangeNotifier(self, topics=[key for key, _ in self.TABS])
+        self.data_notifier.changed.connect(self._on_data_changed)
 
     def setup_ui(self):
         layout = QVBoxLayout(self)
 
         # Header
         header = QLabel("Pembayaran Lainnya")
-        header.setStyleSheet("font-size: 18px; font-weight: bold; padding: 10px;")
+        set_role(header, "page-title")
         layout.addWidget(header)
 
-        # Tabs
+        # Tabs: halaman kosong, isinya dibangun oleh _ensure_tab
         self.tabs = QTabWidget()
+        for key, label in self.TABS:
+            page = QWidget()
+            QVBoxLayout(page)
+            self.tabs.addTab(page, label)
+        self.tabs.currentChanged.connect(self._ensure_tab)
 
-        # ========== TAB 1: SK KPA ==========
-        tab_sk = QWidget()
-        sk_layout = QVBoxLayout(tab_sk)
-
-        sk_toolbar = QHBoxLayout()
-        btn_add_sk = QPushButton("+ Buat SK KPA")
-        btn_add_sk.setStyleSheet("background-color: #3498db; color: white; padding: 8px 16px;")
-        btn_add_sk.clicked.connect(self.add_sk_kpa)
-        sk_toolbar.addWidget(btn_add_sk)
-        sk_toolbar.addStretch()
-
-        sk_toolbar.addWidget(QLabel("Tahun:"))
-        self.cmb_sk_tahun = QComboBox()
-        self.cmb_sk_tahun.addItem("Semua", None)
-        for y in range(TAHUN_ANGGARAN - 2, TAHUN_ANGGARAN + 3):
-            self.cmb_sk_tahun.addItem(str(y), y)
-        self.cmb_sk_tahun.setCurrentText(str(TAHUN_ANGGARAN))
-        self.cmb_sk_tahun.currentIndexChanged.connect(self.refresh_sk_kpa)
-        sk_toolbar.addWidget(self.cmb_sk_tahun)
-
-        sk_layout.addLayout(sk_toolbar)
-
-        self.tbl_sk = QTableWidget()
-        self.tbl_sk.setColumnCount(7)
-        self.tbl_sk.setHorizontalHeaderLabels([
-            "ID", "Nomor SK", "Tanggal", "Perihal", "Jenis", "Nilai", "Aksi"
-        ])
-        self.tbl_sk.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.tbl_sk.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        self.tbl_sk.horizontalHeader().setStretchLastSection(True)
-        self.tbl_sk.setColumnWidth(0, 50)
-        self.tbl_sk.setColumnWidth(1, 150)
-        self.tbl_sk.setColumnWidth(2, 100)
-        self.tbl_sk.setColumnWidth(3, 250)
-        self.tbl_sk.setColumnWidth(4, 100)
-        self.tbl_sk.setColumnWidth(5, 120)
-        sk_layout.addWidget(self.tbl_sk)
-
-        self.tabs.addTab(tab_sk, "SK KPA")
+        layout.addWidget(self.tabs)
 
-        # ========== TAB 2: HONORARIUM ==========
-        tab_hon = QWidget()
-        hon_layout = QVBoxLayout(tab_hon)
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._ensure_tab(self.tabs.currentIndex())
 
-        hon_toolbar = QHBoxLayout()
-        btn_add_hon = QPushButton("+ Tambah Honorarium")
-        btn_add_hon.setStyleSheet("background-color: #27ae60; color: white; padding: 8px 16px;")
-        btn_add_hon.clicked.connect(self.add_honorarium)
-        hon_toolbar.addWidget(btn_add_hon)
-        hon_toolbar.addStretch()
-
-        hon_toolbar.addWidget(QLabel("Kategori:"))
-        self.cmb_hon_kategori = QComboBox()
-        self.cmb_hon_kategori.addItem("Semua", None)
-        self.cmb_hon_kategori.addItems(["reguler", "insidentil"])
-        self.cmb_hon_kategori.currentIndexChanged.connect(self.refresh_honorarium)
-        hon_toolbar.addWidget(self.cmb_hon_kategori)
+    def format_currency(self, value):
+        return f"Rp {value or 0:,.0f}".replace(",", ".")
 
-        hon_toolbar.addWidget(QLabel("Tahun:"))
-        self.cmb_hon_tahun = QComboBox()
-        self.cmb_hon_tahun.addItem("Semua", None)
-        for y in range(TAHUN_ANGGARAN - 2, TAHUN_ANGGARAN + 3):
-            self.cmb_hon_tahun.addItem(str(y), y)
-        self.cmb_hon_tahun.setCurrentText(str(TAHUN_ANGGARAN))
-        self.cmb_hon_tahun.currentIndexChanged.connect(self.refresh_honorarium)
-        hon_toolbar.addWidget(self.cmb_hon_tahun)
+    # =========================================================================
+    # LAZY TABS
+    # =========================================================================
 
-        hon_layout.addLayout(hon_toolbar)
+    def current_tab(self) -> str:
+        """Key (topic) tab yang sedang tampil."""
+        return self.TABS[self.tabs.currentIndex()][0]
 
-        self.tbl_hon = QTableWidget()
-        self.tbl_hon.setColumnCount(8)
-        self.tbl_hon.setHorizontalHeaderLabels([
-            "ID", "Kegiatan", "Jenis", "Kategori", "SK KPA", "Total Bruto", "Status", "Aksi"
-        ])
-        self.tbl_hon.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.tbl_hon.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        self.tbl_hon.horizontalHeader().setStretchLastSection(True)
-        hon_layout.addWidget(self.tbl_hon)
+    def is_tab_built(self, key: str) -> bool:
+        return key in self.models
 
-        self.tabs.addTab(tab_hon, "Honorarium")
+    def _ensure_tab(self, index: int):
+        """Bangun tab saat pertama tampil; muat ulang jika datanya berubah."""
+        if not self.isVisible() or not (0 <= index < len(self.TABS)):
+            return
+        key = self.TABS[index][0]
+        if key not in self.models:
+            self._builders[key](self.tabs.widget(index).layout())
+            self._reload_tab(key)
+        elif key in self._stale:
+            self._reload_tab(key)
+
+    def _reload_tab(self, key: str):
+        """Muat ulang halaman pertama tab dengan filter saat ini."""
+        self._stale.discard(key)
+        model = self.models[key]
+        if not model.set_filters(**self._tab_filters(key)):
+            model.reload()
+        if key == TOPIC_HONOR_PENGELOLA:
+            self.refresh_fa_reference()
 
-        # ========== TAB 3: JAMUAN TAMU ==========
-        tab_jt = QWidget()
-        jt_layout = QVBoxLayout(tab_jt)
+    def _tab_filters(self, key: str) -> Dict:
+        """Filter toolbar tab -> keyword argument DatabaseManagerV4.list_*."""
+        search = self._search_inputs[key].text().strip()
+        if key == TOPIC_SK_KPA:
+            return {'tahun': self.cmb_sk_tahun.currentData(), 'search': search}
+        if key == TOPIC_HONORARIUM:
+            return {'tahun': self.cmb_hon_tahun.currentData(),
+                    'kategori': self.cmb_hon_kategori.currentData(), 'search': search}
+        if key == TOPIC_JAMUAN_TAMU:
+            return {'tahun': self.cmb_jt_tahun.currentData(),
+                    'kategori': self.cmb_jt_kategori.currentData(), 'search': search}
+        return {'tahun': self.cmb_hpk_tahun.currentData() or TAHUN_ANGGARAN,
+                'search': search}
+
+    def _apply_filters(self, key: str):
+        """Kirim filter toolbar ke query; dimuat ulang hanya jika berubah."""
+        self._search_timers[key].stop()
+        self.models[key].set_filters(**self._tab_filters(key))
+        if key == TOPIC_HONOR_PENGELOLA:
+            self.refresh_fa_reference()
 
-        jt_toolbar = QHBoxLayout()
-        btn_add_jt = QPushButton("+ Tambah Jamuan Tamu")
-        btn_add_jt.setStyleSheet("background-color: #e67e22; color: white; padding: 8px 16px;")
-        btn_add_jt.clicked.connect(self.add_jamuan_tamu)
-        jt_toolbar.addWidget(btn_add_jt)
-        jt_toolbar.addStretch()
+    def _on_data_changed(self, changes: Dict):
+        """Tandai tab yang datanya berubah; muat ulang jika sedang tampil."""
+        self._stale.update(key for key in changes if key in self.models)
+        if self.isVisible() and self.current_tab() in self._stale:
+            self._reload_tab(self.current_tab())
 
-        jt_toolbar.addWidget(QLabel("Kategori:"))
-        self.cmb_jt_kategori = QComboBox()
-        self.cmb_jt_kategori.addItem("Semua", None)
-        self.cmb_jt_kategori.addItems(["reguler", "insidentil"])
-        self.cmb_jt_kategori.currentIndexChanged.connect(self.refresh_jamuan_tamu)
-        jt_toolbar.addWidget(self.cmb_jt_kategori)
+    def _sync_changes(self):
+        """Terapkan perubahan dari dialog/hapus sekarang, tanpa menunggu jeda notifier."""
+        self.data_notifier.flush()
 
-        jt_toolbar.addWidget(QLabel("Tahun:"))
-        self.cmb_jt_tahun = QComboBox()
-        self.cmb_jt_tahun.addItem("Semua", None)
-        for y in range(TAHUN_ANGGARAN - 2, TAHUN_ANGGARAN + 3):
-            self.cmb_jt_tahun.addItem(str(y), y)
-        self.cmb_jt_tahun.setCurrentText(str(TAHUN_ANGGARAN))
-        self.cmb_jt_tahun.currentIndexChanged.connect(self.refresh_jamuan_tamu)
-        jt_toolbar.addWidget(self.cmb_jt_tahun)
+    def refresh_all(self):
+        self._stale.update(self.models)
+        self._ensure_tab(self.tabs.currentIndex())
 
-        jt_layout.addLayout(jt_toolbar)
+    def refresh_sk_kpa(self):
+        self._refresh(TOPIC_SK_KPA)
 
-        self.tbl_jt = QTableWidget()
-        self.tbl_jt.setColumnCount(8)
-        self.tbl_jt.setHorizontalHeaderLabels([
-            "ID", "Kegiatan", "Tanggal", "Tamu", "Kategori", "Total Biaya", "Status", "Aksi"
-        ])
-        self.tbl_jt.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.tbl_jt.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        self.tbl_jt.horizontalHeader().setStretchLastSection(True)
-        jt_layout.addWidget(self.tbl_jt)
+    def refresh_honorarium(self):
+        self._refresh(TOPIC_HONORARIUM)
 
-        self.tabs.addTab(tab_jt, "Jamuan Tamu")
+    def refresh_jamuan_tamu(self):
+        self._refresh(TOPIC_JAMUAN_TAMU)
 
-        # ========== TAB 4: HONORARIUM PENGELOLA KEUANGAN ==========
-        tab_hpk = QWidget()
-        hpk_layout = QVBoxLayout(tab_hpk)
+    def refresh_honorarium_pengelola(self):
+        """Refresh honorarium pengelola keuangan table"""
+        self._refresh(TOPIC_HONOR_PENGELOLA)
 
-        # Info
-        info_label = QLabel("Honorarium Pengelola Keuangan diambil dari FA Detail (Pagu Anggaran)")
-        info_label.setStyleSheet("color: #7f8c8d; font-style: italic; padding: 5px;")
-        hpk_layout.addWidget(info_label)
+    def _refresh(self, key: str):
+        if key in self.models:
+            self._reload_tab(key)
 
-        # Toolbar
-        hpk_toolbar = QHBoxLayout()
-        btn_add_hpk = QPushButton("+ Tambah Pembayaran")
-        btn_add_hpk.setStyleSheet("background-color: #9b59b6; color: white; padding: 8px 16px;")
-        btn_add_hpk.clicked.connect(self.add_honorarium_pengelola)
-        hpk_toolbar.addWidget(btn_add_hpk)
-
-        btn_from_fa = QPushButton("Import dari FA Detail")
-        btn_from_fa.setStyleSheet("background-color: #1abc9c; color: white; padding: 8px 16px;")
-        btn_from_fa.clicked.connect(self.import_from_fa_detail)
-        hpk_toolbar.addWidget(btn_from_fa)
-        hpk_toolbar.addStretch()
+    # =========================================================================
+    # TAB WIDGETS
+    # =========================================================================
 
-        hpk_toolbar.addWidget(QLabel("Tahun:"))
-        self.cmb_hpk_tahun = QComboBox()
+    def _tahun_combo(self, key: str, with_all: bool = True) -> QComboBox:
+        combo = QComboBox()
+        if with_all:
+            combo.addItem("Semua", None)
         for y in range(TAHUN_ANGGARAN - 2, TAHUN_ANGGARAN + 3):
-            self.cmb_hpk_tahun.addItem(str(y), y)
-        self.cmb_hpk_tahun.setCurrentText(str(TAHUN_ANGGARAN))
-        self.cmb_hpk_tahun.currentIndexChanged.connect(self.refresh_honorarium_pengelola)
-        hpk_toolbar.addWidget(self.cmb_hpk_tahun)
-
-        hpk_layout.addLayout(hpk_toolbar)
-
-        # Table
-        self.tbl_hpk = QTableWidget()
-        self.tbl_hpk.setColumnCount(9)
-        self.tbl_hpk.setHorizontalHeaderLabels([
-            "ID", "Bulan", "Jabatan", "Pegawai", "NIP", "Jumlah", "Pajak", "Netto", "Aksi"
-        ])
-        self.tbl_hpk.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.tbl_hpk.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        self.tbl_hpk.horizontalHeader().setStretchLastSection(True)
-        self.tbl_hpk.setColumnWidth(0, 50)
-        self.tbl_hpk.setColumnWidth(1, 100)
-        self.tbl_hpk.setColumnWidth(2, 120)
-        self.tbl_hpk.setColumnWidth(3, 200)
-        self.tbl_hpk.setColumnWidth(4, 150)
-        self.tbl_hpk.setColumnWidth(5, 120)
-        self.tbl_hpk.setColumnWidth(6, 100)
-        self.tbl_hpk.setColumnWidth(7, 120)
-        hpk_layout.addWidget(self.tbl_hpk)
-
-        # FA Detail reference
-        fa_group = QGroupBox("Referensi Pagu Anggaran (FA Detail)")
-        fa_layout = QVBoxLayout()
-        self.tbl_fa_ref = QTableWidget()
-        self.tbl_fa_ref.setColumnCount(5)
-        self.tbl_fa_ref.setHorizontalHeaderLabels([
-            "Kode Akun", "Uraian", "Pagu", "Realisasi", "Sisa"
-        ])
-        self.tbl_fa_ref.setMaximumHeight(150)
-        self.tbl_fa_ref.horizontalHeader().setStretchLastSection(True)
-        fa_layout.addWidget(self.tbl_fa_ref)
-        fa_group.setLayout(fa_layout)
-        hpk_layout.addWidget(fa_group)
-
-        self.tabs.addTab(tab_hpk, "Honor Pengelola Keuangan")
-
-        layout.addWidget(self.tabs)
-
-    def format_currency(self, value):
-        return f"Rp {value:,.0f}".replace(",", ".")
-
-    def refresh_all(self):
-        self.refresh_sk_kpa()
-        self.refresh_honorarium()
-        self.refresh_jamuan_tamu()
-        self.refresh_honorarium_pengelola()
-        self.refresh_fa_reference()
-
-    def refresh_sk_kpa(self):
-        tahun = self.cmb_sk_tahun.currentData()
-        data = self.db.get_all_sk_kpa(tahun=tahun)
-        self.tbl_sk.setRowCount(len(data))
-
-        for row, d in enumerate(data):
-            self.tbl_sk.setItem(row, 0, QTableWidgetItem(str(d['id'])))
-            self.tbl_sk.setItem(row, 1, QTableWidgetItem(d.get('nomor_sk', '')))
-            self.tbl_sk.setItem(row, 2, QTableWidgetItem(str(d.get('tanggal_sk', ''))))
-            self.tbl_sk.setItem(row, 3, QTableWidgetItem(d.get('perihal', '')))
-            self.tbl_sk.setItem(row, 4, QTableWidgetItem(d.get('jenis_pembayaran', '')))
-            self.tbl_sk.setItem(row, 5, QTableWidgetItem(self.format_currency(d.get('nilai_pembayaran', 0))))
-
-            btn_widget = QWidget()
-            btn_layout = QHBoxLayout(btn_widget)
-            btn_layout.setContentsMargins(2, 2, 2, 2)
+            combo.addItem(str(y), y)
+        combo.setCurrentText(str(TAHUN_ANGGARAN))
+        combo.currentIndexChanged.connect(lambda _, k=key: self._apply_filters(k))
+        return combo
+
+    def _kategori_combo(self, key: str) -> QComboBox:
+        combo = QComboBox()
+        combo.addItem("Semua", None)
+        for kategori in ("reguler", "insidentil"):
+            combo.addItem(kategori, kategori)
+        combo.currentIndexChanged.connect(lambda _, k=key: self._apply_filters(k))
+        return combo
+
+    def _search_input(self, key: str, placeholder: str) -> QLineEdit:
+        """Input pencarian dengan jeda ketik sebelum query dijalankan."""
+        search = QLineEdit()
+        search.setPlaceholderText(placeholder)
+        search.setClearButtonEnabled(True)
+        search.setMinimumWidth(200)
+
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(SEARCH_DEBOUNCE_MS)
+        timer.timeout.connect(lambda k=key: self._apply_filters(k))
+        search.textChanged.connect(timer.start)
+
+        self._search_timers[key] = timer
+        self._search_inputs[key] = search
+        return search
+
+    def _action_buttons(self, toolbar: QHBoxLayout, key: str):
+        """Tombol aksi untuk baris terpilih (juga lewat double click / menu konteks)."""
+        for text, tone, handler in self._row_actions(key):
+            btn = QPushButton(text)
+            set_role(btn, tone=tone, size="small")
+            btn.clicked.connect(handler)
+            toolbar.addWidget(btn)
+
+    def _create_table(self, key: str, columns: List[ListColumn], fetcher) -> QTableView:
+        """Tabel query-backed: sort di query, halaman berikutnya saat di-scroll."""
+        model = TransaksiTableModel(columns, parent=self)
+        model.set_fetcher(fetcher)
+        self.models[key] = model
+
+        table = QTableView()
+        table.setModel(model)
+        table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        table.setSelectionMode(QAbstractItemView.SingleSelection)
+        table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        table.verticalHeader().setVisible(False)
+
+        header = table.horizontalHeader()
+        for column, col in enumerate(columns):
+            if col.stretch:
+                header.setSectionResizeMode(column, QHeaderView.Stretch)
+            elif col.width:
+                table.setColumnWidth(column, col.width)
+
+        # Sorting dijalankan di query (TransaksiTableModel.sort)
+        header.setSortIndicator(-1, Qt.SortOrder.DescendingOrder)
+        table.setSortingEnabled(True)
+
+        table.doubleClicked.connect(lambda _, k=key: self._on_double_click(k))
+        table.setContextMenuPolicy(Qt.CustomContextMenu)
+        table.customContextMenuRequested.connect(
+            lambda pos, k=key: self._show_context_menu(k, pos))
+
+        self.tables[key] = table
+        return table
+
+    def _create_footer(self, key: str) -> QLabel:
+        """Label jumlah baris dimuat / total yang cocok dengan filter."""
+        label = QLabel()
+        set_role(label, "caption")
+        model = self.models[key]
+
+        def update(*args):
+            label.setText(f"Menampilkan {model.rowCount()} dari {model.total_count()}")
+
+        model.modelReset.connect(update)
+        model.rowsInserted.connect(update)
+        update()
+        return label
+
+    def _row_actions(self, key: str) -> List[tuple]:
+        """(teks, tone, handler) aksi baris per tab; yang pertama = double click."""
+        if key == TOPIC_SK_KPA:
+            return [("Edit", "primary", self.edit_sk_kpa),
+                    ("Hapus", "danger", self.delete_sk_kpa)]
+        if key == TOPIC_HONORARIUM:
+            return [("Edit", "primary", self.edit_honorarium),
+                    ("Hapus", "danger", self.delete_honorarium)]
+        if key == TOPIC_JAMUAN_TAMU:
+            return [("Edit", "primary", self.edit_jamuan_tamu),
+                    ("Hapus", "danger", self.delete_jamuan_tamu),
+                    ("Cetak", "success", self.generate_jamuan_tamu)]
+        return [("Edit", "primary", self.edit_honorarium_pengelola),
+                ("Hapus", "danger", self.delete_honorarium_pengelola)]
+
+    def _on_double_click(self, key: str):
+        """Double click menjalankan aksi pertama (Edit)."""
+        _, _, handler = self._row_actions(key)[0]
+        handler()
+
+    def _show_context_menu(self, key: str, pos):
+        table = self.tables[key]
+        index = table.indexAt(pos)
+        if not index.isValid():
+            return
+        table.selectRow(index.row())
+
+        menu = QMenu(self)
+        for text, _, handler in self._row_actions(key):
+            menu.addAction(text).triggered.connect(lambda checked=False, h=handler: h())
+        menu.exec(table.viewport().mapToGlobal(pos))
+
+    def selected_id(self, key: str) -> Optional[int]:
+        """ID baris terpilih pada tab (None jika belum ada yang dipilih)."""
+        table = self.tables.get(key)
+        if table is None:
+            return None
+        rows = table.selectionModel().selectedRows()
+        if rows:
+            data = self.models[key].row_data(rows[0].row())
+            if data:
+                return data.get('id')
+        return None
+
+    def _kategori_column(self) -> ListColumn:
+        return ListColumn('kategori', 'Kategori', width=100,
+                          foreground=KATEGORI_FOREGROUND.get,
+                          background=KATEGORI_BACKGROUND.get)
+
+    def _currency_column(self, key: str, header: str, width: int = 130) -> ListColumn:
+        return ListColumn(key, header, width=width, formatter=self.format_currency,
+                          alignment=ALIGN_RIGHT)
+
+    # ========== TAB 1: SK KPA ==========
+
+    def _build_sk_tab(self, sk_layout: QVBoxLayout):
+        sk_toolbar = QHBoxLayout()
+        btn_add_sk = QPushButton("+ Buat SK KPA")
+        set_role(btn_add_sk, tone="primary")
+        btn_add_sk.clicked.connect(self.add_sk_kpa)
+        sk_toolbar.addWidget(btn_add_sk)
+        self._action_buttons(sk_toolbar, TOPIC_SK_KPA)
+        sk_toolbar.addStretch()
 
-            btn_edit = QPushButton("Edit")
-            btn_edit.setStyleSheet("background: #3498db; color: white; padding: 2px 8px;")
-            btn_edit.clicked.connect(lambda checked, r=row: self.edit_sk_kpa(r))
-            btn_layout.addWidget(btn_edit)
+        sk_toolbar.addWidget(self._search_input(TOPIC_SK_KPA, "Cari nomor SK / perihal..."))
+        sk_toolbar.addWidget(QLabel("Tahun:"))
+        self.cmb_sk_tahun = self._tahun_combo(TOPIC_SK_KPA)
+        sk_toolbar.addWidget(self.cmb_sk_tahun)
 
-            btn_del = QPushButton("Hapus")
-            btn_del.setStyleSheet("background: #e74c3c; color: white; padding: 2px 8px;")
-            btn_del.clicked.connect(lambda checked, r=row: self.delete_sk_kpa(r))
-            btn_layout.addWidget(btn_del)
+        sk_layout.addLayout(sk_toolbar)
 
-            self.tbl_sk.setCellWidget(row, 6, btn_widget)
+        self.tbl_sk = self._create_table(TOPIC_SK_KPA, [
+            ListColumn('id', 'ID', width=50),
+            ListColumn('nomor_sk', 'Nomor SK', width=150),
+            ListColumn('tanggal_sk', 'Tanggal', width=100),
+            ListColumn('perihal', 'Perihal', stretch=True),
+            ListColumn('jenis_pembayaran', 'Jenis', width=100),
+            self._currency_column('nilai_pembayaran', 'Nilai'),
+        ], self.db.list_sk_kpa)
+        sk_layout.addWidget(self.tbl_sk)
+        sk_layout.addWidget(self._create_footer(TOPIC_SK_KPA))
 
     def add_sk_kpa(self):
         dialog = SKKPADialog(parent=self)
         if dialog.exec() == QDialog.Accepted:
-            self.refresh_sk_kpa()
+            self._sync_changes()
             QMessageBox.information(self, "Sukses", "SK KPA berhasil ditambahkan!")
 
-    def edit_sk_kpa(self, row):
-        sk_id = int(self.tbl_sk.item(row, 0).text())
-        sk_data = self.db.get_sk_kpa(sk_id)
+    def edit_sk_kpa(self):
+        sk_id = self.selected_id(TOPIC_SK_KPA)
+        sk_data = self.db.get_sk_kpa(sk_id) if sk_id else None
         if sk_data:
             dialog = SKKPADialog(sk_data, parent=self)
             if dialog.exec() == QDialog.Accepted:
-                self.refresh_sk_kpa()
+                self._sync_changes()
 
-    def delete_sk_kpa(self, row):
-        sk_id = int(self.tbl_sk.item(row, 0).text())
+    def delete_sk_kpa(self):
+        sk_id = self.selected_id(TOPIC_SK_KPA)
+        if not sk_id:
+            return
         reply = QMessageBox.question(self, "Konfirmasi", "Yakin ingin menghapus SK KPA ini?",
                                      QMessageBox.Yes | QMessageBox.No)
         if reply == QMessageBox.Yes:
             if self.db.delete_sk_kpa(sk_id):
-                self.refresh_sk_kpa()
-
-    def refresh_honorarium(self):
-        tahun = self.cmb_hon_tahun.currentData()
-        kategori = self.cmb_hon_kategori.currentText()
-        if kategori == "Semua":
-            kategori = None
-        data = self.db.get_all_honorarium(tahun=tahun, kategori=kategori)
-        self.tbl_hon.setRowCount(len(data))
+                self._sync_changes()
 
-        for row, d in enumerate(data):
-            self.tbl_hon.setItem(row, 0, QTableWidgetItem(str(d['id'])))
-            self.tbl_hon.setItem(row, 1, QTableWidgetItem(d.get('nama_kegiatan', '')))
-            self.tbl_hon.setItem(row, 2, QTableWidgetItem(d.get('jenis_honorarium', '')))
+    # ========== TAB 2: HONORARIUM ==========
 
-            kat_item = QTableWidgetItem(d.get('kategori', ''))
-            if d.get('kategori') == 'reguler':
-                kat_item.setBackground(QColor('#d4edda'))
-            else:
-                kat_item.setBackground(QColor('#fff3cd'))
-            self.tbl_hon.setItem(row, 3, kat_item)
-
-            self.tbl_hon.setItem(row, 4, QTableWidgetItem(d.get('nomor_sk_kpa', '')))
-            self.tbl_hon.setItem(row, 5, QTableWidgetItem(self.format_currency(d.get('total_bruto', 0))))
-            self.tbl_hon.setItem(row, 6, QTableWidgetItem(d.get('status', '')))
+    def _build_hon_tab(self, hon_layout: QVBoxLayout):
+        hon_toolbar = QHBoxLayout()
+        btn_add_hon = QPushButton("+ Tambah Honorarium")
+        set_role(btn_add_hon, tone="success")
+        btn_add_hon.clicked.connect(self.add_honorarium)
+        hon_toolbar.addWidget(btn_add_hon)
+        self._action_buttons(hon_toolbar, TOPIC_HONORARIUM)
+        hon_toolbar.addStretch()
 
-            btn_widget = QWidget()
-            btn_layout = QHBoxLayout(btn_widget)
-            btn_layout.setContentsMargins(2, 2, 2, 2)
+        hon_toolbar.addWidget(self._search_input(TOPIC_HONORARIUM, "Cari kegiatan / SK KPA..."))
+        hon_toolbar.addWidget(QLabel("Kategori:"))
+        self.cmb_hon_kategori = self._kategori_combo(TOPIC_HONORARIUM)
+        hon_toolbar.addWidget(self.cmb_hon_kategori)
 
-            btn_edit = QPushButton("Edit")
-            btn_edit.setStyleSheet("background: #3498db; color: white; padding: 2px 8px;")
-            btn_edit.clicked.connect(lambda checked, r=row: self.edit_honorarium(r))
-            btn_layout.addWidget(btn_edit)
+        hon_toolbar.addWidget(QLabel("Tahun:"))
+        self.cmb_hon_tahun = self._tahun_combo(TOPIC_HONORARIUM)
+        hon_toolbar.addWidget(self.cmb_hon_tahun)
 
-            btn_del = QPushButton("Hapus")
-            btn_del.setStyleSheet("background: #e74c3c; color: white; padding: 2px 8px;")
-            btn_del.clicked.connect(lambda checked, r=row: self.delete_honorarium(r))
-            btn_layout.addWidget(btn_del)
+        hon_layout.addLayout(hon_toolbar)
 
-            self.tbl_hon.setCellWidget(row, 7, btn_widget)
+        self.tbl_hon = self._create_table(TOPIC_HONORARIUM, [
+            ListColumn('id', 'ID', width=50),
+            ListColumn('nama_kegiatan', 'Kegiatan', stretch=True),
+            ListColumn('jenis_honorarium', 'Jenis', width=110),
+            self._kategori_column(),
+            ListColumn('nomor_sk_kpa', 'SK KPA', width=150),
+            self._currency_column('total_bruto', 'Total Bruto'),
+            ListColumn('status', 'Status', width=90),
+        ], self.db.list_honorarium)
+        hon_layout.addWidget(self.tbl_hon)
+        hon_layout.addWidget(self._create_footer(TOPIC_HONORARIUM))
 
     def add_honorarium(self):
         dialog = HonorariumDialog(parent=self)
         if dialog.exec() == QDialog.Accepted:
-            self.refresh_honorarium()
+            self._sync_changes()
             QMessageBox.information(self, "Sukses", "Honorarium berhasil ditambahkan!")
 
-    def edit_honorarium(self, row):
-        hon_id = int(self.tbl_hon.item(row, 0).text())
-        hon_data = self.db.get_honorarium(hon_id)
+    def edit_honorarium(self):
+        hon_id = self.selected_id(TOPIC_HONORARIUM)
+        hon_data = self.db.get_honorarium(hon_id) if hon_id else None
         if hon_data:
             dialog = HonorariumDialog(hon_data, parent=self)
             if dialog.exec() == QDialog.Accepted:
-                self.refresh_honorarium()
+                self._sync_changes()
 
-    def delete_honorarium(self, row):
-        hon_id = int(self.tbl_hon.item(row, 0).text())
+    def delete_honorarium(self):
+        hon_id = self.selected_id(TOPIC_HONORARIUM)
+        if not hon_id:
+            return
         reply = QMessageBox.question(self, "Konfirmasi", "Yakin ingin menghapus Honorarium ini?",
                                      QMessageBox.Yes | QMessageBox.No)
         if reply == QMessageBox.Yes:
             if self.db.delete_honorarium(hon_id):
-                self.refresh_honorarium()
+                self._sync_changes()
 
-    def refresh_jamuan_tamu(self):
-        tahun = self.cmb_jt_tahun.currentData()
-        kategori = self.cmb_jt_kategori.currentText()
-        if kategori == "Semua":
-            kategori = None
-        data = self.db.get_all_jamuan_tamu(tahun=tahun, kategori=kategori)
-        self.tbl_jt.setRowCount(len(data))
+    # ========== TAB 3: JAMUAN TAMU ==========
 
-        for row, d in enumerate(data):
-            self.tbl_jt.setItem(row, 0, QTableWidgetItem(str(d['id'])))
-            self.tbl_jt.setItem(row, 1, QTableWidgetItem(d.get('nama_kegiatan', '')))
-            self.tbl_jt.setItem(row, 2, QTableWidgetItem(str(d.get('tanggal_kegiatan', ''))))
-            self.tbl_jt.setItem(row, 3, QTableWidgetItem(d.get('nama_tamu', '')))
-
-            kat_item = QTableWidgetItem(d.get('kategori', ''))
-            if d.get('kategori') == 'reguler':
-                kat_item.setBackground(QColor('#d4edda'))
-            else:
-                kat_item.setBackground(QColor('#fff3cd'))
-            self.tbl_jt.setItem(row, 4, kat_item)
-
-            self.tbl_jt.setItem(row, 5, QTableWidgetItem(self.format_currency(d.get('total_biaya', 0))))
-            self.tbl_jt.setItem(row, 6, QTableWidgetItem(d.get('status', '')))
-
-            btn_widget = QWidget()
-            btn_layout = QHBoxLayout(btn_widget)
-            btn_layout.setContentsMargins(2, 2, 2, 2)
+    def _build_jt_tab(self, jt_layout: QVBoxLayout):
+        jt_toolbar = QHBoxLayout()
+        btn_add_jt = QPushButton("+ Tambah Jamuan Tamu")
+        set_role(btn_add_jt, tone="warning")
+        btn_add_jt.clicked.connect(self.add_jamuan_tamu)
+        jt_toolbar.addWidget(btn_add_jt)
+        self._action_buttons(jt_toolbar, TOPIC_JAMUAN_TAMU)
+        jt_toolbar.addStretch()
 
-            btn_edit = QPushButton("Edit")
-            btn_edit.setStyleSheet("background: #3498db; color: white; padding: 2px 8px;")
-            btn_edit.clicked.connect(lambda checked, r=row: self.edit_jamuan_tamu(r))
-            btn_layout.addWidget(btn_edit)
+        jt_toolbar.addWidget(self._search_input(TOPIC_JAMUAN_TAMU, "Cari kegiatan / tamu..."))
+        jt_toolbar.addWidget(QLabel("Kategori:"))
+        self.cmb_jt_kategori = self._kategori_combo(TOPIC_JAMUAN_TAMU)
+        jt_toolbar.addWidget(self.cmb_jt_kategori)
 
-            btn_del = QPushButton("Hapus")
-            btn_del.setStyleSheet("background: #e74c3c; color: white; padding: 2px 8px;")
-            btn_del.clicked.connect(lambda checked, r=row: self.delete_jamuan_tamu(r))
-            btn_layout.addWidget(btn_del)
+        jt_toolbar.addWidget(QLabel("Tahun:"))
+        self.cmb_jt_tahun = self._tahun_combo(TOPIC_JAMUAN_TAMU)
+        jt_toolbar.addWidget(self.cmb_jt_tahun)
 
-            btn_gen = QPushButton("Cetak")
-            btn_gen.setStyleSheet("background: #27ae60; color: white; padding: 2px 8px;")
-            btn_gen.clicked.connect(lambda checked, r=row: self.generate_jamuan_tamu(r))
-            btn_layout.addWidget(btn_gen)
+        jt_layout.addLayout(jt_toolbar)
 
-            self.tbl_jt.setCellWidget(row, 7, btn_widget)
+        self.tbl_jt = self._create_table(TOPIC_JAMUAN_TAMU, [
+            ListColumn('id', 'ID', width=50),
+            ListColumn('nama_kegiatan', 'Kegiatan', stretch=True),
+            ListColumn('tanggal_kegiatan', 'Tanggal', width=100),
+            ListColumn('nama_tamu', 'Tamu', width=180),
+            self._kategori_column(),
+            self._currency_column('total_biaya', 'Total Biaya'),
+            ListColumn('status', 'Status', width=90),
+        ], self.db.list_jamuan_tamu)
+        jt_layout.addWidget(self.tbl_jt)
+        jt_layout.addWidget(self._create_footer(TOPIC_JAMUAN_TAMU))
 
     def add_jamuan_tamu(self):
         dialog = JamuanTamuDialog(parent=self)
         if dialog.exec() == QDialog.Accepted:
-            self.refresh_jamuan_tamu()
+            self._sync_changes()
             QMessageBox.information(self, "Sukses", "Jamuan Tamu berhasil ditambahkan!")
 
-    def edit_jamuan_tamu(self, row):
-        jt_id = int(self.tbl_jt.item(row, 0).text())
-        jt_data = self.db.get_jamuan_tamu(jt_id)
+    def edit_jamuan_tamu(self):
+        jt_id = self.selected_id(TOPIC_JAMUAN_TAMU)
+        jt_data = self.db.get_jamuan_tamu(jt_id) if jt_id else None
         if jt_data:
             dialog = JamuanTamuDialog(jt_data, parent=self)
             if dialog.exec() == QDialog.Accepted:
-                self.refresh_jamuan_tamu()
+                self._sync_changes()
 
-    def delete_jamuan_tamu(self, row):
-        jt_id = int(self.tbl_jt.item(row, 0).text())
+    def delete_jamuan_tamu(self):
+        jt_id = self.selected_id(TOPIC_JAMUAN_TAMU)
+        if not jt_id:
+            return
         reply = QMessageBox.question(self, "Konfirmasi", "Yakin ingin menghapus Jamuan Tamu ini?",
                                      QMessageBox.Yes | QMessageBox.No)
         if reply == QMessageBox.Yes:
             if self.db.delete_jamuan_tamu(jt_id):
-                self.refresh_jamuan_tamu()
+                self._sync_changes()
 
-    def generate_jamuan_tamu(self, row):
+    def generate_jamuan_tamu(self):
         """Generate documents for selected Jamuan Tamu"""
-        jt_id = int(self.tbl_jt.item(row, 0).text())
-        jt_data = self.db.get_jamuan_tamu(jt_id)
+        jt_id = self.selected_id(TOPIC_JAMUAN_TAMU)
+        jt_data = self.db.get_jamuan_tamu(jt_id) if jt_id else None
         if jt_data:
             dialog = GenerateJTDocumentDialog(jt_data, parent=self)
             dialog.exec()
@@ -1961,45 +1782,70 @@ class PembayaranLainnyaManager(QWidget):
         "Juli", "Agustus", "September", "Oktober", "November", "Desember"
     ]
 
-    def refresh_honorarium_pengelola(self):
-        """Refresh honorarium pengelola keuangan table"""
-        tahun = self.cmb_hpk_tahun.currentData()
-        if not tahun:
-            tahun = TAHUN_ANGGARAN
-        data = self.db.get_all_honorarium_pengelola(tahun=tahun)
-        self.tbl_hpk.setRowCount(len(data))
+    def _bulan_name(self, bulan) -> str:
+        if isinstance(bulan, int) and 1 <= bulan <= 12:
+            return self.BULAN_NAMES[bulan - 1]
+        return str(bulan)
 
-        for row, d in enumerate(data):
-            self.tbl_hpk.setItem(row, 0, QTableWidgetItem(str(d['id'])))
-            # Get bulan name
-            bulan_idx = d.get('bulan', 1) - 1
-            bulan_name = self.BULAN_NAMES[bulan_idx] if 0 <= bulan_idx < 12 else str(d.get('bulan'))
-            self.tbl_hpk.setItem(row, 1, QTableWidgetItem(bulan_name))
-            self.tbl_hpk.setItem(row, 2, QTableWidgetItem(d.get('jabatan', '')))
-            self.tbl_hpk.setItem(row, 3, QTableWidgetItem(d.get('pegawai_nama', '')))
-            self.tbl_hpk.setItem(row, 4, QTableWidgetItem(d.get('pegawai_nip', '')))
-            self.tbl_hpk.setItem(row, 5, QTableWidgetItem(self.format_currency(d.get('jumlah', 0))))
-            self.tbl_hpk.setItem(row, 6, QTableWidgetItem(self.format_currency(d.get('pajak', 0))))
-            self.tbl_hpk.setItem(row, 7, QTableWidgetItem(self.format_currency(d.get('netto', 0))))
-
-            btn_widget = QWidget()
-            btn_layout = QHBoxLayout(btn_widget)
-            btn_layout.setContentsMargins(2, 2, 2, 2)
-
-            btn_edit = QPushButton("Edit")
-            btn_edit.setStyleSheet("background: #3498db; color: white; padding: 2px 8px;")
-            btn_edit.clicked.connect(lambda checked, r=row: self.edit_honorarium_pengelola(r))
-            btn_layout.addWidget(btn_edit)
-
-            btn_del = QPushButton("Hapus")
-            btn_del.setStyleSheet("background: #e74c3c; color: white; padding: 2px 8px;")
-            btn_del.clicked.connect(lambda checked, r=row: self.delete_honorarium_pengelola(r))
-            btn_layout.addWidget(btn_del)
-
-            self.tbl_hpk.setCellWidget(row, 8, btn_widget)
+    def _build_hpk_tab(self, hpk_layout: QVBoxLayout):
+        # Info
+        info_label = QLabel("Honorarium Pengelola Keuangan diambil dari FA Detail (Pagu Anggaran)")
+        set_role(info_label, "hint")
+        hpk_layout.addWidget(info_label)
+
+        # Toolbar
+        hpk_toolbar = QHBoxLayout()
+        btn_add_hpk = QPushButton("+ Tambah Pembayaran")
+        set_role(btn_add_hpk, tone="accent")
+        btn_add_hpk.clicked.connect(self.add_honorarium_pengelola)
+        hpk_toolbar.addWidget(btn_add_hpk)
+
+        btn_from_fa = QPushButton("Import dari FA Detail")
+        set_role(btn_from_fa, tone="neutral")
+        btn_from_fa.clicked.connect(self.import_from_fa_detail)
+        hpk_toolbar.addWidget(btn_from_fa)
+        self._action_buttons(hpk_toolbar, TOPIC_HONOR_PENGELOLA)
+        hpk_toolbar.addStretch()
+
+        hpk_toolbar.addWidget(self._search_input(TOPIC_HONOR_PENGELOLA, "Cari pegawai / jabatan..."))
+        hpk_toolbar.addWidget(QLabel("Tahun:"))
+        self.cmb_hpk_tahun = self._tahun_combo(TOPIC_HONOR_PENGELOLA, with_all=False)
+        hpk_toolbar.addWidget(self.cmb_hpk_tahun)
+
+        hpk_layout.addLayout(hpk_toolbar)
+
+        # Table
+        self.tbl_hpk = self._create_table(TOPIC_HONOR_PENGELOLA, [
+            ListColumn('id', 'ID', width=50),
+            ListColumn('bulan', 'Bulan', width=100, formatter=self._bulan_name),
+            ListColumn('jabatan', 'Jabatan', width=120),
+            ListColumn('pegawai_nama', 'Pegawai', stretch=True),
+            ListColumn('pegawai_nip', 'NIP', width=150),
+            self._currency_column('jumlah', 'Jumlah', 120),
+            self._currency_column('pajak', 'Pajak', 100),
+            self._currency_column('netto', 'Netto', 120),
+        ], self.db.list_honorarium_pengelola)
+        hpk_layout.addWidget(self.tbl_hpk)
+        hpk_layout.addWidget(self._create_footer(TOPIC_HONOR_PENGELOLA))
+
+        # FA Detail reference
+        fa_group = QGroupBox("Referensi Pagu Anggaran (FA Detail)")
+        fa_layout = QVBoxLayout()
+        self.tbl_fa_ref = QTableWidget()
+        self.tbl_fa_ref.setColumnCount(5)
+        self.tbl_fa_ref.setHorizontalHeaderLabels([
+            "Kode Akun", "Uraian", "Pagu", "Realisasi", "Sisa"
+        ])
+        self.tbl_fa_ref.setMaximumHeight(150)
+        self.tbl_fa_ref.horizontalHeader().setStretchLastSection(True)
+        fa_layout.addWidget(self.tbl_fa_ref)
+        fa_group.setLayout(fa_layout)
+        hpk_layout.addWidget(fa_group)
 
     def refresh_fa_reference(self):
         """Refresh FA Detail reference table for pengelola keuangan"""
+        if TOPIC_HONOR_PENGELOLA not in self.models:
+            return
         tahun = self.cmb_hpk_tahun.currentData()
         if not tahun:
             tahun = TAHUN_ANGGARAN
@@ -2018,27 +1864,26 @@ class PembayaranLainnyaManager(QWidget):
         """Add honorarium pengelola keuangan"""
         dialog = HonorariumPengelolaDialog(parent=self)
         if dialog.exec() == QDialog.Accepted:
-            self.refresh_honorarium_pengelola()
-            self.refresh_fa_reference()
+            self._sync_changes()
             QMessageBox.information(self, "Sukses", "Honorarium berhasil ditambahkan!")
 
-    def edit_honorarium_pengelola(self, row):
-        hpk_id = int(self.tbl_hpk.item(row, 0).text())
-        hpk_data = self.db.get_honorarium_pengelola(hpk_id)
+    def edit_honorarium_pengelola(self):
+        hpk_id = self.selected_id(TOPIC_HONOR_PENGELOLA)
+        hpk_data = self.db.get_honorarium_pengelola(hpk_id) if hpk_id else None
         if hpk_data:
             dialog = HonorariumPengelolaDialog(hpk_data, parent=self)
             if dialog.exec() == QDialog.Accepted:
-                self.refresh_honorarium_pengelola()
-                self.refresh_fa_reference()
+                self._sync_changes()
 
-    def delete_honorarium_pengelola(self, row):
-        hpk_id = int(self.tbl_hpk.item(row, 0).text())
+    def delete_honorarium_pengelola(self):
+        hpk_id = self.selected_id(TOPIC_HONOR_PENGELOLA)
+        if not hpk_id:
+            return
         reply = QMessageBox.question(self, "Konfirmasi", "Yakin ingin menghapus Honorarium ini?",
                                      QMessageBox.Yes | QMessageBox.No)
         if reply == QMessageBox.Yes:
             if self.db.delete_honorarium_pengelola(hpk_id):
-                self.refresh_honorarium_pengelola()
-                self.refresh_fa_reference()
+                self._sync_changes()
 
     def import_from_fa_detail(self):
         """Import honorarium amounts from FA Detail"""
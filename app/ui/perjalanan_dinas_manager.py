@@ -24,7 +24,14 @@ from PySide6.QtCore import Qt, Signal, QDate, QLocale
 from PySide6.QtGui import QAction, QColor
 
 from app.core.database_v4 import get_db_manager_v4
-from app.core.config import SATKER_DEFAULT, TAHUN_ANGGARAN, OUTPUT_DIR
+from app.core.master_data import format_nama_pegawai
+from app.core.config import SATKER_DEFAULT, TAHUN_ANGGARAN
+from app.core.kalkulasi import KalkulasiModel, format_rupiah
+from app.services.document_bundles import (
+    BundlePipeline, PERJALANAN_DINAS_BUNDLE, BIAYA_PERJALANAN_DINAS,
+)
+from app.ui.dialogs.bundle_generate_dialog import BundleGenerateDialog
+from app.ui.master_data_models import bind_pegawai_combo, select_pegawai
 
 
 # ============================================================================
@@ -66,6 +73,10 @@ class CurrencySpinBox(QDoubleSpinBox):
 # PERJALANAN DINAS DIALOG (Add/Edit)
 # ============================================================================
 
+# Komponen biaya yang dijumlahkan menjadi total biaya
+BIAYA_KOMPONEN = BIAYA_PERJALANAN_DINAS
+
+
 class PerjalananDinasDialog(QDialog):
     """Dialog for adding/editing perjalanan dinas"""
 
@@ -73,6 +84,7 @@ class PerjalananDinasDialog(QDialog):
         super().__init__(parent)
         self.pd_data = pd_data
         self.db = get_db_manager_v4()
+        self.biaya_model = KalkulasiModel(BIAYA_KOMPONEN)
 
         self.setWindowTitle("Tambah Perjalanan Dinas" if not pd_data else "Edit Perjalanan Dinas")
         self.setMinimumWidth(800)
@@ -245,23 +257,28 @@ class PerjalananDinasDialog(QDialog):
         biaya_form = QFormLayout()
 
         self.spn_biaya_transport = CurrencySpinBox()
-        self.spn_biaya_transport.valueChanged.connect(self.update_total_biaya)
+        self.spn_biaya_transport.valueChanged.connect(
+            lambda v: self.biaya_model.set_value('biaya_transport', v))
         biaya_form.addRow("Biaya Transport:", self.spn_biaya_transport)
 
         self.spn_biaya_uang_harian = CurrencySpinBox()
-        self.spn_biaya_uang_harian.valueChanged.connect(self.update_total_biaya)
+        self.spn_biaya_uang_harian.valueChanged.connect(
+            lambda v: self.biaya_model.set_value('biaya_uang_harian', v))
         biaya_form.addRow("Uang Harian:", self.spn_biaya_uang_harian)
 
         self.spn_biaya_penginapan = CurrencySpinBox()
-        self.spn_biaya_penginapan.valueChanged.connect(self.update_total_biaya)
+        self.spn_biaya_penginapan.valueChanged.connect(
+            lambda v: self.biaya_model.set_value('biaya_penginapan', v))
         biaya_form.addRow("Biaya Penginapan:", self.spn_biaya_penginapan)
 
         self.spn_biaya_representasi = CurrencySpinBox()
-        self.spn_biaya_representasi.valueChanged.connect(self.update_total_biaya)
+        self.spn_biaya_representasi.valueChanged.connect(
+            lambda v: self.biaya_model.set_value('biaya_representasi', v))
         biaya_form.addRow("Uang Representasi:", self.spn_biaya_representasi)
 
         self.spn_biaya_lain = CurrencySpinBox()
-        self.spn_biaya_lain.valueChanged.connect(self.update_total_biaya)
+        self.spn_biaya_lain.valueChanged.connect(
+            lambda v: self.biaya_model.set_value('biaya_lain_lain', v))
         biaya_form.addRow("Biaya Lain-lain:", self.spn_biaya_lain)
 
         # Separator
@@ -272,6 +289,8 @@ class PerjalananDinasDialog(QDialog):
         self.lbl_total_biaya = QLabel("Rp 0")
         self.lbl_total_biaya.setStyleSheet("font-weight: bold; font-size: 14px;")
         biaya_form.addRow("TOTAL BIAYA:", self.lbl_total_biaya)
+        self.biaya_model.subscribe(
+            lambda total: self.lbl_total_biaya.setText(format_rupiah(total)))
 
         self.spn_uang_muka = CurrencySpinBox()
         biaya_form.addRow("Uang Muka Diterima:", self.spn_uang_muka)
@@ -377,66 +396,23 @@ class PerjalananDinasDialog(QDialog):
         """)
 
     def load_pegawai_combo(self):
-        """Load pegawai into combo box"""
-        self.cmb_pelaksana.clear()
-        self.cmb_pelaksana.addItem("-- Pilih Pegawai --", None)
-
-        try:
-            pegawai_list = self.db.get_all_pegawai(active_only=True)
-            for p in pegawai_list:
-                nama = p.get('nama', '')
-                if p.get('gelar_depan'):
-                    nama = f"{p['gelar_depan']} {nama}"
-                if p.get('gelar_belakang'):
-                    nama = f"{nama}, {p['gelar_belakang']}"
-                self.cmb_pelaksana.addItem(nama, p)
-        except Exception as e:
-            print(f"Error loading pegawai: {e}")
+        """Load pegawai into combo box (model bersama)"""
+        bind_pegawai_combo(self.cmb_pelaksana, db_path=self.db.db_path)
 
     def load_ppk_combo(self):
         """Load PPK into combo box"""
-        self.cmb_ppk.clear()
-        self.cmb_ppk.addItem("-- Pilih PPK --", None)
-
-        try:
-            pegawai_list = self.db.get_pegawai_by_role('ppk')
-            for p in pegawai_list:
-                nama = p.get('nama', '')
-                if p.get('gelar_depan'):
-                    nama = f"{p['gelar_depan']} {nama}"
-                if p.get('gelar_belakang'):
-                    nama = f"{nama}, {p['gelar_belakang']}"
-                self.cmb_ppk.addItem(nama, p)
-        except Exception as e:
-            print(f"Error loading PPK: {e}")
+        bind_pegawai_combo(self.cmb_ppk, 'ppk', "-- Pilih PPK --", db_path=self.db.db_path)
 
     def load_bendahara_combo(self):
         """Load Bendahara into combo box"""
-        self.cmb_bendahara.clear()
-        self.cmb_bendahara.addItem("-- Pilih Bendahara --", None)
-
-        try:
-            pegawai_list = self.db.get_pegawai_by_role('bendahara')
-            for p in pegawai_list:
-                nama = p.get('nama', '')
-                if p.get('gelar_depan'):
-                    nama = f"{p['gelar_depan']} {nama}"
-                if p.get('gelar_belakang'):
-                    nama = f"{nama}, {p['gelar_belakang']}"
-                self.cmb_bendahara.addItem(nama, p)
-        except Exception as e:
-            print(f"Error loading bendahara: {e}")
+        bind_pegawai_combo(self.cmb_bendahara, 'bendahara', "-- Pilih Bendahara --",
+                           db_path=self.db.db_path)
 
     def on_pelaksana_selected(self, index):
         """Fill form when pelaksana selected"""
         data = self.cmb_pelaksana.currentData()
         if data and isinstance(data, dict):
-            nama = data.get('nama', '')
-            if data.get('gelar_depan'):
-                nama = f"{data['gelar_depan']} {nama}"
-            if data.get('gelar_belakang'):
-                nama = f"{nama}, {data['gelar_belakang']}"
-            self.txt_pelaksana_nama.setText(nama)
+            self.txt_pelaksana_nama.setText(format_nama_pegawai(data))
             self.txt_pelaksana_nip.setText(data.get('nip', '') or '')
             self.txt_pelaksana_pangkat.setText(data.get('pangkat', '') or '')
             self.txt_pelaksana_golongan.setCurrentText(data.get('golongan', '') or '')
@@ -446,24 +422,14 @@ class PerjalananDinasDialog(QDialog):
         """Fill PPK data"""
         data = self.cmb_ppk.currentData()
         if data and isinstance(data, dict):
-            nama = data.get('nama', '')
-            if data.get('gelar_depan'):
-                nama = f"{data['gelar_depan']} {nama}"
-            if data.get('gelar_belakang'):
-                nama = f"{nama}, {data['gelar_belakang']}"
-            self.txt_ppk_nama.setText(nama)
+            self.txt_ppk_nama.setText(format_nama_pegawai(data))
             self.txt_ppk_nip.setText(data.get('nip', '') or '')
 
     def on_bendahara_selected(self, index):
         """Fill Bendahara data"""
         data = self.cmb_bendahara.currentData()
         if data and isinstance(data, dict):
-            nama = data.get('nama', '')
-            if data.get('gelar_depan'):
-                nama = f"{data['gelar_depan']} {nama}"
-            if data.get('gelar_belakang'):
-                nama = f"{nama}, {data['gelar_belakang']}"
-            self.txt_bendahara_nama.setText(nama)
+            self.txt_bendahara_nama.setText(format_nama_pegawai(data))
             self.txt_bendahara_nip.setText(data.get('nip', '') or '')
 
     def update_lama_perjalanan(self):
@@ -474,15 +440,14 @@ class PerjalananDinasDialog(QDialog):
         self.spn_lama.setValue(max(1, lama))
 
     def update_total_biaya(self):
-        """Calculate total cost"""
-        total = (
-            self.spn_biaya_transport.value() +
-            self.spn_biaya_uang_harian.value() +
-            self.spn_biaya_penginapan.value() +
-            self.spn_biaya_representasi.value() +
-            self.spn_biaya_lain.value()
-        )
-        self.lbl_total_biaya.setText(f"Rp {total:,.0f}".replace(',', '.'))
+        """Recalculate total cost from all inputs"""
+        self.biaya_model.set_values({
+            'biaya_transport': self.spn_biaya_transport.value(),
+            'biaya_uang_harian': self.spn_biaya_uang_harian.value(),
+            'biaya_penginapan': self.spn_biaya_penginapan.value(),
+            'biaya_representasi': self.spn_biaya_representasi.value(),
+            'biaya_lain_lain': self.spn_biaya_lain.value(),
+        })
 
     def load_data(self):
         """Load existing data"""
@@ -543,11 +508,7 @@ class PerjalananDinasDialog(QDialog):
 
     def _set_combo_by_id(self, combo: QComboBox, pegawai_id: int):
         """Set combo selection by pegawai ID"""
-        for i in range(combo.count()):
-            data = combo.itemData(i)
-            if data and isinstance(data, dict) and data.get('id') == pegawai_id:
-                combo.setCurrentIndex(i)
-                return
+        select_pegawai(combo, pegawai_id)
 
     def get_data(self) -> dict:
         """Get form data"""
@@ -896,269 +857,20 @@ class PerjalananDinasManager(QDialog):
 # GENERATE DOCUMENT DIALOG
 # ============================================================================
 
-class GeneratePDDocumentDialog(QDialog):
+class GeneratePDDocumentDialog(BundleGenerateDialog):
     """Dialog for generating perjalanan dinas documents"""
 
     def __init__(self, pd_data: dict, parent=None):
-        super().__init__(parent)
-        self.pd_data = pd_data
-        self.db = get_db_manager_v4()
-
-        self.setWindowTitle("Generate Dokumen Perjalanan Dinas")
-        self.setMinimumWidth(500)
-        self.setup_ui()
-
-    def setup_ui(self):
-        layout = QVBoxLayout(self)
-
-        # Info
-        info_group = QGroupBox("Perjalanan Dinas")
-        info_form = QFormLayout()
-        info_form.addRow("Kegiatan:", QLabel(self.pd_data.get('nama_kegiatan', '-')))
-        info_form.addRow("Pelaksana:", QLabel(self.pd_data.get('pelaksana_nama', '-')))
-        info_form.addRow("Tujuan:", QLabel(self.pd_data.get('kota_tujuan', '-')))
-        info_group.setLayout(info_form)
-        layout.addWidget(info_group)
-
-        # Document checkboxes
-        doc_group = QGroupBox("Pilih Dokumen yang akan di-generate")
-        doc_layout = QVBoxLayout()
-
-        self.chk_surat_tugas = QCheckBox("📄 Surat Tugas")
-        self.chk_surat_tugas.setChecked(True)
-        doc_layout.addWidget(self.chk_surat_tugas)
-
-        self.chk_sppd = QCheckBox("📄 SPPD (Surat Perintah Perjalanan Dinas)")
-        self.chk_sppd.setChecked(True)
-        doc_layout.addWidget(self.chk_sppd)
-
-        self.chk_kuitansi_um = QCheckBox("💰 Kuitansi Uang Muka")
-        self.chk_kuitansi_um.setChecked(True)
-        doc_layout.addWidget(self.chk_kuitansi_um)
-
-        self.chk_rincian = QCheckBox("📊 Rincian Biaya Perjalanan Dinas")
-        doc_layout.addWidget(self.chk_rincian)
-
-        self.chk_kuitansi_rampung = QCheckBox("💰 Kuitansi Rampung")
-        doc_layout.addWidget(self.chk_kuitansi_rampung)
-
-        self.chk_daftar_riil = QCheckBox("📋 Daftar Pengeluaran Riil")
-        doc_layout.addWidget(self.chk_daftar_riil)
-
-        self.chk_laporan = QCheckBox("📝 Laporan Perjalanan Dinas")
-        doc_layout.addWidget(self.chk_laporan)
-
-        doc_group.setLayout(doc_layout)
-        layout.addWidget(doc_group)
-
-        # Buttons
-        btn_layout = QHBoxLayout()
-        btn_layout.addStretch()
-
-        btn_generate = QPushButton("🖨️ Generate Dokumen")
-        btn_generate.setStyleSheet("background-color: #27ae60; color: white; padding: 10px 20px;")
-        btn_generate.clicked.connect(self.generate)
-        btn_layout.addWidget(btn_generate)
-
-        btn_cancel = QPushButton("Batal")
-        btn_cancel.clicked.connect(self.reject)
-        btn_layout.addWidget(btn_cancel)
-
-        layout.addLayout(btn_layout)
-
-    def generate(self):
-        """Generate selected documents"""
-        import traceback
-        from app.core.config import WORD_TEMPLATES_DIR
-
-        generated = []
-        errors = []
-
-        try:
-            from app.templates.engine import get_template_engine
-            engine = get_template_engine()
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Gagal load template engine:\n{str(e)}\n\n{traceback.format_exc()}")
-            return
-
-        # Prepare placeholders
-        try:
-            placeholders = self._prepare_placeholders()
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Gagal menyiapkan data:\n{str(e)}\n\n{traceback.format_exc()}")
-            return
-
-        # Output folder
-        try:
-            output_folder = os.path.join(
-                OUTPUT_DIR,
-                str(TAHUN_ANGGARAN),
-                "Perjalanan_Dinas",
-                f"PD_{self.pd_data['id']}_{self.pd_data.get('pelaksana_nama', 'unknown')[:20]}"
-            )
-            os.makedirs(output_folder, exist_ok=True)
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Gagal membuat folder output:\n{str(e)}")
-            return
-
-        # Generate each selected document
-        docs_to_generate = []
-        if self.chk_surat_tugas.isChecked():
-            docs_to_generate.append(('surat_tugas', 'Surat_Tugas'))
-        if self.chk_sppd.isChecked():
-            docs_to_generate.append(('sppd', 'SPPD'))
-        if self.chk_kuitansi_um.isChecked():
-            docs_to_generate.append(('kuitansi_uang_muka', 'Kuitansi_Uang_Muka'))
-        if self.chk_rincian.isChecked():
-            docs_to_generate.append(('rincian_biaya_pd', 'Rincian_Biaya'))
-        if self.chk_kuitansi_rampung.isChecked():
-            docs_to_generate.append(('kuitansi_rampung', 'Kuitansi_Rampung'))
-        if self.chk_daftar_riil.isChecked():
-            docs_to_generate.append(('daftar_pengeluaran_riil', 'Daftar_Pengeluaran_Riil'))
-        if self.chk_laporan.isChecked():
-            docs_to_generate.append(('laporan_perjalanan_dinas', 'Laporan_Perjalanan_Dinas'))
-
-        if not docs_to_generate:
-            QMessageBox.warning(self, "Peringatan", "Pilih minimal satu dokumen untuk di-generate!")
-            return
-
-        for template_name, output_name in docs_to_generate:
-            try:
-                template_path = os.path.join(WORD_TEMPLATES_DIR, f"{template_name}.docx")
-                output_path = os.path.join(output_folder, f"{output_name}.docx")
-
-                # Check if template exists
-                if not os.path.exists(template_path):
-                    errors.append(f"{output_name}: Template tidak ditemukan di {template_path}")
-                    continue
-
-                engine.merge_word(
-                    template_path=template_path,
-                    data=placeholders,
-                    output_path=output_path
-                )
-                generated.append(output_name)
-            except Exception as e:
-                errors.append(f"{output_name}: {str(e)}\n{traceback.format_exc()}")
-
-        # Show result
-        if generated:
-            msg = f"Berhasil generate {len(generated)} dokumen:\n"
-            msg += "\n".join([f"✅ {d}" for d in generated])
-            if errors:
-                msg += f"\n\n⚠️ Error:\n" + "\n".join(errors)
-            msg += f"\n\n📁 Output: {output_folder}"
-
-            QMessageBox.information(self, "Generate Selesai", msg)
-
-            # Open folder
-            import sys
-            if sys.platform == 'win32':
-                os.startfile(output_folder)
-            elif sys.platform == 'darwin':
-                os.system(f'open "{output_folder}"')
-            else:
-                os.system(f'xdg-open "{output_folder}"')
-
-            self.accept()
-        else:
-            error_msg = "Tidak ada dokumen yang berhasil di-generate."
-            if errors:
-                error_msg += "\n\n" + "\n".join(errors)
-            QMessageBox.warning(self, "Error", error_msg)
-
-    def _prepare_placeholders(self) -> dict:
-        """Prepare placeholders from perjalanan dinas data"""
-        d = self.pd_data
-
-        # Calculate total
-        total_biaya = (
-            (d.get('biaya_transport', 0) or 0) +
-            (d.get('biaya_uang_harian', 0) or 0) +
-            (d.get('biaya_penginapan', 0) or 0) +
-            (d.get('biaya_representasi', 0) or 0) +
-            (d.get('biaya_lain_lain', 0) or 0)
+        super().__init__(
+            PERJALANAN_DINAS_BUNDLE, pd_data,
+            info_rows=[("Kegiatan:", pd_data.get('nama_kegiatan', '-')),
+                       ("Pelaksana:", pd_data.get('pelaksana_nama', '-')),
+                       ("Tujuan:", pd_data.get('kota_tujuan', '-'))],
+            info_title="Perjalanan Dinas",
+            pipeline=BundlePipeline(db_path=get_db_manager_v4().db_path),
+            parent=parent,
         )
-
-        uang_muka = d.get('uang_muka', 0) or 0
-        selisih = total_biaya - uang_muka
-
-        # Format currency
-        def fmt_rp(value):
-            return f"Rp {value:,.0f}".replace(',', '.')
-
-        # Terbilang
-        def terbilang_rupiah(n):
-            from app.templates.engine import terbilang
-            return terbilang(n)
-
-        # Get satker data from database
-        satker = self.db.get_satker()
-        pejabat = self.db.get_satker_pejabat()
-
-        return {
-            # DIPA - dari master data satker
-            'satker_kode': satker.get('kode', ''),
-            'satker_nama': satker.get('nama', ''),
-            'satker_alamat': satker.get('alamat', ''),
-            'satker_kota': satker.get('kota', ''),
-            'satker_provinsi': satker.get('provinsi', ''),
-            'kementerian': satker.get('kementerian', ''),
-            'eselon1': satker.get('eselon1', ''),
-            'tahun_anggaran': str(TAHUN_ANGGARAN),
-            'sumber_dana': d.get('sumber_dana', 'DIPA'),
-            'kode_akun': d.get('kode_akun', ''),
-
-            # Kegiatan
-            'nama_paket': d.get('nama_kegiatan', ''),
-            'maksud_perjalanan': d.get('maksud_perjalanan', ''),
-
-            # Pelaksana
-            'pelaksana_nama': d.get('pelaksana_nama', ''),
-            'pelaksana_nip': d.get('pelaksana_nip', ''),
-            'pelaksana_pangkat': d.get('pelaksana_pangkat', ''),
-            'pelaksana_golongan': d.get('pelaksana_golongan', ''),
-            'pelaksana_jabatan': d.get('pelaksana_jabatan', ''),
-
-            # Tujuan
-            'kota_asal': d.get('kota_asal', ''),
-            'kota_tujuan': d.get('kota_tujuan', ''),
-            'provinsi_tujuan': d.get('provinsi_tujuan', ''),
-            'alamat_tujuan': d.get('alamat_tujuan', ''),
-
-            # Waktu
-            'tanggal_surat_tugas': str(d.get('tanggal_surat_tugas', '')),
-            'tanggal_berangkat': str(d.get('tanggal_berangkat', '')),
-            'tanggal_kembali': str(d.get('tanggal_kembali', '')),
-            'lama_perjalanan': str(d.get('lama_perjalanan', 1)),
-
-            # Nomor dokumen
-            'nomor_surat_tugas': d.get('nomor_surat_tugas', ''),
-            'nomor_sppd': d.get('nomor_sppd', ''),
-
-            # Biaya
-            'biaya_transport': fmt_rp(d.get('biaya_transport', 0) or 0),
-            'biaya_uang_harian': fmt_rp(d.get('biaya_uang_harian', 0) or 0),
-            'biaya_penginapan': fmt_rp(d.get('biaya_penginapan', 0) or 0),
-            'biaya_representasi': fmt_rp(d.get('biaya_representasi', 0) or 0),
-            'biaya_lain_lain': fmt_rp(d.get('biaya_lain_lain', 0) or 0),
-            'total_biaya': fmt_rp(total_biaya),
-            'uang_muka': fmt_rp(uang_muka),
-            'uang_muka_terbilang': terbilang_rupiah(uang_muka),
-            'kekurangan_bayar': fmt_rp(max(0, selisih)),
-            'kelebihan_bayar': fmt_rp(max(0, -selisih)),
-            'sisa_terbilang': terbilang_rupiah(abs(selisih)),
-
-            # Pejabat - dari master data satker
-            'kpa_nama': pejabat.get('kpa_nama', ''),
-            'kpa_nip': pejabat.get('kpa_nip', ''),
-            'ppk_nama': d.get('ppk_nama', '') or pejabat.get('ppk_nama', ''),
-            'ppk_nip': d.get('ppk_nip', '') or pejabat.get('ppk_nip', ''),
-            'ppk_jabatan': d.get('ppk_jabatan', '') or 'Pejabat Pembuat Komitmen',
-            'bendahara_nama': d.get('bendahara_nama', '') or pejabat.get('bendahara_nama', ''),
-            'bendahara_nip': d.get('bendahara_nip', '') or pejabat.get('bendahara_nip', ''),
-        }
-
+        self.pd_data = pd_data
 
 # ============================================================================
 # HELPER FUNCTION
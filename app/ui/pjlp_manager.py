@@ -25,7 +25,9 @@ from PySide6.QtCore import Qt, Signal, QDate, QLocale
 from PySide6.QtGui import QAction, QColor
 
 from app.core.database_v4 import get_db_manager_v4
+from app.core.master_data import get_master_data, format_nama_pegawai
 from app.core.config import SATKER_DEFAULT, TAHUN_ANGGARAN, OUTPUT_DIR
+from app.ui.master_data_models import bind_pegawai_combo, select_pegawai
 
 
 # ============================================================================
@@ -236,7 +238,7 @@ class PJLPDialog(QDialog):
         form2 = QVBoxLayout(tab_pejabat)
 
         # Get default pejabat from database
-        pejabat_default = self.db.get_satker_pejabat()
+        pejabat_default = get_master_data(self.db.db_path).get_satker_pejabat()
 
         # PPK - Hybrid approach dengan ComboBox dan editable text
         ppk_group = QGroupBox("Pejabat Pembuat Komitmen (PPK)")
@@ -324,37 +326,17 @@ class PJLPDialog(QDialog):
         self.spn_total_kontrak.setValue(honor * bulan)
 
     def _load_ppk_combo(self):
-        """Load PPK pegawai into combo box"""
-        self.cmb_ppk.clear()
-        self.cmb_ppk.addItem("-- Pilih PPK --", None)
-        try:
-            pegawai_list = self.db.get_pegawai_by_role('ppk')
-            for p in pegawai_list:
-                nama = self._format_nama(p)
-                self.cmb_ppk.addItem(nama, p)
-        except Exception as e:
-            print(f"Error loading PPK: {e}")
+        """Load PPK pegawai into combo box (model bersama)"""
+        bind_pegawai_combo(self.cmb_ppk, 'ppk', "-- Pilih PPK --", db_path=self.db.db_path)
 
     def _load_bendahara_combo(self):
-        """Load Bendahara pegawai into combo box"""
-        self.cmb_bendahara.clear()
-        self.cmb_bendahara.addItem("-- Pilih Bendahara --", None)
-        try:
-            pegawai_list = self.db.get_pegawai_by_role('bendahara')
-            for p in pegawai_list:
-                nama = self._format_nama(p)
-                self.cmb_bendahara.addItem(nama, p)
-        except Exception as e:
-            print(f"Error loading Bendahara: {e}")
+        """Load Bendahara pegawai into combo box (model bersama)"""
+        bind_pegawai_combo(self.cmb_bendahara, 'bendahara', "-- Pilih Bendahara --",
+                           db_path=self.db.db_path)
 
     def _format_nama(self, p: dict) -> str:
         """Format nama pegawai dengan gelar"""
-        nama = p.get('nama', '')
-        if p.get('gelar_depan'):
-            nama = f"{p['gelar_depan']} {nama}"
-        if p.get('gelar_belakang'):
-            nama = f"{nama}, {p['gelar_belakang']}"
-        return nama
+        return format_nama_pegawai(p)
 
     def _on_ppk_selected(self, index):
         data = self.cmb_ppk.currentData()
@@ -373,11 +355,7 @@ class PJLPDialog(QDialog):
         """Helper to set ComboBox selection by pegawai ID"""
         if not pegawai_id:
             return
-        for i in range(combo.count()):
-            data = combo.itemData(i)
-            if data and isinstance(data, dict) and data.get('id') == pegawai_id:
-                combo.setCurrentIndex(i)
-                return
+        select_pegawai(combo, pegawai_id)
 
     def load_data(self):
         """Load existing PJLP data"""
@@ -893,6 +871,17 @@ class PJLPManager(QWidget):
         rekap_filter.addWidget(btn_rekap)
 
         rekap_filter.addStretch()
+
+        btn_payroll = QPushButton("Generate Pembayaran Bulanan")
+        btn_payroll.setStyleSheet("background-color: #27ae60; color: white; padding: 8px 16px;")
+        btn_payroll.setToolTip("Buat pembayaran draft untuk semua kontrak aktif pada bulan ini")
+        btn_payroll.clicked.connect(self.run_payroll)
+        rekap_filter.addWidget(btn_payroll)
+
+        self.btn_batal_payroll = QPushButton("Batalkan Payroll")
+        self.btn_batal_payroll.setStyleSheet("background-color: #e74c3c; color: white; padding: 8px 16px;")
+        self.btn_batal_payroll.clicked.connect(self.reverse_payroll)
+        rekap_filter.addWidget(self.btn_batal_payroll)
         rekap_layout.addLayout(rekap_filter)
 
         # Rekap table
@@ -1146,21 +1135,17 @@ class PJLPManager(QWidget):
         bulan = self.cmb_rekap_bulan.currentData()
         tahun = self.spn_rekap_tahun.value()
 
-        payments = self.db.get_pembayaran_by_bulan(bulan, tahun)
+        rekap = self.db.get_rekap_pembayaran_pjlp(bulan, tahun)
+        payments = rekap['items']
+        total = rekap['total']
         self.tbl_rekap.setRowCount(len(payments))
 
-        total_bruto = 0
-        total_potongan = 0
-        total_netto = 0
-
         for row, p in enumerate(payments):
             self.tbl_rekap.setItem(row, 0, QTableWidgetItem(p.get('nama_pjlp', '')))
             self.tbl_rekap.setItem(row, 1, QTableWidgetItem(p.get('nama_pekerjaan', '')))
             self.tbl_rekap.setItem(row, 2, QTableWidgetItem(self.format_currency(p.get('honor_bulanan', 0))))
             self.tbl_rekap.setItem(row, 3, QTableWidgetItem(self.format_currency(p.get('nilai_bruto', 0))))
-
-            potongan = (p.get('potongan_pajak', 0) or 0) + (p.get('potongan_lain', 0) or 0)
-            self.tbl_rekap.setItem(row, 4, QTableWidgetItem(self.format_currency(potongan)))
+            self.tbl_rekap.setItem(row, 4, QTableWidgetItem(self.format_currency(p.get('total_potongan', 0))))
             self.tbl_rekap.setItem(row, 5, QTableWidgetItem(self.format_currency(p.get('nilai_netto', 0))))
 
             status_item = QTableWidgetItem(p.get('status', ''))
@@ -1168,15 +1153,71 @@ class PJLPManager(QWidget):
                 status_item.setBackground(QColor('#d4edda'))
             self.tbl_rekap.setItem(row, 6, status_item)
 
-            total_bruto += p.get('nilai_bruto', 0) or 0
-            total_potongan += potongan
-            total_netto += p.get('nilai_netto', 0) or 0
+        runs = self.db.get_payroll_runs_pjlp(bulan=bulan, tahun=tahun, status='aktif')
+        self.btn_batal_payroll.setEnabled(bool(runs))
 
         bulan_nama = self.BULAN_NAMES[bulan - 1]
         self.lbl_rekap_total.setText(
             f"Rekap Pembayaran PJLP {bulan_nama} {tahun}\n\n"
-            f"Jumlah PJLP: {len(payments)} orang\n"
-            f"Total Bruto: {self.format_currency(total_bruto)}\n"
-            f"Total Potongan: {self.format_currency(total_potongan)}\n"
-            f"Total Netto: {self.format_currency(total_netto)}"
+            f"Jumlah PJLP: {total['jumlah']} orang\n"
+            f"Total Bruto: {self.format_currency(total['total_bruto'])}\n"
+            f"Total Potongan: {self.format_currency(total['total_potongan'])}\n"
+            f"Total Netto: {self.format_currency(total['total_netto'])}"
         )
+
+    def run_payroll(self):
+        """Generate draft payments for all active contracts in the recap month"""
+        bulan = self.cmb_rekap_bulan.currentData()
+        tahun = self.spn_rekap_tahun.value()
+        bulan_nama = self.BULAN_NAMES[bulan - 1]
+
+        reply = QMessageBox.question(
+            self, "Generate Pembayaran",
+            f"Buat pembayaran draft {bulan_nama} {tahun} untuk semua kontrak PJLP aktif?\n\n"
+            "Kontrak yang sudah memiliki pembayaran bulan ini dilewati.",
+            QMessageBox.Yes | QMessageBox.No
+        )
+        if reply != QMessageBox.Yes:
+            return
+
+        try:
+            run = self.db.run_payroll_pjlp(bulan, tahun)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Gagal generate pembayaran: {str(e)}")
+            return
+
+        self.refresh_rekap()
+        self.refresh_pembayaran()
+        QMessageBox.information(
+            self, "Sukses",
+            f"{run['jumlah_baru']} pembayaran dibuat, "
+            f"{run['jumlah_dilewati']} kontrak dilewati (sudah ada)."
+        )
+
+    def reverse_payroll(self):
+        """Cancel the active payroll run of the recap month"""
+        bulan = self.cmb_rekap_bulan.currentData()
+        tahun = self.spn_rekap_tahun.value()
+        runs = self.db.get_payroll_runs_pjlp(bulan=bulan, tahun=tahun, status='aktif')
+        if not runs:
+            return
+        run = runs[0]
+
+        reply = QMessageBox.question(
+            self, "Batalkan Payroll",
+            f"Hapus {run['jumlah_pembayaran']} pembayaran hasil generate "
+            f"{self.BULAN_NAMES[bulan - 1]} {tahun}?\n\n"
+            "Pembayaran yang diinput manual tidak ikut dihapus.",
+            QMessageBox.Yes | QMessageBox.No
+        )
+        if reply != QMessageBox.Yes:
+            return
+
+        try:
+            self.db.reverse_payroll_pjlp(run['id'])
+        except ValueError as e:
+            QMessageBox.warning(self, "Gagal", str(e))
+            return
+
+        self.refresh_rekap()
+        self.refresh_pembayaran()
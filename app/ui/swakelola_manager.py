@@ -25,7 +25,12 @@ from PySide6.QtCore import Qt, Signal, QDate, QLocale
 from PySide6.QtGui import QAction, QColor
 
 from app.core.database_v4 import get_db_manager_v4
-from app.core.config import SATKER_DEFAULT, TAHUN_ANGGARAN, OUTPUT_DIR
+from app.core.master_data import format_nama_pegawai
+from app.core.config import SATKER_DEFAULT, TAHUN_ANGGARAN
+from app.core.kalkulasi import format_rupiah
+from app.services.document_bundles import BundlePipeline, SWAKELOLA_BUNDLE
+from app.ui.dialogs.bundle_generate_dialog import BundleGenerateDialog
+from app.ui.master_data_models import bind_pegawai_combo, select_pegawai
 
 
 # ============================================================================
@@ -426,65 +431,22 @@ class SwakelolaDialog(QDialog):
         """)
 
     def load_pegawai_combo(self, combo: QComboBox):
-        """Load pegawai into combo box"""
-        combo.clear()
-        combo.addItem("-- Pilih Pegawai --", None)
-
-        try:
-            pegawai_list = self.db.get_all_pegawai(active_only=True)
-            for p in pegawai_list:
-                nama = p.get('nama', '')
-                if p.get('gelar_depan'):
-                    nama = f"{p['gelar_depan']} {nama}"
-                if p.get('gelar_belakang'):
-                    nama = f"{nama}, {p['gelar_belakang']}"
-                combo.addItem(nama, p)
-        except Exception as e:
-            print(f"Error loading pegawai: {e}")
+        """Load pegawai into combo box (model bersama)"""
+        bind_pegawai_combo(combo, db_path=self.db.db_path)
 
     def load_ppk_combo(self):
         """Load PPK into combo box"""
-        self.cmb_ppk.clear()
-        self.cmb_ppk.addItem("-- Pilih PPK --", None)
-
-        try:
-            pegawai_list = self.db.get_pegawai_by_role('ppk')
-            for p in pegawai_list:
-                nama = p.get('nama', '')
-                if p.get('gelar_depan'):
-                    nama = f"{p['gelar_depan']} {nama}"
-                if p.get('gelar_belakang'):
-                    nama = f"{nama}, {p['gelar_belakang']}"
-                self.cmb_ppk.addItem(nama, p)
-        except Exception as e:
-            print(f"Error loading PPK: {e}")
+        bind_pegawai_combo(self.cmb_ppk, 'ppk', "-- Pilih PPK --", db_path=self.db.db_path)
 
     def load_bendahara_combo(self):
         """Load Bendahara into combo box"""
-        self.cmb_bendahara.clear()
-        self.cmb_bendahara.addItem("-- Pilih Bendahara --", None)
-
-        try:
-            pegawai_list = self.db.get_pegawai_by_role('bendahara')
-            for p in pegawai_list:
-                nama = p.get('nama', '')
-                if p.get('gelar_depan'):
-                    nama = f"{p['gelar_depan']} {nama}"
-                if p.get('gelar_belakang'):
-                    nama = f"{nama}, {p['gelar_belakang']}"
-                self.cmb_bendahara.addItem(nama, p)
-        except Exception as e:
-            print(f"Error loading bendahara: {e}")
+        bind_pegawai_combo(self.cmb_bendahara, 'bendahara', "-- Pilih Bendahara --",
+                           db_path=self.db.db_path)
 
     def _fill_pegawai_fields(self, data, nama_field, nip_field, jabatan_field=None):
         """Helper to fill pegawai fields"""
         if data and isinstance(data, dict):
-            nama = data.get('nama', '')
-            if data.get('gelar_depan'):
-                nama = f"{data['gelar_depan']} {nama}"
-            if data.get('gelar_belakang'):
-                nama = f"{nama}, {data['gelar_belakang']}"
-            nama_field.setText(nama)
+            nama_field.setText(format_nama_pegawai(data))
             nip_field.setText(data.get('nip', '') or '')
             if jabatan_field:
                 jabatan_field.setText(data.get('jabatan', '') or '')
@@ -513,11 +475,7 @@ class SwakelolaDialog(QDialog):
         """Helper to set ComboBox selection by pegawai ID"""
         if not pegawai_id:
             return
-        for i in range(combo.count()):
-            data = combo.itemData(i)
-            if data and isinstance(data, dict) and data.get('id') == pegawai_id:
-                combo.setCurrentIndex(i)
-                return
+        select_pegawai(combo, pegawai_id)
 
     def update_selisih(self):
         """Calculate difference between uang muka and realisasi"""
@@ -838,9 +796,6 @@ class SwakelolaManager(QDialog):
         """Display data in table"""
         self.table.setRowCount(len(data_list))
 
-        def fmt_rp(value):
-            return f"Rp {value:,.0f}".replace(',', '.')
-
         for row, sw in enumerate(data_list):
             # No
             self.table.setItem(row, 0, QTableWidgetItem(str(row + 1)))
@@ -853,19 +808,19 @@ class SwakelolaManager(QDialog):
             self.table.setItem(row, 2, QTableWidgetItem(f"Tipe {tipe + 1}"))
 
             # Pagu
-            self.table.setItem(row, 3, QTableWidgetItem(fmt_rp(sw.get('pagu_swakelola', 0) or 0)))
+            self.table.setItem(row, 3, QTableWidgetItem(format_rupiah(sw.get('pagu_swakelola', 0) or 0)))
 
             # Uang Muka
             uang_muka = sw.get('uang_muka', 0) or 0
-            self.table.setItem(row, 4, QTableWidgetItem(fmt_rp(uang_muka)))
+            self.table.setItem(row, 4, QTableWidgetItem(format_rupiah(uang_muka)))
 
             # Realisasi
             realisasi = sw.get('total_realisasi', 0) or 0
-            self.table.setItem(row, 5, QTableWidgetItem(fmt_rp(realisasi)))
+            self.table.setItem(row, 5, QTableWidgetItem(format_rupiah(realisasi)))
 
             # Sisa/Kurang
             selisih = uang_muka - realisasi
-            selisih_item = QTableWidgetItem(fmt_rp(abs(selisih)))
+            selisih_item = QTableWidgetItem(format_rupiah(abs(selisih)))
             if selisih >= 0:
                 selisih_item.setForeground(QColor('#27ae60'))
             else:
@@ -963,294 +918,20 @@ class SwakelolaManager(QDialog):
 # GENERATE DOCUMENT DIALOG
 # ============================================================================
 
-class GenerateSWDocumentDialog(QDialog):
+class GenerateSWDocumentDialog(BundleGenerateDialog):
     """Dialog for generating swakelola documents"""
 
     def __init__(self, sw_data: dict, parent=None):
-        super().__init__(parent)
+        tipe = sw_data.get('tipe_swakelola', 0) or 0
+        super().__init__(
+            SWAKELOLA_BUNDLE, sw_data,
+            info_rows=[("Kegiatan:", sw_data.get('nama_kegiatan', '-')),
+                       ("Tipe:", f"Tipe {tipe + 1}")],
+            info_title="Kegiatan Swakelola",
+            pipeline=BundlePipeline(db_path=get_db_manager_v4().db_path),
+            parent=parent,
+        )
         self.sw_data = sw_data
-        self.db = get_db_manager_v4()
-
-        self.setWindowTitle("Generate Dokumen Swakelola")
-        self.setMinimumWidth(500)
-        self.setup_ui()
-
-    def setup_ui(self):
-        layout = QVBoxLayout(self)
-
-        # Info
-        info_group = QGroupBox("Kegiatan Swakelola")
-        info_form = QFormLayout()
-        info_form.addRow("Kegiatan:", QLabel(self.sw_data.get('nama_kegiatan', '-')))
-        tipe = self.sw_data.get('tipe_swakelola', 0) or 0
-        info_form.addRow("Tipe:", QLabel(f"Tipe {tipe + 1}"))
-        info_group.setLayout(info_form)
-        layout.addWidget(info_group)
-
-        # Document checkboxes
-        doc_group = QGroupBox("Pilih Dokumen yang akan di-generate")
-        doc_layout = QVBoxLayout()
-
-        self.chk_kak = QCheckBox("📄 KAK Swakelola")
-        self.chk_kak.setChecked(True)
-        doc_layout.addWidget(self.chk_kak)
-
-        self.chk_rab = QCheckBox("📊 RAB Swakelola (Excel)")
-        self.chk_rab.setChecked(True)
-        doc_layout.addWidget(self.chk_rab)
-
-        self.chk_sk_tim = QCheckBox("📄 SK Tim Pelaksana")
-        self.chk_sk_tim.setChecked(True)
-        doc_layout.addWidget(self.chk_sk_tim)
-
-        self.chk_kuitansi_um = QCheckBox("💰 Kuitansi Uang Muka Swakelola")
-        doc_layout.addWidget(self.chk_kuitansi_um)
-
-        self.chk_bap = QCheckBox("📄 Berita Acara Pembayaran")
-        doc_layout.addWidget(self.chk_bap)
-
-        self.chk_laporan = QCheckBox("📝 Laporan Kemajuan")
-        doc_layout.addWidget(self.chk_laporan)
-
-        self.chk_kuitansi_rampung = QCheckBox("💰 Kuitansi Rampung Swakelola")
-        doc_layout.addWidget(self.chk_kuitansi_rampung)
-
-        self.chk_bast = QCheckBox("📄 BAST Swakelola")
-        doc_layout.addWidget(self.chk_bast)
-
-        self.chk_daftar_hadir = QCheckBox("📋 Daftar Hadir")
-        doc_layout.addWidget(self.chk_daftar_hadir)
-
-        doc_group.setLayout(doc_layout)
-        layout.addWidget(doc_group)
-
-        # Buttons
-        btn_layout = QHBoxLayout()
-        btn_layout.addStretch()
-
-        btn_generate = QPushButton("🖨️ Generate Dokumen")
-        btn_generate.setStyleSheet("background-color: #27ae60; color: white; padding: 10px 20px;")
-        btn_generate.clicked.connect(self.generate)
-        btn_layout.addWidget(btn_generate)
-
-        btn_cancel = QPushButton("Batal")
-        btn_cancel.clicked.connect(self.reject)
-        btn_layout.addWidget(btn_cancel)
-
-        layout.addLayout(btn_layout)
-
-    def generate(self):
-        """Generate selected documents"""
-        import traceback
-        from app.core.config import WORD_TEMPLATES_DIR, EXCEL_TEMPLATES_DIR
-
-        generated = []
-        errors = []
-
-        try:
-            from app.templates.engine import get_template_engine
-            engine = get_template_engine()
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Gagal load template engine:\n{str(e)}\n\n{traceback.format_exc()}")
-            return
-
-        # Prepare placeholders
-        try:
-            placeholders = self._prepare_placeholders()
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Gagal menyiapkan data:\n{str(e)}\n\n{traceback.format_exc()}")
-            return
-
-        # Output folder
-        try:
-            output_folder = os.path.join(
-                OUTPUT_DIR,
-                str(TAHUN_ANGGARAN),
-                "Swakelola",
-                f"SW_{self.sw_data['id']}_{self.sw_data.get('nama_kegiatan', 'unknown')[:20]}"
-            )
-            os.makedirs(output_folder, exist_ok=True)
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Gagal membuat folder output:\n{str(e)}")
-            return
-
-        # Generate each selected document
-        docs_to_generate = []
-        if self.chk_kak.isChecked():
-            docs_to_generate.append(('kak_swakelola', 'KAK_Swakelola', 'word'))
-        if self.chk_rab.isChecked():
-            docs_to_generate.append(('rab_swakelola', 'RAB_Swakelola', 'excel'))
-        if self.chk_sk_tim.isChecked():
-            docs_to_generate.append(('sk_tim_swakelola', 'SK_Tim_Pelaksana', 'word'))
-        if self.chk_kuitansi_um.isChecked():
-            docs_to_generate.append(('kuitansi_uang_muka', 'Kuitansi_Uang_Muka', 'word'))
-        if self.chk_bap.isChecked():
-            docs_to_generate.append(('bap_swakelola', 'BA_Pembayaran', 'word'))
-        if self.chk_laporan.isChecked():
-            docs_to_generate.append(('laporan_kemajuan', 'Laporan_Kemajuan', 'word'))
-        if self.chk_kuitansi_rampung.isChecked():
-            docs_to_generate.append(('kuitansi_rampung', 'Kuitansi_Rampung', 'word'))
-        if self.chk_bast.isChecked():
-            docs_to_generate.append(('bast_swakelola', 'BAST_Swakelola', 'word'))
-        if self.chk_daftar_hadir.isChecked():
-            docs_to_generate.append(('daftar_hadir_swakelola', 'Daftar_Hadir', 'word'))
-
-        if not docs_to_generate:
-            QMessageBox.warning(self, "Peringatan", "Pilih minimal satu dokumen untuk di-generate!")
-            return
-
-        for template_name, output_name, doc_type in docs_to_generate:
-            try:
-                if doc_type == 'word':
-                    template_path = os.path.join(WORD_TEMPLATES_DIR, f"{template_name}.docx")
-                    output_path = os.path.join(output_folder, f"{output_name}.docx")
-
-                    # Check if template exists
-                    if not os.path.exists(template_path):
-                        errors.append(f"{output_name}: Template tidak ditemukan di {template_path}")
-                        continue
-
-                    engine.merge_word(
-                        template_path=template_path,
-                        data=placeholders,
-                        output_path=output_path
-                    )
-                elif doc_type == 'excel':
-                    template_path = os.path.join(EXCEL_TEMPLATES_DIR, f"{template_name}.xlsx")
-                    output_path = os.path.join(output_folder, f"{output_name}.xlsx")
-
-                    # Check if template exists
-                    if not os.path.exists(template_path):
-                        errors.append(f"{output_name}: Template tidak ditemukan di {template_path}")
-                        continue
-
-                    engine.merge_excel(
-                        template_path=template_path,
-                        data=placeholders,
-                        output_path=output_path
-                    )
-                generated.append(output_name)
-            except Exception as e:
-                errors.append(f"{output_name}: {str(e)}\n{traceback.format_exc()}")
-
-        # Show result
-        if generated:
-            msg = f"Berhasil generate {len(generated)} dokumen:\n"
-            msg += "\n".join([f"✅ {d}" for d in generated])
-            if errors:
-                msg += f"\n\n⚠️ Error:\n" + "\n".join(errors)
-            msg += f"\n\n📁 Output: {output_folder}"
-
-            QMessageBox.information(self, "Generate Selesai", msg)
-
-            # Open folder
-            import sys
-            if sys.platform == 'win32':
-                os.startfile(output_folder)
-            elif sys.platform == 'darwin':
-                os.system(f'open "{output_folder}"')
-            else:
-                os.system(f'xdg-open "{output_folder}"')
-
-            self.accept()
-        else:
-            error_msg = "Tidak ada dokumen yang berhasil di-generate."
-            if errors:
-                error_msg += "\n\n" + "\n".join(errors)
-            QMessageBox.warning(self, "Error", error_msg)
-
-    def _prepare_placeholders(self) -> dict:
-        """Prepare placeholders from swakelola data"""
-        d = self.sw_data
-
-        # Calculate selisih
-        uang_muka = d.get('uang_muka', 0) or 0
-        realisasi = d.get('total_realisasi', 0) or 0
-        selisih = uang_muka - realisasi
-
-        # Format currency
-        def fmt_rp(value):
-            return f"Rp {value:,.0f}".replace(',', '.')
-
-        # Terbilang
-        def terbilang_rupiah(n):
-            from app.templates.engine import terbilang
-            return terbilang(n)
-
-        # Get satker data from database
-        satker = self.db.get_satker()
-        pejabat = self.db.get_satker_pejabat()
-
-        return {
-            # DIPA - dari master data satker
-            'satker_kode': satker.get('kode', ''),
-            'satker_nama': satker.get('nama', ''),
-            'satker_alamat': satker.get('alamat', ''),
-            'satker_kota': satker.get('kota', ''),
-            'satker_provinsi': satker.get('provinsi', ''),
-            'kementerian': satker.get('kementerian', ''),
-            'eselon1': satker.get('eselon1', ''),
-            'tahun_anggaran': str(TAHUN_ANGGARAN),
-            'sumber_dana': d.get('sumber_dana', 'DIPA'),
-            'kode_akun': d.get('kode_akun', ''),
-
-            # Kegiatan
-            'nama_kegiatan': d.get('nama_kegiatan', ''),
-            'nama_paket': d.get('nama_kegiatan', ''),
-            'tipe_swakelola': d.get('tipe_swakelola_text', ''),
-            'deskripsi': d.get('deskripsi', ''),
-            'output_kegiatan': d.get('output_kegiatan', ''),
-
-            # Nomor dokumen
-            'nomor_kak': d.get('nomor_kak', ''),
-            'nomor_sk_tim': d.get('nomor_sk_tim', ''),
-
-            # Waktu
-            'tanggal_sk_tim': str(d.get('tanggal_sk_tim', '')),
-            'tanggal_mulai': str(d.get('tanggal_mulai', '')),
-            'tanggal_selesai': str(d.get('tanggal_selesai', '')),
-            'jangka_waktu': str(d.get('jangka_waktu', 30)),
-            'waktu_mulai': d.get('waktu_mulai', '08:00'),
-            'waktu_selesai': d.get('waktu_selesai', 'selesai'),
-            'tempat_kegiatan': d.get('tempat_kegiatan', '') or satker.get('nama', ''),
-
-            # Anggaran
-            'pagu_swakelola': fmt_rp(d.get('pagu_swakelola', 0) or 0),
-            'pagu_swakelola_terbilang': terbilang_rupiah(d.get('pagu_swakelola', 0) or 0),
-
-            # Uang Muka
-            'pum_nama': d.get('pum_nama', ''),
-            'pum_nip': d.get('pum_nip', ''),
-            'pum_jabatan': d.get('pum_jabatan', ''),
-            'uang_muka': fmt_rp(uang_muka),
-            'uang_muka_terbilang': terbilang_rupiah(uang_muka),
-            'tanggal_uang_muka': str(d.get('tanggal_uang_muka', '')),
-
-            # Realisasi / Rampung
-            'total_realisasi': fmt_rp(realisasi),
-            'total_realisasi_terbilang': terbilang_rupiah(realisasi),
-            'sisa_uang_muka': fmt_rp(max(0, selisih)),
-            'kekurangan_bayar': fmt_rp(max(0, -selisih)),
-            'tanggal_rampung': str(d.get('tanggal_rampung', '')),
-
-            # Tim
-            'ketua_nama': d.get('ketua_nama', ''),
-            'ketua_nip': d.get('ketua_nip', ''),
-            'ketua_jabatan': d.get('ketua_jabatan', ''),
-            'sekretaris_nama': d.get('sekretaris_nama', ''),
-            'sekretaris_nip': d.get('sekretaris_nip', ''),
-            'anggota_tim': d.get('anggota_tim', ''),
-
-            # Pejabat - dari master data satker
-            'kpa_nama': pejabat.get('kpa_nama', ''),
-            'kpa_nip': pejabat.get('kpa_nip', ''),
-            'ppk_nama': d.get('ppk_nama', '') or pejabat.get('ppk_nama', ''),
-            'ppk_nip': d.get('ppk_nip', '') or pejabat.get('ppk_nip', ''),
-            'ppk_jabatan': d.get('ppk_jabatan', '') or 'Pejabat Pembuat Komitmen',
-            'bendahara_nama': d.get('bendahara_nama', '') or pejabat.get('bendahara_nama', ''),
-            'bendahara_nip': d.get('bendahara_nip', '') or pejabat.get('bendahara_nip', ''),
-        }
-
 
 # ============================================================================
 # HELPER FUNCTION
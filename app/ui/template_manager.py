@@ -28,6 +28,7 @@ from app.core.config import (
     WORD_TEMPLATES_DIR, EXCEL_TEMPLATES_DIR, BACKUP_TEMPLATES_DIR,
     PHASE_TEMPLATE_GROUPS
 )
+from app.templates.catalog import get_template_catalog
 from app.templates.engine import get_template_manager
 
 
@@ -261,7 +262,7 @@ PANDUAN MEMBUAT TEMPLATE:
         btn_layout.addStretch()
         
         btn_refresh = QPushButton("🔄 Refresh")
-        btn_refresh.clicked.connect(self.load_templates)
+        btn_refresh.clicked.connect(lambda: self.load_templates(force=True))
         btn_layout.addWidget(btn_refresh)
         
         btn_close = QPushButton("Tutup")
@@ -270,10 +271,12 @@ PANDUAN MEMBUAT TEMPLATE:
         
         layout.addLayout(btn_layout)
     
-    def load_templates(self):
-        """Load template list"""
+    def load_templates(self, force: bool = False):
+        """Load template list (force=True: periksa ulang semua file template)"""
         self.template_table.setRowCount(0)
         
+        if force:
+            get_template_catalog(self.template_manager.db).refresh(force=True)
         templates = self.template_manager.get_all_templates_status()
         
         for template in templates:
@@ -326,12 +329,13 @@ PANDUAN MEMBUAT TEMPLATE:
             
             self.template_table.setCellWidget(row, 5, btn_widget)
 
-        # Refresh phase checklist progress
-        self.load_phase_checklists()
+        # Refresh phase checklist progress dari snapshot yang sama
+        self.load_phase_checklists(templates)
 
-    def load_phase_checklists(self):
+    def load_phase_checklists(self, status_list: List[Dict] = None):
         """Render checklist per fase berdasarkan ketersediaan template"""
-        status_list = self.template_manager.get_all_templates_status()
+        if status_list is None:
+            status_list = self.template_manager.get_all_templates_status()
         status_map = {item['code']: item for item in status_list}
 
         for group in PHASE_TEMPLATE_GROUPS:
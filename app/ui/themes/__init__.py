@@ -0,0 +1,19 @@
+"""
+PPK Document Factory - UI Themes
+================================
+Theme engine: satu stylesheet aplikasi dengan palet terang/gelap.
+"""
+
+from .palettes import (
+    LIGHT, DARK, PALETTES, THEME_LABELS, DEFAULT_THEME,
+    MEKANISME_TONE, STATUS_TONE,
+)
+from .theme_manager import (
+    ThemeManager, get_theme_manager, render_stylesheet, build_palette, set_role,
+)
+
+__all__ = [
+    'LIGHT', 'DARK', 'PALETTES', 'THEME_LABELS', 'DEFAULT_THEME',
+    'MEKANISME_TONE', 'STATUS_TONE',
+    'ThemeManager', 'get_theme_manager', 'render_stylesheet', 'build_palette', 'set_role',
+]
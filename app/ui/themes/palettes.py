@@ -0,0 +1,153 @@
+"""
+PPK DOCUMENT FACTORY - Theme Palettes
+=====================================
+Token warna untuk stylesheet aplikasi (app/ui/styles/main.qss).
+
+Di main.qss setiap warna ditulis sebagai token, mis. @primary atau
+@surface_alt, lalu diganti dengan nilai dari palet tema yang aktif.
+Tema baru cukup menyediakan semua token yang ada di LIGHT.
+"""
+
+from typing import Dict
+
+# ============================================================================
+# PALET
+# ============================================================================
+
+LIGHT: Dict[str, str] = {
+    # Permukaan
+    'background': '#f5f6fa',
+    'surface': '#ffffff',
+    'surface_alt': '#f8f9fa',
+    'border': '#ecf0f1',
+    'border_strong': '#dcdfe6',
+    'border_hover': '#bdc3c7',
+    'control': '#ecf0f1',
+    'control_hover': '#d5dbdb',
+    'control_pressed': '#bdc3c7',
+    'input_readonly': '#ecf0f1',
+
+    # Teks
+    'text': '#2c3e50',
+    'text_secondary': '#34495e',
+    'text_muted': '#7f8c8d',
+    'text_subtle': '#95a5a6',
+    'text_disabled': '#bdc3c7',
+    'text_inverse': '#ffffff',
+
+    # Sidebar, status bar, menu bar, tooltip
+    'chrome': '#2c3e50',
+    'chrome_hover': '#34495e',
+    'chrome_text': '#ecf0f1',
+    'chrome_text_muted': '#95a5a6',
+    'chrome_text_dim': '#bdc3c7',
+
+    # Warna status
+    'primary': '#3498db',
+    'primary_hover': '#2980b9',
+    'primary_pressed': '#21618c',
+    'primary_soft': '#ebf5fb',
+    'primary_strong': '#2471a3',
+    'success': '#27ae60',
+    'success_hover': '#1e8449',
+    'success_soft': '#e8f8f0',
+    'success_strong': '#1e8449',
+    'warning': '#f39c12',
+    'warning_hover': '#d68910',
+    'warning_soft': '#fef5e7',
+    'warning_strong': '#9a7d0a',
+    'danger': '#e74c3c',
+    'danger_hover': '#c0392b',
+    'danger_soft': '#fdeaea',
+    'danger_strong': '#943126',
+    'accent': '#9b59b6',
+    'accent_hover': '#7d3c98',
+    'accent_soft': '#f5eef8',
+    'neutral': '#95a5a6',
+    'neutral_hover': '#7f8c8d',
+}
+
+DARK: Dict[str, str] = {
+    'background': '#1b1f2a',
+    'surface': '#252a37',
+    'surface_alt': '#2c3241',
+    'border': '#343b4d',
+    'border_strong': '#434b60',
+    'border_hover': '#56607a',
+    'control': '#343b4d',
+    'control_hover': '#3f475c',
+    'control_pressed': '#4a536b',
+    'input_readonly': '#2f3546',
+
+    'text': '#e5e8ef',
+    'text_secondary': '#c9ceda',
+    'text_muted': '#9aa3b5',
+    'text_subtle': '#7d869a',
+    'text_disabled': '#5c6479',
+    'text_inverse': '#ffffff',
+
+    'chrome': '#141720',
+    'chrome_hover': '#222736',
+    'chrome_text': '#dfe3ea',
+    'chrome_text_muted': '#7d869a',
+    'chrome_text_dim': '#a3abbc',
+
+    'primary': '#3d9be0',
+    'primary_hover': '#2f86c6',
+    'primary_pressed': '#236ea5',
+    'primary_soft': '#1f3449',
+    'primary_strong': '#8cc6ef',
+    'success': '#2fb56a',
+    'success_hover': '#27995a',
+    'success_soft': '#1c3a2b',
+    'success_strong': '#80dca8',
+    'warning': '#f0a22e',
+    'warning_hover': '#d88c1b',
+    'warning_soft': '#3d321d',
+    'warning_strong': '#f6c878',
+    'danger': '#e5584a',
+    'danger_hover': '#c9473a',
+    'danger_soft': '#432628',
+    'danger_strong': '#f3a198',
+    'accent': '#a66bc0',
+    'accent_hover': '#8d54a6',
+    'accent_soft': '#352a40',
+    'neutral': '#6c7589',
+    'neutral_hover': '#5a6275',
+}
+
+PALETTES: Dict[str, Dict[str, str]] = {
+    'light': LIGHT,
+    'dark': DARK,
+}
+
+THEME_LABELS: Dict[str, str] = {
+    'light': 'Terang',
+    'dark': 'Gelap',
+}
+
+DEFAULT_THEME = 'light'
+
+# ============================================================================
+# TONE
+# ============================================================================
+# Nilai property "tone" yang dipakai main.qss untuk badge, tombol, dsb.
+
+MEKANISME_TONE: Dict[str, str] = {
+    'UP': 'success',
+    'TUP': 'warning',
+    'LS': 'primary',
+}
+
+STATUS_TONE: Dict[str, str] = {
+    'draft': 'neutral',
+    'aktif': 'primary',
+    'selesai': 'success',
+    'batal': 'danger',
+}
+
+
+__all__ = [
+    'LIGHT', 'DARK', 'PALETTES', 'THEME_LABELS', 'DEFAULT_THEME',
+    'MEKANISME_TONE', 'STATUS_TONE',
+]
@@ -0,0 +1,257 @@
+"""
+PPK DOCUMENT FACTORY - Theme Manager
+====================================
+Satu stylesheet level aplikasi untuk seluruh UI.
+
+main.qss ditulis dengan token warna (@primary, @surface, ...) dan
+selector object name / dynamic property ([role="card"], [tone="success"]).
+ThemeManager merender template dengan palet tema aktif lalu memasangnya
+sekali di QApplication, sehingga Qt hanya mem-parse satu stylesheet,
+bukan satu stylesheet per widget.
+
+Tema gelap dan ganti tema saat runtime masih opt-in lewat env PPK_THEME:
+sebagian layar masih memakai setStyleSheet inline dengan warna terang
+dan belum terbaca di palet gelap. Tanpa PPK_THEME aplikasi selalu memakai
+tema default dan toggle() tidak mengubah apa pun.
+
+Usage:
+    from app.ui.themes import get_theme_manager, set_role
+
+    get_theme_manager().apply()             # saat start
+    get_theme_manager().toggle()            # terang <-> gelap (PPK_THEME)
+
+    title = set_role(QLabel("Judul"), "page-title")
+    badge = set_role(QLabel("UP"), "badge", tone="success")
+"""
+
+import os
+import re
+import threading
+from typing import Dict, List, Optional
+
+from PySide6.QtCore import QObject, QSettings, Qt, Signal
+from PySide6.QtGui import QColor, QPalette
+from PySide6.QtWidgets import QApplication, QWidget
+
+from ...core.config import UI_THEME
+from .palettes import PALETTES, DEFAULT_THEME
+
+QSS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                        "styles", "main.qss")
+
+SETTINGS_ORG = "PPK Document Factory"
+SETTINGS_APP = "Asisten PPK Offline"
+SETTINGS_KEY = "ui/theme"
+
+_TOKEN_RE = re.compile(r"@([a-z][a-z0-9_]*)")
+
+
+# ============================================================================
+# RENDERING
+# ============================================================================
+
+def render_stylesheet(template: str, palette: Dict[str, str]) -> str:
+    """
+    Ganti semua token @nama di template dengan warna dari palette.
+
+    Raises:
+        KeyError: Jika template memakai token yang tidak ada di palette
+    """
+    missing = set()
+
+    def substitute(match):
+        token = match.group(1)
+        if token not in palette:
+            missing.add(token)
+            return match.group(0)
+        return palette[token]
+
+    rendered = _TOKEN_RE.sub(substitute, template)
+    if missing:
+        raise KeyError(f"Token tema tidak dikenal: {', '.join(sorted(missing))}")
+    return rendered
+
+
+def build_palette(colors: Dict[str, str]) -> QPalette:
+    """QPalette dari token tema, untuk bagian widget yang tidak dijangkau QSS."""
+    palette = QPalette()
+    roles = {
+        QPalette.Window: 'background',
+        QPalette.WindowText: 'text',
+        QPalette.Base: 'surface',
+        QPalette.AlternateBase: 'surface_alt',
+        QPalette.Text: 'text',
+        QPalette.Button: 'control',
+        QPalette.ButtonText: 'text',
+        QPalette.ToolTipBase: 'chrome',
+        QPalette.ToolTipText: 'chrome_text',
+        QPalette.PlaceholderText: 'text_disabled',
+        QPalette.Highlight: 'primary',
+        QPalette.HighlightedText: 'text_inverse',
+        QPalette.Link: 'primary',
+        QPalette.Mid: 'border_strong',
+        QPalette.Midlight: 'border',
+    }
+    for role, token in roles.items():
+        palette.setColor(role, QColor(colors[token]))
+    for role in (QPalette.WindowText, QPalette.Text, QPalette.ButtonText):
+        palette.setColor(QPalette.Disabled, role, QColor(colors['text_disabled']))
+    return palette
+
+
+def set_role(widget: QWidget, role: Optional[str] = None, **properties) -> QWidget:
+    """
+    Pasang dynamic property yang dipakai selector main.qss.
+
+    Widget yang sudah tampil di-repolish agar perubahan (mis. tone status)
+    langsung terlihat; widget baru cukup diberi property sebelum polish.
+
+    Args:
+        widget: Widget target
+        role: Nilai property "role" (None = tidak diubah)
+        **properties: Property lain, mis. tone="success" atau size="small"
+
+    Returns:
+        Widget yang sama, agar bisa dipakai inline
+    """
+    if role is not None:
+        widget.setProperty("role", role)
+    for name, value in properties.items():
+        widget.setProperty(name, value)
+    if widget.testAttribute(Qt.WA_WState_Polished):
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+        widget.update()
+    return widget
+
+
+# ============================================================================
+# THEME MANAGER
+# ============================================================================
+
+class ThemeManager(QObject):
+    """
+    Render dan pasang stylesheet aplikasi untuk tema terang/gelap.
+
+    Signals:
+        theme_changed(str): Nama tema setelah diganti
+    """
+
+    theme_changed = Signal(str)
+
+    def __init__(self, qss_path: str = QSS_PATH, persist: bool = True,
+                 switchable: Optional[bool] = None, parent=None):
+        super().__init__(parent)
+        self.qss_path = qss_path
+        self.persist = persist
+        # Ganti tema saat runtime hanya jika PPK_THEME diset
+        self.switchable = bool(UI_THEME) if switchable is None else switchable
+        self._template: Optional[str] = None
+        self._rendered: Dict[str, str] = {}
+        self._theme = self._initial_theme()
+
+    def _settings(self) -> QSettings:
+        return QSettings(SETTINGS_ORG, SETTINGS_APP)
+
+    def _initial_theme(self) -> str:
+        """Env PPK_THEME, lalu pilihan tersimpan (hanya jika switchable), lalu default."""
+        if UI_THEME in PALETTES:
+            return UI_THEME
+        if self.persist and self.switchable:
+            saved = self._settings().value(SETTINGS_KEY, DEFAULT_THEME)
+            if saved in PALETTES:
+                return saved
+        return DEFAULT_THEME
+
+    @property
+    def theme(self) -> str:
+        """Nama tema aktif."""
+        return self._theme
+
+    def themes(self) -> List[str]:
+        """Nama semua tema yang tersedia."""
+        return list(PALETTES)
+
+    def color(self, token: str, theme: Optional[str] = None) -> str:
+        """Warna hex token untuk tema (default: tema aktif)."""
+        return PALETTES[theme or self._theme][token]
+
+    def _load_template(self) -> str:
+        if self._template is None:
+            with open(self.qss_path, 'r', encoding='utf-8') as f:
+                self._template = f.read()
+        return self._template
+
+    def stylesheet(self, theme: Optional[str] = None) -> str:
+        """Stylesheet hasil render untuk tema (di-cache per tema)."""
+        name = theme or self._theme
+        if name not in PALETTES:
+            raise ValueError(f"Tema tidak dikenal: {name}")
+        if name not in self._rendered:
+            self._rendered[name] = render_stylesheet(self._load_template(), PALETTES[name])
+        return self._rendered[name]
+
+    def reload(self):
+        """Baca ulang main.qss dan pasang lagi (untuk pengembangan stylesheet)."""
+        self._template = None
+        self._rendered.clear()
+        self.apply()
+
+    def apply(self, theme: Optional[str] = None, app: Optional[QApplication] = None) -> str:
+        """
+        Pasang tema di QApplication.
+
+        Args:
+            theme: Nama tema (None = tema aktif)
+            app: QApplication (None = instance yang berjalan)
+
+        Returns:
+            Nama tema yang dipasang
+
+        Raises:
+            ValueError: Jika nama tema tidak dikenal
+        """
+        name = theme or self._theme
+        stylesheet = self.stylesheet(name)
+        app = app or QApplication.instance()
+        if app is not None:
+            app.setPalette(build_palette(PALETTES[name]))
+            app.setStyleSheet(stylesheet)
+
+        changed = name != self._theme
+        self._theme = name
+        if self.persist:
+            self._settings().setValue(SETTINGS_KEY, name)
+        if changed:
+            self.theme_changed.emit(name)
+        return name
+
+    def toggle(self) -> str:
+        """Ganti terang <-> gelap; tanpa opt-in PPK_THEME tema tidak berubah."""
+        if not self.switchable:
+            return self._theme
+        return self.apply('dark' if self._theme == 'light' else 'light')
+
+
+# ============================================================================
+# SINGLETON
+# ============================================================================
+
+_theme_manager: Optional[ThemeManager] = None
+_theme_manager_lock = threading.Lock()
+
+
+def get_theme_manager() -> ThemeManager:
+    """Get the application-wide ThemeManager."""
+    global _theme_manager
+    with _theme_manager_lock:
+        if _theme_manager is None:
+            _theme_manager = ThemeManager()
+        return _theme_manager
+
+
+__all__ = [
+    'ThemeManager', 'get_theme_manager', 'render_stylesheet',
+    'build_palette', 'set_role', 'QSS_PATH',
+]
@@ -208,21 +208,78 @@ DOKUMEN_TIMELINE = [
 DOKUMEN_CONFIG = {d['code']: d for d in DOKUMEN_TIMELINE}
 
 
+# ============================================================================
+# TIMELINE CONSTRAINT GRAPH
+# ============================================================================
+
+# Jenis constraint antar dokumen
+CONSTRAINT_ORDER = 'order'        # tanggal >= dokumen referensi (error)
+CONSTRAINT_MIN_DAYS = 'min_days'  # tanggal >= referensi + N hari (warning)
+
+
+def _build_constraint_graph(timeline: List[Dict]) -> Dict[str, List[Tuple[str, str, object]]]:
+    """
+    Compile DOKUMEN_TIMELINE into {doc_type: [(ref_doc, kind, days_spec), ...]}.
+
+    Urutan edge mengikuti urutan pengecekan lama (must_same_or_after,
+    min_days_after, can_be_before) sehingga pesan error/warning tetap sama.
+    """
+    graph = {}
+    for config in timeline:
+        edges = []
+        if 'must_same_or_after' in config:
+            edges.append((config['must_same_or_after'], CONSTRAINT_ORDER, None))
+        for ref_doc, days_spec in config.get('min_days_after', {}).items():
+            edges.append((ref_doc, CONSTRAINT_MIN_DAYS, days_spec))
+        for ref_doc in config.get('can_be_before', []):
+            edges.append((ref_doc, CONSTRAINT_ORDER, None))
+        graph[config['code']] = edges
+    return graph
+
+
+# Dibangun sekali; DOKUMEN_TIMELINE sudah terurut kronologis
+TIMELINE_GRAPH = _build_constraint_graph(DOKUMEN_TIMELINE)
+TIMELINE_ORDER = [d['code'] for d in DOKUMEN_TIMELINE]
+
+
 # ============================================================================
 # TIMELINE VALIDATOR
 # ============================================================================
 
 class TimelineValidator:
-    """Validate document timeline dates"""
+    """
+    Validate document timeline dates.
+
+    Tanggal dokumen paket dimuat sekali (lazy) dan disimpan di memori;
+    validate_date() dan suggest_date() tidak lagi query database. Setelah
+    tanggal disimpan, panggil update_date() (atau refresh()) agar cache
+    sinkron dengan database.
+    """
     
-    def __init__(self, paket_id: int):
+    def __init__(self, paket_id: int, paket: Dict = None,
+                 dates: Dict[str, date] = None, db=None):
         self.paket_id = paket_id
-        self.db = get_db_manager()
-        self.paket = self.db.get_paket(paket_id)
+        self.db = db
+        if paket is None:
+            self.db = self.db or get_db_manager()
+            paket = self.db.get_paket(paket_id)
+        self.paket = paket
         self.jangka_waktu = self.paket.get('jangka_waktu', 30) if self.paket else 30
+        self._dates: Optional[Dict[str, date]] = dict(dates) if dates is not None else None
+    
+    # -------------------------------------------------------------------------
+    # DATE CACHE
+    # -------------------------------------------------------------------------
     
     def get_all_dates(self) -> Dict[str, date]:
-        """Get all timeline dates for the paket"""
+        """Get all timeline dates for the paket (cached after first load)"""
+        if self._dates is None:
+            self.refresh()
+        return dict(self._dates)
+    
+    def refresh(self):
+        """Reload timeline dates from the database"""
+        self.db = self.db or get_db_manager()
         timeline = self.db.get_dokumen_timeline(self.paket_id)
         dates = {}
         for entry in timeline:
@@ -230,7 +287,27 @@ class TimelineValidator:
                 tgl = parse_tanggal(entry['tanggal_dokumen'])
                 if tgl:
                     dates[entry['doc_type']] = tgl
-        return dates
+        self._dates = dates
+    
+    def update_date(self, doc_type: str, tanggal):
+        """Update cached date after it has been saved (None/'' removes it)"""
+        if self._dates is None:
+            self.refresh()
+            return
+        tgl = parse_tanggal(tanggal) if isinstance(tanggal, str) else tanggal
+        if tgl:
+            self._dates[doc_type] = tgl
+        else:
+            self._dates.pop(doc_type, None)
+    
+    def _min_days(self, days_spec) -> int:
+        if days_spec == 'jangka_waktu':
+            return self.jangka_waktu
+        return int(days_spec)
+    
+    # -------------------------------------------------------------------------
+    # VALIDATION
+    # -------------------------------------------------------------------------
     
     def validate_date(self, doc_type: str, proposed_date: date) -> Tuple[bool, List[str], List[str]]:
         """
@@ -239,58 +316,37 @@ class TimelineValidator:
         Returns:
             (is_valid, errors, warnings)
         """
-        errors = []
-        warnings = []
-        
-        config = DOKUMEN_CONFIG.get(doc_type)
-        if not config:
+        if doc_type not in TIMELINE_GRAPH:
             return True, [], []
         
-        all_dates = self.get_all_dates()
+        if self._dates is None:
+            self.refresh()
+        all_dates = self._dates
         
-        # Check must_same_or_after
-        if 'must_same_or_after' in config:
-            ref_doc = config['must_same_or_after']
-            if ref_doc in all_dates:
-                ref_date = all_dates[ref_doc]
+        errors = []
+        warnings = []
+        
+        for ref_doc, kind, days_spec in TIMELINE_GRAPH[doc_type]:
+            ref_date = all_dates.get(ref_doc)
+            if ref_date is None:
+                continue
+            
+            if kind == CONSTRAINT_ORDER:
                 if proposed_date < ref_date:
                     errors.append(
                         f"Tanggal {doc_type} ({format_tanggal_indonesia(proposed_date)}) "
                         f"tidak boleh sebelum {ref_doc} ({format_tanggal_indonesia(ref_date)})"
                     )
-        
-        # Check min_days_after
-        if 'min_days_after' in config:
-            for ref_doc, days_spec in config['min_days_after'].items():
-                if ref_doc in all_dates:
-                    ref_date = all_dates[ref_doc]
-                    
-                    if days_spec == 'jangka_waktu':
-                        min_days = self.jangka_waktu
-                    else:
-                        min_days = int(days_spec)
-                    
-                    expected_date = ref_date + timedelta(days=min_days)
-                    
-                    if proposed_date < expected_date:
-                        # Warning, not error - could be early completion
-                        days_diff = (expected_date - proposed_date).days
-                        warnings.append(
-                            f"Tanggal {doc_type} ({format_tanggal_indonesia(proposed_date)}) "
-                            f"adalah {days_diff} hari sebelum perkiraan selesai "
-                            f"({format_tanggal_indonesia(expected_date)}). "
-                            f"Pastikan pekerjaan memang sudah selesai lebih awal."
-                        )
-        
-        # Check can_be_before (all referenced docs should have earlier or equal dates)
-        can_be_before = config.get('can_be_before', [])
-        for ref_doc in can_be_before:
-            if ref_doc in all_dates:
-                ref_date = all_dates[ref_doc]
-                if proposed_date < ref_date:
-                    errors.append(
+            else:
+                expected_date = ref_date + timedelta(days=self._min_days(days_spec))
+                if proposed_date < expected_date:
+                    # Warning, not error - could be early completion
+                    days_diff = (expected_date - proposed_date).days
+                    warnings.append(
                         f"Tanggal {doc_type} ({format_tanggal_indonesia(proposed_date)}) "
-                        f"tidak boleh sebelum {ref_doc} ({format_tanggal_indonesia(ref_date)})"
+                        f"adalah {days_diff} hari sebelum perkiraan selesai "
+                        f"({format_tanggal_indonesia(expected_date)}). "
+                        f"Pastikan pekerjaan memang sudah selesai lebih awal."
                     )
         
         # Check for future dates
@@ -312,37 +368,37 @@ class TimelineValidator:
         is_valid = len(errors) == 0
         return is_valid, errors, warnings
     
+    def validate_timeline(self) -> Dict[str, Tuple[bool, List[str], List[str]]]:
+        """Validate every saved date of the paket against the others"""
+        all_dates = self.get_all_dates()
+        return {
+            doc_type: self.validate_date(doc_type, all_dates[doc_type])
+            for doc_type in TIMELINE_ORDER if doc_type in all_dates
+        }
+    
     def suggest_date(self, doc_type: str) -> date:
         """Suggest appropriate date for a document"""
         config = DOKUMEN_CONFIG.get(doc_type)
         if not config:
             return date.today()
         
-        all_dates = self.get_all_dates()
+        if self._dates is None:
+            self.refresh()
+        all_dates = self._dates
         
-        # Find the latest date from documents that should come before
+        # Latest date from documents that should come before
         latest_before = None
-        can_be_before = config.get('can_be_before', [])
-        
-        for ref_doc in can_be_before:
+        for ref_doc in config.get('can_be_before', []):
             if ref_doc in all_dates:
                 if latest_before is None or all_dates[ref_doc] > latest_before:
                     latest_before = all_dates[ref_doc]
         
         # Check min_days_after
-        if 'min_days_after' in config:
-            for ref_doc, days_spec in config['min_days_after'].items():
-                if ref_doc in all_dates:
-                    ref_date = all_dates[ref_doc]
-                    
-                    if days_spec == 'jangka_waktu':
-                        min_days = self.jangka_waktu
-                    else:
-                        min_days = int(days_spec)
-                    
-                    expected = ref_date + timedelta(days=min_days)
-                    if latest_before is None or expected > latest_before:
-                        latest_before = expected
+        for ref_doc, kind, days_spec in TIMELINE_GRAPH[doc_type]:
+            if kind == CONSTRAINT_MIN_DAYS and ref_doc in all_dates:
+                expected = all_dates[ref_doc] + timedelta(days=self._min_days(days_spec))
+                if latest_before is None or expected > latest_before:
+                    latest_before = expected
         
         if latest_before:
             return latest_before
@@ -350,6 +406,46 @@ class TimelineValidator:
         return date.today()
 
 
+def validate_tahun_anggaran(tahun: int, db=None) -> Dict[int, Dict]:
+    """
+    Re-validate the timeline of every paket in a fiscal year.
+
+    Semua tanggal dimuat dengan satu query, lalu divalidasi di memori.
+
+    Returns:
+        {paket_id: {'nama': str, 'errors': [...], 'warnings': [...]}}
+        hanya untuk paket yang memiliki error atau warning.
+    """
+    db = db or get_db_manager()
+    pakets: Dict[int, Dict] = {}
+    for row in db.get_dokumen_timeline_by_tahun(tahun):
+        paket = pakets.setdefault(row['paket_id'], {
+            'paket': {
+                'nama': row['nama'],
+                'jangka_waktu': row['jangka_waktu'],
+                'tahun_anggaran': row['tahun_anggaran'],
+            },
+            'dates': {},
+        })
+        tgl = parse_tanggal(row['tanggal_dokumen']) if row['tanggal_dokumen'] else None
+        if row['doc_type'] and tgl:
+            paket['dates'][row['doc_type']] = tgl
+    
+    report = {}
+    for paket_id, item in pakets.items():
+        paket = dict(item['paket'])
+        if paket['jangka_waktu'] is None:
+            paket.pop('jangka_waktu')
+        validator = TimelineValidator(paket_id, paket=paket, dates=item['dates'])
+        errors, warnings = [], []
+        for _, doc_errors, doc_warnings in validator.validate_timeline().values():
+            errors.extend(doc_errors)
+            warnings.extend(doc_warnings)
+        if errors or warnings:
+            report[paket_id] = {'nama': paket['nama'], 'errors': errors, 'warnings': warnings}
+    return report
+
+
 # ============================================================================
 # TIMELINE ENTRY WIDGET
 # ============================================================================
@@ -465,10 +561,10 @@ class TimelineEntryWidget(QFrame):
         
         self.update_tanggal_display()
     
-    def set_paket(self, paket_id: int):
-        """Set paket for validation"""
+    def set_paket(self, paket_id: int, validator: TimelineValidator = None):
+        """Set paket for validation (validator dapat dibagi antar entry)"""
         self.paket_id = paket_id
-        self.validator = TimelineValidator(paket_id)
+        self.validator = validator or TimelineValidator(paket_id)
     
     def set_data(self, nomor: str, tanggal: str):
         """Set entry data"""
@@ -586,6 +682,8 @@ class TimelineManager(QDialog):
         self.paket_id = paket_id
         self.db = get_db_manager()
         self.paket = self.db.get_paket(paket_id)
+        # Satu validator (cache tanggal) untuk semua entry
+        self.validator = TimelineValidator(paket_id, paket=self.paket, db=self.db)
         
         self.entries = {}
         
@@ -650,7 +748,7 @@ class TimelineManager(QDialog):
         
         for doc_config in DOKUMEN_TIMELINE:
             entry = TimelineEntryWidget(doc_config)
-            entry.set_paket(self.paket_id)
+            entry.set_paket(self.paket_id, self.validator)
             entry.date_changed.connect(self.on_entry_changed)
             
             self.entries[doc_config['code']] = entry
@@ -690,6 +788,11 @@ class TimelineManager(QDialog):
         btn_validate.clicked.connect(self.validate_all)
         btn_layout.addWidget(btn_validate)
         
+        btn_validate_tahun = QPushButton("📋 Validasi Semua Paket")
+        btn_validate_tahun.setToolTip("Validasi ulang timeline semua paket di tahun anggaran ini")
+        btn_validate_tahun.clicked.connect(self.validate_tahun)
+        btn_layout.addWidget(btn_validate_tahun)
+        
         btn_layout.addStretch()
         
         btn_save = QPushButton("💾 Simpan")
@@ -787,6 +890,33 @@ class TimelineManager(QDialog):
         
         return all_valid
     
+    def validate_tahun(self):
+        """Re-validate all pakets in this paket's fiscal year"""
+        tahun = self.paket.get('tahun_anggaran') or TAHUN_ANGGARAN
+        report = validate_tahun_anggaran(tahun, self.db)
+        
+        if not report:
+            QMessageBox.information(
+                self, "Validasi Tahun Anggaran",
+                f"✅ Timeline semua paket tahun {tahun} valid!"
+            )
+            return
+        
+        lines = []
+        for paket_id, result in list(report.items())[:20]:
+            status = "❌" if result['errors'] else "⚠️"
+            lines.append(
+                f"{status} {result['nama']}: {len(result['errors'])} error, "
+                f"{len(result['warnings'])} peringatan"
+            )
+        if len(report) > 20:
+            lines.append(f"... dan {len(report) - 20} paket lainnya")
+        
+        QMessageBox.warning(
+            self, "Validasi Tahun Anggaran",
+            f"{len(report)} paket tahun {tahun} perlu diperiksa:\n\n" + "\n".join(lines)
+        )
+    
     def save_all(self):
         """Save all timeline entries"""
         # Validate first
@@ -832,6 +962,10 @@ class TimelineManager(QDialog):
                     self.db.set_dokumen_timeline(
                         self.paket_id, doc_type, nomor, tanggal
                     )
+                    self.validator.update_date(doc_type, tanggal)
+            
+            for entry in self.entries.values():
+                entry.validate()
             
             QMessageBox.information(self, "Sukses", "Timeline berhasil disimpan!")
             self.timeline_changed.emit()
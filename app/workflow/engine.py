@@ -14,6 +14,11 @@ from ..core.database import get_db_manager
 from ..templates.engine import get_template_engine
 
 
+# Dokumen paket SPP (SPP-LS + DRPP + Kuitansi) dan SSP
+SPP_PACKAGE_DOCS = ('SPP_LS', 'DRPP', 'KUITANSI')
+SSP_PACKAGE_DOCS = ('SSP_PPN', 'SSP_PPH')
+
+
 class StageStatus(Enum):
     """Status of a workflow stage"""
     PENDING = 'pending'
@@ -345,8 +350,7 @@ class WorkflowEngine:
         results = []
         
         # Generate SPP documents
-        spp_docs = ['SPP_LS', 'DRPP', 'KUITANSI']
-        for doc_type in spp_docs:
+        for doc_type in SPP_PACKAGE_DOCS:
             try:
                 filepath, nomor = self.generate_document(
                     paket_id, doc_type, additional_data, force=True
@@ -356,8 +360,7 @@ class WorkflowEngine:
                 results.append((doc_type, None, f"Error: {str(e)}"))
         
         # Generate SSP documents
-        ssp_docs = ['SSP_PPN', 'SSP_PPH']
-        for doc_type in ssp_docs:
+        for doc_type in SSP_PACKAGE_DOCS:
             try:
                 filepath, nomor = self.generate_document(
                     paket_id, doc_type, additional_data, force=True
@@ -528,4 +531,5 @@ def get_workflow_engine() -> WorkflowEngine:
     return _workflow_engine
 
 
-__all__ = ['WorkflowEngine', 'get_workflow_engine', 'StageStatus', 'StageInfo']
+__all__ = ['WorkflowEngine', 'get_workflow_engine', 'StageStatus', 'StageInfo',
+           'SPP_PACKAGE_DOCS', 'SSP_PACKAGE_DOCS']
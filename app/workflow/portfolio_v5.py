@@ -0,0 +1,373 @@
+"""
+PPK DOCUMENT FACTORY v5.0 - Portfolio Evaluator
+================================================
+Evaluasi aturan engine_v5 untuk SEMUA paket satu tahun anggaran sekaligus.
+
+Paket, item, dokumen dan timeline dimuat dengan empat query berbasis set
+(bukan per paket), lalu validate_paket, get_document_checklist,
+can_advance_status dan get_next_actions dijalankan di memori. Hasilnya
+laporan "perlu perhatian" yang bisa diurutkan, plus jumlah per aturan.
+
+Usage:
+    report = evaluate_portfolio(tahun=2026)
+    for entry in report.sorted_by('skor')[:20]:
+        print(entry.kode, entry.skor, entry.next_actions)
+    print(report.rule_counts)
+
+CLI (laporan JSON ke stdout atau --output):
+    python -m app.workflow.portfolio_v5 --tahun 2026 --sort skor --limit 20
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Set
+
+from ..core.config import DATABASE_PATH, TAHUN_ANGGARAN
+from ..core.query_stats import connect
+from .engine_v5 import (
+    PaketStatus, STATUS_NAMES, ValidationResult, ValidationType,
+    validate_paket, has_blocking_errors, get_document_checklist,
+    can_advance_status, get_next_actions,
+)
+
+
+# =============================================================================
+# MAPPING DATABASE -> ENGINE V5
+# =============================================================================
+
+# current_stage (WORKFLOW_STAGES) -> PaketStatus
+STAGE_STATUS = {
+    'SPESIFIKASI': PaketStatus.PERSIAPAN,
+    'SURVEY': PaketStatus.PERSIAPAN,
+    'HPS': PaketStatus.PERSIAPAN,
+    'KAK': PaketStatus.PERSIAPAN,
+    'NOTA_DINAS_PP': PaketStatus.DIKIRIM_KE_PP,
+    'SPK': PaketStatus.PENYEDIA_OK,
+    'SPMK': PaketStatus.KONTRAK_AKTIF,
+    'BAHP': PaketStatus.PELAKSANAAN,
+    'BAST': PaketStatus.SERAH_TERIMA,
+    'SPP': PaketStatus.SERAH_TERIMA,
+    'SSP': PaketStatus.SERAH_TERIMA,
+}
+
+# doc_type di tabel dokumen/dokumen_timeline -> kode DOCUMENT_VISIBILITY v5
+DOC_TYPE_ALIAS = {
+    'SPESIFIKASI': 'SPESIFIKASI_TEKNIS',
+    'BA_SURVEY_HARGA': 'BA_SURVEY',
+    'BAHP': 'BAHP_HASIL',
+}
+
+# doc_type dokumen_timeline -> field tanggal yang dipakai validate_paket
+TIMELINE_TANGGAL = {
+    'BA_SURVEY_HARGA': 'tanggal_survey_selesai',
+    'HPS': 'tanggal_hps',
+    'NOTA_DINAS_PP': 'tanggal_nota_dinas',
+    'PENETAPAN_PENYEDIA': 'tanggal_penetapan_penyedia',
+    'SPK': 'tanggal_kontrak',
+    'SPMK': 'tanggal_spmk',
+    'BAHP': 'tanggal_bahp',
+    'BAST': 'tanggal_bast',
+}
+
+# Bobot skor perhatian
+SKOR_VALIDASI = {
+    ValidationType.BLOCKED: 100,
+    ValidationType.WARNING: 10,
+    ValidationType.INCOMPLETE: 5,
+}
+SKOR_AKSI = {'high': 3, 'medium': 1, 'low': 0}
+
+
+def paket_status_code(paket: Dict) -> int:
+    """Turunkan PaketStatus v5 dari status dan current_stage paket."""
+    if paket.get('status_code') is not None:
+        return paket['status_code']
+    status = paket.get('status') or 'draft'
+    if status == 'completed':
+        return PaketStatus.SELESAI
+    if status == 'cancelled':
+        return PaketStatus.DIBATALKAN
+    stage = paket.get('current_stage') or 'SPESIFIKASI'
+    if status == 'draft' and stage == 'SPESIFIKASI':
+        return PaketStatus.DRAFT
+    return STAGE_STATUS.get(stage, PaketStatus.PERSIAPAN)
+
+
+# =============================================================================
+# REPORT
+# =============================================================================
+
+@dataclass
+class PaketAttention:
+    """Hasil evaluasi v5 untuk satu paket."""
+    paket_id: int
+    kode: str
+    nama: str
+    status_code: int
+    status_name: str
+    nilai_pagu: float
+    results: List[ValidationResult]
+    blocked: bool
+    missing_docs: List[str]
+    can_advance: bool
+    advance_message: str
+    next_actions: List[Dict]
+    skor: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'paket_id': self.paket_id,
+            'kode': self.kode,
+            'nama': self.nama,
+            'status_code': int(self.status_code),
+            'status_name': self.status_name,
+            'nilai_pagu': self.nilai_pagu,
+            'skor': self.skor,
+            'blocked': self.blocked,
+            'missing_docs': list(self.missing_docs),
+            'can_advance': self.can_advance,
+            'advance_message': self.advance_message,
+            'results': [{'type': r.type, 'field': r.field, 'message': r.message}
+                        for r in self.results],
+            'next_actions': [a['action'] for a in self.next_actions],
+        }
+
+
+@dataclass
+class PortfolioReport:
+    """Laporan portfolio: entri per paket aktif dan jumlah per aturan."""
+    tahun: int
+    entries: List[PaketAttention] = field(default_factory=list)
+    rule_counts: Dict[str, int] = field(default_factory=dict)
+    action_counts: Dict[str, int] = field(default_factory=dict)
+    status_counts: Dict[str, int] = field(default_factory=dict)
+    total_paket: int = 0
+
+    SORT_KEYS = ('skor', 'kode', 'nama', 'status_code', 'nilai_pagu')
+
+    def sorted_by(self, key: str = 'skor', descending: bool = None) -> List[PaketAttention]:
+        """
+        Urutkan entri. Default: skor/nilai_pagu menurun, lainnya menaik.
+        Entri dengan nilai sama diurutkan menurut kode.
+        """
+        if key not in self.SORT_KEYS:
+            raise ValueError(f"Kolom sort tidak valid: {key}")
+        if descending is None:
+            descending = key in ('skor', 'nilai_pagu')
+        kosong = '' if key in ('kode', 'nama') else 0
+        ordered = sorted(self.entries, key=lambda e: e.kode)
+        return sorted(ordered, key=lambda e: getattr(e, key) or kosong,
+                      reverse=descending)
+
+    def needs_attention(self) -> List[PaketAttention]:
+        """Entri dengan skor > 0, urut skor tertinggi."""
+        return [e for e in self.sorted_by('skor') if e.skor > 0]
+
+
+# =============================================================================
+# LOADER (SET QUERIES)
+# =============================================================================
+
+def load_portfolio(db_path: str = None, tahun: int = None) -> List[Dict]:
+    """
+    Muat semua paket tahun anggaran beserta item, dokumen dan timeline.
+
+    Returns:
+        List paket dict dengan tambahan 'status_code', '_items' dan
+        '_existing_docs' (set kode dokumen v5), tanggal timeline sudah
+        dipetakan ke field tanggal_* engine_v5
+    """
+    tahun = tahun or TAHUN_ANGGARAN
+    conn = connect(db_path or str(DATABASE_PATH))
+    conn.row_factory = sqlite3.Row
+    try:
+        pakets: Dict[int, Dict] = {}
+        for row in conn.execute("""
+            SELECT id, kode, nama, status, current_stage, nilai_pagu, nilai_hps,
+                   nilai_kontrak, penyedia_id, tanggal_mulai, tanggal_selesai,
+                   jangka_waktu
+            FROM paket WHERE tahun_anggaran = ?
+        """, (tahun,)):
+            paket = dict(row)
+            paket['tanggal_mulai_kerja'] = paket['tanggal_mulai']
+            paket['tanggal_selesai_kerja'] = paket['tanggal_selesai']
+            paket['status_code'] = paket_status_code(paket)
+            paket['_items'] = []
+            paket['_existing_docs'] = set()
+            pakets[paket['id']] = paket
+
+        if not pakets:
+            return []
+
+        for row in conn.execute("""
+            SELECT i.paket_id, i.harga_survey1, i.harga_survey2, i.harga_survey3
+            FROM item_barang i JOIN paket p ON p.id = i.paket_id
+            WHERE p.tahun_anggaran = ? AND COALESCE(i.is_active, 1) = 1
+        """, (tahun,)):
+            pakets[row[0]]['_items'].append({
+                'harga_survey1': row[1], 'harga_survey2': row[2], 'harga_survey3': row[3],
+            })
+
+        for row in conn.execute("""
+            SELECT DISTINCT d.paket_id, d.doc_type
+            FROM dokumen d JOIN paket p ON p.id = d.paket_id
+            WHERE p.tahun_anggaran = ? AND COALESCE(d.status, '') != 'superseded'
+        """, (tahun,)):
+            pakets[row[0]]['_existing_docs'].add(DOC_TYPE_ALIAS.get(row[1], row[1]))
+
+        for row in conn.execute("""
+            SELECT t.paket_id, t.doc_type, t.tanggal_dokumen
+            FROM dokumen_timeline t JOIN paket p ON p.id = t.paket_id
+            WHERE p.tahun_anggaran = ?
+        """, (tahun,)):
+            paket = pakets[row[0]]
+            paket['_existing_docs'].add(DOC_TYPE_ALIAS.get(row[1], row[1]))
+            tanggal_field = TIMELINE_TANGGAL.get(row[1])
+            if tanggal_field and row[2]:
+                paket[tanggal_field] = row[2]
+    finally:
+        conn.close()
+
+    return list(pakets.values())
+
+
+# =============================================================================
+# EVALUATOR
+# =============================================================================
+
+def evaluate_paket(paket: Dict, items: List[Dict], existing_docs: Set[str]) -> PaketAttention:
+    """Jalankan semua aturan v5 untuk satu paket yang sudah dimuat."""
+    status = paket.get('status_code', PaketStatus.DRAFT)
+    results = validate_paket(paket, items)
+    checklist = get_document_checklist(paket, existing_docs, status)
+    missing = [c['doc_type'] for c in checklist
+               if c['visible'] and c['status'] != 'complete']
+    can_advance, message = can_advance_status(paket, items, status)
+    actions = get_next_actions(paket, items, existing_docs)
+
+    skor = sum(SKOR_VALIDASI.get(r.type, 0) for r in results)
+    skor += sum(SKOR_AKSI.get(a.get('priority'), 0) for a in actions)
+
+    return PaketAttention(
+        paket_id=paket.get('id'),
+        kode=paket.get('kode') or '',
+        nama=paket.get('nama') or '',
+        status_code=status,
+        status_name=STATUS_NAMES.get(status, 'Unknown'),
+        nilai_pagu=paket.get('nilai_pagu') or 0,
+        results=results,
+        blocked=has_blocking_errors(results),
+        missing_docs=missing,
+        can_advance=can_advance,
+        advance_message=message,
+        next_actions=actions,
+        skor=skor,
+    )
+
+
+def evaluate_portfolio(db_path: str = None, tahun: int = None,
+                       pakets: List[Dict] = None) -> PortfolioReport:
+    """
+    Evaluasi seluruh paket satu tahun anggaran.
+
+    Paket SELESAI dan DIBATALKAN hanya dihitung di status_counts.
+
+    Args:
+        db_path: Path database (default: DATABASE_PATH)
+        tahun: Tahun anggaran (default: TAHUN_ANGGARAN)
+        pakets: Hasil load_portfolio() jika sudah dimuat
+
+    Returns:
+        PortfolioReport
+    """
+    tahun = tahun or TAHUN_ANGGARAN
+    if pakets is None:
+        pakets = load_portfolio(db_path, tahun)
+
+    report = PortfolioReport(tahun=tahun, total_paket=len(pakets))
+    rule_counts: Counter = Counter()
+    action_counts: Counter = Counter()
+    status_counts: Counter = Counter()
+
+    for paket in pakets:
+        status = paket.get('status_code', PaketStatus.DRAFT)
+        status_counts[STATUS_NAMES.get(status, 'Unknown')] += 1
+        if status in (PaketStatus.SELESAI, PaketStatus.DIBATALKAN):
+            continue
+
+        entry = evaluate_paket(paket, paket.get('_items', []),
+                               paket.get('_existing_docs', set()))
+        report.entries.append(entry)
+        rule_counts.update(f"{r.type}:{r.field}" for r in entry.results)
+        action_counts.update(a['action'] for a in entry.next_actions)
+
+    report.rule_counts = dict(rule_counts.most_common())
+    report.action_counts = dict(action_counts.most_common())
+    report.status_counts = dict(status_counts)
+    return report
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Laporan paket yang perlu perhatian menurut aturan engine_v5")
+    parser.add_argument('--db', default=str(DATABASE_PATH), help="Path database")
+    parser.add_argument('--tahun', type=int, default=TAHUN_ANGGARAN, help="Tahun anggaran")
+    parser.add_argument('--sort', choices=PortfolioReport.SORT_KEYS, default='skor',
+                        help="Kolom urutan entri")
+    parser.add_argument('--limit', type=int, help="Jumlah entri maksimum")
+    parser.add_argument('--all', action='store_true',
+                        help="Sertakan paket dengan skor 0 (default: hanya yang perlu perhatian)")
+    parser.add_argument('--output', help="Tulis laporan JSON ke file (default: stdout)")
+    return parser
+
+
+def main(argv: List[str] = None) -> int:
+    args = _build_parser().parse_args(argv)
+    try:
+        report = evaluate_portfolio(args.db, args.tahun)
+    except sqlite3.Error as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    entries = [e for e in report.sorted_by(args.sort) if args.all or e.skor > 0]
+    if args.limit is not None:
+        entries = entries[:args.limit]
+    text = json.dumps({
+        'tahun': report.tahun,
+        'total_paket': report.total_paket,
+        'perlu_perhatian': sum(1 for e in report.entries if e.skor > 0),
+        'status_counts': report.status_counts,
+        'rule_counts': report.rule_counts,
+        'action_counts': report.action_counts,
+        'entries': [e.to_dict() for e in entries],
+    }, indent=2, default=str)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text)
+    else:
+        print(text)
+    return 0
+
+
+__all__ = [
+    'STAGE_STATUS',
+    'paket_status_code',
+    'PaketAttention',
+    'PortfolioReport',
+    'load_portfolio',
+    'evaluate_paket',
+    'evaluate_portfolio',
+    'main',
+]
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
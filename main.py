@@ -9,6 +9,7 @@ Main entry point untuk aplikasi.
 Jalankan dengan:
     python main.py              # UI Workflow baru (default)
     python main.py --legacy     # UI lama (document-centric)
+    python main.py --sql-stats  # Aktifkan instrumentasi query (slow query log)
 
 Atau double-click START.bat di Windows
 """
@@ -68,6 +69,20 @@ def create_sample_templates():
             print(f"Warning: Could not create sample templates: {e}")
 
 
+def enable_sql_stats():
+    """Enable query instrumentation and print top offenders on exit"""
+    import atexit
+    from app.core.query_stats import enable_query_stats, format_report
+
+    stats = enable_query_stats()
+
+    def print_report():
+        print("\nTop query (total waktu):")
+        print(format_report(stats.top(15)))
+
+    atexit.register(print_report)
+
+
 def run_workflow_ui():
     """Run the new workflow-based UI"""
     from PySide6.QtWidgets import QApplication
@@ -107,6 +122,9 @@ def main():
     # Check dependencies
     check_dependencies()
 
+    if "--sql-stats" in sys.argv:
+        enable_sql_stats()
+
     # Create templates if needed
     create_sample_templates()
 
@@ -0,0 +1,8 @@
+"""
+PPK DOCUMENT FACTORY - Performance Benchmarks
+=============================================
+Benchmark suite dengan database sintetis.
+
+Run:
+    python -m tests.benchmarks.run_benchmarks
+"""
@@ -0,0 +1,314 @@
+"""
+PPK DOCUMENT FACTORY - Benchmark Runner
+=======================================
+Mengukur jalur-jalur kritis pada database sintetis (lihat seed.py) dan
+membandingkan median terhadap tests/benchmarks/thresholds.json.
+
+Hasil ditulis ke JSON agar bisa dibandingkan antar commit. Exit code 1
+jika ada benchmark yang melewati threshold (regresi).
+
+Run:
+    python -m tests.benchmarks.run_benchmarks
+    python -m tests.benchmarks.run_benchmarks --scale 0.1 --only get_paket
+    python -m tests.benchmarks.run_benchmarks --output hasil.json --no-check
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from tests.benchmarks.seed import seed_database, build_dipa_hierarchy, TAHUN
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+THRESHOLDS_PATH = os.path.join(BENCH_DIR, 'thresholds.json')
+DEFAULT_OUTPUT = os.path.join(BENCH_DIR, 'last_run.json')
+WORD_TEMPLATE = os.path.join(ROOT_DIR, 'templates', 'word', 'spk.docx')
+EXCEL_TEMPLATE = os.path.join(ROOT_DIR, 'templates', 'excel', 'hps.xlsx')
+
+
+# ============================================================================
+# CONTEXT
+# ============================================================================
+
+class BenchContext:
+    """Seeded database plus managers pointed at it."""
+
+    def __init__(self, workdir: str, scale: float):
+        from app.core import database, database_v4
+        from app.core.database import DatabaseManager
+        from app.core.database_v4 import DatabaseManagerV4
+        from app.models.pencairan_models import PencairanManager
+
+        self.workdir = workdir
+        self.db_path = os.path.join(workdir, 'bench.db')
+        self.output_dir = os.path.join(workdir, 'output')
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        start = time.perf_counter()
+        self.counts = seed_database(self.db_path, scale)
+        self.seed_seconds = time.perf_counter() - start
+
+        self.db = DatabaseManager(self.db_path)
+        self.db_v4 = DatabaseManagerV4(self.db_path)
+        self.pencairan = PencairanManager(self.db_path)
+        self.scale = scale
+        self.rng = random.Random(42)
+
+        # TemplateEngine memakai singleton; arahkan ke database benchmark
+        self._saved_singletons = (database._db_manager, database_v4._db_manager_v4)
+        database._db_manager = self.db
+        database_v4._db_manager_v4 = self.db_v4
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            self.paket_ids = [r[0] for r in conn.execute("SELECT id FROM paket")]
+        finally:
+            conn.close()
+
+    def close(self):
+        from app.core import database, database_v4
+        database._db_manager, database_v4._db_manager_v4 = self._saved_singletons
+        self.db_v4._audit_writer.close()
+
+    def random_paket_id(self) -> int:
+        return self.rng.choice(self.paket_ids)
+
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+
+def bench_get_paket(ctx: BenchContext) -> Callable[[], None]:
+    def run():
+        for _ in range(50):
+            ctx.db.get_paket(ctx.random_paket_id())
+    return run
+
+
+def bench_list_transaksi(ctx: BenchContext) -> Callable[[], None]:
+    def run():
+        ctx.pencairan.list_transaksi(mekanisme='UP', tahun=TAHUN)
+        ctx.pencairan.list_transaksi(mekanisme='LS', status='aktif', tahun=TAHUN, offset=100)
+        ctx.pencairan.list_transaksi(tahun=TAHUN, search='Laptop')
+    return run
+
+
+def bench_get_statistik(ctx: BenchContext) -> Callable[[], None]:
+    def run():
+        for mekanisme in ('UP', 'TUP', 'LS'):
+            ctx.pencairan.get_statistik(mekanisme, TAHUN)
+        ctx.pencairan.get_statistik(tahun=TAHUN)
+    return run
+
+
+def bench_merge_word(ctx: BenchContext) -> Callable[[], None]:
+    from app.templates.engine import TemplateEngine
+    engine = TemplateEngine()
+    output = os.path.join(ctx.output_dir, 'spk.docx')
+
+    def run():
+        data = engine.prepare_data(ctx.random_paket_id(), 'SPK')
+        engine.merge_word(WORD_TEMPLATE, data, output)
+    return run
+
+
+def bench_merge_excel(ctx: BenchContext) -> Callable[[], None]:
+    from app.templates.engine import TemplateEngine
+    engine = TemplateEngine()
+    output = os.path.join(ctx.output_dir, 'hps.xlsx')
+
+    def run():
+        paket_id = ctx.random_paket_id()
+        data = engine.prepare_data(paket_id, 'HPS')
+        engine.merge_excel(EXCEL_TEMPLATE, data, output,
+                           items=ctx.db.get_item_barang(paket_id))
+    return run
+
+
+def bench_dipa_import(ctx: BenchContext) -> Callable[[], None]:
+    # Tahun berbeda supaya tidak bentrok dengan data seed
+    rows = build_dipa_hierarchy(TAHUN + 1, ctx.scale)
+
+    def run():
+        ctx.db_v4.bulk_insert_pagu(rows, upsert=True)
+    return run
+
+
+def bench_hps_recalc(ctx: BenchContext) -> Callable[[], None]:
+    """Same loop as ItemBarangManager.recalculate_all_hps, without the UI."""
+    from app.core.config import hitung_harga_hps
+
+    def run():
+        for item in ctx.db.get_item_barang(ctx.random_paket_id()):
+            harga = hitung_harga_hps(item.get('harga_survey1', 0),
+                                     item.get('harga_survey2', 0),
+                                     item.get('harga_survey3', 0), 'TERTINGGI')
+            if harga > 0:
+                item['harga_dasar'] = harga
+                ctx.db.update_item_barang(item['id'], item)
+    return run
+
+
+def bench_portfolio_v5(ctx: BenchContext) -> Callable[[], None]:
+    """engine_v5 rules over every paket of the tahun anggaran."""
+    from app.workflow.portfolio_v5 import evaluate_portfolio
+
+    def run():
+        evaluate_portfolio(ctx.db_path, TAHUN)
+    return run
+
+
+BENCHMARKS: Dict[str, Callable[[BenchContext], Callable[[], None]]] = {
+    'get_paket': bench_get_paket,
+    'list_transaksi': bench_list_transaksi,
+    'get_statistik': bench_get_statistik,
+    'merge_word': bench_merge_word,
+    'merge_excel': bench_merge_excel,
+    'dipa_import': bench_dipa_import,
+    'hps_recalc': bench_hps_recalc,
+    'portfolio_v5': bench_portfolio_v5,
+}
+
+
+# ============================================================================
+# RUNNER
+# ============================================================================
+
+def time_callable(func: Callable[[], None], repeat: int, warmup: int = 1) -> Dict:
+    """Run func warmup + repeat times; return timing summary in ms."""
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    p95_index = min(len(samples) - 1, int(round(0.95 * (len(samples) - 1))))
+    return {
+        'repeat': repeat,
+        'min_ms': round(samples[0], 3),
+        'median_ms': round(statistics.median(samples), 3),
+        'p95_ms': round(samples[p95_index], 3),
+        'max_ms': round(samples[-1], 3),
+    }
+
+
+def load_thresholds(path: str = THRESHOLDS_PATH) -> Dict[str, Dict]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f).get('benchmarks', {})
+
+
+def check_thresholds(results: Dict[str, Dict], thresholds: Dict[str, Dict]) -> List[str]:
+    """Return a list of regression messages (empty = all within budget)."""
+    failures = []
+    for name, result in results.items():
+        limit = thresholds.get(name, {}).get('max_median_ms')
+        result['threshold_ms'] = limit
+        if limit is not None and result['median_ms'] > limit:
+            result['status'] = 'REGRESSION'
+            failures.append(f"{name}: median {result['median_ms']:.1f} ms > {limit} ms")
+        else:
+            result['status'] = 'ok'
+    return failures
+
+
+def run_benchmarks(scale: float = 1.0, repeat: int = 5,
+                   only: Optional[List[str]] = None,
+                   thresholds: Optional[Dict[str, Dict]] = None) -> Dict:
+    """
+    Seed a temporary database, run the selected benchmarks and return the report.
+
+    Args:
+        scale: Faktor ukuran data (1.0 = ukuran penuh)
+        repeat: Jumlah pengulangan terukur per benchmark
+        only: Nama benchmark yang dijalankan (None = semua)
+        thresholds: Threshold per benchmark; None = tanpa pengecekan
+    """
+    names = only or list(BENCHMARKS)
+    unknown = [n for n in names if n not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"Benchmark tidak dikenal: {', '.join(unknown)}")
+
+    workdir = tempfile.mkdtemp(prefix='ppk_bench_')
+    ctx = None
+    try:
+        ctx = BenchContext(workdir, scale)
+        results = {}
+        for name in names:
+            results[name] = time_callable(BENCHMARKS[name](ctx), repeat)
+
+        failures = check_thresholds(results, thresholds) if thresholds is not None else []
+        return {
+            'meta': {
+                'timestamp': datetime.now().isoformat(timespec='seconds'),
+                'scale': scale,
+                'repeat': repeat,
+                'python': platform.python_version(),
+                'sqlite': sqlite3.sqlite_version,
+                'platform': platform.platform(),
+                'seed_seconds': round(ctx.seed_seconds, 3),
+                'rows': ctx.counts,
+            },
+            'results': results,
+            'failures': failures,
+        }
+    finally:
+        if ctx is not None:
+            ctx.close()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="PPK Document Factory benchmarks")
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help="Faktor ukuran data sintetis (default 1.0)")
+    parser.add_argument('--repeat', type=int, default=5,
+                        help="Pengulangan terukur per benchmark (default 5)")
+    parser.add_argument('--only', nargs='+', choices=sorted(BENCHMARKS),
+                        help="Jalankan benchmark tertentu saja")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT,
+                        help="File JSON hasil benchmark")
+    parser.add_argument('--thresholds', default=THRESHOLDS_PATH,
+                        help="File JSON threshold")
+    parser.add_argument('--no-check', action='store_true',
+                        help="Jangan bandingkan dengan threshold")
+    args = parser.parse_args(argv)
+
+    thresholds = None if args.no_check else load_thresholds(args.thresholds)
+    report = run_benchmarks(args.scale, args.repeat, args.only, thresholds)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    print(f"{'Benchmark':<16} {'median':>10} {'p95':>10} {'limit':>10}  status")
+    for name, r in report['results'].items():
+        limit = r.get('threshold_ms')
+        print(f"{name:<16} {r['median_ms']:>10.1f} {r['p95_ms']:>10.1f} "
+              f"{(str(limit) if limit is not None else '-'):>10}  {r.get('status', '-')}")
+    print(f"\nHasil: {args.output}")
+
+    for failure in report['failures']:
+        print(f"REGRESI: {failure}")
+    return 1 if report['failures'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
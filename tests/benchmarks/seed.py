@@ -0,0 +1,272 @@
+"""
+PPK DOCUMENT FACTORY - Benchmark Seed Data
+==========================================
+Membangun database sintetis yang deterministik untuk benchmark.
+
+Pada scale=1.0:
+- 200 pegawai, 100 penyedia
+- 2.000 paket dengan 20.000 item_barang
+- 20.000 transaksi_pencairan (UP/TUP/LS) beserta dokumen dan fase_log
+- Hierarki DIPA lengkap (Program s.d. Detail, level 1-8)
+"""
+
+import random
+import sqlite3
+from datetime import date, timedelta
+from typing import Dict, List
+
+from app.core.database import DatabaseManager
+from app.core.database_v4 import DatabaseManagerV4
+from app.models.pencairan_models import PencairanManager
+
+# ============================================================================
+# UKURAN DATA (scale = 1.0)
+# ============================================================================
+
+BASE_PEGAWAI = 200
+BASE_PENYEDIA = 100
+BASE_PAKET = 2000
+ITEMS_PER_PAKET = 10
+BASE_TRANSAKSI = 20000
+
+TAHUN = 2026
+SEED = 20260101
+
+MEKANISME = ('UP', 'TUP', 'LS')
+JENIS_BELANJA = ('honorarium', 'jamuan_tamu', 'perjalanan_dinas', 'atk', 'jasa', 'modal')
+STATUS_TRANSAKSI = ('draft', 'aktif', 'aktif', 'selesai', 'batal')
+JENIS_PENGADAAN = ('Barang', 'Jasa Lainnya', 'Konstruksi')
+METODE_PENGADAAN = ('Pengadaan Langsung', 'Penunjukan Langsung', 'E-Purchasing')
+SATUAN = ('Unit', 'Paket', 'Buah', 'Rim', 'Box', 'Set', 'Lembar')
+KATA = ('Kertas', 'Tinta', 'Laptop', 'Meja', 'Kursi', 'Printer', 'Kabel',
+        'Lampu', 'Pupuk', 'Benih', 'Semen', 'Cat', 'Pipa', 'Jaring')
+
+
+def _scaled(base: int, scale: float) -> int:
+    return max(1, int(base * scale))
+
+
+def _nama(rng: random.Random, words: int = 3) -> str:
+    return ' '.join(rng.choice(KATA) for _ in range(words))
+
+
+# ============================================================================
+# DIPA HIERARCHY
+# ============================================================================
+
+def build_dipa_hierarchy(tahun: int = TAHUN, scale: float = 1.0,
+                         seed: int = SEED) -> List[Dict]:
+    """
+    Build a full 8-level DIPA hierarchy as pagu dicts for bulk_insert_pagu.
+
+    Fan-out per level dipilih sehingga scale=1.0 menghasilkan kurang lebih
+    2.600 baris (setara DIPA satker menengah).
+    """
+    rng = random.Random(seed)
+    rows: List[Dict] = []
+    detail_count = max(2, int(6 * scale ** 0.5))
+    akun_count = max(2, int(5 * scale ** 0.5))
+
+    def add(level: int, codes: Dict[str, str], uraian: str, jumlah: float = 0,
+            volume: float = 0, satuan: str = None, harga: float = 0):
+        kode_full = '.'.join(v for v in codes.values() if v)
+        rows.append({
+            'tahun_anggaran': tahun,
+            'kode_program': codes.get('kode_program'),
+            'kode_kegiatan': codes.get('kode_kegiatan'),
+            'kode_kro': codes.get('kode_kro'),
+            'kode_ro': codes.get('kode_ro'),
+            'kode_komponen': codes.get('kode_komponen'),
+            'kode_sub_komponen': codes.get('kode_sub_komponen'),
+            'kode_akun': codes.get('kode_akun'),
+            'kode_detail': codes.get('kode_detail'),
+            'kode_full': kode_full,
+            'level_kode': level,
+            'uraian': uraian,
+            'volume': volume,
+            'satuan': satuan,
+            'harga_satuan': harga,
+            'jumlah': jumlah,
+            'sumber_dana': 'RM',
+        })
+
+    program = {'kode_program': '032.04.WA'}
+    add(1, program, 'Program Dukungan Manajemen')
+    for k in range(2):
+        kegiatan = dict(program, kode_kegiatan=f"{4001 + k}")
+        add(2, kegiatan, f"Kegiatan {k + 1}")
+        for kro in ('EBA', 'EBB', 'EBD'):
+            kro_codes = dict(kegiatan, kode_kro=kro)
+            add(3, kro_codes, f"KRO {kro}")
+            for r in range(2):
+                ro = dict(kro_codes, kode_ro=f"{962 + r}")
+                add(4, ro, f"RO {962 + r}")
+                for c in range(3):
+                    komponen = dict(ro, kode_komponen=f"{51 + c:03d}")
+                    add(5, komponen, f"Komponen {51 + c}")
+                    for s in range(2):
+                        sub = dict(komponen, kode_sub_komponen=chr(ord('A') + s))
+                        add(6, sub, f"Sub Komponen {chr(ord('A') + s)}")
+                        for a in range(akun_count):
+                            akun = dict(sub, kode_akun=f"{521211 + a}")
+                            add(7, akun, f"Belanja {521211 + a}")
+                            for d in range(detail_count):
+                                volume = rng.randint(1, 50)
+                                harga = rng.randint(10, 500) * 1000
+                                add(8, dict(akun, kode_detail=f"{d + 1:03d}"),
+                                    _nama(rng), volume * harga, volume,
+                                    rng.choice(SATUAN), harga)
+    return rows
+
+
+# ============================================================================
+# SEEDER
+# ============================================================================
+
+def seed_database(db_path: str, scale: float = 1.0, seed: int = SEED) -> Dict[str, int]:
+    """
+    Create all schemas at db_path and fill them with synthetic data.
+
+    Returns:
+        Jumlah baris per tabel yang dibuat
+    """
+    # Urutan penting: v3 (paket/item) -> v4 (master, pagu) -> pencairan
+    DatabaseManager(db_path)
+    db_v4 = DatabaseManagerV4(db_path)
+    db_v4._audit_writer.close()
+    PencairanManager(db_path)
+
+    rng = random.Random(seed)
+    n_pegawai = _scaled(BASE_PEGAWAI, scale)
+    n_penyedia = _scaled(BASE_PENYEDIA, scale)
+    n_paket = _scaled(BASE_PAKET, scale)
+    n_transaksi = _scaled(BASE_TRANSAKSI, scale)
+    start = date(TAHUN, 1, 2)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.executemany("""
+            INSERT INTO pegawai (nip, nama, pangkat, golongan, jabatan,
+                                 is_ppk, is_ppspm, is_bendahara)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, [
+            (f"19{rng.randint(70, 99)}{i:012d}", f"Pegawai {i}", 'Penata', 'III/c',
+             'Staf', int(i % 50 == 0), int(i % 50 == 1), int(i % 50 == 2))
+            for i in range(n_pegawai)
+        ])
+        pegawai_ids = [r[0] for r in conn.execute("SELECT id FROM pegawai")]
+
+        conn.executemany("""
+            INSERT INTO penyedia (nama, nama_direktur, alamat, kota, npwp)
+            VALUES (?, ?, ?, ?, ?)
+        """, [
+            (f"CV Penyedia {i}", f"Direktur {i}", f"Jl. Contoh No. {i}",
+             'Kota', f"01.234.{i:03d}.5-678.000")
+            for i in range(n_penyedia)
+        ])
+        penyedia_ids = [r[0] for r in conn.execute("SELECT id FROM penyedia")]
+
+        # --- paket + item_barang -------------------------------------------
+        paket_rows = []
+        for i in range(n_paket):
+            mulai = start + timedelta(days=rng.randint(0, 300))
+            jangka = rng.randint(14, 90)
+            pagu = rng.randint(10, 200) * 1_000_000
+            paket_rows.append((
+                f"PKT-{TAHUN}-{i:05d}", f"Pengadaan {_nama(rng)} {i}", TAHUN,
+                rng.choice(JENIS_PENGADAAN), rng.choice(METODE_PENGADAAN),
+                'Kantor', 'RM', '521211', pagu, pagu * 0.95, pagu * 0.9, 1.5,
+                mulai.isoformat(), (mulai + timedelta(days=jangka)).isoformat(), jangka,
+                rng.choice(pegawai_ids), rng.choice(pegawai_ids),
+                rng.choice(pegawai_ids), rng.choice(penyedia_ids),
+                rng.choice(('draft', 'in_progress', 'completed')),
+            ))
+        conn.executemany("""
+            INSERT INTO paket (kode, nama, tahun_anggaran, jenis_pengadaan,
+                metode_pengadaan, lokasi, sumber_dana, kode_akun, nilai_pagu,
+                nilai_hps, nilai_kontrak, tarif_pph, tanggal_mulai,
+                tanggal_selesai, jangka_waktu, ppk_id, ppspm_id, bendahara_id,
+                penyedia_id, status)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, paket_rows)
+        paket_ids = [r[0] for r in conn.execute("SELECT id FROM paket")]
+
+        item_rows = []
+        for paket_id in paket_ids:
+            for n in range(1, ITEMS_PER_PAKET + 1):
+                surveys = [rng.randint(5, 500) * 1000 for _ in range(3)]
+                volume = rng.randint(1, 100)
+                rata = sum(surveys) / 3
+                item_rows.append((
+                    paket_id, n, 'A', _nama(rng), rng.choice(SATUAN), volume,
+                    surveys[0], surveys[1], surveys[2], rata, rata, volume * rata,
+                ))
+        conn.executemany("""
+            INSERT INTO item_barang (paket_id, nomor_urut, kategori, uraian,
+                satuan, volume, harga_survey1, harga_survey2, harga_survey3,
+                harga_rata, harga_dasar, total)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, item_rows)
+
+        # --- transaksi pencairan -------------------------------------------
+        transaksi_rows = []
+        for i in range(n_transaksi):
+            mekanisme = MEKANISME[i % 3]
+            created = start + timedelta(days=rng.randint(0, 330))
+            biaya = rng.randint(1, 200) * 250_000
+            transaksi_rows.append((
+                f"{mekanisme}-{TAHUN}-{i:06d}", mekanisme, rng.choice(JENIS_BELANJA),
+                f"Kegiatan {_nama(rng, 2)} {i}", biaya,
+                biaya if mekanisme != 'LS' else 0,
+                biaya * rng.choice((0, 0.9, 1.0)), rng.randint(1, 5),
+                rng.choice(STATUS_TRANSAKSI), TAHUN, f"Pegawai {i % n_pegawai}",
+                rng.choice(penyedia_ids) if mekanisme == 'LS' else None,
+                created.isoformat(), created.isoformat(),
+            ))
+        conn.executemany("""
+            INSERT INTO transaksi_pencairan (kode_transaksi, mekanisme,
+                jenis_belanja, nama_kegiatan, estimasi_biaya, uang_muka,
+                realisasi, fase_aktif, status, tahun_anggaran, penerima_nama,
+                penyedia_id, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, transaksi_rows)
+        transaksi = conn.execute(
+            "SELECT id, fase_aktif FROM transaksi_pencairan").fetchall()
+
+        dokumen_rows = []
+        fase_rows = []
+        for transaksi_id, fase_aktif in transaksi:
+            for fase in range(1, fase_aktif + 1):
+                dokumen_rows.append((transaksi_id, fase, f"DOK{fase}",
+                                     f"Dokumen Fase {fase}", 'wajib', 'final'))
+                fase_rows.append((transaksi_id, max(fase - 1, 1), fase, 'maju'))
+        conn.executemany("""
+            INSERT INTO dokumen_transaksi (transaksi_id, fase, kode_dokumen,
+                nama_dokumen, kategori, status)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, dokumen_rows)
+        conn.executemany("""
+            INSERT INTO fase_log (transaksi_id, fase_dari, fase_ke, aksi)
+            VALUES (?, ?, ?, ?)
+        """, fase_rows)
+
+        conn.commit()
+    finally:
+        conn.close()
+
+    dipa = build_dipa_hierarchy(TAHUN, scale, seed)
+    db_v4.bulk_insert_pagu(dipa)
+
+    return {
+        'pegawai': len(pegawai_ids),
+        'penyedia': len(penyedia_ids),
+        'paket': len(paket_ids),
+        'item_barang': len(item_rows),
+        'transaksi_pencairan': len(transaksi),
+        'dokumen_transaksi': len(dokumen_rows),
+        'fase_log': len(fase_rows),
+        'pagu_anggaran': len(dipa),
+    }
+
+
+__all__ = ['seed_database', 'build_dipa_hierarchy', 'TAHUN']
@@ -0,0 +1,54 @@
+"""
+PPK DOCUMENT FACTORY - Test Benchmark Suite
+===========================================
+Smoke test benchmark pada data kecil; run penuh dengan threshold hanya
+jika PPK_BENCHMARK=1.
+
+Run:
+    python -m pytest tests/benchmarks -v
+    PPK_BENCHMARK=1 python -m pytest tests/benchmarks -v
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from tests.benchmarks.run_benchmarks import (
+    BENCHMARKS, run_benchmarks, load_thresholds, check_thresholds,
+)
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    """Benchmark suite sanity and regression gate."""
+
+    def test_smoke_small_scale(self):
+        """Semua benchmark jalan pada data kecil dan menghasilkan timing."""
+        report = run_benchmarks(scale=0.02, repeat=1, thresholds={})
+        self.assertEqual(set(report['results']), set(BENCHMARKS))
+        self.assertEqual(report['failures'], [])
+        self.assertGreater(report['meta']['rows']['item_barang'], 0)
+        for result in report['results'].values():
+            self.assertGreaterEqual(result['median_ms'], 0)
+
+    def test_thresholds_cover_all_benchmarks(self):
+        """Setiap benchmark punya threshold."""
+        self.assertEqual(set(load_thresholds()), set(BENCHMARKS))
+
+    def test_check_thresholds_flags_regression(self):
+        results = {'get_paket': {'median_ms': 50.0}, 'hps_recalc': {'median_ms': 5.0}}
+        failures = check_thresholds(results, {'get_paket': {'max_median_ms': 10}})
+        self.assertEqual(len(failures), 1)
+        self.assertEqual(results['get_paket']['status'], 'REGRESSION')
+        self.assertEqual(results['hps_recalc']['status'], 'ok')
+
+    @unittest.skipUnless(os.environ.get('PPK_BENCHMARK') == '1',
+                         "set PPK_BENCHMARK=1 untuk benchmark penuh")
+    def test_full_scale_within_thresholds(self):
+        report = run_benchmarks(scale=1.0, repeat=5, thresholds=load_thresholds())
+        self.assertEqual(report['failures'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
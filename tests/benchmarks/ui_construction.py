@@ -0,0 +1,141 @@
+"""
+PPK DOCUMENT FACTORY - UI Construction Benchmark
+================================================
+Mengukur waktu membangun (konstruksi + show + polish) layar terberat
+dengan stylesheet aplikasi dari ThemeManager terpasang di QApplication.
+
+Setiap sampel membuat halaman baru di dalam host window yang sudah tampil,
+memproses event sampai widget ter-polish, lalu membuangnya lagi.
+
+Run:
+    python -m tests.benchmarks.ui_construction
+    python -m tests.benchmarks.ui_construction --theme dark --repeat 20
+    python -m tests.benchmarks.ui_construction --only up_detail tup_detail
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+from typing import Callable, Dict, List, Optional
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from tests.benchmarks.run_benchmarks import time_callable
+
+
+# ============================================================================
+# SCREENS
+# ============================================================================
+
+def _dokumen_checklist():
+    """Checklist fase 1 UP berisi semua dokumen dari workflow config."""
+    from app.config.workflow_config import get_dokumen_list
+    from app.ui.components.dokumen_checklist import DokumenChecklist
+
+    statuses = ['pending', 'draft', 'final', 'signed', 'uploaded']
+    dokumen = [
+        {**dok, 'status': statuses[i % len(statuses)]}
+        for i, dok in enumerate(get_dokumen_list('UP', 1) * 4)
+    ]
+    widget = DokumenChecklist(fase=1)
+    widget.set_dokumen(dokumen)
+    return widget
+
+
+def _screens() -> Dict[str, Callable]:
+    from app.ui.pages.pencairan import (
+        TransaksiFormPage, UPDetailPage, TUPDetailPage, LSDetailPage,
+        DashboardPencairanPage,
+    )
+    return {
+        'transaksi_form_up': lambda: TransaksiFormPage('UP'),
+        'transaksi_form_ls': lambda: TransaksiFormPage('LS'),
+        'up_detail': UPDetailPage,
+        'tup_detail': TUPDetailPage,
+        'ls_detail': LSDetailPage,
+        'dashboard': DashboardPencairanPage,
+        'dokumen_checklist': _dokumen_checklist,
+    }
+
+
+SCREENS = (
+    'transaksi_form_up', 'transaksi_form_ls', 'up_detail', 'tup_detail',
+    'ls_detail', 'dashboard', 'dokumen_checklist',
+)
+
+
+# ============================================================================
+# RUNNER
+# ============================================================================
+
+def run_ui_benchmarks(theme: Optional[str] = None, repeat: int = 10,
+                      only: Optional[List[str]] = None) -> Dict[str, Dict]:
+    """Bangun setiap layar repeat kali; return ringkasan waktu per layar."""
+    from PySide6.QtWidgets import QApplication, QWidget, QVBoxLayout
+    from app.core import config
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    app.setStyle('Fusion')
+
+    # Halaman membaca pegawai/DIPA dari DATABASE_PATH; pakai database kosong
+    workdir = tempfile.mkdtemp(prefix='ppk_ui_bench_')
+    saved_db_path = config.DATABASE_PATH
+    config.DATABASE_PATH = os.path.join(workdir, 'ui_bench.db')
+
+    from app.ui.themes import ThemeManager
+    ThemeManager(persist=False).apply(theme, app)
+
+    host = QWidget()
+    layout = QVBoxLayout(host)
+    host.resize(1200, 800)
+    host.show()
+    app.processEvents()
+
+    factories = _screens()
+    results = {}
+    try:
+        for name in SCREENS:
+            if only and name not in only:
+                continue
+            factory = factories[name]
+
+            def build():
+                widget = factory()
+                layout.addWidget(widget)
+                widget.show()
+                app.processEvents()
+                widget.setParent(None)
+                widget.deleteLater()
+
+            results[name] = time_callable(build, repeat, warmup=2)
+    finally:
+        host.close()
+        config.DATABASE_PATH = saved_db_path
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark konstruksi layar UI")
+    parser.add_argument('--theme', default=None,
+                        help="Tema yang dipasang (default: tema aktif)")
+    parser.add_argument('--repeat', type=int, default=10,
+                        help="Pengulangan terukur per layar (default 10)")
+    parser.add_argument('--only', nargs='+', choices=SCREENS,
+                        help="Ukur layar tertentu saja")
+    args = parser.parse_args(argv)
+
+    results = run_ui_benchmarks(args.theme, args.repeat, args.only)
+
+    print(f"{'Layar':<20} {'median':>10} {'min':>10} {'p95':>10}")
+    for name, r in results.items():
+        print(f"{name:<20} {r['median_ms']:>10.1f} {r['min_ms']:>10.1f} {r['p95_ms']:>10.1f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,101 @@
+"""
+PPK DOCUMENT FACTORY - Test Audit Writer
+========================================
+Verifikasi buffered audit log pada DatabaseManagerV4.
+
+Run:
+    python -m pytest tests/test_core/test_audit_writer.py -v
+"""
+
+import os
+import sys
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.core.audit_writer import AuditWriter, flush_all_audit_writers
+from app.core.database_v4 import DatabaseManagerV4
+
+
+def _count_rows(db_path: str) -> int:
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM audit_log").fetchone()[0]
+    finally:
+        conn.close()
+
+
+class TestAuditWriter(unittest.TestCase):
+    """Test buffered audit log writer."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmpdir, "test.db")
+        self.db = DatabaseManagerV4(self.db_path)
+        # Interval panjang supaya flush hanya terjadi secara eksplisit
+        self.db._audit_writer.flush_interval = 60
+
+    def tearDown(self):
+        self.db._audit_writer.close()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_log_audit_is_buffered(self):
+        """log_audit tidak langsung menulis ke database."""
+        self.db.log_audit('UPDATE', 'paket', 1, {'nama': 'A'}, {'nama': 'B'})
+        self.assertEqual(self.db._audit_writer.pending_count(), 1)
+        self.assertEqual(_count_rows(self.db_path), 0)
+
+    def test_query_sees_pending_entries(self):
+        """get_audit_log melihat entri yang masih di buffer."""
+        self.db.log_audit('CREATE', 'paket', 7, new_values={'nama': 'Paket 7'})
+        self.db.log_audit('LOCK', 'paket', 8)
+
+        entries = self.db.get_audit_log(table_name='paket', record_id=7)
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0]['action'], 'CREATE')
+        self.assertEqual(entries[0]['new_values'], {'nama': 'Paket 7'})
+        self.assertIsNone(entries[0]['old_values'])
+        self.assertEqual(self.db._audit_writer.pending_count(), 0)
+
+    def test_values_snapshotted_at_enqueue(self):
+        """Perubahan dict setelah log_audit tidak mempengaruhi entri."""
+        values = {'status': 'draft'}
+        self.db.log_audit('UPDATE', 'paket', 1, new_values=values)
+        values['status'] = 'final'
+        entry = self.db.get_audit_log(record_id=1)[0]
+        self.assertEqual(entry['new_values'], {'status': 'draft'})
+
+    def test_full_queue_flushes_synchronously(self):
+        """Antrian penuh memicu flush sinkron tanpa kehilangan entri."""
+        writer = AuditWriter(self.db_path, batch_size=5, flush_interval=60, max_queue=10)
+        try:
+            for i in range(25):
+                writer.enqueue('UPDATE', 'item_barang', i)
+            self.assertLessEqual(writer.pending_count(), 10)
+        finally:
+            writer.close()
+        self.assertEqual(_count_rows(self.db_path), 25)
+
+    def test_close_and_flush_all_write_everything(self):
+        """flush_all (backup) dan close (shutdown) menulis semua entri."""
+        self.db.log_audit('CREATE', 'pegawai', 1)
+        flush_all_audit_writers()
+        self.assertEqual(_count_rows(self.db_path), 1)
+
+        self.db.log_audit('DELETE', 'pegawai', 1)
+        self.db._audit_writer.close()
+        self.assertEqual(_count_rows(self.db_path), 2)
+
+    def test_entries_written_in_order(self):
+        """Urutan entri dipertahankan."""
+        for i in range(10):
+            self.db.log_audit('UPDATE', 'paket', i)
+        entries = self.db.get_audit_log(limit=10)
+        self.assertEqual([e['record_id'] for e in entries], list(range(9, -1, -1)))
+
+
+if __name__ == '__main__':
+    unittest.main()
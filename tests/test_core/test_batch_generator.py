@@ -0,0 +1,160 @@
+"""
+PPK DOCUMENT FACTORY - Test Headless Batch Generator
+====================================================
+Verifikasi batch_generator: seleksi paket/transaksi, generate paralel
+dengan nomor unik, resume dari file state, ringkasan JSON, dan tanpa
+import PySide6.
+
+Run:
+    python -m pytest tests/test_core/test_batch_generator.py -v
+"""
+
+import io
+import json
+import os
+import sys
+import shutil
+import sqlite3
+import subprocess
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+import app.services.dokumen_generator as dokumen_generator
+import app.templates.engine as template_engine
+from app.core.database import DatabaseManager
+from app.core.database_v4 import DatabaseManagerV4
+from app.models.pencairan_models import PencairanManager
+from app.services.batch_generator import (
+    BatchGenerator, select_paket, select_transaksi, plan_paket_jobs,
+    plan_transaksi_jobs, load_state, main, STATUS_OK,
+)
+from app.services.dokumen_index import DokumenIndex
+
+
+class TestBatchGenerator(unittest.TestCase):
+    """Test batch generation without GUI."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmpdir, "test.db")
+        self.output = os.path.join(self.tmpdir, "output")
+        self.state = os.path.join(self.tmpdir, "state.jsonl")
+        DatabaseManagerV4(self.db_path)
+        DatabaseManager(self.db_path)
+
+        conn = sqlite3.connect(self.db_path)
+        conn.executemany("""
+            INSERT INTO paket (kode, nama, tahun_anggaran, nilai_pagu, nilai_hps,
+                nilai_kontrak, tarif_pph, jangka_waktu, current_stage, status)
+            VALUES (?, ?, ?, 1000000, 900000, 800000, 0.02, 30, ?, 'in_progress')
+        """, [(f"PKT-{i}", f"Paket {i}", 2026, 'SPK' if i % 2 else 'BAST') for i in range(4)]
+            + [("PKT-LAMA", "Paket Lama", 2025, 'SPK')])
+        conn.commit()
+        conn.close()
+
+        # Hasil generate ke folder sementara, bukan output/ aplikasi
+        for patcher in (
+            mock.patch.object(template_engine, 'OUTPUT_DIR', self.output),
+            mock.patch.object(dokumen_generator, 'OUTPUT_DIR', Path(self.output)),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_select_and_plan(self):
+        pakets = select_paket(self.db_path, tahun=2026, stage=['SPK'])
+        self.assertEqual([p['kode'] for p in pakets], ['PKT-1', 'PKT-3'])
+        jobs = plan_paket_jobs(pakets, ['SPK'], stage='SPMK')
+        self.assertEqual([j.key for j in jobs], [
+            'paket:2:SPK', 'paket:2:SPMK', 'paket:4:SPK', 'paket:4:SPMK'])
+        with self.assertRaises(ValueError):
+            plan_paket_jobs(pakets)
+        with self.assertRaises(ValueError):
+            plan_paket_jobs(pakets, stage='TIDAK_ADA')
+
+    def test_parallel_run_unique_numbers_and_resume(self):
+        pakets = select_paket(self.db_path, tahun=2026)
+        jobs = plan_paket_jobs(pakets, ['SPK', 'SPMK'])
+        runner = BatchGenerator(self.db_path, workers=4, executor='thread',
+                                state_path=self.state)
+        summary = runner.run(jobs[:5])
+        self.assertEqual((summary['berhasil'], summary['gagal']), (5, 0))
+        spk = [r['nomor'] for r in summary['hasil'] if r['dokumen'] == 'SPK']
+        self.assertEqual(len(set(spk)), len(spk))
+        self.assertTrue(all(os.path.exists(r['filepath']) for r in summary['hasil']))
+        index = DokumenIndex(self.db_path, root_dir=self.output)
+        for r in summary['hasil']:
+            entry = index.cari_terbaru(r['dokumen'], paket_id=r['target_id'])
+            self.assertEqual(entry['file_path'], os.path.abspath(r['filepath']))
+
+        # Simulasi proses terhenti: baris terakhir terpotong
+        with open(self.state, 'a', encoding='utf-8') as f:
+            f.write('{"key": "paket:')
+        self.assertEqual(len(load_state(self.state)), 5)
+
+        summary = runner.run(jobs)
+        self.assertEqual(summary['total'], 8)
+        self.assertEqual(summary['dilanjutkan'], 5)
+        self.assertEqual(summary['berhasil'], 3)
+        self.assertEqual([r['key'] for r in summary['hasil']], [j.key for j in jobs])
+        self.assertTrue(all(r['status'] == STATUS_OK for r in summary['hasil']))
+
+    def test_transaksi_jobs_use_workflow_templates_and_index(self):
+        manager = PencairanManager(self.db_path)
+        tid = manager.create_transaksi({
+            'mekanisme': 'UP', 'jenis_belanja': 'operasional',
+            'nama_kegiatan': 'Rapat Koordinasi', 'estimasi_biaya': 1_000_000,
+            'tahun_anggaran': 2026,
+        })
+        transaksi = select_transaksi(self.db_path, mekanisme=['up'])
+        self.assertEqual([t['id'] for t in transaksi], [tid])
+
+        jobs = plan_transaksi_jobs(transaksi, ['LBR_REQ', 'TIDAK_ADA'])
+        summary = BatchGenerator(self.db_path, executor='thread').run(jobs)
+        by_dok = {r['dokumen']: r for r in summary['hasil']}
+        self.assertEqual(by_dok['LBR_REQ']['status'], STATUS_OK)
+        self.assertEqual(by_dok['TIDAK_ADA']['status'], 'dilewati')
+
+        entry = DokumenIndex(self.db_path, root_dir=self.output).cari_terbaru(
+            'LBR_REQ', transaksi_id=tid)
+        self.assertEqual(entry['file_path'], os.path.abspath(by_dok['LBR_REQ']['filepath']))
+
+    def test_cli_summary_and_exit_code(self):
+        summary_path = os.path.join(self.tmpdir, "summary.json")
+        with redirect_stderr(io.StringIO()):
+            code = main(['paket', '--db', self.db_path, '--tahun', '2026', '--dokumen', 'SPK',
+                         '--workers', '1', '--summary', summary_path])
+        self.assertEqual(code, 0)
+        with open(summary_path, encoding='utf-8') as f:
+            self.assertEqual(json.load(f)['berhasil'], 4)
+
+        out = io.StringIO()
+        with redirect_stdout(out):
+            code = main(['paket', '--db', self.db_path, '--id', '1', '--dokumen', 'SPK,SPMK',
+                         '--dry-run'])
+        self.assertEqual(code, 0)
+        self.assertEqual(json.loads(out.getvalue())['total'], 2)
+
+        with redirect_stderr(io.StringIO()), redirect_stdout(io.StringIO()):
+            code = main(['paket', '--db', self.db_path, '--id', '1', '--dokumen', 'BUKAN_DOKUMEN',
+                         '--workers', '1'])
+        self.assertEqual(code, 1)
+
+    def test_imports_no_pyside(self):
+        code = ("import sys, app.services.batch_generator as b; "
+                "b.plan_paket_jobs([{'id': 1, 'kode': 'X'}], spp_package=True); "
+                "sys.exit(any(m.startswith('PySide6') for m in sys.modules))")
+        result = subprocess.run([sys.executable, "-c", code], cwd=ROOT)
+        self.assertEqual(result.returncode, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
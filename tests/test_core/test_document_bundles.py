@@ -0,0 +1,134 @@
+"""
+PPK DOCUMENT FACTORY - Test Document Bundles
+============================================
+Verifikasi registry bundle dokumen modul dan BundlePipeline: konteks
+disiapkan sekali, merge word/excel, template hilang, pembatalan, dan
+laporan seragam.
+
+Run:
+    python -m pytest tests/test_core/test_document_bundles.py -v
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import threading
+import unittest
+from dataclasses import replace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from docx import Document
+from openpyxl import Workbook
+
+from app.core.database_v4 import DatabaseManagerV4
+from app.services.document_bundles import (
+    BundlePipeline, get_bundle, list_bundles, STATUS_OK, STATUS_GAGAL,
+    STATUS_DIBATALKAN, SWAKELOLA_BUNDLE, JAMUAN_TAMU_BUNDLE,
+)
+from app.services.dokumen_index import DokumenIndex
+
+
+class TestDocumentBundles(unittest.TestCase):
+    """Test bundle registry and generation pipeline."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmpdir, "test.db")
+        self.db = DatabaseManagerV4(self.db_path)
+        ppk = self.db.create_pegawai({'nip': '197001011990011001', 'nama': 'Pak PPK',
+                                      'is_ppk': 1})
+        self.db.update_satker_pejabat(ppk_id=ppk)
+
+        self.word_dir = os.path.join(self.tmpdir, "word")
+        self.excel_dir = os.path.join(self.tmpdir, "excel")
+        os.makedirs(self.word_dir)
+        os.makedirs(self.excel_dir)
+        self.pipeline = BundlePipeline(db_path=self.db_path,
+                                       output_dir=os.path.join(self.tmpdir, "output"),
+                                       word_dir=self.word_dir, excel_dir=self.excel_dir)
+        self.sw_data = {'id': 7, 'nama_kegiatan': 'Pemeliharaan Gedung Kantor Pusat',
+                        'uang_muka': 2_000_000, 'total_realisasi': 1_500_000}
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _word_template(self, name, text="{{nama_kegiatan}} / {{ppk_nama}}"):
+        doc = Document()
+        doc.add_paragraph(text)
+        doc.save(os.path.join(self.word_dir, f"{name}.docx"))
+
+    def test_registry(self):
+        self.assertLessEqual({'swakelola', 'perjalanan_dinas', 'jamuan_tamu'},
+                             {b.kode for b in list_bundles()})
+        self.assertIs(get_bundle('swakelola'), SWAKELOLA_BUNDLE)
+        self.assertEqual(SWAKELOLA_BUNDLE.default_selection(),
+                         ['KAK_Swakelola', 'RAB_Swakelola', 'SK_Tim_Pelaksana'])
+        self.assertEqual(len(JAMUAN_TAMU_BUNDLE.notes), 3)
+        with self.assertRaises(KeyError):
+            get_bundle('tidak_ada')
+
+    def test_merge_with_one_context(self):
+        self._word_template('kak_swakelola')
+        self._word_template('sk_tim_swakelola')
+        wb = Workbook()
+        wb.active['A1'] = "{{pagu_swakelola}}"
+        wb.save(os.path.join(self.excel_dir, "rab_swakelola.xlsx"))
+
+        calls = []
+
+        def provider(data, master):
+            calls.append(data['id'])
+            return SWAKELOLA_BUNDLE.provider(data, master)
+
+        bundle = replace(SWAKELOLA_BUNDLE, provider=provider)
+        progress = []
+        report = self.pipeline.run(bundle, self.sw_data,
+                                   progress=lambda *args: progress.append(args))
+
+        self.assertEqual(calls, [7])
+        self.assertEqual([i.status for i in report.items], [STATUS_OK] * 3)
+        self.assertEqual([p[0] for p in progress], [0, 1, 2, 3])
+        self.assertTrue(report.output_folder.endswith(
+            os.path.join("Swakelola", "SW_7_Pemeliharaan Gedung ")))
+        self.assertEqual(os.path.splitext(report.items[1].path)[1], '.xlsx')
+
+        text = Document(report.items[0].path).paragraphs[0].text
+        self.assertEqual(text, "Pemeliharaan Gedung Kantor Pusat / Pak PPK")
+        self.assertIn("Berhasil generate 3 dokumen", report.summary_text())
+
+        index = DokumenIndex(self.db_path, root_dir=self.pipeline.output_dir)
+        entry = index.cari_terbaru('SK_Tim_Pelaksana', swakelola_id=7)
+        self.assertEqual(entry['file_path'], os.path.abspath(report.items[2].path))
+
+    def test_missing_template_and_cancel(self):
+        self._word_template('kak_swakelola')
+        report = self.pipeline.run(SWAKELOLA_BUNDLE, self.sw_data,
+                                   selected=['KAK_Swakelola', 'BAST_Swakelola'])
+        self.assertEqual([i.status for i in report.items], [STATUS_OK, STATUS_GAGAL])
+        self.assertIn("Template tidak ditemukan", report.failed[0].error)
+        self.assertEqual(report.to_dict()['items'][1]['status'], STATUS_GAGAL)
+
+        cancel = threading.Event()
+        report = self.pipeline.run(
+            SWAKELOLA_BUNDLE, self.sw_data,
+            selected=['KAK_Swakelola', 'SK_Tim_Pelaksana', 'Daftar_Hadir'],
+            progress=lambda done, total, name: cancel.set(), cancel_event=cancel)
+        self.assertTrue(report.cancelled)
+        self.assertEqual([i.status for i in report.items],
+                         [STATUS_OK, STATUS_DIBATALKAN, STATUS_DIBATALKAN])
+        self.assertIn("Dibatalkan, 2 dokumen", report.summary_text())
+
+        with self.assertRaises(KeyError):
+            self.pipeline.run(SWAKELOLA_BUNDLE, self.sw_data, selected=['Tidak_Ada'])
+
+    def test_provider_error_reported(self):
+        report = self.pipeline.run(JAMUAN_TAMU_BUNDLE, {'id': 1, 'total_biaya': 'x'})
+        self.assertEqual(report.items, [])
+        self.assertFalse(report.ok)
+        self.assertTrue(report.summary_text().startswith("Gagal menyiapkan data"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,246 @@
+"""
+PPK DOCUMENT FACTORY - Test Document Store
+==========================================
+Verifikasi DocumentStore: deduplikasi berdasarkan isi, reference count
+lewat trigger checklist_spj/foto_dokumentasi, garbage collection,
+verifikasi integritas, statistik dan migrasi file lama.
+
+Run:
+    python -m pytest tests/test_core/test_document_store.py -v
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.core.database import DatabaseManager
+from app.services import document_store
+from app.services.document_store import DocumentStore, STATUS_RUSAK, STATUS_HILANG
+
+
+class TestDocumentStore(unittest.TestCase):
+    """Test content-addressed storage for SPJ uploads and photos."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmpdir, "test.db")
+        self.db = DatabaseManager(self.db_path)
+        self.store = DocumentStore(self.db_path)
+        self.src_dir = os.path.join(self.tmpdir, "upload")
+        os.makedirs(self.src_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _file(self, name, content):
+        path = os.path.join(self.src_dir, name)
+        with open(path, 'wb') as f:
+            f.write(content)
+        return path
+
+    def _checklist(self, paket_id, doc_type, blob):
+        with self.db.get_connection() as conn:
+            conn.execute("""
+                INSERT INTO checklist_spj (paket_id, doc_type, status, filepath_signed, blob_sha256)
+                VALUES (?, ?, 'UPLOADED', ?, ?)
+            """, (paket_id, doc_type, blob.path, blob.sha256))
+            conn.commit()
+
+    def _foto(self, paket_id, blob):
+        with self.db.get_connection() as conn:
+            cursor = conn.execute("""
+                INSERT INTO foto_dokumentasi (paket_id, jenis, filepath, blob_sha256)
+                VALUES (?, 'BAHP', ?, ?)
+            """, (paket_id, blob.path, blob.sha256))
+            conn.commit()
+            return cursor.lastrowid
+
+    def _ref_count(self, sha256):
+        return self.store.get(sha256)['ref_count']
+
+    def test_dedup_and_reference_counting(self):
+        scan = self._file("kontrak.PDF", b"%PDF scan kontrak" * 1000)
+        copy = self._file("kontrak_lagi.pdf", b"%PDF scan kontrak" * 1000)
+
+        first = self.store.put(scan)
+        second = self.store.put(copy)
+        self.assertTrue(first.baru)
+        self.assertFalse(second.baru)
+        self.assertEqual(first.path, second.path)
+        self.assertTrue(first.path.startswith(os.path.join(self.store.root_dir, first.sha256[:2])))
+        self.assertTrue(first.path.endswith('.pdf'))
+        self.assertEqual(self._ref_count(first.sha256), 0)
+
+        self._checklist(1, 'SPK', first)
+        self._checklist(2, 'SPK', second)
+        foto_id = self._foto(3, first)
+        self.assertEqual(self._ref_count(first.sha256), 3)
+
+        other = self.store.put(self._file("bast.pdf", b"%PDF bast"))
+        with self.db.get_connection() as conn:
+            conn.execute("UPDATE checklist_spj SET blob_sha256 = ? WHERE paket_id = 2",
+                         (other.sha256,))
+            conn.execute("DELETE FROM foto_dokumentasi WHERE id = ?", (foto_id,))
+            conn.commit()
+        self.assertEqual(self._ref_count(first.sha256), 1)
+        self.assertEqual(self._ref_count(other.sha256), 1)
+
+        stats = self.store.stats()
+        self.assertEqual(stats.jumlah_blob, 2)
+        self.assertEqual(stats.jumlah_referensi, 2)
+        self.assertEqual(stats.ukuran_tersimpan, first.ukuran + other.ukuran)
+        self.assertEqual(stats.hemat, 0)
+
+        self._checklist(4, 'BAST', first)
+        self.assertEqual(self.store.stats().hemat, first.ukuran)
+        self.assertGreater(self.store.stats().to_dict()['rasio'], 1.0)
+
+    def test_garbage_collection(self):
+        kept = self.store.put(self._file("a.pdf", b"dirujuk"))
+        dropped = self.store.put(self._file("b.pdf", b"tidak dirujuk"))
+        fresh = self.store.put(self._file("c.pdf", b"baru di-upload"))
+        self._checklist(1, 'SPK', kept)
+
+        # Dalam jeda grace, blob tanpa rujukan tetap disimpan
+        self.assertEqual(self.store.collect_garbage([dropped.sha256])['dihapus'], 0)
+
+        report = self.store.collect_garbage([dropped.sha256, kept.sha256], grace_seconds=0)
+        self.assertEqual(report['dihapus'], 1)
+        self.assertEqual(report['bytes'], dropped.ukuran)
+        self.assertFalse(os.path.exists(dropped.path))
+        self.assertTrue(os.path.exists(kept.path))
+        self.assertTrue(os.path.exists(fresh.path))
+
+        # Pass penuh: perbaiki ref_count yang menyimpang, hapus file yatim
+        with self.store.get_connection() as conn:
+            conn.execute("UPDATE document_blob SET ref_count = 5 WHERE sha256 = ?",
+                         (fresh.sha256,))
+            conn.commit()
+        orphan = os.path.join(self.store.root_dir, "zz", "sisa.tmp")
+        os.makedirs(os.path.dirname(orphan))
+        with open(orphan, 'wb') as f:
+            f.write(b"x")
+
+        report = self.store.collect_garbage(grace_seconds=0)
+        self.assertEqual(report['diperbaiki'], 1)
+        self.assertEqual(report['dihapus'], 1)
+        self.assertEqual(report['yatim'], 1)
+        self.assertFalse(os.path.exists(fresh.path))
+        self.assertFalse(os.path.exists(orphan))
+        self.assertEqual(self._ref_count(kept.sha256), 1)
+
+    def _orphans(self, count):
+        paths = []
+        for i in range(count):
+            path = os.path.join(self.store.root_dir, f"{i:02x}", f"sisa_{i}.tmp")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(b"x")
+            paths.append(path)
+        return paths
+
+    def test_cancelled_garbage_collection(self):
+        dropped = self.store.put(self._file("b.pdf", b"tidak dirujuk"))
+        orphans = self._orphans(3)
+
+        cancel = threading.Event()
+        cancel.set()
+        report = self.store.collect_garbage(grace_seconds=0, cancel=cancel)
+        self.assertTrue(report['dibatalkan'])
+        self.assertEqual((report['dihapus'], report['yatim']), (0, 0))
+        self.assertTrue(os.path.exists(dropped.path))
+
+        # Dibatalkan di tengah penelusuran folder: sisa file yatim menunggu pass berikutnya
+        cancel.clear()
+        real_walk = os.walk
+
+        def walk_then_cancel(top):
+            for entry in real_walk(top):
+                yield entry
+                cancel.set()
+
+        with patch.object(document_store.os, 'walk', walk_then_cancel):
+            report = self.store.collect_garbage(grace_seconds=0, cancel=cancel)
+        self.assertTrue(report['dibatalkan'])
+        self.assertEqual(report['dihapus'], 1)
+        self.assertLess(report['yatim'], len(orphans))
+
+        report = self.store.collect_garbage(grace_seconds=0)
+        self.assertFalse(report['dibatalkan'])
+        self.assertFalse(any(os.path.exists(path) for path in orphans))
+
+    def test_orphan_walk_does_not_block_targeted_gc(self):
+        """GC per dokumen (GUI) tidak menunggu penelusuran folder pass penuh."""
+        dropped = self.store.put(self._file("b.pdf", b"tidak dirujuk"))
+        self._orphans(2)
+        real_walk = os.walk
+        targeted = []
+
+        def walk_with_targeted_gc(top):
+            worker = threading.Thread(target=lambda: targeted.append(
+                self.store.collect_garbage([dropped.sha256], grace_seconds=0)))
+            worker.start()
+            worker.join(5)
+            self.assertFalse(worker.is_alive())
+            yield from real_walk(top)
+
+        with patch.object(document_store.os, 'walk', walk_with_targeted_gc):
+            report = self.store.collect_garbage(grace_seconds=0)
+        self.assertEqual((report['dihapus'], report['yatim']), (1, 2))
+        self.assertEqual(len(targeted), 1)
+
+    def test_verify_integrity(self):
+        good = self.store.put(self._file("a.jpg", b"foto bagus"))
+        bad = self.store.put(self._file("b.jpg", b"foto rusak"))
+        gone = self.store.put(self._file("c.jpg", b"foto hilang"))
+        with open(bad.path, 'wb') as f:
+            f.write(b"bit rot")
+        os.remove(gone.path)
+
+        report = self.store.verify()
+        self.assertEqual(report['ok'], 1)
+        self.assertEqual(report[STATUS_RUSAK], [bad.sha256])
+        self.assertEqual(report[STATUS_HILANG], [gone.sha256])
+        self.assertEqual(self.store.get(bad.sha256)['status'], STATUS_RUSAK)
+        self.assertIsNotNone(self.store.get(good.sha256)['verified_at'])
+
+        # Upload ulang isi yang sama memulihkan file yang hilang
+        healed = self.store.put(self._file("c2.jpg", b"foto hilang"))
+        self.assertTrue(healed.baru)
+        self.assertTrue(os.path.exists(gone.path))
+        self.assertEqual(self.store.verify([gone.sha256])['ok'], 1)
+
+    def test_adopt_legacy_files(self):
+        legacy_dir = os.path.join(self.tmpdir, "output", "signed_documents")
+        os.makedirs(legacy_dir)
+        legacy = os.path.join(legacy_dir, "SPK_20240101_120000.pdf")
+        with open(legacy, 'wb') as f:
+            f.write(b"%PDF lama")
+        with self.db.get_connection() as conn:
+            conn.execute("""
+                INSERT INTO checklist_spj (paket_id, doc_type, status, filepath_signed)
+                VALUES (1, 'SPK', 'UPLOADED', ?), (2, 'SPK', 'UPLOADED', ?),
+                       (3, 'SPK', 'UPLOADED', '/tidak/ada.pdf')
+            """, (legacy, legacy))
+            conn.commit()
+
+        self.assertEqual(self.store.adopt_legacy(), 2)
+        with self.db.get_connection() as conn:
+            rows = conn.execute("""
+                SELECT filepath_signed, blob_sha256 FROM checklist_spj ORDER BY paket_id
+            """).fetchall()
+        self.assertEqual(rows[0]['blob_sha256'], rows[1]['blob_sha256'])
+        self.assertTrue(rows[0]['filepath_signed'].startswith(self.store.root_dir))
+        self.assertIsNone(rows[2]['blob_sha256'])
+        self.assertEqual(self._ref_count(rows[0]['blob_sha256']), 2)
+        self.assertTrue(os.path.exists(legacy))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,170 @@
+"""
+PPK DOCUMENT FACTORY - Test Generated Document Index
+====================================================
+Verifikasi dokumen_file_index: pencatatan, lookup terbaru per
+transaksi/paket, dan rescan (berubah, dipindah, hilang, yatim).
+
+Run:
+    python -m pytest tests/test_core/test_dokumen_index.py -v
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.core.query_stats import enable_query_stats, disable_query_stats
+from app.services.dokumen_index import DokumenIndex, STATUS_HILANG, hash_file
+
+
+class TestDokumenIndex(unittest.TestCase):
+    """Test DokumenIndex."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.root = os.path.join(self.tmpdir, "output")
+        self.folder = os.path.join(self.root, "UP", "Januari_2026", "Rapat")
+        os.makedirs(self.folder)
+        self.index = DokumenIndex(os.path.join(self.tmpdir, "test.db"), root_dir=self.root)
+
+    def tearDown(self):
+        disable_query_stats()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _tulis(self, name, isi=b"isi dokumen", folder=None):
+        path = os.path.join(folder or self.folder, name)
+        with open(path, 'wb') as f:
+            f.write(isi)
+        return path
+
+    def test_catat_and_lookup_latest(self):
+        draft = self._tulis("KUIT_UM_DRAFT.docx", b"draft")
+        final = self._tulis("KUIT_UM.docx", b"final")
+        self.index.catat(draft, 'KUIT_UM', transaksi_id=1)
+        self.index.catat(final, 'KUIT_UM', transaksi_id=1)
+        self.index.catat(self._tulis("LBR_REQ.docx"), 'LBR_REQ', transaksi_id=2)
+
+        entry = self.index.cari_terbaru('KUIT_UM', transaksi_id=1)
+        self.assertEqual(entry['file_path'], os.path.abspath(final))
+        self.assertEqual(entry['ukuran'], 5)
+        self.assertEqual(entry['sha256'], hash_file(final))
+        self.assertIsNone(self.index.cari_terbaru('KUIT_UM', transaksi_id=2))
+        with self.assertRaises(ValueError):
+            self.index.cari_terbaru('KUIT_UM')
+
+        # Menimpa file di path sama memperbarui baris yang ada
+        self.index.catat(draft, 'KUIT_UM', transaksi_id=1)
+        self.assertEqual(len(self.index.daftar(transaksi_id=1)), 2)
+        self.assertEqual(self.index.cari_terbaru('KUIT_UM', transaksi_id=1)['file_path'],
+                         os.path.abspath(draft))
+
+    def test_lookup_is_single_query_and_skips_missing_files(self):
+        for i in range(200):
+            self.index.catat(self._tulis(f"DOK_{i}.docx"), f"DOK_{i}", paket_id=i)
+        lama = self._tulis("SPK_lama.docx", b"lama")
+        baru = self._tulis("SPK.docx", b"baru")
+        self.index.catat(lama, 'SPK', paket_id=7)
+        self.index.catat(baru, 'SPK', paket_id=7)
+
+        stats = enable_query_stats(threshold_ms=10_000,
+                                   log_path=os.path.join(self.tmpdir, "slow.log"))
+        self.assertEqual(self.index.cari_terbaru('DOK_150', paket_id=150)['kode_dokumen'],
+                         'DOK_150')
+        self.assertEqual(sum(r['count'] for r in stats.snapshot()), 1)
+
+        os.remove(baru)
+        self.assertEqual(self.index.cari_terbaru('SPK', paket_id=7)['file_path'],
+                         os.path.abspath(lama))
+        hilang = self.index.daftar(paket_id=7, status=STATUS_HILANG)
+        self.assertEqual([e['file_path'] for e in hilang], [os.path.abspath(baru)])
+
+    def test_rescan_detects_changes_moves_missing_and_orphans(self):
+        berubah = self._tulis("LBR_REQ.docx", b"v1")
+        dipindah = self._tulis("KUIT_UM.docx", b"kuitansi")
+        dihapus = self._tulis("SPBY.docx", b"spby")
+        for path, kode in ((berubah, 'LBR_REQ'), (dipindah, 'KUIT_UM'), (dihapus, 'SPBY')):
+            self.index.catat(path, kode, transaksi_id=1)
+
+        time.sleep(0.01)
+        self._tulis("LBR_REQ.docx", b"versi 2")
+        folder_baru = os.path.join(self.root, "UP", "Februari_2026", "Rapat")
+        os.makedirs(folder_baru)
+        tujuan = os.path.join(folder_baru, "KUIT_UM.docx")
+        shutil.move(dipindah, tujuan)
+        os.remove(dihapus)
+        yatim = self._tulis("CATATAN.docx", b"tanpa index")
+        self._tulis("~$KUIT_UM.docx", b"lock")
+
+        report = self.index.rescan()
+        self.assertEqual(report['diperiksa'], 3)
+        self.assertEqual(report['diperbarui'], [os.path.abspath(berubah)])
+        self.assertEqual(report['dipindah'], [(os.path.abspath(dipindah), os.path.abspath(tujuan))])
+        self.assertEqual(report['hilang'], [os.path.abspath(dihapus)])
+        self.assertEqual(report['yatim'], [os.path.abspath(yatim)])
+
+        self.assertEqual(self.index.cari_terbaru('KUIT_UM', transaksi_id=1)['file_path'],
+                         os.path.abspath(tujuan))
+        self.assertEqual(self.index.cari_terbaru('LBR_REQ', transaksi_id=1)['sha256'],
+                         hash_file(berubah))
+        self.assertIsNone(self.index.cari_terbaru('SPBY', transaksi_id=1))
+
+        # File yang kembali ke tempatnya aktif lagi; rescan berikutnya bersih
+        self._tulis("SPBY.docx", b"spby")
+        report = self.index.rescan()
+        self.assertEqual(report['muncul_lagi'], [os.path.abspath(dihapus)])
+        self.assertEqual((report['diperbarui'], report['dipindah'], report['hilang']),
+                         ([], [], []))
+
+    def test_bundle_owner_and_files_outside_root(self):
+        luar = os.path.join(self.tmpdir, "Swakelola", "SW_7")
+        os.makedirs(luar)
+        kak = self._tulis("KAK.docx", b"kak", folder=luar)
+        self.index.catat(kak, 'KAK_Swakelola', swakelola_id=7)
+
+        self.assertEqual(self.index.cari_terbaru('KAK_Swakelola', swakelola_id=7)['file_path'],
+                         os.path.abspath(kak))
+        self.assertEqual(len(self.index.daftar(swakelola_id=7)), 1)
+        self.assertIsNone(self.index.cari_terbaru('KAK_Swakelola', transaksi_id=7))
+        with self.assertRaises(ValueError):
+            self.index.catat(kak, 'KAK_Swakelola', kegiatan_id=7)
+
+        # File di luar root_dir tidak dianggap hilang selama masih ada
+        report = self.index.rescan()
+        self.assertEqual((report['hilang'], report['yatim']), ([], []))
+        self.assertIsNotNone(self.index.cari_terbaru('KAK_Swakelola', swakelola_id=7))
+
+        os.remove(kak)
+        report = self.index.rescan()
+        self.assertEqual(report['hilang'], [os.path.abspath(kak)])
+
+    def test_cancelled_rescan_writes_nothing(self):
+        path = self._tulis("SPBY.docx", b"spby")
+        self.index.catat(path, 'SPBY', transaksi_id=1)
+        os.remove(path)
+
+        cancel = threading.Event()
+        cancel.set()
+        report = self.index.rescan(cancel=cancel)
+        self.assertTrue(report['dibatalkan'])
+        self.assertEqual(report['hilang'], [])
+        self.assertEqual(self.index.daftar(transaksi_id=1, status=STATUS_HILANG), [])
+
+        report = self.index.rescan()
+        self.assertFalse(report['dibatalkan'])
+        self.assertEqual(report['hilang'], [os.path.abspath(path)])
+
+    def test_rescan_async(self):
+        self.index.catat(self._tulis("LBR_REQ.docx"), 'LBR_REQ', transaksi_id=1)
+        reports = []
+        self.index.rescan_async(reports.append).join(timeout=10)
+        self.assertEqual(len(reports), 1)
+        self.assertEqual(reports[0]['diperiksa'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+PPK DOCUMENT FACTORY - Test Data Change Events
+==============================================
+Verifikasi event bus dan event yang di-publish jalur tulis PencairanManager.
+
+Run:
+    python -m pytest tests/test_core/test_events.py -v
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.core.events import (
+    EventBus, get_event_bus,
+    TOPIC_TRANSAKSI, TOPIC_DOKUMEN, TOPIC_SALDO, TOPIC_FASE,
+)
+from app.core.database_v4 import DatabaseManagerV4
+from app.models.pencairan_models import PencairanManager
+
+
+class TestEventBus(unittest.TestCase):
+
+    def test_topic_filter_and_unsubscribe(self):
+        bus = EventBus()
+        semua, saldo = [], []
+        bus.subscribe(semua.append)
+        unsubscribe = bus.subscribe(saldo.append, [TOPIC_SALDO])
+
+        bus.publish(TOPIC_TRANSAKSI, "create", 1, "UP")
+        bus.publish(TOPIC_SALDO, "fase", 1, "UP")
+        unsubscribe()
+        bus.publish(TOPIC_SALDO, "fase", 2, "UP")
+
+        self.assertEqual([e.topic for e in semua], [TOPIC_TRANSAKSI, TOPIC_SALDO, TOPIC_SALDO])
+        self.assertEqual([e.transaksi_id for e in saldo], [1])
+
+    def test_subscriber_error_does_not_stop_others(self):
+        bus = EventBus()
+        received = []
+
+        def broken(event):
+            raise RuntimeError("boom")
+
+        bus.subscribe(broken)
+        bus.subscribe(received.append)
+        bus.publish(TOPIC_DOKUMEN, "create", data_key=1)
+        self.assertEqual(received[0].data['data_key'], 1)
+
+
+class TestManagerEvents(unittest.TestCase):
+    """Jalur tulis PencairanManager mem-publish event setelah commit."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        db_path = os.path.join(self.tmpdir, "test.db")
+        DatabaseManagerV4(db_path)  # master tables (penyedia)
+        self.manager = PencairanManager(db_path)
+        self.events = []
+        self._unsubscribe = get_event_bus().subscribe(self.events.append)
+
+    def tearDown(self):
+        self._unsubscribe()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _topics(self):
+        return [(e.topic, e.action, e.mekanisme) for e in self.events]
+
+    def test_transaksi_fase_saldo_events(self):
+        tid = self.manager.create_transaksi({
+            'mekanisme': 'UP', 'jenis_belanja': 'atk',
+            'nama_kegiatan': 'ATK', 'uang_muka': 500_000,
+        })
+        self.assertEqual(self._topics(), [(TOPIC_TRANSAKSI, 'create', 'UP')])
+
+        self.events.clear()
+        self.manager.update_fase(tid, 2)
+        self.assertEqual(self._topics(), [(TOPIC_FASE, 'next', 'UP'), (TOPIC_SALDO, 'fase', 'UP')])
+        self.assertEqual(self.events[0].data['fase_baru'], 2)
+
+        self.events.clear()
+        self.manager.update_transaksi(tid, {'catatan': 'x'})
+        self.manager.update_status(tid, 'batal')
+        self.assertEqual(self._topics(), [
+            (TOPIC_TRANSAKSI, 'update', None),
+            (TOPIC_TRANSAKSI, 'status', 'UP'),
+            (TOPIC_SALDO, 'status', 'UP'),
+        ])
+
+    def test_dokumen_events(self):
+        tid = self.manager.create_transaksi({
+            'mekanisme': 'LS', 'jenis_belanja': 'atk', 'nama_kegiatan': 'ATK',
+        })
+        self.events.clear()
+        dok_id = self.manager.create_dokumen(tid, {'kode_dokumen': 'SPP', 'fase': 1})
+        self.manager.update_dokumen_status(dok_id, 'final')
+        self.assertEqual([e.topic for e in self.events], [TOPIC_DOKUMEN, TOPIC_DOKUMEN])
+        self.assertEqual(self.events[1].data['dokumen_id'], dok_id)
+
+
+if __name__ == '__main__':
+    unittest.main()
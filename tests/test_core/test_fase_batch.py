@@ -0,0 +1,120 @@
+"""
+PPK DOCUMENT FACTORY - Test Batch Fase Transition
+=================================================
+Verifikasi update_fase_batch: validasi aturan workflow, satu transaksi
+database, dan laporan diterima/ditolak per transaksi.
+
+Run:
+    python -m pytest tests/test_core/test_fase_batch.py -v
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.config.workflow_config import cek_validasi_fase, get_dokumen_list
+from app.core.database_v4 import DatabaseManagerV4
+from app.core.events import get_event_bus, TOPIC_FASE
+from app.models.pencairan_models import PencairanManager
+
+
+class TestFaseBatch(unittest.TestCase):
+    """Test batch fase transition."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmpdir, "test.db")
+        DatabaseManagerV4(self.db_path)  # master tables (penyedia)
+        self.manager = PencairanManager(self.db_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _create_up(self, estimasi=1_000_000, lbr_req='final'):
+        tid = self.manager.create_transaksi({
+            'mekanisme': 'UP',
+            'jenis_belanja': 'operasional',
+            'nama_kegiatan': 'Rapat',
+            'estimasi_biaya': estimasi,
+        })
+        if lbr_req:
+            self.manager.create_dokumen(tid, {
+                'fase': 1, 'kode_dokumen': 'LBR_REQ',
+                'nama_dokumen': 'Lembar Permintaan', 'status': lbr_req,
+            })
+        return tid
+
+    def test_cek_validasi_fase(self):
+        transaksi = {'estimasi_biaya': 60_000_000}
+        hasil = cek_validasi_fase('UP', 1, transaksi, {})
+        self.assertEqual(len(hasil['errors']), 2)  # LBR_REQ + batas 50 juta
+
+        hasil = cek_validasi_fase('UP', 1, {'estimasi_biaya': 1}, {'LBR_REQ': 'signed'})
+        self.assertEqual(hasil['errors'], [])
+
+        # Aturan yang tidak bisa dicek otomatis hanya jadi peringatan
+        lengkap = {dok['kode']: 'final' for dok in get_dokumen_list('TUP', 4)}
+        hasil = cek_validasi_fase('TUP', 4, {}, lengkap)
+        self.assertEqual(hasil['errors'], [])
+        self.assertTrue(hasil['warnings'])
+
+        hasil = cek_validasi_fase('UP', 5, {}, {'SPBY': 'final'})
+        self.assertIn("SPBY wajib sudah ditandatangani", hasil['errors'])
+
+    def test_batch_report_and_apply(self):
+        ok_1 = self._create_up()
+        ok_2 = self._create_up(lbr_req='signed')
+        tanpa_dokumen = self._create_up(lbr_req=None)
+        terlalu_besar = self._create_up(estimasi=60_000_000)
+        draft_dokumen = self._create_up(lbr_req='draft')
+        batal = self._create_up()
+        self.manager.update_status(batal, 'batal')
+
+        ids = [ok_1, tanpa_dokumen, ok_2, terlalu_besar, draft_dokumen, batal, 99999]
+        report = self.manager.update_fase_batch(ids, catatan="Tutup bulan")
+
+        self.assertEqual([r['transaksi_id'] for r in report], ids)
+        accepted = {r['transaksi_id'] for r in report if r['accepted']}
+        self.assertEqual(accepted, {ok_1, ok_2})
+        by_id = {r['transaksi_id']: r for r in report}
+        self.assertIn("Estimasi biaya UP maksimal Rp 50 juta", by_id[terlalu_besar]['errors'])
+        self.assertEqual(by_id[99999]['errors'], ["Transaksi tidak ditemukan"])
+        self.assertEqual(by_id[ok_1]['fase_ke'], 2)
+
+        self.assertEqual(self.manager.get_transaksi(ok_1)['fase_aktif'], 2)
+        self.assertEqual(self.manager.get_transaksi(tanpa_dokumen)['fase_aktif'], 1)
+        log = [e for e in self.manager.get_fase_log(ok_2) if e['aksi'] == 'NEXT']
+        self.assertEqual([(e['fase_dari'], e['fase_ke'], e['catatan']) for e in log],
+                         [(1, 2, "Tutup bulan")])
+        self.assertFalse([e for e in self.manager.get_fase_log(terlalu_besar)
+                          if e['aksi'] == 'NEXT'])
+
+        # Fase 2 UP butuh KUIT_UM, uang muka dan penerima
+        report = self.manager.update_fase_batch([ok_1])
+        self.assertFalse(report[0]['accepted'])
+        self.assertEqual(len(report[0]['errors']), 3)
+
+    def test_dry_run_writes_nothing(self):
+        tid = self._create_up()
+        report = self.manager.update_fase_batch([tid], dry_run=True)
+        self.assertTrue(report[0]['accepted'])
+        self.assertEqual(self.manager.get_transaksi(tid)['fase_aktif'], 1)
+        self.assertFalse([e for e in self.manager.get_fase_log(tid) if e['aksi'] == 'NEXT'])
+
+    def test_events_published_after_commit(self):
+        events = []
+        unsubscribe = get_event_bus().subscribe(events.append, [TOPIC_FASE])
+        self.addCleanup(unsubscribe)
+
+        ids = [self._create_up() for _ in range(3)]
+        self.manager.update_fase_batch(ids)
+        self.assertEqual(sorted(e.transaksi_id for e in events), ids)
+        self.assertEqual({e.data['fase_baru'] for e in events}, {2})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,298 @@
+"""
+PPK DOCUMENT FACTORY - Test Fiscal Year Archive
+===============================================
+Verifikasi partisi per tahun anggaran: tutup tahun memindahkan data tahun
+beserta tabel anaknya ke file arsip dalam satu transaksi, query lintas
+tahun lewat ATTACH, buka kembali arsip, dan backup inkremental.
+
+Run:
+    python -m pytest tests/test_core/test_fiscal_archive.py -v
+"""
+
+import os
+import sys
+import json
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.core.config import TAHUN_ANGGARAN
+from app.core.database import DatabaseManager
+from app.core.database_v4 import DatabaseManagerV4
+from app.models.pencairan_models import PencairanManager
+from app.services.document_store import DocumentStore
+from app.services.dokumen_index import DokumenIndex
+from app.services.fiscal_archive import FiscalArchive, PARTITIONED_TABLES
+
+TAHUN_LAMA = TAHUN_ANGGARAN - 2
+
+# Kolom rujukan tanpa FOREIGN KEY yang dideklarasikan: nama kolom -> tabel induk
+UNDECLARED_REFERENCES = {'transaksi_id': 'transaksi_pencairan', 'paket_id': 'paket',
+                         'swakelola_id': 'swakelola',
+                         'perjalanan_dinas_id': 'perjalanan_dinas',
+                         'jamuan_tamu_id': 'jamuan_tamu'}
+
+
+def _references(conn):
+    """(tabel, kolom, induk) untuk setiap rujukan ke tabel yang dipartisi."""
+    refs = set()
+    tables = [row[0] for row in conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table'")]
+    for table in tables:
+        for fk in conn.execute(f"PRAGMA foreign_key_list({table})"):
+            refs.add((table, fk[3], fk[2]))
+        for column in conn.execute(f"PRAGMA table_info({table})"):
+            parent = UNDECLARED_REFERENCES.get(column[1])
+            if parent and parent != table:
+                refs.add((table, column[1], parent))
+    return {ref for ref in refs if ref[2] in PARTITIONED_TABLES}
+
+
+class TestFiscalArchive(unittest.TestCase):
+    """Test year-close archive files and cross-year queries."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmpdir, "ppk.db")
+        self.db = DatabaseManagerV4(self.db_path)
+        self.pencairan = PencairanManager(self.db_path)
+        self.archive = FiscalArchive(self.db_path)
+        for tahun in (TAHUN_LAMA, TAHUN_ANGGARAN):
+            self._isi_tahun(tahun)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _isi_tahun(self, tahun):
+        hon_id = self.db.create_honorarium({'tahun_anggaran': tahun, 'nama_kegiatan': f'Rapat {tahun}',
+                                            'jenis_honorarium': 'narasumber'})
+        self.db.import_honorarium_details(hon_id, [
+            {'nama': f'Narasumber {i}', 'nilai_bruto': 1_000_000, 'pph21': 50_000}
+            for i in range(3)
+        ])
+        self.db.create_pjlp({'tahun_anggaran': tahun, 'nama_pekerjaan': 'Kebersihan',
+                             'nama_pjlp': f'Tenaga {tahun}', 'honor_bulanan': 3_000_000})
+        self.db.run_payroll_pjlp(1, tahun)
+        self.pencairan.create_transaksi({
+            'mekanisme': 'LS', 'jenis_belanja': 'operasional',
+            'nama_kegiatan': f'Belanja {tahun}', 'uang_muka': 500_000,
+            'tahun_anggaran': tahun,
+        })
+
+    def _count(self, table, where="1=1", path=None):
+        conn = sqlite3.connect(path or self.db_path)
+        try:
+            return conn.execute(f"SELECT COUNT(*) FROM {table} WHERE {where}").fetchone()[0]
+        finally:
+            conn.close()
+
+    def test_close_and_reopen_year(self):
+        counts = self.archive.close_year(TAHUN_LAMA)
+        self.assertEqual(counts['honorarium'], 1)
+        self.assertEqual(counts['honorarium_detail'], 3)
+        self.assertEqual(counts['pembayaran_pjlp'], 1)
+        self.assertEqual(counts['transaksi_pencairan'], 1)
+
+        path = self.archive.archived_years()[TAHUN_LAMA]
+        self.assertTrue(os.path.exists(path))
+        self.assertEqual(self._count('honorarium_detail', path=path), 3)
+        self.assertEqual(self._count('honorarium', f"tahun_anggaran = {TAHUN_LAMA}"), 0)
+        self.assertEqual(self._count('honorarium_detail'), 3)
+        self.assertEqual(self._count('pembayaran_pjlp'), 1)
+        self.assertEqual([h['tahun_anggaran'] for h in self.db.get_all_honorarium()],
+                         [TAHUN_ANGGARAN])
+
+        with self.assertRaises(ValueError):
+            self.archive.close_year(TAHUN_LAMA)
+        with self.assertRaises(ValueError):
+            self.archive.close_year(TAHUN_ANGGARAN)
+
+        # Buka kembali: data dan total header kembali persis
+        self.archive.reopen_year(TAHUN_LAMA)
+        self.assertFalse(os.path.exists(path))
+        self.assertEqual(self.archive.archived_years(), {})
+        lama = self.db.get_all_honorarium(tahun=TAHUN_LAMA)[0]
+        self.assertEqual((lama['total_bruto'], lama['jumlah_penerima']), (3_000_000, 3))
+        self.assertTrue(self.db.reconcile_honorarium_totals(perbaiki=False)['ok'])
+        self.assertEqual(self._count('honorarium_detail'), 6)
+
+    def test_cross_year_query(self):
+        self.archive.close_year(TAHUN_LAMA)
+
+        rows = self.archive.query_all_years('honorarium', order_by='tahun_anggaran')
+        self.assertEqual([(r['tahun_anggaran'], r['_sumber']) for r in rows],
+                         [(TAHUN_LAMA, f'arsip_{TAHUN_LAMA}'), (TAHUN_ANGGARAN, 'main')])
+
+        rows = self.archive.query_all_years('pjlp', 'honor_bulanan >= ?', (3_000_000,),
+                                            columns='nama_pjlp')
+        self.assertEqual(sorted(r['nama_pjlp'] for r in rows),
+                         [f'Tenaga {TAHUN_LAMA}', f'Tenaga {TAHUN_ANGGARAN}'])
+
+        with self.archive.attached() as (conn, schemas):
+            total = conn.execute(" UNION ALL ".join(
+                f"SELECT SUM(nilai_bruto) FROM {s}.honorarium_detail" for s in schemas
+            )).fetchall()
+        self.assertEqual([r[0] for r in total], [3_000_000, 3_000_000])
+
+        self.assertEqual(len(self.archive.query_all_years('honorarium', years=[])), 1)
+
+    def test_failed_close_rolls_back(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("""
+            CREATE TRIGGER blok_hapus BEFORE DELETE ON transaksi_pencairan
+            BEGIN SELECT RAISE(ABORT, 'ditolak'); END
+        """)
+        conn.close()
+
+        with self.assertRaises(sqlite3.DatabaseError):
+            self.archive.close_year(TAHUN_LAMA)
+        self.assertEqual(self.archive.archived_years(), {})
+        self.assertFalse(os.path.exists(self.archive.archive_path(TAHUN_LAMA)))
+        self.assertEqual(self._count('honorarium_detail'), 6)
+        self.assertEqual(self._count('transaksi_pencairan'), 2)
+
+    def test_incremental_backup(self):
+        self.archive.close_year(TAHUN_LAMA)
+        backup_dir = os.path.join(self.tmpdir, "backup")
+
+        first = self.archive.backup_incremental(backup_dir)
+        self.assertEqual(sorted(first['disalin']),
+                         sorted(['ppk.db', f'arsip/ppk_{TAHUN_LAMA}.db']))
+        self.assertGreater(first['bytes'], 0)
+
+        second = self.archive.backup_incremental(backup_dir)
+        self.assertEqual(second['disalin'], [])
+        self.assertEqual(second['bytes'], 0)
+
+        self.db.create_pjlp({'tahun_anggaran': TAHUN_ANGGARAN, 'nama_pekerjaan': 'Satpam',
+                             'nama_pjlp': 'Baru'})
+        third = self.archive.backup_incremental(backup_dir)
+        self.assertEqual(third['disalin'], ['ppk.db'])
+        self.assertEqual(third['dilewati'], [f'arsip/ppk_{TAHUN_LAMA}.db'])
+
+        with open(os.path.join(backup_dir, 'manifest.json'), encoding='utf-8') as f:
+            self.assertEqual(len(json.load(f)['snapshots']), 3)
+
+        # Restore snapshot pertama: pjlp baru hilang lagi
+        self.assertEqual(len(self.archive.restore_incremental(backup_dir, 0)), 2)
+        self.assertEqual(self._count('pjlp', "nama_pjlp = 'Baru'"), 0)
+        self.assertIn(TAHUN_LAMA, self.archive.archived_years())
+
+
+class TestFiscalArchivePaket(unittest.TestCase):
+    """Test tabel anak paket (v3) dan rujukan blob document store di arsip."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmpdir, "ppk.db")
+        self.db = DatabaseManager(self.db_path)
+        DatabaseManagerV4(self.db_path)
+        self.store = DocumentStore(self.db_path)
+        self.pencairan = PencairanManager(self.db_path)
+        self.index = DokumenIndex(self.db_path, root_dir=self.tmpdir)
+        self.archive = FiscalArchive(self.db_path)
+
+        scan = os.path.join(self.tmpdir, "spk.pdf")
+        with open(scan, 'wb') as f:
+            f.write(b"%PDF scan SPK" * 100)
+        self.blob = self.store.put(scan)
+        self.paket = {tahun: self._isi_paket(tahun) for tahun in (TAHUN_LAMA, TAHUN_ANGGARAN)}
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _isi_paket(self, tahun):
+        with self.db.get_connection() as conn:
+            conn.execute("INSERT OR IGNORE INTO pegawai (nip, nama) VALUES ('1', 'Pemeriksa')")
+            pegawai_id = conn.execute("SELECT id FROM pegawai WHERE nip = '1'").fetchone()[0]
+            paket_id = conn.execute(
+                "INSERT INTO paket (kode, nama, tahun_anggaran) VALUES (?, ?, ?)",
+                (f"PKT-{tahun}", f"Paket {tahun}", tahun)).lastrowid
+            conn.execute("INSERT INTO paket_item (paket_id, nama_item) VALUES (?, 'Kertas')",
+                         (paket_id,))
+            conn.execute("INSERT INTO paket_pemeriksa (paket_id, pegawai_id) VALUES (?, ?)",
+                         (paket_id, pegawai_id))
+            blob_sha256 = self.blob.sha256 if tahun == TAHUN_LAMA else None
+            conn.execute("""
+                INSERT INTO checklist_spj (paket_id, doc_type, status, filepath_signed, blob_sha256)
+                VALUES (?, 'SPK', 'UPLOADED', ?, ?)
+            """, (paket_id, self.blob.path, blob_sha256))
+            conn.execute("""
+                INSERT INTO foto_dokumentasi (paket_id, jenis, filepath, blob_sha256)
+                VALUES (?, 'BAHP', ?, ?)
+            """, (paket_id, self.blob.path, blob_sha256))
+            conn.commit()
+
+        transaksi_id = self.pencairan.create_transaksi({
+            'mekanisme': 'LS', 'jenis_belanja': 'operasional',
+            'nama_kegiatan': f'Belanja {tahun}', 'tahun_anggaran': tahun,
+        })
+        for kode, owner in (('SPK', {'paket_id': paket_id}),
+                            ('KUITANSI', {'transaksi_id': transaksi_id})):
+            path = os.path.join(self.tmpdir, f"{kode}_{tahun}.docx")
+            with open(path, 'wb') as f:
+                f.write(f"{kode} {tahun}".encode())
+            self.index.catat(path, kode, **owner)
+        return paket_id
+
+    def _orphans(self):
+        """(tabel, kolom, jumlah) baris di database aktif yang induknya tidak ada."""
+        orphans = []
+        conn = sqlite3.connect(self.db_path)
+        try:
+            for table, column, parent in sorted(_references(conn)):
+                jumlah = conn.execute(f"""
+                    SELECT COUNT(*) FROM {table} WHERE {column} IS NOT NULL
+                    AND {column} NOT IN (SELECT id FROM {parent})
+                """).fetchone()[0]
+                if jumlah:
+                    orphans.append((table, column, jumlah))
+        finally:
+            conn.close()
+        return orphans
+
+    def test_every_child_of_partitioned_parent_is_partitioned(self):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            missing = sorted({table for table, _, _ in _references(conn)
+                              if table not in PARTITIONED_TABLES})
+        finally:
+            conn.close()
+        self.assertEqual(missing, [])
+
+    def test_no_child_row_left_for_archived_paket(self):
+        counts = self.archive.close_year(TAHUN_LAMA)
+        for table in ('paket', 'paket_item', 'paket_pemeriksa', 'checklist_spj',
+                      'foto_dokumentasi', 'transaksi_pencairan'):
+            self.assertEqual(counts[table], 1, table)
+        self.assertEqual(counts['dokumen_file_index'], 2)
+        self.assertEqual(self._orphans(), [])
+
+        self.archive.reopen_year(TAHUN_LAMA)
+        self.assertEqual(self._orphans(), [])
+        conn = sqlite3.connect(self.db_path)
+        try:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM paket_item").fetchone()[0], 2)
+        finally:
+            conn.close()
+
+    def test_archived_blob_survives_garbage_collection(self):
+        self.assertEqual(self.store.get(self.blob.sha256)['ref_count'], 2)
+
+        self.archive.close_year(TAHUN_LAMA)
+        self.assertEqual(self.store.get(self.blob.sha256)['ref_count'], 2)
+        report = self.store.collect_garbage(grace_seconds=0)
+        self.assertEqual((report['diperbaiki'], report['dihapus']), (0, 0))
+        self.assertTrue(os.path.exists(self.blob.path))
+        self.assertEqual(self.store.stats().jumlah_referensi, 2)
+
+        self.archive.reopen_year(TAHUN_LAMA)
+        self.assertEqual(self.store.get(self.blob.sha256)['ref_count'], 2)
+        self.assertEqual(self.store.recount(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+"""
+PPK DOCUMENT FACTORY - Test Honorarium Totals
+=============================================
+Verifikasi total header honorarium (bruto, PPh 21, netto, jumlah penerima)
+yang dijaga trigger honorarium_detail, import rincian massal dalam satu
+transaksi, dan rekonsiliasi total seluruh header.
+
+Run:
+    python -m pytest tests/test_core/test_honorarium_totals.py -v
+"""
+
+import os
+import sys
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.core.database_v4 import DatabaseManagerV4
+
+TAHUN = 2026
+
+
+class TestHonorariumTotals(unittest.TestCase):
+    """Test database-derived honorarium header totals."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmpdir, "test.db")
+        self.db = DatabaseManagerV4(self.db_path)
+        self.hon_id = self._header()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _header(self, **extra):
+        data = {'tahun_anggaran': TAHUN, 'nama_kegiatan': 'Rapat Koordinasi',
+                'jenis_honorarium': 'narasumber'}
+        data.update(extra)
+        return self.db.create_honorarium(data)
+
+    def _totals(self, hon_id=None):
+        h = self.db.get_honorarium(hon_id or self.hon_id)
+        return h['total_bruto'], h['total_pajak'], h['total_netto'], h['jumlah_penerima']
+
+    def _penerima(self, n, tarif=900_000):
+        return [{'nama': f'Penerima {i}', 'jumlah_jp': 2, 'tarif_per_jp': tarif,
+                 'pph21': tarif * 2 * 0.05} for i in range(n)]
+
+    def test_detail_writes_maintain_header(self):
+        header = self.db.get_honorarium(self.hon_id)
+        self.db.update_honorarium(self.hon_id, dict(header, total_bruto=750_000))
+        self.assertEqual(self._totals()[0], 750_000)
+
+        # Rincian pertama menggantikan total manual
+        a = self.db.add_honorarium_detail({'honorarium_id': self.hon_id, 'nama': 'A',
+                                           'nilai_bruto': 1_000_000, 'pph21': 50_000})
+        b = self.db.add_honorarium_detail({'honorarium_id': self.hon_id, 'nama': 'B',
+                                           'jumlah_jp': 3, 'tarif_per_jp': 200_000,
+                                           'pph21': 30_000, 'potongan_lain': 10_000})
+        self.assertEqual(self._totals(), (1_600_000, 80_000, 1_510_000, 2))
+
+        self.db.update_honorarium_detail(b, {'nama': 'B', 'nilai_bruto': 400_000, 'pph21': 20_000})
+        self.assertEqual(self._totals(), (1_400_000, 70_000, 1_330_000, 2))
+
+        # Header edit tidak menimpa total turunan
+        header = self.db.get_honorarium(self.hon_id)
+        self.db.update_honorarium(self.hon_id, dict(header, total_bruto=1, nama_kegiatan='Rapat'))
+        self.assertEqual(self._totals()[0], 1_400_000)
+
+        # Rincian dipindah ke header lain
+        other = self._header()
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("UPDATE honorarium_detail SET honorarium_id = ? WHERE id = ?", (other, a))
+        self.assertEqual(self._totals(), (400_000, 20_000, 380_000, 1))
+        self.assertEqual(self._totals(other), (1_000_000, 50_000, 950_000, 1))
+
+        self.db.delete_honorarium_detail(b)
+        self.assertEqual(self._totals(), (0, 0, 0, 0))
+        self.assertTrue(self.db.reconcile_honorarium_totals()['ok'])
+
+    def test_bulk_import_single_transaction(self):
+        self.assertEqual(self.db.import_honorarium_details(self.hon_id, self._penerima(300)), 300)
+        self.assertEqual(self._totals(), (540_000_000, 27_000_000, 513_000_000, 300))
+        self.assertEqual(len(self.db.get_honorarium_details(self.hon_id)), 300)
+
+        # Satu baris invalid membatalkan seluruh import
+        rows = self._penerima(5) + [{'nama': None, 'nilai_bruto': 1}]
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.db.import_honorarium_details(self.hon_id, rows, replace=True)
+        self.assertEqual(self._totals()[3], 300)
+
+        self.db.import_honorarium_details(self.hon_id, self._penerima(2, tarif=100_000),
+                                          replace=True)
+        self.assertEqual(self._totals(), (400_000, 20_000, 380_000, 2))
+
+    def test_reconcile_detects_and_repairs_drift(self):
+        self.db.import_honorarium_details(self.hon_id, self._penerima(3))
+        manual = self._header(total_bruto=5_000_000, total_netto=5_000_000)
+        broken = self._header()
+        self.db.import_honorarium_details(broken, self._penerima(1))
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("UPDATE honorarium SET total_netto = 1, jumlah_penerima = 9 WHERE id = ?",
+                         (broken,))
+
+        report = self.db.reconcile_honorarium_totals(perbaiki=False)
+        self.assertFalse(report['ok'])
+        self.assertEqual([d['id'] for d in report['drift']], [broken])
+        self.assertEqual(report['drift'][0]['seharusnya_penerima'], 1)
+
+        self.assertFalse(self.db.reconcile_honorarium_totals(tahun=TAHUN)['ok'])
+        self.assertTrue(self.db.reconcile_honorarium_totals()['ok'])
+        self.assertEqual(self._totals(broken), (1_800_000, 90_000, 1_710_000, 1))
+        self.assertEqual(self._totals(manual)[0], 5_000_000)
+
+    def test_migration_backfills_existing_headers(self):
+        with sqlite3.connect(self.db_path) as conn:
+            for trigger in ('insert', 'update', 'delete'):
+                conn.execute(f"DROP TRIGGER trg_honorarium_detail_{trigger}")
+            conn.execute("ALTER TABLE honorarium DROP COLUMN jumlah_penerima")
+            conn.execute("""
+                INSERT INTO honorarium_detail (honorarium_id, nama, nilai_bruto, pph21, nilai_netto)
+                VALUES (?, 'Lama', 600000, 30000, 570000)
+            """, (self.hon_id,))
+
+        self.db = DatabaseManagerV4(self.db_path)
+        self.assertEqual(self._totals(), (600_000, 30_000, 570_000, 1))
+        self.db.add_honorarium_detail({'honorarium_id': self.hon_id, 'nama': 'Baru',
+                                       'nilai_bruto': 400_000})
+        self.assertEqual(self._totals(), (1_000_000, 30_000, 970_000, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
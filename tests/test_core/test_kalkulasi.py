@@ -0,0 +1,159 @@
+"""
+PPK DOCUMENT FACTORY - Test Kalkulasi Core
+==========================================
+Verifikasi format Rupiah/terbilang terpusat identik dengan implementasi
+lama, dan total inkremental KalkulasiModel.
+
+Run:
+    python -m pytest tests/test_core/test_kalkulasi.py -v
+"""
+
+import os
+import sys
+import random
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.core.kalkulasi import (
+    format_rupiah, format_angka, terbilang, hitung_selisih, KalkulasiModel,
+)
+from app.templates import engine
+
+
+# ============================================================================
+# SALINAN IMPLEMENTASI LAMA (golden reference)
+# ============================================================================
+
+def legacy_widget_format_rupiah(value):
+    if value is None:
+        return "Rp 0"
+    return f"Rp {value:,.0f}".replace(",", ".")
+
+
+def legacy_engine_format_rupiah(nilai, with_prefix=True):
+    if nilai is None:
+        nilai = 0
+    formatted = f"{int(nilai):,}".replace(",", ".")
+    return f"Rp {formatted}" if with_prefix else formatted
+
+
+def legacy_engine_terbilang(n):
+    if n == 0:
+        return "nol rupiah"
+    satuan = ["", "satu", "dua", "tiga", "empat", "lima",
+              "enam", "tujuh", "delapan", "sembilan", "sepuluh", "sebelas"]
+
+    def convert(num):
+        num = int(num)
+        if num < 0:
+            return "minus " + convert(-num)
+        elif num < 12:
+            return satuan[num]
+        elif num < 20:
+            return satuan[num - 10] + " belas"
+        elif num < 100:
+            return satuan[num // 10] + " puluh " + satuan[num % 10]
+        elif num < 200:
+            return "seratus " + convert(num - 100)
+        elif num < 1000:
+            return satuan[num // 100] + " ratus " + convert(num % 100)
+        elif num < 2000:
+            return "seribu " + convert(num - 1000)
+        elif num < 1000000:
+            return convert(num // 1000) + " ribu " + convert(num % 1000)
+        elif num < 1000000000:
+            return convert(num // 1000000) + " juta " + convert(num % 1000000)
+        elif num < 1000000000000:
+            return convert(num // 1000000000) + " miliar " + convert(num % 1000000000)
+        else:
+            return convert(num // 1000000000000) + " triliun " + convert(num % 1000000000000)
+
+    result = convert(n).strip()
+    while "  " in result:
+        result = result.replace("  ", " ")
+    return result.strip() + " rupiah"
+
+
+def sample_values():
+    rng = random.Random(7)
+    values = [None, 0, 0.4, 0.5, 1, 11, 12, 19, 20, 99, 100, 101, 199, 1000,
+              1001, 1999, 2000, 10500.5, 999999, 1000000, 1500000, 2_000_000_000,
+              1_000_000_000_000, 3_250_000_000_000, -1500, -0.5]
+    values += [rng.randint(0, 10 ** 12) for _ in range(300)]
+    values += [rng.randint(0, 10 ** 7) + rng.random() for _ in range(100)]
+    return values
+
+
+class TestFormatting(unittest.TestCase):
+    """Output harus byte-identical dengan implementasi sebelumnya."""
+
+    def test_format_rupiah_identical_to_widget_copy(self):
+        for value in sample_values():
+            self.assertEqual(format_rupiah(value), legacy_widget_format_rupiah(value), value)
+
+    def test_engine_format_identical(self):
+        for value in sample_values():
+            self.assertEqual(engine.format_rupiah(value), legacy_engine_format_rupiah(value), value)
+            self.assertEqual(engine.format_rupiah(value, with_prefix=False),
+                             legacy_engine_format_rupiah(value, False), value)
+            self.assertEqual(format_angka(value), legacy_engine_format_rupiah(value, False), value)
+
+    def test_terbilang_identical_to_engine_copy(self):
+        for value in sample_values():
+            if value is None:
+                continue
+            self.assertEqual(terbilang(value), legacy_engine_terbilang(value), value)
+        self.assertIs(engine.terbilang, terbilang)
+
+    def test_terbilang_examples(self):
+        self.assertEqual(terbilang(1500), "seribu lima ratus rupiah")
+        self.assertEqual(terbilang(2_000_000), "dua juta rupiah")
+        self.assertEqual(terbilang(0), "nol rupiah")
+
+    def test_hitung_selisih(self):
+        self.assertEqual(hitung_selisih(100, 150)['status'], 'KURANG_BAYAR')
+        self.assertEqual(hitung_selisih(150, 100)['selisih_abs'], 50)
+        self.assertEqual(hitung_selisih(100, 100)['status'], 'PAS')
+
+
+class TestKalkulasiModel(unittest.TestCase):
+    """Total inkremental sama dengan penjumlahan penuh."""
+
+    def test_incremental_matches_full_sum(self):
+        rng = random.Random(3)
+        model = KalkulasiModel(['transport', 'harian'])
+        notified = []
+        model.subscribe(notified.append)
+
+        for i in range(200):
+            action = rng.random()
+            if action < 0.5 or not model.items:
+                model.add_item(f"Item {i}", rng.randint(1, 10), 'Unit', rng.randint(1, 500) * 1000)
+            elif action < 0.7:
+                model.update_item(rng.randrange(len(model.items)), volume=rng.randint(1, 10))
+            elif action < 0.8:
+                model.remove_items([rng.randrange(len(model.items))])
+            else:
+                model.set_value(rng.choice(['transport', 'harian']), rng.randint(0, 10 ** 6))
+
+            full = (sum(model.get_values().values())
+                    + sum(item['jumlah'] for item in model.items))
+            self.assertEqual(format_rupiah(model.total), format_rupiah(full))
+
+        self.assertEqual(len(notified), 200)
+        self.assertEqual(notified[-1], model.total)
+
+    def test_set_values_and_set_items(self):
+        model = KalkulasiModel(['a', 'b'])
+        model.set_values({'a': 1000, 'b': 2500})
+        self.assertEqual(model.total, 3500)
+        model.set_items([{'jumlah': 500}, {'jumlah': None}])
+        self.assertEqual(model.total, 4000)
+        model.clear_items()
+        self.assertEqual(model.total_rupiah(), "Rp 3.500")
+        self.assertEqual(model.total_terbilang(), "tiga ribu lima ratus rupiah")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+"""
+PPK DOCUMENT FACTORY - Test Lembar Document Context
+===================================================
+Verifikasi LembarContext: seluruh transformasi dan ringkasan lembar
+permintaan dilayani dari satu kali load, output sama dengan data
+database, dan context dibuang saat lembar/item berubah.
+
+Run:
+    python -m pytest tests/test_core/test_lembar_context.py -v
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.core.query_stats import enable_query_stats, disable_query_stats
+from app.models.pencairan_models import PencairanManager
+from app.services import lembar_permintaan_helper as helper
+
+
+class TestLembarContext(unittest.TestCase):
+    """Test single-load lembar permintaan context."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.db = PencairanManager(os.path.join(self.tmpdir, "test.db"))
+        helper.get_lembar_context_cache().invalidate()
+        self.lembar_id = self.db.create_lembar_permintaan({
+            'hari_tanggal': '2026-03-02', 'unit_kerja': 'Bagian Umum',
+            'sumber_dana': 'DIPA', 'subtotal': 900_000, 'ppn': 99_000, 'total': 999_000,
+            'nama_pengajuan': 'Andi', 'nama_verifikator': 'Budi', 'nama_ppk': 'Citra',
+            'nama_kpa': 'Dewi', 'created_by': 'tester',
+        })
+        for no, nama in enumerate(['Kertas A4', 'Tinta Printer'], start=1):
+            self.db.add_lembar_permintaan_item(self.lembar_id, {
+                'item_no': no, 'nama_barang': nama, 'volume': 3, 'satuan': 'rim',
+                'harga_satuan': 150_000, 'total_item': 450_000,
+            })
+
+    def tearDown(self):
+        disable_query_stats()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _all_views(self):
+        return {
+            'spj': helper.transform_to_spj_format(self.db, self.lembar_id),
+            'kuitansi': helper.transform_to_kuitansi_format(self.db, self.lembar_id),
+            'realisasi': helper.transform_to_realisasi_format(self.db, self.lembar_id),
+            'nilai': helper.get_nilai_finansial(self.db, self.lembar_id),
+            'ttd': helper.get_penandatangan(self.db, self.lembar_id),
+            'summary': helper.get_lembar_summary(self.db, self.lembar_id),
+        }
+
+    def test_all_views_from_one_load(self):
+        stats = enable_query_stats(threshold_ms=10_000,
+                                   log_path=os.path.join(self.tmpdir, "slow.log"))
+        stats.reset()
+        views = self._all_views()
+        self.assertEqual(sum(r['count'] for r in stats.snapshot()), 2)
+
+        data = self.db.get_lembar_permintaan_with_items(self.lembar_id)
+        lembar, items = data['lembar'], data['items']
+        today = datetime.now().strftime('%Y-%m-%d')
+
+        self.assertEqual(views['spj']['tanggal_sp2d'], today)
+        self.assertEqual(views['spj']['rincian'], helper.transform_items_to_spj_format(items))
+        self.assertEqual(views['kuitansi']['penerima_dana'], 'Andi')
+        self.assertEqual(views['kuitansi']['nilai_uang_muka'], 999_000)
+        self.assertEqual(views['realisasi']['rincian'],
+                         helper.transform_items_to_realisasi_format(items))
+        self.assertEqual(views['nilai'], {'subtotal': 900_000, 'ppn': 99_000, 'total': 999_000})
+        self.assertEqual(views['ttd']['nama_atasan'], None)
+        self.assertEqual(views['ttd']['nama_kpa'], 'Dewi')
+        self.assertEqual(views['summary']['items'], items)
+        self.assertEqual(views['summary']['jumlah_item'], 2)
+        self.assertEqual(views['summary']['created_at'], lembar['created_at'])
+
+        # Mengubah hasil tidak mengubah context yang di-cache
+        views['summary']['items'][0]['nama_barang'] = 'diubah'
+        self.assertEqual(helper.get_lembar_summary(self.db, self.lembar_id)['items'][0]
+                         ['nama_barang'], 'Kertas A4')
+
+    def test_invalidated_on_lembar_and_item_writes(self):
+        context = helper.get_lembar_context(self.db, self.lembar_id)
+        self.assertIs(helper.get_lembar_context(self.db, self.lembar_id), context)
+
+        self.db.update_lembar_permintaan(self.lembar_id, {'total': 1_500_000, 'status': 'final'})
+        self.assertIsNot(helper.get_lembar_context(self.db, self.lembar_id), context)
+        self.assertEqual(helper.get_nilai_finansial(self.db, self.lembar_id)['total'], 1_500_000)
+        self.assertEqual(helper.get_lembar_summary(self.db, self.lembar_id)['status'], 'final')
+
+        self.db.add_lembar_permintaan_item(self.lembar_id, {
+            'item_no': 3, 'nama_barang': 'Map', 'volume': 10, 'satuan': 'buah',
+            'harga_satuan': 5_000, 'total_item': 50_000,
+        })
+        self.assertEqual(len(helper.transform_to_kuitansi_format(self.db, self.lembar_id)
+                             ['rincian']), 3)
+
+        self.assertIsNone(helper.transform_to_spj_format(self.db, 9999))
+        self.assertIsNone(helper.get_penandatangan(None, self.lembar_id))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+"""
+PPK DOCUMENT FACTORY - Test Master Data Directory
+=================================================
+Verifikasi MasterDataDirectory: index per id/NIP/peran, pejabat satker
+sama dengan get_satker_pejabat(), lookup tanpa query setelah dimuat, dan
+invalidasi otomatis saat DatabaseManagerV4 atau DatabaseManager (v3,
+dipakai SatkerManager) menulis pegawai/satker.
+
+Run:
+    python -m pytest tests/test_core/test_master_data.py -v
+"""
+
+import os
+import sys
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.core.database import DatabaseManager
+from app.core.database_v4 import DatabaseManagerV4
+from app.core.events import TOPIC_MASTER_DATA, get_event_bus
+from app.core.master_data import MasterDataDirectory, format_nama_pegawai
+from app.core.query_stats import enable_query_stats, disable_query_stats
+
+
+class TestMasterDataDirectory(unittest.TestCase):
+    """Test shared pegawai/pejabat directory."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmpdir, "test.db")
+        self.db = DatabaseManagerV4(self.db_path)
+
+        conn = sqlite3.connect(self.db_path)
+        conn.executemany("""
+            INSERT INTO pegawai (nip, nama, gelar_depan, gelar_belakang, jabatan,
+                is_ppk, is_bendahara, is_active)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, [(f"19800101{i:010d}", f"Pegawai {i:04d}", 'Dr.' if i == 1 else None,
+               'S.E.' if i % 2 else None, 'Staf', int(i % 10 == 0), int(i % 25 == 0),
+               int(i != 3))
+              for i in range(500)])
+        conn.commit()
+        conn.close()
+        self.db.update_satker_pejabat(kpa_id=2, ppk_id=11, ppspm_id=None, bendahara_id=26)
+
+        self.directory = MasterDataDirectory(self.db_path)
+
+    def tearDown(self):
+        disable_query_stats()
+        self.directory.close()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_indexes_match_database_manager(self):
+        self.assertEqual(self.directory.all_pegawai(), self.db.get_all_pegawai())
+        self.assertEqual(len(self.directory.all_pegawai(active_only=False)), 500)
+        for role in ('ppk', 'bendahara', 'PPSPM', 'kpa'):
+            self.assertEqual(self.directory.get_pegawai_by_role(role),
+                             self.db.get_pegawai_by_role(role))
+        self.assertEqual(self.directory.get_satker_pejabat(), self.db.get_satker_pejabat())
+        self.assertEqual(self.directory.get_satker(), self.db.get_satker())
+
+        pegawai = self.directory.get_pegawai_by_nip("198001010000000001")
+        self.assertIs(pegawai, self.directory.get_pegawai(pegawai['id']))
+        self.assertEqual(format_nama_pegawai(pegawai), "Dr. Pegawai 0001, S.E.")
+
+    def test_lookups_after_load_run_no_queries(self):
+        stats = enable_query_stats(threshold_ms=10_000,
+                                   log_path=os.path.join(self.tmpdir, "slow.log"))
+        self.directory.get_satker_pejabat()
+        self.assertEqual(sum(r['count'] for r in stats.snapshot()), 2)
+
+        for _ in range(50):
+            self.directory.get_pegawai_by_role('ppk')
+            self.directory.get_pegawai_by_role('bendahara')
+            self.directory.all_pegawai()
+            self.directory.get_satker_pejabat()
+        self.assertEqual(sum(r['count'] for r in stats.snapshot()), 2)
+
+    def test_writes_invalidate_directory(self):
+        notified = []
+        self.addCleanup(self.directory.add_listener(lambda: notified.append(1)))
+        self.assertEqual(len(self.directory.get_pegawai_by_role('ppk')), 50)
+
+        new_id = self.db.create_pegawai({'nip': '199901012020011001', 'nama': 'Baru',
+                                         'is_ppk': 1})
+        self.assertEqual(len(self.directory.get_pegawai_by_role('ppk')), 51)
+        self.db.deactivate_pegawai(new_id)
+        self.assertEqual(len(self.directory.get_pegawai_by_role('ppk')), 50)
+        self.db.activate_pegawai(new_id)
+        self.assertEqual(len(self.directory.get_pegawai_by_role('ppk')), 51)
+
+        self.db.update_satker_pejabat(kpa_id=2, ppk_id=new_id, bendahara_id=26)
+        self.assertEqual(self.directory.get_satker_pejabat()['ppk_nama'], 'Baru')
+        self.assertEqual(len(notified), 4)
+
+    def test_v3_writes_invalidate_directory(self):
+        db_v3 = DatabaseManager(self.db_path)
+        self.assertEqual(self.directory.get_satker_pejabat()['ppk_id'], 11)
+
+        db_v3.update_satker_pejabat(kpa_id=2, ppk_id=21, bendahara_id=26)
+        pejabat = self.directory.get_satker_pejabat()
+        self.assertEqual((pejabat['ppk_id'], pejabat['ppk_nama']), (21, 'Pegawai 0020'))
+
+        db_v3.update_satker({'nama': 'Satker Baru'})
+        self.assertEqual(self.directory.get_satker()['nama'], 'Satker Baru')
+        db_v3.save_satker({**self.directory.get_satker(), 'nama_pendek': 'SB'})
+        self.assertEqual(self.directory.get_satker()['nama_pendek'], 'SB')
+
+        new_id = db_v3.save_pegawai({'nip': '199901012020011001', 'nama': 'Baru',
+                                     'is_ppk': 1})
+        self.assertEqual(self.directory.get_pegawai(new_id)['nama'], 'Baru')
+        db_v3.save_pegawai({**self.directory.get_pegawai(new_id), 'nama': 'Diubah'})
+        self.assertEqual(self.directory.get_pegawai(new_id)['nama'], 'Diubah')
+        db_v3.delete_pegawai(new_id)
+        self.assertNotIn(new_id, [p['id'] for p in self.directory.all_pegawai()])
+
+    def test_events_for_other_database_ignored(self):
+        self.directory.all_pegawai()
+        version = self.directory.version
+        get_event_bus().publish(TOPIC_MASTER_DATA, 'update',
+                                db_path=os.path.join(self.tmpdir, "lain.db"))
+        self.assertEqual(self.directory.version, version)
+        get_event_bus().publish(TOPIC_MASTER_DATA, 'update', db_path=self.db_path)
+        self.assertEqual(self.directory.version, version + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
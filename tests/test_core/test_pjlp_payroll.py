@@ -0,0 +1,148 @@
+"""
+PPK DOCUMENT FACTORY - Test PJLP Payroll Run
+============================================
+Verifikasi payroll bulanan PJLP: generate pembayaran seluruh kontrak aktif
+dalam satu transaksi, idempoten, dapat dibatalkan per run, serta rekap dan
+ringkasan per kontrak dari query ber-GROUP BY.
+
+Run:
+    python -m pytest tests/test_core/test_pjlp_payroll.py -v
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.core.config import TAX_RATES
+from app.core.database_v4 import DatabaseManagerV4
+
+TAHUN = 2026
+HONOR = 4_000_000
+
+
+class TestPjlpPayroll(unittest.TestCase):
+    """Test monthly PJLP payroll run."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.db = DatabaseManagerV4(os.path.join(self.tmpdir, "test.db"))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _kontrak(self, n, **extra):
+        ids = []
+        for i in range(n):
+            data = {
+                'tahun_anggaran': TAHUN, 'nama_pekerjaan': 'Petugas Kebersihan',
+                'nama_pjlp': f'Tenaga {i:03d}', 'honor_bulanan': HONOR,
+                'npwp': '12.345.678.9-012.000' if i % 2 == 0 else '',
+                'tanggal_mulai': f'{TAHUN}-01-01', 'tanggal_selesai': f'{TAHUN}-12-31',
+            }
+            data.update(extra)
+            ids.append(self.db.create_pjlp(data))
+        return ids
+
+    def test_run_applies_tax_and_is_idempotent(self):
+        ids = self._kontrak(4)
+        self._kontrak(1, status='selesai')
+        self._kontrak(1, tanggal_selesai=f'{TAHUN}-02-28')
+        manual = self.db.create_pembayaran_pjlp({
+            'pjlp_id': ids[3], 'bulan': 3, 'tahun': TAHUN,
+            'nilai_bruto': HONOR, 'nilai_netto': HONOR, 'status': 'dibayar',
+        })
+
+        run = self.db.run_payroll_pjlp(3, TAHUN, potongan_lain=50_000)
+        self.assertEqual(run['jumlah_baru'], 3)
+        self.assertEqual(run['jumlah_dilewati'], 1)
+        self.assertEqual(run['jumlah_pembayaran'], 3)
+
+        rows = {p['pjlp_id']: p for p in self.db.get_pembayaran_by_bulan(3, TAHUN)}
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(rows[ids[0]]['potongan_pajak'], HONOR * TAX_RATES['PPH_21_NPWP'])
+        self.assertEqual(rows[ids[1]]['potongan_pajak'], HONOR * TAX_RATES['PPH_21_NON_NPWP'])
+        self.assertEqual(rows[ids[0]]['nilai_netto'],
+                         HONOR - HONOR * TAX_RATES['PPH_21_NPWP'] - 50_000)
+        self.assertEqual(rows[ids[0]]['status'], 'draft')
+        self.assertEqual(rows[ids[3]]['id'], manual)
+        self.assertIsNone(rows[ids[3]]['payroll_run_id'])
+
+        again = self.db.run_payroll_pjlp(3, TAHUN)
+        self.assertEqual(again['id'], run['id'])
+        self.assertEqual(again['jumlah_baru'], 0)
+        self.assertEqual(len(self.db.get_payroll_runs_pjlp(bulan=3, tahun=TAHUN)), 1)
+
+        # Kontrak baru ditambahkan ke run aktif bulan itu
+        self._kontrak(1)
+        self.assertEqual(self.db.run_payroll_pjlp(3, TAHUN)['jumlah_pembayaran'], 4)
+
+        # Tidak ada kontrak yang perlu dibayar: tidak ada run kosong
+        self.assertIsNone(self.db.run_payroll_pjlp(3, TAHUN + 1)['id'])
+        self.assertEqual(self.db.get_payroll_runs_pjlp(tahun=TAHUN + 1), [])
+
+    def test_reverse_as_unit(self):
+        ids = self._kontrak(3)
+        manual = self.db.create_pembayaran_pjlp({
+            'pjlp_id': ids[0], 'bulan': 5, 'tahun': TAHUN, 'nilai_bruto': HONOR,
+        })
+        run = self.db.run_payroll_pjlp(5, TAHUN)
+        generated = [p for p in self.db.get_pembayaran_by_bulan(5, TAHUN)
+                     if p['payroll_run_id'] == run['id']]
+        self.assertEqual(len(generated), 2)
+
+        data = dict(generated[0], status='dibayar')
+        self.db.update_pembayaran_pjlp(generated[0]['id'], data)
+        with self.assertRaises(ValueError):
+            self.db.reverse_payroll_pjlp(run['id'])
+        self.assertEqual(len(self.db.get_pembayaran_by_bulan(5, TAHUN)), 3)
+
+        self.db.update_pembayaran_pjlp(generated[0]['id'], dict(data, status='draft'))
+        self.assertTrue(self.db.reverse_payroll_pjlp(run['id']))
+        self.assertFalse(self.db.reverse_payroll_pjlp(run['id']))
+        remaining = self.db.get_pembayaran_by_bulan(5, TAHUN)
+        self.assertEqual([p['id'] for p in remaining], [manual])
+        self.assertEqual(self.db.get_payroll_runs_pjlp(run_id=run['id'])[0]['status'],
+                         'dibatalkan')
+
+        # Run ulang setelah dibatalkan membuat run baru
+        rerun = self.db.run_payroll_pjlp(5, TAHUN)
+        self.assertNotEqual(rerun['id'], run['id'])
+        self.assertEqual(rerun['jumlah_baru'], 2)
+
+    def test_grouped_recap_for_500_workers(self):
+        ids = self._kontrak(500)
+
+        start = time.perf_counter()
+        run = self.db.run_payroll_pjlp(7, TAHUN)
+        rekap = self.db.get_rekap_pembayaran_pjlp(7, TAHUN)
+        self.assertLess(time.perf_counter() - start, 5.0)
+
+        self.assertEqual(run['jumlah_baru'], 500)
+        self.assertEqual(len(rekap['items']), 500)
+        total = rekap['total']
+        self.assertEqual(total['jumlah'], 500)
+        self.assertEqual(total['total_bruto'], 500 * HONOR)
+        self.assertAlmostEqual(total['total_netto'],
+                               sum(p['nilai_netto'] for p in rekap['items']))
+        self.assertAlmostEqual(total['total_potongan'],
+                               sum(p['total_potongan'] for p in rekap['items']))
+        self.assertEqual(rekap['per_status']['draft']['jumlah'], 500)
+        self.assertAlmostEqual(run['total_netto'], total['total_netto'])
+
+        for pjlp_id in ids[:2]:
+            payment = self.db.get_pembayaran_by_pjlp(pjlp_id)[0]
+            self.db.update_pembayaran_pjlp(payment['id'], dict(payment, status='dibayar'))
+        summaries = self.db.get_pjlp_summaries(tahun=TAHUN)
+        self.assertEqual(set(summaries), set(ids[:2]))
+        self.assertEqual(summaries[ids[0]]['total_bulan_dibayar'], 1)
+        self.assertEqual(self.db.get_pjlp_summary(ids[0]), summaries[ids[0]])
+        self.assertEqual(self.db.get_pjlp_summary(ids[5])['total_netto'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
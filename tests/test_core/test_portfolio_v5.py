@@ -0,0 +1,179 @@
+"""
+PPK DOCUMENT FACTORY - Test Portfolio Evaluator v5
+==================================================
+Verifikasi evaluate_portfolio: pemuatan berbasis set, aturan engine_v5
+per paket, jumlah per aturan, dan waktu < 1 detik untuk 1.000 paket.
+
+Run:
+    python -m pytest tests/test_core/test_portfolio_v5.py -v
+"""
+
+import io
+import json
+import os
+import sys
+import shutil
+import sqlite3
+import tempfile
+import time
+import unittest
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.core.database import DatabaseManager
+from app.core.query_stats import enable_query_stats, disable_query_stats
+from app.workflow.engine_v5 import PaketStatus, validate_paket, get_next_actions
+from app.workflow.portfolio_v5 import (
+    evaluate_portfolio, load_portfolio, paket_status_code, main,
+)
+
+TAHUN = 2026
+STAGES = ('SPESIFIKASI', 'SURVEY', 'NOTA_DINAS_PP', 'SPK', 'BAHP', 'BAST')
+
+
+class TestPortfolioV5(unittest.TestCase):
+    """Test batch evaluation of engine_v5 rules."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.mkdtemp()
+        cls.db_path = os.path.join(cls.tmpdir, "test.db")
+        DatabaseManager(cls.db_path)
+
+        conn = sqlite3.connect(cls.db_path)
+        paket_rows = []
+        for i in range(1000):
+            stage = STAGES[i % len(STAGES)]
+            status = 'draft' if stage == 'SPESIFIKASI' and i % 12 == 0 else 'in_progress'
+            if i % 50 == 0:
+                status = 'completed'
+            pagu = 100_000_000
+            # Setiap 7 paket: nilai kontrak melebihi pagu
+            kontrak = pagu * 1.1 if i % 7 == 0 else pagu * 0.9
+            paket_rows.append((f"PKT-{i:05d}", f"Paket {i}", TAHUN, pagu, pagu * 0.95,
+                               kontrak, stage, status, '2026-02-01', '2026-03-01'))
+        # Paket fatal: tanggal selesai sebelum mulai
+        paket_rows.append(("PKT-FATAL", "Paket Fatal", TAHUN, 1, 1, 1, 'BAHP',
+                           'in_progress', '2026-05-01', '2026-04-01'))
+        paket_rows.append(("PKT-LAIN", "Tahun Lain", TAHUN - 1, 1, 1, 1, 'SPK',
+                           'in_progress', None, None))
+        conn.executemany("""
+            INSERT INTO paket (kode, nama, tahun_anggaran, nilai_pagu, nilai_hps,
+                nilai_kontrak, current_stage, status, tanggal_mulai, tanggal_selesai)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, paket_rows)
+
+        ids = [r[0] for r in conn.execute("SELECT id FROM paket ORDER BY id")]
+        item_rows = []
+        for paket_id in ids:
+            for n in range(10):
+                lengkap = (paket_id + n) % 4 != 0
+                item_rows.append((paket_id, n + 1, f"Item {n}", 1000, 1100,
+                                  1200 if lengkap else None))
+        conn.executemany("""
+            INSERT INTO item_barang (paket_id, nomor_urut, uraian,
+                harga_survey1, harga_survey2, harga_survey3)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, item_rows)
+        conn.executemany("""
+            INSERT INTO dokumen (paket_id, doc_type, status) VALUES (?, ?, 'final')
+        """, [(paket_id, 'SPK') for paket_id in ids[::2]])
+        conn.executemany("""
+            INSERT INTO dokumen_timeline (paket_id, doc_type, tanggal_dokumen)
+            VALUES (?, ?, ?)
+        """, [(paket_id, 'HPS', '2026-01-10') for paket_id in ids[::3]])
+        conn.commit()
+        conn.close()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmpdir, ignore_errors=True)
+
+    def tearDown(self):
+        disable_query_stats()
+
+    def test_status_mapping(self):
+        self.assertEqual(paket_status_code({'status': 'draft'}), PaketStatus.DRAFT)
+        self.assertEqual(paket_status_code({'status': 'completed'}), PaketStatus.SELESAI)
+        self.assertEqual(paket_status_code({'status': 'in_progress', 'current_stage': 'SPK'}),
+                         PaketStatus.PENYEDIA_OK)
+        self.assertEqual(paket_status_code({'status_code': PaketStatus.PEMILIHAN}),
+                         PaketStatus.PEMILIHAN)
+
+    def test_loads_with_set_queries(self):
+        stats = enable_query_stats(threshold_ms=10_000,
+                                   log_path=os.path.join(self.tmpdir, "slow.log"))
+        pakets = load_portfolio(self.db_path, TAHUN)
+        self.assertEqual(len(pakets), 1001)
+        self.assertEqual(sum(r['count'] for r in stats.snapshot()), 4)
+
+        first = next(p for p in pakets if p['kode'] == 'PKT-00000')
+        self.assertEqual(len(first['_items']), 10)
+        self.assertIn('SPK', first['_existing_docs'])
+        self.assertEqual(first['tanggal_hps'], '2026-01-10')
+
+    def test_matches_single_paket_engine(self):
+        pakets = load_portfolio(self.db_path, TAHUN)
+        report = evaluate_portfolio(self.db_path, TAHUN, pakets=pakets)
+        by_kode = {e.kode: e for e in report.entries}
+
+        for paket in pakets[:60]:
+            if paket['kode'] not in by_kode:
+                continue
+            entry = by_kode[paket['kode']]
+            expected = validate_paket(paket, paket['_items'])
+            self.assertEqual([(r.type, r.field) for r in entry.results],
+                             [(r.type, r.field) for r in expected])
+            actions = get_next_actions(paket, paket['_items'], paket['_existing_docs'])
+            self.assertEqual([a['action'] for a in entry.next_actions],
+                             [a['action'] for a in actions])
+
+    def test_report_counts_and_sorting(self):
+        report = evaluate_portfolio(self.db_path, TAHUN)
+        self.assertEqual(report.total_paket, 1001)
+        self.assertEqual(report.status_counts['Selesai'], 20)
+        self.assertEqual(len(report.entries), 981)
+
+        melebihi_pagu = sum(1 for i in range(1000) if i % 7 == 0 and i % 50 != 0)
+        self.assertEqual(report.rule_counts['WARNING:nilai_kontrak'], melebihi_pagu)
+        self.assertEqual(report.rule_counts['BLOCKED:tanggal_selesai_kerja'], 1)
+
+        top = report.sorted_by('skor')[0]
+        self.assertEqual(top.kode, 'PKT-FATAL')
+        self.assertTrue(top.blocked)
+        skor = [e.skor for e in report.needs_attention()]
+        self.assertEqual(skor, sorted(skor, reverse=True))
+        kode = [e.kode for e in report.sorted_by('kode')]
+        self.assertEqual(kode, sorted(kode))
+        with self.assertRaises(ValueError):
+            report.sorted_by('tidak_ada')
+
+    def test_cli_report(self):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            code = main(['--db', self.db_path, '--tahun', str(TAHUN), '--limit', '5'])
+        self.assertEqual(code, 0)
+        data = json.loads(out.getvalue())
+        self.assertEqual(data['total_paket'], 1001)
+        self.assertEqual(len(data['entries']), 5)
+        self.assertEqual(data['entries'][0]['kode'], 'PKT-FATAL')
+        self.assertEqual(data['rule_counts']['BLOCKED:tanggal_selesai_kerja'], 1)
+
+        output = os.path.join(self.tmpdir, "portfolio.json")
+        self.assertEqual(main(['--db', self.db_path, '--tahun', str(TAHUN), '--sort', 'kode',
+                               '--all', '--output', output]), 0)
+        with open(output, encoding='utf-8') as f:
+            kode = [e['kode'] for e in json.load(f)['entries']]
+        self.assertEqual(len(kode), 981)
+        self.assertEqual(kode, sorted(kode))
+
+    def test_thousand_pakets_under_one_second(self):
+        evaluate_portfolio(self.db_path, TAHUN)  # warm-up
+        start = time.perf_counter()
+        evaluate_portfolio(self.db_path, TAHUN)
+        self.assertLess(time.perf_counter() - start, 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
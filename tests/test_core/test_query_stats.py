@@ -0,0 +1,106 @@
+"""
+PPK DOCUMENT FACTORY - Test Query Instrumentation
+==================================================
+Verifikasi statistik query dan slow query log.
+
+Run:
+    python -m pytest tests/test_core/test_query_stats.py -v
+"""
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.core import query_stats
+from app.core.query_stats import (
+    enable_query_stats, disable_query_stats, get_query_stats,
+    InstrumentedConnection, format_report,
+)
+from app.core.database_v4 import DatabaseManagerV4
+from app.models.pencairan_models import PencairanManager
+
+
+class TestQueryStats(unittest.TestCase):
+    """Test opt-in query instrumentation."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmpdir, "test.db")
+        self.log_path = os.path.join(self.tmpdir, "slow.log")
+        disable_query_stats()
+
+    def tearDown(self):
+        disable_query_stats()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_disabled_by_default_uses_plain_connection(self):
+        """Tanpa enable, koneksi tidak diinstrumentasi."""
+        conn = query_stats.connect(self.db_path)
+        try:
+            self.assertNotIsInstance(conn, InstrumentedConnection)
+        finally:
+            conn.close()
+
+    def test_records_count_rows_and_latency(self):
+        """Count, rows dan latency tercatat per statement."""
+        stats = enable_query_stats(threshold_ms=10_000, log_path=self.log_path)
+        DatabaseManagerV4(self.db_path)  # master tables (penyedia)
+        manager = PencairanManager(self.db_path)
+        for i in range(3):
+            manager.create_transaksi({
+                'mekanisme': 'UP', 'jenis_belanja': 'atk',
+                'nama_kegiatan': f'Kegiatan {i}', 'tahun_anggaran': 2026,
+            })
+        stats.reset()
+
+        for _ in range(4):
+            manager.list_transaksi(mekanisme='UP', tahun=2026)
+
+        top = stats.top(50, sort_by='count')
+        select = [r for r in top if r['sql'].startswith('SELECT t.*')]
+        self.assertEqual(len(select), 1)
+        self.assertEqual(select[0]['count'], 4)
+        self.assertEqual(select[0]['rows'], 12)
+        self.assertGreaterEqual(select[0]['p95_ms'], 0)
+        self.assertGreaterEqual(select[0]['total_ms'], select[0]['max_ms'])
+        self.assertIn('SELECT t.*', format_report(top))
+
+    def test_slow_queries_written_to_log(self):
+        """Statement di atas threshold ditulis ke slow query log."""
+        enable_query_stats(threshold_ms=0, log_path=self.log_path)
+        conn = query_stats.connect(self.db_path)
+        try:
+            conn.execute("SELECT 1").fetchall()
+        finally:
+            conn.close()
+        with open(self.log_path, encoding='utf-8') as f:
+            self.assertIn("SELECT 1", f.read())
+
+    def test_save_snapshot_and_cli(self):
+        """Snapshot JSON bisa dibaca CLI."""
+        stats = enable_query_stats(threshold_ms=10_000, log_path=self.log_path)
+        conn = query_stats.connect(self.db_path)
+        try:
+            conn.execute("CREATE TABLE t (x INTEGER)")
+            conn.executemany("INSERT INTO t VALUES (?)", [(i,) for i in range(5)])
+            list(conn.execute("SELECT x FROM t"))
+        finally:
+            conn.close()
+
+        path = os.path.join(self.tmpdir, "stats.json")
+        stats.save(path)
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        rows = {r['sql']: r for r in data['statements']}
+        self.assertEqual(rows['SELECT x FROM t']['rows'], 5)
+        self.assertEqual(query_stats.main(['--file', path, '--sort', 'rows']), 0)
+        self.assertIs(get_query_stats(), stats)
+
+
+if __name__ == '__main__':
+    unittest.main()
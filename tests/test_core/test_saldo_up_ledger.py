@@ -0,0 +1,195 @@
+"""
+PPK DOCUMENT FACTORY - Test Saldo UP Ledger
+===========================================
+Verifikasi up_ledger, saldo_up per bulan dan rekonsiliasi.
+
+Run:
+    python -m pytest tests/test_core/test_saldo_up_ledger.py -v
+"""
+
+import os
+import sys
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.core.database_v4 import DatabaseManagerV4
+from app.models import pencairan_models
+from app.models.pencairan_models import PencairanManager, BATAS_UP_MAKSIMAL
+
+TAHUN = 2026
+
+
+class TestSaldoUpLedger(unittest.TestCase):
+    """Test ledger-backed saldo UP."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmpdir, "test.db")
+        DatabaseManagerV4(self.db_path)  # master tables (penyedia)
+        self.manager = PencairanManager(self.db_path)
+        self.bulan = datetime.now().month
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _create(self, uang_muka=1_000_000, mekanisme='UP'):
+        return self.manager.create_transaksi({
+            'mekanisme': mekanisme,
+            'jenis_belanja': 'operasional',
+            'nama_kegiatan': 'Rapat',
+            'uang_muka': uang_muka,
+            'tahun_anggaran': TAHUN,
+        })
+
+    def _count(self, table):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        finally:
+            conn.close()
+
+    def test_get_saldo_up_is_read_only(self):
+        """Membaca saldo tidak menulis baris baru."""
+        saldo = self.manager.get_saldo_up(TAHUN, 3)
+        self.assertEqual(saldo['saldo_tersedia'], BATAS_UP_MAKSIMAL)
+        self.assertEqual(self._count('saldo_up'), 0)
+
+    def test_fase_events_update_saldo(self):
+        """Pencairan, realisasi dan penyelesaian tercatat di ledger."""
+        tid = self._create()
+        self.assertEqual(self.manager.get_ledger_up(transaksi_id=tid), [])
+
+        self.manager.update_fase(tid, 2)
+        saldo = self.manager.get_saldo_up(TAHUN, self.bulan)
+        self.assertEqual(saldo['total_penggunaan'], 1_000_000)
+
+        self.manager.update_fase(tid, 3)
+        self.manager.update_fase(tid, 4)
+        self.manager.update_transaksi(tid, {'realisasi': 1_200_000})
+        self.manager.update_transaksi(tid, {'realisasi': 1_200_000})
+        saldo = self.manager.get_saldo_up(TAHUN, self.bulan)
+        self.assertEqual(saldo['total_penggunaan'], 1_200_000)
+
+        self.manager.update_fase(tid, 5)
+        saldo = self.manager.get_saldo_up(TAHUN, self.bulan)
+        self.assertEqual(saldo['total_pertanggungjawaban'], 1_200_000)
+        self.assertEqual(saldo['saldo_tersedia'], BATAS_UP_MAKSIMAL)
+
+        events = [e['event'] for e in self.manager.get_ledger_up(transaksi_id=tid)]
+        self.assertEqual(events, ['FASE', 'UPDATE', 'FASE'])
+
+    def test_batal_reverses_and_non_up_ignored(self):
+        tid = self._create()
+        self.manager.update_fase(tid, 2)
+        self.manager.delete_transaksi(tid)
+        self.assertEqual(self.manager.get_saldo_up(TAHUN, self.bulan)['total_penggunaan'], 0)
+
+        ls = self._create(mekanisme='LS')
+        self.manager.update_fase(ls, 2)
+        self.assertEqual(self.manager.get_ledger_up(transaksi_id=ls), [])
+
+    def test_reconcile_detects_and_fixes_drift(self):
+        tid = self._create()
+        self.manager.update_fase(tid, 2)
+        self.assertTrue(self.manager.reconcile_saldo_up(TAHUN)['ok'])
+
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("UPDATE saldo_up SET total_penggunaan = 5 WHERE tahun_anggaran = ?", (TAHUN,))
+        conn.commit()
+        conn.close()
+
+        report = self.manager.reconcile_saldo_up(TAHUN, perbaiki=False)
+        self.assertFalse(report['ok'])
+        self.assertEqual(report['saldo_drift'][0]['seharusnya_penggunaan'], 1_000_000)
+        self.assertEqual(self.manager.get_saldo_up(TAHUN, self.bulan)['total_penggunaan'], 5)
+
+        self.manager.reconcile_saldo_up(TAHUN)
+        self.assertEqual(self.manager.get_saldo_up(TAHUN, self.bulan)['total_penggunaan'], 1_000_000)
+        self.assertTrue(self.manager.reconcile_saldo_up(TAHUN)['ok'])
+
+    def test_reconcile_migrates_existing_transaksi(self):
+        """Transaksi tanpa entri ledger (data lama) disinkronkan."""
+        tid = self._create(uang_muka=750_000)
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("UPDATE transaksi_pencairan SET fase_aktif = 3 WHERE id = ?", (tid,))
+        conn.commit()
+        conn.close()
+
+        report = self.manager.reconcile_saldo_up(TAHUN)
+        self.assertEqual(report['transaksi_drift'][0]['penggunaan'], 750_000)
+        self.assertEqual(self.manager.get_ledger_up(transaksi_id=tid)[0]['event'], 'SINKRON')
+        self.assertEqual(self.manager.get_saldo_up(TAHUN, self.bulan)['total_penggunaan'], 750_000)
+
+    def _pada(self, bulan, hari=10, tahun=TAHUN):
+        """Jalankan event ledger seolah-olah terjadi pada tanggal lokal ini."""
+        return patch.object(pencairan_models, '_sekarang',
+                            return_value=datetime(tahun, bulan, hari, 14, 0))
+
+    def test_ledger_books_each_event_in_its_month(self):
+        """Pencairan dan pertanggungjawaban masuk ke bulan masing-masing."""
+        tid = self._create()
+        with self._pada(2):
+            self.manager.update_fase(tid, 2)
+        with self._pada(4):
+            self.manager.update_fase(tid, 3)
+            self.manager.update_fase(tid, 4)
+            self.manager.update_transaksi(tid, {'realisasi': 1_200_000})
+            self.manager.update_fase(tid, 5)
+
+        self.assertEqual([e['bulan'] for e in self.manager.get_ledger_up(transaksi_id=tid)],
+                         [2, 4, 4])
+        februari = self.manager.get_saldo_up(TAHUN, 2)
+        april = self.manager.get_saldo_up(TAHUN, 4)
+        self.assertEqual((februari['total_penggunaan'], februari['total_pertanggungjawaban']),
+                         (1_000_000, 0))
+        self.assertEqual((april['total_penggunaan'], april['total_pertanggungjawaban']),
+                         (200_000, 1_200_000))
+        self.assertTrue(self.manager.reconcile_saldo_up(TAHUN)['ok'])
+
+    def test_event_after_fiscal_year_goes_to_december(self):
+        tid = self._create()
+        with self._pada(12, 20):
+            self.manager.update_fase(tid, 2)
+        with self._pada(1, 5, tahun=TAHUN + 1):
+            self.manager.update_fase(tid, 5)
+        self.assertEqual({e['bulan'] for e in self.manager.get_ledger_up(transaksi_id=tid)},
+                         {12})
+        self.assertEqual(self.manager.get_saldo_up(TAHUN, 12)['total_pertanggungjawaban'],
+                         1_000_000)
+
+    def test_reconcile_books_sync_in_month_of_last_change(self):
+        """Sinkronisasi data lama dicatat di bulan perubahan terakhir transaksi."""
+        bulan_lalu = 1 if self.bulan != 1 else 2
+        tid = self._create(uang_muka=600_000)
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("UPDATE transaksi_pencairan SET fase_aktif = 3, updated_at = ? WHERE id = ?",
+                     (f"{TAHUN}-{bulan_lalu:02d}-15 09:00:00", tid))
+        conn.commit()
+        conn.close()
+
+        report = self.manager.reconcile_saldo_up(TAHUN)
+        self.assertEqual(report['transaksi_drift'][0]['bulan'], bulan_lalu)
+        self.assertEqual(self.manager.get_ledger_up(transaksi_id=tid)[0]['bulan'], bulan_lalu)
+        self.assertEqual(self.manager.get_saldo_up(TAHUN, bulan_lalu)['total_penggunaan'], 600_000)
+
+        # Perubahan berikutnya masuk ke bulan event-nya sendiri
+        with self._pada(6):
+            self.manager.update_fase(tid, 4)
+            self.manager.update_transaksi(tid, {'realisasi': 650_000})
+        self.assertEqual(self.manager.get_saldo_up(TAHUN, 6)['total_penggunaan'], 50_000)
+        self.assertTrue(self.manager.reconcile_saldo_up(TAHUN)['ok'])
+
+    def test_manual_correction_goes_through_ledger(self):
+        self.assertTrue(self.manager.update_saldo_up(TAHUN, 1, penggunaan_delta=250_000))
+        self.assertEqual(self.manager.get_ledger_up(TAHUN, 1)[0]['event'], 'KOREKSI')
+        self.assertTrue(self.manager.reconcile_saldo_up(TAHUN)['ok'])
+
+
+if __name__ == '__main__':
+    unittest.main()
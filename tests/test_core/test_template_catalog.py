@@ -0,0 +1,129 @@
+"""
+PPK DOCUMENT FACTORY - Test Template Catalog
+============================================
+Verifikasi TemplateCatalog: snapshot status dengan satu query, hanya
+template yang berubah diperbarui, invalidasi saat upload, dan resolusi
+path untuk generate.
+
+Run:
+    python -m pytest tests/test_core/test_template_catalog.py -v
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from docx import Document
+
+from app.core.config import DOCUMENT_TEMPLATES
+from app.core.database import DatabaseManager
+from app.core.query_stats import enable_query_stats, disable_query_stats
+from app.templates import engine
+from app.templates.catalog import TemplateCatalog
+
+
+class TestTemplateCatalog(unittest.TestCase):
+    """Test cached template status and change detection."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.db = DatabaseManager(os.path.join(self.tmpdir, "test.db"))
+        self.word_dir = os.path.join(self.tmpdir, "word")
+        self.excel_dir = os.path.join(self.tmpdir, "excel")
+        os.makedirs(self.word_dir)
+        os.makedirs(self.excel_dir)
+        self.catalog = TemplateCatalog(self.db, max_age=0,
+                                       word_dir=self.word_dir, excel_dir=self.excel_dir)
+
+    def tearDown(self):
+        disable_query_stats()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _write_docx(self, path, text):
+        doc = Document()
+        doc.add_paragraph(text)
+        doc.save(path)
+        return path
+
+    def _default_path(self, code):
+        return os.path.join(self.word_dir, DOCUMENT_TEMPLATES[code]['template'])
+
+    def _count_queries(self, func):
+        stats = enable_query_stats(threshold_ms=10_000,
+                                   log_path=os.path.join(self.tmpdir, "slow.log"))
+        stats.reset()
+        result = func()
+        count = sum(r['count'] for r in stats.snapshot())
+        disable_query_stats()
+        return result, count
+
+    def test_status_snapshot_single_query(self):
+        self._write_docx(self._default_path('SPESIFIKASI'), "{{nama_paket}}")
+
+        status, queries = self._count_queries(self.catalog.status_list)
+        self.assertEqual(queries, 1)
+        self.assertEqual([s['code'] for s in status], list(DOCUMENT_TEMPLATES))
+        by_code = {s['code']: s for s in status}
+        self.assertEqual(by_code['SPESIFIKASI']['status'], 'exists')
+        self.assertEqual(by_code['SPESIFIKASI']['filepath'], self._default_path('SPESIFIKASI'))
+        self.assertEqual(by_code['SURVEY_HARGA']['status'], 'missing')
+        self.assertIsNone(by_code['SURVEY_HARGA']['filepath'])
+
+        # Tampilan berikutnya (tabel + checklist fase) tanpa query database
+        _, queries = self._count_queries(lambda: (self.catalog.status_list(),
+                                                  self.catalog.status_list()))
+        self.assertEqual(queries, 0)
+
+    def test_only_changed_entry_refreshed(self):
+        path = self._write_docx(self._default_path('SPESIFIKASI'), "{{nama_paket}}")
+        self._write_docx(self._default_path('SURVEY_HARGA_WORD'), "{{tanggal_survey}}")
+        self.catalog.refresh()
+
+        with mock.patch.object(engine, 'extract_placeholders',
+                               wraps=engine.extract_placeholders) as extract:
+            self.assertEqual(self.catalog.placeholders('SPESIFIKASI'), ['nama_paket'])
+            self.assertEqual(self.catalog.placeholders('SURVEY_HARGA_WORD'), ['tanggal_survey'])
+            self.catalog.placeholders('SPESIFIKASI')
+            self.assertEqual(extract.call_count, 2)
+
+            self.assertEqual(self.catalog.refresh(force=True), [])
+
+            self._write_docx(path, "{{nama_paket}} {{nilai_hps}}")
+            os.utime(path, ns=(1, 1))
+            self.assertEqual(self.catalog.refresh(force=True), ['SPESIFIKASI'])
+            self.assertEqual(self.catalog.placeholders('SPESIFIKASI'),
+                             ['nama_paket', 'nilai_hps'])
+            self.catalog.placeholders('SURVEY_HARGA_WORD')
+            self.assertEqual(extract.call_count, 3)
+
+    def test_upload_invalidates_and_resolve_path(self):
+        self.assertEqual(self.catalog.resolve_path('SPESIFIKASI'),
+                         self._default_path('SPESIFIKASI'))
+        self.assertIsNone(self.catalog.resolve_path('TIDAK_ADA'))
+
+        uploaded = self._write_docx(os.path.join(self.tmpdir, "spek_v1.docx"), "{{nama_ppk}}")
+        self.db.save_template({'code': 'SPESIFIKASI', 'name': 'Spesifikasi Teknis',
+                               'type': 'word', 'filename': 'spek_v1.docx',
+                               'filepath': uploaded, 'placeholders': ['nama_ppk']})
+        # Tanpa invalidate snapshot lama tetap dipakai
+        self.assertEqual(self.catalog.get('SPESIFIKASI').status, 'missing')
+
+        self.catalog.invalidate()
+        self.assertEqual(self.catalog.refresh(), ['SPESIFIKASI'])
+        entry = self.catalog.get('SPESIFIKASI')
+        self.assertEqual(entry.status, 'uploaded')
+        self.assertEqual(entry.version, 1)
+        self.assertEqual(entry.size, os.path.getsize(uploaded))
+
+        _, queries = self._count_queries(lambda: self.catalog.resolve_path('SPESIFIKASI'))
+        self.assertEqual(queries, 0)
+        self.assertEqual(self.catalog.resolve_path('SPESIFIKASI'), uploaded)
+
+
+if __name__ == '__main__':
+    unittest.main()
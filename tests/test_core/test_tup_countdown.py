@@ -0,0 +1,137 @@
+"""
+PPK DOCUMENT FACTORY - Test TUP Countdown
+=========================================
+Verifikasi countdown TUP berbasis satu query dan pengingat ambang batas.
+
+Run:
+    python -m pytest tests/test_core/test_tup_countdown.py -v
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.core.query_stats import enable_query_stats, disable_query_stats
+from app.core.database_v4 import DatabaseManagerV4
+from app.core.events import EventBus, TOPIC_TUP_DEADLINE
+from app.models.pencairan_models import PencairanManager, BATAS_TUP_HARI
+from app.services.tup_deadline_scheduler import (
+    TUPDeadlineScheduler, LEVEL_OVERDUE, seconds_until_midnight
+)
+
+HARI_INI = date(2026, 3, 20)
+
+
+class TestTupCountdown(unittest.TestCase):
+    """Test get_countdown_tup dan TUPDeadlineScheduler."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmpdir, "test.db")
+        DatabaseManagerV4(self.db_path)  # master tables (penyedia)
+        self.manager = PencairanManager(self.db_path)
+        self.bus = EventBus()
+        self.events = []
+        self.bus.subscribe(self.events.append, [TOPIC_TUP_DEADLINE])
+
+    def tearDown(self):
+        disable_query_stats()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _create_tup(self, sisa_hari, status=None):
+        """Buat TUP dengan tanggal SP2D sehingga sisa hari = sisa_hari."""
+        tanggal_sp2d = HARI_INI - timedelta(days=BATAS_TUP_HARI - sisa_hari)
+        tid = self.manager.create_transaksi({
+            'mekanisme': 'TUP',
+            'jenis_belanja': 'operasional',
+            'nama_kegiatan': f'TUP {sisa_hari}',
+            'uang_muka': 1_000_000,
+        })
+        self.manager.update_transaksi(tid, {'tanggal_sp2d_tup': tanggal_sp2d.isoformat()})
+        if status:
+            self.manager.update_status(tid, status)
+        return tid
+
+    def test_countdown_single_query(self):
+        """Semua TUP terbuka dihitung dengan satu query, urut sisa hari."""
+        for sisa in (12, -2, 5):
+            self._create_tup(sisa)
+        self._create_tup(1, status='selesai')
+        self.manager.create_transaksi({'mekanisme': 'TUP', 'nama_kegiatan': 'Belum SP2D'})
+
+        stats = enable_query_stats(threshold_ms=10_000,
+                                   log_path=os.path.join(self.tmpdir, "slow.log"))
+        rows = self.manager.get_countdown_tup(hari_ini=HARI_INI)
+        self.assertEqual(sum(r['count'] for r in stats.snapshot()), 1)
+
+        self.assertEqual([r['sisa_hari'] for r in rows], [-2, 5, 12])
+        self.assertTrue(rows[0]['is_overdue'])
+        self.assertEqual(rows[1]['batas_waktu'], HARI_INI + timedelta(days=5))
+        self.assertEqual(rows[1]['batas_waktu'] - rows[1]['tanggal_sp2d'],
+                         timedelta(days=BATAS_TUP_HARI))
+
+    def test_list_transaksi_carries_countdown(self):
+        for sisa in (12, -2):
+            self._create_tup(sisa)
+        self.manager.create_transaksi({'mekanisme': 'TUP', 'nama_kegiatan': 'Belum SP2D'})
+        self.manager.create_transaksi({'mekanisme': 'UP', 'nama_kegiatan': 'UP'})
+
+        rows, _ = self.manager.list_transaksi(hari_ini=HARI_INI, order_by='nama_kegiatan')
+        self.assertEqual({r['nama_kegiatan']: r['sisa_hari_tup'] for r in rows},
+                         {'TUP 12': 12, 'TUP -2': -2, 'Belum SP2D': None, 'UP': None})
+        countdown = {r['transaksi_id']: r['sisa_hari']
+                     for r in self.manager.get_countdown_tup(hari_ini=HARI_INI)}
+        for row in rows:
+            if row['id'] in countdown:
+                self.assertEqual(row['sisa_hari_tup'], countdown[row['id']])
+
+    def test_hitung_countdown_tup_single(self):
+        tid = self._create_tup(BATAS_TUP_HARI)
+        countdown = self.manager.hitung_countdown_tup(tid)
+        self.assertEqual(countdown['tanggal_sp2d'], HARI_INI)
+        self.assertEqual(countdown['sisa_hari'],
+                         (countdown['batas_waktu'] - date.today()).days)
+
+        up = self.manager.create_transaksi({'mekanisme': 'UP', 'nama_kegiatan': 'UP'})
+        self.assertIsNone(self.manager.hitung_countdown_tup(up))
+
+    def test_scheduler_emits_each_threshold_once(self):
+        tid = self._create_tup(10)
+        scheduler = TUPDeadlineScheduler(self.manager, thresholds=(7, 3), bus=self.bus)
+
+        self.assertEqual(scheduler.check(HARI_INI), [])
+        hari = HARI_INI + timedelta(days=3)  # sisa 7
+        self.assertEqual([r['level'] for r in scheduler.check(hari)], ['H-7'])
+        self.assertEqual(scheduler.check(hari), [])
+        self.assertEqual(scheduler.check(hari + timedelta(days=1)), [])
+
+        hari = HARI_INI + timedelta(days=8)  # sisa 2: langsung H-3
+        self.assertEqual([r['level'] for r in scheduler.check(hari)], ['H-3'])
+        hari = HARI_INI + timedelta(days=11)  # sisa -1
+        self.assertEqual([r['level'] for r in scheduler.check(hari)], [LEVEL_OVERDUE])
+        self.assertEqual(scheduler.check(hari), [])
+
+        self.assertEqual([e.action for e in self.events], ['H-7', 'H-3', LEVEL_OVERDUE])
+        self.assertEqual(self.events[-1].transaksi_id, tid)
+        self.assertEqual(self.events[-1].data['sisa_hari'], -1)
+
+    def test_scheduler_forgets_closed_tup(self):
+        tid = self._create_tup(-3)
+        scheduler = TUPDeadlineScheduler(self.manager, bus=self.bus)
+        self.assertEqual(len(scheduler.check(HARI_INI)), 1)
+
+        self.manager.update_status(tid, 'selesai')
+        self.assertEqual(scheduler.check(HARI_INI), [])
+        self.assertEqual(scheduler._notified, {})
+
+    def test_seconds_until_midnight(self):
+        self.assertEqual(seconds_until_midnight(datetime(2026, 3, 20, 23, 59, 30)), 30)
+
+
+if __name__ == '__main__':
+    unittest.main()
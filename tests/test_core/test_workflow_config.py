@@ -0,0 +1,107 @@
+"""
+PPK DOCUMENT FACTORY - Test Workflow Config Index
+=================================================
+Verifikasi index workflow terkompilasi (read-only, tanpa salinan per
+panggilan) dan pengecekan konsistensi definisi.
+
+Run:
+    python -m pytest tests/test_core/test_workflow_config.py -v
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.config.workflow_config import (
+    ALL_WORKFLOWS, get_workflow, get_fase_config, get_dokumen_list,
+    get_dokumen_wajib, get_dokumen_opsional, get_all_dokumen, get_dokumen,
+    get_validasi_rules, cek_konsistensi_workflow,
+)
+
+
+class TestWorkflowIndex(unittest.TestCase):
+    """Test compiled workflow lookups."""
+
+    def test_lookups_match_definitions(self):
+        for mekanisme, workflow in ALL_WORKFLOWS.items():
+            self.assertEqual(get_workflow(mekanisme.lower())['nama'], workflow['nama'])
+            for fase, fase_config in workflow['fase'].items():
+                dokumen = fase_config.get('dokumen', [])
+                self.assertEqual([d['kode'] for d in get_dokumen_list(mekanisme, fase)],
+                                 [d['kode'] for d in dokumen])
+                self.assertEqual(
+                    len(get_dokumen_wajib(mekanisme, fase)) + len(get_dokumen_opsional(mekanisme, fase)),
+                    len(dokumen))
+                self.assertEqual([r['rule'] for r in get_validasi_rules(mekanisme, fase)],
+                                 [r['rule'] for r in fase_config.get('validasi', [])])
+
+        self.assertIsNone(get_workflow('XX'))
+        self.assertEqual(get_dokumen_list('UP', 9), ())
+        self.assertIsNone(get_fase_config('UP', 9))
+
+    def test_results_are_shared_and_read_only(self):
+        self.assertIs(get_all_dokumen('UP'), get_all_dokumen('UP'))
+        self.assertIs(get_dokumen_list('TUP', 1), get_dokumen_list('TUP', 1))
+
+        dok = get_all_dokumen('UP')[0]
+        self.assertEqual((dok['fase'], dok['fase_nama']), (1, 'Inisiasi & SK'))
+        with self.assertRaises(TypeError):
+            dok['kode'] = 'X'
+        with self.assertRaises(TypeError):
+            get_fase_config('UP', 1)['nama'] = 'X'
+
+    def test_get_dokumen_by_kode_includes_variants(self):
+        dok = get_dokumen('UP', 'SK_KPA')
+        self.assertEqual(dok['template'], 'sk_kpa.docx')
+        self.assertEqual((dok['fase'], dok['grup']), (1, 'dokumen_dengan_sk'))
+        self.assertEqual(get_dokumen('UP', 'LBR_REQ')['grup'], 'dokumen')
+        self.assertIsNone(get_dokumen('UP', 'TIDAK_ADA'))
+
+
+class TestKonsistensiWorkflow(unittest.TestCase):
+    """Test cek_konsistensi_workflow."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.tmpdir, "word"))
+        open(os.path.join(self.tmpdir, "word", "ada.docx"), "w").close()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_no_duplicate_codes_in_shipped_workflows(self):
+        masalah = cek_konsistensi_workflow()
+        self.assertEqual([m for m in masalah if m['jenis'] == 'kode_ganda'], [])
+
+    def test_flags_duplicates_and_missing_templates(self):
+        workflows = {
+            "UP": {"fase": {
+                1: {
+                    "dokumen": [
+                        {"kode": "A", "template": "ada.docx"},
+                        {"kode": "A"},
+                    ],
+                    # Kode sama di daftar varian pada fase sama: boleh
+                    "dokumen_rapat": [{"kode": "A"}],
+                },
+                2: {"dokumen": [
+                    {"kode": "A"},
+                    {"kode": "B", "template": "hilang.docx"},
+                ]},
+            }},
+        }
+        masalah = cek_konsistensi_workflow(workflows, templates_dir=self.tmpdir)
+        ringkas = sorted((m['jenis'], m['fase'], m['kode']) for m in masalah)
+        self.assertEqual(ringkas, [
+            ('kode_ganda', 1, 'A'),
+            ('kode_ganda', 2, 'A'),
+            ('template_hilang', 2, 'B'),
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()
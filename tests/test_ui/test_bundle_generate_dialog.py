@@ -0,0 +1,81 @@
+"""
+PPK DOCUMENT FACTORY - Test Bundle Generate Dialog
+==================================================
+Verifikasi BundleGenerateDialog: checkbox dari deklarasi bundle dan
+generate di background thread dengan laporan hasil.
+
+Run:
+    python -m pytest tests/test_ui/test_bundle_generate_dialog.py -v
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from PySide6.QtWidgets import QApplication
+
+app = QApplication.instance()
+if app is None:
+    app = QApplication([])
+
+from docx import Document
+
+from app.core.database_v4 import DatabaseManagerV4
+from app.services.document_bundles import BundlePipeline, PERJALANAN_DINAS_BUNDLE, STATUS_OK
+from app.ui.dialogs.bundle_generate_dialog import BundleGenerateDialog
+
+
+class TestBundleGenerateDialog(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        db_path = os.path.join(self.tmpdir, "test.db")
+        DatabaseManagerV4(db_path)
+        word_dir = os.path.join(self.tmpdir, "word")
+        os.makedirs(word_dir)
+        for name in ('surat_tugas', 'sppd'):
+            doc = Document()
+            doc.add_paragraph("{{pelaksana_nama}} ke {{kota_tujuan}}")
+            doc.save(os.path.join(word_dir, f"{name}.docx"))
+
+        pipeline = BundlePipeline(db_path=db_path, word_dir=word_dir,
+                                  output_dir=os.path.join(self.tmpdir, "output"))
+        self.dialog = BundleGenerateDialog(
+            PERJALANAN_DINAS_BUNDLE, {'id': 3, 'pelaksana_nama': 'Budi', 'kota_tujuan': 'Ambon'},
+            info_rows=[("Pelaksana:", "Budi")], pipeline=pipeline)
+        self.reports = []
+        self.dialog.show_report = self.reports.append
+
+    def tearDown(self):
+        self.dialog.deleteLater()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_checkboxes_follow_bundle(self):
+        self.assertEqual(list(self.dialog.checkboxes),
+                         [doc.output_name for doc in PERJALANAN_DINAS_BUNDLE.documents])
+        self.assertEqual(self.dialog.selected_documents(),
+                         ['Surat_Tugas', 'SPPD', 'Kuitansi_Uang_Muka'])
+
+    def test_generate_in_background(self):
+        self.dialog.checkboxes['Kuitansi_Uang_Muka'].setChecked(False)
+        self.dialog.generate()
+        self.assertFalse(self.dialog.btn_generate.isEnabled())
+
+        deadline = time.monotonic() + 10
+        while not self.reports and time.monotonic() < deadline:
+            app.processEvents()
+            time.sleep(0.01)
+
+        report = self.reports[0]
+        self.assertEqual([i.status for i in report.items], [STATUS_OK, STATUS_OK])
+        self.assertEqual(self.dialog.progress_bar.value(), 2)
+        self.assertEqual(Document(report.items[1].path).paragraphs[0].text, "Budi ke Ambon")
+
+
+if __name__ == '__main__':
+    unittest.main()
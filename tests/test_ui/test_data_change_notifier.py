@@ -0,0 +1,82 @@
+"""
+PPK DOCUMENT FACTORY - Test Data Change Notifier
+================================================
+Verifikasi penggabungan (coalescing) event perubahan data untuk UI.
+
+Run:
+    python -m pytest tests/test_ui/test_data_change_notifier.py -v
+"""
+
+import os
+import sys
+import threading
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from PySide6.QtCore import QCoreApplication, QEvent
+from PySide6.QtWidgets import QApplication, QWidget
+
+app = QApplication.instance()
+if app is None:
+    app = QApplication([])
+
+from app.core.events import EventBus, TOPIC_TRANSAKSI, TOPIC_SALDO, TOPIC_FASE
+from app.ui.data_change_notifier import DataChangeNotifier
+
+
+class TestDataChangeNotifier(unittest.TestCase):
+
+    def setUp(self):
+        self.bus = EventBus()
+        self.notifier = DataChangeNotifier(bus=self.bus)
+        self.received = []
+        self.notifier.changed.connect(self.received.append)
+
+    def tearDown(self):
+        self.notifier.close()
+
+    def test_burst_coalesced_into_one_update(self):
+        for i in range(20):
+            self.bus.publish(TOPIC_TRANSAKSI, "update", i, "UP")
+        self.bus.publish(TOPIC_FASE, "next", 3, "LS")
+        self.bus.publish(TOPIC_SALDO, "fase", 3, "UP")
+
+        self.assertEqual(self.received, [])
+        self.assertTrue(self.notifier.has_pending())
+        self.notifier.flush()
+
+        self.assertEqual(len(self.received), 1)
+        self.assertEqual(self.received[0], {
+            TOPIC_TRANSAKSI: {"UP"}, TOPIC_FASE: {"LS"}, TOPIC_SALDO: {"UP"},
+        })
+
+        self.notifier.flush()
+        self.assertEqual(len(self.received), 1)
+
+    def test_event_from_worker_thread(self):
+        worker = threading.Thread(
+            target=self.bus.publish, args=(TOPIC_TRANSAKSI, "create", 1, "TUP")
+        )
+        worker.start()
+        worker.join()
+        app.processEvents()
+        self.notifier.flush()
+        self.assertEqual(self.received, [{TOPIC_TRANSAKSI: {"TUP"}}])
+
+    def test_close_unsubscribes(self):
+        self.notifier.close()
+        self.bus.publish(TOPIC_TRANSAKSI, "create", 1, "UP")
+        self.assertFalse(self.notifier.has_pending())
+
+    def test_deleted_owner_unsubscribes(self):
+        owner = QWidget()
+        DataChangeNotifier(owner, bus=self.bus)
+        self.assertEqual(len(self.bus._subscribers), 2)
+        owner.deleteLater()
+        QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+        self.assertEqual(len(self.bus._subscribers), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+PPK DOCUMENT FACTORY - Test Document Store Worker
+=================================================
+Verifikasi tugas pemeliharaan document store yang dijalankan di background
+(StoreMaintenanceThread) dan tab File Upload di dialog backup.
+
+Run:
+    python -m pytest tests/test_ui/test_document_store_worker.py -v
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from PySide6.QtWidgets import QApplication
+
+app = QApplication.instance()
+if app is None:
+    app = QApplication([])
+
+from app.core.database import DatabaseManager
+from app.services.document_store import DocumentStore
+from app.ui.document_store_worker import StoreMaintenanceThread
+
+
+class TestStoreMaintenanceThread(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmpdir, "test.db")
+        self.db = DatabaseManager(self.db_path)
+        self.store = DocumentStore(self.db_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _run(self, task):
+        results, errors = [], []
+        thread = StoreMaintenanceThread(self.store, task)
+        thread.finished.connect(lambda t, result: results.append((t, result)))
+        thread.failed.connect(lambda t, message: errors.append((t, message)))
+        thread.start()
+        self.assertTrue(thread.wait(10_000))
+        app.processEvents()
+        return results, errors
+
+    def test_adopt_legacy_then_stats(self):
+        legacy = os.path.join(self.tmpdir, "lama.pdf")
+        with open(legacy, 'wb') as f:
+            f.write(b"scan kontrak")
+        with self.db.get_connection() as conn:
+            conn.execute("""
+                INSERT INTO checklist_spj (paket_id, doc_type, status, filepath_signed)
+                VALUES (1, 'SPK', 'UPLOADED', ?)
+            """, (legacy,))
+            conn.commit()
+
+        results, errors = self._run('adopt_legacy')
+        self.assertEqual((results, errors), ([('adopt_legacy', 1)], []))
+
+        results, _ = self._run('stats')
+        self.assertEqual(results[0][1].jumlah_blob, 1)
+
+        results, _ = self._run('collect_garbage')
+        self.assertEqual(results[0][1]['dihapus'], 0)
+
+    def test_cancelled_collect_garbage_not_reported(self):
+        orphan = os.path.join(self.store.root_dir, "zz", "sisa.tmp")
+        os.makedirs(os.path.dirname(orphan))
+        with open(orphan, 'wb') as f:
+            f.write(b"x")
+        os.utime(orphan, (0, 0))
+
+        results = []
+        thread = StoreMaintenanceThread(self.store, 'collect_garbage')
+        thread.finished.connect(lambda t, result: results.append(result))
+        thread.cancel()
+        thread.start()
+        self.assertTrue(thread.wait(10_000))
+        app.processEvents()
+        self.assertEqual(results, [])
+        self.assertTrue(os.path.exists(orphan))
+
+    def test_failure_reported(self):
+        os.remove(self.db_path)
+        os.makedirs(self.db_path)  # Database tidak bisa dibuka
+        results, errors = self._run('verify')
+        self.assertEqual(results, [])
+        self.assertEqual(errors[0][0], 'verify')
+
+    def test_unknown_task_rejected(self):
+        with self.assertRaises(ValueError):
+            StoreMaintenanceThread(self.store, 'recount')
+
+
+if __name__ == '__main__':
+    unittest.main()
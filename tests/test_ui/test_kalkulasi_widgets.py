@@ -0,0 +1,96 @@
+"""
+PPK DOCUMENT FACTORY - Test Kalkulasi Widgets
+=============================================
+Verifikasi widget kalkulasi terikat ke KalkulasiModel.
+
+Run:
+    python -m pytest tests/test_ui/test_kalkulasi_widgets.py -v
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from PySide6.QtWidgets import QApplication
+
+app = QApplication.instance()
+if app is None:
+    app = QApplication([])
+
+from app.ui.components.kalkulasi_widget import KalkulasiWidget
+from app.ui.components.rincian_kalkulasi_widget import RincianKalkulasiWidget
+
+
+class TestRincianKalkulasiWidget(unittest.TestCase):
+
+    def setUp(self):
+        self.widget = RincianKalkulasiWidget()
+
+    def _add(self, uraian, volume, harga):
+        self.widget.uraian_input.setText(uraian)
+        self.widget.volume_input.setValue(volume)
+        self.widget.harga_input.setValue(harga)
+        self.widget._add_item_to_table()
+
+    def test_total_and_debounced_terbilang(self):
+        totals = []
+        self.widget.total_changed.connect(totals.append)
+
+        self._add("Kertas", 2, 50000)
+        self._add("Tinta", 1, 1500)
+
+        self.assertEqual(self.widget.total_display.text(), "Rp 101.500")
+        self.assertEqual(totals, [100000, 101500])
+        self.assertTrue(self.widget._terbilang_timer.isActive())
+
+        self.widget._refresh_terbilang()
+        self.assertEqual(self.widget.terbilang_label.text(),
+                         "( Seratus satu ribu lima ratus rupiah )")
+
+    def test_delete_and_set_items(self):
+        self._add("Kertas", 2, 50000)
+        self._add("Tinta", 1, 1500)
+        self.widget.table.selectRow(0)
+        self.widget._delete_selected()
+        self.assertEqual(self.widget.get_total(), 1500)
+        self.assertEqual(self.widget.table.rowCount(), 1)
+
+        self.widget.set_items([{'uraian': 'A', 'volume': 1, 'satuan': 'Unit',
+                                'harga_satuan': 2000, 'jumlah': 2000}])
+        data = self.widget.get_data_for_kuitansi()
+        self.assertEqual(data['total_rupiah'], "Rp 2.000")
+        self.assertEqual(data['total_terbilang'], "dua ribu rupiah")
+        self.assertEqual(self.widget.terbilang_label.text(), "( Dua ribu rupiah )")
+
+        self.widget.clear()
+        self.assertEqual(self.widget.terbilang_label.text(), "( Nol rupiah )")
+
+
+class TestKalkulasiWidget(unittest.TestCase):
+
+    def test_value_change_is_debounced(self):
+        widget = KalkulasiWidget()
+        widget.um_input.setValue(1000000)
+        widget.real_input.setValue(1250000)
+
+        # Nilai langsung tersedia, tampilan menunggu debounce
+        self.assertEqual(widget.get_result()['status'], 'KURANG_BAYAR')
+        self.assertTrue(widget._calculate_timer.isActive())
+
+        widget._calculate()
+        self.assertEqual(widget.selisih_display.text(), "Rp 250.000")
+        self.assertEqual(widget.summary_label.text(),
+                         "Perlu pembayaran tambahan sebesar Rp 250.000")
+
+    def test_set_values_updates_immediately(self):
+        widget = KalkulasiWidget()
+        widget.set_values(500000, 200000)
+        self.assertFalse(widget._calculate_timer.isActive())
+        self.assertEqual(widget.selisih_display.text(), "- Rp 300.000")
+        self.assertEqual(widget.get_result()['selisih_abs'], 300000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+PPK DOCUMENT FACTORY - Test Shared Master Data Combo Models
+===========================================================
+Verifikasi PegawaiComboModel: satu model dipakai bersama oleh banyak
+combo, pilihan per id, dan refresh setelah pegawai diubah tanpa
+mengubah pilihan combo yang sudah ada.
+
+Run:
+    python -m pytest tests/test_ui/test_master_data_models.py -v
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from PySide6.QtWidgets import QApplication, QComboBox
+
+app = QApplication.instance()
+if app is None:
+    app = QApplication([])
+
+from app.core.database_v4 import DatabaseManagerV4
+from app.ui.master_data_models import (
+    bind_pegawai_combo, get_pegawai_combo_model, select_pegawai,
+)
+
+
+class TestPegawaiComboModel(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmpdir, "test.db")
+        self.db = DatabaseManagerV4(self.db_path)
+        self.ids = [self.db.create_pegawai({'nip': f'1990{i:014d}', 'nama': f'Pegawai {i}',
+                                            'gelar_belakang': 'S.T.', 'is_ppk': i % 2})
+                    for i in range(6)]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_combos_share_one_model(self):
+        first, second = QComboBox(), QComboBox()
+        model = bind_pegawai_combo(first, 'ppk', "-- Pilih PPK --", db_path=self.db_path)
+        bind_pegawai_combo(second, 'ppk', "-- Pilih PPK --", db_path=self.db_path)
+        self.assertIs(second.model(), model)
+        self.assertIsNot(get_pegawai_combo_model(db_path=self.db_path), model)
+
+        self.assertEqual(first.count(), 4)
+        self.assertEqual(first.itemText(0), "-- Pilih PPK --")
+        self.assertIsNone(first.itemData(0))
+        self.assertTrue(select_pegawai(first, self.ids[3]))
+        self.assertEqual(first.currentText(), "Pegawai 3, S.T.")
+        self.assertEqual(first.currentData()['id'], self.ids[3])
+        self.assertFalse(select_pegawai(first, self.ids[2]))
+        self.assertEqual(first.currentIndex(), 0)
+
+    def test_refresh_keeps_selection(self):
+        combo = QComboBox()
+        bind_pegawai_combo(combo, db_path=self.db_path)
+        select_pegawai(combo, self.ids[4])
+
+        # "Aaa" masuk di urutan pertama, pilihan tetap pegawai yang sama
+        self.db.create_pegawai({'nip': '199900000000000001', 'nama': 'Aaa'})
+        app.processEvents()
+        self.assertEqual(combo.count(), 8)
+        self.assertEqual(combo.itemText(1), "Aaa")
+        self.assertEqual(combo.currentData()['id'], self.ids[4])
+
+        self.db.deactivate_pegawai(self.ids[4])
+        app.processEvents()
+        self.assertEqual(combo.count(), 7)
+        self.assertEqual(combo.currentIndex(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
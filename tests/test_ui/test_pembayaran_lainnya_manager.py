@@ -0,0 +1,240 @@
+"""
+PPK DOCUMENT FACTORY - Test Pembayaran Lainnya Manager
+======================================================
+Verifikasi tab SK KPA / honorarium / jamuan tamu / honor pengelola dibangun
+saat pertama ditampilkan, dimuat per halaman dengan filter/sort di query,
+dan hanya tab yang datanya berubah yang dimuat ulang.
+
+Run:
+    python -m pytest tests/test_ui/test_pembayaran_lainnya_manager.py -v
+"""
+
+import os
+import sys
+import shutil
+import sqlite3
+import tempfile
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+
+app = QApplication.instance()
+if app is None:
+    app = QApplication([])
+
+from app.core import database_v4
+from app.core.config import TAHUN_ANGGARAN
+from app.core.database_v4 import DatabaseManagerV4
+from app.core.events import (
+    TOPIC_SK_KPA, TOPIC_HONORARIUM, TOPIC_JAMUAN_TAMU, TOPIC_HONOR_PENGELOLA,
+)
+from app.ui.pembayaran_lainnya_manager import PembayaranLainnyaManager
+from app.ui.pages.pencairan.transaksi_table_model import PAGE_SIZE
+
+LARGE = 10_000
+SMALL = 100
+
+LIST_METHODS = {
+    TOPIC_SK_KPA: 'list_sk_kpa',
+    TOPIC_HONORARIUM: 'list_honorarium',
+    TOPIC_JAMUAN_TAMU: 'list_jamuan_tamu',
+    TOPIC_HONOR_PENGELOLA: 'list_honorarium_pengelola',
+}
+
+
+def seed_pembayaran(db_path, count):
+    """count baris per tabel, semuanya di TAHUN_ANGGARAN."""
+    conn = sqlite3.connect(db_path)
+    conn.execute("INSERT INTO pegawai (nip, nama) VALUES ('198001012005011001', 'Budi')")
+    pegawai_id = conn.execute("SELECT id FROM pegawai WHERE nama = 'Budi'").fetchone()[0]
+    conn.executemany("""
+        INSERT INTO sk_kpa (tahun_anggaran, nomor_sk, tanggal_sk, perihal,
+                            jenis_pembayaran, nilai_pembayaran)
+        VALUES (?, ?, ?, ?, 'honorarium', ?)
+    """, [(TAHUN_ANGGARAN, f"SK-{i:05d}", f"{TAHUN_ANGGARAN}-01-{i % 28 + 1:02d}",
+           f"Perihal {i}", i * 1000) for i in range(count)])
+    conn.executemany("""
+        INSERT INTO honorarium (tahun_anggaran, nama_kegiatan, jenis_honorarium,
+                                kategori, total_bruto)
+        VALUES (?, ?, 'narasumber', ?, ?)
+    """, [(TAHUN_ANGGARAN, f"{'Rapat' if i % 10 == 0 else 'Sosialisasi'} {i}",
+           'reguler' if i % 2 else 'insidentil', i * 1000) for i in range(count)])
+    conn.executemany("""
+        INSERT INTO jamuan_tamu (tahun_anggaran, nama_kegiatan, tanggal_kegiatan,
+                                 nama_tamu, total_biaya)
+        VALUES (?, ?, ?, ?, ?)
+    """, [(TAHUN_ANGGARAN, f"Jamuan {i}", f"{TAHUN_ANGGARAN}-02-{i % 28 + 1:02d}",
+           f"Tamu {i}", i * 500) for i in range(count)])
+    conn.executemany("""
+        INSERT INTO honorarium_pengelola (tahun, bulan, jabatan, pegawai_id, jumlah)
+        VALUES (?, ?, 'PPK', ?, ?)
+    """, [(TAHUN_ANGGARAN, i % 12 + 1, pegawai_id, 1_000_000) for i in range(count)])
+    conn.commit()
+    conn.close()
+
+
+class CountingFetcher:
+    """Bungkus DatabaseManagerV4.list_* dan catat argumen setiap query."""
+
+    def __init__(self, fetch):
+        self._fetch = fetch
+        self.calls = []
+
+    def __call__(self, **kwargs):
+        self.calls.append(kwargs)
+        return self._fetch(**kwargs)
+
+
+class TestPembayaranLainnyaManager(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.mkdtemp()
+        cls.dbs = {}
+        for count in (SMALL, LARGE):
+            db = DatabaseManagerV4(os.path.join(cls.tmpdir, f"pembayaran_{count}.db"))
+            seed_pembayaran(db.db_path, count)
+            cls.dbs[count] = db
+        cls._saved_db = database_v4._db_manager_v4
+
+    @classmethod
+    def tearDownClass(cls):
+        database_v4._db_manager_v4 = cls._saved_db
+        shutil.rmtree(cls.tmpdir, ignore_errors=True)
+
+    def setUp(self):
+        self.db = self.dbs[LARGE]
+        self.fetchers = {}
+        for key, name in LIST_METHODS.items():
+            self.fetchers[key] = CountingFetcher(getattr(self.db, name))
+            setattr(self.db, name, self.fetchers[key])
+        self.managers = []
+
+    def tearDown(self):
+        for manager in self.managers:
+            manager.close()
+            manager.deleteLater()
+        for name in LIST_METHODS.values():
+            delattr(self.db, name)
+
+    def _open(self, db=None) -> PembayaranLainnyaManager:
+        database_v4._db_manager_v4 = db or self.db
+        manager = PembayaranLainnyaManager()
+        manager.show()
+        app.processEvents()
+        self.managers.append(manager)
+        return manager
+
+    def test_only_visible_tab_is_built_and_paged(self):
+        manager = self._open()
+        self.assertEqual(list(manager.models), [TOPIC_SK_KPA])
+        self.assertEqual(len(self.fetchers[TOPIC_SK_KPA].calls), 1)
+        for key in (TOPIC_HONORARIUM, TOPIC_JAMUAN_TAMU, TOPIC_HONOR_PENGELOLA):
+            self.assertEqual(self.fetchers[key].calls, [])
+
+        model = manager.models[TOPIC_SK_KPA]
+        self.assertEqual(model.rowCount(), PAGE_SIZE)
+        self.assertEqual(model.total_count(), LARGE)
+        self.assertEqual(self.fetchers[TOPIC_SK_KPA].calls[0]['limit'], PAGE_SIZE)
+
+        manager.tabs.setCurrentIndex(2)
+        self.assertTrue(manager.is_tab_built(TOPIC_JAMUAN_TAMU))
+        self.assertFalse(manager.is_tab_built(TOPIC_HONORARIUM))
+        self.assertEqual(manager.models[TOPIC_JAMUAN_TAMU].rowCount(), PAGE_SIZE)
+
+        # Kembali ke tab yang sudah dibangun tidak query ulang
+        manager.tabs.setCurrentIndex(0)
+        self.assertEqual(len(self.fetchers[TOPIC_SK_KPA].calls), 1)
+
+        model.fetchMore()
+        self.assertEqual(model.rowCount(), 2 * PAGE_SIZE)
+        self.assertEqual(self.fetchers[TOPIC_SK_KPA].calls[-1]['offset'], PAGE_SIZE)
+
+    def test_open_time_independent_of_size(self):
+        """Membuka manager dengan 10k baris per tabel secepat dengan 100 baris."""
+        def open_time(db):
+            best = float('inf')
+            for _ in range(3):
+                start = time.perf_counter()
+                self._open(db)
+                best = min(best, time.perf_counter() - start)
+            return best
+
+        small = open_time(self.dbs[SMALL])
+        large = open_time(self.db)
+        self.assertLess(large, small * 3 + 0.1)
+
+    def test_filter_and_sort_run_in_query(self):
+        manager = self._open()
+        manager.tabs.setCurrentIndex(1)
+        fetcher = self.fetchers[TOPIC_HONORARIUM]
+        model = manager.models[TOPIC_HONORARIUM]
+
+        manager.cmb_hon_kategori.setCurrentIndex(1)  # reguler
+        self.assertEqual(fetcher.calls[-1]['kategori'], 'reguler')
+        self.assertEqual(model.total_count(), LARGE // 2)
+
+        manager.tbl_hon.sortByColumn(5, Qt.SortOrder.DescendingOrder)  # Total Bruto
+        self.assertEqual((fetcher.calls[-1]['order_by'], fetcher.calls[-1]['descending']),
+                         ('total_bruto', True))
+        self.assertEqual(model.row_data(0)['total_bruto'], (LARGE - 1) * 1000)
+
+        calls = len(fetcher.calls)
+        for text in ["R", "Ra", "Rapat"]:
+            manager._search_inputs[TOPIC_HONORARIUM].setText(text)
+        self.assertEqual(len(fetcher.calls), calls)
+        manager._search_timers[TOPIC_HONORARIUM].timeout.emit()
+        self.assertEqual(fetcher.calls[-1]['search'], 'Rapat')
+        self.assertEqual(model.total_count(), 0)  # Rapat hanya ada di insidentil
+
+        manager.cmb_hon_kategori.setCurrentIndex(2)  # insidentil
+        self.assertEqual(model.total_count(), LARGE // 10)
+        self.assertTrue(model.row_data(0)['nama_kegiatan'].startswith('Rapat'))
+
+        with self.assertRaises(ValueError):
+            self.db.list_honorarium(order_by='tidak_ada')
+
+    def test_only_changed_tab_reloads(self):
+        manager = self._open()
+        manager.tabs.setCurrentIndex(1)
+        sk_calls = len(self.fetchers[TOPIC_SK_KPA].calls)
+        hon_calls = len(self.fetchers[TOPIC_HONORARIUM].calls)
+
+        sk_id = self.db.create_sk_kpa({
+            'tahun_anggaran': TAHUN_ANGGARAN, 'nomor_sk': 'SK-BARU',
+            'tanggal_sk': f"{TAHUN_ANGGARAN}-12-31", 'perihal': 'Baru',
+            'jenis_pembayaran': 'honorarium'})
+        try:
+            manager.data_notifier.flush()
+            # Tab SK KPA tidak tampil: hanya ditandai, honorarium tidak disentuh
+            self.assertEqual(len(self.fetchers[TOPIC_SK_KPA].calls), sk_calls)
+            self.assertEqual(len(self.fetchers[TOPIC_HONORARIUM].calls), hon_calls)
+
+            manager.tabs.setCurrentIndex(0)
+            self.assertEqual(len(self.fetchers[TOPIC_SK_KPA].calls), sk_calls + 1)
+            model = manager.models[TOPIC_SK_KPA]
+            self.assertEqual(model.total_count(), LARGE + 1)
+            self.assertEqual(model.row_data(0)['id'], sk_id)
+
+            # Tab yang tampil dimuat ulang langsung
+            self.db.delete_sk_kpa(sk_id)
+            manager.data_notifier.flush()
+            self.assertEqual(model.total_count(), LARGE)
+            self.assertEqual(len(self.fetchers[TOPIC_HONORARIUM].calls), hon_calls)
+        finally:
+            self.db.delete_sk_kpa(sk_id)
+
+    def test_selected_row_id(self):
+        manager = self._open()
+        self.assertIsNone(manager.selected_id(TOPIC_SK_KPA))
+        manager.tbl_sk.selectRow(3)
+        self.assertEqual(manager.selected_id(TOPIC_SK_KPA),
+                         manager.models[TOPIC_SK_KPA].row_data(3)['id'])
+
+
+if __name__ == '__main__':
+    unittest.main()
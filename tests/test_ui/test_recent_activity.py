@@ -0,0 +1,102 @@
+"""
+PPK DOCUMENT FACTORY - Test Recent Activity Widget
+==================================================
+Verifikasi refresh berbasis diff dan pemakaian ulang item widget.
+
+Run:
+    python -m pytest tests/test_ui/test_recent_activity.py -v
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from PySide6.QtWidgets import QApplication
+
+app = QApplication.instance()
+if app is None:
+    app = QApplication([])
+
+from app.ui.dashboard_components.recent_activity import (
+    RecentActivityWidget, TransactionItemWidget,
+)
+
+
+def make_transactions(ids, status="proses"):
+    return [
+        {"id": i, "mekanisme": "UP", "nama": f"Transaksi {i}",
+         "nilai": 1000, "status": status, "tanggal": "2026-01-15"}
+        for i in ids
+    ]
+
+
+class TestRecentActivityWidget(unittest.TestCase):
+
+    def setUp(self):
+        self.widget = RecentActivityWidget(max_items=5)
+
+    def _item_count(self):
+        return len(self.widget.items_container.findChildren(TransactionItemWidget))
+
+    def _shown_ids(self):
+        layout = self.widget.items_layout
+        ids = []
+        for index in range(layout.count()):
+            item_widget = layout.itemAt(index).widget()
+            if isinstance(item_widget, TransactionItemWidget):
+                ids.append(item_widget.get_transaction_id())
+        return ids
+
+    def test_identical_refresh_allocates_nothing(self):
+        self.widget.set_transactions(make_transactions([1, 2, 3]))
+        self.assertEqual(self._item_count(), 3)
+        layout_count = self.widget.items_layout.count()
+        first = list(self.widget._item_widgets)
+
+        for _ in range(10):
+            self.widget.set_transactions(make_transactions([1, 2, 3]))
+
+        self.assertEqual(self._item_count(), 3)
+        self.assertEqual(self.widget.items_layout.count(), layout_count)
+        self.assertEqual(self.widget._item_widgets, first)
+
+    def test_reorder_and_patch_reuse_widgets(self):
+        self.widget.set_transactions(make_transactions([1, 2, 3]))
+        by_id = {w.get_transaction_id(): w for w in self.widget._item_widgets}
+
+        data = make_transactions([3, 1, 2])
+        data[0]["status"] = "selesai"
+        self.widget.set_transactions(data)
+
+        self.assertEqual(self._shown_ids(), [3, 1, 2])
+        self.assertIs(self.widget._item_widgets[0], by_id[3])
+        self.assertEqual(by_id[3].status_label.text(), "Selesai")
+        self.assertEqual(self._item_count(), 3)
+
+    def test_removed_items_are_pooled(self):
+        self.widget.set_transactions(make_transactions([1, 2, 3, 4]))
+        self.widget.set_transactions(make_transactions([1]))
+        self.assertEqual(len(self.widget._pool), 3)
+
+        self.widget.set_transactions(make_transactions([7, 8, 1]))
+        self.assertEqual(self._shown_ids(), [7, 8, 1])
+        self.assertEqual(self._item_count(), 4)
+        self.assertEqual(self.widget._item_widgets[0].nama_label.text(), "Transaksi 7")
+
+        self.widget.clear()
+        self.assertEqual(self._item_count(), 4)
+        self.assertEqual(self.widget.count_label.text(), "0")
+
+    def test_click_emits_current_id_after_reuse(self):
+        clicked = []
+        self.widget.item_clicked.connect(clicked.append)
+        self.widget.set_transactions(make_transactions(["A"]))
+        self.widget.set_transactions(make_transactions(["B"]))
+        self.widget._item_widgets[0]._on_edit_clicked()
+        self.assertEqual(clicked, ["B"])
+
+
+if __name__ == '__main__':
+    unittest.main()
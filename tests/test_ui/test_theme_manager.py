@@ -0,0 +1,108 @@
+"""
+PPK DOCUMENT FACTORY - Test Theme Manager
+=========================================
+Verifikasi render main.qss untuk setiap palet, ganti tema saat runtime,
+dan dynamic property dari set_role.
+
+Run:
+    python -m pytest tests/test_ui/test_theme_manager.py -v
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from PySide6.QtWidgets import QApplication, QLabel
+
+app = QApplication.instance()
+if app is None:
+    app = QApplication([])
+
+from app.ui.themes import (
+    PALETTES, DEFAULT_THEME, ThemeManager, render_stylesheet, set_role,
+)
+
+
+class TestRenderStylesheet(unittest.TestCase):
+
+    def test_every_palette_defines_the_same_tokens(self):
+        keys = set(PALETTES[DEFAULT_THEME])
+        for name, palette in PALETTES.items():
+            self.assertEqual(set(palette), keys, name)
+
+    def test_main_qss_renders_for_every_theme(self):
+        manager = ThemeManager(persist=False)
+        for name in manager.themes():
+            rendered = manager.stylesheet(name)
+            self.assertNotRegex(rendered, r"@[a-z]")
+            self.assertIn(PALETTES[name]['primary'], rendered)
+
+    def test_unknown_token_raises(self):
+        with self.assertRaises(KeyError):
+            render_stylesheet("QLabel { color: @bukan_token; }", PALETTES[DEFAULT_THEME])
+
+
+class TestThemeManager(unittest.TestCase):
+
+    def setUp(self):
+        self.saved_stylesheet = app.styleSheet()
+        self.manager = ThemeManager(persist=False)
+
+    def tearDown(self):
+        app.setStyleSheet(self.saved_stylesheet)
+
+    def test_apply_installs_stylesheet_on_app(self):
+        self.manager.apply('light', app)
+        self.assertEqual(app.styleSheet(), self.manager.stylesheet('light'))
+
+    def test_toggle_switches_theme_and_emits_signal(self):
+        self.manager = ThemeManager(persist=False, switchable=True)
+        self.manager.apply('light', app)
+        emitted = []
+        self.manager.theme_changed.connect(emitted.append)
+
+        self.assertEqual(self.manager.toggle(), 'dark')
+        self.assertEqual(self.manager.theme, 'dark')
+        self.assertEqual(app.styleSheet(), self.manager.stylesheet('dark'))
+        self.assertEqual(emitted, ['dark'])
+
+        # Memasang tema yang sama tidak memicu signal lagi
+        self.manager.apply('dark', app)
+        self.assertEqual(emitted, ['dark'])
+
+    def test_toggle_requires_opt_in(self):
+        manager = ThemeManager(persist=False, switchable=False)
+        manager.apply('light', app)
+        emitted = []
+        manager.theme_changed.connect(emitted.append)
+
+        self.assertEqual(manager.toggle(), 'light')
+        self.assertEqual(app.styleSheet(), manager.stylesheet('light'))
+        self.assertEqual(emitted, [])
+
+    def test_unknown_theme_raises(self):
+        with self.assertRaises(ValueError):
+            self.manager.apply('ungu', app)
+
+
+class TestSetRole(unittest.TestCase):
+
+    def test_sets_role_and_properties(self):
+        label = set_role(QLabel("UP"), "badge", tone="success")
+        self.assertEqual(label.property("role"), "badge")
+        self.assertEqual(label.property("tone"), "success")
+
+    def test_updates_polished_widget(self):
+        label = set_role(QLabel("Status"), "badge", tone="neutral")
+        label.show()
+        app.processEvents()
+        set_role(label, tone="danger")
+        self.assertEqual(label.property("role"), "badge")
+        self.assertEqual(label.property("tone"), "danger")
+        label.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
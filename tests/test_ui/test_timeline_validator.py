@@ -0,0 +1,115 @@
+"""
+PPK DOCUMENT FACTORY - Test Timeline Validator
+==============================================
+Verifikasi cache tanggal dan constraint graph TimelineValidator.
+
+Run:
+    python -m pytest tests/test_ui/test_timeline_validator.py -v
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from PySide6.QtWidgets import QApplication
+
+app = QApplication.instance()
+if app is None:
+    app = QApplication([])
+
+from app.core.database import DatabaseManager
+from app.ui.timeline_manager import TimelineValidator, validate_tahun_anggaran
+
+
+class CountingDatabaseManager(DatabaseManager):
+    """DatabaseManager yang menghitung query timeline per paket."""
+
+    timeline_queries = 0
+
+    def get_dokumen_timeline(self, paket_id):
+        self.timeline_queries += 1
+        return super().get_dokumen_timeline(paket_id)
+
+
+class TestTimelineValidator(unittest.TestCase):
+    """Test cached timeline validation."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.db = CountingDatabaseManager(os.path.join(self.tmpdir, "test.db"))
+        self.paket_id = self.db.create_paket({
+            'nama': 'Paket A', 'tahun_anggaran': 2026, 'jangka_waktu': 30,
+        })
+        self.db.set_dokumen_timeline(self.paket_id, 'BAHPL', '1/BA', '2026-03-10')
+        self.db.set_dokumen_timeline(self.paket_id, 'SPK', '1/SPK', '2026-03-12')
+        self.db.set_dokumen_timeline(self.paket_id, 'SPMK', '1/SPMK', '2026-03-12')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_dates_loaded_once(self):
+        """Validasi dan saran berulang hanya memuat tanggal sekali."""
+        validator = TimelineValidator(self.paket_id, db=self.db)
+        for day in range(1, 20):
+            validator.validate_date('SPK', date(2026, 3, day))
+            validator.suggest_date('BAHP')
+        self.assertEqual(self.db.timeline_queries, 1)
+
+    def test_errors_and_warnings(self):
+        """Pesan error/warning sama seperti validasi sebelumnya."""
+        validator = TimelineValidator(self.paket_id, db=self.db)
+
+        is_valid, errors, _ = validator.validate_date('SPK', date(2026, 3, 9))
+        self.assertFalse(is_valid)
+        # must_same_or_after dan can_be_before sama-sama merujuk BAHPL
+        self.assertEqual(len(errors), 2)
+        self.assertTrue(all('tidak boleh sebelum BAHPL' in e for e in errors))
+
+        is_valid, errors, warnings = validator.validate_date('BAHP', date(2026, 3, 20))
+        self.assertTrue(is_valid)
+        self.assertIn('22 hari sebelum perkiraan selesai', warnings[0])
+
+        _, _, warnings = validator.validate_date('HPS', date(2025, 12, 1))
+        self.assertIn('berbeda dengan tahun anggaran paket (2026)', warnings[-1])
+
+    def test_suggest_date(self):
+        validator = TimelineValidator(self.paket_id, db=self.db)
+        self.assertEqual(validator.suggest_date('SPMK'), date(2026, 3, 12))
+        self.assertEqual(validator.suggest_date('BAHP'), date(2026, 4, 11))
+
+    def test_update_date_after_save(self):
+        """Cache diperbarui setelah tanggal disimpan."""
+        validator = TimelineValidator(self.paket_id, db=self.db)
+        validator.validate_date('SPK', date(2026, 3, 12))
+
+        self.db.set_dokumen_timeline(self.paket_id, 'BAHPL', '1/BA', '2026-03-15')
+        validator.update_date('BAHPL', '2026-03-15')
+
+        is_valid, _, _ = validator.validate_date('SPK', date(2026, 3, 12))
+        self.assertFalse(is_valid)
+        self.assertEqual(self.db.timeline_queries, 1)
+
+        validator.refresh()
+        self.assertEqual(validator.get_all_dates()['BAHPL'], date(2026, 3, 15))
+
+    def test_validate_tahun_anggaran(self):
+        """Validasi massal satu tahun anggaran tanpa query per paket."""
+        bad = self.db.create_paket({'nama': 'Paket B', 'tahun_anggaran': 2026})
+        self.db.set_dokumen_timeline(bad, 'HPS', '1/HPS', '2026-02-01')
+        self.db.set_dokumen_timeline(bad, 'KAK', '1/KAK', '2026-01-15')
+        self.db.create_paket({'nama': 'Paket C', 'tahun_anggaran': 2026})
+
+        report = validate_tahun_anggaran(2026, self.db)
+        self.assertEqual(self.db.timeline_queries, 0)
+        self.assertIn(bad, report)
+        self.assertEqual(len(report[bad]['errors']), 1)
+        self.assertEqual(report[bad]['nama'], 'Paket B')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,163 @@
+"""
+PPK DOCUMENT FACTORY - Test Transaksi List Page
+===============================================
+Verifikasi filter/sort list page dijalankan di query dengan pemuatan
+per halaman.
+
+Run:
+    python -m pytest tests/test_ui/test_transaksi_list_page.py -v
+"""
+
+import os
+import sys
+import shutil
+import sqlite3
+import tempfile
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+
+app = QApplication.instance()
+if app is None:
+    app = QApplication([])
+
+from app.core.database_v4 import DatabaseManagerV4
+from app.models.pencairan_models import PencairanManager
+from app.ui.pages.pencairan import UPListPage, TUPListPage
+from app.ui.pages.pencairan.transaksi_table_model import PAGE_SIZE
+
+JENIS = ['honorarium', 'jamuan', 'perdin', 'pjlp', 'atk', 'lainnya']
+STATUS = ['draft', 'aktif', 'selesai']
+
+
+def seed_transaksi(db_path, count, mekanisme='UP'):
+    conn = sqlite3.connect(db_path)
+    conn.executemany("""
+        INSERT INTO transaksi_pencairan (
+            kode_transaksi, mekanisme, jenis_belanja, nama_kegiatan,
+            estimasi_biaya, status, fase_aktif, tahun_anggaran, created_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, 2026, ?)
+    """, [
+        (f"{mekanisme}-{i:05d}", mekanisme, JENIS[i % 6],
+         f"Kegiatan {'Rapat' if i % 10 == 0 else 'Belanja'} {i}",
+         (i % 50) * 100_000, STATUS[i % 3], 1 + i % 4,
+         f"2026-01-01 00:{(i // 60) % 60:02d}:{i % 60:02d}")
+        for i in range(count)
+    ])
+    conn.commit()
+    conn.close()
+
+
+class CountingFetcher:
+    """Bungkus list_transaksi dan catat argumen setiap query."""
+
+    def __init__(self, fetch):
+        self._fetch = fetch
+        self.calls = []
+
+    def __call__(self, **kwargs):
+        self.calls.append(kwargs)
+        return self._fetch(**kwargs)
+
+
+class TestTransaksiListPage(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.mkdtemp()
+        cls.db_path = os.path.join(cls.tmpdir, "test.db")
+        DatabaseManagerV4(cls.db_path)  # master tables (penyedia)
+        cls.manager = PencairanManager(cls.db_path)
+        seed_transaksi(cls.db_path, 20_000)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmpdir, ignore_errors=True)
+
+    def setUp(self):
+        self.page = UPListPage()
+        self.fetcher = CountingFetcher(self.manager.list_transaksi)
+        self.page.set_fetcher(self.fetcher)
+        self.page.reload()
+
+    def test_first_page_only(self):
+        self.assertEqual(self.page.model.rowCount(), PAGE_SIZE)
+        self.assertEqual(self.page.model.total_count(), 20_000)
+        self.assertEqual(self.page.count_label.text(), "20000 transaksi")
+
+        self.page.model.fetchMore()
+        self.assertEqual(self.page.model.rowCount(), 2 * PAGE_SIZE)
+        self.assertEqual(self.fetcher.calls[-1]['offset'], PAGE_SIZE)
+
+    def test_filters_pushed_into_query(self):
+        self.page.status_combo.setCurrentIndex(2)   # Aktif
+        self.page.jenis_combo.setCurrentIndex(5)    # ATK
+        call = self.fetcher.calls[-1]
+        self.assertEqual((call['status'], call['jenis_belanja']), ('aktif', 'atk'))
+        self.assertEqual(call['mekanisme'], 'UP')
+
+        model = self.page.model
+        for row in range(model.rowCount()):
+            data = model.row_data(row)
+            self.assertEqual((data['status'], data['jenis_belanja']), ('aktif', 'atk'))
+
+    def test_search_is_debounced(self):
+        calls = len(self.fetcher.calls)
+        for text in ["R", "Ra", "Rap", "Rapat"]:
+            self.page.search_input.setText(text)
+        self.assertEqual(len(self.fetcher.calls), calls)
+        self.assertTrue(self.page._search_timer.isActive())
+
+        self.page._search_timer.timeout.emit()
+        self.assertEqual(len(self.fetcher.calls), calls + 1)
+        self.assertEqual(self.page.model.total_count(), 2_000)
+
+    def test_header_sort_uses_sql(self):
+        self.page.table.sortByColumn(4, Qt.SortOrder.AscendingOrder)  # Nilai
+        call = self.fetcher.calls[-1]
+        self.assertEqual((call['order_by'], call['descending']), ('estimasi_biaya', False))
+        self.assertEqual(self.page.model.row_data(0)['estimasi_biaya'], 0)
+
+    def test_filter_time_independent_of_size(self):
+        """Filter 20k transaksi tetap cepat karena hanya satu halaman dimuat."""
+        start = time.perf_counter()
+        for text in ["Rapat", "Belanja 1", "UP-0", "tidak ada"]:
+            self.page.search_input.setText(text)
+            self.page._apply_filters()
+        elapsed = time.perf_counter() - start
+        self.assertLessEqual(self.page.model.rowCount(), PAGE_SIZE)
+        self.assertLess(elapsed, 2.0)
+
+    def test_selection_emits_id(self):
+        selected = []
+        self.page.item_selected.connect(selected.append)
+        self.page.table.selectRow(0)
+        self.assertEqual(selected, [self.page.model.row_data(0)['id']])
+        self.assertEqual(self.page.get_selected_id(), selected[0])
+
+
+class TestTUPListPage(unittest.TestCase):
+
+    def test_countdown_column(self):
+        page = TUPListPage()
+        page.set_data([
+            {'id': 1, 'kode_transaksi': 'TUP-1', 'nama_kegiatan': 'A', 'status': 'aktif'},
+            {'id': 2, 'kode_transaksi': 'TUP-2', 'nama_kegiatan': 'B', 'status': 'aktif',
+             'tanggal_sp2d_tup': '2000-01-01', 'sisa_hari_tup': -9000},
+            {'id': 3, 'kode_transaksi': 'TUP-3', 'nama_kegiatan': 'C', 'status': 'aktif',
+             'tanggal_sp2d_tup': '2000-01-01', 'sisa_hari_tup': 12},
+        ])
+        model = page.model
+        self.assertEqual(model.data(model.index(0, 5)), "-")
+        self.assertEqual(model.data(model.index(1, 5)), "Terlambat!")
+        self.assertEqual(model.data(model.index(2, 5)), "12 hari")
+        self.assertEqual(model.data(model.index(1, 6)), "Aktif")
+        self.assertFalse(model.canFetchMore())
+
+
+if __name__ == '__main__':
+    unittest.main()